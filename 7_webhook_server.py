@@ -1,3 +1,5 @@
+import asyncio
+import os
 from datetime import date
 from typing import Any, Dict, List, Optional, cast
 
@@ -16,7 +18,6 @@ from sapiopylib.rest.pojo.eln.ExperimentEntry import ExperimentEntry
 from sapiopylib.rest.pojo.eln.ExperimentEntryCriteria import ElnEntryCriteria, ExperimentEntryCriteriaUtil
 from sapiopylib.rest.pojo.eln.SapioELNEnums import ElnEntryType, ExperimentEntryStatus
 from sapiopylib.rest.pojo.webhook.ClientCallbackRequest import (
-    DataRecordSelectionRequest,
     DisplayPopupRequest,
     FormEntryDialogRequest,
     OptionDialogRequest,
@@ -27,9 +28,18 @@ from sapiopylib.rest.pojo.webhook.WebhookResult import SapioWebhookResult
 from sapiopylib.rest.utils.FormBuilder import FormBuilder
 from sapiopylib.rest.utils.ProtocolUtils import ELNStepFactory
 from sapiopylib.rest.utils.Protocols import ElnEntryStep, ElnExperimentProtocol
-from sapiopylib.rest.utils.recordmodel.RecordModelManager import RecordModelManager
 from waitress import serve
 
+from sapio_utils.async_webhook import AsyncAbstractWebhookHandler, AsyncManagers
+from sapio_utils.data_type_cache import DATA_TYPE_CACHE
+from sapio_utils.eln_snapshot import eln_request_sent, get_experiment_snapshot, get_snapshot_eln_manager
+from sapio_utils.fan_out import gather, get_fan_out_stats
+from sapio_utils.http_pool import HTTP_POOL, PooledWebhookHandler
+from sapio_utils.record_set import RecordSet
+from sapio_utils.record_selection import FieldMapPager, select_record_ids, visible_fields
+from sapio_utils.report_cache import REPORT_CACHE
+from sapio_utils.report_terms import record_id_not_in_term
+
 
 class HelloWorldWebhookHandler(AbstractWebhookHandler):
     """
@@ -309,9 +319,10 @@ class AutoCompleteFirstEntry(AbstractWebhookHandler):
         return SapioWebhookResult(True)
 
 
-class AddRecords(AbstractWebhookHandler):
+class AddRecords(PooledWebhookHandler):
     """
     This webhook adds records to a table in the experiment its invoked on.
+    Every prompt and table update is a request to Sapio, so the requests reuse the connections of earlier invocations.
     """
 
     DATA_TYPE = "Data Type"
@@ -353,6 +364,9 @@ class AddRecords(AbstractWebhookHandler):
         elif choice == self.EXISTING:
             record_ids = self.__prompt_for_existing_records(context, data_type_name)
 
+            if record_ids is None:
+                return self.user_cancelled()
+
             data_record_manager = context.data_record_manager
             records = list(data_record_manager.query_data_records_by_id(data_type_name, record_ids))
 
@@ -366,15 +380,11 @@ class AddRecords(AbstractWebhookHandler):
         )
 
     def __prompt_for_data_type(self, context: SapioWebhookContext) -> str | None:
-        data_type_manager = DataMgmtServer.get_data_type_manager(context.user)
-        data_type_internal_names = data_type_manager.get_data_type_name_list()
+        data_type_internal_names = DATA_TYPE_CACHE.get_data_type_names(context.user)
 
-        data_type_cache_manager = RecordModelManager(context.user).data_type_cache_manager
-
-        # This line performs an api call for each name which makes it slow
-        data_type_display_names = [
-            data_type_cache_manager.get_display_name(internal_name) for internal_name in data_type_internal_names
-        ]
+        # The definitions are shared by every invocation of the webhook server, and the ones that are missing are
+        # fetched concurrently, so only the first invocation (or the first after the cache expired) waits for them.
+        data_type_display_names = DATA_TYPE_CACHE.get_display_names(context.user, data_type_internal_names)
 
         internal_and_display_names = zip(data_type_internal_names, data_type_display_names)
 
@@ -450,48 +460,33 @@ class AddRecords(AbstractWebhookHandler):
 
     @staticmethod
     def __prompt_for_existing_records(context: SapioWebhookContext, data_type_name: str) -> list[int] | None:
-        data_type_cache_manager = RecordModelManager(context.user).data_type_cache_manager
-        data_type_plural_display_name = data_type_cache_manager.get_plural_display_name(data_type_name)
-
-        data_record_manager = context.data_record_manager
+        data_type_plural_display_name = DATA_TYPE_CACHE.get_plural_display_name(context.user, data_type_name)
 
-        # Get all records of type selected_internal_data_type_name
-        records = list(data_record_manager.query_all_records_of_type(data_type_name))
+        records_in_table = RecordSet(_get_records_in_table(context, data_type_plural_display_name))
 
-        records_in_table = _get_records_in_table(context, data_type_plural_display_name)
+        data_type_display_name = DATA_TYPE_CACHE.get_display_name(context.user, data_type_name)
+        fields = DATA_TYPE_CACHE.get_field_definitions(context.user, data_type_name)
 
-        # Display records that are not already in the table
-        records_not_in_table = [record for record in records if record not in records_in_table]
-
-        data_type_display_name = data_type_cache_manager.get_display_name(data_type_name)
-        data_type_manager = DataMgmtServer.get_data_type_manager(context.user)
-        fields = data_type_manager.get_field_definition_list(data_type_name)
-
-        request = DataRecordSelectionRequest(
-            data_type_display_name,
-            data_type_plural_display_name,
-            fields,
-            [record.get_fields() for record in records_not_in_table],
-            multi_select=True,
+        # Display records that are not already in the table, a page at a time, with only the columns the dialog shows.
+        # The report leaves out the records of the table where it can, and the pager leaves out the rest.
+        pager = FieldMapPager(
+            context.user,
+            data_type_name,
+            visible_fields(fields),
+            root_term=record_id_not_in_term(data_type_name, records_in_table.record_ids(data_type_name)),
+            excluded_records=records_in_table,
         )
 
         client_callback = DataMgmtServer.get_client_callback(context.user)
 
-        record_selection = client_callback.show_data_record_selection_dialog(request)
-
-        if not record_selection:
-            return None
-
-        return [field_map["RecordId"] for field_map in record_selection]
+        return select_record_ids(client_callback, pager, data_type_display_name, data_type_plural_display_name)
 
     @staticmethod
     def __add_records_to_table(context: SapioWebhookContext, records: list[DataRecord], data_type_name: str) -> None:
         """
         If the table doesn't already exist it is created and added to the Experiment
         """
-        data_type_cache_manager = RecordModelManager(context.user).data_type_cache_manager
-
-        data_type_plural_display_name = data_type_cache_manager.get_plural_display_name(data_type_name)
+        data_type_plural_display_name = DATA_TYPE_CACHE.get_plural_display_name(context.user, data_type_name)
 
         protocol = context.active_protocol
 
@@ -500,13 +495,16 @@ class AddRecords(AbstractWebhookHandler):
         table_name = format_table_name(data_type_plural_display_name)
         table = get_entry_by_name(context, experiment_id, table_name)
 
-        eln_manager = context.eln_manager
+        # The snapshot read by get_entry_by_name is invalidated by the changes below, since they go through the
+        # snapshot's ELN manager.
+        eln_manager = get_snapshot_eln_manager(context)
 
         if table is None:
             # Create new table entry since it doesn't exist
 
-            # Place the table at the end of the experiment
-            table_position = len(protocol.get_sorted_step_list()) + 1
+            # Place the table at the end of the experiment. The snapshot's entry list is the one the protocol's steps
+            # would be read from, so counting it saves a request.
+            table_position = len(get_experiment_snapshot(context, experiment_id).entries) + 1
 
             new_table_entry_criteria = ElnEntryCriteria(ElnEntryType.Table, table_name, data_type_name, table_position)
 
@@ -522,15 +520,10 @@ class AddRecords(AbstractWebhookHandler):
 
 def get_entry_by_name(context: SapioWebhookContext, experiment_id: int, entry_name: str) -> ExperimentEntry | None:
     """
-    Returns the entry with the specified name if it exists in the experiment else returns None
+    Returns the entry with the specified name if it exists in the experiment else returns None.
+    The entries are read once per webhook request, from the experiment snapshot of the context.
     """
-    entries = context.eln_manager.get_experiment_entry_list(experiment_id)
-
-    for entry in entries:
-        if entry.entry_name == entry_name:
-            return entry
-
-    return None
+    return get_experiment_snapshot(context, experiment_id).get_entry_by_name(entry_name)
 
 
 # No way to reuse f-strings so use a function
@@ -554,28 +547,18 @@ def _get_records_in_table(context: SapioWebhookContext, data_type_plural_display
     if table is None:
         return []
 
-    eln_manager = context.eln_manager
-
-    return list(eln_manager.get_data_records_for_entry(experiment_id, table.entry_id))
+    return list(get_experiment_snapshot(context, experiment_id).get_entry_records(table.entry_id))
 
 
 def get_entry_by_option(context: SapioWebhookContext, option: str) -> ExperimentEntry | None:
     """
     Get the first entry in the context with the given entry option key, or None if no entry has that entry option.
+    Reads the options of every entry once per webhook request, from the experiment snapshot of the context.
     """
-    exp_id = context.eln_experiment.notebook_experiment_id
-    eln_manager = context.eln_manager
-    entry_list = eln_manager.get_experiment_entry_list(exp_id, False)
-
-    for entry in entry_list:
-        entry_options = eln_manager.get_experiment_entry_options(exp_id, entry.entry_id)
-        if option in entry_options:
-            return entry
+    return get_experiment_snapshot(context).get_entry_by_option(option)
 
-    return None
 
-
-class CheckNumberOfSamples(AbstractWebhookHandler):
+class CheckNumberOfSamples(PooledWebhookHandler):
     """
     This webhook ensures that the table of samples has the correct number of samples.
     Invoked when the sample check entry is initialized.
@@ -586,21 +569,31 @@ class CheckNumberOfSamples(AbstractWebhookHandler):
     CORRECT_NUM_SAMPLES = 5
 
     def run(self, context: SapioWebhookContext) -> SapioWebhookResult:
-        samples_table = get_entry_by_option(context, "SOURCE SAMPLES")
+        exp_id = context.active_protocol.get_id()
+
+        # Both entries are looked up by option, so read the options of every entry once.
+        snapshot = get_experiment_snapshot(context, exp_id)
+
+        samples_table = snapshot.get_entry_by_option("SOURCE SAMPLES")
         assert samples_table is not None
 
-        eln_manager = context.eln_manager
-        exp_id = context.active_protocol.get_id()
-        samples = list(eln_manager.get_data_records_for_entry(exp_id, samples_table.entry_id))
+        check_entry = snapshot.get_entry_by_option("SAMPLE NUMBER CHECK")
+
+        # The records of the two entries don't depend on each other, so read them at the same time, each on a pooled
+        # connection of its own.
+        samples, check_entry_records = gather(
+            context,
+            lambda: snapshot.get_entry_records(samples_table.entry_id),
+            lambda: snapshot.get_entry_records(check_entry.entry_id) if check_entry is not None else [],
+        )
 
         # The check entry is false by default so there's no need to do anything in this case
         if len(samples) != self.CORRECT_NUM_SAMPLES:
             return SapioWebhookResult(True)
 
-        check_entry = get_entry_by_option(context, "SAMPLE NUMBER CHECK")
         assert check_entry is not None
 
-        check_entry_record = list(eln_manager.get_data_records_for_entry(exp_id, check_entry.entry_id))[0]
+        check_entry_record = check_entry_records[0]
 
         # Set the check to True, allowing the check entry to be submitted without being rejected.
         check_entry_record.set_field_value("CorrectNumber", True)
@@ -611,6 +604,32 @@ class CheckNumberOfSamples(AbstractWebhookHandler):
         return SapioWebhookResult(True)
 
 
+class TableRecordCounts(AsyncAbstractWebhookHandler):
+    """
+    Displays how many records each table in the experiment has.
+    The tables are independent of each other, so their records are requested at the same time.
+    """
+
+    async def run(self, context: SapioWebhookContext) -> SapioWebhookResult:
+        eln_manager = AsyncManagers(context).eln_manager
+        exp_id = context.eln_experiment.notebook_experiment_id
+
+        entries = await eln_manager.get_experiment_entry_list(exp_id)
+        tables = [entry for entry in entries if entry.entry_type == ElnEntryType.Table]
+
+        # Each request runs on its own thread, and gather waits for all of them together.
+        pages = await asyncio.gather(
+            *[eln_manager.get_data_records_for_entry(exp_id, table.entry_id) for table in tables]
+        )
+
+        counts = [
+            f"{table.entry_name}: {len(page.result_list)}{'+' if page.is_next_page_available else ''}"
+            for table, page in zip(tables, pages)
+        ]
+
+        return SapioWebhookResult(True, display_text="\n".join(counts) or "There are no tables in this experiment.")
+
+
 # Note: the registration points here are directly under root.
 # In this example, we are listening to 8090. So the endpoint URL to be configured in Sapio is:
 # http://[webhook_server_hostname]:8090/hello_world
@@ -626,10 +645,36 @@ config.register("/eln/bar_chart_creation", BarChartDashboardCreationHandler)
 config.register("/eln/add_instrument_tracking", AddInstrumentTracking)
 config.register("/eln/autocomplete_first_entry", AutoCompleteFirstEntry)
 config.register("/eln/check_number_samples", CheckNumberOfSamples)
+config.register("/eln/table_record_counts", TableRecordCounts)
+
+# Records the pooled handlers change drop the cached reports on their data types, and the changes they make to
+# experiments, through any ELN manager or protocol, drop what the experiment snapshots of their request had read.
+HTTP_POOL.add_request_listener(REPORT_CACHE.request_sent)
+HTTP_POOL.add_request_listener(eln_request_sent)
 
 app = WebhookServerFactory.configure_flask_app(app=None, config=config)
 # UNENCRYPTED! This should not be used in production. You should give the "app" a ssl_context or set up a reverse-proxy.
 
+
+# Counters of the data type cache shared by the handlers. Under gunicorn, every worker process has its own cache, so
+# the process ID is included to tell the workers apart.
+@app.get("/data_type_cache/stats")
+def data_type_cache_stats() -> Dict[str, Any]:
+    return {"pid": os.getpid(), "entries": len(DATA_TYPE_CACHE), **DATA_TYPE_CACHE.stats().to_json()}
+
+
+# How much time the handlers saved by running independent calls with gather, in the same process.
+@app.get("/fan_out/stats")
+def fan_out_stats() -> Dict[str, Any]:
+    return {"pid": os.getpid(), **get_fan_out_stats().to_json()}
+
+
+# How many connections to Sapio the handlers of this process opened, and how many requests reused one.
+@app.get("/http_pool/stats")
+def http_pool_stats() -> Dict[str, Any]:
+    return {"pid": os.getpid(), **HTTP_POOL.stats().to_json()}
+
+
 # Dev Mode:
 # app.run(host="0.0.0.0", port=8090)
 
@@ -0,0 +1,40 @@
+"""
+Helpers to build record models for benchmarks without a Sapio server.
+"""
+from __future__ import annotations
+
+import os
+import sys
+from typing import Any, Callable, Dict, List, Type
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sapiopylib.rest.User import SapioUser
+from sapiopylib.rest.pojo.DataRecord import DataRecord
+from sapiopylib.rest.utils.recordmodel.RecordModelManager import RecordModelManager
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrappedType
+
+OFFLINE_URL = "http://127.0.0.1:9/webservice/api"
+
+
+def offline_user() -> SapioUser:
+    return SapioUser(url=OFFLINE_URL, api_token="offline")
+
+
+def make_records(data_type_name: str, count: int, make_fields: Callable[[int], Dict[str, Any]],
+                 first_record_id: int = 1) -> List[DataRecord]:
+    return [DataRecord(data_type_name, first_record_id + i, make_fields(i)) for i in range(count)]
+
+
+def make_models(wrapper_type: Type[WrappedType], count: int, make_fields: Callable[[int], Dict[str, Any]],
+                user: SapioUser | None = None, first_record_id: int = 1) -> List[WrappedType]:
+    """
+    Import count existing records of the wrapper's data type as wrapped record models.
+    The field definition cache is primed so that setting field values does not reach out to a server.
+    """
+    user = user or offline_user()
+    rec_man = RecordModelManager(user)
+    data_type_name = wrapper_type.get_wrapper_data_type_name()
+    rec_man.data_type_cache_manager._DataTypeCacheManager__data_field_cache.setdefault(data_type_name, {})
+    records = make_records(data_type_name, count, make_fields, first_record_id)
+    return rec_man.instance_manager.add_existing_records_of_type(records, wrapper_type)
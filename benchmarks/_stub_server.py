@@ -0,0 +1,144 @@
+"""
+A stand-in for the Sapio webservice API on localhost, for benchmarks that measure round trips.
+
+Routes are registered as regular expressions over the path below /webservice/api. Every request waits for the
+configured latency before it is answered, to simulate the round trip to a remote server. Responses are sent as
+MessagePack to clients that ask for it, if the msgpack package is installed, and gzip-compressed to clients that
+accept it if compression is turned on.
+"""
+from __future__ import annotations
+
+import gzip
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Pattern, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from sapiopylib.rest.User import SapioUser
+
+from sapio_utils.http_pool import HttpPool, PooledSapioUser
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+API_PREFIX = "/webservice/api"
+
+# Handlers get the match of the route, the query parameters and the parsed JSON body (or None), and return a value
+# that is sent back as JSON. None is sent as 204 No Content.
+RouteHandler = Callable[[re.Match, Dict[str, List[str]], Any], Any]
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # Concurrent clients open many connections at once.
+    request_queue_size = 256
+
+
+class StubSapioServer:
+    """
+    Serves registered routes on a random localhost port from a background thread, for use in a with statement.
+    """
+
+    def __init__(self, latency_seconds: float = 0.0, compress: bool = False):
+        self.latency_seconds = latency_seconds
+        self.compress = compress
+        self.request_count = 0
+        self.connection_count = 0
+        # The size of the response bodies sent, as sent.
+        self.bytes_sent = 0
+        self._routes: List[Tuple[str, Pattern[str], RouteHandler]] = []
+        self._count_lock = threading.Lock()
+        self._server: Optional[_Server] = None
+
+    def route(self, method: str, pattern: str, handler: RouteHandler) -> None:
+        self._routes.append((method, re.compile(pattern), handler))
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{API_PREFIX}"
+
+    def user(self) -> SapioUser:
+        return SapioUser(url=self.url, api_token="stub")
+
+    def pooled_user(self, http_pool: HttpPool) -> PooledSapioUser:
+        return PooledSapioUser(self.url, api_token="stub", http_pool=http_pool)
+
+    def __enter__(self) -> StubSapioServer:
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # Keeps connections open between requests, as the Sapio server does, so clients can reuse them.
+            protocol_version = "HTTP/1.1"
+            # Headers and body are written separately, which on a kept-alive connection would wait for delayed ACKs.
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                with stub._count_lock:
+                    stub.connection_count += 1
+
+            def do_GET(self):
+                self._answer("GET")
+
+            def do_POST(self):
+                self._answer("POST")
+
+            def do_DELETE(self):
+                self._answer("DELETE")
+
+            def do_PUT(self):
+                self._answer("PUT")
+
+            def _answer(self, method: str) -> None:
+                with stub._count_lock:
+                    stub.request_count += 1
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length)) if length else None
+                split = urlsplit(self.path)
+                path = unquote(split.path)[len(API_PREFIX):]
+                if stub.latency_seconds:
+                    time.sleep(stub.latency_seconds)
+                for route_method, pattern, handler in stub._routes:
+                    match = pattern.fullmatch(path)
+                    if route_method == method and match:
+                        self._send(handler(match, parse_qs(split.query), body))
+                        return
+                self.send_error(404, f"No stub route for {method} {path}")
+
+            def _send(self, value: Any) -> None:
+                if value is None:
+                    self.send_response(204)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                if msgpack is not None and "application/msgpack" in (self.headers.get("Accept") or ""):
+                    content_type, data = "application/msgpack", msgpack.packb(value)
+                else:
+                    content_type, data = "application/json", json.dumps(value).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                if stub.compress and "gzip" in (self.headers.get("Accept-Encoding") or ""):
+                    data = gzip.compress(data, compresslevel=6)
+                    self.send_header("Content-Encoding", "gzip")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+                with stub._count_lock:
+                    stub.bytes_sent += len(data)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        self._server = _Server(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._server.shutdown()
+        self._server.server_close()
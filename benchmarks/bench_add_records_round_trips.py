@@ -0,0 +1,111 @@
+"""
+Benchmark of the ELN requests AddRecords makes to add existing records to a table of the experiment.
+
+Runs the real ElnManager against a local stand-in server that answers after an injected latency. AddRecords reads the
+records already in the table, then looks the table up again (creating it at the end of the experiment if it is
+missing) and adds the chosen records. Compares reading the experiment for each of these steps against the experiment
+snapshot of the webhook context, with and without an existing table.
+
+Example:
+    python benchmarks/bench_add_records_round_trips.py --entries 40 --latency-ms 20
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Callable, List, Optional
+
+from _offline import offline_user  # noqa: F401, puts the repository root on sys.path
+from _stub_server import StubSapioServer
+from sapiopylib.rest.ELNService import ElnManager
+from sapiopylib.rest.pojo.DataRecord import DataRecord
+from sapiopylib.rest.pojo.eln.ExperimentEntry import ExperimentEntry
+from sapiopylib.rest.pojo.eln.ExperimentEntryCriteria import ElnEntryCriteria
+from sapiopylib.rest.pojo.eln.SapioELNEnums import ElnEntryType
+from sapiopylib.rest.pojo.webhook.WebhookContext import SapioWebhookContext
+from sapiopylib.rest.pojo.webhook.WebhookEnums import WebhookEndpointType
+
+from sapio_utils.eln_snapshot import get_experiment_snapshot, get_snapshot_eln_manager
+
+EXPERIMENT_ID = 1
+TABLE_NAME = "Samples Records"
+
+
+def entry_json(entry_id: int, name: str) -> dict:
+    return {"entryType": "Table", "entryId": entry_id, "parentExperimentId": EXPERIMENT_ID, "enbEntryName": name,
+            "order": entry_id, "entryStatus": "Enabled"}
+
+
+def find_entry(eln_manager: ElnManager, entry_name: str) -> Optional[ExperimentEntry]:
+    for entry in eln_manager.get_experiment_entry_list(EXPERIMENT_ID):
+        if entry.entry_name == entry_name:
+            return entry
+    return None
+
+
+def per_step_reads(context: SapioWebhookContext, records: List[DataRecord]) -> int:
+    # What AddRecords used to do: every step reads the entry list again.
+    eln_manager = context.eln_manager
+    table = find_entry(eln_manager, TABLE_NAME)
+    in_table = list(eln_manager.get_data_records_for_entry(EXPERIMENT_ID, table.entry_id)) if table else []
+    table = find_entry(eln_manager, TABLE_NAME)
+    if table is None:
+        position = len(eln_manager.get_experiment_entry_list(EXPERIMENT_ID, False)) + 1
+        criteria = ElnEntryCriteria(ElnEntryType.Table, TABLE_NAME, "Sample", position)
+        table = eln_manager.add_experiment_entry(EXPERIMENT_ID, criteria)
+    eln_manager.add_records_to_table_entry(EXPERIMENT_ID, table.entry_id, records)
+    return len(in_table)
+
+
+def snapshot_reads(context: SapioWebhookContext, records: List[DataRecord]) -> int:
+    snapshot = get_experiment_snapshot(context, EXPERIMENT_ID)
+    table = snapshot.get_entry_by_name(TABLE_NAME)
+    in_table = list(snapshot.get_entry_records(table.entry_id)) if table else []
+    table = snapshot.get_entry_by_name(TABLE_NAME)
+    eln_manager = get_snapshot_eln_manager(context)
+    if table is None:
+        criteria = ElnEntryCriteria(ElnEntryType.Table, TABLE_NAME, "Sample", len(snapshot.entries) + 1)
+        table = eln_manager.add_experiment_entry(EXPERIMENT_ID, criteria)
+    eln_manager.add_records_to_table_entry(EXPERIMENT_ID, table.entry_id, records)
+    return len(in_table)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entries", type=int, default=40)
+    parser.add_argument("--records", type=int, default=100)
+    parser.add_argument("--latency-ms", type=float, default=20)
+    args = parser.parse_args()
+
+    records = [DataRecord("Sample", i + 1, {}) for i in range(args.records)]
+    with StubSapioServer(latency_seconds=args.latency_ms / 1000) as server:
+        entries = [entry_json(i + 1, f"Entry {i + 1}") for i in range(args.entries)]
+        server.route("GET", f"/eln/getExperimentEntryList/{EXPERIMENT_ID}", lambda match, query, body: entries)
+        server.route("GET", f"/eln/getDataRecordsForEntry/{EXPERIMENT_ID}/(\\d+)",
+                     lambda match, query, body: {"nextPageAvailable": False, "resultList": [
+                         {"dataTypeName": "Sample", "recordId": -i - 1, "fields": {}} for i in range(args.records)]})
+        server.route("POST", f"/eln/addExperimentEntry/{EXPERIMENT_ID}",
+                     lambda match, query, body: entry_json(args.entries + 1, TABLE_NAME))
+        server.route("POST", f"/eln/addRecordsToTableEntry/{EXPERIMENT_ID}/(\\d+)", lambda match, query, body: None)
+
+        def measure(name: str, add_records: Callable[[SapioWebhookContext, List[DataRecord]], int]) -> int:
+            # A new context per invocation, like a webhook request.
+            context = SapioWebhookContext(server.user(), WebhookEndpointType.NOTEBOOKEXPERIMENTMAINTOOLBAR)
+            server.request_count = 0
+            start = time.perf_counter()
+            in_table = add_records(context, records)
+            elapsed = time.perf_counter() - start
+            print(f"{name:<40}{elapsed * 1000:>10.1f}{server.request_count:>10}")
+            return in_table
+
+        print(f"{args.entries} entries, {args.records} records, {args.latency_ms:g} ms latency per request")
+        print(f"{'flow':<40}{'ms':>10}{'requests':>10}")
+        for table_exists in (False, True):
+            entries[-1] = entry_json(args.entries, TABLE_NAME if table_exists else f"Entry {args.entries}")
+            suffix = "existing table" if table_exists else "new table"
+            expected = measure(f"per step, {suffix}", per_step_reads)
+            assert measure(f"experiment snapshot, {suffix}", snapshot_reads) == expected
+
+
+if __name__ == "__main__":
+    main()
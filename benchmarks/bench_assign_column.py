@@ -0,0 +1,62 @@
+"""
+Benchmark of writing a column of values back into many wrapped record models.
+
+Compares GeneratedRecordModel.assign_column against calling the generated setter on every record, when only a
+fraction of the values actually change, and reports how many records end up with pending changes.
+
+Example:
+    python benchmarks/bench_assign_column.py --records 100000 --changed 0.1
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+from _offline import make_models, offline_user
+
+from data_type_models import PlateWellModel
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=100000)
+    parser.add_argument("--changed", type=float, default=0.1, help="Fraction of values that differ.")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    def fields(i: int):
+        return {"Concentration": float(i)}
+
+    original = np.arange(args.records, dtype=np.float64)
+    normalized = original.copy()
+    changed_rows = np.random.default_rng(0).random(args.records) < args.changed
+    normalized[changed_rows] += 0.5
+
+    def per_record(models):
+        for model, value in zip(models, normalized.tolist()):
+            model.set_Concentration_field(value)
+        return sum(1 for model in models if model.fields.copy_changes_to_dict())
+
+    def assign_column(models):
+        PlateWellModel.assign_column(models, PlateWellModel.CONCENTRATION__FIELD_NAME, normalized)
+        return sum(1 for model in models if model.fields.copy_changes_to_dict())
+
+    best = {}
+    pending = {}
+    for round_number in range(args.repeat):
+        for name, func in [("per-record set_Concentration_field", per_record),
+                           ("PlateWellModel.assign_column", assign_column)]:
+            # Fresh, unchanged records for every run.
+            models = make_models(PlateWellModel, args.records, fields, user=offline_user())
+            start = time.perf_counter()
+            pending[name] = func(models)
+            best[name] = min(best.get(name, float("inf")), time.perf_counter() - start)
+
+    print(f"{'operation':<36}{'ms':>10}{'pending changes':>18}")
+    for name, seconds in best.items():
+        print(f"{name:<36}{seconds * 1000:>10.1f}{pending[name]:>18}")
+    print(f"values that differ: {int(changed_rows.sum())}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark of webhook throughput when each invocation makes several independent requests to the Sapio server.
+
+Registers a synchronous and an asynchronous handler with WebhookServerFactory. Both read the same data type
+definitions from a local stand-in server that answers after an injected latency: the synchronous handler one after
+the other, the asynchronous one with asyncio.gather(). The Flask app is invoked from several client threads at once,
+as the threads of waitress would.
+
+Example:
+    python benchmarks/bench_async_webhook_throughput.py --invocations 40 --lookups 8 --clients 4 --latency-ms 20
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+from _offline import offline_user  # noqa: F401, puts the repository root on sys.path
+from _stub_server import StubSapioServer
+from sapiopylib.rest.DataMgmtService import DataMgmtServer
+from sapiopylib.rest.WebhookService import AbstractWebhookHandler, WebhookConfiguration, WebhookServerFactory
+from sapiopylib.rest.pojo.webhook.WebhookContext import SapioWebhookContext
+from sapiopylib.rest.pojo.webhook.WebhookResult import SapioWebhookResult
+
+from sapio_utils.async_webhook import AsyncAbstractWebhookHandler, AsyncManagers
+
+
+# The data types to look up are passed in the context data of the webhook, separated by commas.
+def data_type_names(context: SapioWebhookContext) -> List[str]:
+    return context.context_data.split(",")
+
+
+class SyncLookups(AbstractWebhookHandler):
+    def run(self, context: SapioWebhookContext) -> SapioWebhookResult:
+        data_type_manager = DataMgmtServer.get_data_type_manager(context.user)
+        names = [data_type_manager.get_data_type_definition(x).display_name for x in data_type_names(context)]
+        return SapioWebhookResult(True, display_text=",".join(names))
+
+
+class AsyncLookups(AsyncAbstractWebhookHandler):
+    async def run(self, context: SapioWebhookContext) -> SapioWebhookResult:
+        data_type_manager = AsyncManagers(context).data_type_manager
+        definitions = await asyncio.gather(*[data_type_manager.get_data_type_definition(x)
+                                             for x in data_type_names(context)])
+        return SapioWebhookResult(True, display_text=",".join(x.display_name for x in definitions))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--invocations", type=int, default=40)
+    parser.add_argument("--lookups", type=int, default=8)
+    parser.add_argument("--clients", type=int, default=4)
+    parser.add_argument("--latency-ms", type=float, default=20)
+    args = parser.parse_args()
+
+    config = WebhookConfiguration()
+    config.register("/sync", SyncLookups)
+    config.register("/async", AsyncLookups)
+    app = WebhookServerFactory.configure_flask_app(app=None, config=config)
+
+    with StubSapioServer(latency_seconds=args.latency_ms / 1000) as server:
+        server.route("GET", "/datatypemanager/datatypedefinition/(.+)",
+                     lambda match, query, body: {"dataTypeName": match.group(1), "dataTypeId": 1,
+                                                 "displayName": f"{match.group(1)} Display",
+                                                 "pluralDisplayName": f"{match.group(1)} Displays"})
+        webhook: Dict[str, Any] = {"endpointType": "Action Menu", "webserviceUrl": server.url,
+                                   "webhookApiToken": "stub",
+                                   "contextData": ",".join(f"Type{i}" for i in range(args.lookups))}
+
+        def invoke(path: str) -> str:
+            response = app.test_client().post(path, json=webhook)
+            result = response.get_json()
+            assert result["passed"], result
+            return result["displayText"]
+
+        def measure(name: str, path: str) -> List[str]:
+            server.request_count = 0
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=args.clients) as clients:
+                results = list(clients.map(invoke, [path] * args.invocations))
+            elapsed = time.perf_counter() - start
+            print(f"{name:<24}{elapsed * 1000:>10.1f}{args.invocations / elapsed:>14.1f}{server.request_count:>10}")
+            return results
+
+        print(f"{args.invocations} invocations of {args.lookups} lookups from {args.clients} clients, "
+              f"{args.latency_ms:g} ms latency per request")
+        print(f"{'handler':<24}{'ms':>10}{'invocations/s':>14}{'requests':>10}")
+        expected = measure("synchronous", "/sync")
+        assert measure("asynchronous", "/async") == expected
+
+
+if __name__ == "__main__":
+    main()
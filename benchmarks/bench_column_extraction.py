@@ -0,0 +1,50 @@
+"""
+Benchmark of reading one field of many wrapped record models into a NumPy array.
+
+Compares GeneratedRecordModel.column against calling the generated getter on every record and converting the
+resulting list.
+
+Example:
+    python benchmarks/bench_column_extraction.py --records 50000
+"""
+from __future__ import annotations
+
+import argparse
+import timeit
+
+import numpy as np
+from _offline import make_models
+
+from data_type_models import QCDatumModel
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    # Every tenth concentration is missing.
+    models = make_models(QCDatumModel, args.records,
+                         lambda i: {"Concentration": None if i % 10 == 0 else i / 7, "Volume": float(i)})
+
+    def per_record_getter():
+        return np.array([np.nan if x is None else x for x in
+                         [model.get_Concentration_field() for model in models]], dtype=np.float64)
+
+    def column():
+        return QCDatumModel.column(models, QCDatumModel.CONCENTRATION__FIELD_NAME)
+
+    assert np.array_equal(per_record_getter(), column(), equal_nan=True)
+    operations = [("per-record getter + np.array", per_record_getter), ("QCDatumModel.column", column)]
+    best = {name: float("inf") for name, _ in operations}
+    for _ in range(args.repeat):
+        for name, func in operations:
+            best[name] = min(best[name], timeit.timeit(func, number=1))
+    print(f"{'operation':<32}{'ms':>10}{'M rows/s':>10}")
+    for name, seconds in best.items():
+        print(f"{name:<32}{seconds * 1000:>10.1f}{len(models) / seconds / 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark of reading many data records into a pandas data frame.
+
+Compares DataRecordManager.get_data_frame, which builds a list per field from each record's field map and leaves
+pandas to guess the dtypes, against GeneratedRecordModel.data_frame, which picks each column's dtype from its field
+type and converts a chunk of records per field at once. Reports the construction time and the memory of the data
+frame, counting the python objects its columns hold.
+
+Example:
+    python benchmarks/bench_data_frame.py --records 200000
+"""
+from __future__ import annotations
+
+import argparse
+import timeit
+
+import numpy as np
+import pandas as pd
+from _offline import make_records
+from sapiopylib.rest.DataRecordManagerService import DataRecordManager
+
+from data_type_models import QCDatumModel
+
+FIELDS = [QCDatumModel.SAMPLEID__FIELD_NAME, QCDatumModel.INSTRUMENTNAME__FIELD_NAME,
+          QCDatumModel.DATETIME__FIELD_NAME, QCDatumModel.DATUMTYPE__FIELD_NAME, QCDatumModel.QCSTATUS__FIELD_NAME,
+          QCDatumModel.CONCENTRATION__FIELD_NAME, QCDatumModel.CT__FIELD_NAME, QCDatumModel.RIN__FIELD_NAME,
+          QCDatumModel.QUANTITY__FIELD_NAME, QCDatumModel.TUBEVOLUME__FIELD_NAME,
+          QCDatumModel.VICELLTOTALCELLS__FIELD_NAME, QCDatumModel.FRACTFAISFOUND__FIELD_NAME,
+          QCDatumModel.INSTRUMENTDATASTATUS__FIELD_NAME]
+
+
+def make_fields(i: int) -> dict:
+    # Every seventh concentration and every eleventh date are missing.
+    return {
+        "SampleId": f"S-{i // 4:06d}",
+        "InstrumentName": f"Instrument {i % 12}",
+        "DateTime": None if i % 11 == 0 else 1_700_000_000_000 + i * 60_000,
+        "DatumType": ("Concentration", "Volume", "RIN", "Ct")[i % 4],
+        "QCStatus": ("Passed", "Failed", "Pending")[i % 3],
+        "Concentration": None if i % 7 == 0 else i / 7,
+        "Ct": 20 + (i % 100) / 10,
+        "RIN": (i % 100) / 10,
+        "Quantity": i * 0.5,
+        "TubeVolume": 100.0,
+        "ViCellTotalCells": float(i * 1000),
+        "FracTFAIsFound": i % 2 == 0,
+        "InstrumentDataStatus": ("Imported", "Reviewed")[i % 2],
+    }
+
+
+def normalize(column: pd.Series) -> list:
+    # The values as python objects, with every kind of missing value as None, so both frames compare equal.
+    if column.dtype.kind == "M":
+        column = column.astype("int64").where(column.notna(), None)
+    return [None if v is None or v is pd.NA or (isinstance(v, float) and np.isnan(v)) else v
+            for v in column.astype(object).tolist()]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=200000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    records = make_records("QCDatum", args.records, make_fields)
+
+    def get_data_frame():
+        return DataRecordManager.get_data_frame(records)
+
+    def typed_data_frame():
+        return QCDatumModel.data_frame(records, FIELDS)
+
+    untyped, typed = get_data_frame(), typed_data_frame()
+    for field in FIELDS:
+        assert normalize(untyped[field.field_name]) == normalize(typed[field.field_name]), field.field_name
+
+    operations = [("DataRecordManager.get_data_frame", get_data_frame, untyped),
+                  ("QCDatumModel.data_frame", typed_data_frame, typed)]
+    best = {name: float("inf") for name, _, _ in operations}
+    for _ in range(args.repeat):
+        for name, func, _ in operations:
+            best[name] = min(best[name], timeit.timeit(func, number=1))
+    print(f"{'operation':<36}{'ms':>10}{'MiB':>10}")
+    for name, _, frame in operations:
+        mib = frame.memory_usage(deep=True).sum() / 2 ** 20
+        print(f"{name:<36}{best[name] * 1000:>10.1f}{mib:>10.1f}")
+    print()
+    print("dtypes of QCDatumModel.data_frame:")
+    print(typed.dtypes.to_string())
+
+
+if __name__ == "__main__":
+    main()
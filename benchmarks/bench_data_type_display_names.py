@@ -0,0 +1,71 @@
+"""
+Benchmark of resolving the display name of every data type, as AddRecords does to open its data type dialog.
+
+Runs against a local stand-in server that answers after an injected latency, with one data type per generated
+wrapper. Compares the per-name DataTypeCacheManager lookups against the shared DataTypeCache, cold and warm.
+
+Example:
+    python benchmarks/bench_data_type_display_names.py --latency-ms 20
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Callable, List
+
+from _offline import offline_user  # noqa: F401, puts the repository root on sys.path
+from _stub_server import StubSapioServer
+from sapiopylib.rest.DataMgmtService import DataMgmtServer
+from sapiopylib.rest.utils.recordmodel.RecordModelManager import RecordModelManager
+
+from data_type_models import _DATA_TYPE_MODELS
+from sapio_utils.data_type_cache import DataTypeCache
+
+
+def data_type_definition(data_type_name: str) -> dict:
+    return {"dataTypeName": data_type_name, "dataTypeId": 1, "displayName": f"{data_type_name} Display",
+            "pluralDisplayName": f"{data_type_name} Displays"}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency-ms", type=float, default=20)
+    parser.add_argument("--workers", type=int, default=16)
+    args = parser.parse_args()
+
+    names = list(_DATA_TYPE_MODELS)
+    with StubSapioServer(latency_seconds=args.latency_ms / 1000) as server:
+        server.route("GET", "/datatypemanager/datatypenamelist", lambda match, query, body: names)
+        server.route("GET", "/datatypemanager/datatypedefinition/(.+)",
+                     lambda match, query, body: data_type_definition(match.group(1)))
+
+        def per_name_lookup() -> List[str]:
+            # A new user per invocation, like a webhook context, so the record model manager starts empty.
+            user = server.user()
+            data_type_names = DataMgmtServer.get_data_type_manager(user).get_data_type_name_list()
+            cache_manager = RecordModelManager(user).data_type_cache_manager
+            return [cache_manager.get_display_name(name) for name in data_type_names]
+
+        shared_cache = DataTypeCache(max_workers=args.workers)
+
+        def shared_cache_lookup() -> List[str]:
+            user = server.user()
+            return shared_cache.get_display_names(user, shared_cache.get_data_type_names(user))
+
+        def measure(name: str, lookup: Callable[[], List[str]]) -> List[str]:
+            server.request_count = 0
+            start = time.perf_counter()
+            display_names = lookup()
+            elapsed = time.perf_counter() - start
+            print(f"{name:<40}{elapsed * 1000:>10.1f}{server.request_count:>10}")
+            return display_names
+
+        print(f"{len(names)} data types, {args.latency_ms:g} ms latency per request")
+        print(f"{'lookup':<40}{'ms':>10}{'requests':>10}")
+        expected = measure("DataTypeCacheManager, per name", per_name_lookup)
+        assert measure("DataTypeCache, cold", shared_cache_lookup) == expected
+        assert measure("DataTypeCache, warm", shared_cache_lookup) == expected
+
+
+if __name__ == "__main__":
+    main()
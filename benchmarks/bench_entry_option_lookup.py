@@ -0,0 +1,77 @@
+"""
+Benchmark of finding experiment entries by entry option, as CheckNumberOfSamples does for two options.
+
+Runs the real ElnManager against a local stand-in server that answers after an injected latency. Compares reading
+the options of one entry after the other until a match is found, once per option, against one ExperimentSnapshot.
+
+Example:
+    python benchmarks/bench_entry_option_lookup.py --entries 40 --latency-ms 20
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Callable, Dict, List, Optional
+
+from _offline import offline_user  # noqa: F401, puts the repository root on sys.path
+from _stub_server import StubSapioServer
+from sapiopylib.rest.DataMgmtService import DataMgmtServer
+from sapiopylib.rest.ELNService import ElnManager
+from sapiopylib.rest.pojo.eln.ExperimentEntry import ExperimentEntry
+
+from sapio_utils.eln_snapshot import ExperimentSnapshot
+
+EXPERIMENT_ID = 1
+OPTIONS = ["SOURCE SAMPLES", "SAMPLE NUMBER CHECK"]
+
+
+def entry_json(entry_id: int) -> dict:
+    return {"entryType": "Table", "entryId": entry_id, "parentExperimentId": EXPERIMENT_ID,
+            "enbEntryName": f"Entry {entry_id}", "order": entry_id, "entryStatus": "Enabled"}
+
+
+def per_entry_lookup(eln_manager: ElnManager, option: str) -> Optional[ExperimentEntry]:
+    # The lookup get_entry_by_option used to do: one request per entry until the option is found.
+    for entry in eln_manager.get_experiment_entry_list(EXPERIMENT_ID, False):
+        if option in eln_manager.get_experiment_entry_options(EXPERIMENT_ID, entry.entry_id):
+            return entry
+    return None
+
+
+def snapshot_lookup(eln_manager: ElnManager) -> List[Optional[ExperimentEntry]]:
+    snapshot = ExperimentSnapshot(eln_manager, EXPERIMENT_ID)
+    return [snapshot.get_entry_by_option(x) for x in OPTIONS]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entries", type=int, default=40)
+    parser.add_argument("--latency-ms", type=float, default=20)
+    args = parser.parse_args()
+
+    # The options are on the last entries, which is the worst case for the per-entry lookup.
+    options_by_entry: Dict[int, Dict[str, str]] = {args.entries - i: {option: ""} for i, option in enumerate(OPTIONS)}
+    with StubSapioServer(latency_seconds=args.latency_ms / 1000) as server:
+        server.route("GET", f"/eln/getExperimentEntryList/{EXPERIMENT_ID}",
+                     lambda match, query, body: [entry_json(i + 1) for i in range(args.entries)])
+        server.route("GET", f"/eln/getExperimentEntryOptions/{EXPERIMENT_ID}/(\\d+)",
+                     lambda match, query, body: options_by_entry.get(int(match.group(1)), {}))
+
+        def measure(name: str, lookup: Callable[[ElnManager], List[Optional[ExperimentEntry]]]) -> List[int]:
+            eln_manager = DataMgmtServer.get_eln_manager(server.user())
+            server.request_count = 0
+            start = time.perf_counter()
+            entries = lookup(eln_manager)
+            elapsed = time.perf_counter() - start
+            print(f"{name:<36}{elapsed * 1000:>10.1f}{server.request_count:>10}")
+            return [entry.entry_id for entry in entries]
+
+        print(f"{args.entries} entries, {args.latency_ms:g} ms latency per request, {len(OPTIONS)} options looked up")
+        print(f"{'lookup':<36}{'ms':>10}{'requests':>10}")
+        expected = measure("per entry, per option",
+                           lambda eln_manager: [per_entry_lookup(eln_manager, x) for x in OPTIONS])
+        assert measure("ExperimentSnapshot", snapshot_lookup) == expected
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark of reading the records of independent experiment entries, as CheckNumberOfSamples does for two entries.
+
+Runs the real ElnManager against a local stand-in server that answers after an injected latency. Compares reading
+the entries one after the other against reading them with gather(), and prints the time gather() reports as saved.
+
+Example:
+    python benchmarks/bench_fan_out_entry_records.py --entries 2 --latency-ms 50
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Callable, List
+
+from _offline import offline_user  # noqa: F401, puts the repository root on sys.path
+from _stub_server import StubSapioServer
+from sapiopylib.rest.pojo.webhook.WebhookContext import SapioWebhookContext
+from sapiopylib.rest.pojo.webhook.WebhookEnums import WebhookEndpointType
+
+from sapio_utils.eln_snapshot import get_experiment_snapshot
+from sapio_utils.fan_out import gather, get_fan_out_stats, reset_fan_out_stats
+
+EXPERIMENT_ID = 1
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entries", type=int, default=2)
+    parser.add_argument("--records", type=int, default=5)
+    parser.add_argument("--latency-ms", type=float, default=50)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    with StubSapioServer(latency_seconds=args.latency_ms / 1000) as server:
+        server.route("GET", f"/eln/getDataRecordsForEntry/{EXPERIMENT_ID}/(\\d+)",
+                     lambda match, query, body: {"nextPageAvailable": False, "resultList": [
+                         {"dataTypeName": "Sample", "recordId": int(match.group(1)) * 1000 + i, "fields": {}}
+                         for i in range(args.records)]})
+        entry_ids = list(range(1, args.entries + 1))
+
+        def serial(context: SapioWebhookContext) -> List[List[int]]:
+            snapshot = get_experiment_snapshot(context, EXPERIMENT_ID)
+            return [[x.record_id for x in snapshot.get_entry_records(entry_id)] for entry_id in entry_ids]
+
+        def fan_out(context: SapioWebhookContext) -> List[List[int]]:
+            snapshot = get_experiment_snapshot(context, EXPERIMENT_ID)
+            pages = gather(context, *[lambda entry_id=entry_id: snapshot.get_entry_records(entry_id)
+                                      for entry_id in entry_ids])
+            return [[x.record_id for x in page] for page in pages]
+
+        def measure(name: str, read: Callable[[SapioWebhookContext], List[List[int]]]) -> List[List[int]]:
+            results = []
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                # A new context per invocation, like a webhook request, so the snapshot starts empty.
+                context = SapioWebhookContext(server.user(), WebhookEndpointType.VELOXELNRULEACTION)
+                results = read(context)
+            elapsed = time.perf_counter() - start
+            print(f"{name:<24}{elapsed * 1000 / args.repeat:>18.1f}")
+            return results
+
+        print(f"{args.entries} entries, {args.latency_ms:g} ms latency per request, {args.repeat} invocations")
+        print(f"{'read':<24}{'ms per invocation':>18}")
+        expected = measure("one after the other", serial)
+        reset_fan_out_stats()
+        assert measure("gather", fan_out) == expected
+        stats = get_fan_out_stats()
+        print(f"gather reports {stats.saved_seconds * 1000 / stats.fan_outs:.1f} ms saved per invocation "
+              f"({stats.serial_seconds * 1000 / stats.fan_outs:.1f} ms of calls in "
+              f"{stats.wall_seconds * 1000 / stats.fan_outs:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Benchmark of walking Project -> Sample -> QCDatum, as the notebook's GetChildrenListAutoPager loop does for each level.
+
+Runs the real data record manager against a local stand-in server that answers after an injected latency. Compares
+one GetChildrenListAutoPager per level, collecting every page into a SetMultimap of DataRecords, against
+traverse_hierarchy(), which reads chunks of each level at the same time and keeps only CSR arrays of record IDs. The
+memory is what each result holds once the walk is done, measured with tracemalloc.
+
+Example:
+    python benchmarks/bench_hierarchy_traversal.py --projects 20 --samples 100 --qc-data 5 --latency-ms 50
+"""
+from __future__ import annotations
+
+import argparse
+import bisect
+import gc
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Set, Tuple
+
+from _offline import offline_user  # noqa: F401, puts the repository root on sys.path
+from _stub_server import StubSapioServer
+from sapiopylib.rest.User import SapioUser
+from sapiopylib.rest.pojo.DataRecordPaging import DataRecordPojoHierarchyPageCriteria
+from sapiopylib.rest.utils.autopaging import GetChildrenListAutoPager
+
+from sapio_utils.hierarchy import traverse_hierarchy
+
+PATH = ["Project", "Sample", "QCDatum"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--projects", type=int, default=20)
+    parser.add_argument("--samples", type=int, default=100, help="samples per project")
+    parser.add_argument("--qc-data", type=int, default=5, help="QC data per sample")
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--chunk-size", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=50)
+    args = parser.parse_args()
+
+    # Record IDs by level: projects first, then their samples, then the QC data of the samples.
+    children: Dict[int, Tuple[str, List[int]]] = {}
+    next_id = 1 + args.projects
+    project_ids = list(range(1, 1 + args.projects))
+    for project_id in project_ids:
+        children[project_id] = ("Sample", list(range(next_id, next_id + args.samples)))
+        next_id += args.samples
+    for sample_id in [x for project_id in project_ids for x in children[project_id][1]]:
+        children[sample_id] = ("QCDatum", list(range(next_id, next_id + args.qc_data)))
+        next_id += args.qc_data
+
+    def children_page(match, query, body) -> dict:
+        child_type = query["childTypeName"][0]
+        page_size = int(query["pageSize"][0])
+        last = (int(query.get("lastSourceRecordId", ["-1"])[0]), int(query.get("lastRetrievedRecordId", ["-1"])[0]))
+        links = [(parent_id, child_id) for parent_id in sorted(body) if children.get(parent_id, ("",))[0] == child_type
+                 for child_id in children[parent_id][1]]
+        page = links[bisect.bisect_right(links, last):][:page_size + 1]
+        result_map: Dict[str, List[Any]] = {}
+        for parent_id, child_id in page[:page_size]:
+            result_map.setdefault(str(parent_id), []).append(
+                {"dataTypeName": child_type, "recordId": child_id, "fields": {"RecordId": child_id}})
+        more = len(page) > page_size
+        last_source_id, last_target_id = page[min(page_size, len(page)) - 1] if page else (None, None)
+        return {"nextPageAvailable": more, "resultMap": result_map, "nextPageCriteria": {
+            "lastRetrievedSourceRecordId": last_source_id, "lastRetrievedTargetRecordId": last_target_id,
+            "pageSize": page_size} if more else None}
+
+    with StubSapioServer(latency_seconds=args.latency_ms / 1000) as server:
+        server.route("POST", "/datarecordlist/childrenbyid", children_page)
+
+        def per_level(user: SapioUser) -> Tuple[Any, Dict[int, Set[int]]]:
+            levels = []
+            record_ids = project_ids
+            for child_type in PATH[1:]:
+                level = GetChildrenListAutoPager(record_ids, child_type, user,
+                                                 DataRecordPojoHierarchyPageCriteria(page_size=args.page_size))
+                levels.append(level.get_all_at_once())
+                record_ids = sorted({record.record_id for records in levels[-1].get_all_values() for record in records})
+            qc_data = {project_id: {qc.record_id for sample in levels[0].get(project_id)
+                                    for qc in levels[1].get(sample.record_id)} for project_id in project_ids}
+            return levels, qc_data
+
+        def batched(user: SapioUser) -> Tuple[Any, Dict[int, Set[int]]]:
+            traversal = traverse_hierarchy(user, project_ids, PATH, chunk_size=args.chunk_size,
+                                           page_size=args.page_size)
+            end_to_end = traversal.end_to_end()
+            return traversal, {project_id: set(end_to_end.targets_of(project_id).tolist())
+                               for project_id in project_ids}
+
+        def measure(name: str, walk: Callable[[SapioUser], Tuple[Any, Dict[int, Set[int]]]]) -> Dict[int, Set[int]]:
+            user = server.user()
+            server.request_count = 0
+            gc.collect()
+            tracemalloc.start()
+            start = time.perf_counter()
+            result, qc_data = walk(user)
+            elapsed = time.perf_counter() - start
+            gc.collect()
+            held = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            print(f"{name:<28}{elapsed * 1000:>10.1f}{server.request_count:>10}{held / 2 ** 20:>12.2f}")
+            return qc_data
+
+        links = args.projects * args.samples * (1 + args.qc_data)
+        print(f"{links} links over {len(PATH) - 1} levels, {args.latency_ms:g} ms latency per request, "
+              f"pages of {args.page_size}, chunks of {args.chunk_size}")
+        print(f"{'walk':<28}{'ms':>10}{'requests':>10}{'held MiB':>12}")
+        expected = measure("auto-pager per level", per_level)
+        assert measure("traverse_hierarchy", batched) == expected
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark of the connections opened to the Sapio server when several threads make requests at the same time, as the
+threads of a webhook server and the calls of gather() do.
+
+Every client thread reads data type definitions from a local stand-in server that answers after an injected latency.
+Compares the plain SapioUser, which opens a connection for every request, against a PooledSapioUser, which reuses the
+connections of an HttpPool. The connections are counted by the stand-in server, and for the pool also by the pool.
+
+Example:
+    python benchmarks/bench_http_pool_connections.py --clients 8 --requests 50 --latency-ms 2
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from _offline import offline_user  # noqa: F401, puts the repository root on sys.path
+from _stub_server import StubSapioServer
+from sapiopylib.rest.DataMgmtService import DataMgmtServer
+from sapiopylib.rest.User import SapioUser
+
+from sapio_utils.http_pool import HttpPool
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=50, help="requests per client")
+    parser.add_argument("--latency-ms", type=float, default=2)
+    args = parser.parse_args()
+
+    with StubSapioServer(latency_seconds=args.latency_ms / 1000) as server:
+        server.route("GET", "/datatypemanager/datatypedefinition/(.+)",
+                     lambda match, query, body: {"dataTypeName": match.group(1), "dataTypeId": 1,
+                                                 "displayName": f"{match.group(1)} Display",
+                                                 "pluralDisplayName": f"{match.group(1)} Displays"})
+
+        def read(user: SapioUser) -> List[str]:
+            data_type_manager = DataMgmtServer.get_data_type_manager(user)
+            return [data_type_manager.get_data_type_definition(f"Type{i}").display_name for i in range(args.requests)]
+
+        def measure(name: str, users: List[SapioUser]) -> List[List[str]]:
+            server.request_count = server.connection_count = 0
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=args.clients) as clients:
+                results = list(clients.map(read, users))
+            elapsed = time.perf_counter() - start
+            print(f"{name:<16}{elapsed * 1000:>10.1f}{server.request_count:>10}{server.connection_count:>13}")
+            return results
+
+        print(f"{args.clients} clients of {args.requests} requests each, {args.latency_ms:g} ms latency per request")
+        print(f"{'user':<16}{'ms':>10}{'requests':>10}{'connections':>13}")
+        expected = measure("SapioUser", [server.user() for _ in range(args.clients)])
+        pool = HttpPool(pool_maxsize=args.clients)
+        assert measure("pooled", [server.pooled_user(pool) for _ in range(args.clients)]) == expected
+        stats = pool.stats()
+        print(f"the pool reports {stats.connections_opened} connections opened for {stats.requests} requests, "
+              f"{stats.reuse_ratio:.1%} reused, {stats.retries} retries")
+
+
+if __name__ == "__main__":
+    main()
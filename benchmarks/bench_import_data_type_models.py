@@ -0,0 +1,83 @@
+"""
+Cold start benchmark for the data_type_models package.
+
+Every sample is a fresh interpreter that imports SampleModel and reports how long the import took and the peak RSS
+of the process. The lazy package is compared against loading every wrapper, and, when a git revision is given,
+against the single-module data_type_models.py from that revision.
+
+Example:
+    python benchmarks/bench_import_data_type_models.py --runs 100 --baseline-rev d8363f0
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from typing import Dict, List
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD_SCRIPT = """
+import json, resource, sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}}))
+"""
+
+# sapiopylib is imported by every scenario, so it is loaded before the clock starts.
+PRELUDE = "from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrappedRecordModel\n"
+
+
+def run_scenario(statement: str, path: str, runs: int) -> Dict[str, float]:
+    seconds: List[float] = []
+    rss: List[int] = []
+    env = dict(os.environ, PYTHONPATH=path, PYTHONDONTWRITEBYTECODE="")
+    for _ in range(runs):
+        script = PRELUDE + CHILD_SCRIPT.format(statement=statement)
+        output = subprocess.run([sys.executable, "-c", script], cwd=path, env=env, check=True,
+                                capture_output=True, text=True).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        seconds.append(result["seconds"])
+        rss.append(result["max_rss_kb"])
+    return {
+        "median_ms": statistics.median(seconds) * 1000,
+        "p95_ms": sorted(seconds)[int(len(seconds) * 0.95) - 1] * 1000,
+        "median_rss_mb": statistics.median(rss) / 1024,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=100)
+    parser.add_argument("--baseline-rev", help="A git revision that still has the single data_type_models.py")
+    args = parser.parse_args()
+
+    scenarios = {
+        "lazy: from data_type_models import SampleModel": ("from data_type_models import SampleModel", REPO_DIR),
+        "eager: load_all_models()": ("import data_type_models; data_type_models.load_all_models()", REPO_DIR),
+    }
+    with tempfile.TemporaryDirectory() as baseline_dir:
+        if args.baseline_rev:
+            source = subprocess.run(["git", "show", f"{args.baseline_rev}:data_type_models.py"], cwd=REPO_DIR,
+                                    check=True, capture_output=True, text=True).stdout
+            with open(os.path.join(baseline_dir, "data_type_models.py"), "w", encoding="utf-8") as file:
+                file.write(source)
+            scenarios[f"single module @ {args.baseline_rev}"] = (
+                "from data_type_models import SampleModel", baseline_dir)
+
+        # Warm the bytecode caches so every scenario is measured the way a restarted worker sees it.
+        for statement, path in scenarios.values():
+            run_scenario(statement, path, 1)
+        print(f"{'scenario':<52}{'median ms':>12}{'p95 ms':>12}{'RSS MB':>10}")
+        for name, (statement, path) in scenarios.items():
+            result = run_scenario(statement, path, args.runs)
+            print(f"{name:<52}{result['median_ms']:>12.1f}{result['p95_ms']:>12.1f}{result['median_rss_mb']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Micro-benchmark of field reads and writes on wrapped record models.
+
+Compares the ModelField descriptors (qc.Concentration) and their get_X_field/set_X_field aliases against the
+previously generated accessor methods, which looked up X__FIELD_NAME.field_name on every call, over a list of
+QCDatumModel records.
+
+Example:
+    python benchmarks/bench_model_field_access.py --records 10000
+"""
+from __future__ import annotations
+
+import argparse
+import itertools
+import timeit
+
+from _offline import make_models
+
+from data_type_models import QCDatumModel
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    models = make_models(QCDatumModel, args.records, lambda i: {"Concentration": float(i)})
+    # Every pass writes a new value, so each write goes through change tracking.
+    passes = itertools.count(1)
+
+    def get_descriptor():
+        for model in models:
+            model.Concentration
+
+    def get_alias():
+        for model in models:
+            model.get_Concentration_field()
+
+    def get_generated_method():
+        for model in models:
+            model.get_field_value(model.CONCENTRATION__FIELD_NAME.field_name)
+
+    def set_descriptor():
+        value = float(next(passes))
+        for model in models:
+            model.Concentration = value
+
+    def set_alias():
+        value = float(next(passes))
+        for model in models:
+            model.set_Concentration_field(value)
+
+    def set_generated_method():
+        value = float(next(passes))
+        for model in models:
+            model.set_field_value(model.CONCENTRATION__FIELD_NAME.field_name, value)
+
+    operations = [("get: descriptor", get_descriptor), ("get: get_X_field alias", get_alias),
+                  ("get: previous generated method", get_generated_method),
+                  ("set: descriptor", set_descriptor), ("set: set_X_field alias", set_alias),
+                  ("set: previous generated method", set_generated_method)]
+    # Rounds are interleaved so that background noise is spread over all operations alike.
+    best = {name: float("inf") for name, _ in operations}
+    for _ in range(args.repeat):
+        for name, func in operations:
+            best[name] = min(best[name], timeit.timeit(func, number=1))
+    print(f"{'operation':<36}{'M ops/s':>10}")
+    for name, seconds in best.items():
+        print(f"{name:<36}{len(models) / seconds / 1e6:>10.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Benchmark of the memory needed to hold many sample records at once.
+
+Compares the tracemalloc peak of loading the records as SampleModel record models against copying them into a
+CompactRecordStore with SampleModel.compact. The data records are produced one at a time, like pages of a query
+would be, so the compact store never holds more than a chunk of them.
+
+Example:
+    python benchmarks/bench_model_memory.py --records 100000
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import tracemalloc
+from typing import Any, Callable, Dict, Iterator
+
+from _offline import make_models, offline_user
+from sapiopylib.rest.pojo.DataRecord import DataRecord
+
+from data_type_models import SampleModel
+
+
+def sample_fields(i: int) -> Dict[str, Any]:
+    return {
+        "SampleId": f"S-{i:07d}",
+        "OtherSampleId": f"External {i}",
+        "ExemplarSampleType": "Blood",
+        "ExemplarSampleStatus": "Received",
+        "ContainerType": "Tube",
+        "StorageLocationBarcode": f"BOX-{i // 81:05d}",
+        "RowPosition": "ABCDEFGHI"[i % 81 // 9],
+        "ColPosition": str(i % 9 + 1),
+        "Concentration": None if i % 10 == 0 else i / 7,
+        "ConcentrationUnits": "ng/uL",
+        "Volume": float(i % 500),
+        "VolumeUnits": "uL",
+        "CollectionDate": 1_700_000_000_000 + i * 1000,
+        "IsControl": i % 96 == 0,
+        "IsPooled": False,
+    }
+
+
+def stream_records(count: int) -> Iterator[DataRecord]:
+    return (DataRecord(SampleModel.DATA_TYPE_NAME, i + 1, sample_fields(i)) for i in range(count))
+
+
+def measure(load: Callable[[], Any]) -> float:
+    gc.collect()
+    tracemalloc.start()
+    held = load()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del held
+    return peak / 1024 / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=100000)
+    args = parser.parse_args()
+    # Create the user up front so its session is not part of either measurement.
+    user = offline_user()
+
+    scenarios = [
+        ("SampleModel record models", lambda: make_models(SampleModel, args.records, sample_fields, user)),
+        ("SampleModel.compact", lambda: SampleModel.compact(stream_records(args.records))),
+    ]
+    print(f"{'storage':<30}{'peak MiB':>10}{'bytes/record':>14}")
+    for name, load in scenarios:
+        peak = measure(load)
+        print(f"{name:<30}{peak:>10.1f}{peak * 1024 * 1024 / args.records:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
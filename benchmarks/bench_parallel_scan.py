@@ -0,0 +1,96 @@
+"""
+Benchmark of exporting every QCDatum record, one page after the other and with a ParallelRecordScan.
+
+Runs against a local stand-in server that answers custom reports on RecordId ranges. Every report takes an injected
+time on the server, and the server runs a limited number of reports at once, like a Sapio server with a limited
+connection pool to its database. The record IDs are spread unevenly, as record IDs shared by every data type are.
+
+Example:
+    python benchmarks/bench_parallel_scan.py --records 50000 --report-ms 200 --server-concurrency 8
+"""
+from __future__ import annotations
+
+import argparse
+import bisect
+import threading
+import time
+from typing import Any, List, Tuple
+
+from _offline import offline_user  # noqa: F401, puts the repository root on sys.path
+from _stub_server import StubSapioServer
+from sapiopylib.rest.pojo.datatype.FieldDefinition import VeloxDoubleFieldDefinition, VeloxStringFieldDefinition
+
+from sapio_utils.parallel_scan import ParallelRecordScan
+
+DATA_TYPE_NAME = "QCDatum"
+
+
+def record_id_range(term: Any) -> Tuple[float, float]:
+    """
+    The record IDs from first up to but not including stop that a term of ANDed RecordId bounds matches.
+    """
+    if term["termType"] == "COMPOSITE_TERM":
+        left, right = record_id_range(term["leftChild"]), record_id_range(term["rightChild"])
+        return max(left[0], right[0]), min(left[1], right[1])
+    value = int(term["value"])
+    return {"GREATER_THAN_OR_EQUAL_OPERATOR": (value, float("inf")),
+            "GREATER_THAN_OPERATOR": (value + 1, float("inf")),
+            "LESS_THAN_OPERATOR": (float("-inf"), value),
+            "LESS_THAN_OR_EQUAL_OPERATOR": (float("-inf"), value + 1)}[term["termOperation"]]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=50000)
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--report-ms", type=float, default=200, help="the time the server takes per report")
+    parser.add_argument("--server-concurrency", type=int, default=8)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    args = parser.parse_args()
+
+    # Runs of consecutive record IDs with gaps between them, wider in the second half of the ID space.
+    record_ids: List[int] = []
+    record_id = 1000
+    while len(record_ids) < args.records:
+        run = min(50, args.records - len(record_ids))
+        record_ids.extend(range(record_id, record_id + run))
+        record_id += run + (10 if len(record_ids) < args.records // 2 else 400)
+    slots = threading.Semaphore(args.server_concurrency)
+
+    def report(match, query, body) -> dict:
+        first, stop = record_id_range(body["rootTerm"])
+        matched = record_ids[bisect.bisect_left(record_ids, first):bisect.bisect_left(record_ids, stop)]
+        if body["columnList"][0]["sortDirection"] == "DESCENDING":
+            matched = matched[::-1]
+        page = matched[:body["pageSize"]]
+        with slots:
+            time.sleep(args.report_ms / 1000)
+        columns = [column["dataFieldName"] for column in body["columnList"]]
+        return {**body, "hasNextPage": len(matched) > len(page),
+                "resultTable": [[{"RecordId": x, "SampleId": f"S-{x}", "Value": x / 7}[column] for column in columns]
+                                for x in page]}
+
+    fields = [VeloxStringFieldDefinition(DATA_TYPE_NAME, "SampleId", "Sample ID"),
+              VeloxDoubleFieldDefinition(DATA_TYPE_NAME, "Value", "Value")]
+    with StubSapioServer() as server:
+        server.route("POST", "/report/runCustomReport", report)
+
+        print(f"{args.records} records, pages of {args.page_size}, {args.report_ms:g} ms per report, "
+              f"{args.server_concurrency} reports at once on the server")
+        print(f"{'workers':<10}{'ms':>10}{'speedup':>10}{'reports':>10}{'pages':>8}")
+        baseline = None
+        for workers in args.workers:
+            server.request_count = 0
+            start = time.perf_counter()
+            with ParallelRecordScan(server.user(), DATA_TYPE_NAME, fields, workers=workers,
+                                    partitions=None if workers > 1 else 1, page_size=args.page_size) as scan:
+                data_frame = scan.to_data_frame()
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            assert data_frame["RecordId"].tolist() == record_ids
+            print(f"{workers:<10}{elapsed * 1000:>10.1f}{baseline / elapsed:>10.2f}{server.request_count:>10}"
+                  f"{scan.pages_read:>8}")
+
+
+if __name__ == "__main__":
+    main()
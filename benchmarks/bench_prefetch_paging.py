@@ -0,0 +1,82 @@
+"""
+Benchmark of scanning every record of a data type with QueryAllRecordsOfTypeAutoPager, when the caller works on each
+page before it asks for the next.
+
+Runs the real auto-pager against a local stand-in server that answers after an injected latency. The caller's work is
+simulated by sleeping for a while per page. Compares the auto-pager on its own against a PrefetchingAutoPager at
+several read-ahead depths.
+
+Example:
+    python benchmarks/bench_prefetch_paging.py --records 50000 --page-size 1000 --latency-ms 50 --work-ms 40
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Iterator, List
+
+from _offline import offline_user  # noqa: F401, puts the repository root on sys.path
+from _stub_server import StubSapioServer
+from sapiopylib.rest.pojo.DataRecord import DataRecord
+from sapiopylib.rest.pojo.DataRecordPaging import DataRecordPojoPageCriteria
+from sapiopylib.rest.utils.autopaging import QueryAllRecordsOfTypeAutoPager
+
+from sapio_utils.prefetch_paging import PrefetchingAutoPager
+
+DATA_TYPE_NAME = "Sample"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=50000)
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--latency-ms", type=float, default=50)
+    parser.add_argument("--work-ms", type=float, default=40, help="the caller's work per page")
+    parser.add_argument("--depths", type=int, nargs="+", default=[1, 2, 4])
+    args = parser.parse_args()
+
+    def records_page(match, query, body) -> dict:
+        last = int(query.get("lastRetrievedRecordId", ["0"])[0] or 0)
+        page_size = int(query["pageSize"][0])
+        record_ids = range(last + 1, min(last + page_size, args.records) + 1)
+        return {"nextPageAvailable": record_ids.stop <= args.records,
+                "nextPageCriteria": {"lastRetrievedRecordId": record_ids.stop - 1, "pageSize": page_size},
+                "resultList": [{"dataTypeName": DATA_TYPE_NAME, "recordId": record_id,
+                                "fields": {"RecordId": record_id, "SampleId": f"S-{record_id:08d}"}}
+                               for record_id in record_ids]}
+
+    with StubSapioServer(latency_seconds=args.latency_ms / 1000) as server:
+        server.route("GET", "/datarecordlist/all", records_page)
+
+        def consume(records: Iterator[DataRecord]) -> List[int]:
+            record_ids = []
+            for record in records:
+                record_ids.append(record.record_id)
+                if len(record_ids) % args.page_size == 0:
+                    time.sleep(args.work_ms / 1000)
+            return record_ids
+
+        def pager() -> QueryAllRecordsOfTypeAutoPager:
+            return QueryAllRecordsOfTypeAutoPager(DATA_TYPE_NAME, server.user(),
+                                                  DataRecordPojoPageCriteria(page_size=args.page_size))
+
+        def measure(name: str, records: Iterator[DataRecord]) -> List[int]:
+            server.request_count = 0
+            start = time.perf_counter()
+            record_ids = consume(records)
+            elapsed = time.perf_counter() - start
+            print(f"{name:<28}{elapsed * 1000:>10.1f}{elapsed * 1000 / server.request_count:>14.1f}"
+                  f"{server.request_count:>10}")
+            return record_ids
+
+        print(f"{args.records} records in pages of {args.page_size}, {args.latency_ms:g} ms latency per request, "
+              f"{args.work_ms:g} ms of work per page")
+        print(f"{'pager':<28}{'ms':>10}{'ms per page':>14}{'requests':>10}")
+        expected = measure("auto-pager", pager())
+        assert expected == list(range(1, args.records + 1))
+        for depth in args.depths:
+            with PrefetchingAutoPager(pager(), depth=depth) as records:
+                assert measure(f"prefetching, depth {depth}", records) == expected
+
+if __name__ == "__main__":
+    main()
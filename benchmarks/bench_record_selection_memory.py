@@ -0,0 +1,93 @@
+"""
+Benchmark of the client memory AddRecords needs to build its record selection dialog.
+
+Runs against a local stand-in server with one data type of many fields, few of them visible. Compares reading every
+record with all of its fields, as query_all_records_of_type does, against reading the visible fields one report page
+at a time with a FieldMapPager. Peak memory is measured with tracemalloc while every page is read. The stand-in server
+runs in the same process, so the response it is sending at the time is included.
+
+Example:
+    python benchmarks/bench_record_selection_memory.py --records 20000 --fields 40 --visible 8
+"""
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+from typing import Callable
+
+from _offline import offline_user  # noqa: F401, puts the repository root on sys.path
+from _stub_server import StubSapioServer
+from sapiopylib.rest.DataMgmtService import DataMgmtServer
+from sapiopylib.rest.User import SapioUser
+from sapiopylib.rest.pojo.datatype.FieldDefinition import VeloxStringFieldDefinition
+
+from sapio_utils.record_selection import FieldMapPager, visible_fields
+
+DATA_TYPE_NAME = "Sample"
+
+
+def field_value(record_id: int, field_name: str) -> str:
+    return f"{field_name} of record {record_id}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=20000)
+    parser.add_argument("--fields", type=int, default=40)
+    parser.add_argument("--visible", type=int, default=8)
+    parser.add_argument("--page-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    field_names = [f"Field{i}" for i in range(args.fields)]
+    fields = [VeloxStringFieldDefinition(DATA_TYPE_NAME, name, name) for name in field_names]
+    for field in fields[args.visible:]:
+        field.visible = False
+
+    def all_records(match, query, body) -> dict:
+        return {"nextPageAvailable": False, "resultList": [
+            {"dataTypeName": DATA_TYPE_NAME, "recordId": record_id,
+             "fields": {"RecordId": record_id, **{name: field_value(record_id, name) for name in field_names}}}
+            for record_id in range(1, args.records + 1)]}
+
+    def report_page(match, query, body) -> dict:
+        first = body["pageNumber"] * body["pageSize"]
+        record_ids = range(first + 1, min(first + body["pageSize"], args.records) + 1)
+        columns = [column["dataFieldName"] for column in body["columnList"]]
+        return {**body, "hasNextPage": first + body["pageSize"] < args.records,
+                "resultTable": [[record_id if column == "RecordId" else field_value(record_id, column)
+                                 for column in columns] for record_id in record_ids]}
+
+    with StubSapioServer() as server:
+        server.route("GET", "/datarecordlist/all", all_records)
+        server.route("POST", "/report/runCustomReport", report_page)
+
+        def full_dump(user: SapioUser) -> int:
+            records = DataMgmtServer.get_data_record_manager(user).query_all_records_of_type(DATA_TYPE_NAME)
+            return len([record.get_fields() for record in records])
+
+        def paged(user: SapioUser) -> int:
+            pager = FieldMapPager(user, DATA_TYPE_NAME, visible_fields(fields), page_size=args.page_size)
+            return sum(len(page) for page in pager)
+
+        def measure(name: str, read: Callable[[SapioUser], int]) -> int:
+            user = server.user()
+            server.request_count = 0
+            tracemalloc.start()
+            start = time.perf_counter()
+            count = read(user)
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"{name:<40}{elapsed * 1000:>10.1f}{peak / 2 ** 20:>12.1f}{server.request_count:>10}{count:>10}")
+            return count
+
+        print(f"{args.records} records, {args.fields} fields of which {args.visible} visible, "
+              f"{args.page_size} records per page")
+        print(f"{'read':<40}{'ms':>10}{'peak MiB':>12}{'requests':>10}{'records':>10}")
+        expected = measure("query_all_records_of_type, all fields", full_dump)
+        assert measure("FieldMapPager, visible fields", paged) == expected
+
+
+if __name__ == "__main__":
+    main()
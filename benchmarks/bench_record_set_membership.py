@@ -0,0 +1,59 @@
+"""
+Benchmark of leaving out the records already in a table, as AddRecords does before showing its selection dialog.
+
+Compares checking every candidate against the list of table records, which compares each pair of DataRecords, with a
+RecordSet. Also reports the size of the custom report term that leaves the table records out on the server instead.
+
+Example:
+    python benchmarks/bench_record_set_membership.py --candidates 20000 --in-table 5000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from typing import Callable, List
+
+from _offline import offline_user  # noqa: F401, puts the repository root on sys.path
+from sapiopylib.rest.pojo.DataRecord import DataRecord
+
+from sapio_utils.record_set import RecordSet
+from sapio_utils.report_terms import record_id_not_in_term, record_id_ranges
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--candidates", type=int, default=20000)
+    parser.add_argument("--in-table", type=int, default=5000)
+    parser.add_argument("--batch-size", type=int, default=50,
+                        help="How many records with consecutive record IDs were added to the table at a time.")
+    parser.add_argument("--skip-list", action="store_true", help="Skip the list membership check, which is slow.")
+    args = parser.parse_args()
+
+    candidates = [DataRecord("Sample", record_id, {}) for record_id in range(1, args.candidates + 1)]
+    batches = [candidates[i:i + args.batch_size] for i in range(0, len(candidates), args.batch_size)]
+    chosen = random.Random(0).sample(batches, min(len(batches), args.in_table // args.batch_size))
+    table_ids = sorted(record.record_id for batch in chosen for record in batch)
+    in_table = [DataRecord("Sample", record_id, {}) for record_id in table_ids]
+
+    def measure(name: str, difference: Callable[[], List[DataRecord]]) -> List[DataRecord]:
+        start = time.perf_counter()
+        records = difference()
+        elapsed = time.perf_counter() - start
+        print(f"{name:<40}{elapsed * 1000:>12.1f}{len(records):>12}")
+        return records
+
+    print(f"{len(candidates)} candidates, {len(in_table)} records in the table")
+    print(f"{'difference':<40}{'ms':>12}{'left':>12}")
+    expected = measure("RecordSet", lambda: RecordSet(in_table).difference(candidates))
+    if not args.skip_list:
+        assert measure("list membership", lambda: [x for x in candidates if x not in in_table]) == expected
+
+    term = record_id_not_in_term("Sample", table_ids, max_terms=len(table_ids))
+    size = len(json.dumps(term.to_json())) if term else 0
+    print(f"report term: {len(record_id_ranges(table_ids))} ranges, {size / 1024:.1f} KiB of JSON")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Benchmark of running the same few custom reports again and again, with and without a ReportCache.
+
+Runs against a local stand-in server that takes an injected time per report. Each run builds the criteria of one of
+a few reports anew, with the operands of its AND and OR terms in a random order and nesting, as different callers
+would. Every so often, a record of one of the data types is committed through a PooledSapioUser of a pool the cache
+listens to, which drops the cached results of the reports on that data type. A second cache on the same directory
+stands in for a later process that reads the results from disk.
+
+Example:
+    python benchmarks/bench_report_cache.py --runs 200 --report-ms 50 --commit-every 50
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import tempfile
+import time
+from typing import Callable, List
+
+from _offline import offline_user  # noqa: F401, puts the repository root on sys.path
+from _stub_server import StubSapioServer
+from sapiopylib.rest.DataMgmtService import DataMgmtServer
+from sapiopylib.rest.User import SapioUser
+from sapiopylib.rest.pojo.CustomReport import (AbstractReportTerm, CompositeReportTerm, CompositeTermOperation,
+                                               CustomReport, CustomReportCriteria, RawReportTerm, RawTermOperation,
+                                               ReportColumn)
+from sapiopylib.rest.pojo.DataRecord import DataRecord
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+
+from sapio_utils.http_pool import HttpPool
+from sapio_utils.report_cache import ReportCache, criteria_key
+
+EQUAL = RawTermOperation.EQUAL_TO_OPERATOR
+
+
+def random_tree(terms: List[AbstractReportTerm], operation: CompositeTermOperation,
+                rng: random.Random) -> AbstractReportTerm:
+    """
+    The terms joined by the operation, in a random order and a random nesting.
+    """
+    terms = rng.sample(terms, len(terms))
+    while len(terms) > 1:
+        position = rng.randrange(len(terms) - 1)
+        terms[position:position + 2] = [CompositeReportTerm(terms[position], operation, terms[position + 1])]
+    return terms[0]
+
+
+def report_builders() -> List[Callable[[random.Random], CustomReportCriteria]]:
+    qc_columns = [ReportColumn("QCDatum", "RecordId", FieldType.LONG),
+                  ReportColumn("QCDatum", "Concentration", FieldType.DOUBLE)]
+    sample_columns = [ReportColumn("Sample", "RecordId", FieldType.LONG),
+                      ReportColumn("Sample", "SampleId", FieldType.STRING)]
+
+    def qc(status: str) -> Callable[[random.Random], CustomReportCriteria]:
+        def build(rng: random.Random) -> CustomReportCriteria:
+            kinds = [RawReportTerm("QCDatum", "QCType", EQUAL, x) for x in ("Qubit", "NanoDrop", "Bioanalyzer")]
+            terms = [RawReportTerm("QCDatum", "Status", EQUAL, status),
+                     RawReportTerm("QCDatum", "Concentration", RawTermOperation.GREATER_THAN_OPERATOR, "0"),
+                     random_tree(kinds, CompositeTermOperation.OR_OPERATOR, rng)]
+            return CustomReportCriteria(qc_columns, random_tree(terms, CompositeTermOperation.AND_OPERATOR, rng))
+        return build
+
+    def samples(rng: random.Random) -> CustomReportCriteria:
+        terms = [RawReportTerm("Sample", "ExemplarSampleType", EQUAL, x) for x in ("Blood", "Tissue", "DNA")]
+        return CustomReportCriteria(sample_columns, random_tree(terms, CompositeTermOperation.OR_OPERATOR, rng))
+
+    return [qc("Passed"), qc("Failed"), qc("Pending"), samples]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=200)
+    parser.add_argument("--rows", type=int, default=2000, help="the rows of each report")
+    parser.add_argument("--report-ms", type=float, default=50, help="the time the server takes per report")
+    parser.add_argument("--commit-every", type=int, default=50, help="runs between commits of a QCDatum record")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    def report(match, query, body) -> dict:
+        time.sleep(args.report_ms / 1000)
+        return {**body, "hasNextPage": False,
+                "resultTable": [[i + 1, f"S-{i:08d}"] for i in range(args.rows)]}
+
+    builders = report_builders()
+
+    def workload() -> List[CustomReportCriteria]:
+        rng = random.Random(args.seed)
+        return [rng.choice(builders)(rng) for _ in range(args.runs)]
+
+    with StubSapioServer() as server:
+        server.route("POST", "/report/runCustomReport", report)
+        server.route("PUT", "/datarecordlist/fields", lambda match, query, body: None)
+
+        def measure(name: str, run: Callable[[SapioUser, CustomReportCriteria], CustomReport],
+                    cache: ReportCache = None) -> List[int]:
+            if cache is None:
+                user = server.user()
+            else:
+                pool = HttpPool()
+                pool.add_request_listener(cache.request_sent)
+                user = server.pooled_user(pool)
+            record = DataRecord("QCDatum", 1, {"Status": "Passed"})
+            server.request_count = 0
+            row_counts: List[int] = []
+            start = time.perf_counter()
+            for position, criteria in enumerate(workload()):
+                if position and position % args.commit_every == 0:
+                    record.set_field_value("Status", "Failed" if position % 2 else "Passed")
+                    DataMgmtServer.get_data_record_manager(user).commit_data_records([record])
+                row_counts.append(len(run(user, criteria).result_table))
+            elapsed = time.perf_counter() - start
+            stats = cache.stats() if cache is not None else None
+            hits = f"{stats.hit_ratio:>9.1%}" if stats else f"{'':>9}"
+            print(f"{name:<26}{elapsed * 1000:>10.1f}{server.request_count:>10}{hits}")
+            return row_counts
+
+        criteria_list = workload()
+        print(f"{args.runs} runs of {len(builders)} reports of {args.rows} rows, {args.report_ms:g} ms per report, "
+              f"a QCDatum commit every {args.commit_every} runs")
+        print(f"distinct criteria as sent: {len({json.dumps(x.to_json(), sort_keys=True) for x in criteria_list})}, "
+              f"distinct canonical keys: {len({criteria_key(x) for x in criteria_list})}")
+        print(f"{'':<26}{'ms':>10}{'requests':>10}{'hits':>9}")
+        expected = measure("no cache", lambda user, criteria: (
+            DataMgmtServer.get_custom_report_manager(user).run_custom_report(criteria)))
+        memory = ReportCache()
+        assert measure("memory", memory.run_custom_report, memory) == expected
+        with tempfile.TemporaryDirectory() as directory:
+            first = ReportCache(directory=directory)
+            assert measure("memory and disk", first.run_custom_report, first) == expected
+            # A later process, with nothing in memory yet, and without the commits of the first one.
+            args.commit_every = args.runs + 1
+            later = ReportCache(directory=directory)
+            measure("later process, from disk", later.run_custom_report, later)
+            print(f"disk hits of the later process: {later.stats().disk_hits}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark of reading every row of a custom report with a CustomReportAutoPager in each of its modes.
+
+Runs against a local stand-in server that answers custom reports by page number. Every report takes an injected time
+on the server, and the server runs a limited number of reports at once. The caller's work on each page is simulated
+by sleeping for a while per page. A second, short report shows the requests the probe of CONCURRENT mode saves.
+
+Example:
+    python benchmarks/bench_report_paging.py --rows 60000 --page-size 2000 --report-ms 150 --work-ms 20
+"""
+from __future__ import annotations
+
+import argparse
+import threading
+import time
+from typing import List
+
+from _offline import offline_user  # noqa: F401, puts the repository root on sys.path
+from _stub_server import StubSapioServer
+from sapiopylib.rest.pojo.CustomReport import CustomReportCriteria, RawReportTerm, RawTermOperation, ReportColumn
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+
+from sapio_utils.report_paging import CONCURRENT, PREFETCH, SEQUENTIAL, CustomReportAutoPager
+
+DATA_TYPE_NAME = "QCDatum"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=60000)
+    parser.add_argument("--short-rows", type=int, default=5000, help="the rows of the short report")
+    parser.add_argument("--page-size", type=int, default=2000)
+    parser.add_argument("--report-ms", type=float, default=150, help="the time the server takes per report")
+    parser.add_argument("--server-concurrency", type=int, default=8)
+    parser.add_argument("--work-ms", type=float, default=20, help="the caller's work per page")
+    args = parser.parse_args()
+    slots = threading.Semaphore(args.server_concurrency)
+
+    def report(match, query, body) -> dict:
+        rows = args.rows if body["rootTerm"]["value"] == "0" else args.short_rows
+        first = body["pageNumber"] * body["pageSize"]
+        stop = min(first + body["pageSize"], rows)
+        with slots:
+            time.sleep(args.report_ms / 1000)
+        return {**body, "hasNextPage": stop < rows,
+                "resultTable": [[i + 1, f"S-{i // 4:08d}", i / 7] for i in range(first, stop)]}
+
+    columns = [ReportColumn(DATA_TYPE_NAME, "RecordId", FieldType.LONG),
+               ReportColumn(DATA_TYPE_NAME, "SampleId", FieldType.STRING),
+               ReportColumn(DATA_TYPE_NAME, "Concentration", FieldType.DOUBLE)]
+
+    def criteria(rows: int) -> CustomReportCriteria:
+        # The stand-in server tells the two reports apart by the value of their term.
+        value = "0" if rows == args.rows else "1"
+        return CustomReportCriteria(columns, RawReportTerm(DATA_TYPE_NAME, "RecordId",
+                                                           RawTermOperation.GREATER_THAN_OR_EQUAL_OPERATOR, value),
+                                    page_size=args.page_size, page_number=0)
+
+    with StubSapioServer() as server:
+        server.route("POST", "/report/runCustomReport", report)
+
+        def measure(name: str, rows: int, mode: str, workers: int = 1) -> None:
+            server.request_count = 0
+            start = time.perf_counter()
+            record_ids: List[int] = []
+            with CustomReportAutoPager(server.user(), criteria(rows), mode=mode, workers=workers) as pager:
+                for row in pager:
+                    record_ids.append(row[0])
+                    if len(record_ids) % args.page_size == 0:
+                        time.sleep(args.work_ms / 1000)
+            elapsed = time.perf_counter() - start
+            assert record_ids == list(range(1, rows + 1))
+            print(f"{name:<28}{rows:>8}{elapsed * 1000:>10.1f}{server.request_count:>10}")
+
+        print(f"pages of {args.page_size}, {args.report_ms:g} ms per report, {args.server_concurrency} reports at "
+              f"once on the server, {args.work_ms:g} ms of work per page")
+        print(f"{'mode':<28}{'rows':>8}{'ms':>10}{'requests':>10}")
+        for rows in (args.rows, args.short_rows):
+            measure("sequential", rows, SEQUENTIAL)
+            measure("prefetch", rows, PREFETCH)
+            for workers in (2, 4, 8):
+                measure(f"concurrent, {workers} workers", rows, CONCURRENT, workers)
+
+
+if __name__ == "__main__":
+    main()
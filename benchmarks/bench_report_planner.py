@@ -0,0 +1,147 @@
+"""
+Benchmark of running custom reports on synthetic term trees as written, and as planned by run_planned_report().
+
+Runs against a local stand-in server that evaluates the term tree of each report against every row of an in-memory
+table, so a report takes longer the more terms it has. The trees are built the way they often are by hand: a
+RecordId >= 0 term, a field comparison first, long left-nested chains of ORs of EQUAL_TO terms with repeated values,
+redundant bounds, and, in some trees, bounds that no value fits.
+
+Example:
+    python benchmarks/bench_report_planner.py --trees 200 --rows 500 --report-ms 5
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import operator
+import random
+import time
+from typing import Any, Callable, Dict, List
+
+from _offline import offline_user  # noqa: F401, puts the repository root on sys.path
+from _stub_server import StubSapioServer
+from sapiopylib.rest.DataMgmtService import DataMgmtServer
+from sapiopylib.rest.pojo.CustomReport import (AbstractReportTerm, CompositeReportTerm, CompositeTermOperation,
+                                               CustomReport, CustomReportCriteria, FieldCompareReportTerm,
+                                               RawReportTerm, RawTermOperation, ReportColumn)
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+
+from sapio_utils.report_planner import plan_criteria, run_planned_report, term_count, term_depth
+
+DATA_TYPE_NAME = "Sample"
+STATUSES = ["Received", "Queued", "Passed", "Failed", "Consumed", "Archived"]
+COLUMNS = [ReportColumn(DATA_TYPE_NAME, "RecordId", FieldType.LONG),
+           ReportColumn(DATA_TYPE_NAME, "RunNumber", FieldType.INTEGER),
+           ReportColumn(DATA_TYPE_NAME, "Volume", FieldType.DOUBLE),
+           ReportColumn(DATA_TYPE_NAME, "Status", FieldType.STRING)]
+NUMERIC_FIELDS = {"RecordId", "RunNumber", "Volume", "ParentRunNumber"}
+COMPARE: Dict[str, Callable[[Any, Any], bool]] = {
+    "EQUAL_TO_OPERATOR": operator.eq, "NOT_EQUAL_TO_OPERATOR": operator.ne,
+    "GREATER_THAN_OPERATOR": operator.gt, "GREATER_THAN_OR_EQUAL_OPERATOR": operator.ge,
+    "LESS_THAN_OPERATOR": operator.lt, "LESS_THAN_OR_EQUAL_OPERATOR": operator.le}
+
+
+def matches(term: Dict[str, Any], row: Dict[str, Any]) -> bool:
+    """
+    Whether a row matches the JSON of a term tree, the way the stand-in server evaluates it.
+    """
+    if term["termType"] == "COMPOSITE_TERM":
+        left = matches(term["leftChild"], row)
+        result = (left and matches(term["rightChild"], row) if term["termOperation"] == "AND_OPERATOR"
+                  else left or matches(term["rightChild"], row))
+    elif term["termType"] == "JOIN_TERM":
+        result = COMPARE[term["termOperation"]](row[term["leftDataFieldName"]], row[term["rightDataFieldName"]])
+    else:
+        field_name = term["dataFieldName"]
+        value = float(term["value"]) if field_name in NUMERIC_FIELDS else term["value"]
+        result = COMPARE[term["termOperation"]](row[field_name], value)
+    return result != term["negated"]
+
+
+def left_nested(terms: List[AbstractReportTerm], operation: CompositeTermOperation) -> AbstractReportTerm:
+    tree = terms[0]
+    for term in terms[1:]:
+        tree = CompositeReportTerm(tree, operation, term)
+    return tree
+
+
+def synthetic_criteria(rng: random.Random) -> CustomReportCriteria:
+    """
+    The criteria of a report with a term tree written the long way.
+    """
+    def raw(field_name: str, operation: RawTermOperation, value: Any) -> RawReportTerm:
+        return RawReportTerm(DATA_TYPE_NAME, field_name, operation, str(value))
+
+    eq = RawTermOperation.EQUAL_TO_OPERATOR
+    terms: List[AbstractReportTerm] = []
+    if rng.random() < 0.5:
+        terms.append(FieldCompareReportTerm(DATA_TYPE_NAME, "RunNumber", RawTermOperation.GREATER_THAN_OPERATOR,
+                                            DATA_TYPE_NAME, "ParentRunNumber"))
+    if rng.random() < 0.8:
+        terms.append(raw("RecordId", RawTermOperation.GREATER_THAN_OR_EQUAL_OPERATOR, 0))
+    first_run = rng.randrange(1, 30)
+    runs = [first_run + rng.randrange(rng.randrange(4, 12)) for _ in range(rng.randrange(5, 30))]
+    terms.append(left_nested([raw("RunNumber", eq, x) for x in runs], CompositeTermOperation.OR_OPERATOR))
+    statuses = [rng.choice(STATUSES[:3]) for _ in range(rng.randrange(2, 8))]
+    terms.append(left_nested([raw("Status", eq, x) for x in statuses], CompositeTermOperation.OR_OPERATOR))
+    low = rng.uniform(0, 40)
+    terms.append(raw("Volume", RawTermOperation.GREATER_THAN_OPERATOR, f"{low:.1f}"))
+    terms.append(raw("Volume", RawTermOperation.GREATER_THAN_OR_EQUAL_OPERATOR, f"{low / 2:.1f}"))
+    high = low + rng.uniform(-10, 60)
+    terms.append(raw("Volume", RawTermOperation.LESS_THAN_OPERATOR, f"{high:.1f}"))
+    return CustomReportCriteria(COLUMNS, left_nested(terms, CompositeTermOperation.AND_OPERATOR))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--trees", type=int, default=200)
+    parser.add_argument("--rows", type=int, default=500, help="the rows the stand-in server evaluates each tree on")
+    parser.add_argument("--report-ms", type=float, default=5, help="the time the server takes per report, besides "
+                                                                   "evaluating its terms")
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+    table = [{"RecordId": i + 1, "RunNumber": rng.randrange(1, 45), "ParentRunNumber": rng.randrange(1, 45),
+              "Volume": round(rng.uniform(0, 100), 2), "Status": rng.choice(STATUSES)} for i in range(args.rows)]
+    criteria_list = [synthetic_criteria(rng) for _ in range(args.trees)]
+    request_bytes = 0
+
+    def report(match, query, body) -> dict:
+        nonlocal request_bytes
+        request_bytes += len(json.dumps(body))
+        time.sleep(args.report_ms / 1000)
+        rows = [[row[x["dataFieldName"]] for x in body["columnList"]] for row in table
+                if matches(body["rootTerm"], row)]
+        return {**body, "hasNextPage": False, "resultTable": rows}
+
+    with StubSapioServer() as server:
+        server.route("POST", "/report/runCustomReport", report)
+        user = server.user()
+        report_manager = DataMgmtServer.get_custom_report_manager(user)
+
+        def measure(name: str, run: Callable[[CustomReportCriteria], CustomReport],
+                    terms: List[AbstractReportTerm]) -> List[List[List[Any]]]:
+            nonlocal request_bytes
+            server.request_count = request_bytes = 0
+            start = time.perf_counter()
+            results = [run(criteria).result_table for criteria in criteria_list]
+            elapsed = time.perf_counter() - start
+            print(f"{name:<12}{server.request_count:>10}{request_bytes / 1024:>12.1f}"
+                  f"{sum(term_count(x) for x in terms):>8}{max(term_depth(x) for x in terms):>10}"
+                  f"{elapsed * 1000:>10.1f}")
+            return results
+
+        plans = [plan_criteria(criteria)[1] for criteria in criteria_list]
+        print(f"{args.trees} term trees, {args.rows} rows, {args.report_ms:g} ms per report; "
+              f"{sum(x.matches_nothing for x in plans)} trees match nothing")
+        print(f"{'':<12}{'requests':>10}{'sent KiB':>12}{'terms':>8}{'max depth':>10}{'ms':>10}")
+        written = measure("as written", report_manager.run_custom_report, [x.root_term for x in criteria_list])
+        planned = measure("planned", lambda criteria: run_planned_report(user, criteria, {}),
+                          [x.term for x in plans if x.term is not None])
+        assert written == planned
+        print()
+        print(plans[0].explain())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Benchmark of the bytes sent and the time to decode one large page of records, as query_all_records_of_type reads.
+
+Serves a page of Sample records from a local stand-in server, which compresses its responses with gzip and sends
+MessagePack when the client asks for them. Compares the plain SapioUser, which parses JSON with the json module,
+against PooledSapioUser.send_json(), which negotiates the encoding as described in sapio_utils.wire_format, and
+decodes the page with decode_json(). Then times query_all_records_of_type, which reads JSON pages through either user.
+The MessagePack rows only run if the msgpack package is installed, and JSON is only parsed faster if orjson is.
+
+Example:
+    python benchmarks/bench_wire_format.py --records 100000
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import time
+from typing import Any, Dict, List
+
+from _offline import offline_user  # noqa: F401, puts the repository root on sys.path
+from _stub_server import StubSapioServer
+from sapiopylib.rest.DataMgmtService import DataMgmtServer
+from sapiopylib.rest.User import SapioUser
+
+from sapio_utils import wire_format
+from sapio_utils.http_pool import HttpPool, PooledSapioUser
+
+DATA_TYPE_NAME = "Sample"
+
+
+def sample_fields(record_id: int) -> Dict[str, Any]:
+    return {
+        "RecordId": record_id,
+        "DataRecordName": f"Sample {record_id}",
+        "SampleId": f"S-{record_id:08d}",
+        "OtherSampleId": f"Patient {record_id % 977} tube {record_id % 13}",
+        "ExemplarSampleType": ("Blood", "Plasma", "Serum", "Tissue")[record_id % 4],
+        "ExemplarSampleStatus": "Received" if record_id % 3 else "In Process",
+        "Volume": record_id % 500 / 10,
+        "Concentration": record_id % 1000 / 7,
+        "ContainerType": "Tube",
+        "IsControl": record_id % 50 == 0,
+        "DateCreated": 1_700_000_000_000 + record_id * 1000,
+        "CreatedBy": "lab.tech",
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    page = {"nextPageAvailable": False, "resultList": [
+        {"dataTypeName": DATA_TYPE_NAME, "recordId": record_id, "fields": sample_fields(record_id)}
+        for record_id in range(1, args.records + 1)]}
+
+    with StubSapioServer() as server:
+        server.route("GET", "/datarecordlist/all", lambda match, query, body: page)
+
+        def measure(name: str, user: SapioUser, compress: bool) -> Any:
+            server.compress = compress
+            fetch = decode = float("inf")
+            value = None
+            for _ in range(args.repeat):
+                # Free the previous page first, so that freeing it is not timed.
+                value = None
+                gc.collect()
+                server.bytes_sent = 0
+                start = time.perf_counter()
+                if isinstance(user, PooledSapioUser):
+                    # send_json() fetches and decodes in one call, so its decode time is part of the fetch time.
+                    value = user.send_json("GET", "/datarecordlist/all", params={"datatypename": DATA_TYPE_NAME})
+                    fetched = time.perf_counter()
+                else:
+                    response = user.get("/datarecordlist/all", params={"datatypename": DATA_TYPE_NAME})
+                    fetched = time.perf_counter()
+                    value = response.json()
+                fetch, decode = min(fetch, fetched - start), min(decode, time.perf_counter() - fetched)
+            print(f"{name:<32}{server.bytes_sent / 2 ** 20:>10.1f}"
+                  f"{fetch * 1000:>10.1f}{decode * 1000:>11.1f}")
+            return value
+
+        print(f"{args.records} Sample records in one page, best of {args.repeat}; orjson "
+              f"{'installed' if wire_format.orjson else 'not installed'}, msgpack "
+              f"{'installed' if wire_format.msgpack else 'not installed'}")
+        print(f"{'client':<32}{'MiB sent':>10}{'fetch ms':>10}{'decode ms':>11}")
+        expected = measure("SapioUser", server.user(), compress=False)
+        runs: List[Any] = []
+        json_pool, binary_pool = HttpPool(binary_encoding=False), HttpPool()
+        runs.append(measure("pooled", server.pooled_user(json_pool), compress=False))
+        runs.append(measure("pooled, gzip", server.pooled_user(json_pool), compress=True))
+        if wire_format.msgpack is not None:
+            runs.append(measure("pooled, MessagePack", server.pooled_user(binary_pool), compress=False))
+            runs.append(measure("pooled, MessagePack and gzip", server.pooled_user(binary_pool),
+                                compress=True))
+        assert all(run == expected for run in runs)
+
+        # The managers of sapiopylib read JSON pages, whichever pool their user sends its requests through.
+        for name, user in (("SapioUser, manager", server.user()), ("pooled, manager", server.pooled_user(binary_pool))):
+            server.compress = False
+            best = float("inf")
+            for _ in range(args.repeat):
+                records = None
+                gc.collect()
+                start = time.perf_counter()
+                records = DataMgmtServer.get_data_record_manager(user).query_all_records_of_type(DATA_TYPE_NAME)
+                best = min(best, time.perf_counter() - start)
+            assert len(records.result_list) == args.records
+            print(f"{name:<32}{'':>10}{best * 1000:>10.1f}")
+        stats = json_pool.stats()
+        print(f"the JSON pool reports {stats.bytes_received / 2 ** 20:.1f} MiB received for "
+              f"{stats.bytes_decompressed / 2 ** 20:.1f} MiB of responses")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,707 @@
+"""
+Auto-Generated Record Model Wrappers
+
+Each data type's wrapper lives in its own module and is only imported the first time it is accessed, so that
+"from data_type_models import SampleModel" does not load the wrappers of every other data type in the system.
+"""
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Dict, List, Type
+
+from data_type_models._base import GeneratedRecordModel
+from data_type_models._registry import ModelRegistry
+
+if TYPE_CHECKING:
+    from data_type_models.abi2700result import ABI2700ResultModel
+    from data_type_models.awssagemakerclientconfig import AWSSageMakerClientConfigModel
+    from data_type_models.accessionconfig import AccessionConfigModel
+    from data_type_models.agent import AgentModel
+    from data_type_models.analysisstatus import AnalysisStatusModel
+    from data_type_models.assignedprocess import AssignedProcessModel
+    from data_type_models.attachment import AttachmentModel
+    from data_type_models.barcodeconfig import BarcodeConfigModel
+    from data_type_models.batch import BatchModel
+    from data_type_models.bioanalyzerresult import BioAnalyzerResultModel
+    from data_type_models.bioradresult import BioRadResultModel
+    from data_type_models.biospecresult import BioSpecResultModel
+    from data_type_models.bodymass import BodyMassModel
+    from data_type_models.cdlconfig import CDLConfigModel
+    from data_type_models.cdlfieldmap import CDLFieldMapModel
+    from data_type_models.cdlfilefield import CDLFileFieldModel
+    from data_type_models.cdlgroupingconfig import CDLGroupingConfigModel
+    from data_type_models.c_extensionbuddy import C_ExtensionBuddyModel
+    from data_type_models.c_qubit import C_QubitModel
+    from data_type_models.c_sidelinktome import C_SideLinkToMeModel
+    from data_type_models.c_sidelinktosomethingelse import C_SideLinkToSomethingElseModel
+    from data_type_models.chemreactiondatafile import ChemReactionDataFileModel
+    from data_type_models.chemregistrysavedfieldmap import ChemRegistrySavedFieldMapModel
+    from data_type_models.chemicalreagent import ChemicalReagentModel
+    from data_type_models.chemicalreagentpart import ChemicalReagentPartModel
+    from data_type_models.clientconfigurations import ClientConfigurationsModel
+    from data_type_models.clinicalobservation import ClinicalObservationModel
+    from data_type_models.clusterdetail import ClusterDetailModel
+    from data_type_models.compound import CompoundModel
+    from data_type_models.compoundpart import CompoundPartModel
+    from data_type_models.compoundsaltconfig import CompoundSaltConfigModel
+    from data_type_models.computedassayresults import ComputedAssayResultsModel
+    from data_type_models.consumableitem import ConsumableItemModel
+    from data_type_models.consumablelotusage import ConsumableLotUsageModel
+    from data_type_models.consumable import ConsumableModel
+    from data_type_models.directory import DirectoryModel
+    from data_type_models.dosingresult import DosingResultModel
+    from data_type_models.dropsensea260result import DropSenseA260ResultModel
+    from data_type_models.dropsensea280result import DropSenseA280ResultModel
+    from data_type_models.elnexperimentdetail import ELNExperimentDetailModel
+    from data_type_models.elnexperiment import ELNExperimentModel
+    from data_type_models.elnsampledetail import ELNSampleDetailModel
+    from data_type_models.elntextentrydetail import ELNTextEntryDetailModel
+    from data_type_models.email import EmailModel
+    from data_type_models.enbattachmentthumbnail import EnbAttachmentThumbnailModel
+    from data_type_models.errormetric import ErrorMetricModel
+    from data_type_models.event import EventModel
+    from data_type_models.exemplarconfig import ExemplarConfigModel
+    from data_type_models.exemplarlabnotebookpdf import ExemplarLabNotebookPDFModel
+    from data_type_models.exemplarsdmsfile import ExemplarSDMSFileModel
+    from data_type_models.experimentgroup import ExperimentGroupModel
+    from data_type_models.expoentialdecaymodel import ExpoentialDecayModelModel
+    from data_type_models.exponentialdecayregparameter import ExponentialDecayRegParameterModel
+    from data_type_models.fcsfile import FCSFileModel
+    from data_type_models.fcsstatistic import FCSStatisticModel
+    from data_type_models.failedsampledetails import FailedSampleDetailsModel
+    from data_type_models.filebridgeconnection import FileBridgeConnectionModel
+    from data_type_models.flowairunresult import FlowAIRunResultModel
+    from data_type_models.flowcelllane import FlowCellLaneModel
+    from data_type_models.flowcell import FlowCellModel
+    from data_type_models.flowclustcluster import FlowClustClusterModel
+    from data_type_models.flowclustconfig import FlowClustConfigModel
+    from data_type_models.flowcompmatrixapplication import FlowCompMatrixApplicationModel
+    from data_type_models.flowcompensationmatrixdatum import FlowCompensationMatrixDatumModel
+    from data_type_models.flowcompensationmatrixinfo import FlowCompensationMatrixInfoModel
+    from data_type_models.flowcytofiletemplate import FlowCytoFileTemplateModel
+    from data_type_models.flowcytometrychannelinfo import FlowCytometryChannelInfoModel
+    from data_type_models.flowdensitygate import FlowDensityGateModel
+    from data_type_models.flowdensitygatingstrategy import FlowDensityGatingStrategyModel
+    from data_type_models.flowmanualgate import FlowManualGateModel
+    from data_type_models.fourpllmodel import FourPLLModelModel
+    from data_type_models.fragmentanalyzerresult import FragmentAnalyzerResultModel
+    from data_type_models.hiseqfirstbasereport import HiSeqFirstBaseReportModel
+    from data_type_models.illseqread import IllSeqReadModel
+    from data_type_models.illuminahiseqrunparameters import IlluminaHiSeqRunParametersModel
+    from data_type_models.illuminamiseqrunparameters import IlluminaMiSeqRunParametersModel
+    from data_type_models.illuminamiseqsssettings import IlluminaMiSeqSSSettingsModel
+    from data_type_models.illuminanextgenconfig import IlluminaNextGenConfigModel
+    from data_type_models.illuminanextseqrunparameters import IlluminaNextSeqRunParametersModel
+    from data_type_models.illuminanextseqsssettings import IlluminaNextSeqSSSettingsModel
+    from data_type_models.illuminanovaseqrunparameters import IlluminaNovaSeqRunParametersModel
+    from data_type_models.illuminanovaseqsssettings import IlluminaNovaSeqSSSettingsModel
+    from data_type_models.illuminanovaseqxrunparameters import IlluminaNovaSeqXRunParametersModel
+    from data_type_models.illuminasequencestatus import IlluminaSequenceStatusModel
+    from data_type_models.indexassignmentbatch import IndexAssignmentBatchModel
+    from data_type_models.indexassignment import IndexAssignmentModel
+    from data_type_models.indexassignmenttype import IndexAssignmentTypeModel
+    from data_type_models.indexbarcode import IndexBarcodeModel
+    from data_type_models.indexmetric import IndexMetricModel
+    from data_type_models.instrumentconfig import InstrumentConfigModel
+    from data_type_models.instrumentconsumabledatum import InstrumentConsumableDatumModel
+    from data_type_models.instrumentfieldmap import InstrumentFieldMapModel
+    from data_type_models.instrumentmaintenancereceipt import InstrumentMaintenanceReceiptModel
+    from data_type_models.instrument import InstrumentModel
+    from data_type_models.instrumentparseconfig import InstrumentParseConfigModel
+    from data_type_models.instrumentstatus import InstrumentStatusModel
+    from data_type_models.lcmsresult import LCMSResultModel
+    from data_type_models.learnedmodels import LearnedModelsModel
+    from data_type_models.linearregressionmodel import LinearRegressionModelModel
+    from data_type_models.linearregressionparameter import LinearRegressionParameterModel
+    from data_type_models.logisticregressionparameter import LogisticRegressionParameterModel
+    from data_type_models.maintenanceitem import MaintenanceItemModel
+    from data_type_models.mastermixingredient import MasterMixIngredientModel
+    from data_type_models.mastermixinstructions import MasterMixInstructionsModel
+    from data_type_models.mastermixitem import MasterMixItemModel
+    from data_type_models.measurementexception import MeasurementExceptionModel
+    from data_type_models.msdresult import MsdResultModel
+    from data_type_models.nanodropresult import NanodropResultModel
+    from data_type_models.notebookdirectory import NotebookDirectoryModel
+    from data_type_models.phasingprephasingscore import PhasingPrephasingScoreModel
+    from data_type_models.plasmiditem import PlasmidItemModel
+    from data_type_models.plasmid import PlasmidModel
+    from data_type_models.platedesignerwellannotation import PlateDesignerWellAnnotationModel
+    from data_type_models.platedesignerwellelement import PlateDesignerWellElementModel
+    from data_type_models.platemappingsrcitem import PlateMappingSrcItemModel
+    from data_type_models.platemappingtemplateexp import PlateMappingTemplateExpModel
+    from data_type_models.plate import PlateModel
+    from data_type_models.platetemplate import PlateTemplateModel
+    from data_type_models.platewellindex import PlateWellIndexModel
+    from data_type_models.platewellmapping import PlateWellMappingModel
+    from data_type_models.platewell import PlateWellModel
+    from data_type_models.processbranchcondition import ProcessBranchConditionModel
+    from data_type_models.processconfigdisplay import ProcessConfigDisplayModel
+    from data_type_models.process import ProcessModel
+    from data_type_models.processqueuecolumn import ProcessQueueColumnModel
+    from data_type_models.processworkflow import ProcessWorkflowModel
+    from data_type_models.processworkflowtracking import ProcessWorkflowTrackingModel
+    from data_type_models.project import ProjectModel
+    from data_type_models.protein import ProteinModel
+    from data_type_models.proteinpart import ProteinPartModel
+    from data_type_models.qcconfig import QCConfigModel
+    from data_type_models.qcdatum import QCDatumModel
+    from data_type_models.qscoredistribution import QScoreDistributionModel
+    from data_type_models.quadraticregressionparameter import QuadraticRegressionParameterModel
+    from data_type_models.quantstudiogenotypingdatum import QuantStudioGenotypingDatumModel
+    from data_type_models.reactioncomponent import ReactionComponentModel
+    from data_type_models.reaction import ReactionModel
+    from data_type_models.request import RequestModel
+    from data_type_models.requester import RequesterModel
+    from data_type_models.returnpoint import ReturnPointModel
+    from data_type_models.sba_accandpreccriteriainter import SBA_AccAndPrecCriteriaInterModel
+    from data_type_models.sba_accandprecinterresults import SBA_AccAndPrecInterResultsModel
+    from data_type_models.sba_accandprecintraresults import SBA_AccAndPrecIntraResultsModel
+    from data_type_models.sba_accuracyandpreccriteria import SBA_AccuracyAndPrecCriteriaModel
+    from data_type_models.sba_analyteconcentration import SBA_AnalyteConcentrationModel
+    from data_type_models.sba_assayanalyte import SBA_AssayAnalyteModel
+    from data_type_models.sba_assayinstrumentconfig import SBA_AssayInstrumentConfigModel
+    from data_type_models.sba_assayinstrumentexamplefile import SBA_AssayInstrumentExampleFileModel
+    from data_type_models.sba_assayplatetemplatewell import SBA_AssayPlateTemplateWellModel
+    from data_type_models.sba_assayresultdata import SBA_AssayResultDataModel
+    from data_type_models.sba_assayruncontrolresult import SBA_AssayRunControlResultModel
+    from data_type_models.sba_assayrunresult import SBA_AssayRunResultModel
+    from data_type_models.sba_assayrunsampleresult import SBA_AssayRunSampleResultModel
+    from data_type_models.sba_assaysample import SBA_AssaySampleModel
+    from data_type_models.sba_calibrationcurvecriteria import SBA_CalibrationCurveCriteriaModel
+    from data_type_models.sba_calibrationcurveresults import SBA_CalibrationCurveResultsModel
+    from data_type_models.sba_carryovercriteria import SBA_CarryOverCriteriaModel
+    from data_type_models.sba_carryoverresults import SBA_CarryOverResultsModel
+    from data_type_models.sba_certificateofanalysis import SBA_CertificateOfAnalysisModel
+    from data_type_models.sba_curvefitterfunctionconfig import SBA_CurveFitterFunctionConfigModel
+    from data_type_models.sba_masterassay import SBA_MasterAssayModel
+    from data_type_models.sba_masterassayqc import SBA_MasterAssayQCModel
+    from data_type_models.sba_masterassayrun import SBA_MasterAssayRunModel
+    from data_type_models.sba_masterassaystandard import SBA_MasterAssayStandardModel
+    from data_type_models.sba_recoverycriteria import SBA_RecoveryCriteriaModel
+    from data_type_models.sba_recoveryresults import SBA_RecoveryResultsModel
+    from data_type_models.sba_runacceptanceconfig import SBA_RunAcceptanceConfigModel
+    from data_type_models.sba_runacceptancecriterion import SBA_RunAcceptanceCriterionModel
+    from data_type_models.sba_selectivitycriteria import SBA_SelectivityCriteriaModel
+    from data_type_models.sba_selectivityresults import SBA_SelectivityResultsModel
+    from data_type_models.sba_sensitivitycriteria import SBA_SensitivityCriteriaModel
+    from data_type_models.sba_sensitivityresults import SBA_SensitivityResultsModel
+    from data_type_models.sciexresult import SCIEXResultModel
+    from data_type_models.sdmssubfolder import SDMSSubfolderModel
+    from data_type_models.sdmswatchpoint import SDMSWatchPointModel
+    from data_type_models.sampleevent import SampleEventModel
+    from data_type_models.sampleimportermappingconfig import SampleImporterMappingConfigModel
+    from data_type_models.sampleimportermapping import SampleImporterMappingModel
+    from data_type_models.sample import SampleModel
+    from data_type_models.samplereceipt import SampleReceiptModel
+    from data_type_models.samplingexception import SamplingExceptionModel
+    from data_type_models.samplingresult import SamplingResultModel
+    from data_type_models.samplingschedule import SamplingScheduleModel
+    from data_type_models.siriusweigherresult import SiriusWeigherResultModel
+    from data_type_models.stereoisomer import StereoisomerModel
+    from data_type_models.storageconfiguration import StorageConfigurationModel
+    from data_type_models.storageevent import StorageEventModel
+    from data_type_models.storagehierarchyconfig import StorageHierarchyConfigModel
+    from data_type_models.storageunit import StorageUnitModel
+    from data_type_models.studygroup import StudyGroupModel
+    from data_type_models.study import StudyModel
+    from data_type_models.studyscheduledefinition import StudyScheduleDefinitionModel
+    from data_type_models.studyschedule import StudyScheduleModel
+    from data_type_models.studysubject import StudySubjectModel
+    from data_type_models.studysubjectrandomizerconfig import StudySubjectRandomizerConfigModel
+    from data_type_models.studysubjectrequest import StudySubjectRequestModel
+    from data_type_models.studytaskgroup import StudyTaskGroupModel
+    from data_type_models.studytask import StudyTaskModel
+    from data_type_models.studytaskobservation import StudyTaskObservationModel
+    from data_type_models.subjectmeasurementschedule import SubjectMeasurementScheduleModel
+    from data_type_models.subject import SubjectModel
+    from data_type_models.subjectremoval import SubjectRemovalModel
+    from data_type_models.tapestationresult import TapeStationResultModel
+    from data_type_models.templatewell import TemplateWellModel
+    from data_type_models.treatment import TreatmentModel
+    from data_type_models.treatmentschedule import TreatmentScheduleModel
+    from data_type_models.veloxapprecord import VeloxAppRecordModel
+    from data_type_models.veloxcsvexport import VeloxCsvExportModel
+    from data_type_models.veloxdepartment import VeloxDepartmentModel
+    from data_type_models.veloxlocation import VeloxLocationModel
+    from data_type_models.veloxuser import VeloxUserModel
+    from data_type_models.vicellresult import ViCellResultModel
+    from data_type_models.viia7result import ViiA7ResultModel
+    from data_type_models.wellelement import WellElementModel
+    from data_type_models.workqueuebuttonconfiguration import WorkQueueButtonConfigurationModel
+    from data_type_models.workqueuedatatypeconfiguration import WorkQueueDataTypeConfigurationModel
+    from data_type_models.workqueuetabconfiguration import WorkQueueTabConfigurationModel
+    from data_type_models.workqueuetaskconfiguration import WorkQueueTaskConfigurationModel
+    from data_type_models.ncounterresult import nCounterResultModel
+
+# Wrapper class name -> module under this package that defines it.
+_MODEL_MODULES: Dict[str, str] = {
+    "ABI2700ResultModel": "abi2700result",
+    "AWSSageMakerClientConfigModel": "awssagemakerclientconfig",
+    "AccessionConfigModel": "accessionconfig",
+    "AgentModel": "agent",
+    "AnalysisStatusModel": "analysisstatus",
+    "AssignedProcessModel": "assignedprocess",
+    "AttachmentModel": "attachment",
+    "BarcodeConfigModel": "barcodeconfig",
+    "BatchModel": "batch",
+    "BioAnalyzerResultModel": "bioanalyzerresult",
+    "BioRadResultModel": "bioradresult",
+    "BioSpecResultModel": "biospecresult",
+    "BodyMassModel": "bodymass",
+    "CDLConfigModel": "cdlconfig",
+    "CDLFieldMapModel": "cdlfieldmap",
+    "CDLFileFieldModel": "cdlfilefield",
+    "CDLGroupingConfigModel": "cdlgroupingconfig",
+    "C_ExtensionBuddyModel": "c_extensionbuddy",
+    "C_QubitModel": "c_qubit",
+    "C_SideLinkToMeModel": "c_sidelinktome",
+    "C_SideLinkToSomethingElseModel": "c_sidelinktosomethingelse",
+    "ChemReactionDataFileModel": "chemreactiondatafile",
+    "ChemRegistrySavedFieldMapModel": "chemregistrysavedfieldmap",
+    "ChemicalReagentModel": "chemicalreagent",
+    "ChemicalReagentPartModel": "chemicalreagentpart",
+    "ClientConfigurationsModel": "clientconfigurations",
+    "ClinicalObservationModel": "clinicalobservation",
+    "ClusterDetailModel": "clusterdetail",
+    "CompoundModel": "compound",
+    "CompoundPartModel": "compoundpart",
+    "CompoundSaltConfigModel": "compoundsaltconfig",
+    "ComputedAssayResultsModel": "computedassayresults",
+    "ConsumableItemModel": "consumableitem",
+    "ConsumableLotUsageModel": "consumablelotusage",
+    "ConsumableModel": "consumable",
+    "DirectoryModel": "directory",
+    "DosingResultModel": "dosingresult",
+    "DropSenseA260ResultModel": "dropsensea260result",
+    "DropSenseA280ResultModel": "dropsensea280result",
+    "ELNExperimentDetailModel": "elnexperimentdetail",
+    "ELNExperimentModel": "elnexperiment",
+    "ELNSampleDetailModel": "elnsampledetail",
+    "ELNTextEntryDetailModel": "elntextentrydetail",
+    "EmailModel": "email",
+    "EnbAttachmentThumbnailModel": "enbattachmentthumbnail",
+    "ErrorMetricModel": "errormetric",
+    "EventModel": "event",
+    "ExemplarConfigModel": "exemplarconfig",
+    "ExemplarLabNotebookPDFModel": "exemplarlabnotebookpdf",
+    "ExemplarSDMSFileModel": "exemplarsdmsfile",
+    "ExperimentGroupModel": "experimentgroup",
+    "ExpoentialDecayModelModel": "expoentialdecaymodel",
+    "ExponentialDecayRegParameterModel": "exponentialdecayregparameter",
+    "FCSFileModel": "fcsfile",
+    "FCSStatisticModel": "fcsstatistic",
+    "FailedSampleDetailsModel": "failedsampledetails",
+    "FileBridgeConnectionModel": "filebridgeconnection",
+    "FlowAIRunResultModel": "flowairunresult",
+    "FlowCellLaneModel": "flowcelllane",
+    "FlowCellModel": "flowcell",
+    "FlowClustClusterModel": "flowclustcluster",
+    "FlowClustConfigModel": "flowclustconfig",
+    "FlowCompMatrixApplicationModel": "flowcompmatrixapplication",
+    "FlowCompensationMatrixDatumModel": "flowcompensationmatrixdatum",
+    "FlowCompensationMatrixInfoModel": "flowcompensationmatrixinfo",
+    "FlowCytoFileTemplateModel": "flowcytofiletemplate",
+    "FlowCytometryChannelInfoModel": "flowcytometrychannelinfo",
+    "FlowDensityGateModel": "flowdensitygate",
+    "FlowDensityGatingStrategyModel": "flowdensitygatingstrategy",
+    "FlowManualGateModel": "flowmanualgate",
+    "FourPLLModelModel": "fourpllmodel",
+    "FragmentAnalyzerResultModel": "fragmentanalyzerresult",
+    "HiSeqFirstBaseReportModel": "hiseqfirstbasereport",
+    "IllSeqReadModel": "illseqread",
+    "IlluminaHiSeqRunParametersModel": "illuminahiseqrunparameters",
+    "IlluminaMiSeqRunParametersModel": "illuminamiseqrunparameters",
+    "IlluminaMiSeqSSSettingsModel": "illuminamiseqsssettings",
+    "IlluminaNextGenConfigModel": "illuminanextgenconfig",
+    "IlluminaNextSeqRunParametersModel": "illuminanextseqrunparameters",
+    "IlluminaNextSeqSSSettingsModel": "illuminanextseqsssettings",
+    "IlluminaNovaSeqRunParametersModel": "illuminanovaseqrunparameters",
+    "IlluminaNovaSeqSSSettingsModel": "illuminanovaseqsssettings",
+    "IlluminaNovaSeqXRunParametersModel": "illuminanovaseqxrunparameters",
+    "IlluminaSequenceStatusModel": "illuminasequencestatus",
+    "IndexAssignmentBatchModel": "indexassignmentbatch",
+    "IndexAssignmentModel": "indexassignment",
+    "IndexAssignmentTypeModel": "indexassignmenttype",
+    "IndexBarcodeModel": "indexbarcode",
+    "IndexMetricModel": "indexmetric",
+    "InstrumentConfigModel": "instrumentconfig",
+    "InstrumentConsumableDatumModel": "instrumentconsumabledatum",
+    "InstrumentFieldMapModel": "instrumentfieldmap",
+    "InstrumentMaintenanceReceiptModel": "instrumentmaintenancereceipt",
+    "InstrumentModel": "instrument",
+    "InstrumentParseConfigModel": "instrumentparseconfig",
+    "InstrumentStatusModel": "instrumentstatus",
+    "LCMSResultModel": "lcmsresult",
+    "LearnedModelsModel": "learnedmodels",
+    "LinearRegressionModelModel": "linearregressionmodel",
+    "LinearRegressionParameterModel": "linearregressionparameter",
+    "LogisticRegressionParameterModel": "logisticregressionparameter",
+    "MaintenanceItemModel": "maintenanceitem",
+    "MasterMixIngredientModel": "mastermixingredient",
+    "MasterMixInstructionsModel": "mastermixinstructions",
+    "MasterMixItemModel": "mastermixitem",
+    "MeasurementExceptionModel": "measurementexception",
+    "MsdResultModel": "msdresult",
+    "NanodropResultModel": "nanodropresult",
+    "NotebookDirectoryModel": "notebookdirectory",
+    "PhasingPrephasingScoreModel": "phasingprephasingscore",
+    "PlasmidItemModel": "plasmiditem",
+    "PlasmidModel": "plasmid",
+    "PlateDesignerWellAnnotationModel": "platedesignerwellannotation",
+    "PlateDesignerWellElementModel": "platedesignerwellelement",
+    "PlateMappingSrcItemModel": "platemappingsrcitem",
+    "PlateMappingTemplateExpModel": "platemappingtemplateexp",
+    "PlateModel": "plate",
+    "PlateTemplateModel": "platetemplate",
+    "PlateWellIndexModel": "platewellindex",
+    "PlateWellMappingModel": "platewellmapping",
+    "PlateWellModel": "platewell",
+    "ProcessBranchConditionModel": "processbranchcondition",
+    "ProcessConfigDisplayModel": "processconfigdisplay",
+    "ProcessModel": "process",
+    "ProcessQueueColumnModel": "processqueuecolumn",
+    "ProcessWorkflowModel": "processworkflow",
+    "ProcessWorkflowTrackingModel": "processworkflowtracking",
+    "ProjectModel": "project",
+    "ProteinModel": "protein",
+    "ProteinPartModel": "proteinpart",
+    "QCConfigModel": "qcconfig",
+    "QCDatumModel": "qcdatum",
+    "QScoreDistributionModel": "qscoredistribution",
+    "QuadraticRegressionParameterModel": "quadraticregressionparameter",
+    "QuantStudioGenotypingDatumModel": "quantstudiogenotypingdatum",
+    "ReactionComponentModel": "reactioncomponent",
+    "ReactionModel": "reaction",
+    "RequestModel": "request",
+    "RequesterModel": "requester",
+    "ReturnPointModel": "returnpoint",
+    "SBA_AccAndPrecCriteriaInterModel": "sba_accandpreccriteriainter",
+    "SBA_AccAndPrecInterResultsModel": "sba_accandprecinterresults",
+    "SBA_AccAndPrecIntraResultsModel": "sba_accandprecintraresults",
+    "SBA_AccuracyAndPrecCriteriaModel": "sba_accuracyandpreccriteria",
+    "SBA_AnalyteConcentrationModel": "sba_analyteconcentration",
+    "SBA_AssayAnalyteModel": "sba_assayanalyte",
+    "SBA_AssayInstrumentConfigModel": "sba_assayinstrumentconfig",
+    "SBA_AssayInstrumentExampleFileModel": "sba_assayinstrumentexamplefile",
+    "SBA_AssayPlateTemplateWellModel": "sba_assayplatetemplatewell",
+    "SBA_AssayResultDataModel": "sba_assayresultdata",
+    "SBA_AssayRunControlResultModel": "sba_assayruncontrolresult",
+    "SBA_AssayRunResultModel": "sba_assayrunresult",
+    "SBA_AssayRunSampleResultModel": "sba_assayrunsampleresult",
+    "SBA_AssaySampleModel": "sba_assaysample",
+    "SBA_CalibrationCurveCriteriaModel": "sba_calibrationcurvecriteria",
+    "SBA_CalibrationCurveResultsModel": "sba_calibrationcurveresults",
+    "SBA_CarryOverCriteriaModel": "sba_carryovercriteria",
+    "SBA_CarryOverResultsModel": "sba_carryoverresults",
+    "SBA_CertificateOfAnalysisModel": "sba_certificateofanalysis",
+    "SBA_CurveFitterFunctionConfigModel": "sba_curvefitterfunctionconfig",
+    "SBA_MasterAssayModel": "sba_masterassay",
+    "SBA_MasterAssayQCModel": "sba_masterassayqc",
+    "SBA_MasterAssayRunModel": "sba_masterassayrun",
+    "SBA_MasterAssayStandardModel": "sba_masterassaystandard",
+    "SBA_RecoveryCriteriaModel": "sba_recoverycriteria",
+    "SBA_RecoveryResultsModel": "sba_recoveryresults",
+    "SBA_RunAcceptanceConfigModel": "sba_runacceptanceconfig",
+    "SBA_RunAcceptanceCriterionModel": "sba_runacceptancecriterion",
+    "SBA_SelectivityCriteriaModel": "sba_selectivitycriteria",
+    "SBA_SelectivityResultsModel": "sba_selectivityresults",
+    "SBA_SensitivityCriteriaModel": "sba_sensitivitycriteria",
+    "SBA_SensitivityResultsModel": "sba_sensitivityresults",
+    "SCIEXResultModel": "sciexresult",
+    "SDMSSubfolderModel": "sdmssubfolder",
+    "SDMSWatchPointModel": "sdmswatchpoint",
+    "SampleEventModel": "sampleevent",
+    "SampleImporterMappingConfigModel": "sampleimportermappingconfig",
+    "SampleImporterMappingModel": "sampleimportermapping",
+    "SampleModel": "sample",
+    "SampleReceiptModel": "samplereceipt",
+    "SamplingExceptionModel": "samplingexception",
+    "SamplingResultModel": "samplingresult",
+    "SamplingScheduleModel": "samplingschedule",
+    "SiriusWeigherResultModel": "siriusweigherresult",
+    "StereoisomerModel": "stereoisomer",
+    "StorageConfigurationModel": "storageconfiguration",
+    "StorageEventModel": "storageevent",
+    "StorageHierarchyConfigModel": "storagehierarchyconfig",
+    "StorageUnitModel": "storageunit",
+    "StudyGroupModel": "studygroup",
+    "StudyModel": "study",
+    "StudyScheduleDefinitionModel": "studyscheduledefinition",
+    "StudyScheduleModel": "studyschedule",
+    "StudySubjectModel": "studysubject",
+    "StudySubjectRandomizerConfigModel": "studysubjectrandomizerconfig",
+    "StudySubjectRequestModel": "studysubjectrequest",
+    "StudyTaskGroupModel": "studytaskgroup",
+    "StudyTaskModel": "studytask",
+    "StudyTaskObservationModel": "studytaskobservation",
+    "SubjectMeasurementScheduleModel": "subjectmeasurementschedule",
+    "SubjectModel": "subject",
+    "SubjectRemovalModel": "subjectremoval",
+    "TapeStationResultModel": "tapestationresult",
+    "TemplateWellModel": "templatewell",
+    "TreatmentModel": "treatment",
+    "TreatmentScheduleModel": "treatmentschedule",
+    "VeloxAppRecordModel": "veloxapprecord",
+    "VeloxCsvExportModel": "veloxcsvexport",
+    "VeloxDepartmentModel": "veloxdepartment",
+    "VeloxLocationModel": "veloxlocation",
+    "VeloxUserModel": "veloxuser",
+    "ViCellResultModel": "vicellresult",
+    "ViiA7ResultModel": "viia7result",
+    "WellElementModel": "wellelement",
+    "WorkQueueButtonConfigurationModel": "workqueuebuttonconfiguration",
+    "WorkQueueDataTypeConfigurationModel": "workqueuedatatypeconfiguration",
+    "WorkQueueTabConfigurationModel": "workqueuetabconfiguration",
+    "WorkQueueTaskConfigurationModel": "workqueuetaskconfiguration",
+    "nCounterResultModel": "ncounterresult",
+}
+
+# Data type name -> wrapper class name.
+_DATA_TYPE_MODELS: Dict[str, str] = {
+    "ABI2700Result": "ABI2700ResultModel",
+    "AWSSageMakerClientConfig": "AWSSageMakerClientConfigModel",
+    "AccessionConfig": "AccessionConfigModel",
+    "Agent": "AgentModel",
+    "AnalysisStatus": "AnalysisStatusModel",
+    "AssignedProcess": "AssignedProcessModel",
+    "Attachment": "AttachmentModel",
+    "BarcodeConfig": "BarcodeConfigModel",
+    "Batch": "BatchModel",
+    "BioAnalyzerResult": "BioAnalyzerResultModel",
+    "BioRadResult": "BioRadResultModel",
+    "BioSpecResult": "BioSpecResultModel",
+    "BodyMass": "BodyMassModel",
+    "CDLConfig": "CDLConfigModel",
+    "CDLFieldMap": "CDLFieldMapModel",
+    "CDLFileField": "CDLFileFieldModel",
+    "CDLGroupingConfig": "CDLGroupingConfigModel",
+    "C_ExtensionBuddy": "C_ExtensionBuddyModel",
+    "C_Qubit": "C_QubitModel",
+    "C_SideLinkToMe": "C_SideLinkToMeModel",
+    "C_SideLinkToSomethingElse": "C_SideLinkToSomethingElseModel",
+    "ChemReactionDataFile": "ChemReactionDataFileModel",
+    "ChemRegistrySavedFieldMap": "ChemRegistrySavedFieldMapModel",
+    "ChemicalReagent": "ChemicalReagentModel",
+    "ChemicalReagentPart": "ChemicalReagentPartModel",
+    "ClientConfigurations": "ClientConfigurationsModel",
+    "ClinicalObservation": "ClinicalObservationModel",
+    "ClusterDetail": "ClusterDetailModel",
+    "Compound": "CompoundModel",
+    "CompoundPart": "CompoundPartModel",
+    "CompoundSaltConfig": "CompoundSaltConfigModel",
+    "ComputedAssayResults": "ComputedAssayResultsModel",
+    "ConsumableItem": "ConsumableItemModel",
+    "ConsumableLotUsage": "ConsumableLotUsageModel",
+    "Consumable": "ConsumableModel",
+    "Directory": "DirectoryModel",
+    "DosingResult": "DosingResultModel",
+    "DropSenseA260Result": "DropSenseA260ResultModel",
+    "DropSenseA280Result": "DropSenseA280ResultModel",
+    "ELNExperimentDetail": "ELNExperimentDetailModel",
+    "ELNExperiment": "ELNExperimentModel",
+    "ELNSampleDetail": "ELNSampleDetailModel",
+    "ELNTextEntryDetail": "ELNTextEntryDetailModel",
+    "Email": "EmailModel",
+    "EnbAttachmentThumbnail": "EnbAttachmentThumbnailModel",
+    "ErrorMetric": "ErrorMetricModel",
+    "Event": "EventModel",
+    "ExemplarConfig": "ExemplarConfigModel",
+    "ExemplarLabNotebookPDF": "ExemplarLabNotebookPDFModel",
+    "ExemplarSDMSFile": "ExemplarSDMSFileModel",
+    "ExperimentGroup": "ExperimentGroupModel",
+    "ExpoentialDecayModel": "ExpoentialDecayModelModel",
+    "ExponentialDecayRegParameter": "ExponentialDecayRegParameterModel",
+    "FCSFile": "FCSFileModel",
+    "FCSStatistic": "FCSStatisticModel",
+    "FailedSampleDetails": "FailedSampleDetailsModel",
+    "FileBridgeConnection": "FileBridgeConnectionModel",
+    "FlowAIRunResult": "FlowAIRunResultModel",
+    "FlowCellLane": "FlowCellLaneModel",
+    "FlowCell": "FlowCellModel",
+    "FlowClustCluster": "FlowClustClusterModel",
+    "FlowClustConfig": "FlowClustConfigModel",
+    "FlowCompMatrixApplication": "FlowCompMatrixApplicationModel",
+    "FlowCompensationMatrixDatum": "FlowCompensationMatrixDatumModel",
+    "FlowCompensationMatrixInfo": "FlowCompensationMatrixInfoModel",
+    "FlowCytoFileTemplate": "FlowCytoFileTemplateModel",
+    "FlowCytometryChannelInfo": "FlowCytometryChannelInfoModel",
+    "FlowDensityGate": "FlowDensityGateModel",
+    "FlowDensityGatingStrategy": "FlowDensityGatingStrategyModel",
+    "FlowManualGate": "FlowManualGateModel",
+    "FourPLLModel": "FourPLLModelModel",
+    "FragmentAnalyzerResult": "FragmentAnalyzerResultModel",
+    "HiSeqFirstBaseReport": "HiSeqFirstBaseReportModel",
+    "IllSeqRead": "IllSeqReadModel",
+    "IlluminaHiSeqRunParameters": "IlluminaHiSeqRunParametersModel",
+    "IlluminaMiSeqRunParameters": "IlluminaMiSeqRunParametersModel",
+    "IlluminaMiSeqSSSettings": "IlluminaMiSeqSSSettingsModel",
+    "IlluminaNextGenConfig": "IlluminaNextGenConfigModel",
+    "IlluminaNextSeqRunParameters": "IlluminaNextSeqRunParametersModel",
+    "IlluminaNextSeqSSSettings": "IlluminaNextSeqSSSettingsModel",
+    "IlluminaNovaSeqRunParameters": "IlluminaNovaSeqRunParametersModel",
+    "IlluminaNovaSeqSSSettings": "IlluminaNovaSeqSSSettingsModel",
+    "IlluminaNovaSeqXRunParameters": "IlluminaNovaSeqXRunParametersModel",
+    "IlluminaSequenceStatus": "IlluminaSequenceStatusModel",
+    "IndexAssignmentBatch": "IndexAssignmentBatchModel",
+    "IndexAssignment": "IndexAssignmentModel",
+    "IndexAssignmentType": "IndexAssignmentTypeModel",
+    "IndexBarcode": "IndexBarcodeModel",
+    "IndexMetric": "IndexMetricModel",
+    "InstrumentConfig": "InstrumentConfigModel",
+    "InstrumentConsumableDatum": "InstrumentConsumableDatumModel",
+    "InstrumentFieldMap": "InstrumentFieldMapModel",
+    "InstrumentMaintenanceReceipt": "InstrumentMaintenanceReceiptModel",
+    "Instrument": "InstrumentModel",
+    "InstrumentParseConfig": "InstrumentParseConfigModel",
+    "InstrumentStatus": "InstrumentStatusModel",
+    "LCMSResult": "LCMSResultModel",
+    "LearnedModels": "LearnedModelsModel",
+    "LinearRegressionModel": "LinearRegressionModelModel",
+    "LinearRegressionParameter": "LinearRegressionParameterModel",
+    "LogisticRegressionParameter": "LogisticRegressionParameterModel",
+    "MaintenanceItem": "MaintenanceItemModel",
+    "MasterMixIngredient": "MasterMixIngredientModel",
+    "MasterMixInstructions": "MasterMixInstructionsModel",
+    "MasterMixItem": "MasterMixItemModel",
+    "MeasurementException": "MeasurementExceptionModel",
+    "MsdResult": "MsdResultModel",
+    "NanodropResult": "NanodropResultModel",
+    "NotebookDirectory": "NotebookDirectoryModel",
+    "PhasingPrephasingScore": "PhasingPrephasingScoreModel",
+    "PlasmidItem": "PlasmidItemModel",
+    "Plasmid": "PlasmidModel",
+    "PlateDesignerWellAnnotation": "PlateDesignerWellAnnotationModel",
+    "PlateDesignerWellElement": "PlateDesignerWellElementModel",
+    "PlateMappingSrcItem": "PlateMappingSrcItemModel",
+    "PlateMappingTemplateExp": "PlateMappingTemplateExpModel",
+    "Plate": "PlateModel",
+    "PlateTemplate": "PlateTemplateModel",
+    "PlateWellIndex": "PlateWellIndexModel",
+    "PlateWellMapping": "PlateWellMappingModel",
+    "PlateWell": "PlateWellModel",
+    "ProcessBranchCondition": "ProcessBranchConditionModel",
+    "ProcessConfigDisplay": "ProcessConfigDisplayModel",
+    "Process": "ProcessModel",
+    "ProcessQueueColumn": "ProcessQueueColumnModel",
+    "ProcessWorkflow": "ProcessWorkflowModel",
+    "ProcessWorkflowTracking": "ProcessWorkflowTrackingModel",
+    "Project": "ProjectModel",
+    "Protein": "ProteinModel",
+    "ProteinPart": "ProteinPartModel",
+    "QCConfig": "QCConfigModel",
+    "QCDatum": "QCDatumModel",
+    "QScoreDistribution": "QScoreDistributionModel",
+    "QuadraticRegressionParameter": "QuadraticRegressionParameterModel",
+    "QuantStudioGenotypingDatum": "QuantStudioGenotypingDatumModel",
+    "ReactionComponent": "ReactionComponentModel",
+    "Reaction": "ReactionModel",
+    "Request": "RequestModel",
+    "Requester": "RequesterModel",
+    "ReturnPoint": "ReturnPointModel",
+    "SBA_AccAndPrecCriteriaInter": "SBA_AccAndPrecCriteriaInterModel",
+    "SBA_AccAndPrecInterResults": "SBA_AccAndPrecInterResultsModel",
+    "SBA_AccAndPrecIntraResults": "SBA_AccAndPrecIntraResultsModel",
+    "SBA_AccuracyAndPrecCriteria": "SBA_AccuracyAndPrecCriteriaModel",
+    "SBA_AnalyteConcentration": "SBA_AnalyteConcentrationModel",
+    "SBA_AssayAnalyte": "SBA_AssayAnalyteModel",
+    "SBA_AssayInstrumentConfig": "SBA_AssayInstrumentConfigModel",
+    "SBA_AssayInstrumentExampleFile": "SBA_AssayInstrumentExampleFileModel",
+    "SBA_AssayPlateTemplateWell": "SBA_AssayPlateTemplateWellModel",
+    "SBA_AssayResultData": "SBA_AssayResultDataModel",
+    "SBA_AssayRunControlResult": "SBA_AssayRunControlResultModel",
+    "SBA_AssayRunResult": "SBA_AssayRunResultModel",
+    "SBA_AssayRunSampleResult": "SBA_AssayRunSampleResultModel",
+    "SBA_AssaySample": "SBA_AssaySampleModel",
+    "SBA_CalibrationCurveCriteria": "SBA_CalibrationCurveCriteriaModel",
+    "SBA_CalibrationCurveResults": "SBA_CalibrationCurveResultsModel",
+    "SBA_CarryOverCriteria": "SBA_CarryOverCriteriaModel",
+    "SBA_CarryOverResults": "SBA_CarryOverResultsModel",
+    "SBA_CertificateOfAnalysis": "SBA_CertificateOfAnalysisModel",
+    "SBA_CurveFitterFunctionConfig": "SBA_CurveFitterFunctionConfigModel",
+    "SBA_MasterAssay": "SBA_MasterAssayModel",
+    "SBA_MasterAssayQC": "SBA_MasterAssayQCModel",
+    "SBA_MasterAssayRun": "SBA_MasterAssayRunModel",
+    "SBA_MasterAssayStandard": "SBA_MasterAssayStandardModel",
+    "SBA_RecoveryCriteria": "SBA_RecoveryCriteriaModel",
+    "SBA_RecoveryResults": "SBA_RecoveryResultsModel",
+    "SBA_RunAcceptanceConfig": "SBA_RunAcceptanceConfigModel",
+    "SBA_RunAcceptanceCriterion": "SBA_RunAcceptanceCriterionModel",
+    "SBA_SelectivityCriteria": "SBA_SelectivityCriteriaModel",
+    "SBA_SelectivityResults": "SBA_SelectivityResultsModel",
+    "SBA_SensitivityCriteria": "SBA_SensitivityCriteriaModel",
+    "SBA_SensitivityResults": "SBA_SensitivityResultsModel",
+    "SCIEXResult": "SCIEXResultModel",
+    "SDMSSubfolder": "SDMSSubfolderModel",
+    "SDMSWatchPoint": "SDMSWatchPointModel",
+    "SampleEvent": "SampleEventModel",
+    "SampleImporterMappingConfig": "SampleImporterMappingConfigModel",
+    "SampleImporterMapping": "SampleImporterMappingModel",
+    "Sample": "SampleModel",
+    "SampleReceipt": "SampleReceiptModel",
+    "SamplingException": "SamplingExceptionModel",
+    "SamplingResult": "SamplingResultModel",
+    "SamplingSchedule": "SamplingScheduleModel",
+    "SiriusWeigherResult": "SiriusWeigherResultModel",
+    "Stereoisomer": "StereoisomerModel",
+    "StorageConfiguration": "StorageConfigurationModel",
+    "StorageEvent": "StorageEventModel",
+    "StorageHierarchyConfig": "StorageHierarchyConfigModel",
+    "StorageUnit": "StorageUnitModel",
+    "StudyGroup": "StudyGroupModel",
+    "Study": "StudyModel",
+    "StudyScheduleDefinition": "StudyScheduleDefinitionModel",
+    "StudySchedule": "StudyScheduleModel",
+    "StudySubject": "StudySubjectModel",
+    "StudySubjectRandomizerConfig": "StudySubjectRandomizerConfigModel",
+    "StudySubjectRequest": "StudySubjectRequestModel",
+    "StudyTaskGroup": "StudyTaskGroupModel",
+    "StudyTask": "StudyTaskModel",
+    "StudyTaskObservation": "StudyTaskObservationModel",
+    "SubjectMeasurementSchedule": "SubjectMeasurementScheduleModel",
+    "Subject": "SubjectModel",
+    "SubjectRemoval": "SubjectRemovalModel",
+    "TapeStationResult": "TapeStationResultModel",
+    "TemplateWell": "TemplateWellModel",
+    "Treatment": "TreatmentModel",
+    "TreatmentSchedule": "TreatmentScheduleModel",
+    "VeloxAppRecord": "VeloxAppRecordModel",
+    "VeloxCsvExport": "VeloxCsvExportModel",
+    "VeloxDepartment": "VeloxDepartmentModel",
+    "VeloxLocation": "VeloxLocationModel",
+    "VeloxUser": "VeloxUserModel",
+    "ViCellResult": "ViCellResultModel",
+    "ViiA7Result": "ViiA7ResultModel",
+    "WellElement": "WellElementModel",
+    "WorkQueueButtonConfiguration": "WorkQueueButtonConfigurationModel",
+    "WorkQueueDataTypeConfiguration": "WorkQueueDataTypeConfigurationModel",
+    "WorkQueueTabConfiguration": "WorkQueueTabConfigurationModel",
+    "WorkQueueTaskConfiguration": "WorkQueueTaskConfigurationModel",
+    "nCounterResult": "nCounterResultModel",
+}
+
+__all__ = list(_MODEL_MODULES)
+
+
+def __getattr__(name: str):
+    module_name = _MODEL_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    model = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = model
+    return model
+
+
+# The wrapper class of every data type by data type name, e.g. MODELS_BY_DATA_TYPE["Sample"] is SampleModel.
+# Only the wrappers that are looked up are imported.
+MODELS_BY_DATA_TYPE: ModelRegistry = ModelRegistry(_DATA_TYPE_MODELS, __getattr__)
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_MODEL_MODULES))
+
+
+def load_all_models() -> List[Type[GeneratedRecordModel]]:
+    """
+    Import every wrapper in this package. Only use this when all wrappers are actually needed.
+    """
+    return [__getattr__(name) for name in _MODEL_MODULES]
@@ -0,0 +1,197 @@
+"""
+Shared building blocks of the generated record model wrappers in this package.
+"""
+from __future__ import annotations
+
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Generic, Iterable, Mapping, Optional, Sequence, Tuple, TypeVar
+
+from sapiopylib.rest.pojo.DataRecord import DataRecord
+from sapiopylib.rest.pojo.datatype.FieldDefinition import AbstractVeloxFieldDefinition, FieldType
+from sapiopylib.rest.utils.recordmodel.PyRecordModel import AbstractRecordModel, PyRecordModel
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrappedRecordModel, WrapperField
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+    from data_type_models._compact import CompactRecordStore
+
+FieldValueType = TypeVar("FieldValueType")
+
+# System field present on every data type, which is not part of the generated fields.
+RECORD_ID_FIELD: WrapperField = WrapperField("RecordId", FieldType.LONG)
+
+
+class GeneratedRecordModel(WrappedRecordModel):
+    """
+    Base class of the generated record model wrappers, adding bulk operations over many records of the same type.
+    """
+    # The wrapper fields declared on the class, in declaration order, and the same fields by field name. Both are
+    # computed once, when each generated subclass is defined.
+    _wrapper_fields: Tuple[WrapperField, ...] = ()
+    _wrapper_fields_by_name: Mapping[str, WrapperField] = MappingProxyType({})
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._wrapper_fields = tuple(value for name, value in vars(cls).items()
+                                    if name.endswith("__FIELD_NAME") and isinstance(value, WrapperField))
+        cls._wrapper_fields_by_name = MappingProxyType({x.field_name: x for x in cls._wrapper_fields})
+
+    @classmethod
+    def get_wrapper_fields(cls) -> Tuple[WrapperField, ...]:
+        """
+        The fields of this wrapper's data type, in the order they are declared on the wrapper.
+        """
+        return cls._wrapper_fields
+
+    @classmethod
+    def get_wrapper_fields_by_name(cls) -> Mapping[str, WrapperField]:
+        """
+        The fields of this wrapper's data type, by data field name.
+        """
+        return cls._wrapper_fields_by_name
+
+    @classmethod
+    def get_wrapper_field(cls, field: WrapperField | str) -> WrapperField:
+        """
+        Resolve a field of this wrapper, given either its wrapper field or its data field name.
+        """
+        if isinstance(field, WrapperField):
+            return field
+        wrapper_field = cls._wrapper_fields_by_name.get(field)
+        if wrapper_field is not None:
+            return wrapper_field
+        if field.lower() == RECORD_ID_FIELD.field_name.lower():
+            return RECORD_ID_FIELD
+        raise ValueError(f"{cls.__name__} has no field named {field!r}.")
+
+    @classmethod
+    def column(cls, models: Iterable[AbstractRecordModel | PyRecordModel], field: WrapperField | str,
+               masked: bool = False) -> np.ndarray:
+        """
+        Read one field of many record models into a NumPy array in a single pass, in the order of the models.
+
+        The dtype follows the field type: float64 for DOUBLE, int64 for LONG, INTEGER, SHORT, ENUM, SIDE_LINK and DATE
+        (epoch milliseconds), bool for BOOLEAN and object for everything else. None becomes NaN in float columns;
+        integer and boolean columns with missing values are returned as a numpy.ma.MaskedArray. Pass masked=True to get
+        a masked array for float columns as well.
+
+        :param models: The record models to read, wrapped or not.
+        :param field: The wrapper field to read, e.g. QCDatumModel.CONCENTRATION__FIELD_NAME, or its field name.
+        :param masked: Whether missing values of float columns should be masked rather than NaN.
+        """
+        from data_type_models._columns import field_values, to_column
+        wrapper_field = cls.get_wrapper_field(field)
+        return to_column(field_values(models, wrapper_field.field_name), wrapper_field.field_type, masked)
+
+    @classmethod
+    def assign_column(cls, models: Sequence[AbstractRecordModel | PyRecordModel], field: WrapperField | str,
+                      values: Any) -> int:
+        """
+        Write a column of values back into one field of many record models, the reverse of column().
+
+        The values can be a NumPy array, a masked array, a pandas Series or any sequence with one value per model.
+        Their dtype is validated against the field type once: DOUBLE accepts numbers, integer field types accept
+        integers (or integral floats), BOOLEAN accepts booleans. Missing values (None, masked, NaN, pandas NA) clear
+        the field. Only models whose value actually changes are set, so records whose value is unchanged are not
+        marked as modified and stay out of the next store_and_commit.
+
+        :param models: The record models to update, wrapped or not.
+        :param field: The wrapper field to set, e.g. PlateWellModel.CONCENTRATION__FIELD_NAME, or its field name.
+        :param values: The new values, in the order of the models.
+        :return: The number of record models whose value changed.
+        """
+        from data_type_models._columns import assign_values, from_column
+        wrapper_field = cls.get_wrapper_field(field)
+        if not isinstance(models, Sequence):
+            models = list(models)
+        return assign_values(models, wrapper_field.field_name, from_column(values, wrapper_field.field_type))
+
+    @classmethod
+    def compact(cls, source: Iterable[DataRecord | AbstractRecordModel | PyRecordModel],
+                fields: Optional[Sequence[WrapperField | str]] = None) -> CompactRecordStore:
+        """
+        Copy the field values of many records of this data type into a CompactRecordStore, which keeps one array per
+        field instead of a record model per record. Use it to hold large, read-only working sets; for example, pass
+        the data records of a query directly, without ever creating record models for them.
+
+        :param source: Data records or record models (wrapped or not) of this wrapper's data type.
+        :param fields: The fields to keep, as wrapper fields or field names. Defaults to every field of the wrapper.
+        """
+        from data_type_models._compact import CompactRecordStore
+        if fields is not None:
+            fields = [cls.get_wrapper_field(x) for x in fields]
+        store = CompactRecordStore(cls, fields)
+        store.extend(source)
+        return store
+
+    @classmethod
+    def data_frame(cls, source: Iterable[DataRecord | AbstractRecordModel | PyRecordModel],
+                   fields: Optional[Sequence[WrapperField | AbstractVeloxFieldDefinition | str]] = None
+                   ) -> pd.DataFrame:
+        """
+        Read the field values of many records of this data type into a pandas data frame, with a RecordId column
+        followed by a column per field, one row per record in order. Unlike DataRecordManager.get_data_frame(), which
+        leaves pandas to guess a dtype from each column's values, the dtype comes from the field type: float64 for
+        DOUBLE, datetime64[ms] for DATE (UTC), Int64 for the other integer field types, boolean for BOOLEAN and
+        category for PICKLIST and SELECTION. Text columns are left for pandas to infer, which gives its string dtype.
+
+        Field definitions carry their own field type, so records of a data type without a generated wrapper can be
+        read by calling this on GeneratedRecordModel itself, with the field definitions of the data type.
+
+        :param source: Data records or record models (wrapped or not) of this wrapper's data type.
+        :param fields: The fields to read, as wrapper fields, field definitions or field names. Defaults to every
+            field of the wrapper.
+        """
+        from data_type_models._frames import records_data_frame
+        wrapper_fields = [WrapperField(x.data_field_name, x.data_field_type)
+                          if isinstance(x, AbstractVeloxFieldDefinition) else cls.get_wrapper_field(x)
+                          for x in (cls.get_wrapper_fields() if fields is None else fields)]
+        return records_data_frame(source, wrapper_fields)
+
+
+class ModelField(WrapperField, property, Generic[FieldValueType]):
+    """
+    A wrapper field that is also a data descriptor of the wrapper class it is declared on.
+
+    Reading or assigning the attribute on a wrapped record model reads or sets the field value of its backing record
+    model, e.g. sample.SampleId or sample.SampleId = "S-0001". Accessed on the class, e.g. SampleModel.SampleId, the
+    attribute is the wrapper field itself, so it can be used anywhere a WrapperField is expected.
+
+    The get_X_field and set_X_field methods of the older generated wrappers are added to the class as aliases of the
+    descriptor's accessors.
+    """
+
+    def __init__(self, field_name: str, field_type: FieldType, display_name: Optional[str] = None):
+        WrapperField.__init__(self, field_name, field_type, display_name)
+
+        # Plain functions handed to property, so that attribute access does not go through a python-level __get__.
+        # Both go straight to the field map of the backing record model, skipping its fields property. Only text
+        # values are read through the map's __getitem__, which resolves server macros in the text of new records;
+        # every other value comes from the map's dictionary as it is.
+        if field_name.lower() == RECORD_ID_FIELD.field_name.lower():
+            # The record ID is not in the map's dictionary.
+            def getter(model: WrappedRecordModel) -> Any:
+                return model._backing_model._model_fields[field_name]
+        else:
+            def getter(model: WrappedRecordModel) -> Any:
+                field_map = model._backing_model._model_fields
+                value = field_map._model_fields.get(field_name)
+                if isinstance(value, str):
+                    return field_map[field_name]
+                return value
+
+        def setter(model: WrappedRecordModel, value: Any) -> None:
+            model._backing_model._model_fields[field_name] = value
+
+        getter.__name__ = f"get_{field_name}_field"
+        getter.__doc__ = f"Get data field value with field name '{field_name}' from this record model"
+        setter.__name__ = f"set_{field_name}_field"
+        setter.__doc__ = f"Set data field with field name '{field_name}' on this record model"
+        property.__init__(self, getter, setter)
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        for accessor in (self.fget, self.fset):
+            if accessor.__name__ not in owner.__dict__:
+                accessor.__qualname__ = f"{owner.__qualname__}.{accessor.__name__}"
+                setattr(owner, accessor.__name__, accessor)
@@ -0,0 +1,206 @@
+"""
+Columnar access to one field of many record models at once, backed by NumPy arrays.
+"""
+from __future__ import annotations
+
+from operator import itemgetter
+from typing import Any, Callable, Iterable, List, Sequence, Tuple
+
+import numpy as np
+from sapiopylib.rest.pojo.DataRecord import DataRecord
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.PyRecordModel import AbstractRecordModel, PyRecordModel
+
+FLOAT_FIELD_TYPES = frozenset({FieldType.DOUBLE})
+INTEGER_FIELD_TYPES = frozenset({FieldType.LONG, FieldType.INTEGER, FieldType.SHORT, FieldType.ENUM, FieldType.DATE,
+                                 FieldType.SIDE_LINK})
+BOOLEAN_FIELD_TYPES = frozenset({FieldType.BOOLEAN})
+
+
+def column_dtype(field_type: FieldType) -> np.dtype:
+    """
+    The NumPy dtype used for a column of the provided field type. Dates are epoch milliseconds, like the field values.
+    """
+    if field_type in FLOAT_FIELD_TYPES:
+        return np.dtype(np.float64)
+    if field_type in INTEGER_FIELD_TYPES:
+        return np.dtype(np.int64)
+    if field_type in BOOLEAN_FIELD_TYPES:
+        return np.dtype(np.bool_)
+    return np.dtype(object)
+
+
+def field_values(models: Iterable[AbstractRecordModel | PyRecordModel], field_name: str) -> List[Any]:
+    """
+    The current (possibly uncommitted) values of a field, in the order of the provided models.
+    """
+    if field_name.lower() == "recordid":
+        return [model.record_id for model in models]
+    values: List[Any] = []
+    append = values.append
+    for model in models:
+        field_map = model.fields
+        # Read the field map's dictionary directly; only string values can be server macros (e.g. default values
+        # of new records) that need the translation done by the field map's own lookup.
+        value = field_map._model_fields.get(field_name)
+        if value.__class__ is str:
+            value = field_map[field_name]
+        append(value)
+    return values
+
+
+def values_reader(items: List[DataRecord | AbstractRecordModel | PyRecordModel]) -> Callable[[str], List[Any]]:
+    """
+    A function that reads the values of a field of every item, in order, for a list of data records or of record
+    models. Data records are read from their field maps, record models through field_values().
+    """
+    if items and isinstance(items[0], DataRecord):
+        field_maps = [record.fields for record in items]
+        return lambda field_name: [x.get(field_name) for x in field_maps]
+    return lambda field_name: field_values(items, field_name)
+
+
+def field_value_lists(items: List[DataRecord | AbstractRecordModel | PyRecordModel],
+                      field_names: Sequence[str]) -> List[Sequence[Any]]:
+    """
+    The values of each of the provided fields of every item, in order, like values_reader() for each field. The field
+    maps of data records that have every field are read with a single lookup per record rather than one per field.
+    """
+    if items and field_names and isinstance(items[0], DataRecord):
+        get = itemgetter(*field_names)
+        try:
+            rows = [get(record.fields) for record in items]
+        except KeyError:
+            pass
+        else:
+            return list(zip(*rows)) if len(field_names) > 1 else [rows]
+    values_of = values_reader(items)
+    return [values_of(field_name) for field_name in field_names]
+
+
+def to_column(values: List[Any], field_type: FieldType, masked: bool = False) -> np.ndarray:
+    """
+    Convert field values into an array of the field type's dtype.
+
+    Missing (None) values become NaN in float columns. Integer and boolean columns can't hold NaN, so when any value
+    is missing they are returned as a numpy.ma.MaskedArray with the missing values masked. With masked=True, float
+    columns are returned as masked arrays as well.
+    """
+    column, mask = split_missing(values, field_type)
+    if column.dtype == object:
+        return column
+    if column.dtype == np.float64 and not masked:
+        column[mask] = np.nan
+        return column
+    if not mask.any() and column.dtype != np.float64:
+        return column
+    return np.ma.MaskedArray(column, mask=mask)
+
+
+def split_missing(values: Sequence[Any], field_type: FieldType) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convert field values into an array of the field type's dtype, along with a mask of the missing (None) values.
+
+    Object columns keep None at the missing positions. Other columns hold a zero placeholder there instead.
+    """
+    dtype = column_dtype(field_type)
+    # Checking the list for None first runs at C speed, and spares building the mask of fully populated columns.
+    if None not in values:
+        mask = np.zeros(len(values), dtype=bool)
+    else:
+        mask = np.fromiter((x is None for x in values), dtype=bool, count=len(values))
+    if dtype == object:
+        column = np.empty(len(values), dtype=object)
+        column[:] = values
+        return column, mask
+    if mask.any():
+        values = [dtype.type(0) if x is None else x for x in values]
+    return np.array(values, dtype=dtype), mask
+
+
+def from_column(values: Any, field_type: FieldType) -> List[Any]:
+    """
+    Convert an array, masked array, pandas Series or sequence into field values of the provided field type.
+
+    The dtype is validated once for the whole column. Missing values (None, masked entries, NaN, pandas NA) become
+    None and NumPy scalars become the equivalent python values.
+    """
+    data, mask = _to_numpy(values)
+    if data.ndim != 1:
+        raise ValueError(f"Expected a one dimensional column, got shape {data.shape}.")
+    if mask.all():
+        return [None] * len(mask)
+    data = _validate(data, field_type)
+    if data.dtype.kind == "f":
+        mask = mask | np.isnan(data)
+        if field_type in INTEGER_FIELD_TYPES:
+            data = np.where(mask, 0, data).astype(np.int64)
+    if not mask.any():
+        return data.tolist()
+    return [None if missing else value for value, missing in zip(data.tolist(), mask.tolist())]
+
+
+def _to_numpy(values: Any) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Split a column into a typed array and a mask of its missing values.
+    """
+    if isinstance(values, np.ma.MaskedArray):
+        return values.data, np.ma.getmaskarray(values)
+    if hasattr(values, "isna") and hasattr(values, "to_numpy"):
+        # pandas Series or Index. Nullable extension dtypes only convert to plain NumPy dtypes without NA values.
+        mask = np.asarray(values.isna(), dtype=bool)
+        if not mask.any():
+            return values.to_numpy(), mask
+        return _fill_missing(values[~mask].to_numpy(), mask), mask
+    data = np.asarray(values)
+    if data.dtype != object:
+        return data, np.zeros(len(data), dtype=bool)
+    mask = np.array([x is None for x in data.tolist()], dtype=bool)
+    if not mask.any():
+        return np.array(data.tolist()), mask
+    return _fill_missing(np.array(data[~mask].tolist()), mask), mask
+
+
+def _fill_missing(present: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    # The missing positions get a placeholder of the present values' dtype; they are masked out anyway.
+    dtype = present.dtype
+    data = np.zeros(len(mask), dtype=dtype) if dtype.kind in "fiub" else np.empty(len(mask), dtype=object)
+    data[~mask] = present
+    return data
+
+
+def _validate(data: np.ndarray, field_type: FieldType) -> np.ndarray:
+    kind = data.dtype.kind
+    if field_type in FLOAT_FIELD_TYPES:
+        if kind not in "fiu":
+            raise TypeError(f"Cannot assign values of dtype {data.dtype} to a {field_type.name} field.")
+        return data.astype(np.float64, copy=False)
+    if field_type in INTEGER_FIELD_TYPES:
+        if kind == "f":
+            finite = data[~np.isnan(data)]
+            if not np.array_equal(finite, np.trunc(finite)):
+                raise TypeError(f"Cannot assign non-integral values to a {field_type.name} field.")
+            return data
+        if kind not in "iu":
+            raise TypeError(f"Cannot assign values of dtype {data.dtype} to a {field_type.name} field.")
+        return data.astype(np.int64, copy=False)
+    if field_type in BOOLEAN_FIELD_TYPES:
+        if kind != "b":
+            raise TypeError(f"Cannot assign values of dtype {data.dtype} to a {field_type.name} field.")
+        return data
+    return data
+
+
+def assign_values(models: Sequence[AbstractRecordModel | PyRecordModel], field_name: str, values: List[Any]) -> int:
+    """
+    Set a field on each model to the value at the same position. Only models whose value actually differs are set,
+    so only those are marked as changed. Returns the number of changed models.
+    """
+    if len(models) != len(values):
+        raise ValueError(f"Got {len(values)} values for {len(models)} record models.")
+    # Compare against the raw field map values, the same way the field map itself decides whether a set is a change.
+    current = [model.fields._model_fields.get(field_name) for model in models]
+    changed = [i for i, (old, new) in enumerate(zip(current, values)) if old != new]
+    for i in changed:
+        models[i].fields[field_name] = values[i]
+    return len(changed)
@@ -0,0 +1,199 @@
+"""
+Compact, column-wise storage of the field values of many records of one data type.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, Generic, Iterable, Iterator, List, Optional, Sequence, Tuple, Type
+
+import numpy as np
+from sapiopylib.rest.pojo.DataRecord import DataRecord
+from sapiopylib.rest.utils.recordmodel.PyRecordModel import AbstractRecordModel, PyRecordModel
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrappedType, WrapperField
+
+from data_type_models._columns import split_missing, values_reader
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Number of records converted into arrays at once while filling a store, which bounds the temporary python lists.
+CHUNK_SIZE = 4096
+
+_Chunk = Tuple[np.ndarray, List[np.ndarray], List[Optional[np.ndarray]]]
+
+
+class CompactRecordStore(Generic[WrappedType]):
+    """
+    A read-only copy of the field values of many records of one data type, stored as one array per field.
+
+    A record model keeps a number of dictionaries and sets for every record, which adds up when hundreds of thousands
+    of records are held at once. This store keeps a single array per field instead, at the position of the field in
+    the wrapper's field list: numeric, date and boolean fields in typed NumPy arrays (with a mask of the missing
+    values, if any), every other field in an object array. Records are read back through CompactRecord views.
+
+    The store is a snapshot. Changes to the records still have to be made through record models.
+    """
+    __slots__ = ("wrapper_type", "fields", "_positions", "_record_ids", "_columns", "_masks", "_chunks")
+
+    wrapper_type: Type[WrappedType]
+    fields: Tuple[WrapperField, ...]
+
+    def __init__(self, wrapper_type: Type[WrappedType], fields: Optional[Sequence[WrapperField]] = None):
+        """
+        :param wrapper_type: The wrapper class of the data type of the records.
+        :param fields: The fields to keep. Defaults to every field of the wrapper.
+        """
+        self.wrapper_type = wrapper_type
+        self.fields = tuple(fields) if fields is not None else wrapper_type.get_wrapper_fields()
+        self._positions: Dict[str, int] = {x.field_name: i for i, x in enumerate(self.fields)}
+        self._record_ids: np.ndarray = np.empty(0, dtype=np.int64)
+        self._columns: List[np.ndarray] = [split_missing([], x.field_type)[0] for x in self.fields]
+        self._masks: List[Optional[np.ndarray]] = [None] * len(self.fields)
+        self._chunks: List[_Chunk] = []
+
+    def extend(self, source: Iterable[DataRecord | AbstractRecordModel | PyRecordModel]) -> None:
+        """
+        Add the field values of data records or record models (wrapped or not) to the end of this store.
+        """
+        chunk: List[Any] = []
+        for item in source:
+            chunk.append(item)
+            if len(chunk) == CHUNK_SIZE:
+                self._add_chunk(chunk)
+                chunk = []
+        if chunk:
+            self._add_chunk(chunk)
+
+    def _add_chunk(self, chunk: List[DataRecord | AbstractRecordModel | PyRecordModel]) -> None:
+        values_of = values_reader(chunk)
+        record_ids = np.fromiter((x.record_id for x in chunk), dtype=np.int64, count=len(chunk))
+        columns: List[np.ndarray] = []
+        masks: List[Optional[np.ndarray]] = []
+        for wrapper_field in self.fields:
+            column, mask = split_missing(values_of(wrapper_field.field_name), wrapper_field.field_type)
+            columns.append(column)
+            # Object columns keep None in place, and fully populated columns don't need a mask at all.
+            masks.append(mask if column.dtype != object and mask.any() else None)
+        self._chunks.append((record_ids, columns, masks))
+
+    def _consolidate(self) -> None:
+        """
+        Merge the chunks added since the last read into the field arrays.
+        """
+        if not self._chunks:
+            return
+        chunks, self._chunks = self._chunks, []
+        sizes = [len(self._record_ids)] + [len(x[0]) for x in chunks]
+        self._record_ids = np.concatenate([self._record_ids] + [x[0] for x in chunks])
+        for position in range(len(self.fields)):
+            self._columns[position] = np.concatenate([self._columns[position]] + [x[1][position] for x in chunks])
+            masks = [self._masks[position]] + [x[2][position] for x in chunks]
+            if all(x is None for x in masks):
+                continue
+            self._masks[position] = np.concatenate(
+                [np.zeros(size, dtype=bool) if mask is None else mask for mask, size in zip(masks, sizes)])
+
+    @property
+    def record_ids(self) -> np.ndarray:
+        """
+        The record IDs of the records in this store, in order.
+        """
+        self._consolidate()
+        return self._record_ids
+
+    def get_value(self, index: int, field_name: str) -> Any:
+        """
+        The value of a field of the record at the provided position, as the record model would have returned it.
+        """
+        position = self._positions.get(field_name)
+        if position is None:
+            if field_name.lower() == "recordid":
+                return int(self.record_ids[index])
+            raise KeyError(field_name)
+        self._consolidate()
+        mask = self._masks[position]
+        if mask is not None and mask[index]:
+            return None
+        value = self._columns[position][index]
+        return value.item() if isinstance(value, np.generic) else value
+
+    def column(self, field: WrapperField | str, masked: bool = False) -> np.ndarray:
+        """
+        Copy one field of every record into an array, with the same dtypes and handling of missing values as
+        GeneratedRecordModel.column().
+        """
+        field_name = field.field_name if isinstance(field, WrapperField) else field
+        if field_name.lower() == "recordid":
+            return self.record_ids.copy()
+        position = self._positions[field_name]
+        self._consolidate()
+        column = self._columns[position].copy()
+        mask = self._masks[position]
+        if column.dtype == object:
+            return column
+        if mask is None:
+            return np.ma.MaskedArray(column, mask=False) if masked and column.dtype == np.float64 else column
+        if column.dtype == np.float64 and not masked:
+            column[mask] = np.nan
+            return column
+        return np.ma.MaskedArray(column, mask=mask.copy())
+
+    def to_data_frame(self) -> pd.DataFrame:
+        """
+        Copy every record of this store into a data frame, with the same columns and dtypes as
+        GeneratedRecordModel.data_frame().
+        """
+        from data_type_models._frames import columns_data_frame
+        self._consolidate()
+        return columns_data_frame(self._record_ids.copy(), self.fields, [x.copy() for x in self._columns],
+                                  [None if x is None else x.copy() for x in self._masks])
+
+    def __len__(self) -> int:
+        return len(self._record_ids) + sum(len(x[0]) for x in self._chunks)
+
+    def __getitem__(self, index: int) -> CompactRecord:
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("CompactRecordStore index out of range")
+        return CompactRecord(self, index)
+
+    def __iter__(self) -> Iterator[CompactRecord]:
+        return (CompactRecord(self, i) for i in range(len(self)))
+
+    def __repr__(self) -> str:
+        return f"CompactRecordStore({self.wrapper_type.__name__}, {len(self)} records)"
+
+
+class CompactRecord:
+    """
+    A view of one record of a CompactRecordStore. Field values are read like on the wrapper, e.g. record.SampleId,
+    or with get_field_value().
+    """
+    __slots__ = ("_store", "_index")
+
+    def __init__(self, store: CompactRecordStore, index: int):
+        self._store = store
+        self._index = index
+
+    @property
+    def record_id(self) -> int:
+        return self._store.get_value(self._index, "RecordId")
+
+    @property
+    def data_type_name(self) -> str:
+        return self._store.wrapper_type.get_wrapper_data_type_name()
+
+    def get_field_value(self, field_name: str) -> Any:
+        return self._store.get_value(self._index, field_name)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self._store.get_value(self._index, name)
+        except KeyError:
+            raise AttributeError(f"{type(self).__name__} has no field named {name!r}") from None
+
+    def __repr__(self) -> str:
+        return f"CompactRecord({self.data_type_name}, {self.record_id})"
@@ -0,0 +1,92 @@
+"""
+pandas data frames of the field values of many records, with the dtype of each column chosen from its field type.
+"""
+from __future__ import annotations
+
+from typing import Any, Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from sapiopylib.rest.pojo.DataRecord import DataRecord
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.PyRecordModel import AbstractRecordModel, PyRecordModel
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+
+from data_type_models._columns import (BOOLEAN_FIELD_TYPES, FLOAT_FIELD_TYPES, INTEGER_FIELD_TYPES, field_value_lists,
+                                       split_missing)
+from data_type_models._compact import CHUNK_SIZE
+
+# Fields whose values come from a short list, which are stored once per distinct value in a categorical column.
+CATEGORY_FIELD_TYPES = frozenset({FieldType.PICKLIST, FieldType.SELECTION})
+
+
+def to_series_values(column: np.ndarray, mask: np.ndarray, field_type: FieldType) -> Any:
+    """
+    Convert a column and the mask of its missing values, as split_missing() returns them, into the values of a data
+    frame column: float64 for DOUBLE, datetime64[ms] for DATE, Int64 for the other integer field types, boolean for
+    BOOLEAN and category for PICKLIST and SELECTION. Missing values become NaN, NaT or pandas NA, depending on the
+    dtype. Other field types keep their object column, for pandas to infer a dtype from, which makes text columns its
+    string dtype, backed by Arrow when pyarrow is installed.
+
+    The column and the mask are not modified, but the result may share their memory.
+    """
+    if field_type in FLOAT_FIELD_TYPES:
+        return np.where(mask, np.nan, column) if mask.any() else column
+    if field_type == FieldType.DATE:
+        # Dates are epoch milliseconds, in UTC.
+        dates = column.astype("datetime64[ms]")
+        dates[mask] = np.datetime64("NaT")
+        return dates
+    if field_type in INTEGER_FIELD_TYPES:
+        return pd.arrays.IntegerArray(column, mask)
+    if field_type in BOOLEAN_FIELD_TYPES:
+        return pd.arrays.BooleanArray(column, mask)
+    if field_type in CATEGORY_FIELD_TYPES:
+        return pd.Categorical(column)
+    return column
+
+
+def columns_data_frame(record_ids: np.ndarray, fields: Sequence[WrapperField], columns: Sequence[np.ndarray],
+                       masks: Sequence[Optional[np.ndarray]]) -> pd.DataFrame:
+    """
+    A data frame with a RecordId column followed by a column per field, from the arrays of the field values and the
+    masks of their missing values. A mask of None means that no value of the field is missing.
+    """
+    data = {"RecordId": record_ids}
+    for wrapper_field, column, mask in zip(fields, columns, masks):
+        if mask is None:
+            mask = np.zeros(len(column), dtype=bool)
+        data[wrapper_field.field_name] = to_series_values(column, mask, wrapper_field.field_type)
+    return pd.DataFrame(data, copy=False)
+
+
+def records_data_frame(source: Iterable[DataRecord | AbstractRecordModel | PyRecordModel],
+                       fields: Sequence[WrapperField]) -> pd.DataFrame:
+    """
+    Read the provided fields of data records or record models (wrapped or not) into a data frame, one row per record
+    in order. The records are read a chunk at a time, and each field of a chunk is converted into an array of its
+    type at once, so no row is ever held as a dictionary.
+    """
+    fields = [x for x in fields if x.field_name.lower() != "recordid"]
+    record_ids: List[np.ndarray] = []
+    columns: List[List[np.ndarray]] = [[] for _ in fields]
+    masks: List[List[np.ndarray]] = [[] for _ in fields]
+
+    def add_chunk(chunk: List[Any]) -> None:
+        record_ids.append(np.fromiter((x.record_id for x in chunk), dtype=np.int64, count=len(chunk)))
+        value_lists = field_value_lists(chunk, [x.field_name for x in fields])
+        for position, (wrapper_field, values) in enumerate(zip(fields, value_lists)):
+            column, mask = split_missing(values, wrapper_field.field_type)
+            columns[position].append(column)
+            masks[position].append(mask)
+
+    chunk: List[Any] = []
+    for item in source:
+        chunk.append(item)
+        if len(chunk) == CHUNK_SIZE:
+            add_chunk(chunk)
+            chunk = []
+    if chunk or not record_ids:
+        add_chunk(chunk)
+    return columns_data_frame(np.concatenate(record_ids), fields, [np.concatenate(x) for x in columns],
+                              [np.concatenate(x) for x in masks])
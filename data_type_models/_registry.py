@@ -0,0 +1,84 @@
+"""
+Lookup of the generated record model wrappers by data type name.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, Mapping, Type
+
+from sapiopylib.rest.pojo.DataRecord import DataRecord
+from sapiopylib.rest.utils.recordmodel.PyRecordModel import AbstractRecordModel, PyRecordModel
+
+from data_type_models._base import GeneratedRecordModel
+
+if TYPE_CHECKING:
+    # Importing the record model manager pulls in most of sapiopylib, which would slow down importing the package.
+    from sapiopylib.rest.utils.recordmodel.RecordModelManager import RecordModelInstanceManager
+
+
+class ModelRegistry(Mapping[str, Type[GeneratedRecordModel]]):
+    """
+    A read-only mapping from data type name to the wrapper class generated for it, e.g. "QCDatum" -> QCDatumModel.
+
+    The index of data type names is generated along with the wrappers, so a lookup never has to look at other wrapper
+    classes, and only the module of the wrapper that is looked up gets imported. Data type names are matched exactly
+    first, then ignoring case.
+    """
+
+    def __init__(self, class_names_by_data_type: Dict[str, str], load_model: Callable[[str], type]):
+        """
+        :param class_names_by_data_type: The wrapper class name of every data type, by data type name.
+        :param load_model: Imports and returns a wrapper class, given its class name.
+        """
+        self._class_names = class_names_by_data_type
+        self._class_names_lower = {name.lower(): class_name for name, class_name in class_names_by_data_type.items()}
+        self._load_model = load_model
+        self._models: Dict[str, Type[GeneratedRecordModel]] = {}
+
+    def __getitem__(self, data_type_name: str) -> Type[GeneratedRecordModel]:
+        model = self._models.get(data_type_name)
+        if model is not None:
+            return model
+        class_name = self._class_names.get(data_type_name) or self._class_names_lower.get(data_type_name.lower())
+        if class_name is None:
+            raise KeyError(data_type_name)
+        model = self._load_model(class_name)
+        self._models[data_type_name] = model
+        return model
+
+    def __contains__(self, data_type_name: object) -> bool:
+        return isinstance(data_type_name, str) and (data_type_name in self._class_names or
+                                                    data_type_name.lower() in self._class_names_lower)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._class_names)
+
+    def __len__(self) -> int:
+        return len(self._class_names)
+
+    def get_model_type(self, data_type_name: str) -> Type[GeneratedRecordModel]:
+        """
+        The wrapper class of a data type. Raises a ValueError if no wrapper was generated for the data type.
+        """
+        try:
+            return self[data_type_name]
+        except KeyError:
+            raise ValueError(f"No record model wrapper was generated for data type {data_type_name!r}.") from None
+
+    def wrap_records(self, records: Iterable[DataRecord], inst_man: RecordModelInstanceManager) \
+            -> List[GeneratedRecordModel]:
+        """
+        Import data records of any data types as record models, each wrapped with the wrapper class of its own data
+        type, in the order of the records. Records that were already imported reuse their existing record model.
+        """
+        return self.wrap_models([inst_man.add_existing_record(record) for record in records])
+
+    def wrap_models(self, models: Iterable[AbstractRecordModel | PyRecordModel]) -> List[GeneratedRecordModel]:
+        """
+        Wrap record models of any data types with the wrapper class of their own data type, in order.
+        """
+        get_model_type = self.get_model_type
+        wrapped: List[GeneratedRecordModel] = []
+        for model in models:
+            root = model if isinstance(model, PyRecordModel) else model.backing_model
+            wrapped.append(root.wrap(get_model_type(root.data_type_name)))
+        return wrapped
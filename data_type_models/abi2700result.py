@@ -0,0 +1,24 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class ABI2700ResultModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type ABI2700Result
+    Data Type Display Name: ABI2700 Result (ABI2700 Results)
+    Fields: Ct, CtSD, Detector
+    """
+    DATA_TYPE_NAME: str = 'ABI2700Result'
+    CT__FIELD_NAME: WrapperField = WrapperField("Ct", FieldType.DOUBLE)
+    CTSD__FIELD_NAME: WrapperField = WrapperField("CtSD", FieldType.DOUBLE)
+    DETECTOR__FIELD_NAME: WrapperField = WrapperField("Detector", FieldType.STRING)
+
+    Ct: ModelField[Optional[float]] = ModelField("Ct", FieldType.DOUBLE)
+    CtSD: ModelField[Optional[float]] = ModelField("CtSD", FieldType.DOUBLE)
+    Detector: ModelField[Optional[str]] = ModelField("Detector", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
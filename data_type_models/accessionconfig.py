@@ -0,0 +1,37 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class AccessionConfigModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type AccessionConfig
+    Data Type Display Name: Accession Configuration (Accession Configurations)
+    Fields: AccessionOnCreate, CustomPluginClassPath, DataFieldName, DataTypeField, IsGlobal, NumberOfDigits, PrefixField, StartNumber, SuffixField
+    Accession configuration can be used to modify default accessioning behaviors for out-of-box plugins from Sapio Sciences. Convenient methods can be found in AccessioningWithConfigManager class to accession according to the configuration. All Sapio plugins who accession samples should use this util for accessioning.
+    """
+    DATA_TYPE_NAME: str = 'AccessionConfig'
+    ACCESSIONONCREATE__FIELD_NAME: WrapperField = WrapperField("AccessionOnCreate", FieldType.BOOLEAN)
+    CUSTOMPLUGINCLASSPATH__FIELD_NAME: WrapperField = WrapperField("CustomPluginClassPath", FieldType.STRING)
+    DATAFIELDNAME__FIELD_NAME: WrapperField = WrapperField("DataFieldName", FieldType.SELECTION)
+    DATATYPEFIELD__FIELD_NAME: WrapperField = WrapperField("DataTypeField", FieldType.SELECTION)
+    ISGLOBAL__FIELD_NAME: WrapperField = WrapperField("IsGlobal", FieldType.BOOLEAN)
+    NUMBEROFDIGITS__FIELD_NAME: WrapperField = WrapperField("NumberOfDigits", FieldType.INTEGER)
+    PREFIXFIELD__FIELD_NAME: WrapperField = WrapperField("PrefixField", FieldType.STRING)
+    STARTNUMBER__FIELD_NAME: WrapperField = WrapperField("StartNumber", FieldType.INTEGER)
+    SUFFIXFIELD__FIELD_NAME: WrapperField = WrapperField("SuffixField", FieldType.STRING)
+
+    AccessionOnCreate: ModelField[Optional[bool]] = ModelField("AccessionOnCreate", FieldType.BOOLEAN)
+    CustomPluginClassPath: ModelField[Optional[str]] = ModelField("CustomPluginClassPath", FieldType.STRING)
+    DataFieldName: ModelField[Optional[str]] = ModelField("DataFieldName", FieldType.SELECTION)
+    DataTypeField: ModelField[Optional[str]] = ModelField("DataTypeField", FieldType.SELECTION)
+    IsGlobal: ModelField[Optional[bool]] = ModelField("IsGlobal", FieldType.BOOLEAN)
+    NumberOfDigits: ModelField[Optional[int]] = ModelField("NumberOfDigits", FieldType.INTEGER)
+    PrefixField: ModelField[Optional[str]] = ModelField("PrefixField", FieldType.STRING)
+    StartNumber: ModelField[Optional[int]] = ModelField("StartNumber", FieldType.INTEGER)
+    SuffixField: ModelField[Optional[str]] = ModelField("SuffixField", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,23 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class AgentModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type Agent
+    Data Type Display Name: Agent (Agents)
+    Fields: AgentName, AgentType, MultiParentLink441
+    """
+    DATA_TYPE_NAME: str = 'Agent'
+    AGENTNAME__FIELD_NAME: WrapperField = WrapperField("AgentName", FieldType.SELECTION)
+    AGENTTYPE__FIELD_NAME: WrapperField = WrapperField("AgentType", FieldType.SELECTION)
+    MULTIPARENTLINK441__FIELD_NAME: WrapperField = WrapperField("MultiParentLink441", FieldType.MULTIPARENTLINK)
+
+    AgentName: ModelField[Optional[str]] = ModelField("AgentName", FieldType.SELECTION)
+    AgentType: ModelField[Optional[str]] = ModelField("AgentType", FieldType.SELECTION)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
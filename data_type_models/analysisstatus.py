@@ -0,0 +1,24 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class AnalysisStatusModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type AnalysisStatus
+    Data Type Display Name: Analysis Status (Analysis Statuses)
+    Fields: Invocation, Script, Status
+    """
+    DATA_TYPE_NAME: str = 'AnalysisStatus'
+    INVOCATION__FIELD_NAME: WrapperField = WrapperField("Invocation", FieldType.PICKLIST)
+    SCRIPT__FIELD_NAME: WrapperField = WrapperField("Script", FieldType.STRING)
+    STATUS__FIELD_NAME: WrapperField = WrapperField("Status", FieldType.PICKLIST)
+
+    Invocation: ModelField[Optional[str]] = ModelField("Invocation", FieldType.PICKLIST)
+    Script: ModelField[Optional[str]] = ModelField("Script", FieldType.STRING)
+    Status: ModelField[Optional[str]] = ModelField("Status", FieldType.PICKLIST)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
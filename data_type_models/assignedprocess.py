@@ -0,0 +1,54 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class AssignedProcessModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type AssignedProcess
+    Data Type Display Name: Assigned Process (Assigned Processes)
+    Fields: AwaitingRequestApproval, BranchLongId, CompletedDate, DoNotProceed, HasBeenReprocessed, OtherSampleId, ProcessName, ProcessStepNumber, ProcessTAT, Reprocessing, RequestRecordId, SampleId, SampleRecordId, ScheduledDate, SourceAssignedProcessIds, Status, TurnAroundHours, TurnAroundMinutes
+    """
+    DATA_TYPE_NAME: str = 'AssignedProcess'
+    AWAITINGREQUESTAPPROVAL__FIELD_NAME: WrapperField = WrapperField("AwaitingRequestApproval", FieldType.BOOLEAN)
+    BRANCHLONGID__FIELD_NAME: WrapperField = WrapperField("BranchLongId", FieldType.LONG)
+    COMPLETEDDATE__FIELD_NAME: WrapperField = WrapperField("CompletedDate", FieldType.DATE)
+    DONOTPROCEED__FIELD_NAME: WrapperField = WrapperField("DoNotProceed", FieldType.BOOLEAN)
+    HASBEENREPROCESSED__FIELD_NAME: WrapperField = WrapperField("HasBeenReprocessed", FieldType.BOOLEAN)
+    OTHERSAMPLEID__FIELD_NAME: WrapperField = WrapperField("OtherSampleId", FieldType.STRING)
+    PROCESSNAME__FIELD_NAME: WrapperField = WrapperField("ProcessName", FieldType.SELECTION)
+    PROCESSSTEPNUMBER__FIELD_NAME: WrapperField = WrapperField("ProcessStepNumber", FieldType.LONG)
+    PROCESSTAT__FIELD_NAME: WrapperField = WrapperField("ProcessTAT", FieldType.DOUBLE)
+    REPROCESSING__FIELD_NAME: WrapperField = WrapperField("Reprocessing", FieldType.BOOLEAN)
+    REQUESTRECORDID__FIELD_NAME: WrapperField = WrapperField("RequestRecordId", FieldType.LONG)
+    SAMPLEID__FIELD_NAME: WrapperField = WrapperField("SampleId", FieldType.STRING)
+    SAMPLERECORDID__FIELD_NAME: WrapperField = WrapperField("SampleRecordId", FieldType.LONG)
+    SCHEDULEDDATE__FIELD_NAME: WrapperField = WrapperField("ScheduledDate", FieldType.DATE)
+    SOURCEASSIGNEDPROCESSIDS__FIELD_NAME: WrapperField = WrapperField("SourceAssignedProcessIds", FieldType.STRING)
+    STATUS__FIELD_NAME: WrapperField = WrapperField("Status", FieldType.SELECTION)
+    TURNAROUNDHOURS__FIELD_NAME: WrapperField = WrapperField("TurnAroundHours", FieldType.LONG)
+    TURNAROUNDMINUTES__FIELD_NAME: WrapperField = WrapperField("TurnAroundMinutes", FieldType.LONG)
+
+    AwaitingRequestApproval: ModelField[Optional[bool]] = ModelField("AwaitingRequestApproval", FieldType.BOOLEAN)
+    BranchLongId: ModelField[Optional[int]] = ModelField("BranchLongId", FieldType.LONG)
+    CompletedDate: ModelField[Optional[int]] = ModelField("CompletedDate", FieldType.DATE)
+    DoNotProceed: ModelField[Optional[bool]] = ModelField("DoNotProceed", FieldType.BOOLEAN)
+    HasBeenReprocessed: ModelField[Optional[bool]] = ModelField("HasBeenReprocessed", FieldType.BOOLEAN)
+    OtherSampleId: ModelField[Optional[str]] = ModelField("OtherSampleId", FieldType.STRING)
+    ProcessName: ModelField[Optional[str]] = ModelField("ProcessName", FieldType.SELECTION)
+    ProcessStepNumber: ModelField[Optional[int]] = ModelField("ProcessStepNumber", FieldType.LONG)
+    ProcessTAT: ModelField[Optional[float]] = ModelField("ProcessTAT", FieldType.DOUBLE)
+    Reprocessing: ModelField[Optional[bool]] = ModelField("Reprocessing", FieldType.BOOLEAN)
+    RequestRecordId: ModelField[Optional[int]] = ModelField("RequestRecordId", FieldType.LONG)
+    SampleId: ModelField[Optional[str]] = ModelField("SampleId", FieldType.STRING)
+    SampleRecordId: ModelField[Optional[int]] = ModelField("SampleRecordId", FieldType.LONG)
+    ScheduledDate: ModelField[Optional[int]] = ModelField("ScheduledDate", FieldType.DATE)
+    SourceAssignedProcessIds: ModelField[Optional[str]] = ModelField("SourceAssignedProcessIds", FieldType.STRING)
+    Status: ModelField[Optional[str]] = ModelField("Status", FieldType.SELECTION)
+    TurnAroundHours: ModelField[Optional[int]] = ModelField("TurnAroundHours", FieldType.LONG)
+    TurnAroundMinutes: ModelField[Optional[int]] = ModelField("TurnAroundMinutes", FieldType.LONG)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
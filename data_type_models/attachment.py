@@ -0,0 +1,38 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class AttachmentModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type Attachment
+    Data Type Display Name: Attachment (Attachments)
+    Fields: AttachmentId, Comments, Description, FilePath, IsGeneratedByReportBuilder, MultiParentLink118, MultiParentLink172, MultiParentLink174, MultiParentLink207, MultiParentLink208, VeloxCurrentVersion, VersionNumber
+    Data type for document attachments
+    """
+    DATA_TYPE_NAME: str = 'Attachment'
+    ATTACHMENTID__FIELD_NAME: WrapperField = WrapperField("AttachmentId", FieldType.STRING)
+    COMMENTS__FIELD_NAME: WrapperField = WrapperField("Comments", FieldType.STRING)
+    DESCRIPTION__FIELD_NAME: WrapperField = WrapperField("Description", FieldType.STRING)
+    FILEPATH__FIELD_NAME: WrapperField = WrapperField("FilePath", FieldType.STRING)
+    ISGENERATEDBYREPORTBUILDER__FIELD_NAME: WrapperField = WrapperField("IsGeneratedByReportBuilder", FieldType.BOOLEAN)
+    MULTIPARENTLINK118__FIELD_NAME: WrapperField = WrapperField("MultiParentLink118", FieldType.MULTIPARENTLINK)
+    MULTIPARENTLINK172__FIELD_NAME: WrapperField = WrapperField("MultiParentLink172", FieldType.MULTIPARENTLINK)
+    MULTIPARENTLINK174__FIELD_NAME: WrapperField = WrapperField("MultiParentLink174", FieldType.MULTIPARENTLINK)
+    MULTIPARENTLINK207__FIELD_NAME: WrapperField = WrapperField("MultiParentLink207", FieldType.MULTIPARENTLINK)
+    MULTIPARENTLINK208__FIELD_NAME: WrapperField = WrapperField("MultiParentLink208", FieldType.MULTIPARENTLINK)
+    VELOXCURRENTVERSION__FIELD_NAME: WrapperField = WrapperField("VeloxCurrentVersion", FieldType.INTEGER)
+    VERSIONNUMBER__FIELD_NAME: WrapperField = WrapperField("VersionNumber", FieldType.STRING)
+
+    AttachmentId: ModelField[Optional[str]] = ModelField("AttachmentId", FieldType.STRING)
+    Comments: ModelField[Optional[str]] = ModelField("Comments", FieldType.STRING)
+    Description: ModelField[Optional[str]] = ModelField("Description", FieldType.STRING)
+    FilePath: ModelField[Optional[str]] = ModelField("FilePath", FieldType.STRING)
+    IsGeneratedByReportBuilder: ModelField[Optional[bool]] = ModelField("IsGeneratedByReportBuilder", FieldType.BOOLEAN)
+    VeloxCurrentVersion: ModelField[Optional[int]] = ModelField("VeloxCurrentVersion", FieldType.INTEGER)
+    VersionNumber: ModelField[Optional[str]] = ModelField("VersionNumber", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,24 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class AWSSageMakerClientConfigModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type AWSSageMakerClientConfig
+    Data Type Display Name: AWS SageMaker Client Configuration (AWS SageMaker Client Configurations)
+    Fields: AccessKeyId, Region, SecretKey
+    """
+    DATA_TYPE_NAME: str = 'AWSSageMakerClientConfig'
+    ACCESSKEYID__FIELD_NAME: WrapperField = WrapperField("AccessKeyId", FieldType.STRING)
+    REGION__FIELD_NAME: WrapperField = WrapperField("Region", FieldType.STRING)
+    SECRETKEY__FIELD_NAME: WrapperField = WrapperField("SecretKey", FieldType.STRING)
+
+    AccessKeyId: ModelField[Optional[str]] = ModelField("AccessKeyId", FieldType.STRING)
+    Region: ModelField[Optional[str]] = ModelField("Region", FieldType.STRING)
+    SecretKey: ModelField[Optional[str]] = ModelField("SecretKey", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,47 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class BarcodeConfigModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type BarcodeConfig
+    Data Type Display Name: Barcode Configuration (Barcode Configurations)
+    Fields: BarcodeConfigName, CustomPluginClassPath, DataType, DefaultPrinter, Field1, Field10, Field2, Field3, Field4, Field5, Field6, Field7, Field8, Field9
+    The Barcode Configurations Data Type
+    """
+    DATA_TYPE_NAME: str = 'BarcodeConfig'
+    BARCODECONFIGNAME__FIELD_NAME: WrapperField = WrapperField("BarcodeConfigName", FieldType.STRING)
+    CUSTOMPLUGINCLASSPATH__FIELD_NAME: WrapperField = WrapperField("CustomPluginClassPath", FieldType.STRING)
+    DATATYPE__FIELD_NAME: WrapperField = WrapperField("DataType", FieldType.SELECTION)
+    DEFAULTPRINTER__FIELD_NAME: WrapperField = WrapperField("DefaultPrinter", FieldType.SELECTION)
+    FIELD1__FIELD_NAME: WrapperField = WrapperField("Field1", FieldType.SELECTION)
+    FIELD10__FIELD_NAME: WrapperField = WrapperField("Field10", FieldType.SELECTION)
+    FIELD2__FIELD_NAME: WrapperField = WrapperField("Field2", FieldType.SELECTION)
+    FIELD3__FIELD_NAME: WrapperField = WrapperField("Field3", FieldType.SELECTION)
+    FIELD4__FIELD_NAME: WrapperField = WrapperField("Field4", FieldType.SELECTION)
+    FIELD5__FIELD_NAME: WrapperField = WrapperField("Field5", FieldType.SELECTION)
+    FIELD6__FIELD_NAME: WrapperField = WrapperField("Field6", FieldType.SELECTION)
+    FIELD7__FIELD_NAME: WrapperField = WrapperField("Field7", FieldType.SELECTION)
+    FIELD8__FIELD_NAME: WrapperField = WrapperField("Field8", FieldType.SELECTION)
+    FIELD9__FIELD_NAME: WrapperField = WrapperField("Field9", FieldType.SELECTION)
+
+    BarcodeConfigName: ModelField[Optional[str]] = ModelField("BarcodeConfigName", FieldType.STRING)
+    CustomPluginClassPath: ModelField[Optional[str]] = ModelField("CustomPluginClassPath", FieldType.STRING)
+    DataType: ModelField[Optional[str]] = ModelField("DataType", FieldType.SELECTION)
+    DefaultPrinter: ModelField[Optional[str]] = ModelField("DefaultPrinter", FieldType.SELECTION)
+    Field1: ModelField[Optional[str]] = ModelField("Field1", FieldType.SELECTION)
+    Field10: ModelField[Optional[str]] = ModelField("Field10", FieldType.SELECTION)
+    Field2: ModelField[Optional[str]] = ModelField("Field2", FieldType.SELECTION)
+    Field3: ModelField[Optional[str]] = ModelField("Field3", FieldType.SELECTION)
+    Field4: ModelField[Optional[str]] = ModelField("Field4", FieldType.SELECTION)
+    Field5: ModelField[Optional[str]] = ModelField("Field5", FieldType.SELECTION)
+    Field6: ModelField[Optional[str]] = ModelField("Field6", FieldType.SELECTION)
+    Field7: ModelField[Optional[str]] = ModelField("Field7", FieldType.SELECTION)
+    Field8: ModelField[Optional[str]] = ModelField("Field8", FieldType.SELECTION)
+    Field9: ModelField[Optional[str]] = ModelField("Field9", FieldType.SELECTION)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,34 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class BatchModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type Batch
+    Data Type Display Name: Batch (Batches)
+    Fields: AssignedTo, BatchId, BatchName, ExemplarBatchStatus, NumberOfSamples, PriorityLevel, StartDate, WorkflowName
+    """
+    DATA_TYPE_NAME: str = 'Batch'
+    ASSIGNEDTO__FIELD_NAME: WrapperField = WrapperField("AssignedTo", FieldType.SELECTION)
+    BATCHID__FIELD_NAME: WrapperField = WrapperField("BatchId", FieldType.STRING)
+    BATCHNAME__FIELD_NAME: WrapperField = WrapperField("BatchName", FieldType.STRING)
+    EXEMPLARBATCHSTATUS__FIELD_NAME: WrapperField = WrapperField("ExemplarBatchStatus", FieldType.SELECTION)
+    NUMBEROFSAMPLES__FIELD_NAME: WrapperField = WrapperField("NumberOfSamples", FieldType.LONG)
+    PRIORITYLEVEL__FIELD_NAME: WrapperField = WrapperField("PriorityLevel", FieldType.PICKLIST)
+    STARTDATE__FIELD_NAME: WrapperField = WrapperField("StartDate", FieldType.DATE)
+    WORKFLOWNAME__FIELD_NAME: WrapperField = WrapperField("WorkflowName", FieldType.SELECTION)
+
+    AssignedTo: ModelField[Optional[str]] = ModelField("AssignedTo", FieldType.SELECTION)
+    BatchId: ModelField[Optional[str]] = ModelField("BatchId", FieldType.STRING)
+    BatchName: ModelField[Optional[str]] = ModelField("BatchName", FieldType.STRING)
+    ExemplarBatchStatus: ModelField[Optional[str]] = ModelField("ExemplarBatchStatus", FieldType.SELECTION)
+    NumberOfSamples: ModelField[Optional[int]] = ModelField("NumberOfSamples", FieldType.LONG)
+    PriorityLevel: ModelField[Optional[str]] = ModelField("PriorityLevel", FieldType.PICKLIST)
+    StartDate: ModelField[Optional[int]] = ModelField("StartDate", FieldType.DATE)
+    WorkflowName: ModelField[Optional[str]] = ModelField("WorkflowName", FieldType.SELECTION)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
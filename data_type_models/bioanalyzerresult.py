@@ -0,0 +1,30 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class BioAnalyzerResultModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type BioAnalyzerResult
+    Data Type Display Name: BioAnalyzer Result (BioAnalyzer Results)
+    Fields: Area, AvgBPSize, Molarity, MolarityUnits, PeakRegionIdentifier, PeakValue
+    """
+    DATA_TYPE_NAME: str = 'BioAnalyzerResult'
+    AREA__FIELD_NAME: WrapperField = WrapperField("Area", FieldType.DOUBLE)
+    AVGBPSIZE__FIELD_NAME: WrapperField = WrapperField("AvgBPSize", FieldType.DOUBLE)
+    MOLARITY__FIELD_NAME: WrapperField = WrapperField("Molarity", FieldType.DOUBLE)
+    MOLARITYUNITS__FIELD_NAME: WrapperField = WrapperField("MolarityUnits", FieldType.STRING)
+    PEAKREGIONIDENTIFIER__FIELD_NAME: WrapperField = WrapperField("PeakRegionIdentifier", FieldType.STRING)
+    PEAKVALUE__FIELD_NAME: WrapperField = WrapperField("PeakValue", FieldType.DOUBLE)
+
+    Area: ModelField[Optional[float]] = ModelField("Area", FieldType.DOUBLE)
+    AvgBPSize: ModelField[Optional[float]] = ModelField("AvgBPSize", FieldType.DOUBLE)
+    Molarity: ModelField[Optional[float]] = ModelField("Molarity", FieldType.DOUBLE)
+    MolarityUnits: ModelField[Optional[str]] = ModelField("MolarityUnits", FieldType.STRING)
+    PeakRegionIdentifier: ModelField[Optional[str]] = ModelField("PeakRegionIdentifier", FieldType.STRING)
+    PeakValue: ModelField[Optional[float]] = ModelField("PeakValue", FieldType.DOUBLE)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
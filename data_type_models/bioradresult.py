@@ -0,0 +1,42 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class BioRadResultModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type BioRadResult
+    Data Type Display Name: Bio-Rad qPCR Result (Bio-Rad qPCR Results)
+    Fields: BiologicalSetName, Content, Cq, CqMean, CqStdDev, Fluor, LogStartingQuantity, SetPoint, SQMean, SQStdDev, Target, WellNote
+    """
+    DATA_TYPE_NAME: str = 'BioRadResult'
+    BIOLOGICALSETNAME__FIELD_NAME: WrapperField = WrapperField("BiologicalSetName", FieldType.STRING)
+    CONTENT__FIELD_NAME: WrapperField = WrapperField("Content", FieldType.STRING)
+    CQ__FIELD_NAME: WrapperField = WrapperField("Cq", FieldType.DOUBLE)
+    CQMEAN__FIELD_NAME: WrapperField = WrapperField("CqMean", FieldType.DOUBLE)
+    CQSTDDEV__FIELD_NAME: WrapperField = WrapperField("CqStdDev", FieldType.DOUBLE)
+    FLUOR__FIELD_NAME: WrapperField = WrapperField("Fluor", FieldType.STRING)
+    LOGSTARTINGQUANTITY__FIELD_NAME: WrapperField = WrapperField("LogStartingQuantity", FieldType.DOUBLE)
+    SETPOINT__FIELD_NAME: WrapperField = WrapperField("SetPoint", FieldType.DOUBLE)
+    SQMEAN__FIELD_NAME: WrapperField = WrapperField("SQMean", FieldType.DOUBLE)
+    SQSTDDEV__FIELD_NAME: WrapperField = WrapperField("SQStdDev", FieldType.DOUBLE)
+    TARGET__FIELD_NAME: WrapperField = WrapperField("Target", FieldType.STRING)
+    WELLNOTE__FIELD_NAME: WrapperField = WrapperField("WellNote", FieldType.STRING)
+
+    BiologicalSetName: ModelField[Optional[str]] = ModelField("BiologicalSetName", FieldType.STRING)
+    Content: ModelField[Optional[str]] = ModelField("Content", FieldType.STRING)
+    Cq: ModelField[Optional[float]] = ModelField("Cq", FieldType.DOUBLE)
+    CqMean: ModelField[Optional[float]] = ModelField("CqMean", FieldType.DOUBLE)
+    CqStdDev: ModelField[Optional[float]] = ModelField("CqStdDev", FieldType.DOUBLE)
+    Fluor: ModelField[Optional[str]] = ModelField("Fluor", FieldType.STRING)
+    LogStartingQuantity: ModelField[Optional[float]] = ModelField("LogStartingQuantity", FieldType.DOUBLE)
+    SetPoint: ModelField[Optional[float]] = ModelField("SetPoint", FieldType.DOUBLE)
+    SQMean: ModelField[Optional[float]] = ModelField("SQMean", FieldType.DOUBLE)
+    SQStdDev: ModelField[Optional[float]] = ModelField("SQStdDev", FieldType.DOUBLE)
+    Target: ModelField[Optional[str]] = ModelField("Target", FieldType.STRING)
+    WellNote: ModelField[Optional[str]] = ModelField("WellNote", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
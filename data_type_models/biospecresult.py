@@ -0,0 +1,22 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class BioSpecResultModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type BioSpecResult
+    Data Type Display Name: BioSpec Result (BioSpec Results)
+    Fields: A260230, A260280
+    """
+    DATA_TYPE_NAME: str = 'BioSpecResult'
+    A260230__FIELD_NAME: WrapperField = WrapperField("A260230", FieldType.DOUBLE)
+    A260280__FIELD_NAME: WrapperField = WrapperField("A260280", FieldType.DOUBLE)
+
+    A260230: ModelField[Optional[float]] = ModelField("A260230", FieldType.DOUBLE)
+    A260280: ModelField[Optional[float]] = ModelField("A260280", FieldType.DOUBLE)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
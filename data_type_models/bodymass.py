@@ -0,0 +1,26 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class BodyMassModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type BodyMass
+    Data Type Display Name: Body Mass (Body Masses)
+    Fields: Mass, MassUnits, ObservationInstrument, StudyTask
+    """
+    DATA_TYPE_NAME: str = 'BodyMass'
+    MASS__FIELD_NAME: WrapperField = WrapperField("Mass", FieldType.DOUBLE)
+    MASSUNITS__FIELD_NAME: WrapperField = WrapperField("MassUnits", FieldType.PICKLIST)
+    OBSERVATIONINSTRUMENT__FIELD_NAME: WrapperField = WrapperField("ObservationInstrument", FieldType.SELECTION)
+    STUDYTASK__FIELD_NAME: WrapperField = WrapperField("StudyTask", FieldType.SIDE_LINK)
+
+    Mass: ModelField[Optional[float]] = ModelField("Mass", FieldType.DOUBLE)
+    MassUnits: ModelField[Optional[str]] = ModelField("MassUnits", FieldType.PICKLIST)
+    ObservationInstrument: ModelField[Optional[str]] = ModelField("ObservationInstrument", FieldType.SELECTION)
+    StudyTask: ModelField[Optional[int]] = ModelField("StudyTask", FieldType.SIDE_LINK)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
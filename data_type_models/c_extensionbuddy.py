@@ -0,0 +1,14 @@
+from data_type_models._base import GeneratedRecordModel
+
+
+class C_ExtensionBuddyModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type C_ExtensionBuddy
+    Data Type Display Name: Extension Buddy (Extension Buddies)
+    Fields: 
+    """
+    DATA_TYPE_NAME: str = 'C_ExtensionBuddy'
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,24 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class C_QubitModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type C_Qubit
+    Data Type Display Name: Qubit (Qubits)
+    Fields: C_ObservationInstrument, C_QubitValue, C_StudyTask
+    """
+    DATA_TYPE_NAME: str = 'C_Qubit'
+    C_OBSERVATIONINSTRUMENT__FIELD_NAME: WrapperField = WrapperField("C_ObservationInstrument", FieldType.SELECTION)
+    C_QUBITVALUE__FIELD_NAME: WrapperField = WrapperField("C_QubitValue", FieldType.STRING)
+    C_STUDYTASK__FIELD_NAME: WrapperField = WrapperField("C_StudyTask", FieldType.SIDE_LINK)
+
+    C_ObservationInstrument: ModelField[Optional[str]] = ModelField("C_ObservationInstrument", FieldType.SELECTION)
+    C_QubitValue: ModelField[Optional[str]] = ModelField("C_QubitValue", FieldType.STRING)
+    C_StudyTask: ModelField[Optional[int]] = ModelField("C_StudyTask", FieldType.SIDE_LINK)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
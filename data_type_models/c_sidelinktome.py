@@ -0,0 +1,14 @@
+from data_type_models._base import GeneratedRecordModel
+
+
+class C_SideLinkToMeModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type C_SideLinkToMe
+    Data Type Display Name: Side Link To Me (Side Link To Mes)
+    Fields: 
+    """
+    DATA_TYPE_NAME: str = 'C_SideLinkToMe'
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,20 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class C_SideLinkToSomethingElseModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type C_SideLinkToSomethingElse
+    Data Type Display Name: Side Link To Something Else (Side Link To Something Elses)
+    Fields: C_SideLink
+    """
+    DATA_TYPE_NAME: str = 'C_SideLinkToSomethingElse'
+    C_SIDELINK__FIELD_NAME: WrapperField = WrapperField("C_SideLink", FieldType.SIDE_LINK)
+
+    C_SideLink: ModelField[Optional[int]] = ModelField("C_SideLink", FieldType.SIDE_LINK)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,34 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class CDLConfigModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type CDLConfig
+    Data Type Display Name: Complex Data Loader Config (Complex Data Loader Configs)
+    Fields: ConfigurationName, DataTypeName, DataTypeRules, DataTypeRules2, ExplicitlyMapped, IdentifierType, Options, Options2
+    """
+    DATA_TYPE_NAME: str = 'CDLConfig'
+    CONFIGURATIONNAME__FIELD_NAME: WrapperField = WrapperField("ConfigurationName", FieldType.STRING)
+    DATATYPENAME__FIELD_NAME: WrapperField = WrapperField("DataTypeName", FieldType.SELECTION)
+    DATATYPERULES__FIELD_NAME: WrapperField = WrapperField("DataTypeRules", FieldType.SELECTION)
+    DATATYPERULES2__FIELD_NAME: WrapperField = WrapperField("DataTypeRules2", FieldType.SELECTION)
+    EXPLICITLYMAPPED__FIELD_NAME: WrapperField = WrapperField("ExplicitlyMapped", FieldType.BOOLEAN)
+    IDENTIFIERTYPE__FIELD_NAME: WrapperField = WrapperField("IdentifierType", FieldType.SELECTION)
+    OPTIONS__FIELD_NAME: WrapperField = WrapperField("Options", FieldType.SELECTION)
+    OPTIONS2__FIELD_NAME: WrapperField = WrapperField("Options2", FieldType.SELECTION)
+
+    ConfigurationName: ModelField[Optional[str]] = ModelField("ConfigurationName", FieldType.STRING)
+    DataTypeName: ModelField[Optional[str]] = ModelField("DataTypeName", FieldType.SELECTION)
+    DataTypeRules: ModelField[Optional[str]] = ModelField("DataTypeRules", FieldType.SELECTION)
+    DataTypeRules2: ModelField[Optional[str]] = ModelField("DataTypeRules2", FieldType.SELECTION)
+    ExplicitlyMapped: ModelField[Optional[bool]] = ModelField("ExplicitlyMapped", FieldType.BOOLEAN)
+    IdentifierType: ModelField[Optional[str]] = ModelField("IdentifierType", FieldType.SELECTION)
+    Options: ModelField[Optional[str]] = ModelField("Options", FieldType.SELECTION)
+    Options2: ModelField[Optional[str]] = ModelField("Options2", FieldType.SELECTION)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,51 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class CDLFieldMapModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type CDLFieldMap
+    Data Type Display Name: Complex Data Loader Field Mapping (Complex Data Loader Field Mappings)
+    Fields: ConfigurationName, DataTypeName, FieldRules, FieldRules2, FieldType, FromHeader, IdentifiedBy, IsListField, Options, Options2, ToField
+    """
+    DATA_TYPE_NAME: str = 'CDLFieldMap'
+    CONFIGURATIONNAME__FIELD_NAME: WrapperField = WrapperField("ConfigurationName", FieldType.STRING)
+    DATATYPENAME__FIELD_NAME: WrapperField = WrapperField("DataTypeName", FieldType.SELECTION)
+    FIELDRULES__FIELD_NAME: WrapperField = WrapperField("FieldRules", FieldType.SELECTION)
+    FIELDRULES2__FIELD_NAME: WrapperField = WrapperField("FieldRules2", FieldType.SELECTION)
+    FIELDTYPE__FIELD_NAME: WrapperField = WrapperField("FieldType", FieldType.SELECTION)
+    FROMHEADER__FIELD_NAME: WrapperField = WrapperField("FromHeader", FieldType.SELECTION)
+    IDENTIFIEDBY__FIELD_NAME: WrapperField = WrapperField("IdentifiedBy", FieldType.STRING)
+    ISLISTFIELD__FIELD_NAME: WrapperField = WrapperField("IsListField", FieldType.BOOLEAN)
+    OPTIONS__FIELD_NAME: WrapperField = WrapperField("Options", FieldType.SELECTION)
+    OPTIONS2__FIELD_NAME: WrapperField = WrapperField("Options2", FieldType.SELECTION)
+    TOFIELD__FIELD_NAME: WrapperField = WrapperField("ToField", FieldType.SELECTION)
+
+    ConfigurationName: ModelField[Optional[str]] = ModelField("ConfigurationName", FieldType.STRING)
+    DataTypeName: ModelField[Optional[str]] = ModelField("DataTypeName", FieldType.SELECTION)
+    FieldRules: ModelField[Optional[str]] = ModelField("FieldRules", FieldType.SELECTION)
+    FieldRules2: ModelField[Optional[str]] = ModelField("FieldRules2", FieldType.SELECTION)
+    FromHeader: ModelField[Optional[str]] = ModelField("FromHeader", FieldType.SELECTION)
+    IdentifiedBy: ModelField[Optional[str]] = ModelField("IdentifiedBy", FieldType.STRING)
+    IsListField: ModelField[Optional[bool]] = ModelField("IsListField", FieldType.BOOLEAN)
+    Options: ModelField[Optional[str]] = ModelField("Options", FieldType.SELECTION)
+    Options2: ModelField[Optional[str]] = ModelField("Options2", FieldType.SELECTION)
+    ToField: ModelField[Optional[str]] = ModelField("ToField", FieldType.SELECTION)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
+
+    def set_FieldType_field(self, value: Optional[str]):
+        """
+        Set data field with field name 'FieldType' on this record model
+        """
+        self.set_field_value(self.FIELDTYPE__FIELD_NAME.field_name, value)
+
+    def get_FieldType_field(self) -> Optional[str]:
+        """
+        Get data field value with field name 'FieldType' from this record model
+        """
+        return self.get_field_value(self.FIELDTYPE__FIELD_NAME.field_name)
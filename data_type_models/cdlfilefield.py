@@ -0,0 +1,23 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class CDLFileFieldModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type CDLFileField
+    Data Type Display Name: Complex Data Loader File Field Header (Complex Data Loader File Field Headers)
+    Fields: ConfigurationName, FileFieldHeader
+    These records represent the field headers that were found in the example file.  These records are used by the plugin backing the selection list to the header field on the Complex Data Loader Field Mapping records.
+    """
+    DATA_TYPE_NAME: str = 'CDLFileField'
+    CONFIGURATIONNAME__FIELD_NAME: WrapperField = WrapperField("ConfigurationName", FieldType.STRING)
+    FILEFIELDHEADER__FIELD_NAME: WrapperField = WrapperField("FileFieldHeader", FieldType.STRING)
+
+    ConfigurationName: ModelField[Optional[str]] = ModelField("ConfigurationName", FieldType.STRING)
+    FileFieldHeader: ModelField[Optional[str]] = ModelField("FileFieldHeader", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,22 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class CDLGroupingConfigModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type CDLGroupingConfig
+    Data Type Display Name: Complex Data Loader Grouping Config (Complex Data Loader Grouping Configs)
+    Fields: ConfigurationName, FileParser
+    """
+    DATA_TYPE_NAME: str = 'CDLGroupingConfig'
+    CONFIGURATIONNAME__FIELD_NAME: WrapperField = WrapperField("ConfigurationName", FieldType.STRING)
+    FILEPARSER__FIELD_NAME: WrapperField = WrapperField("FileParser", FieldType.SELECTION)
+
+    ConfigurationName: ModelField[Optional[str]] = ModelField("ConfigurationName", FieldType.STRING)
+    FileParser: ModelField[Optional[str]] = ModelField("FileParser", FieldType.SELECTION)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,66 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class ChemicalReagentModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type ChemicalReagent
+    Data Type Display Name: Chemical Reagent (Chemical Reagents)
+    Fields: CAS, Charge, cLogP, ConsumableType, ExactMass, ExpirationDate, Formula, GHSCautionCode, GHSHazardCode, GHSPictoCode, GHSSignal, inchi, InchiKey, IsGHSClassified, IUPAC, LotNumber, MolecularWeight, PolarSurfaceArea, PubchemCid, Purity, RegistryId, SMILES, TotalHBondCount, Yield
+    """
+    DATA_TYPE_NAME: str = 'ChemicalReagent'
+    CAS__FIELD_NAME: WrapperField = WrapperField("CAS", FieldType.STRING)
+    CHARGE__FIELD_NAME: WrapperField = WrapperField("Charge", FieldType.INTEGER)
+    CLOGP__FIELD_NAME: WrapperField = WrapperField("cLogP", FieldType.DOUBLE)
+    CONSUMABLETYPE__FIELD_NAME: WrapperField = WrapperField("ConsumableType", FieldType.SELECTION)
+    EXACTMASS__FIELD_NAME: WrapperField = WrapperField("ExactMass", FieldType.DOUBLE)
+    EXPIRATIONDATE__FIELD_NAME: WrapperField = WrapperField("ExpirationDate", FieldType.DATE)
+    FORMULA__FIELD_NAME: WrapperField = WrapperField("Formula", FieldType.STRING)
+    GHSCAUTIONCODE__FIELD_NAME: WrapperField = WrapperField("GHSCautionCode", FieldType.STRING)
+    GHSHAZARDCODE__FIELD_NAME: WrapperField = WrapperField("GHSHazardCode", FieldType.STRING)
+    GHSPICTOCODE__FIELD_NAME: WrapperField = WrapperField("GHSPictoCode", FieldType.STRING)
+    GHSSIGNAL__FIELD_NAME: WrapperField = WrapperField("GHSSignal", FieldType.STRING)
+    INCHI__FIELD_NAME: WrapperField = WrapperField("inchi", FieldType.STRING)
+    INCHIKEY__FIELD_NAME: WrapperField = WrapperField("InchiKey", FieldType.STRING)
+    ISGHSCLASSIFIED__FIELD_NAME: WrapperField = WrapperField("IsGHSClassified", FieldType.BOOLEAN)
+    IUPAC__FIELD_NAME: WrapperField = WrapperField("IUPAC", FieldType.STRING)
+    LOTNUMBER__FIELD_NAME: WrapperField = WrapperField("LotNumber", FieldType.STRING)
+    MOLECULARWEIGHT__FIELD_NAME: WrapperField = WrapperField("MolecularWeight", FieldType.DOUBLE)
+    POLARSURFACEAREA__FIELD_NAME: WrapperField = WrapperField("PolarSurfaceArea", FieldType.DOUBLE)
+    PUBCHEMCID__FIELD_NAME: WrapperField = WrapperField("PubchemCid", FieldType.INTEGER)
+    PURITY__FIELD_NAME: WrapperField = WrapperField("Purity", FieldType.DOUBLE)
+    REGISTRYID__FIELD_NAME: WrapperField = WrapperField("RegistryId", FieldType.STRING)
+    SMILES__FIELD_NAME: WrapperField = WrapperField("SMILES", FieldType.STRING)
+    TOTALHBONDCOUNT__FIELD_NAME: WrapperField = WrapperField("TotalHBondCount", FieldType.INTEGER)
+    YIELD__FIELD_NAME: WrapperField = WrapperField("Yield", FieldType.DOUBLE)
+
+    CAS: ModelField[Optional[str]] = ModelField("CAS", FieldType.STRING)
+    Charge: ModelField[Optional[int]] = ModelField("Charge", FieldType.INTEGER)
+    cLogP: ModelField[Optional[float]] = ModelField("cLogP", FieldType.DOUBLE)
+    ConsumableType: ModelField[Optional[str]] = ModelField("ConsumableType", FieldType.SELECTION)
+    ExactMass: ModelField[Optional[float]] = ModelField("ExactMass", FieldType.DOUBLE)
+    ExpirationDate: ModelField[Optional[int]] = ModelField("ExpirationDate", FieldType.DATE)
+    Formula: ModelField[Optional[str]] = ModelField("Formula", FieldType.STRING)
+    GHSCautionCode: ModelField[Optional[str]] = ModelField("GHSCautionCode", FieldType.STRING)
+    GHSHazardCode: ModelField[Optional[str]] = ModelField("GHSHazardCode", FieldType.STRING)
+    GHSPictoCode: ModelField[Optional[str]] = ModelField("GHSPictoCode", FieldType.STRING)
+    GHSSignal: ModelField[Optional[str]] = ModelField("GHSSignal", FieldType.STRING)
+    inchi: ModelField[Optional[str]] = ModelField("inchi", FieldType.STRING)
+    InchiKey: ModelField[Optional[str]] = ModelField("InchiKey", FieldType.STRING)
+    IsGHSClassified: ModelField[Optional[bool]] = ModelField("IsGHSClassified", FieldType.BOOLEAN)
+    IUPAC: ModelField[Optional[str]] = ModelField("IUPAC", FieldType.STRING)
+    LotNumber: ModelField[Optional[str]] = ModelField("LotNumber", FieldType.STRING)
+    MolecularWeight: ModelField[Optional[float]] = ModelField("MolecularWeight", FieldType.DOUBLE)
+    PolarSurfaceArea: ModelField[Optional[float]] = ModelField("PolarSurfaceArea", FieldType.DOUBLE)
+    PubchemCid: ModelField[Optional[int]] = ModelField("PubchemCid", FieldType.INTEGER)
+    Purity: ModelField[Optional[float]] = ModelField("Purity", FieldType.DOUBLE)
+    RegistryId: ModelField[Optional[str]] = ModelField("RegistryId", FieldType.STRING)
+    SMILES: ModelField[Optional[str]] = ModelField("SMILES", FieldType.STRING)
+    TotalHBondCount: ModelField[Optional[int]] = ModelField("TotalHBondCount", FieldType.INTEGER)
+    Yield: ModelField[Optional[float]] = ModelField("Yield", FieldType.DOUBLE)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,80 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class ChemicalReagentPartModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type ChemicalReagentPart
+    Data Type Display Name: Chemical Reagent Part (Chemical Reagent Parts)
+    Fields: CAS, Charge, cLogP, ConsumableType, EditLock, ExactMass, Formula, GHSCautionCode, GHSHazardCode, GHSPictoCode, GHSSignal, inchi, InchiKey, INCHIShadow, IsGHSClassified, IUPAC, MOL, MolecularWeight, PolarSurfaceArea, PubchemCid, QuantityOnHand, QuantityPerItem, RegisteredToCartridge, RegistryId, ReorderLevelQuantity, RequestImageUpdate, SMILES, SMILESShadow, TotalHBondCount, Units, Vendor
+    """
+    DATA_TYPE_NAME: str = 'ChemicalReagentPart'
+    CAS__FIELD_NAME: WrapperField = WrapperField("CAS", FieldType.STRING)
+    CHARGE__FIELD_NAME: WrapperField = WrapperField("Charge", FieldType.INTEGER)
+    CLOGP__FIELD_NAME: WrapperField = WrapperField("cLogP", FieldType.DOUBLE)
+    CONSUMABLETYPE__FIELD_NAME: WrapperField = WrapperField("ConsumableType", FieldType.SELECTION)
+    EDITLOCK__FIELD_NAME: WrapperField = WrapperField("EditLock", FieldType.BOOLEAN)
+    EXACTMASS__FIELD_NAME: WrapperField = WrapperField("ExactMass", FieldType.DOUBLE)
+    FORMULA__FIELD_NAME: WrapperField = WrapperField("Formula", FieldType.STRING)
+    GHSCAUTIONCODE__FIELD_NAME: WrapperField = WrapperField("GHSCautionCode", FieldType.STRING)
+    GHSHAZARDCODE__FIELD_NAME: WrapperField = WrapperField("GHSHazardCode", FieldType.STRING)
+    GHSPICTOCODE__FIELD_NAME: WrapperField = WrapperField("GHSPictoCode", FieldType.STRING)
+    GHSSIGNAL__FIELD_NAME: WrapperField = WrapperField("GHSSignal", FieldType.STRING)
+    INCHI__FIELD_NAME: WrapperField = WrapperField("inchi", FieldType.STRING)
+    INCHIKEY__FIELD_NAME: WrapperField = WrapperField("InchiKey", FieldType.STRING)
+    INCHISHADOW__FIELD_NAME: WrapperField = WrapperField("INCHIShadow", FieldType.STRING)
+    ISGHSCLASSIFIED__FIELD_NAME: WrapperField = WrapperField("IsGHSClassified", FieldType.BOOLEAN)
+    IUPAC__FIELD_NAME: WrapperField = WrapperField("IUPAC", FieldType.STRING)
+    MOL__FIELD_NAME: WrapperField = WrapperField("MOL", FieldType.STRING)
+    MOLECULARWEIGHT__FIELD_NAME: WrapperField = WrapperField("MolecularWeight", FieldType.DOUBLE)
+    POLARSURFACEAREA__FIELD_NAME: WrapperField = WrapperField("PolarSurfaceArea", FieldType.DOUBLE)
+    PUBCHEMCID__FIELD_NAME: WrapperField = WrapperField("PubchemCid", FieldType.INTEGER)
+    QUANTITYONHAND__FIELD_NAME: WrapperField = WrapperField("QuantityOnHand", FieldType.DOUBLE)
+    QUANTITYPERITEM__FIELD_NAME: WrapperField = WrapperField("QuantityPerItem", FieldType.DOUBLE)
+    REGISTEREDTOCARTRIDGE__FIELD_NAME: WrapperField = WrapperField("RegisteredToCartridge", FieldType.BOOLEAN)
+    REGISTRYID__FIELD_NAME: WrapperField = WrapperField("RegistryId", FieldType.STRING)
+    REORDERLEVELQUANTITY__FIELD_NAME: WrapperField = WrapperField("ReorderLevelQuantity", FieldType.DOUBLE)
+    REQUESTIMAGEUPDATE__FIELD_NAME: WrapperField = WrapperField("RequestImageUpdate", FieldType.BOOLEAN)
+    SMILES__FIELD_NAME: WrapperField = WrapperField("SMILES", FieldType.STRING)
+    SMILESSHADOW__FIELD_NAME: WrapperField = WrapperField("SMILESShadow", FieldType.STRING)
+    TOTALHBONDCOUNT__FIELD_NAME: WrapperField = WrapperField("TotalHBondCount", FieldType.INTEGER)
+    UNITS__FIELD_NAME: WrapperField = WrapperField("Units", FieldType.PICKLIST)
+    VENDOR__FIELD_NAME: WrapperField = WrapperField("Vendor", FieldType.SELECTION)
+
+    CAS: ModelField[Optional[str]] = ModelField("CAS", FieldType.STRING)
+    Charge: ModelField[Optional[int]] = ModelField("Charge", FieldType.INTEGER)
+    cLogP: ModelField[Optional[float]] = ModelField("cLogP", FieldType.DOUBLE)
+    ConsumableType: ModelField[Optional[str]] = ModelField("ConsumableType", FieldType.SELECTION)
+    EditLock: ModelField[Optional[bool]] = ModelField("EditLock", FieldType.BOOLEAN)
+    ExactMass: ModelField[Optional[float]] = ModelField("ExactMass", FieldType.DOUBLE)
+    Formula: ModelField[Optional[str]] = ModelField("Formula", FieldType.STRING)
+    GHSCautionCode: ModelField[Optional[str]] = ModelField("GHSCautionCode", FieldType.STRING)
+    GHSHazardCode: ModelField[Optional[str]] = ModelField("GHSHazardCode", FieldType.STRING)
+    GHSPictoCode: ModelField[Optional[str]] = ModelField("GHSPictoCode", FieldType.STRING)
+    GHSSignal: ModelField[Optional[str]] = ModelField("GHSSignal", FieldType.STRING)
+    inchi: ModelField[Optional[str]] = ModelField("inchi", FieldType.STRING)
+    InchiKey: ModelField[Optional[str]] = ModelField("InchiKey", FieldType.STRING)
+    INCHIShadow: ModelField[Optional[str]] = ModelField("INCHIShadow", FieldType.STRING)
+    IsGHSClassified: ModelField[Optional[bool]] = ModelField("IsGHSClassified", FieldType.BOOLEAN)
+    IUPAC: ModelField[Optional[str]] = ModelField("IUPAC", FieldType.STRING)
+    MOL: ModelField[Optional[str]] = ModelField("MOL", FieldType.STRING)
+    MolecularWeight: ModelField[Optional[float]] = ModelField("MolecularWeight", FieldType.DOUBLE)
+    PolarSurfaceArea: ModelField[Optional[float]] = ModelField("PolarSurfaceArea", FieldType.DOUBLE)
+    PubchemCid: ModelField[Optional[int]] = ModelField("PubchemCid", FieldType.INTEGER)
+    QuantityOnHand: ModelField[Optional[float]] = ModelField("QuantityOnHand", FieldType.DOUBLE)
+    QuantityPerItem: ModelField[Optional[float]] = ModelField("QuantityPerItem", FieldType.DOUBLE)
+    RegisteredToCartridge: ModelField[Optional[bool]] = ModelField("RegisteredToCartridge", FieldType.BOOLEAN)
+    RegistryId: ModelField[Optional[str]] = ModelField("RegistryId", FieldType.STRING)
+    ReorderLevelQuantity: ModelField[Optional[float]] = ModelField("ReorderLevelQuantity", FieldType.DOUBLE)
+    RequestImageUpdate: ModelField[Optional[bool]] = ModelField("RequestImageUpdate", FieldType.BOOLEAN)
+    SMILES: ModelField[Optional[str]] = ModelField("SMILES", FieldType.STRING)
+    SMILESShadow: ModelField[Optional[str]] = ModelField("SMILESShadow", FieldType.STRING)
+    TotalHBondCount: ModelField[Optional[int]] = ModelField("TotalHBondCount", FieldType.INTEGER)
+    Units: ModelField[Optional[str]] = ModelField("Units", FieldType.PICKLIST)
+    Vendor: ModelField[Optional[str]] = ModelField("Vendor", FieldType.SELECTION)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
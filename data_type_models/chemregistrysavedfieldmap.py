@@ -0,0 +1,27 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class ChemRegistrySavedFieldMapModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type ChemRegistrySavedFieldMap
+    Data Type Display Name: Chem Registry Saved Field Map (Chem Registry Saved Field Maps)
+    Fields: FieldMapDataTypeName, FilePath, Name, VeloxCurrentVersion
+    Saved field maps for people to use in importing CSV and SDF files.
+    """
+    DATA_TYPE_NAME: str = 'ChemRegistrySavedFieldMap'
+    FIELDMAPDATATYPENAME__FIELD_NAME: WrapperField = WrapperField("FieldMapDataTypeName", FieldType.STRING)
+    FILEPATH__FIELD_NAME: WrapperField = WrapperField("FilePath", FieldType.STRING)
+    NAME__FIELD_NAME: WrapperField = WrapperField("Name", FieldType.STRING)
+    VELOXCURRENTVERSION__FIELD_NAME: WrapperField = WrapperField("VeloxCurrentVersion", FieldType.INTEGER)
+
+    FieldMapDataTypeName: ModelField[Optional[str]] = ModelField("FieldMapDataTypeName", FieldType.STRING)
+    FilePath: ModelField[Optional[str]] = ModelField("FilePath", FieldType.STRING)
+    Name: ModelField[Optional[str]] = ModelField("Name", FieldType.STRING)
+    VeloxCurrentVersion: ModelField[Optional[int]] = ModelField("VeloxCurrentVersion", FieldType.INTEGER)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,45 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class ClientConfigurationsModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type ClientConfigurations
+    Data Type Display Name: Client Configurations (Client Configurations)
+    Fields: BillingPortalUrl, ClientConfig1, COMWebServiceAccountName, COMWebServiceApiKey, COMWebServiceGuid, COMWebServiceUrl, ReportingUserPassword, ReportingWebServiceHost, ReportingWebServiceName, ReportingWebServicePort, ReportingWebServiceUserName, SampleSheetPath, SampleSheetPathForPacBio
+    Client specific configurations.
+    """
+    DATA_TYPE_NAME: str = 'ClientConfigurations'
+    BILLINGPORTALURL__FIELD_NAME: WrapperField = WrapperField("BillingPortalUrl", FieldType.STRING)
+    CLIENTCONFIG1__FIELD_NAME: WrapperField = WrapperField("ClientConfig1", FieldType.STRING)
+    COMWEBSERVICEACCOUNTNAME__FIELD_NAME: WrapperField = WrapperField("COMWebServiceAccountName", FieldType.STRING)
+    COMWEBSERVICEAPIKEY__FIELD_NAME: WrapperField = WrapperField("COMWebServiceApiKey", FieldType.STRING)
+    COMWEBSERVICEGUID__FIELD_NAME: WrapperField = WrapperField("COMWebServiceGuid", FieldType.STRING)
+    COMWEBSERVICEURL__FIELD_NAME: WrapperField = WrapperField("COMWebServiceUrl", FieldType.STRING)
+    REPORTINGUSERPASSWORD__FIELD_NAME: WrapperField = WrapperField("ReportingUserPassword", FieldType.STRING)
+    REPORTINGWEBSERVICEHOST__FIELD_NAME: WrapperField = WrapperField("ReportingWebServiceHost", FieldType.STRING)
+    REPORTINGWEBSERVICENAME__FIELD_NAME: WrapperField = WrapperField("ReportingWebServiceName", FieldType.STRING)
+    REPORTINGWEBSERVICEPORT__FIELD_NAME: WrapperField = WrapperField("ReportingWebServicePort", FieldType.INTEGER)
+    REPORTINGWEBSERVICEUSERNAME__FIELD_NAME: WrapperField = WrapperField("ReportingWebServiceUserName", FieldType.STRING)
+    SAMPLESHEETPATH__FIELD_NAME: WrapperField = WrapperField("SampleSheetPath", FieldType.STRING)
+    SAMPLESHEETPATHFORPACBIO__FIELD_NAME: WrapperField = WrapperField("SampleSheetPathForPacBio", FieldType.STRING)
+
+    BillingPortalUrl: ModelField[Optional[str]] = ModelField("BillingPortalUrl", FieldType.STRING)
+    ClientConfig1: ModelField[Optional[str]] = ModelField("ClientConfig1", FieldType.STRING)
+    COMWebServiceAccountName: ModelField[Optional[str]] = ModelField("COMWebServiceAccountName", FieldType.STRING)
+    COMWebServiceApiKey: ModelField[Optional[str]] = ModelField("COMWebServiceApiKey", FieldType.STRING)
+    COMWebServiceGuid: ModelField[Optional[str]] = ModelField("COMWebServiceGuid", FieldType.STRING)
+    COMWebServiceUrl: ModelField[Optional[str]] = ModelField("COMWebServiceUrl", FieldType.STRING)
+    ReportingUserPassword: ModelField[Optional[str]] = ModelField("ReportingUserPassword", FieldType.STRING)
+    ReportingWebServiceHost: ModelField[Optional[str]] = ModelField("ReportingWebServiceHost", FieldType.STRING)
+    ReportingWebServiceName: ModelField[Optional[str]] = ModelField("ReportingWebServiceName", FieldType.STRING)
+    ReportingWebServicePort: ModelField[Optional[int]] = ModelField("ReportingWebServicePort", FieldType.INTEGER)
+    ReportingWebServiceUserName: ModelField[Optional[str]] = ModelField("ReportingWebServiceUserName", FieldType.STRING)
+    SampleSheetPath: ModelField[Optional[str]] = ModelField("SampleSheetPath", FieldType.STRING)
+    SampleSheetPathForPacBio: ModelField[Optional[str]] = ModelField("SampleSheetPathForPacBio", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
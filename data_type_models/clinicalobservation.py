@@ -0,0 +1,26 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class ClinicalObservationModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type ClinicalObservation
+    Data Type Display Name: Clinical Observation (Clinical Observations)
+    Fields: Severity, Site, Status, Symptom
+    """
+    DATA_TYPE_NAME: str = 'ClinicalObservation'
+    SEVERITY__FIELD_NAME: WrapperField = WrapperField("Severity", FieldType.PICKLIST)
+    SITE__FIELD_NAME: WrapperField = WrapperField("Site", FieldType.PICKLIST)
+    STATUS__FIELD_NAME: WrapperField = WrapperField("Status", FieldType.PICKLIST)
+    SYMPTOM__FIELD_NAME: WrapperField = WrapperField("Symptom", FieldType.PICKLIST)
+
+    Severity: ModelField[Optional[str]] = ModelField("Severity", FieldType.PICKLIST)
+    Site: ModelField[Optional[str]] = ModelField("Site", FieldType.PICKLIST)
+    Status: ModelField[Optional[str]] = ModelField("Status", FieldType.PICKLIST)
+    Symptom: ModelField[Optional[str]] = ModelField("Symptom", FieldType.PICKLIST)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,47 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class ClusterDetailModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type ClusterDetail
+    Data Type Display Name: Tile Details (Tile Details)
+    Fields: Aligned, AlignedPM, ClusterDensity, ClusterPassingFilter, ClusterPercentFilter, ColRead, DensityPlusMinus, Lane, LaneCol, PassedClustersInAllTiles, PassingPlusMinus, PFPercentPM, Tiles, TotalClustersInAllTiles
+     <!-- DISPLAY IN INSTRUMENT RUN MONITOR -->
+    """
+    DATA_TYPE_NAME: str = 'ClusterDetail'
+    ALIGNED__FIELD_NAME: WrapperField = WrapperField("Aligned", FieldType.DOUBLE)
+    ALIGNEDPM__FIELD_NAME: WrapperField = WrapperField("AlignedPM", FieldType.DOUBLE)
+    CLUSTERDENSITY__FIELD_NAME: WrapperField = WrapperField("ClusterDensity", FieldType.DOUBLE)
+    CLUSTERPASSINGFILTER__FIELD_NAME: WrapperField = WrapperField("ClusterPassingFilter", FieldType.DOUBLE)
+    CLUSTERPERCENTFILTER__FIELD_NAME: WrapperField = WrapperField("ClusterPercentFilter", FieldType.DOUBLE)
+    COLREAD__FIELD_NAME: WrapperField = WrapperField("ColRead", FieldType.STRING)
+    DENSITYPLUSMINUS__FIELD_NAME: WrapperField = WrapperField("DensityPlusMinus", FieldType.DOUBLE)
+    LANE__FIELD_NAME: WrapperField = WrapperField("Lane", FieldType.LONG)
+    LANECOL__FIELD_NAME: WrapperField = WrapperField("LaneCol", FieldType.STRING)
+    PASSEDCLUSTERSINALLTILES__FIELD_NAME: WrapperField = WrapperField("PassedClustersInAllTiles", FieldType.DOUBLE)
+    PASSINGPLUSMINUS__FIELD_NAME: WrapperField = WrapperField("PassingPlusMinus", FieldType.DOUBLE)
+    PFPERCENTPM__FIELD_NAME: WrapperField = WrapperField("PFPercentPM", FieldType.DOUBLE)
+    TILES__FIELD_NAME: WrapperField = WrapperField("Tiles", FieldType.INTEGER)
+    TOTALCLUSTERSINALLTILES__FIELD_NAME: WrapperField = WrapperField("TotalClustersInAllTiles", FieldType.DOUBLE)
+
+    Aligned: ModelField[Optional[float]] = ModelField("Aligned", FieldType.DOUBLE)
+    AlignedPM: ModelField[Optional[float]] = ModelField("AlignedPM", FieldType.DOUBLE)
+    ClusterDensity: ModelField[Optional[float]] = ModelField("ClusterDensity", FieldType.DOUBLE)
+    ClusterPassingFilter: ModelField[Optional[float]] = ModelField("ClusterPassingFilter", FieldType.DOUBLE)
+    ClusterPercentFilter: ModelField[Optional[float]] = ModelField("ClusterPercentFilter", FieldType.DOUBLE)
+    ColRead: ModelField[Optional[str]] = ModelField("ColRead", FieldType.STRING)
+    DensityPlusMinus: ModelField[Optional[float]] = ModelField("DensityPlusMinus", FieldType.DOUBLE)
+    Lane: ModelField[Optional[int]] = ModelField("Lane", FieldType.LONG)
+    LaneCol: ModelField[Optional[str]] = ModelField("LaneCol", FieldType.STRING)
+    PassedClustersInAllTiles: ModelField[Optional[float]] = ModelField("PassedClustersInAllTiles", FieldType.DOUBLE)
+    PassingPlusMinus: ModelField[Optional[float]] = ModelField("PassingPlusMinus", FieldType.DOUBLE)
+    PFPercentPM: ModelField[Optional[float]] = ModelField("PFPercentPM", FieldType.DOUBLE)
+    Tiles: ModelField[Optional[int]] = ModelField("Tiles", FieldType.INTEGER)
+    TotalClustersInAllTiles: ModelField[Optional[float]] = ModelField("TotalClustersInAllTiles", FieldType.DOUBLE)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,23 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class CompoundSaltConfigModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type CompoundSaltConfig
+    Data Type Display Name: Compound Salt Config (Compound Salt Configs)
+    Fields: SaltId, SaltSMARTS
+    The corporate compound salt database. This will be a list of SMARTS expressions that will be used for desalting when importing a compound part.
+    """
+    DATA_TYPE_NAME: str = 'CompoundSaltConfig'
+    SALTID__FIELD_NAME: WrapperField = WrapperField("SaltId", FieldType.STRING)
+    SALTSMARTS__FIELD_NAME: WrapperField = WrapperField("SaltSMARTS", FieldType.STRING)
+
+    SaltId: ModelField[Optional[str]] = ModelField("SaltId", FieldType.STRING)
+    SaltSMARTS: ModelField[Optional[str]] = ModelField("SaltSMARTS", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,35 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class ComputedAssayResultsModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type ComputedAssayResults
+    Data Type Display Name: Computed Assay Result (Computed Assay Results)
+    Fields: AssayType, AssayUnits, ChemReagentPartLink, CompoundPartLink, Name, NumericValue, SampleSideLink, TextValue
+    Stores the computed assay results from a fixed formula for program that operates on data.
+    """
+    DATA_TYPE_NAME: str = 'ComputedAssayResults'
+    ASSAYTYPE__FIELD_NAME: WrapperField = WrapperField("AssayType", FieldType.STRING)
+    ASSAYUNITS__FIELD_NAME: WrapperField = WrapperField("AssayUnits", FieldType.SELECTION)
+    CHEMREAGENTPARTLINK__FIELD_NAME: WrapperField = WrapperField("ChemReagentPartLink", FieldType.SIDE_LINK)
+    COMPOUNDPARTLINK__FIELD_NAME: WrapperField = WrapperField("CompoundPartLink", FieldType.SIDE_LINK)
+    NAME__FIELD_NAME: WrapperField = WrapperField("Name", FieldType.STRING)
+    NUMERICVALUE__FIELD_NAME: WrapperField = WrapperField("NumericValue", FieldType.DOUBLE)
+    SAMPLESIDELINK__FIELD_NAME: WrapperField = WrapperField("SampleSideLink", FieldType.SIDE_LINK)
+    TEXTVALUE__FIELD_NAME: WrapperField = WrapperField("TextValue", FieldType.STRING)
+
+    AssayType: ModelField[Optional[str]] = ModelField("AssayType", FieldType.STRING)
+    AssayUnits: ModelField[Optional[str]] = ModelField("AssayUnits", FieldType.SELECTION)
+    ChemReagentPartLink: ModelField[Optional[int]] = ModelField("ChemReagentPartLink", FieldType.SIDE_LINK)
+    CompoundPartLink: ModelField[Optional[int]] = ModelField("CompoundPartLink", FieldType.SIDE_LINK)
+    Name: ModelField[Optional[str]] = ModelField("Name", FieldType.STRING)
+    NumericValue: ModelField[Optional[float]] = ModelField("NumericValue", FieldType.DOUBLE)
+    SampleSideLink: ModelField[Optional[int]] = ModelField("SampleSideLink", FieldType.SIDE_LINK)
+    TextValue: ModelField[Optional[str]] = ModelField("TextValue", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,41 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class ConsumableModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type Consumable
+    Data Type Display Name: Reagent Part (Reagent Parts)
+    Fields: ConsumableClassification, ConsumableName, ConsumableType, Description, EditConsumableType, PartNumber, QuantityOnHand, QuantityPerItem, ReorderLevelQuantity, Units, Vendor
+    General definition of a consumable object.
+    """
+    DATA_TYPE_NAME: str = 'Consumable'
+    CONSUMABLECLASSIFICATION__FIELD_NAME: WrapperField = WrapperField("ConsumableClassification", FieldType.SELECTION)
+    CONSUMABLENAME__FIELD_NAME: WrapperField = WrapperField("ConsumableName", FieldType.AUTO_ACCESSION)
+    CONSUMABLETYPE__FIELD_NAME: WrapperField = WrapperField("ConsumableType", FieldType.SELECTION)
+    DESCRIPTION__FIELD_NAME: WrapperField = WrapperField("Description", FieldType.STRING)
+    EDITCONSUMABLETYPE__FIELD_NAME: WrapperField = WrapperField("EditConsumableType", FieldType.BOOLEAN)
+    PARTNUMBER__FIELD_NAME: WrapperField = WrapperField("PartNumber", FieldType.STRING)
+    QUANTITYONHAND__FIELD_NAME: WrapperField = WrapperField("QuantityOnHand", FieldType.DOUBLE)
+    QUANTITYPERITEM__FIELD_NAME: WrapperField = WrapperField("QuantityPerItem", FieldType.DOUBLE)
+    REORDERLEVELQUANTITY__FIELD_NAME: WrapperField = WrapperField("ReorderLevelQuantity", FieldType.DOUBLE)
+    UNITS__FIELD_NAME: WrapperField = WrapperField("Units", FieldType.PICKLIST)
+    VENDOR__FIELD_NAME: WrapperField = WrapperField("Vendor", FieldType.SELECTION)
+
+    ConsumableClassification: ModelField[Optional[str]] = ModelField("ConsumableClassification", FieldType.SELECTION)
+    ConsumableName: ModelField[Optional[str]] = ModelField("ConsumableName", FieldType.AUTO_ACCESSION)
+    ConsumableType: ModelField[Optional[str]] = ModelField("ConsumableType", FieldType.SELECTION)
+    Description: ModelField[Optional[str]] = ModelField("Description", FieldType.STRING)
+    EditConsumableType: ModelField[Optional[bool]] = ModelField("EditConsumableType", FieldType.BOOLEAN)
+    PartNumber: ModelField[Optional[str]] = ModelField("PartNumber", FieldType.STRING)
+    QuantityOnHand: ModelField[Optional[float]] = ModelField("QuantityOnHand", FieldType.DOUBLE)
+    QuantityPerItem: ModelField[Optional[float]] = ModelField("QuantityPerItem", FieldType.DOUBLE)
+    ReorderLevelQuantity: ModelField[Optional[float]] = ModelField("ReorderLevelQuantity", FieldType.DOUBLE)
+    Units: ModelField[Optional[str]] = ModelField("Units", FieldType.PICKLIST)
+    Vendor: ModelField[Optional[str]] = ModelField("Vendor", FieldType.SELECTION)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
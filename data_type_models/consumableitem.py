@@ -0,0 +1,51 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class ConsumableItemModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type ConsumableItem
+    Data Type Display Name: Reagent (Reagents)
+    Fields: ColPosition, ConsumableName, ConsumableType, ExpirationDate, Expired, KitLotNumbers, LotNumber, LotNumberDefined, PartNumber, RowPosition, StorageLocationBarcode, StorageUnitPath, Validated, ValidationDate, ValidationExperimentId, ValidationTechician
+    Detailed representation of a more specific consumable object.
+    """
+    DATA_TYPE_NAME: str = 'ConsumableItem'
+    COLPOSITION__FIELD_NAME: WrapperField = WrapperField("ColPosition", FieldType.SELECTION)
+    CONSUMABLENAME__FIELD_NAME: WrapperField = WrapperField("ConsumableName", FieldType.STRING)
+    CONSUMABLETYPE__FIELD_NAME: WrapperField = WrapperField("ConsumableType", FieldType.SELECTION)
+    EXPIRATIONDATE__FIELD_NAME: WrapperField = WrapperField("ExpirationDate", FieldType.DATE)
+    EXPIRED__FIELD_NAME: WrapperField = WrapperField("Expired", FieldType.BOOLEAN)
+    KITLOTNUMBERS__FIELD_NAME: WrapperField = WrapperField("KitLotNumbers", FieldType.STRING)
+    LOTNUMBER__FIELD_NAME: WrapperField = WrapperField("LotNumber", FieldType.STRING)
+    LOTNUMBERDEFINED__FIELD_NAME: WrapperField = WrapperField("LotNumberDefined", FieldType.BOOLEAN)
+    PARTNUMBER__FIELD_NAME: WrapperField = WrapperField("PartNumber", FieldType.STRING)
+    ROWPOSITION__FIELD_NAME: WrapperField = WrapperField("RowPosition", FieldType.SELECTION)
+    STORAGELOCATIONBARCODE__FIELD_NAME: WrapperField = WrapperField("StorageLocationBarcode", FieldType.SELECTION)
+    STORAGEUNITPATH__FIELD_NAME: WrapperField = WrapperField("StorageUnitPath", FieldType.STRING)
+    VALIDATED__FIELD_NAME: WrapperField = WrapperField("Validated", FieldType.BOOLEAN)
+    VALIDATIONDATE__FIELD_NAME: WrapperField = WrapperField("ValidationDate", FieldType.DATE)
+    VALIDATIONEXPERIMENTID__FIELD_NAME: WrapperField = WrapperField("ValidationExperimentId", FieldType.STRING)
+    VALIDATIONTECHICIAN__FIELD_NAME: WrapperField = WrapperField("ValidationTechician", FieldType.SELECTION)
+
+    ColPosition: ModelField[Optional[str]] = ModelField("ColPosition", FieldType.SELECTION)
+    ConsumableName: ModelField[Optional[str]] = ModelField("ConsumableName", FieldType.STRING)
+    ConsumableType: ModelField[Optional[str]] = ModelField("ConsumableType", FieldType.SELECTION)
+    ExpirationDate: ModelField[Optional[int]] = ModelField("ExpirationDate", FieldType.DATE)
+    Expired: ModelField[Optional[bool]] = ModelField("Expired", FieldType.BOOLEAN)
+    KitLotNumbers: ModelField[Optional[str]] = ModelField("KitLotNumbers", FieldType.STRING)
+    LotNumber: ModelField[Optional[str]] = ModelField("LotNumber", FieldType.STRING)
+    LotNumberDefined: ModelField[Optional[bool]] = ModelField("LotNumberDefined", FieldType.BOOLEAN)
+    PartNumber: ModelField[Optional[str]] = ModelField("PartNumber", FieldType.STRING)
+    RowPosition: ModelField[Optional[str]] = ModelField("RowPosition", FieldType.SELECTION)
+    StorageLocationBarcode: ModelField[Optional[str]] = ModelField("StorageLocationBarcode", FieldType.SELECTION)
+    StorageUnitPath: ModelField[Optional[str]] = ModelField("StorageUnitPath", FieldType.STRING)
+    Validated: ModelField[Optional[bool]] = ModelField("Validated", FieldType.BOOLEAN)
+    ValidationDate: ModelField[Optional[int]] = ModelField("ValidationDate", FieldType.DATE)
+    ValidationExperimentId: ModelField[Optional[str]] = ModelField("ValidationExperimentId", FieldType.STRING)
+    ValidationTechician: ModelField[Optional[str]] = ModelField("ValidationTechician", FieldType.SELECTION)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,37 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class ConsumableLotUsageModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type ConsumableLotUsage
+    Data Type Display Name: Consumable Lot Usage (Consumable Lot Usages)
+    Fields: ActiveTaskId, BarcodeFieldName, ConsumableBarcode, ElnId, ExpRecordId, LotNumber, LotNumberFieldName, LotRecordId, QuantityUsed
+    Data type used in workflows to allow memory of what is used.
+    """
+    DATA_TYPE_NAME: str = 'ConsumableLotUsage'
+    ACTIVETASKID__FIELD_NAME: WrapperField = WrapperField("ActiveTaskId", FieldType.LONG)
+    BARCODEFIELDNAME__FIELD_NAME: WrapperField = WrapperField("BarcodeFieldName", FieldType.STRING)
+    CONSUMABLEBARCODE__FIELD_NAME: WrapperField = WrapperField("ConsumableBarcode", FieldType.STRING)
+    ELNID__FIELD_NAME: WrapperField = WrapperField("ElnId", FieldType.STRING)
+    EXPRECORDID__FIELD_NAME: WrapperField = WrapperField("ExpRecordId", FieldType.LONG)
+    LOTNUMBER__FIELD_NAME: WrapperField = WrapperField("LotNumber", FieldType.STRING)
+    LOTNUMBERFIELDNAME__FIELD_NAME: WrapperField = WrapperField("LotNumberFieldName", FieldType.STRING)
+    LOTRECORDID__FIELD_NAME: WrapperField = WrapperField("LotRecordId", FieldType.LONG)
+    QUANTITYUSED__FIELD_NAME: WrapperField = WrapperField("QuantityUsed", FieldType.DOUBLE)
+
+    ActiveTaskId: ModelField[Optional[int]] = ModelField("ActiveTaskId", FieldType.LONG)
+    BarcodeFieldName: ModelField[Optional[str]] = ModelField("BarcodeFieldName", FieldType.STRING)
+    ConsumableBarcode: ModelField[Optional[str]] = ModelField("ConsumableBarcode", FieldType.STRING)
+    ElnId: ModelField[Optional[str]] = ModelField("ElnId", FieldType.STRING)
+    ExpRecordId: ModelField[Optional[int]] = ModelField("ExpRecordId", FieldType.LONG)
+    LotNumber: ModelField[Optional[str]] = ModelField("LotNumber", FieldType.STRING)
+    LotNumberFieldName: ModelField[Optional[str]] = ModelField("LotNumberFieldName", FieldType.STRING)
+    LotRecordId: ModelField[Optional[int]] = ModelField("LotRecordId", FieldType.LONG)
+    QuantityUsed: ModelField[Optional[float]] = ModelField("QuantityUsed", FieldType.DOUBLE)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,20 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class DirectoryModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type Directory
+    Data Type Display Name: Directory (Directories)
+    Fields: DirectoryName
+    """
+    DATA_TYPE_NAME: str = 'Directory'
+    DIRECTORYNAME__FIELD_NAME: WrapperField = WrapperField("DirectoryName", FieldType.STRING)
+
+    DirectoryName: ModelField[Optional[str]] = ModelField("DirectoryName", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,46 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class DosingResultModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type DosingResult
+    Data Type Display Name: Dosing Result (Dosing Results)
+    Fields: ActualDose, AgentName, BaseDosage, DateCompleted, DoseComments, DoseResult, DoseType, DoseUnit, ExpectedDose, Formulation, RouteOfAdministration, SkipTaskReason, TreatmentId, TreatmentRecordId
+    """
+    DATA_TYPE_NAME: str = 'DosingResult'
+    ACTUALDOSE__FIELD_NAME: WrapperField = WrapperField("ActualDose", FieldType.DOUBLE)
+    AGENTNAME__FIELD_NAME: WrapperField = WrapperField("AgentName", FieldType.SELECTION)
+    BASEDOSAGE__FIELD_NAME: WrapperField = WrapperField("BaseDosage", FieldType.DOUBLE)
+    DATECOMPLETED__FIELD_NAME: WrapperField = WrapperField("DateCompleted", FieldType.DATE)
+    DOSECOMMENTS__FIELD_NAME: WrapperField = WrapperField("DoseComments", FieldType.STRING)
+    DOSERESULT__FIELD_NAME: WrapperField = WrapperField("DoseResult", FieldType.PICKLIST)
+    DOSETYPE__FIELD_NAME: WrapperField = WrapperField("DoseType", FieldType.PICKLIST)
+    DOSEUNIT__FIELD_NAME: WrapperField = WrapperField("DoseUnit", FieldType.SELECTION)
+    EXPECTEDDOSE__FIELD_NAME: WrapperField = WrapperField("ExpectedDose", FieldType.DOUBLE)
+    FORMULATION__FIELD_NAME: WrapperField = WrapperField("Formulation", FieldType.SELECTION)
+    ROUTEOFADMINISTRATION__FIELD_NAME: WrapperField = WrapperField("RouteOfAdministration", FieldType.SELECTION)
+    SKIPTASKREASON__FIELD_NAME: WrapperField = WrapperField("SkipTaskReason", FieldType.STRING)
+    TREATMENTID__FIELD_NAME: WrapperField = WrapperField("TreatmentId", FieldType.STRING)
+    TREATMENTRECORDID__FIELD_NAME: WrapperField = WrapperField("TreatmentRecordId", FieldType.SIDE_LINK)
+
+    ActualDose: ModelField[Optional[float]] = ModelField("ActualDose", FieldType.DOUBLE)
+    AgentName: ModelField[Optional[str]] = ModelField("AgentName", FieldType.SELECTION)
+    BaseDosage: ModelField[Optional[float]] = ModelField("BaseDosage", FieldType.DOUBLE)
+    DateCompleted: ModelField[Optional[int]] = ModelField("DateCompleted", FieldType.DATE)
+    DoseComments: ModelField[Optional[str]] = ModelField("DoseComments", FieldType.STRING)
+    DoseResult: ModelField[Optional[str]] = ModelField("DoseResult", FieldType.PICKLIST)
+    DoseType: ModelField[Optional[str]] = ModelField("DoseType", FieldType.PICKLIST)
+    DoseUnit: ModelField[Optional[str]] = ModelField("DoseUnit", FieldType.SELECTION)
+    ExpectedDose: ModelField[Optional[float]] = ModelField("ExpectedDose", FieldType.DOUBLE)
+    Formulation: ModelField[Optional[str]] = ModelField("Formulation", FieldType.SELECTION)
+    RouteOfAdministration: ModelField[Optional[str]] = ModelField("RouteOfAdministration", FieldType.SELECTION)
+    SkipTaskReason: ModelField[Optional[str]] = ModelField("SkipTaskReason", FieldType.STRING)
+    TreatmentId: ModelField[Optional[str]] = ModelField("TreatmentId", FieldType.STRING)
+    TreatmentRecordId: ModelField[Optional[int]] = ModelField("TreatmentRecordId", FieldType.SIDE_LINK)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
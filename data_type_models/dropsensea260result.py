@@ -0,0 +1,24 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class DropSenseA260ResultModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type DropSenseA260Result
+    Data Type Display Name: DropSense A260 Result (DropSense A260 Results)
+    Fields: A260230, A260280, DilutionFactor
+    """
+    DATA_TYPE_NAME: str = 'DropSenseA260Result'
+    A260230__FIELD_NAME: WrapperField = WrapperField("A260230", FieldType.DOUBLE)
+    A260280__FIELD_NAME: WrapperField = WrapperField("A260280", FieldType.DOUBLE)
+    DILUTIONFACTOR__FIELD_NAME: WrapperField = WrapperField("DilutionFactor", FieldType.DOUBLE)
+
+    A260230: ModelField[Optional[float]] = ModelField("A260230", FieldType.DOUBLE)
+    A260280: ModelField[Optional[float]] = ModelField("A260280", FieldType.DOUBLE)
+    DilutionFactor: ModelField[Optional[float]] = ModelField("DilutionFactor", FieldType.DOUBLE)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,20 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class DropSenseA280ResultModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type DropSenseA280Result
+    Data Type Display Name: DropSense A280 Result (DropSense A280 Results)
+    Fields: ExtinctionCoefficient
+    """
+    DATA_TYPE_NAME: str = 'DropSenseA280Result'
+    EXTINCTIONCOEFFICIENT__FIELD_NAME: WrapperField = WrapperField("ExtinctionCoefficient", FieldType.DOUBLE)
+
+    ExtinctionCoefficient: ModelField[Optional[float]] = ModelField("ExtinctionCoefficient", FieldType.DOUBLE)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
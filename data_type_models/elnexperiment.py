@@ -0,0 +1,33 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class ELNExperimentModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type ELNExperiment
+    Data Type Display Name: Experiment (Experiments)
+    Fields: DataTypeId, TemplateExperimentName, TemplateVersion, VeloxCompletedBy, VeloxDateCompleted, VeloxExperimentStatus, VELOXOWNER
+    Data type to represent the base E-Notebook data type.
+    """
+    DATA_TYPE_NAME: str = 'ELNExperiment'
+    DATATYPEID__FIELD_NAME: WrapperField = WrapperField("DataTypeId", FieldType.LONG)
+    TEMPLATEEXPERIMENTNAME__FIELD_NAME: WrapperField = WrapperField("TemplateExperimentName", FieldType.STRING)
+    TEMPLATEVERSION__FIELD_NAME: WrapperField = WrapperField("TemplateVersion", FieldType.LONG)
+    VELOXCOMPLETEDBY__FIELD_NAME: WrapperField = WrapperField("VeloxCompletedBy", FieldType.STRING)
+    VELOXDATECOMPLETED__FIELD_NAME: WrapperField = WrapperField("VeloxDateCompleted", FieldType.DATE)
+    VELOXEXPERIMENTSTATUS__FIELD_NAME: WrapperField = WrapperField("VeloxExperimentStatus", FieldType.STRING)
+    VELOXOWNER__FIELD_NAME: WrapperField = WrapperField("VELOXOWNER", FieldType.STRING)
+
+    DataTypeId: ModelField[Optional[int]] = ModelField("DataTypeId", FieldType.LONG)
+    TemplateExperimentName: ModelField[Optional[str]] = ModelField("TemplateExperimentName", FieldType.STRING)
+    TemplateVersion: ModelField[Optional[int]] = ModelField("TemplateVersion", FieldType.LONG)
+    VeloxCompletedBy: ModelField[Optional[str]] = ModelField("VeloxCompletedBy", FieldType.STRING)
+    VeloxDateCompleted: ModelField[Optional[int]] = ModelField("VeloxDateCompleted", FieldType.DATE)
+    VeloxExperimentStatus: ModelField[Optional[str]] = ModelField("VeloxExperimentStatus", FieldType.STRING)
+    VELOXOWNER: ModelField[Optional[str]] = ModelField("VELOXOWNER", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,21 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class ELNExperimentDetailModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type ELNExperimentDetail
+    Data Type Display Name: Experiment Detail (Experiment Details)
+    Fields: DataTypeId
+    Data type to represent the base E-Notebook data type to represent the experiment details.
+    """
+    DATA_TYPE_NAME: str = 'ELNExperimentDetail'
+    DATATYPEID__FIELD_NAME: WrapperField = WrapperField("DataTypeId", FieldType.LONG)
+
+    DataTypeId: ModelField[Optional[int]] = ModelField("DataTypeId", FieldType.LONG)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,25 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class ELNSampleDetailModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type ELNSampleDetail
+    Data Type Display Name: Sample Detail (Sample Details)
+    Fields: DataTypeId, OtherSampleId, SampleId
+    Data type to represent the base E-Notebook data type to represent the sample level details.
+    """
+    DATA_TYPE_NAME: str = 'ELNSampleDetail'
+    DATATYPEID__FIELD_NAME: WrapperField = WrapperField("DataTypeId", FieldType.LONG)
+    OTHERSAMPLEID__FIELD_NAME: WrapperField = WrapperField("OtherSampleId", FieldType.STRING)
+    SAMPLEID__FIELD_NAME: WrapperField = WrapperField("SampleId", FieldType.STRING)
+
+    DataTypeId: ModelField[Optional[int]] = ModelField("DataTypeId", FieldType.LONG)
+    OtherSampleId: ModelField[Optional[str]] = ModelField("OtherSampleId", FieldType.STRING)
+    SampleId: ModelField[Optional[str]] = ModelField("SampleId", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,25 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class ELNTextEntryDetailModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type ELNTextEntryDetail
+    Data Type Display Name: ELN Text Entry Detail (ELN Text Entry Details)
+    Fields: FilePath, TextField, VeloxCurrentVersion
+    This data type is used to store the latest PDF file that has been generated from a given notebook.
+    """
+    DATA_TYPE_NAME: str = 'ELNTextEntryDetail'
+    FILEPATH__FIELD_NAME: WrapperField = WrapperField("FilePath", FieldType.STRING)
+    TEXTFIELD__FIELD_NAME: WrapperField = WrapperField("TextField", FieldType.STRING)
+    VELOXCURRENTVERSION__FIELD_NAME: WrapperField = WrapperField("VeloxCurrentVersion", FieldType.INTEGER)
+
+    FilePath: ModelField[Optional[str]] = ModelField("FilePath", FieldType.STRING)
+    TextField: ModelField[Optional[str]] = ModelField("TextField", FieldType.STRING)
+    VeloxCurrentVersion: ModelField[Optional[int]] = ModelField("VeloxCurrentVersion", FieldType.INTEGER)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,31 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class EmailModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type Email
+    Data Type Display Name: Email (Emails)
+    Fields: AddressedTo, Body, CarbonCopy, MultiParentLink118, SentDate, SentFrom, Subject
+    """
+    DATA_TYPE_NAME: str = 'Email'
+    ADDRESSEDTO__FIELD_NAME: WrapperField = WrapperField("AddressedTo", FieldType.STRING)
+    BODY__FIELD_NAME: WrapperField = WrapperField("Body", FieldType.STRING)
+    CARBONCOPY__FIELD_NAME: WrapperField = WrapperField("CarbonCopy", FieldType.STRING)
+    MULTIPARENTLINK118__FIELD_NAME: WrapperField = WrapperField("MultiParentLink118", FieldType.MULTIPARENTLINK)
+    SENTDATE__FIELD_NAME: WrapperField = WrapperField("SentDate", FieldType.DATE)
+    SENTFROM__FIELD_NAME: WrapperField = WrapperField("SentFrom", FieldType.STRING)
+    SUBJECT__FIELD_NAME: WrapperField = WrapperField("Subject", FieldType.STRING)
+
+    AddressedTo: ModelField[Optional[str]] = ModelField("AddressedTo", FieldType.STRING)
+    Body: ModelField[Optional[str]] = ModelField("Body", FieldType.STRING)
+    CarbonCopy: ModelField[Optional[str]] = ModelField("CarbonCopy", FieldType.STRING)
+    SentDate: ModelField[Optional[int]] = ModelField("SentDate", FieldType.DATE)
+    SentFrom: ModelField[Optional[str]] = ModelField("SentFrom", FieldType.STRING)
+    Subject: ModelField[Optional[str]] = ModelField("Subject", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
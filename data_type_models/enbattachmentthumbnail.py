@@ -0,0 +1,31 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class EnbAttachmentThumbnailModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type EnbAttachmentThumbnail
+    Data Type Display Name: E-Notebook Attachment Thumbnail (E-Notebook Attachment Thumbnails)
+    Fields: FilePath, PageNumber, ResolutionHeight, ResolutionWidth, SinglePage, VeloxCurrentVersion
+    An attachment that stores a cached thumbnail of a page from a document attached to an Experiment entry.
+    """
+    DATA_TYPE_NAME: str = 'EnbAttachmentThumbnail'
+    FILEPATH__FIELD_NAME: WrapperField = WrapperField("FilePath", FieldType.STRING)
+    PAGENUMBER__FIELD_NAME: WrapperField = WrapperField("PageNumber", FieldType.INTEGER)
+    RESOLUTIONHEIGHT__FIELD_NAME: WrapperField = WrapperField("ResolutionHeight", FieldType.INTEGER)
+    RESOLUTIONWIDTH__FIELD_NAME: WrapperField = WrapperField("ResolutionWidth", FieldType.INTEGER)
+    SINGLEPAGE__FIELD_NAME: WrapperField = WrapperField("SinglePage", FieldType.BOOLEAN)
+    VELOXCURRENTVERSION__FIELD_NAME: WrapperField = WrapperField("VeloxCurrentVersion", FieldType.INTEGER)
+
+    FilePath: ModelField[Optional[str]] = ModelField("FilePath", FieldType.STRING)
+    PageNumber: ModelField[Optional[int]] = ModelField("PageNumber", FieldType.INTEGER)
+    ResolutionHeight: ModelField[Optional[int]] = ModelField("ResolutionHeight", FieldType.INTEGER)
+    ResolutionWidth: ModelField[Optional[int]] = ModelField("ResolutionWidth", FieldType.INTEGER)
+    SinglePage: ModelField[Optional[bool]] = ModelField("SinglePage", FieldType.BOOLEAN)
+    VeloxCurrentVersion: ModelField[Optional[int]] = ModelField("VeloxCurrentVersion", FieldType.INTEGER)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,29 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class ErrorMetricModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type ErrorMetric
+    Data Type Display Name: Error Metric (Error Metrics)
+    Fields: ColRead, ErrorRate, Lane, LaneCol, PlusMinus
+     <!-- DISPLAY IN INSTRUMENT RUN MONITOR -->
+    """
+    DATA_TYPE_NAME: str = 'ErrorMetric'
+    COLREAD__FIELD_NAME: WrapperField = WrapperField("ColRead", FieldType.STRING)
+    ERRORRATE__FIELD_NAME: WrapperField = WrapperField("ErrorRate", FieldType.DOUBLE)
+    LANE__FIELD_NAME: WrapperField = WrapperField("Lane", FieldType.LONG)
+    LANECOL__FIELD_NAME: WrapperField = WrapperField("LaneCol", FieldType.STRING)
+    PLUSMINUS__FIELD_NAME: WrapperField = WrapperField("PlusMinus", FieldType.DOUBLE)
+
+    ColRead: ModelField[Optional[str]] = ModelField("ColRead", FieldType.STRING)
+    ErrorRate: ModelField[Optional[float]] = ModelField("ErrorRate", FieldType.DOUBLE)
+    Lane: ModelField[Optional[int]] = ModelField("Lane", FieldType.LONG)
+    LaneCol: ModelField[Optional[str]] = ModelField("LaneCol", FieldType.STRING)
+    PlusMinus: ModelField[Optional[float]] = ModelField("PlusMinus", FieldType.DOUBLE)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,36 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class EventModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type Event
+    Data Type Display Name: Event (Event)
+    Fields: Comments, EndDateTime, EventDescription, EventName, EventStatus, ReminderDateTime, ReminderSent, StartDateTime, UserName
+    """
+    DATA_TYPE_NAME: str = 'Event'
+    COMMENTS__FIELD_NAME: WrapperField = WrapperField("Comments", FieldType.STRING)
+    ENDDATETIME__FIELD_NAME: WrapperField = WrapperField("EndDateTime", FieldType.DATE)
+    EVENTDESCRIPTION__FIELD_NAME: WrapperField = WrapperField("EventDescription", FieldType.STRING)
+    EVENTNAME__FIELD_NAME: WrapperField = WrapperField("EventName", FieldType.STRING)
+    EVENTSTATUS__FIELD_NAME: WrapperField = WrapperField("EventStatus", FieldType.PICKLIST)
+    REMINDERDATETIME__FIELD_NAME: WrapperField = WrapperField("ReminderDateTime", FieldType.DATE)
+    REMINDERSENT__FIELD_NAME: WrapperField = WrapperField("ReminderSent", FieldType.BOOLEAN)
+    STARTDATETIME__FIELD_NAME: WrapperField = WrapperField("StartDateTime", FieldType.DATE)
+    USERNAME__FIELD_NAME: WrapperField = WrapperField("UserName", FieldType.SELECTION)
+
+    Comments: ModelField[Optional[str]] = ModelField("Comments", FieldType.STRING)
+    EndDateTime: ModelField[Optional[int]] = ModelField("EndDateTime", FieldType.DATE)
+    EventDescription: ModelField[Optional[str]] = ModelField("EventDescription", FieldType.STRING)
+    EventName: ModelField[Optional[str]] = ModelField("EventName", FieldType.STRING)
+    EventStatus: ModelField[Optional[str]] = ModelField("EventStatus", FieldType.PICKLIST)
+    ReminderDateTime: ModelField[Optional[int]] = ModelField("ReminderDateTime", FieldType.DATE)
+    ReminderSent: ModelField[Optional[bool]] = ModelField("ReminderSent", FieldType.BOOLEAN)
+    StartDateTime: ModelField[Optional[int]] = ModelField("StartDateTime", FieldType.DATE)
+    UserName: ModelField[Optional[str]] = ModelField("UserName", FieldType.SELECTION)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
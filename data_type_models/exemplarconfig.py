@@ -0,0 +1,237 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class ExemplarConfigModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type ExemplarConfig
+    Data Type Display Name: Sapio Configurations (Sapio Configurations)
+    Fields: ActiveNotebooksInWorkQueue, AddAllUserAsCandidate, AddAllUserAsCandidateHelp, AddConsumablesToExperiments, AdditionalInstMaintEmails, AdditionalNotificationEmails, AdditionalQCMailingList, AdHocExperimentsInheritAccess, AlwaysLaunchInstMaintWorkflow, ApproverVisibleRoleType, AssignToProcessUserGroupList, AuthenticationRequired, BAMaxRegions, BAParseSelection, BARegions, BroadcastMaintAlert, BroadcastMaintUsers, CanModifyExistingVSMTPItems, ConfigureInstrumentFileField, ConsumableDataTypes, ConsumableDirectories, ConsumableTrackingAttribute, ConsumableTypeMaxTemp, CoolingStorageUnitTypes, CreateInWorkflow, DefaultELNExperimentGroupRoles, DefaultELNExperimentRoles, DefaultELNExperimentRolesHelp, DefineConsumableDataTypes, DefineConsumableDirectories, Delimiter, ELNCreateSmplExtentionMultiSel, ELNImportSamplesOverride, Email, EnableAutoLotPopulation, EnableBaselineReqCreation, EnableBaselineSampleRec, EnableDND, EnableElnRoleCandidates, EnableMultiTenantDashboards, EnforceConsumableDirectory, EnforceExpiration, EnforceSufficientQuantity, ENotebookSignoffGroups, ENotebookSignoffGroupsHelp, EnumerateStorage, EsignEmailOwnerNotebookUnlock, EsignSendEmailOnDecision, EsignSendEmailOnEntryUnlock, EsignSendEmailOnNotebookUnlock, EsigRequireAllAuthor, EsigRequireAllAuthorHelp, ExperimentBannerExpFields, ExperimentBannerParentFields, ExportExemplarConfigButton, ExportFullConfigButton, ExportSelectedConfigButton, ExportStaticConfigurations, FARegions, GenerateItemBarcode, ImportBackupConfigButton, ImportBaseLineDescription, ImportExemplarConfigButton, ImportExportExemplarConfigText, ImportExportSystemConfigsText, ImportSystemConfigButton, MainDataTypeSelectionList, MatManEnableFeatureExt, MmSampleFieldsToDisplay, MultiLayerPlatePoolIfSameType, NewConsumableDirName, NotificationUsers, NotifyMaintTechnicians, OverrideGroups, PlasmidDataType, PlateDesignerPrimaryTypes, PlateScanToMatch, Port, PreNotificationInterval, PrintConsumableBarcode, QCMailingList, QuantityTracking, ReagentLotScanToMatch, RecordReportAccessGroups, RecordReportDataTypeList, RecordStorageEvents, ReqPortalManifestFieldNames, RequireESignature, RestrictAccessByLocation, ReviewerVisibleRoleType, S3AccessKeyId, S3SecretAcessKey, SaasMaxNumOfSamplesPerTrans, SaasMaxSamples, SaasMode, SampleReceivingEmails, SampleReceivingUserMenu, SampleScanToMatch, SampleSheetPath, SampleTypeMaximumTemperature, SDMSRootPath, SecureSocketLayer, SendTestMail, SMTPServer, SmtpUsername, StorageUnitViewerFillByConfig, SystemPassword, TemperatureEnforcement, TLSEnabled, TLSRequired, UseRequestDefaultLayout, VerificationTypes, ViiPlateSize, WitnessVisibleRoleType, WriteQCInputFileToUser
+    """
+    DATA_TYPE_NAME: str = 'ExemplarConfig'
+    ACTIVENOTEBOOKSINWORKQUEUE__FIELD_NAME: WrapperField = WrapperField("ActiveNotebooksInWorkQueue", FieldType.BOOLEAN)
+    ADDALLUSERASCANDIDATE__FIELD_NAME: WrapperField = WrapperField("AddAllUserAsCandidate", FieldType.BOOLEAN)
+    ADDALLUSERASCANDIDATEHELP__FIELD_NAME: WrapperField = WrapperField("AddAllUserAsCandidateHelp", FieldType.STRING)
+    ADDCONSUMABLESTOEXPERIMENTS__FIELD_NAME: WrapperField = WrapperField("AddConsumablesToExperiments", FieldType.BOOLEAN)
+    ADDITIONALINSTMAINTEMAILS__FIELD_NAME: WrapperField = WrapperField("AdditionalInstMaintEmails", FieldType.STRING)
+    ADDITIONALNOTIFICATIONEMAILS__FIELD_NAME: WrapperField = WrapperField("AdditionalNotificationEmails", FieldType.STRING)
+    ADDITIONALQCMAILINGLIST__FIELD_NAME: WrapperField = WrapperField("AdditionalQCMailingList", FieldType.STRING)
+    ADHOCEXPERIMENTSINHERITACCESS__FIELD_NAME: WrapperField = WrapperField("AdHocExperimentsInheritAccess", FieldType.BOOLEAN)
+    ALWAYSLAUNCHINSTMAINTWORKFLOW__FIELD_NAME: WrapperField = WrapperField("AlwaysLaunchInstMaintWorkflow", FieldType.BOOLEAN)
+    APPROVERVISIBLEROLETYPE__FIELD_NAME: WrapperField = WrapperField("ApproverVisibleRoleType", FieldType.BOOLEAN)
+    ASSIGNTOPROCESSUSERGROUPLIST__FIELD_NAME: WrapperField = WrapperField("AssignToProcessUserGroupList", FieldType.SELECTION)
+    AUTHENTICATIONREQUIRED__FIELD_NAME: WrapperField = WrapperField("AuthenticationRequired", FieldType.BOOLEAN)
+    BAMAXREGIONS__FIELD_NAME: WrapperField = WrapperField("BAMaxRegions", FieldType.SHORT)
+    BAPARSESELECTION__FIELD_NAME: WrapperField = WrapperField("BAParseSelection", FieldType.PICKLIST)
+    BAREGIONS__FIELD_NAME: WrapperField = WrapperField("BARegions", FieldType.SHORT)
+    BROADCASTMAINTALERT__FIELD_NAME: WrapperField = WrapperField("BroadcastMaintAlert", FieldType.BOOLEAN)
+    BROADCASTMAINTUSERS__FIELD_NAME: WrapperField = WrapperField("BroadcastMaintUsers", FieldType.SELECTION)
+    CANMODIFYEXISTINGVSMTPITEMS__FIELD_NAME: WrapperField = WrapperField("CanModifyExistingVSMTPItems", FieldType.BOOLEAN)
+    CONFIGUREINSTRUMENTFILEFIELD__FIELD_NAME: WrapperField = WrapperField("ConfigureInstrumentFileField", FieldType.ACTION)
+    CONSUMABLEDATATYPES__FIELD_NAME: WrapperField = WrapperField("ConsumableDataTypes", FieldType.STRING)
+    CONSUMABLEDIRECTORIES__FIELD_NAME: WrapperField = WrapperField("ConsumableDirectories", FieldType.STRING)
+    CONSUMABLETRACKINGATTRIBUTE__FIELD_NAME: WrapperField = WrapperField("ConsumableTrackingAttribute", FieldType.PICKLIST)
+    CONSUMABLETYPEMAXTEMP__FIELD_NAME: WrapperField = WrapperField("ConsumableTypeMaxTemp", FieldType.STRING)
+    COOLINGSTORAGEUNITTYPES__FIELD_NAME: WrapperField = WrapperField("CoolingStorageUnitTypes", FieldType.SELECTION)
+    CREATEINWORKFLOW__FIELD_NAME: WrapperField = WrapperField("CreateInWorkflow", FieldType.BOOLEAN)
+    DEFAULTELNEXPERIMENTGROUPROLES__FIELD_NAME: WrapperField = WrapperField("DefaultELNExperimentGroupRoles", FieldType.SELECTION)
+    DEFAULTELNEXPERIMENTROLES__FIELD_NAME: WrapperField = WrapperField("DefaultELNExperimentRoles", FieldType.SELECTION)
+    DEFAULTELNEXPERIMENTROLESHELP__FIELD_NAME: WrapperField = WrapperField("DefaultELNExperimentRolesHelp", FieldType.STRING)
+    DEFINECONSUMABLEDATATYPES__FIELD_NAME: WrapperField = WrapperField("DefineConsumableDataTypes", FieldType.ACTION)
+    DEFINECONSUMABLEDIRECTORIES__FIELD_NAME: WrapperField = WrapperField("DefineConsumableDirectories", FieldType.ACTION)
+    DELIMITER__FIELD_NAME: WrapperField = WrapperField("Delimiter", FieldType.STRING)
+    ELNCREATESMPLEXTENTIONMULTISEL__FIELD_NAME: WrapperField = WrapperField("ELNCreateSmplExtentionMultiSel", FieldType.BOOLEAN)
+    ELNIMPORTSAMPLESOVERRIDE__FIELD_NAME: WrapperField = WrapperField("ELNImportSamplesOverride", FieldType.STRING)
+    EMAIL__FIELD_NAME: WrapperField = WrapperField("Email", FieldType.STRING)
+    ENABLEAUTOLOTPOPULATION__FIELD_NAME: WrapperField = WrapperField("EnableAutoLotPopulation", FieldType.BOOLEAN)
+    ENABLEBASELINEREQCREATION__FIELD_NAME: WrapperField = WrapperField("EnableBaselineReqCreation", FieldType.BOOLEAN)
+    ENABLEBASELINESAMPLEREC__FIELD_NAME: WrapperField = WrapperField("EnableBaselineSampleRec", FieldType.BOOLEAN)
+    ENABLEDND__FIELD_NAME: WrapperField = WrapperField("EnableDND", FieldType.BOOLEAN)
+    ENABLEELNROLECANDIDATES__FIELD_NAME: WrapperField = WrapperField("EnableElnRoleCandidates", FieldType.BOOLEAN)
+    ENABLEMULTITENANTDASHBOARDS__FIELD_NAME: WrapperField = WrapperField("EnableMultiTenantDashboards", FieldType.BOOLEAN)
+    ENFORCECONSUMABLEDIRECTORY__FIELD_NAME: WrapperField = WrapperField("EnforceConsumableDirectory", FieldType.BOOLEAN)
+    ENFORCEEXPIRATION__FIELD_NAME: WrapperField = WrapperField("EnforceExpiration", FieldType.BOOLEAN)
+    ENFORCESUFFICIENTQUANTITY__FIELD_NAME: WrapperField = WrapperField("EnforceSufficientQuantity", FieldType.BOOLEAN)
+    ENOTEBOOKSIGNOFFGROUPS__FIELD_NAME: WrapperField = WrapperField("ENotebookSignoffGroups", FieldType.SELECTION)
+    ENOTEBOOKSIGNOFFGROUPSHELP__FIELD_NAME: WrapperField = WrapperField("ENotebookSignoffGroupsHelp", FieldType.STRING)
+    ENUMERATESTORAGE__FIELD_NAME: WrapperField = WrapperField("EnumerateStorage", FieldType.BOOLEAN)
+    ESIGNEMAILOWNERNOTEBOOKUNLOCK__FIELD_NAME: WrapperField = WrapperField("EsignEmailOwnerNotebookUnlock", FieldType.BOOLEAN)
+    ESIGNSENDEMAILONDECISION__FIELD_NAME: WrapperField = WrapperField("EsignSendEmailOnDecision", FieldType.BOOLEAN)
+    ESIGNSENDEMAILONENTRYUNLOCK__FIELD_NAME: WrapperField = WrapperField("EsignSendEmailOnEntryUnlock", FieldType.BOOLEAN)
+    ESIGNSENDEMAILONNOTEBOOKUNLOCK__FIELD_NAME: WrapperField = WrapperField("EsignSendEmailOnNotebookUnlock", FieldType.BOOLEAN)
+    ESIGREQUIREALLAUTHOR__FIELD_NAME: WrapperField = WrapperField("EsigRequireAllAuthor", FieldType.BOOLEAN)
+    ESIGREQUIREALLAUTHORHELP__FIELD_NAME: WrapperField = WrapperField("EsigRequireAllAuthorHelp", FieldType.STRING)
+    EXPERIMENTBANNEREXPFIELDS__FIELD_NAME: WrapperField = WrapperField("ExperimentBannerExpFields", FieldType.SELECTION)
+    EXPERIMENTBANNERPARENTFIELDS__FIELD_NAME: WrapperField = WrapperField("ExperimentBannerParentFields", FieldType.SELECTION)
+    EXPORTEXEMPLARCONFIGBUTTON__FIELD_NAME: WrapperField = WrapperField("ExportExemplarConfigButton", FieldType.ACTION)
+    EXPORTFULLCONFIGBUTTON__FIELD_NAME: WrapperField = WrapperField("ExportFullConfigButton", FieldType.ACTION)
+    EXPORTSELECTEDCONFIGBUTTON__FIELD_NAME: WrapperField = WrapperField("ExportSelectedConfigButton", FieldType.ACTION)
+    EXPORTSTATICCONFIGURATIONS__FIELD_NAME: WrapperField = WrapperField("ExportStaticConfigurations", FieldType.ACTION)
+    FAREGIONS__FIELD_NAME: WrapperField = WrapperField("FARegions", FieldType.INTEGER)
+    GENERATEITEMBARCODE__FIELD_NAME: WrapperField = WrapperField("GenerateItemBarcode", FieldType.BOOLEAN)
+    IMPORTBACKUPCONFIGBUTTON__FIELD_NAME: WrapperField = WrapperField("ImportBackupConfigButton", FieldType.ACTION)
+    IMPORTBASELINEDESCRIPTION__FIELD_NAME: WrapperField = WrapperField("ImportBaseLineDescription", FieldType.STRING)
+    IMPORTEXEMPLARCONFIGBUTTON__FIELD_NAME: WrapperField = WrapperField("ImportExemplarConfigButton", FieldType.ACTION)
+    IMPORTEXPORTEXEMPLARCONFIGTEXT__FIELD_NAME: WrapperField = WrapperField("ImportExportExemplarConfigText", FieldType.STRING)
+    IMPORTEXPORTSYSTEMCONFIGSTEXT__FIELD_NAME: WrapperField = WrapperField("ImportExportSystemConfigsText", FieldType.STRING)
+    IMPORTSYSTEMCONFIGBUTTON__FIELD_NAME: WrapperField = WrapperField("ImportSystemConfigButton", FieldType.ACTION)
+    MAINDATATYPESELECTIONLIST__FIELD_NAME: WrapperField = WrapperField("MainDataTypeSelectionList", FieldType.SELECTION)
+    MATMANENABLEFEATUREEXT__FIELD_NAME: WrapperField = WrapperField("MatManEnableFeatureExt", FieldType.BOOLEAN)
+    MMSAMPLEFIELDSTODISPLAY__FIELD_NAME: WrapperField = WrapperField("MmSampleFieldsToDisplay", FieldType.SELECTION)
+    MULTILAYERPLATEPOOLIFSAMETYPE__FIELD_NAME: WrapperField = WrapperField("MultiLayerPlatePoolIfSameType", FieldType.BOOLEAN)
+    NEWCONSUMABLEDIRNAME__FIELD_NAME: WrapperField = WrapperField("NewConsumableDirName", FieldType.STRING)
+    NOTIFICATIONUSERS__FIELD_NAME: WrapperField = WrapperField("NotificationUsers", FieldType.SELECTION)
+    NOTIFYMAINTTECHNICIANS__FIELD_NAME: WrapperField = WrapperField("NotifyMaintTechnicians", FieldType.BOOLEAN)
+    OVERRIDEGROUPS__FIELD_NAME: WrapperField = WrapperField("OverrideGroups", FieldType.SELECTION)
+    PLASMIDDATATYPE__FIELD_NAME: WrapperField = WrapperField("PlasmidDataType", FieldType.SELECTION)
+    PLATEDESIGNERPRIMARYTYPES__FIELD_NAME: WrapperField = WrapperField("PlateDesignerPrimaryTypes", FieldType.SELECTION)
+    PLATESCANTOMATCH__FIELD_NAME: WrapperField = WrapperField("PlateScanToMatch", FieldType.SELECTION)
+    PORT__FIELD_NAME: WrapperField = WrapperField("Port", FieldType.INTEGER)
+    PRENOTIFICATIONINTERVAL__FIELD_NAME: WrapperField = WrapperField("PreNotificationInterval", FieldType.LONG)
+    PRINTCONSUMABLEBARCODE__FIELD_NAME: WrapperField = WrapperField("PrintConsumableBarcode", FieldType.BOOLEAN)
+    QCMAILINGLIST__FIELD_NAME: WrapperField = WrapperField("QCMailingList", FieldType.SELECTION)
+    QUANTITYTRACKING__FIELD_NAME: WrapperField = WrapperField("QuantityTracking", FieldType.BOOLEAN)
+    REAGENTLOTSCANTOMATCH__FIELD_NAME: WrapperField = WrapperField("ReagentLotScanToMatch", FieldType.SELECTION)
+    RECORDREPORTACCESSGROUPS__FIELD_NAME: WrapperField = WrapperField("RecordReportAccessGroups", FieldType.SELECTION)
+    RECORDREPORTDATATYPELIST__FIELD_NAME: WrapperField = WrapperField("RecordReportDataTypeList", FieldType.SELECTION)
+    RECORDSTORAGEEVENTS__FIELD_NAME: WrapperField = WrapperField("RecordStorageEvents", FieldType.BOOLEAN)
+    REQPORTALMANIFESTFIELDNAMES__FIELD_NAME: WrapperField = WrapperField("ReqPortalManifestFieldNames", FieldType.SELECTION)
+    REQUIREESIGNATURE__FIELD_NAME: WrapperField = WrapperField("RequireESignature", FieldType.BOOLEAN)
+    RESTRICTACCESSBYLOCATION__FIELD_NAME: WrapperField = WrapperField("RestrictAccessByLocation", FieldType.BOOLEAN)
+    REVIEWERVISIBLEROLETYPE__FIELD_NAME: WrapperField = WrapperField("ReviewerVisibleRoleType", FieldType.BOOLEAN)
+    S3ACCESSKEYID__FIELD_NAME: WrapperField = WrapperField("S3AccessKeyId", FieldType.STRING)
+    S3SECRETACESSKEY__FIELD_NAME: WrapperField = WrapperField("S3SecretAcessKey", FieldType.STRING)
+    SAASMAXNUMOFSAMPLESPERTRANS__FIELD_NAME: WrapperField = WrapperField("SaasMaxNumOfSamplesPerTrans", FieldType.LONG)
+    SAASMAXSAMPLES__FIELD_NAME: WrapperField = WrapperField("SaasMaxSamples", FieldType.LONG)
+    SAASMODE__FIELD_NAME: WrapperField = WrapperField("SaasMode", FieldType.BOOLEAN)
+    SAMPLERECEIVINGEMAILS__FIELD_NAME: WrapperField = WrapperField("SampleReceivingEmails", FieldType.STRING)
+    SAMPLERECEIVINGUSERMENU__FIELD_NAME: WrapperField = WrapperField("SampleReceivingUserMenu", FieldType.SELECTION)
+    SAMPLESCANTOMATCH__FIELD_NAME: WrapperField = WrapperField("SampleScanToMatch", FieldType.SELECTION)
+    SAMPLESHEETPATH__FIELD_NAME: WrapperField = WrapperField("SampleSheetPath", FieldType.STRING)
+    SAMPLETYPEMAXIMUMTEMPERATURE__FIELD_NAME: WrapperField = WrapperField("SampleTypeMaximumTemperature", FieldType.STRING)
+    SDMSROOTPATH__FIELD_NAME: WrapperField = WrapperField("SDMSRootPath", FieldType.STRING)
+    SECURESOCKETLAYER__FIELD_NAME: WrapperField = WrapperField("SecureSocketLayer", FieldType.BOOLEAN)
+    SENDTESTMAIL__FIELD_NAME: WrapperField = WrapperField("SendTestMail", FieldType.ACTION)
+    SMTPSERVER__FIELD_NAME: WrapperField = WrapperField("SMTPServer", FieldType.STRING)
+    SMTPUSERNAME__FIELD_NAME: WrapperField = WrapperField("SmtpUsername", FieldType.STRING)
+    STORAGEUNITVIEWERFILLBYCONFIG__FIELD_NAME: WrapperField = WrapperField("StorageUnitViewerFillByConfig", FieldType.PICKLIST)
+    SYSTEMPASSWORD__FIELD_NAME: WrapperField = WrapperField("SystemPassword", FieldType.STRING)
+    TEMPERATUREENFORCEMENT__FIELD_NAME: WrapperField = WrapperField("TemperatureEnforcement", FieldType.PICKLIST)
+    TLSENABLED__FIELD_NAME: WrapperField = WrapperField("TLSEnabled", FieldType.BOOLEAN)
+    TLSREQUIRED__FIELD_NAME: WrapperField = WrapperField("TLSRequired", FieldType.BOOLEAN)
+    USEREQUESTDEFAULTLAYOUT__FIELD_NAME: WrapperField = WrapperField("UseRequestDefaultLayout", FieldType.BOOLEAN)
+    VERIFICATIONTYPES__FIELD_NAME: WrapperField = WrapperField("VerificationTypes", FieldType.PICKLIST)
+    VIIPLATESIZE__FIELD_NAME: WrapperField = WrapperField("ViiPlateSize", FieldType.PICKLIST)
+    WITNESSVISIBLEROLETYPE__FIELD_NAME: WrapperField = WrapperField("WitnessVisibleRoleType", FieldType.BOOLEAN)
+    WRITEQCINPUTFILETOUSER__FIELD_NAME: WrapperField = WrapperField("WriteQCInputFileToUser", FieldType.BOOLEAN)
+
+    ActiveNotebooksInWorkQueue: ModelField[Optional[bool]] = ModelField("ActiveNotebooksInWorkQueue", FieldType.BOOLEAN)
+    AddAllUserAsCandidate: ModelField[Optional[bool]] = ModelField("AddAllUserAsCandidate", FieldType.BOOLEAN)
+    AddAllUserAsCandidateHelp: ModelField[Optional[str]] = ModelField("AddAllUserAsCandidateHelp", FieldType.STRING)
+    AddConsumablesToExperiments: ModelField[Optional[bool]] = ModelField("AddConsumablesToExperiments", FieldType.BOOLEAN)
+    AdditionalInstMaintEmails: ModelField[Optional[str]] = ModelField("AdditionalInstMaintEmails", FieldType.STRING)
+    AdditionalNotificationEmails: ModelField[Optional[str]] = ModelField("AdditionalNotificationEmails", FieldType.STRING)
+    AdditionalQCMailingList: ModelField[Optional[str]] = ModelField("AdditionalQCMailingList", FieldType.STRING)
+    AdHocExperimentsInheritAccess: ModelField[Optional[bool]] = ModelField("AdHocExperimentsInheritAccess", FieldType.BOOLEAN)
+    AlwaysLaunchInstMaintWorkflow: ModelField[Optional[bool]] = ModelField("AlwaysLaunchInstMaintWorkflow", FieldType.BOOLEAN)
+    ApproverVisibleRoleType: ModelField[Optional[bool]] = ModelField("ApproverVisibleRoleType", FieldType.BOOLEAN)
+    AssignToProcessUserGroupList: ModelField[Optional[str]] = ModelField("AssignToProcessUserGroupList", FieldType.SELECTION)
+    AuthenticationRequired: ModelField[Optional[bool]] = ModelField("AuthenticationRequired", FieldType.BOOLEAN)
+    BAMaxRegions: ModelField[Optional[int]] = ModelField("BAMaxRegions", FieldType.SHORT)
+    BAParseSelection: ModelField[Optional[str]] = ModelField("BAParseSelection", FieldType.PICKLIST)
+    BARegions: ModelField[Optional[int]] = ModelField("BARegions", FieldType.SHORT)
+    BroadcastMaintAlert: ModelField[Optional[bool]] = ModelField("BroadcastMaintAlert", FieldType.BOOLEAN)
+    BroadcastMaintUsers: ModelField[Optional[str]] = ModelField("BroadcastMaintUsers", FieldType.SELECTION)
+    CanModifyExistingVSMTPItems: ModelField[Optional[bool]] = ModelField("CanModifyExistingVSMTPItems", FieldType.BOOLEAN)
+    ConsumableDataTypes: ModelField[Optional[str]] = ModelField("ConsumableDataTypes", FieldType.STRING)
+    ConsumableDirectories: ModelField[Optional[str]] = ModelField("ConsumableDirectories", FieldType.STRING)
+    ConsumableTrackingAttribute: ModelField[Optional[str]] = ModelField("ConsumableTrackingAttribute", FieldType.PICKLIST)
+    ConsumableTypeMaxTemp: ModelField[Optional[str]] = ModelField("ConsumableTypeMaxTemp", FieldType.STRING)
+    CoolingStorageUnitTypes: ModelField[Optional[str]] = ModelField("CoolingStorageUnitTypes", FieldType.SELECTION)
+    CreateInWorkflow: ModelField[Optional[bool]] = ModelField("CreateInWorkflow", FieldType.BOOLEAN)
+    DefaultELNExperimentGroupRoles: ModelField[Optional[str]] = ModelField("DefaultELNExperimentGroupRoles", FieldType.SELECTION)
+    DefaultELNExperimentRoles: ModelField[Optional[str]] = ModelField("DefaultELNExperimentRoles", FieldType.SELECTION)
+    DefaultELNExperimentRolesHelp: ModelField[Optional[str]] = ModelField("DefaultELNExperimentRolesHelp", FieldType.STRING)
+    Delimiter: ModelField[Optional[str]] = ModelField("Delimiter", FieldType.STRING)
+    ELNCreateSmplExtentionMultiSel: ModelField[Optional[bool]] = ModelField("ELNCreateSmplExtentionMultiSel", FieldType.BOOLEAN)
+    ELNImportSamplesOverride: ModelField[Optional[str]] = ModelField("ELNImportSamplesOverride", FieldType.STRING)
+    Email: ModelField[Optional[str]] = ModelField("Email", FieldType.STRING)
+    EnableAutoLotPopulation: ModelField[Optional[bool]] = ModelField("EnableAutoLotPopulation", FieldType.BOOLEAN)
+    EnableBaselineReqCreation: ModelField[Optional[bool]] = ModelField("EnableBaselineReqCreation", FieldType.BOOLEAN)
+    EnableBaselineSampleRec: ModelField[Optional[bool]] = ModelField("EnableBaselineSampleRec", FieldType.BOOLEAN)
+    EnableDND: ModelField[Optional[bool]] = ModelField("EnableDND", FieldType.BOOLEAN)
+    EnableElnRoleCandidates: ModelField[Optional[bool]] = ModelField("EnableElnRoleCandidates", FieldType.BOOLEAN)
+    EnableMultiTenantDashboards: ModelField[Optional[bool]] = ModelField("EnableMultiTenantDashboards", FieldType.BOOLEAN)
+    EnforceConsumableDirectory: ModelField[Optional[bool]] = ModelField("EnforceConsumableDirectory", FieldType.BOOLEAN)
+    EnforceExpiration: ModelField[Optional[bool]] = ModelField("EnforceExpiration", FieldType.BOOLEAN)
+    EnforceSufficientQuantity: ModelField[Optional[bool]] = ModelField("EnforceSufficientQuantity", FieldType.BOOLEAN)
+    ENotebookSignoffGroups: ModelField[Optional[str]] = ModelField("ENotebookSignoffGroups", FieldType.SELECTION)
+    ENotebookSignoffGroupsHelp: ModelField[Optional[str]] = ModelField("ENotebookSignoffGroupsHelp", FieldType.STRING)
+    EnumerateStorage: ModelField[Optional[bool]] = ModelField("EnumerateStorage", FieldType.BOOLEAN)
+    EsignEmailOwnerNotebookUnlock: ModelField[Optional[bool]] = ModelField("EsignEmailOwnerNotebookUnlock", FieldType.BOOLEAN)
+    EsignSendEmailOnDecision: ModelField[Optional[bool]] = ModelField("EsignSendEmailOnDecision", FieldType.BOOLEAN)
+    EsignSendEmailOnEntryUnlock: ModelField[Optional[bool]] = ModelField("EsignSendEmailOnEntryUnlock", FieldType.BOOLEAN)
+    EsignSendEmailOnNotebookUnlock: ModelField[Optional[bool]] = ModelField("EsignSendEmailOnNotebookUnlock", FieldType.BOOLEAN)
+    EsigRequireAllAuthor: ModelField[Optional[bool]] = ModelField("EsigRequireAllAuthor", FieldType.BOOLEAN)
+    EsigRequireAllAuthorHelp: ModelField[Optional[str]] = ModelField("EsigRequireAllAuthorHelp", FieldType.STRING)
+    ExperimentBannerExpFields: ModelField[Optional[str]] = ModelField("ExperimentBannerExpFields", FieldType.SELECTION)
+    ExperimentBannerParentFields: ModelField[Optional[str]] = ModelField("ExperimentBannerParentFields", FieldType.SELECTION)
+    FARegions: ModelField[Optional[int]] = ModelField("FARegions", FieldType.INTEGER)
+    GenerateItemBarcode: ModelField[Optional[bool]] = ModelField("GenerateItemBarcode", FieldType.BOOLEAN)
+    ImportBaseLineDescription: ModelField[Optional[str]] = ModelField("ImportBaseLineDescription", FieldType.STRING)
+    ImportExportExemplarConfigText: ModelField[Optional[str]] = ModelField("ImportExportExemplarConfigText", FieldType.STRING)
+    ImportExportSystemConfigsText: ModelField[Optional[str]] = ModelField("ImportExportSystemConfigsText", FieldType.STRING)
+    MainDataTypeSelectionList: ModelField[Optional[str]] = ModelField("MainDataTypeSelectionList", FieldType.SELECTION)
+    MatManEnableFeatureExt: ModelField[Optional[bool]] = ModelField("MatManEnableFeatureExt", FieldType.BOOLEAN)
+    MmSampleFieldsToDisplay: ModelField[Optional[str]] = ModelField("MmSampleFieldsToDisplay", FieldType.SELECTION)
+    MultiLayerPlatePoolIfSameType: ModelField[Optional[bool]] = ModelField("MultiLayerPlatePoolIfSameType", FieldType.BOOLEAN)
+    NewConsumableDirName: ModelField[Optional[str]] = ModelField("NewConsumableDirName", FieldType.STRING)
+    NotificationUsers: ModelField[Optional[str]] = ModelField("NotificationUsers", FieldType.SELECTION)
+    NotifyMaintTechnicians: ModelField[Optional[bool]] = ModelField("NotifyMaintTechnicians", FieldType.BOOLEAN)
+    OverrideGroups: ModelField[Optional[str]] = ModelField("OverrideGroups", FieldType.SELECTION)
+    PlasmidDataType: ModelField[Optional[str]] = ModelField("PlasmidDataType", FieldType.SELECTION)
+    PlateDesignerPrimaryTypes: ModelField[Optional[str]] = ModelField("PlateDesignerPrimaryTypes", FieldType.SELECTION)
+    PlateScanToMatch: ModelField[Optional[str]] = ModelField("PlateScanToMatch", FieldType.SELECTION)
+    Port: ModelField[Optional[int]] = ModelField("Port", FieldType.INTEGER)
+    PreNotificationInterval: ModelField[Optional[int]] = ModelField("PreNotificationInterval", FieldType.LONG)
+    PrintConsumableBarcode: ModelField[Optional[bool]] = ModelField("PrintConsumableBarcode", FieldType.BOOLEAN)
+    QCMailingList: ModelField[Optional[str]] = ModelField("QCMailingList", FieldType.SELECTION)
+    QuantityTracking: ModelField[Optional[bool]] = ModelField("QuantityTracking", FieldType.BOOLEAN)
+    ReagentLotScanToMatch: ModelField[Optional[str]] = ModelField("ReagentLotScanToMatch", FieldType.SELECTION)
+    RecordReportAccessGroups: ModelField[Optional[str]] = ModelField("RecordReportAccessGroups", FieldType.SELECTION)
+    RecordReportDataTypeList: ModelField[Optional[str]] = ModelField("RecordReportDataTypeList", FieldType.SELECTION)
+    RecordStorageEvents: ModelField[Optional[bool]] = ModelField("RecordStorageEvents", FieldType.BOOLEAN)
+    ReqPortalManifestFieldNames: ModelField[Optional[str]] = ModelField("ReqPortalManifestFieldNames", FieldType.SELECTION)
+    RequireESignature: ModelField[Optional[bool]] = ModelField("RequireESignature", FieldType.BOOLEAN)
+    RestrictAccessByLocation: ModelField[Optional[bool]] = ModelField("RestrictAccessByLocation", FieldType.BOOLEAN)
+    ReviewerVisibleRoleType: ModelField[Optional[bool]] = ModelField("ReviewerVisibleRoleType", FieldType.BOOLEAN)
+    S3AccessKeyId: ModelField[Optional[str]] = ModelField("S3AccessKeyId", FieldType.STRING)
+    S3SecretAcessKey: ModelField[Optional[str]] = ModelField("S3SecretAcessKey", FieldType.STRING)
+    SaasMaxNumOfSamplesPerTrans: ModelField[Optional[int]] = ModelField("SaasMaxNumOfSamplesPerTrans", FieldType.LONG)
+    SaasMaxSamples: ModelField[Optional[int]] = ModelField("SaasMaxSamples", FieldType.LONG)
+    SaasMode: ModelField[Optional[bool]] = ModelField("SaasMode", FieldType.BOOLEAN)
+    SampleReceivingEmails: ModelField[Optional[str]] = ModelField("SampleReceivingEmails", FieldType.STRING)
+    SampleReceivingUserMenu: ModelField[Optional[str]] = ModelField("SampleReceivingUserMenu", FieldType.SELECTION)
+    SampleScanToMatch: ModelField[Optional[str]] = ModelField("SampleScanToMatch", FieldType.SELECTION)
+    SampleSheetPath: ModelField[Optional[str]] = ModelField("SampleSheetPath", FieldType.STRING)
+    SampleTypeMaximumTemperature: ModelField[Optional[str]] = ModelField("SampleTypeMaximumTemperature", FieldType.STRING)
+    SDMSRootPath: ModelField[Optional[str]] = ModelField("SDMSRootPath", FieldType.STRING)
+    SecureSocketLayer: ModelField[Optional[bool]] = ModelField("SecureSocketLayer", FieldType.BOOLEAN)
+    SMTPServer: ModelField[Optional[str]] = ModelField("SMTPServer", FieldType.STRING)
+    SmtpUsername: ModelField[Optional[str]] = ModelField("SmtpUsername", FieldType.STRING)
+    StorageUnitViewerFillByConfig: ModelField[Optional[str]] = ModelField("StorageUnitViewerFillByConfig", FieldType.PICKLIST)
+    SystemPassword: ModelField[Optional[str]] = ModelField("SystemPassword", FieldType.STRING)
+    TemperatureEnforcement: ModelField[Optional[str]] = ModelField("TemperatureEnforcement", FieldType.PICKLIST)
+    TLSEnabled: ModelField[Optional[bool]] = ModelField("TLSEnabled", FieldType.BOOLEAN)
+    TLSRequired: ModelField[Optional[bool]] = ModelField("TLSRequired", FieldType.BOOLEAN)
+    UseRequestDefaultLayout: ModelField[Optional[bool]] = ModelField("UseRequestDefaultLayout", FieldType.BOOLEAN)
+    VerificationTypes: ModelField[Optional[str]] = ModelField("VerificationTypes", FieldType.PICKLIST)
+    ViiPlateSize: ModelField[Optional[str]] = ModelField("ViiPlateSize", FieldType.PICKLIST)
+    WitnessVisibleRoleType: ModelField[Optional[bool]] = ModelField("WitnessVisibleRoleType", FieldType.BOOLEAN)
+    WriteQCInputFileToUser: ModelField[Optional[bool]] = ModelField("WriteQCInputFileToUser", FieldType.BOOLEAN)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
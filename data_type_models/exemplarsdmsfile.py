@@ -0,0 +1,37 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class ExemplarSDMSFileModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type ExemplarSDMSFile
+    Data Type Display Name: SDMS File (SDMS Files)
+    Fields: FileCreationDate, FileHash, FileLastModifiedDate, FilePath, FileSize, FileSourcePath, InstrumentType, IsLoaded, VeloxCurrentVersion
+    These are potentially very large files that will be stored as SDMS file. They will be retrieved through streamed download.
+    """
+    DATA_TYPE_NAME: str = 'ExemplarSDMSFile'
+    FILECREATIONDATE__FIELD_NAME: WrapperField = WrapperField("FileCreationDate", FieldType.DATE)
+    FILEHASH__FIELD_NAME: WrapperField = WrapperField("FileHash", FieldType.STRING)
+    FILELASTMODIFIEDDATE__FIELD_NAME: WrapperField = WrapperField("FileLastModifiedDate", FieldType.DATE)
+    FILEPATH__FIELD_NAME: WrapperField = WrapperField("FilePath", FieldType.STRING)
+    FILESIZE__FIELD_NAME: WrapperField = WrapperField("FileSize", FieldType.LONG)
+    FILESOURCEPATH__FIELD_NAME: WrapperField = WrapperField("FileSourcePath", FieldType.STRING)
+    INSTRUMENTTYPE__FIELD_NAME: WrapperField = WrapperField("InstrumentType", FieldType.STRING)
+    ISLOADED__FIELD_NAME: WrapperField = WrapperField("IsLoaded", FieldType.BOOLEAN)
+    VELOXCURRENTVERSION__FIELD_NAME: WrapperField = WrapperField("VeloxCurrentVersion", FieldType.INTEGER)
+
+    FileCreationDate: ModelField[Optional[int]] = ModelField("FileCreationDate", FieldType.DATE)
+    FileHash: ModelField[Optional[str]] = ModelField("FileHash", FieldType.STRING)
+    FileLastModifiedDate: ModelField[Optional[int]] = ModelField("FileLastModifiedDate", FieldType.DATE)
+    FilePath: ModelField[Optional[str]] = ModelField("FilePath", FieldType.STRING)
+    FileSize: ModelField[Optional[int]] = ModelField("FileSize", FieldType.LONG)
+    FileSourcePath: ModelField[Optional[str]] = ModelField("FileSourcePath", FieldType.STRING)
+    InstrumentType: ModelField[Optional[str]] = ModelField("InstrumentType", FieldType.STRING)
+    IsLoaded: ModelField[Optional[bool]] = ModelField("IsLoaded", FieldType.BOOLEAN)
+    VeloxCurrentVersion: ModelField[Optional[int]] = ModelField("VeloxCurrentVersion", FieldType.INTEGER)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,22 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class ExperimentGroupModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type ExperimentGroup
+    Data Type Display Name: Experiment Group (Experiment Groups)
+    Fields: GroupMonth, GroupYear
+    """
+    DATA_TYPE_NAME: str = 'ExperimentGroup'
+    GROUPMONTH__FIELD_NAME: WrapperField = WrapperField("GroupMonth", FieldType.PICKLIST)
+    GROUPYEAR__FIELD_NAME: WrapperField = WrapperField("GroupYear", FieldType.SHORT)
+
+    GroupMonth: ModelField[Optional[str]] = ModelField("GroupMonth", FieldType.PICKLIST)
+    GroupYear: ModelField[Optional[int]] = ModelField("GroupYear", FieldType.SHORT)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
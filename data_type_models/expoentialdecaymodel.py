@@ -0,0 +1,42 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class ExpoentialDecayModelModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type ExpoentialDecayModel
+    Data Type Display Name: Exponential Decay Model (Exponential Decay Models)
+    Fields: c, d, e, EntryName, Formula, MultiParentLink207, RSE, RSEDOF, RSquared, SeriesName, SourceEntryId
+    Exponential Decay follows this formula:
+
+Y = c + (d-c) exp(-x/e)
+    """
+    DATA_TYPE_NAME: str = 'ExpoentialDecayModel'
+    C__FIELD_NAME: WrapperField = WrapperField("c", FieldType.DOUBLE)
+    D__FIELD_NAME: WrapperField = WrapperField("d", FieldType.DOUBLE)
+    E__FIELD_NAME: WrapperField = WrapperField("e", FieldType.DOUBLE)
+    ENTRYNAME__FIELD_NAME: WrapperField = WrapperField("EntryName", FieldType.STRING)
+    FORMULA__FIELD_NAME: WrapperField = WrapperField("Formula", FieldType.STRING)
+    MULTIPARENTLINK207__FIELD_NAME: WrapperField = WrapperField("MultiParentLink207", FieldType.MULTIPARENTLINK)
+    RSE__FIELD_NAME: WrapperField = WrapperField("RSE", FieldType.DOUBLE)
+    RSEDOF__FIELD_NAME: WrapperField = WrapperField("RSEDOF", FieldType.DOUBLE)
+    RSQUARED__FIELD_NAME: WrapperField = WrapperField("RSquared", FieldType.DOUBLE)
+    SERIESNAME__FIELD_NAME: WrapperField = WrapperField("SeriesName", FieldType.STRING)
+    SOURCEENTRYID__FIELD_NAME: WrapperField = WrapperField("SourceEntryId", FieldType.LONG)
+
+    c: ModelField[Optional[float]] = ModelField("c", FieldType.DOUBLE)
+    d: ModelField[Optional[float]] = ModelField("d", FieldType.DOUBLE)
+    e: ModelField[Optional[float]] = ModelField("e", FieldType.DOUBLE)
+    EntryName: ModelField[Optional[str]] = ModelField("EntryName", FieldType.STRING)
+    Formula: ModelField[Optional[str]] = ModelField("Formula", FieldType.STRING)
+    RSE: ModelField[Optional[float]] = ModelField("RSE", FieldType.DOUBLE)
+    RSEDOF: ModelField[Optional[float]] = ModelField("RSEDOF", FieldType.DOUBLE)
+    RSquared: ModelField[Optional[float]] = ModelField("RSquared", FieldType.DOUBLE)
+    SeriesName: ModelField[Optional[str]] = ModelField("SeriesName", FieldType.STRING)
+    SourceEntryId: ModelField[Optional[int]] = ModelField("SourceEntryId", FieldType.LONG)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,24 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class ExponentialDecayRegParameterModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type ExponentialDecayRegParameter
+    Data Type Display Name: Exponential Decay Regression Parameters (Exponential Decay Regression Parameters)
+    Fields: DecayRate, Intercept, OriginalAmount
+    """
+    DATA_TYPE_NAME: str = 'ExponentialDecayRegParameter'
+    DECAYRATE__FIELD_NAME: WrapperField = WrapperField("DecayRate", FieldType.DOUBLE)
+    INTERCEPT__FIELD_NAME: WrapperField = WrapperField("Intercept", FieldType.DOUBLE)
+    ORIGINALAMOUNT__FIELD_NAME: WrapperField = WrapperField("OriginalAmount", FieldType.DOUBLE)
+
+    DecayRate: ModelField[Optional[float]] = ModelField("DecayRate", FieldType.DOUBLE)
+    Intercept: ModelField[Optional[float]] = ModelField("Intercept", FieldType.DOUBLE)
+    OriginalAmount: ModelField[Optional[float]] = ModelField("OriginalAmount", FieldType.DOUBLE)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,28 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class FailedSampleDetailsModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type FailedSampleDetails
+    Data Type Display Name: Failure Details (Failure Details)
+    Fields: ActiveTaskName, ActiveWorkflowName, FailureStatus, OtherSampleId, SampleId
+    """
+    DATA_TYPE_NAME: str = 'FailedSampleDetails'
+    ACTIVETASKNAME__FIELD_NAME: WrapperField = WrapperField("ActiveTaskName", FieldType.STRING)
+    ACTIVEWORKFLOWNAME__FIELD_NAME: WrapperField = WrapperField("ActiveWorkflowName", FieldType.STRING)
+    FAILURESTATUS__FIELD_NAME: WrapperField = WrapperField("FailureStatus", FieldType.PICKLIST)
+    OTHERSAMPLEID__FIELD_NAME: WrapperField = WrapperField("OtherSampleId", FieldType.STRING)
+    SAMPLEID__FIELD_NAME: WrapperField = WrapperField("SampleId", FieldType.STRING)
+
+    ActiveTaskName: ModelField[Optional[str]] = ModelField("ActiveTaskName", FieldType.STRING)
+    ActiveWorkflowName: ModelField[Optional[str]] = ModelField("ActiveWorkflowName", FieldType.STRING)
+    FailureStatus: ModelField[Optional[str]] = ModelField("FailureStatus", FieldType.PICKLIST)
+    OtherSampleId: ModelField[Optional[str]] = ModelField("OtherSampleId", FieldType.STRING)
+    SampleId: ModelField[Optional[str]] = ModelField("SampleId", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,36 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class FCSFileModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type FCSFile
+    Data Type Display Name: Flow Cytometry Standard File (Flow Cytometry Standard Files)
+    Fields: FilePath, IsDataComplete, IsMetadataLoaded, IsTopLevel, PercentCellsToParentLevel, PercentCellsToTopLevel, RootFCSRecordId, TotalNumberOfCells, VeloxCurrentVersion
+    """
+    DATA_TYPE_NAME: str = 'FCSFile'
+    FILEPATH__FIELD_NAME: WrapperField = WrapperField("FilePath", FieldType.STRING)
+    ISDATACOMPLETE__FIELD_NAME: WrapperField = WrapperField("IsDataComplete", FieldType.BOOLEAN)
+    ISMETADATALOADED__FIELD_NAME: WrapperField = WrapperField("IsMetadataLoaded", FieldType.BOOLEAN)
+    ISTOPLEVEL__FIELD_NAME: WrapperField = WrapperField("IsTopLevel", FieldType.BOOLEAN)
+    PERCENTCELLSTOPARENTLEVEL__FIELD_NAME: WrapperField = WrapperField("PercentCellsToParentLevel", FieldType.DOUBLE)
+    PERCENTCELLSTOTOPLEVEL__FIELD_NAME: WrapperField = WrapperField("PercentCellsToTopLevel", FieldType.DOUBLE)
+    ROOTFCSRECORDID__FIELD_NAME: WrapperField = WrapperField("RootFCSRecordId", FieldType.LONG)
+    TOTALNUMBEROFCELLS__FIELD_NAME: WrapperField = WrapperField("TotalNumberOfCells", FieldType.LONG)
+    VELOXCURRENTVERSION__FIELD_NAME: WrapperField = WrapperField("VeloxCurrentVersion", FieldType.INTEGER)
+
+    FilePath: ModelField[Optional[str]] = ModelField("FilePath", FieldType.STRING)
+    IsDataComplete: ModelField[Optional[bool]] = ModelField("IsDataComplete", FieldType.BOOLEAN)
+    IsMetadataLoaded: ModelField[Optional[bool]] = ModelField("IsMetadataLoaded", FieldType.BOOLEAN)
+    IsTopLevel: ModelField[Optional[bool]] = ModelField("IsTopLevel", FieldType.BOOLEAN)
+    PercentCellsToParentLevel: ModelField[Optional[float]] = ModelField("PercentCellsToParentLevel", FieldType.DOUBLE)
+    PercentCellsToTopLevel: ModelField[Optional[float]] = ModelField("PercentCellsToTopLevel", FieldType.DOUBLE)
+    RootFCSRecordId: ModelField[Optional[int]] = ModelField("RootFCSRecordId", FieldType.LONG)
+    TotalNumberOfCells: ModelField[Optional[int]] = ModelField("TotalNumberOfCells", FieldType.LONG)
+    VeloxCurrentVersion: ModelField[Optional[int]] = ModelField("VeloxCurrentVersion", FieldType.INTEGER)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
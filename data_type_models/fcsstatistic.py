@@ -0,0 +1,25 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class FCSStatisticModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type FCSStatistic
+    Data Type Display Name: Flow Cytometry Statistic (Flow Cytometry Statistic)
+    Fields: ChannelName, NumericValue, StatName
+    A statistic record for FCS file, usually for a specific channel so they are not suited directly added to the FCSFile record.
+    """
+    DATA_TYPE_NAME: str = 'FCSStatistic'
+    CHANNELNAME__FIELD_NAME: WrapperField = WrapperField("ChannelName", FieldType.STRING)
+    NUMERICVALUE__FIELD_NAME: WrapperField = WrapperField("NumericValue", FieldType.DOUBLE)
+    STATNAME__FIELD_NAME: WrapperField = WrapperField("StatName", FieldType.STRING)
+
+    ChannelName: ModelField[Optional[str]] = ModelField("ChannelName", FieldType.STRING)
+    NumericValue: ModelField[Optional[float]] = ModelField("NumericValue", FieldType.DOUBLE)
+    StatName: ModelField[Optional[str]] = ModelField("StatName", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
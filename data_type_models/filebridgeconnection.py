@@ -0,0 +1,31 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class FileBridgeConnectionModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type FileBridgeConnection
+    Data Type Display Name: File Bridge Connection (File Bridge Connections)
+    Fields: AesKey, AgentRoot, AuthToken, ConnectionName, ProxyHost, ProxyPort
+    This data type describes the configuration of a File Bridge Connection to be used by Exemplar.
+    """
+    DATA_TYPE_NAME: str = 'FileBridgeConnection'
+    AESKEY__FIELD_NAME: WrapperField = WrapperField("AesKey", FieldType.STRING)
+    AGENTROOT__FIELD_NAME: WrapperField = WrapperField("AgentRoot", FieldType.STRING)
+    AUTHTOKEN__FIELD_NAME: WrapperField = WrapperField("AuthToken", FieldType.STRING)
+    CONNECTIONNAME__FIELD_NAME: WrapperField = WrapperField("ConnectionName", FieldType.STRING)
+    PROXYHOST__FIELD_NAME: WrapperField = WrapperField("ProxyHost", FieldType.STRING)
+    PROXYPORT__FIELD_NAME: WrapperField = WrapperField("ProxyPort", FieldType.INTEGER)
+
+    AesKey: ModelField[Optional[str]] = ModelField("AesKey", FieldType.STRING)
+    AgentRoot: ModelField[Optional[str]] = ModelField("AgentRoot", FieldType.STRING)
+    AuthToken: ModelField[Optional[str]] = ModelField("AuthToken", FieldType.STRING)
+    ConnectionName: ModelField[Optional[str]] = ModelField("ConnectionName", FieldType.STRING)
+    ProxyHost: ModelField[Optional[str]] = ModelField("ProxyHost", FieldType.STRING)
+    ProxyPort: ModelField[Optional[int]] = ModelField("ProxyPort", FieldType.INTEGER)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
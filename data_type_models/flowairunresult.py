@@ -0,0 +1,36 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class FlowAIRunResultModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type FlowAIRunResult
+    Data Type Display Name: FlowAI Run result (FlowAI Run Results)
+    Fields: alphaFR, decompFR, FilePath, max_cptFS, outlier_binsFS, pen_valueFS, second_fractionFR, sideFM, VeloxCurrentVersion
+    """
+    DATA_TYPE_NAME: str = 'FlowAIRunResult'
+    ALPHAFR__FIELD_NAME: WrapperField = WrapperField("alphaFR", FieldType.DOUBLE)
+    DECOMPFR__FIELD_NAME: WrapperField = WrapperField("decompFR", FieldType.BOOLEAN)
+    FILEPATH__FIELD_NAME: WrapperField = WrapperField("FilePath", FieldType.STRING)
+    MAX_CPTFS__FIELD_NAME: WrapperField = WrapperField("max_cptFS", FieldType.INTEGER)
+    OUTLIER_BINSFS__FIELD_NAME: WrapperField = WrapperField("outlier_binsFS", FieldType.BOOLEAN)
+    PEN_VALUEFS__FIELD_NAME: WrapperField = WrapperField("pen_valueFS", FieldType.STRING)
+    SECOND_FRACTIONFR__FIELD_NAME: WrapperField = WrapperField("second_fractionFR", FieldType.DOUBLE)
+    SIDEFM__FIELD_NAME: WrapperField = WrapperField("sideFM", FieldType.PICKLIST)
+    VELOXCURRENTVERSION__FIELD_NAME: WrapperField = WrapperField("VeloxCurrentVersion", FieldType.INTEGER)
+
+    alphaFR: ModelField[Optional[float]] = ModelField("alphaFR", FieldType.DOUBLE)
+    decompFR: ModelField[Optional[bool]] = ModelField("decompFR", FieldType.BOOLEAN)
+    FilePath: ModelField[Optional[str]] = ModelField("FilePath", FieldType.STRING)
+    max_cptFS: ModelField[Optional[int]] = ModelField("max_cptFS", FieldType.INTEGER)
+    outlier_binsFS: ModelField[Optional[bool]] = ModelField("outlier_binsFS", FieldType.BOOLEAN)
+    pen_valueFS: ModelField[Optional[str]] = ModelField("pen_valueFS", FieldType.STRING)
+    second_fractionFR: ModelField[Optional[float]] = ModelField("second_fractionFR", FieldType.DOUBLE)
+    sideFM: ModelField[Optional[str]] = ModelField("sideFM", FieldType.PICKLIST)
+    VeloxCurrentVersion: ModelField[Optional[int]] = ModelField("VeloxCurrentVersion", FieldType.INTEGER)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,38 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class FlowCellModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type FlowCell
+    Data Type Display Name: Flow Cell (Flow Cells)
+    Fields: ColPosition, FlowcellId, OccupancyProxyClusterCount, OccupiedClusterCount, PercentOccupied, pfClusterCount, RawClusterCount, RowPosition, StorageLocationBarcode, StorageUnitPath
+    """
+    DATA_TYPE_NAME: str = 'FlowCell'
+    COLPOSITION__FIELD_NAME: WrapperField = WrapperField("ColPosition", FieldType.SELECTION)
+    FLOWCELLID__FIELD_NAME: WrapperField = WrapperField("FlowcellId", FieldType.STRING)
+    OCCUPANCYPROXYCLUSTERCOUNT__FIELD_NAME: WrapperField = WrapperField("OccupancyProxyClusterCount", FieldType.LONG)
+    OCCUPIEDCLUSTERCOUNT__FIELD_NAME: WrapperField = WrapperField("OccupiedClusterCount", FieldType.LONG)
+    PERCENTOCCUPIED__FIELD_NAME: WrapperField = WrapperField("PercentOccupied", FieldType.DOUBLE)
+    PFCLUSTERCOUNT__FIELD_NAME: WrapperField = WrapperField("pfClusterCount", FieldType.LONG)
+    RAWCLUSTERCOUNT__FIELD_NAME: WrapperField = WrapperField("RawClusterCount", FieldType.LONG)
+    ROWPOSITION__FIELD_NAME: WrapperField = WrapperField("RowPosition", FieldType.SELECTION)
+    STORAGELOCATIONBARCODE__FIELD_NAME: WrapperField = WrapperField("StorageLocationBarcode", FieldType.SELECTION)
+    STORAGEUNITPATH__FIELD_NAME: WrapperField = WrapperField("StorageUnitPath", FieldType.STRING)
+
+    ColPosition: ModelField[Optional[str]] = ModelField("ColPosition", FieldType.SELECTION)
+    FlowcellId: ModelField[Optional[str]] = ModelField("FlowcellId", FieldType.STRING)
+    OccupancyProxyClusterCount: ModelField[Optional[int]] = ModelField("OccupancyProxyClusterCount", FieldType.LONG)
+    OccupiedClusterCount: ModelField[Optional[int]] = ModelField("OccupiedClusterCount", FieldType.LONG)
+    PercentOccupied: ModelField[Optional[float]] = ModelField("PercentOccupied", FieldType.DOUBLE)
+    pfClusterCount: ModelField[Optional[int]] = ModelField("pfClusterCount", FieldType.LONG)
+    RawClusterCount: ModelField[Optional[int]] = ModelField("RawClusterCount", FieldType.LONG)
+    RowPosition: ModelField[Optional[str]] = ModelField("RowPosition", FieldType.SELECTION)
+    StorageLocationBarcode: ModelField[Optional[str]] = ModelField("StorageLocationBarcode", FieldType.SELECTION)
+    StorageUnitPath: ModelField[Optional[str]] = ModelField("StorageUnitPath", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
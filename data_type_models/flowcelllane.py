@@ -0,0 +1,25 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class FlowCellLaneModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type FlowCellLane
+    Data Type Display Name: Flow Cell Lane (Flow Cell Lanes)
+    Fields: ExpRecId, FlowcellId, LaneNum, MultiParentLink207
+    """
+    DATA_TYPE_NAME: str = 'FlowCellLane'
+    EXPRECID__FIELD_NAME: WrapperField = WrapperField("ExpRecId", FieldType.LONG)
+    FLOWCELLID__FIELD_NAME: WrapperField = WrapperField("FlowcellId", FieldType.STRING)
+    LANENUM__FIELD_NAME: WrapperField = WrapperField("LaneNum", FieldType.LONG)
+    MULTIPARENTLINK207__FIELD_NAME: WrapperField = WrapperField("MultiParentLink207", FieldType.MULTIPARENTLINK)
+
+    ExpRecId: ModelField[Optional[int]] = ModelField("ExpRecId", FieldType.LONG)
+    FlowcellId: ModelField[Optional[str]] = ModelField("FlowcellId", FieldType.STRING)
+    LaneNum: ModelField[Optional[int]] = ModelField("LaneNum", FieldType.LONG)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
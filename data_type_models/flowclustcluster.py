@@ -0,0 +1,26 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class FlowClustClusterModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type FlowClustCluster
+    Data Type Display Name: FlowClust Cluster (FlowClust Clusters)
+    Fields: ClusterNum, ColorHTML, ColorName, UserAnnotation
+    """
+    DATA_TYPE_NAME: str = 'FlowClustCluster'
+    CLUSTERNUM__FIELD_NAME: WrapperField = WrapperField("ClusterNum", FieldType.STRING)
+    COLORHTML__FIELD_NAME: WrapperField = WrapperField("ColorHTML", FieldType.STRING)
+    COLORNAME__FIELD_NAME: WrapperField = WrapperField("ColorName", FieldType.STRING)
+    USERANNOTATION__FIELD_NAME: WrapperField = WrapperField("UserAnnotation", FieldType.STRING)
+
+    ClusterNum: ModelField[Optional[str]] = ModelField("ClusterNum", FieldType.STRING)
+    ColorHTML: ModelField[Optional[str]] = ModelField("ColorHTML", FieldType.STRING)
+    ColorName: ModelField[Optional[str]] = ModelField("ColorName", FieldType.STRING)
+    UserAnnotation: ModelField[Optional[str]] = ModelField("UserAnnotation", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,61 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class FlowClustConfigModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type FlowClustConfig
+    Data Type Display Name: FlowClust Config (FlowClust Configs)
+    Fields: BInit, ChannelConfigJSON, ClusterGroupName, criterion, FilePath, IsDataComplete, lam, LLevel, maxcount, MaxEMIterations, mincount, nu, nuest, NumberOfClusters, randomStart, seed, tol, tolInit, trans, VeloxCurrentVersion, zcutoff
+    Sets up a FlowClust clustering package configurations.
+    """
+    DATA_TYPE_NAME: str = 'FlowClustConfig'
+    BINIT__FIELD_NAME: WrapperField = WrapperField("BInit", FieldType.INTEGER)
+    CHANNELCONFIGJSON__FIELD_NAME: WrapperField = WrapperField("ChannelConfigJSON", FieldType.STRING)
+    CLUSTERGROUPNAME__FIELD_NAME: WrapperField = WrapperField("ClusterGroupName", FieldType.STRING)
+    CRITERION__FIELD_NAME: WrapperField = WrapperField("criterion", FieldType.PICKLIST)
+    FILEPATH__FIELD_NAME: WrapperField = WrapperField("FilePath", FieldType.STRING)
+    ISDATACOMPLETE__FIELD_NAME: WrapperField = WrapperField("IsDataComplete", FieldType.BOOLEAN)
+    LAM__FIELD_NAME: WrapperField = WrapperField("lam", FieldType.DOUBLE)
+    LLEVEL__FIELD_NAME: WrapperField = WrapperField("LLevel", FieldType.DOUBLE)
+    MAXCOUNT__FIELD_NAME: WrapperField = WrapperField("maxcount", FieldType.INTEGER)
+    MAXEMITERATIONS__FIELD_NAME: WrapperField = WrapperField("MaxEMIterations", FieldType.INTEGER)
+    MINCOUNT__FIELD_NAME: WrapperField = WrapperField("mincount", FieldType.INTEGER)
+    NU__FIELD_NAME: WrapperField = WrapperField("nu", FieldType.INTEGER)
+    NUEST__FIELD_NAME: WrapperField = WrapperField("nuest", FieldType.PICKLIST)
+    NUMBEROFCLUSTERS__FIELD_NAME: WrapperField = WrapperField("NumberOfClusters", FieldType.INTEGER)
+    RANDOMSTART__FIELD_NAME: WrapperField = WrapperField("randomStart", FieldType.INTEGER)
+    SEED__FIELD_NAME: WrapperField = WrapperField("seed", FieldType.INTEGER)
+    TOL__FIELD_NAME: WrapperField = WrapperField("tol", FieldType.DOUBLE)
+    TOLINIT__FIELD_NAME: WrapperField = WrapperField("tolInit", FieldType.DOUBLE)
+    TRANS__FIELD_NAME: WrapperField = WrapperField("trans", FieldType.PICKLIST)
+    VELOXCURRENTVERSION__FIELD_NAME: WrapperField = WrapperField("VeloxCurrentVersion", FieldType.INTEGER)
+    ZCUTOFF__FIELD_NAME: WrapperField = WrapperField("zcutoff", FieldType.DOUBLE)
+
+    BInit: ModelField[Optional[int]] = ModelField("BInit", FieldType.INTEGER)
+    ChannelConfigJSON: ModelField[Optional[str]] = ModelField("ChannelConfigJSON", FieldType.STRING)
+    ClusterGroupName: ModelField[Optional[str]] = ModelField("ClusterGroupName", FieldType.STRING)
+    criterion: ModelField[Optional[str]] = ModelField("criterion", FieldType.PICKLIST)
+    FilePath: ModelField[Optional[str]] = ModelField("FilePath", FieldType.STRING)
+    IsDataComplete: ModelField[Optional[bool]] = ModelField("IsDataComplete", FieldType.BOOLEAN)
+    lam: ModelField[Optional[float]] = ModelField("lam", FieldType.DOUBLE)
+    LLevel: ModelField[Optional[float]] = ModelField("LLevel", FieldType.DOUBLE)
+    maxcount: ModelField[Optional[int]] = ModelField("maxcount", FieldType.INTEGER)
+    MaxEMIterations: ModelField[Optional[int]] = ModelField("MaxEMIterations", FieldType.INTEGER)
+    mincount: ModelField[Optional[int]] = ModelField("mincount", FieldType.INTEGER)
+    nu: ModelField[Optional[int]] = ModelField("nu", FieldType.INTEGER)
+    nuest: ModelField[Optional[str]] = ModelField("nuest", FieldType.PICKLIST)
+    NumberOfClusters: ModelField[Optional[int]] = ModelField("NumberOfClusters", FieldType.INTEGER)
+    randomStart: ModelField[Optional[int]] = ModelField("randomStart", FieldType.INTEGER)
+    seed: ModelField[Optional[int]] = ModelField("seed", FieldType.INTEGER)
+    tol: ModelField[Optional[float]] = ModelField("tol", FieldType.DOUBLE)
+    tolInit: ModelField[Optional[float]] = ModelField("tolInit", FieldType.DOUBLE)
+    trans: ModelField[Optional[str]] = ModelField("trans", FieldType.PICKLIST)
+    VeloxCurrentVersion: ModelField[Optional[int]] = ModelField("VeloxCurrentVersion", FieldType.INTEGER)
+    zcutoff: ModelField[Optional[float]] = ModelField("zcutoff", FieldType.DOUBLE)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,29 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class FlowCompensationMatrixDatumModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type FlowCompensationMatrixDatum
+    Data Type Display Name: Flow Compensation Matrix Datum (Flow Compensation Matrix Data)
+    Fields: ColumnChannelName, ColumnIndex, CompensationValue, RowChannelName, RowIndex
+    Individual flow compensation matrix data value in the matrix.
+    """
+    DATA_TYPE_NAME: str = 'FlowCompensationMatrixDatum'
+    COLUMNCHANNELNAME__FIELD_NAME: WrapperField = WrapperField("ColumnChannelName", FieldType.STRING)
+    COLUMNINDEX__FIELD_NAME: WrapperField = WrapperField("ColumnIndex", FieldType.INTEGER)
+    COMPENSATIONVALUE__FIELD_NAME: WrapperField = WrapperField("CompensationValue", FieldType.DOUBLE)
+    ROWCHANNELNAME__FIELD_NAME: WrapperField = WrapperField("RowChannelName", FieldType.STRING)
+    ROWINDEX__FIELD_NAME: WrapperField = WrapperField("RowIndex", FieldType.INTEGER)
+
+    ColumnChannelName: ModelField[Optional[str]] = ModelField("ColumnChannelName", FieldType.STRING)
+    ColumnIndex: ModelField[Optional[int]] = ModelField("ColumnIndex", FieldType.INTEGER)
+    CompensationValue: ModelField[Optional[float]] = ModelField("CompensationValue", FieldType.DOUBLE)
+    RowChannelName: ModelField[Optional[str]] = ModelField("RowChannelName", FieldType.STRING)
+    RowIndex: ModelField[Optional[int]] = ModelField("RowIndex", FieldType.INTEGER)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,27 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class FlowCompensationMatrixInfoModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type FlowCompensationMatrixInfo
+    Data Type Display Name: Flow Compensation Matrix Info (Flow Compensation Matrix Info)
+    Fields: ChannelNameList, MatrixName
+    Contains the info about the matrix itself.
+
+The parents of this matrix are those that are used to create this info file. There can be more than one parent.
+
+This is not directly linked to children FCS files. It will be linked through FlowCompMatrixApplication type.
+    """
+    DATA_TYPE_NAME: str = 'FlowCompensationMatrixInfo'
+    CHANNELNAMELIST__FIELD_NAME: WrapperField = WrapperField("ChannelNameList", FieldType.STRING)
+    MATRIXNAME__FIELD_NAME: WrapperField = WrapperField("MatrixName", FieldType.STRING)
+
+    ChannelNameList: ModelField[Optional[str]] = ModelField("ChannelNameList", FieldType.STRING)
+    MatrixName: ModelField[Optional[str]] = ModelField("MatrixName", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
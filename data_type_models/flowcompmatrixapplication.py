@@ -0,0 +1,21 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class FlowCompMatrixApplicationModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type FlowCompMatrixApplication
+    Data Type Display Name: Flow Comp Matrix Application (Flow Comp Matrix Applications)
+    Fields: MatrixInfoRecordId
+    Apply a flow cyto compensation matrix for a target (parent FCS) file, against a matrix info.
+    """
+    DATA_TYPE_NAME: str = 'FlowCompMatrixApplication'
+    MATRIXINFORECORDID__FIELD_NAME: WrapperField = WrapperField("MatrixInfoRecordId", FieldType.LONG)
+
+    MatrixInfoRecordId: ModelField[Optional[int]] = ModelField("MatrixInfoRecordId", FieldType.LONG)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,25 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class FlowCytoFileTemplateModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type FlowCytoFileTemplate
+    Data Type Display Name: Flow Cyto File Template (Flow Cyto File Templates)
+    Fields: TemplateData, TemplateDescription, TemplateName
+    Describes a saved gating and compensation strategy for a flow cytometry file.
+    """
+    DATA_TYPE_NAME: str = 'FlowCytoFileTemplate'
+    TEMPLATEDATA__FIELD_NAME: WrapperField = WrapperField("TemplateData", FieldType.STRING)
+    TEMPLATEDESCRIPTION__FIELD_NAME: WrapperField = WrapperField("TemplateDescription", FieldType.STRING)
+    TEMPLATENAME__FIELD_NAME: WrapperField = WrapperField("TemplateName", FieldType.STRING)
+
+    TemplateData: ModelField[Optional[str]] = ModelField("TemplateData", FieldType.STRING)
+    TemplateDescription: ModelField[Optional[str]] = ModelField("TemplateDescription", FieldType.STRING)
+    TemplateName: ModelField[Optional[str]] = ModelField("TemplateName", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,42 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class FlowCytometryChannelInfoModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type FlowCytometryChannelInfo
+    Data Type Display Name: Flow Cytometry Channel Info (Flow Cytometry Channel Info)
+    Fields: Annotation, AxisMax, AxisMin, AxisRange, ChannelName, TransformLogicleA, TransformLogicleM, TransformLogicleTop, TransformLogicleW, TransformMethod, TransformVarA, TransformVarB
+    """
+    DATA_TYPE_NAME: str = 'FlowCytometryChannelInfo'
+    ANNOTATION__FIELD_NAME: WrapperField = WrapperField("Annotation", FieldType.STRING)
+    AXISMAX__FIELD_NAME: WrapperField = WrapperField("AxisMax", FieldType.DOUBLE)
+    AXISMIN__FIELD_NAME: WrapperField = WrapperField("AxisMin", FieldType.DOUBLE)
+    AXISRANGE__FIELD_NAME: WrapperField = WrapperField("AxisRange", FieldType.DOUBLE)
+    CHANNELNAME__FIELD_NAME: WrapperField = WrapperField("ChannelName", FieldType.STRING)
+    TRANSFORMLOGICLEA__FIELD_NAME: WrapperField = WrapperField("TransformLogicleA", FieldType.DOUBLE)
+    TRANSFORMLOGICLEM__FIELD_NAME: WrapperField = WrapperField("TransformLogicleM", FieldType.DOUBLE)
+    TRANSFORMLOGICLETOP__FIELD_NAME: WrapperField = WrapperField("TransformLogicleTop", FieldType.DOUBLE)
+    TRANSFORMLOGICLEW__FIELD_NAME: WrapperField = WrapperField("TransformLogicleW", FieldType.DOUBLE)
+    TRANSFORMMETHOD__FIELD_NAME: WrapperField = WrapperField("TransformMethod", FieldType.PICKLIST)
+    TRANSFORMVARA__FIELD_NAME: WrapperField = WrapperField("TransformVarA", FieldType.DOUBLE)
+    TRANSFORMVARB__FIELD_NAME: WrapperField = WrapperField("TransformVarB", FieldType.DOUBLE)
+
+    Annotation: ModelField[Optional[str]] = ModelField("Annotation", FieldType.STRING)
+    AxisMax: ModelField[Optional[float]] = ModelField("AxisMax", FieldType.DOUBLE)
+    AxisMin: ModelField[Optional[float]] = ModelField("AxisMin", FieldType.DOUBLE)
+    AxisRange: ModelField[Optional[float]] = ModelField("AxisRange", FieldType.DOUBLE)
+    ChannelName: ModelField[Optional[str]] = ModelField("ChannelName", FieldType.STRING)
+    TransformLogicleA: ModelField[Optional[float]] = ModelField("TransformLogicleA", FieldType.DOUBLE)
+    TransformLogicleM: ModelField[Optional[float]] = ModelField("TransformLogicleM", FieldType.DOUBLE)
+    TransformLogicleTop: ModelField[Optional[float]] = ModelField("TransformLogicleTop", FieldType.DOUBLE)
+    TransformLogicleW: ModelField[Optional[float]] = ModelField("TransformLogicleW", FieldType.DOUBLE)
+    TransformMethod: ModelField[Optional[str]] = ModelField("TransformMethod", FieldType.PICKLIST)
+    TransformVarA: ModelField[Optional[float]] = ModelField("TransformVarA", FieldType.DOUBLE)
+    TransformVarB: ModelField[Optional[float]] = ModelField("TransformVarB", FieldType.DOUBLE)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,34 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class FlowDensityGateModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type FlowDensityGate
+    Data Type Display Name: Flow Density Gate (Flow Density Gates)
+    Fields: IsPositiveX, IsPositiveY, PercentileX, PercentileY, ShapeJSON, UserAnnotation, XChannelName, YChannelName
+    """
+    DATA_TYPE_NAME: str = 'FlowDensityGate'
+    ISPOSITIVEX__FIELD_NAME: WrapperField = WrapperField("IsPositiveX", FieldType.BOOLEAN)
+    ISPOSITIVEY__FIELD_NAME: WrapperField = WrapperField("IsPositiveY", FieldType.BOOLEAN)
+    PERCENTILEX__FIELD_NAME: WrapperField = WrapperField("PercentileX", FieldType.DOUBLE)
+    PERCENTILEY__FIELD_NAME: WrapperField = WrapperField("PercentileY", FieldType.DOUBLE)
+    SHAPEJSON__FIELD_NAME: WrapperField = WrapperField("ShapeJSON", FieldType.STRING)
+    USERANNOTATION__FIELD_NAME: WrapperField = WrapperField("UserAnnotation", FieldType.STRING)
+    XCHANNELNAME__FIELD_NAME: WrapperField = WrapperField("XChannelName", FieldType.STRING)
+    YCHANNELNAME__FIELD_NAME: WrapperField = WrapperField("YChannelName", FieldType.STRING)
+
+    IsPositiveX: ModelField[Optional[bool]] = ModelField("IsPositiveX", FieldType.BOOLEAN)
+    IsPositiveY: ModelField[Optional[bool]] = ModelField("IsPositiveY", FieldType.BOOLEAN)
+    PercentileX: ModelField[Optional[float]] = ModelField("PercentileX", FieldType.DOUBLE)
+    PercentileY: ModelField[Optional[float]] = ModelField("PercentileY", FieldType.DOUBLE)
+    ShapeJSON: ModelField[Optional[str]] = ModelField("ShapeJSON", FieldType.STRING)
+    UserAnnotation: ModelField[Optional[str]] = ModelField("UserAnnotation", FieldType.STRING)
+    XChannelName: ModelField[Optional[str]] = ModelField("XChannelName", FieldType.STRING)
+    YChannelName: ModelField[Optional[str]] = ModelField("YChannelName", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
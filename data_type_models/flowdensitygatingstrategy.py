@@ -0,0 +1,36 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class FlowDensityGatingStrategyModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type FlowDensityGatingStrategy
+    Data Type Display Name: Flow Density Gating Strategy (Flow Density Gating Strategies)
+    Fields: FilePath, IsEvaluated, IsPositiveX, IsPositiveY, PercentileX, PercentileY, VeloxCurrentVersion, XAxisChannel, YAxisChannel
+    """
+    DATA_TYPE_NAME: str = 'FlowDensityGatingStrategy'
+    FILEPATH__FIELD_NAME: WrapperField = WrapperField("FilePath", FieldType.STRING)
+    ISEVALUATED__FIELD_NAME: WrapperField = WrapperField("IsEvaluated", FieldType.BOOLEAN)
+    ISPOSITIVEX__FIELD_NAME: WrapperField = WrapperField("IsPositiveX", FieldType.BOOLEAN)
+    ISPOSITIVEY__FIELD_NAME: WrapperField = WrapperField("IsPositiveY", FieldType.BOOLEAN)
+    PERCENTILEX__FIELD_NAME: WrapperField = WrapperField("PercentileX", FieldType.DOUBLE)
+    PERCENTILEY__FIELD_NAME: WrapperField = WrapperField("PercentileY", FieldType.DOUBLE)
+    VELOXCURRENTVERSION__FIELD_NAME: WrapperField = WrapperField("VeloxCurrentVersion", FieldType.INTEGER)
+    XAXISCHANNEL__FIELD_NAME: WrapperField = WrapperField("XAxisChannel", FieldType.SELECTION)
+    YAXISCHANNEL__FIELD_NAME: WrapperField = WrapperField("YAxisChannel", FieldType.SELECTION)
+
+    FilePath: ModelField[Optional[str]] = ModelField("FilePath", FieldType.STRING)
+    IsEvaluated: ModelField[Optional[bool]] = ModelField("IsEvaluated", FieldType.BOOLEAN)
+    IsPositiveX: ModelField[Optional[bool]] = ModelField("IsPositiveX", FieldType.BOOLEAN)
+    IsPositiveY: ModelField[Optional[bool]] = ModelField("IsPositiveY", FieldType.BOOLEAN)
+    PercentileX: ModelField[Optional[float]] = ModelField("PercentileX", FieldType.DOUBLE)
+    PercentileY: ModelField[Optional[float]] = ModelField("PercentileY", FieldType.DOUBLE)
+    VeloxCurrentVersion: ModelField[Optional[int]] = ModelField("VeloxCurrentVersion", FieldType.INTEGER)
+    XAxisChannel: ModelField[Optional[str]] = ModelField("XAxisChannel", FieldType.SELECTION)
+    YAxisChannel: ModelField[Optional[str]] = ModelField("YAxisChannel", FieldType.SELECTION)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,32 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class FlowManualGateModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type FlowManualGate
+    Data Type Display Name: Flow Manual Gate (Flow Manual Gates)
+    Fields: IsNegated, ShapeID, ShapeJSON, ShapeType, UserAnnotation, XChannelName, YChannelName
+    """
+    DATA_TYPE_NAME: str = 'FlowManualGate'
+    ISNEGATED__FIELD_NAME: WrapperField = WrapperField("IsNegated", FieldType.BOOLEAN)
+    SHAPEID__FIELD_NAME: WrapperField = WrapperField("ShapeID", FieldType.LONG)
+    SHAPEJSON__FIELD_NAME: WrapperField = WrapperField("ShapeJSON", FieldType.STRING)
+    SHAPETYPE__FIELD_NAME: WrapperField = WrapperField("ShapeType", FieldType.STRING)
+    USERANNOTATION__FIELD_NAME: WrapperField = WrapperField("UserAnnotation", FieldType.STRING)
+    XCHANNELNAME__FIELD_NAME: WrapperField = WrapperField("XChannelName", FieldType.STRING)
+    YCHANNELNAME__FIELD_NAME: WrapperField = WrapperField("YChannelName", FieldType.STRING)
+
+    IsNegated: ModelField[Optional[bool]] = ModelField("IsNegated", FieldType.BOOLEAN)
+    ShapeID: ModelField[Optional[int]] = ModelField("ShapeID", FieldType.LONG)
+    ShapeJSON: ModelField[Optional[str]] = ModelField("ShapeJSON", FieldType.STRING)
+    ShapeType: ModelField[Optional[str]] = ModelField("ShapeType", FieldType.STRING)
+    UserAnnotation: ModelField[Optional[str]] = ModelField("UserAnnotation", FieldType.STRING)
+    XChannelName: ModelField[Optional[str]] = ModelField("XChannelName", FieldType.STRING)
+    YChannelName: ModelField[Optional[str]] = ModelField("YChannelName", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,44 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class FourPLLModelModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type FourPLLModel
+    Data Type Display Name: Four Parameter Logistic Regression (Four Parameter Logistic Regressions)
+    Fields: b, c, d, e, ED10, ED50, ED90, ED95, EntryName, MultiParentLink207, RSquared, SeriesName, SourceEntryId
+    Records advanced curve viewer's four parameter logistic regression result, when measuring sample data.
+    """
+    DATA_TYPE_NAME: str = 'FourPLLModel'
+    B__FIELD_NAME: WrapperField = WrapperField("b", FieldType.DOUBLE)
+    C__FIELD_NAME: WrapperField = WrapperField("c", FieldType.DOUBLE)
+    D__FIELD_NAME: WrapperField = WrapperField("d", FieldType.DOUBLE)
+    E__FIELD_NAME: WrapperField = WrapperField("e", FieldType.DOUBLE)
+    ED10__FIELD_NAME: WrapperField = WrapperField("ED10", FieldType.DOUBLE)
+    ED50__FIELD_NAME: WrapperField = WrapperField("ED50", FieldType.DOUBLE)
+    ED90__FIELD_NAME: WrapperField = WrapperField("ED90", FieldType.DOUBLE)
+    ED95__FIELD_NAME: WrapperField = WrapperField("ED95", FieldType.DOUBLE)
+    ENTRYNAME__FIELD_NAME: WrapperField = WrapperField("EntryName", FieldType.STRING)
+    MULTIPARENTLINK207__FIELD_NAME: WrapperField = WrapperField("MultiParentLink207", FieldType.MULTIPARENTLINK)
+    RSQUARED__FIELD_NAME: WrapperField = WrapperField("RSquared", FieldType.DOUBLE)
+    SERIESNAME__FIELD_NAME: WrapperField = WrapperField("SeriesName", FieldType.STRING)
+    SOURCEENTRYID__FIELD_NAME: WrapperField = WrapperField("SourceEntryId", FieldType.LONG)
+
+    b: ModelField[Optional[float]] = ModelField("b", FieldType.DOUBLE)
+    c: ModelField[Optional[float]] = ModelField("c", FieldType.DOUBLE)
+    d: ModelField[Optional[float]] = ModelField("d", FieldType.DOUBLE)
+    e: ModelField[Optional[float]] = ModelField("e", FieldType.DOUBLE)
+    ED10: ModelField[Optional[float]] = ModelField("ED10", FieldType.DOUBLE)
+    ED50: ModelField[Optional[float]] = ModelField("ED50", FieldType.DOUBLE)
+    ED90: ModelField[Optional[float]] = ModelField("ED90", FieldType.DOUBLE)
+    ED95: ModelField[Optional[float]] = ModelField("ED95", FieldType.DOUBLE)
+    EntryName: ModelField[Optional[str]] = ModelField("EntryName", FieldType.STRING)
+    RSquared: ModelField[Optional[float]] = ModelField("RSquared", FieldType.DOUBLE)
+    SeriesName: ModelField[Optional[str]] = ModelField("SeriesName", FieldType.STRING)
+    SourceEntryId: ModelField[Optional[int]] = ModelField("SourceEntryId", FieldType.LONG)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
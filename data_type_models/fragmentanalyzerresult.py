@@ -0,0 +1,26 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class FragmentAnalyzerResultModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type FragmentAnalyzerResult
+    Data Type Display Name: Fragment Analyzer Result (Fragment Analyzer Results)
+    Fields: AvgBPSize, Molarity, MolarityUnits, PeakRegionIdentifier
+    """
+    DATA_TYPE_NAME: str = 'FragmentAnalyzerResult'
+    AVGBPSIZE__FIELD_NAME: WrapperField = WrapperField("AvgBPSize", FieldType.DOUBLE)
+    MOLARITY__FIELD_NAME: WrapperField = WrapperField("Molarity", FieldType.DOUBLE)
+    MOLARITYUNITS__FIELD_NAME: WrapperField = WrapperField("MolarityUnits", FieldType.STRING)
+    PEAKREGIONIDENTIFIER__FIELD_NAME: WrapperField = WrapperField("PeakRegionIdentifier", FieldType.STRING)
+
+    AvgBPSize: ModelField[Optional[float]] = ModelField("AvgBPSize", FieldType.DOUBLE)
+    Molarity: ModelField[Optional[float]] = ModelField("Molarity", FieldType.DOUBLE)
+    MolarityUnits: ModelField[Optional[str]] = ModelField("MolarityUnits", FieldType.STRING)
+    PeakRegionIdentifier: ModelField[Optional[str]] = ModelField("PeakRegionIdentifier", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
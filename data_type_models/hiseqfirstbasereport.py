@@ -0,0 +1,41 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class HiSeqFirstBaseReportModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type HiSeqFirstBaseReport
+    Data Type Display Name: HiSeq First Base Report (HiSeq First Base Reports)
+    Fields: A_Focus_Score, A_Intensity, C_Focus_Score, C_Intensity, ClusterDensity, G_Focus_Score, G_Intensity, Lane, Surface, T_Focus_Score, T_Intensity
+     <!-- DISPLAY IN INSTRUMENT RUN MONITOR -->
+    """
+    DATA_TYPE_NAME: str = 'HiSeqFirstBaseReport'
+    A_FOCUS_SCORE__FIELD_NAME: WrapperField = WrapperField("A_Focus_Score", FieldType.DOUBLE)
+    A_INTENSITY__FIELD_NAME: WrapperField = WrapperField("A_Intensity", FieldType.DOUBLE)
+    C_FOCUS_SCORE__FIELD_NAME: WrapperField = WrapperField("C_Focus_Score", FieldType.DOUBLE)
+    C_INTENSITY__FIELD_NAME: WrapperField = WrapperField("C_Intensity", FieldType.DOUBLE)
+    CLUSTERDENSITY__FIELD_NAME: WrapperField = WrapperField("ClusterDensity", FieldType.DOUBLE)
+    G_FOCUS_SCORE__FIELD_NAME: WrapperField = WrapperField("G_Focus_Score", FieldType.DOUBLE)
+    G_INTENSITY__FIELD_NAME: WrapperField = WrapperField("G_Intensity", FieldType.DOUBLE)
+    LANE__FIELD_NAME: WrapperField = WrapperField("Lane", FieldType.STRING)
+    SURFACE__FIELD_NAME: WrapperField = WrapperField("Surface", FieldType.STRING)
+    T_FOCUS_SCORE__FIELD_NAME: WrapperField = WrapperField("T_Focus_Score", FieldType.DOUBLE)
+    T_INTENSITY__FIELD_NAME: WrapperField = WrapperField("T_Intensity", FieldType.DOUBLE)
+
+    A_Focus_Score: ModelField[Optional[float]] = ModelField("A_Focus_Score", FieldType.DOUBLE)
+    A_Intensity: ModelField[Optional[float]] = ModelField("A_Intensity", FieldType.DOUBLE)
+    C_Focus_Score: ModelField[Optional[float]] = ModelField("C_Focus_Score", FieldType.DOUBLE)
+    C_Intensity: ModelField[Optional[float]] = ModelField("C_Intensity", FieldType.DOUBLE)
+    ClusterDensity: ModelField[Optional[float]] = ModelField("ClusterDensity", FieldType.DOUBLE)
+    G_Focus_Score: ModelField[Optional[float]] = ModelField("G_Focus_Score", FieldType.DOUBLE)
+    G_Intensity: ModelField[Optional[float]] = ModelField("G_Intensity", FieldType.DOUBLE)
+    Lane: ModelField[Optional[str]] = ModelField("Lane", FieldType.STRING)
+    Surface: ModelField[Optional[str]] = ModelField("Surface", FieldType.STRING)
+    T_Focus_Score: ModelField[Optional[float]] = ModelField("T_Focus_Score", FieldType.DOUBLE)
+    T_Intensity: ModelField[Optional[float]] = ModelField("T_Intensity", FieldType.DOUBLE)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,22 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class IllSeqReadModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type IllSeqRead
+    Data Type Display Name: Illumina Sequencing Read (Illumina Sequencing Reads)
+    Fields: IsIndexedRead, NumCycles
+    """
+    DATA_TYPE_NAME: str = 'IllSeqRead'
+    ISINDEXEDREAD__FIELD_NAME: WrapperField = WrapperField("IsIndexedRead", FieldType.BOOLEAN)
+    NUMCYCLES__FIELD_NAME: WrapperField = WrapperField("NumCycles", FieldType.INTEGER)
+
+    IsIndexedRead: ModelField[Optional[bool]] = ModelField("IsIndexedRead", FieldType.BOOLEAN)
+    NumCycles: ModelField[Optional[int]] = ModelField("NumCycles", FieldType.INTEGER)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
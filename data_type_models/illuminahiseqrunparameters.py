@@ -0,0 +1,219 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class IlluminaHiSeqRunParametersModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type IlluminaHiSeqRunParameters
+    Data Type Display Name: Illumina HiSeq Run Parameters (Illumina HiSeq Run Parameters')
+    Fields: AdapterPlate, AlignToPhiXLane, ApplicationName, ApplicationVersion, AutoTiltOnce, Barcode, BaseSpaceRunId, BaseSpaceRunMonitoringOnly, BaseSpaceTempFolder, BaseSpaceUseBaseSpace, BaseSpaceUsername, CameraDriver, CameraFirmware, CanEditRunMode, ChemistryVersion, ComputerName, ControlLane, CopyImages, CPLDVersion, CVGainPosLocked, CVGainStart, DitherSize, EnableAnalysis, EnableAutoCenter, EnableBasecalling, EnableCameraLogging, EnableLft, EnableNotifications, ExperimentName, FCPosition, FirstBaseConfirmation, Flowcell, FocusCameraFirmware, FocusMethod, FPGAVersion, HotPixel, IGain, IHistory, ImageHeight, ImageWidth, IndexQuantity, IndexRead, IndexSerialNumber, IntensityCeiling, IsNew200Cycle, IsNew50Cycle, KeepIntensityFiles, LaneLength, MaxInitialZJumpHalfUm, MaxSubsequentZJumpHalfUm, MockRun, MotorDelayFrames, NumAnalysisThreads, NumberCyclesRemaining, NumberOfInitialZJumps, NumSwaths, NumTilesPerSwath, Offset, OutputFolder, PeQuantity, PerformPreRunFluidicsCheck, PeriodicSave, PeSerialNumber, Prime, PromptForPeReagents, Read1, Read2, RecipeFragmentVersion, Rehyb, Resume, ResumeCycle, RTAVersion, RunID, RunMode, RunStartDate, SampleSheet, SbsQuantity, SbsSerialNumber, ScanID, ScannerID, ScanNumber, SelectedSection_1, SelectedSection_2, SelectedSection_3, SelectedSection_4, SelectedSection_5, SelectedSection_6, SelectedSection_7, SelectedSection_8, SelectedSurface, SlideHolder, SupportMultipleSurfacesInUI, SwathScanMode, TempFolder, TemplateCycleCount, TileHeight, TileWidth, UseExistingRecipe, Username, WorkFlowType
+     <!-- DISPLAY IN INSTRUMENT RUN MONITOR -->
+    """
+    DATA_TYPE_NAME: str = 'IlluminaHiSeqRunParameters'
+    ADAPTERPLATE__FIELD_NAME: WrapperField = WrapperField("AdapterPlate", FieldType.STRING)
+    ALIGNTOPHIXLANE__FIELD_NAME: WrapperField = WrapperField("AlignToPhiXLane", FieldType.STRING)
+    APPLICATIONNAME__FIELD_NAME: WrapperField = WrapperField("ApplicationName", FieldType.STRING)
+    APPLICATIONVERSION__FIELD_NAME: WrapperField = WrapperField("ApplicationVersion", FieldType.STRING)
+    AUTOTILTONCE__FIELD_NAME: WrapperField = WrapperField("AutoTiltOnce", FieldType.BOOLEAN)
+    BARCODE__FIELD_NAME: WrapperField = WrapperField("Barcode", FieldType.STRING)
+    BASESPACERUNID__FIELD_NAME: WrapperField = WrapperField("BaseSpaceRunId", FieldType.STRING)
+    BASESPACERUNMONITORINGONLY__FIELD_NAME: WrapperField = WrapperField("BaseSpaceRunMonitoringOnly", FieldType.BOOLEAN)
+    BASESPACETEMPFOLDER__FIELD_NAME: WrapperField = WrapperField("BaseSpaceTempFolder", FieldType.STRING)
+    BASESPACEUSEBASESPACE__FIELD_NAME: WrapperField = WrapperField("BaseSpaceUseBaseSpace", FieldType.BOOLEAN)
+    BASESPACEUSERNAME__FIELD_NAME: WrapperField = WrapperField("BaseSpaceUsername", FieldType.STRING)
+    CAMERADRIVER__FIELD_NAME: WrapperField = WrapperField("CameraDriver", FieldType.STRING)
+    CAMERAFIRMWARE__FIELD_NAME: WrapperField = WrapperField("CameraFirmware", FieldType.STRING)
+    CANEDITRUNMODE__FIELD_NAME: WrapperField = WrapperField("CanEditRunMode", FieldType.BOOLEAN)
+    CHEMISTRYVERSION__FIELD_NAME: WrapperField = WrapperField("ChemistryVersion", FieldType.STRING)
+    COMPUTERNAME__FIELD_NAME: WrapperField = WrapperField("ComputerName", FieldType.STRING)
+    CONTROLLANE__FIELD_NAME: WrapperField = WrapperField("ControlLane", FieldType.STRING)
+    COPYIMAGES__FIELD_NAME: WrapperField = WrapperField("CopyImages", FieldType.BOOLEAN)
+    CPLDVERSION__FIELD_NAME: WrapperField = WrapperField("CPLDVersion", FieldType.STRING)
+    CVGAINPOSLOCKED__FIELD_NAME: WrapperField = WrapperField("CVGainPosLocked", FieldType.STRING)
+    CVGAINSTART__FIELD_NAME: WrapperField = WrapperField("CVGainStart", FieldType.STRING)
+    DITHERSIZE__FIELD_NAME: WrapperField = WrapperField("DitherSize", FieldType.STRING)
+    ENABLEANALYSIS__FIELD_NAME: WrapperField = WrapperField("EnableAnalysis", FieldType.BOOLEAN)
+    ENABLEAUTOCENTER__FIELD_NAME: WrapperField = WrapperField("EnableAutoCenter", FieldType.BOOLEAN)
+    ENABLEBASECALLING__FIELD_NAME: WrapperField = WrapperField("EnableBasecalling", FieldType.BOOLEAN)
+    ENABLECAMERALOGGING__FIELD_NAME: WrapperField = WrapperField("EnableCameraLogging", FieldType.BOOLEAN)
+    ENABLELFT__FIELD_NAME: WrapperField = WrapperField("EnableLft", FieldType.BOOLEAN)
+    ENABLENOTIFICATIONS__FIELD_NAME: WrapperField = WrapperField("EnableNotifications", FieldType.BOOLEAN)
+    EXPERIMENTNAME__FIELD_NAME: WrapperField = WrapperField("ExperimentName", FieldType.STRING)
+    FCPOSITION__FIELD_NAME: WrapperField = WrapperField("FCPosition", FieldType.STRING)
+    FIRSTBASECONFIRMATION__FIELD_NAME: WrapperField = WrapperField("FirstBaseConfirmation", FieldType.STRING)
+    FLOWCELL__FIELD_NAME: WrapperField = WrapperField("Flowcell", FieldType.STRING)
+    FOCUSCAMERAFIRMWARE__FIELD_NAME: WrapperField = WrapperField("FocusCameraFirmware", FieldType.STRING)
+    FOCUSMETHOD__FIELD_NAME: WrapperField = WrapperField("FocusMethod", FieldType.STRING)
+    FPGAVERSION__FIELD_NAME: WrapperField = WrapperField("FPGAVersion", FieldType.STRING)
+    HOTPIXEL__FIELD_NAME: WrapperField = WrapperField("HotPixel", FieldType.STRING)
+    IGAIN__FIELD_NAME: WrapperField = WrapperField("IGain", FieldType.STRING)
+    IHISTORY__FIELD_NAME: WrapperField = WrapperField("IHistory", FieldType.STRING)
+    IMAGEHEIGHT__FIELD_NAME: WrapperField = WrapperField("ImageHeight", FieldType.STRING)
+    IMAGEWIDTH__FIELD_NAME: WrapperField = WrapperField("ImageWidth", FieldType.STRING)
+    INDEXQUANTITY__FIELD_NAME: WrapperField = WrapperField("IndexQuantity", FieldType.DOUBLE)
+    INDEXREAD__FIELD_NAME: WrapperField = WrapperField("IndexRead", FieldType.STRING)
+    INDEXSERIALNUMBER__FIELD_NAME: WrapperField = WrapperField("IndexSerialNumber", FieldType.SELECTION)
+    INTENSITYCEILING__FIELD_NAME: WrapperField = WrapperField("IntensityCeiling", FieldType.STRING)
+    ISNEW200CYCLE__FIELD_NAME: WrapperField = WrapperField("IsNew200Cycle", FieldType.BOOLEAN)
+    ISNEW50CYCLE__FIELD_NAME: WrapperField = WrapperField("IsNew50Cycle", FieldType.BOOLEAN)
+    KEEPINTENSITYFILES__FIELD_NAME: WrapperField = WrapperField("KeepIntensityFiles", FieldType.STRING)
+    LANELENGTH__FIELD_NAME: WrapperField = WrapperField("LaneLength", FieldType.STRING)
+    MAXINITIALZJUMPHALFUM__FIELD_NAME: WrapperField = WrapperField("MaxInitialZJumpHalfUm", FieldType.STRING)
+    MAXSUBSEQUENTZJUMPHALFUM__FIELD_NAME: WrapperField = WrapperField("MaxSubsequentZJumpHalfUm", FieldType.STRING)
+    MOCKRUN__FIELD_NAME: WrapperField = WrapperField("MockRun", FieldType.BOOLEAN)
+    MOTORDELAYFRAMES__FIELD_NAME: WrapperField = WrapperField("MotorDelayFrames", FieldType.STRING)
+    NUMANALYSISTHREADS__FIELD_NAME: WrapperField = WrapperField("NumAnalysisThreads", FieldType.STRING)
+    NUMBERCYCLESREMAINING__FIELD_NAME: WrapperField = WrapperField("NumberCyclesRemaining", FieldType.LONG)
+    NUMBEROFINITIALZJUMPS__FIELD_NAME: WrapperField = WrapperField("NumberOfInitialZJumps", FieldType.STRING)
+    NUMSWATHS__FIELD_NAME: WrapperField = WrapperField("NumSwaths", FieldType.STRING)
+    NUMTILESPERSWATH__FIELD_NAME: WrapperField = WrapperField("NumTilesPerSwath", FieldType.STRING)
+    OFFSET__FIELD_NAME: WrapperField = WrapperField("Offset", FieldType.STRING)
+    OUTPUTFOLDER__FIELD_NAME: WrapperField = WrapperField("OutputFolder", FieldType.STRING)
+    PEQUANTITY__FIELD_NAME: WrapperField = WrapperField("PeQuantity", FieldType.DOUBLE)
+    PERFORMPRERUNFLUIDICSCHECK__FIELD_NAME: WrapperField = WrapperField("PerformPreRunFluidicsCheck", FieldType.BOOLEAN)
+    PERIODICSAVE__FIELD_NAME: WrapperField = WrapperField("PeriodicSave", FieldType.STRING)
+    PESERIALNUMBER__FIELD_NAME: WrapperField = WrapperField("PeSerialNumber", FieldType.SELECTION)
+    PRIME__FIELD_NAME: WrapperField = WrapperField("Prime", FieldType.BOOLEAN)
+    PROMPTFORPEREAGENTS__FIELD_NAME: WrapperField = WrapperField("PromptForPeReagents", FieldType.BOOLEAN)
+    READ1__FIELD_NAME: WrapperField = WrapperField("Read1", FieldType.STRING)
+    READ2__FIELD_NAME: WrapperField = WrapperField("Read2", FieldType.STRING)
+    RECIPEFRAGMENTVERSION__FIELD_NAME: WrapperField = WrapperField("RecipeFragmentVersion", FieldType.STRING)
+    REHYB__FIELD_NAME: WrapperField = WrapperField("Rehyb", FieldType.STRING)
+    RESUME__FIELD_NAME: WrapperField = WrapperField("Resume", FieldType.BOOLEAN)
+    RESUMECYCLE__FIELD_NAME: WrapperField = WrapperField("ResumeCycle", FieldType.STRING)
+    RTAVERSION__FIELD_NAME: WrapperField = WrapperField("RTAVersion", FieldType.STRING)
+    RUNID__FIELD_NAME: WrapperField = WrapperField("RunID", FieldType.STRING)
+    RUNMODE__FIELD_NAME: WrapperField = WrapperField("RunMode", FieldType.STRING)
+    RUNSTARTDATE__FIELD_NAME: WrapperField = WrapperField("RunStartDate", FieldType.DATE)
+    SAMPLESHEET__FIELD_NAME: WrapperField = WrapperField("SampleSheet", FieldType.STRING)
+    SBSQUANTITY__FIELD_NAME: WrapperField = WrapperField("SbsQuantity", FieldType.DOUBLE)
+    SBSSERIALNUMBER__FIELD_NAME: WrapperField = WrapperField("SbsSerialNumber", FieldType.SELECTION)
+    SCANID__FIELD_NAME: WrapperField = WrapperField("ScanID", FieldType.STRING)
+    SCANNERID__FIELD_NAME: WrapperField = WrapperField("ScannerID", FieldType.STRING)
+    SCANNUMBER__FIELD_NAME: WrapperField = WrapperField("ScanNumber", FieldType.LONG)
+    SELECTEDSECTION_1__FIELD_NAME: WrapperField = WrapperField("SelectedSection_1", FieldType.STRING)
+    SELECTEDSECTION_2__FIELD_NAME: WrapperField = WrapperField("SelectedSection_2", FieldType.STRING)
+    SELECTEDSECTION_3__FIELD_NAME: WrapperField = WrapperField("SelectedSection_3", FieldType.STRING)
+    SELECTEDSECTION_4__FIELD_NAME: WrapperField = WrapperField("SelectedSection_4", FieldType.STRING)
+    SELECTEDSECTION_5__FIELD_NAME: WrapperField = WrapperField("SelectedSection_5", FieldType.STRING)
+    SELECTEDSECTION_6__FIELD_NAME: WrapperField = WrapperField("SelectedSection_6", FieldType.STRING)
+    SELECTEDSECTION_7__FIELD_NAME: WrapperField = WrapperField("SelectedSection_7", FieldType.STRING)
+    SELECTEDSECTION_8__FIELD_NAME: WrapperField = WrapperField("SelectedSection_8", FieldType.STRING)
+    SELECTEDSURFACE__FIELD_NAME: WrapperField = WrapperField("SelectedSurface", FieldType.STRING)
+    SLIDEHOLDER__FIELD_NAME: WrapperField = WrapperField("SlideHolder", FieldType.STRING)
+    SUPPORTMULTIPLESURFACESINUI__FIELD_NAME: WrapperField = WrapperField("SupportMultipleSurfacesInUI", FieldType.BOOLEAN)
+    SWATHSCANMODE__FIELD_NAME: WrapperField = WrapperField("SwathScanMode", FieldType.STRING)
+    TEMPFOLDER__FIELD_NAME: WrapperField = WrapperField("TempFolder", FieldType.STRING)
+    TEMPLATECYCLECOUNT__FIELD_NAME: WrapperField = WrapperField("TemplateCycleCount", FieldType.STRING)
+    TILEHEIGHT__FIELD_NAME: WrapperField = WrapperField("TileHeight", FieldType.STRING)
+    TILEWIDTH__FIELD_NAME: WrapperField = WrapperField("TileWidth", FieldType.STRING)
+    USEEXISTINGRECIPE__FIELD_NAME: WrapperField = WrapperField("UseExistingRecipe", FieldType.BOOLEAN)
+    USERNAME__FIELD_NAME: WrapperField = WrapperField("Username", FieldType.STRING)
+    WORKFLOWTYPE__FIELD_NAME: WrapperField = WrapperField("WorkFlowType", FieldType.STRING)
+
+    AdapterPlate: ModelField[Optional[str]] = ModelField("AdapterPlate", FieldType.STRING)
+    AlignToPhiXLane: ModelField[Optional[str]] = ModelField("AlignToPhiXLane", FieldType.STRING)
+    ApplicationName: ModelField[Optional[str]] = ModelField("ApplicationName", FieldType.STRING)
+    ApplicationVersion: ModelField[Optional[str]] = ModelField("ApplicationVersion", FieldType.STRING)
+    AutoTiltOnce: ModelField[Optional[bool]] = ModelField("AutoTiltOnce", FieldType.BOOLEAN)
+    Barcode: ModelField[Optional[str]] = ModelField("Barcode", FieldType.STRING)
+    BaseSpaceRunId: ModelField[Optional[str]] = ModelField("BaseSpaceRunId", FieldType.STRING)
+    BaseSpaceRunMonitoringOnly: ModelField[Optional[bool]] = ModelField("BaseSpaceRunMonitoringOnly", FieldType.BOOLEAN)
+    BaseSpaceTempFolder: ModelField[Optional[str]] = ModelField("BaseSpaceTempFolder", FieldType.STRING)
+    BaseSpaceUseBaseSpace: ModelField[Optional[bool]] = ModelField("BaseSpaceUseBaseSpace", FieldType.BOOLEAN)
+    BaseSpaceUsername: ModelField[Optional[str]] = ModelField("BaseSpaceUsername", FieldType.STRING)
+    CameraDriver: ModelField[Optional[str]] = ModelField("CameraDriver", FieldType.STRING)
+    CameraFirmware: ModelField[Optional[str]] = ModelField("CameraFirmware", FieldType.STRING)
+    CanEditRunMode: ModelField[Optional[bool]] = ModelField("CanEditRunMode", FieldType.BOOLEAN)
+    ChemistryVersion: ModelField[Optional[str]] = ModelField("ChemistryVersion", FieldType.STRING)
+    ComputerName: ModelField[Optional[str]] = ModelField("ComputerName", FieldType.STRING)
+    ControlLane: ModelField[Optional[str]] = ModelField("ControlLane", FieldType.STRING)
+    CopyImages: ModelField[Optional[bool]] = ModelField("CopyImages", FieldType.BOOLEAN)
+    CPLDVersion: ModelField[Optional[str]] = ModelField("CPLDVersion", FieldType.STRING)
+    CVGainPosLocked: ModelField[Optional[str]] = ModelField("CVGainPosLocked", FieldType.STRING)
+    CVGainStart: ModelField[Optional[str]] = ModelField("CVGainStart", FieldType.STRING)
+    DitherSize: ModelField[Optional[str]] = ModelField("DitherSize", FieldType.STRING)
+    EnableAnalysis: ModelField[Optional[bool]] = ModelField("EnableAnalysis", FieldType.BOOLEAN)
+    EnableAutoCenter: ModelField[Optional[bool]] = ModelField("EnableAutoCenter", FieldType.BOOLEAN)
+    EnableBasecalling: ModelField[Optional[bool]] = ModelField("EnableBasecalling", FieldType.BOOLEAN)
+    EnableCameraLogging: ModelField[Optional[bool]] = ModelField("EnableCameraLogging", FieldType.BOOLEAN)
+    EnableLft: ModelField[Optional[bool]] = ModelField("EnableLft", FieldType.BOOLEAN)
+    EnableNotifications: ModelField[Optional[bool]] = ModelField("EnableNotifications", FieldType.BOOLEAN)
+    ExperimentName: ModelField[Optional[str]] = ModelField("ExperimentName", FieldType.STRING)
+    FCPosition: ModelField[Optional[str]] = ModelField("FCPosition", FieldType.STRING)
+    FirstBaseConfirmation: ModelField[Optional[str]] = ModelField("FirstBaseConfirmation", FieldType.STRING)
+    Flowcell: ModelField[Optional[str]] = ModelField("Flowcell", FieldType.STRING)
+    FocusCameraFirmware: ModelField[Optional[str]] = ModelField("FocusCameraFirmware", FieldType.STRING)
+    FocusMethod: ModelField[Optional[str]] = ModelField("FocusMethod", FieldType.STRING)
+    FPGAVersion: ModelField[Optional[str]] = ModelField("FPGAVersion", FieldType.STRING)
+    HotPixel: ModelField[Optional[str]] = ModelField("HotPixel", FieldType.STRING)
+    IGain: ModelField[Optional[str]] = ModelField("IGain", FieldType.STRING)
+    IHistory: ModelField[Optional[str]] = ModelField("IHistory", FieldType.STRING)
+    ImageHeight: ModelField[Optional[str]] = ModelField("ImageHeight", FieldType.STRING)
+    ImageWidth: ModelField[Optional[str]] = ModelField("ImageWidth", FieldType.STRING)
+    IndexQuantity: ModelField[Optional[float]] = ModelField("IndexQuantity", FieldType.DOUBLE)
+    IndexRead: ModelField[Optional[str]] = ModelField("IndexRead", FieldType.STRING)
+    IndexSerialNumber: ModelField[Optional[str]] = ModelField("IndexSerialNumber", FieldType.SELECTION)
+    IntensityCeiling: ModelField[Optional[str]] = ModelField("IntensityCeiling", FieldType.STRING)
+    IsNew200Cycle: ModelField[Optional[bool]] = ModelField("IsNew200Cycle", FieldType.BOOLEAN)
+    IsNew50Cycle: ModelField[Optional[bool]] = ModelField("IsNew50Cycle", FieldType.BOOLEAN)
+    KeepIntensityFiles: ModelField[Optional[str]] = ModelField("KeepIntensityFiles", FieldType.STRING)
+    LaneLength: ModelField[Optional[str]] = ModelField("LaneLength", FieldType.STRING)
+    MaxInitialZJumpHalfUm: ModelField[Optional[str]] = ModelField("MaxInitialZJumpHalfUm", FieldType.STRING)
+    MaxSubsequentZJumpHalfUm: ModelField[Optional[str]] = ModelField("MaxSubsequentZJumpHalfUm", FieldType.STRING)
+    MockRun: ModelField[Optional[bool]] = ModelField("MockRun", FieldType.BOOLEAN)
+    MotorDelayFrames: ModelField[Optional[str]] = ModelField("MotorDelayFrames", FieldType.STRING)
+    NumAnalysisThreads: ModelField[Optional[str]] = ModelField("NumAnalysisThreads", FieldType.STRING)
+    NumberCyclesRemaining: ModelField[Optional[int]] = ModelField("NumberCyclesRemaining", FieldType.LONG)
+    NumberOfInitialZJumps: ModelField[Optional[str]] = ModelField("NumberOfInitialZJumps", FieldType.STRING)
+    NumSwaths: ModelField[Optional[str]] = ModelField("NumSwaths", FieldType.STRING)
+    NumTilesPerSwath: ModelField[Optional[str]] = ModelField("NumTilesPerSwath", FieldType.STRING)
+    Offset: ModelField[Optional[str]] = ModelField("Offset", FieldType.STRING)
+    OutputFolder: ModelField[Optional[str]] = ModelField("OutputFolder", FieldType.STRING)
+    PeQuantity: ModelField[Optional[float]] = ModelField("PeQuantity", FieldType.DOUBLE)
+    PerformPreRunFluidicsCheck: ModelField[Optional[bool]] = ModelField("PerformPreRunFluidicsCheck", FieldType.BOOLEAN)
+    PeriodicSave: ModelField[Optional[str]] = ModelField("PeriodicSave", FieldType.STRING)
+    PeSerialNumber: ModelField[Optional[str]] = ModelField("PeSerialNumber", FieldType.SELECTION)
+    Prime: ModelField[Optional[bool]] = ModelField("Prime", FieldType.BOOLEAN)
+    PromptForPeReagents: ModelField[Optional[bool]] = ModelField("PromptForPeReagents", FieldType.BOOLEAN)
+    Read1: ModelField[Optional[str]] = ModelField("Read1", FieldType.STRING)
+    Read2: ModelField[Optional[str]] = ModelField("Read2", FieldType.STRING)
+    RecipeFragmentVersion: ModelField[Optional[str]] = ModelField("RecipeFragmentVersion", FieldType.STRING)
+    Rehyb: ModelField[Optional[str]] = ModelField("Rehyb", FieldType.STRING)
+    Resume: ModelField[Optional[bool]] = ModelField("Resume", FieldType.BOOLEAN)
+    ResumeCycle: ModelField[Optional[str]] = ModelField("ResumeCycle", FieldType.STRING)
+    RTAVersion: ModelField[Optional[str]] = ModelField("RTAVersion", FieldType.STRING)
+    RunID: ModelField[Optional[str]] = ModelField("RunID", FieldType.STRING)
+    RunMode: ModelField[Optional[str]] = ModelField("RunMode", FieldType.STRING)
+    RunStartDate: ModelField[Optional[int]] = ModelField("RunStartDate", FieldType.DATE)
+    SampleSheet: ModelField[Optional[str]] = ModelField("SampleSheet", FieldType.STRING)
+    SbsQuantity: ModelField[Optional[float]] = ModelField("SbsQuantity", FieldType.DOUBLE)
+    SbsSerialNumber: ModelField[Optional[str]] = ModelField("SbsSerialNumber", FieldType.SELECTION)
+    ScanID: ModelField[Optional[str]] = ModelField("ScanID", FieldType.STRING)
+    ScannerID: ModelField[Optional[str]] = ModelField("ScannerID", FieldType.STRING)
+    ScanNumber: ModelField[Optional[int]] = ModelField("ScanNumber", FieldType.LONG)
+    SelectedSection_1: ModelField[Optional[str]] = ModelField("SelectedSection_1", FieldType.STRING)
+    SelectedSection_2: ModelField[Optional[str]] = ModelField("SelectedSection_2", FieldType.STRING)
+    SelectedSection_3: ModelField[Optional[str]] = ModelField("SelectedSection_3", FieldType.STRING)
+    SelectedSection_4: ModelField[Optional[str]] = ModelField("SelectedSection_4", FieldType.STRING)
+    SelectedSection_5: ModelField[Optional[str]] = ModelField("SelectedSection_5", FieldType.STRING)
+    SelectedSection_6: ModelField[Optional[str]] = ModelField("SelectedSection_6", FieldType.STRING)
+    SelectedSection_7: ModelField[Optional[str]] = ModelField("SelectedSection_7", FieldType.STRING)
+    SelectedSection_8: ModelField[Optional[str]] = ModelField("SelectedSection_8", FieldType.STRING)
+    SelectedSurface: ModelField[Optional[str]] = ModelField("SelectedSurface", FieldType.STRING)
+    SlideHolder: ModelField[Optional[str]] = ModelField("SlideHolder", FieldType.STRING)
+    SupportMultipleSurfacesInUI: ModelField[Optional[bool]] = ModelField("SupportMultipleSurfacesInUI", FieldType.BOOLEAN)
+    SwathScanMode: ModelField[Optional[str]] = ModelField("SwathScanMode", FieldType.STRING)
+    TempFolder: ModelField[Optional[str]] = ModelField("TempFolder", FieldType.STRING)
+    TemplateCycleCount: ModelField[Optional[str]] = ModelField("TemplateCycleCount", FieldType.STRING)
+    TileHeight: ModelField[Optional[str]] = ModelField("TileHeight", FieldType.STRING)
+    TileWidth: ModelField[Optional[str]] = ModelField("TileWidth", FieldType.STRING)
+    UseExistingRecipe: ModelField[Optional[bool]] = ModelField("UseExistingRecipe", FieldType.BOOLEAN)
+    Username: ModelField[Optional[str]] = ModelField("Username", FieldType.STRING)
+    WorkFlowType: ModelField[Optional[str]] = ModelField("WorkFlowType", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,113 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class IlluminaMiSeqRunParametersModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type IlluminaMiSeqRunParameters
+    Data Type Display Name: Illumina MiSeq Run Parameters (Illumina MiSeq Run Parameters')
+    Fields: AfterRunWashMethod, AnalysisFolder, ApplicationName, ApplicationVersion, Chemistry, CloudRunId, CloudUsername, CopyManifests, EnableAnalysis, EnableCloud, ExperimentName, FlowcellExpirationDate, FlowcellPartNumber, FlowcellSerialNumber, FocusMethod, FPGAVersion, ILMNOnlyRecipeFolder, ManifestFolder, MCSVersion, MostRecentWashType, NumLanes, NumSwaths, NumTilesPerSwath, OutputFolder, PR2BottleExpirationDate, PR2BottlePartNumber, PR2BottleSerialNumber, ReagentKitExpirationDate, ReagentKitPartNumber, ReagentKitSerialNumber, ReagentKitVersion, RecipeFolder, Resumable, RTAVersion, RunID, RunNumber, RunStartDate, SampleSheetFolder, SampleSheetName, SaveFocusImages, SaveScanImages, ScannerID, SendInstrumentHealthToILMN, SupportMultipleSurfacesInUI, SurfaceToScan, TempFolder, Username
+     <!-- DISPLAY IN INSTRUMENT RUN MONITOR -->
+    """
+    DATA_TYPE_NAME: str = 'IlluminaMiSeqRunParameters'
+    AFTERRUNWASHMETHOD__FIELD_NAME: WrapperField = WrapperField("AfterRunWashMethod", FieldType.STRING)
+    ANALYSISFOLDER__FIELD_NAME: WrapperField = WrapperField("AnalysisFolder", FieldType.STRING)
+    APPLICATIONNAME__FIELD_NAME: WrapperField = WrapperField("ApplicationName", FieldType.STRING)
+    APPLICATIONVERSION__FIELD_NAME: WrapperField = WrapperField("ApplicationVersion", FieldType.STRING)
+    CHEMISTRY__FIELD_NAME: WrapperField = WrapperField("Chemistry", FieldType.STRING)
+    CLOUDRUNID__FIELD_NAME: WrapperField = WrapperField("CloudRunId", FieldType.STRING)
+    CLOUDUSERNAME__FIELD_NAME: WrapperField = WrapperField("CloudUsername", FieldType.STRING)
+    COPYMANIFESTS__FIELD_NAME: WrapperField = WrapperField("CopyManifests", FieldType.BOOLEAN)
+    ENABLEANALYSIS__FIELD_NAME: WrapperField = WrapperField("EnableAnalysis", FieldType.BOOLEAN)
+    ENABLECLOUD__FIELD_NAME: WrapperField = WrapperField("EnableCloud", FieldType.BOOLEAN)
+    EXPERIMENTNAME__FIELD_NAME: WrapperField = WrapperField("ExperimentName", FieldType.STRING)
+    FLOWCELLEXPIRATIONDATE__FIELD_NAME: WrapperField = WrapperField("FlowcellExpirationDate", FieldType.STRING)
+    FLOWCELLPARTNUMBER__FIELD_NAME: WrapperField = WrapperField("FlowcellPartNumber", FieldType.STRING)
+    FLOWCELLSERIALNUMBER__FIELD_NAME: WrapperField = WrapperField("FlowcellSerialNumber", FieldType.STRING)
+    FOCUSMETHOD__FIELD_NAME: WrapperField = WrapperField("FocusMethod", FieldType.STRING)
+    FPGAVERSION__FIELD_NAME: WrapperField = WrapperField("FPGAVersion", FieldType.STRING)
+    ILMNONLYRECIPEFOLDER__FIELD_NAME: WrapperField = WrapperField("ILMNOnlyRecipeFolder", FieldType.STRING)
+    MANIFESTFOLDER__FIELD_NAME: WrapperField = WrapperField("ManifestFolder", FieldType.STRING)
+    MCSVERSION__FIELD_NAME: WrapperField = WrapperField("MCSVersion", FieldType.STRING)
+    MOSTRECENTWASHTYPE__FIELD_NAME: WrapperField = WrapperField("MostRecentWashType", FieldType.STRING)
+    NUMLANES__FIELD_NAME: WrapperField = WrapperField("NumLanes", FieldType.LONG)
+    NUMSWATHS__FIELD_NAME: WrapperField = WrapperField("NumSwaths", FieldType.LONG)
+    NUMTILESPERSWATH__FIELD_NAME: WrapperField = WrapperField("NumTilesPerSwath", FieldType.LONG)
+    OUTPUTFOLDER__FIELD_NAME: WrapperField = WrapperField("OutputFolder", FieldType.STRING)
+    PR2BOTTLEEXPIRATIONDATE__FIELD_NAME: WrapperField = WrapperField("PR2BottleExpirationDate", FieldType.STRING)
+    PR2BOTTLEPARTNUMBER__FIELD_NAME: WrapperField = WrapperField("PR2BottlePartNumber", FieldType.STRING)
+    PR2BOTTLESERIALNUMBER__FIELD_NAME: WrapperField = WrapperField("PR2BottleSerialNumber", FieldType.STRING)
+    REAGENTKITEXPIRATIONDATE__FIELD_NAME: WrapperField = WrapperField("ReagentKitExpirationDate", FieldType.STRING)
+    REAGENTKITPARTNUMBER__FIELD_NAME: WrapperField = WrapperField("ReagentKitPartNumber", FieldType.STRING)
+    REAGENTKITSERIALNUMBER__FIELD_NAME: WrapperField = WrapperField("ReagentKitSerialNumber", FieldType.STRING)
+    REAGENTKITVERSION__FIELD_NAME: WrapperField = WrapperField("ReagentKitVersion", FieldType.STRING)
+    RECIPEFOLDER__FIELD_NAME: WrapperField = WrapperField("RecipeFolder", FieldType.STRING)
+    RESUMABLE__FIELD_NAME: WrapperField = WrapperField("Resumable", FieldType.BOOLEAN)
+    RTAVERSION__FIELD_NAME: WrapperField = WrapperField("RTAVersion", FieldType.STRING)
+    RUNID__FIELD_NAME: WrapperField = WrapperField("RunID", FieldType.STRING)
+    RUNNUMBER__FIELD_NAME: WrapperField = WrapperField("RunNumber", FieldType.LONG)
+    RUNSTARTDATE__FIELD_NAME: WrapperField = WrapperField("RunStartDate", FieldType.DATE)
+    SAMPLESHEETFOLDER__FIELD_NAME: WrapperField = WrapperField("SampleSheetFolder", FieldType.STRING)
+    SAMPLESHEETNAME__FIELD_NAME: WrapperField = WrapperField("SampleSheetName", FieldType.STRING)
+    SAVEFOCUSIMAGES__FIELD_NAME: WrapperField = WrapperField("SaveFocusImages", FieldType.BOOLEAN)
+    SAVESCANIMAGES__FIELD_NAME: WrapperField = WrapperField("SaveScanImages", FieldType.BOOLEAN)
+    SCANNERID__FIELD_NAME: WrapperField = WrapperField("ScannerID", FieldType.STRING)
+    SENDINSTRUMENTHEALTHTOILMN__FIELD_NAME: WrapperField = WrapperField("SendInstrumentHealthToILMN", FieldType.BOOLEAN)
+    SUPPORTMULTIPLESURFACESINUI__FIELD_NAME: WrapperField = WrapperField("SupportMultipleSurfacesInUI", FieldType.BOOLEAN)
+    SURFACETOSCAN__FIELD_NAME: WrapperField = WrapperField("SurfaceToScan", FieldType.STRING)
+    TEMPFOLDER__FIELD_NAME: WrapperField = WrapperField("TempFolder", FieldType.STRING)
+    USERNAME__FIELD_NAME: WrapperField = WrapperField("Username", FieldType.STRING)
+
+    AfterRunWashMethod: ModelField[Optional[str]] = ModelField("AfterRunWashMethod", FieldType.STRING)
+    AnalysisFolder: ModelField[Optional[str]] = ModelField("AnalysisFolder", FieldType.STRING)
+    ApplicationName: ModelField[Optional[str]] = ModelField("ApplicationName", FieldType.STRING)
+    ApplicationVersion: ModelField[Optional[str]] = ModelField("ApplicationVersion", FieldType.STRING)
+    Chemistry: ModelField[Optional[str]] = ModelField("Chemistry", FieldType.STRING)
+    CloudRunId: ModelField[Optional[str]] = ModelField("CloudRunId", FieldType.STRING)
+    CloudUsername: ModelField[Optional[str]] = ModelField("CloudUsername", FieldType.STRING)
+    CopyManifests: ModelField[Optional[bool]] = ModelField("CopyManifests", FieldType.BOOLEAN)
+    EnableAnalysis: ModelField[Optional[bool]] = ModelField("EnableAnalysis", FieldType.BOOLEAN)
+    EnableCloud: ModelField[Optional[bool]] = ModelField("EnableCloud", FieldType.BOOLEAN)
+    ExperimentName: ModelField[Optional[str]] = ModelField("ExperimentName", FieldType.STRING)
+    FlowcellExpirationDate: ModelField[Optional[str]] = ModelField("FlowcellExpirationDate", FieldType.STRING)
+    FlowcellPartNumber: ModelField[Optional[str]] = ModelField("FlowcellPartNumber", FieldType.STRING)
+    FlowcellSerialNumber: ModelField[Optional[str]] = ModelField("FlowcellSerialNumber", FieldType.STRING)
+    FocusMethod: ModelField[Optional[str]] = ModelField("FocusMethod", FieldType.STRING)
+    FPGAVersion: ModelField[Optional[str]] = ModelField("FPGAVersion", FieldType.STRING)
+    ILMNOnlyRecipeFolder: ModelField[Optional[str]] = ModelField("ILMNOnlyRecipeFolder", FieldType.STRING)
+    ManifestFolder: ModelField[Optional[str]] = ModelField("ManifestFolder", FieldType.STRING)
+    MCSVersion: ModelField[Optional[str]] = ModelField("MCSVersion", FieldType.STRING)
+    MostRecentWashType: ModelField[Optional[str]] = ModelField("MostRecentWashType", FieldType.STRING)
+    NumLanes: ModelField[Optional[int]] = ModelField("NumLanes", FieldType.LONG)
+    NumSwaths: ModelField[Optional[int]] = ModelField("NumSwaths", FieldType.LONG)
+    NumTilesPerSwath: ModelField[Optional[int]] = ModelField("NumTilesPerSwath", FieldType.LONG)
+    OutputFolder: ModelField[Optional[str]] = ModelField("OutputFolder", FieldType.STRING)
+    PR2BottleExpirationDate: ModelField[Optional[str]] = ModelField("PR2BottleExpirationDate", FieldType.STRING)
+    PR2BottlePartNumber: ModelField[Optional[str]] = ModelField("PR2BottlePartNumber", FieldType.STRING)
+    PR2BottleSerialNumber: ModelField[Optional[str]] = ModelField("PR2BottleSerialNumber", FieldType.STRING)
+    ReagentKitExpirationDate: ModelField[Optional[str]] = ModelField("ReagentKitExpirationDate", FieldType.STRING)
+    ReagentKitPartNumber: ModelField[Optional[str]] = ModelField("ReagentKitPartNumber", FieldType.STRING)
+    ReagentKitSerialNumber: ModelField[Optional[str]] = ModelField("ReagentKitSerialNumber", FieldType.STRING)
+    ReagentKitVersion: ModelField[Optional[str]] = ModelField("ReagentKitVersion", FieldType.STRING)
+    RecipeFolder: ModelField[Optional[str]] = ModelField("RecipeFolder", FieldType.STRING)
+    Resumable: ModelField[Optional[bool]] = ModelField("Resumable", FieldType.BOOLEAN)
+    RTAVersion: ModelField[Optional[str]] = ModelField("RTAVersion", FieldType.STRING)
+    RunID: ModelField[Optional[str]] = ModelField("RunID", FieldType.STRING)
+    RunNumber: ModelField[Optional[int]] = ModelField("RunNumber", FieldType.LONG)
+    RunStartDate: ModelField[Optional[int]] = ModelField("RunStartDate", FieldType.DATE)
+    SampleSheetFolder: ModelField[Optional[str]] = ModelField("SampleSheetFolder", FieldType.STRING)
+    SampleSheetName: ModelField[Optional[str]] = ModelField("SampleSheetName", FieldType.STRING)
+    SaveFocusImages: ModelField[Optional[bool]] = ModelField("SaveFocusImages", FieldType.BOOLEAN)
+    SaveScanImages: ModelField[Optional[bool]] = ModelField("SaveScanImages", FieldType.BOOLEAN)
+    ScannerID: ModelField[Optional[str]] = ModelField("ScannerID", FieldType.STRING)
+    SendInstrumentHealthToILMN: ModelField[Optional[bool]] = ModelField("SendInstrumentHealthToILMN", FieldType.BOOLEAN)
+    SupportMultipleSurfacesInUI: ModelField[Optional[bool]] = ModelField("SupportMultipleSurfacesInUI", FieldType.BOOLEAN)
+    SurfaceToScan: ModelField[Optional[str]] = ModelField("SurfaceToScan", FieldType.STRING)
+    TempFolder: ModelField[Optional[str]] = ModelField("TempFolder", FieldType.STRING)
+    Username: ModelField[Optional[str]] = ModelField("Username", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
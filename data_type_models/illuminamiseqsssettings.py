@@ -0,0 +1,88 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class IlluminaMiSeqSSSettingsModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type IlluminaMiSeqSSSettings
+    Data Type Display Name: Illumina MiSeq Sample Sheet Settings (Illumina MiSeq Sample Sheet Settings)
+    Fields: Adapter, AdapterRead2, AdapterTrimmingStringency, Aligner, Assay, BaitManifestFileName, CustomAmpliconAlignerMaxIndel, CustomIndexPrimerMix, CustomRead1PrimerMix, CustomRead2PrimerMix, CyclesRead1, CyclesRead2, Description, EnrichmentMaxRegionStatistics, ExcludeRegionsManifestA, ExperimentName, FilterOutSingleStrandVariants, FlagPCRDuplicates, IndexReads, InvestigatorName, Kmer, MinimumCoverageDepth, OutputGenomeVCF, PercentTilesToScan, PicardHSmetrics, QualityScoreTrim, ReadType, ReagentCartridgeBarcode, ReverseComplement, RunDate, StitchReads, TaxonomyFile, VariantCaller, VariantFilterQualityCutoff, Workflow
+    """
+    DATA_TYPE_NAME: str = 'IlluminaMiSeqSSSettings'
+    ADAPTER__FIELD_NAME: WrapperField = WrapperField("Adapter", FieldType.STRING)
+    ADAPTERREAD2__FIELD_NAME: WrapperField = WrapperField("AdapterRead2", FieldType.STRING)
+    ADAPTERTRIMMINGSTRINGENCY__FIELD_NAME: WrapperField = WrapperField("AdapterTrimmingStringency", FieldType.STRING)
+    ALIGNER__FIELD_NAME: WrapperField = WrapperField("Aligner", FieldType.STRING)
+    ASSAY__FIELD_NAME: WrapperField = WrapperField("Assay", FieldType.STRING)
+    BAITMANIFESTFILENAME__FIELD_NAME: WrapperField = WrapperField("BaitManifestFileName", FieldType.STRING)
+    CUSTOMAMPLICONALIGNERMAXINDEL__FIELD_NAME: WrapperField = WrapperField("CustomAmpliconAlignerMaxIndel", FieldType.STRING)
+    CUSTOMINDEXPRIMERMIX__FIELD_NAME: WrapperField = WrapperField("CustomIndexPrimerMix", FieldType.STRING)
+    CUSTOMREAD1PRIMERMIX__FIELD_NAME: WrapperField = WrapperField("CustomRead1PrimerMix", FieldType.STRING)
+    CUSTOMREAD2PRIMERMIX__FIELD_NAME: WrapperField = WrapperField("CustomRead2PrimerMix", FieldType.STRING)
+    CYCLESREAD1__FIELD_NAME: WrapperField = WrapperField("CyclesRead1", FieldType.INTEGER)
+    CYCLESREAD2__FIELD_NAME: WrapperField = WrapperField("CyclesRead2", FieldType.INTEGER)
+    DESCRIPTION__FIELD_NAME: WrapperField = WrapperField("Description", FieldType.STRING)
+    ENRICHMENTMAXREGIONSTATISTICS__FIELD_NAME: WrapperField = WrapperField("EnrichmentMaxRegionStatistics", FieldType.STRING)
+    EXCLUDEREGIONSMANIFESTA__FIELD_NAME: WrapperField = WrapperField("ExcludeRegionsManifestA", FieldType.STRING)
+    EXPERIMENTNAME__FIELD_NAME: WrapperField = WrapperField("ExperimentName", FieldType.STRING)
+    FILTEROUTSINGLESTRANDVARIANTS__FIELD_NAME: WrapperField = WrapperField("FilterOutSingleStrandVariants", FieldType.STRING)
+    FLAGPCRDUPLICATES__FIELD_NAME: WrapperField = WrapperField("FlagPCRDuplicates", FieldType.BOOLEAN)
+    INDEXREADS__FIELD_NAME: WrapperField = WrapperField("IndexReads", FieldType.SHORT)
+    INVESTIGATORNAME__FIELD_NAME: WrapperField = WrapperField("InvestigatorName", FieldType.STRING)
+    KMER__FIELD_NAME: WrapperField = WrapperField("Kmer", FieldType.STRING)
+    MINIMUMCOVERAGEDEPTH__FIELD_NAME: WrapperField = WrapperField("MinimumCoverageDepth", FieldType.STRING)
+    OUTPUTGENOMEVCF__FIELD_NAME: WrapperField = WrapperField("OutputGenomeVCF", FieldType.BOOLEAN)
+    PERCENTTILESTOSCAN__FIELD_NAME: WrapperField = WrapperField("PercentTilesToScan", FieldType.STRING)
+    PICARDHSMETRICS__FIELD_NAME: WrapperField = WrapperField("PicardHSmetrics", FieldType.BOOLEAN)
+    QUALITYSCORETRIM__FIELD_NAME: WrapperField = WrapperField("QualityScoreTrim", FieldType.STRING)
+    READTYPE__FIELD_NAME: WrapperField = WrapperField("ReadType", FieldType.PICKLIST)
+    REAGENTCARTRIDGEBARCODE__FIELD_NAME: WrapperField = WrapperField("ReagentCartridgeBarcode", FieldType.STRING)
+    REVERSECOMPLEMENT__FIELD_NAME: WrapperField = WrapperField("ReverseComplement", FieldType.BOOLEAN)
+    RUNDATE__FIELD_NAME: WrapperField = WrapperField("RunDate", FieldType.DATE)
+    STITCHREADS__FIELD_NAME: WrapperField = WrapperField("StitchReads", FieldType.BOOLEAN)
+    TAXONOMYFILE__FIELD_NAME: WrapperField = WrapperField("TaxonomyFile", FieldType.STRING)
+    VARIANTCALLER__FIELD_NAME: WrapperField = WrapperField("VariantCaller", FieldType.STRING)
+    VARIANTFILTERQUALITYCUTOFF__FIELD_NAME: WrapperField = WrapperField("VariantFilterQualityCutoff", FieldType.STRING)
+    WORKFLOW__FIELD_NAME: WrapperField = WrapperField("Workflow", FieldType.STRING)
+
+    Adapter: ModelField[Optional[str]] = ModelField("Adapter", FieldType.STRING)
+    AdapterRead2: ModelField[Optional[str]] = ModelField("AdapterRead2", FieldType.STRING)
+    AdapterTrimmingStringency: ModelField[Optional[str]] = ModelField("AdapterTrimmingStringency", FieldType.STRING)
+    Aligner: ModelField[Optional[str]] = ModelField("Aligner", FieldType.STRING)
+    Assay: ModelField[Optional[str]] = ModelField("Assay", FieldType.STRING)
+    BaitManifestFileName: ModelField[Optional[str]] = ModelField("BaitManifestFileName", FieldType.STRING)
+    CustomAmpliconAlignerMaxIndel: ModelField[Optional[str]] = ModelField("CustomAmpliconAlignerMaxIndel", FieldType.STRING)
+    CustomIndexPrimerMix: ModelField[Optional[str]] = ModelField("CustomIndexPrimerMix", FieldType.STRING)
+    CustomRead1PrimerMix: ModelField[Optional[str]] = ModelField("CustomRead1PrimerMix", FieldType.STRING)
+    CustomRead2PrimerMix: ModelField[Optional[str]] = ModelField("CustomRead2PrimerMix", FieldType.STRING)
+    CyclesRead1: ModelField[Optional[int]] = ModelField("CyclesRead1", FieldType.INTEGER)
+    CyclesRead2: ModelField[Optional[int]] = ModelField("CyclesRead2", FieldType.INTEGER)
+    Description: ModelField[Optional[str]] = ModelField("Description", FieldType.STRING)
+    EnrichmentMaxRegionStatistics: ModelField[Optional[str]] = ModelField("EnrichmentMaxRegionStatistics", FieldType.STRING)
+    ExcludeRegionsManifestA: ModelField[Optional[str]] = ModelField("ExcludeRegionsManifestA", FieldType.STRING)
+    ExperimentName: ModelField[Optional[str]] = ModelField("ExperimentName", FieldType.STRING)
+    FilterOutSingleStrandVariants: ModelField[Optional[str]] = ModelField("FilterOutSingleStrandVariants", FieldType.STRING)
+    FlagPCRDuplicates: ModelField[Optional[bool]] = ModelField("FlagPCRDuplicates", FieldType.BOOLEAN)
+    IndexReads: ModelField[Optional[int]] = ModelField("IndexReads", FieldType.SHORT)
+    InvestigatorName: ModelField[Optional[str]] = ModelField("InvestigatorName", FieldType.STRING)
+    Kmer: ModelField[Optional[str]] = ModelField("Kmer", FieldType.STRING)
+    MinimumCoverageDepth: ModelField[Optional[str]] = ModelField("MinimumCoverageDepth", FieldType.STRING)
+    OutputGenomeVCF: ModelField[Optional[bool]] = ModelField("OutputGenomeVCF", FieldType.BOOLEAN)
+    PercentTilesToScan: ModelField[Optional[str]] = ModelField("PercentTilesToScan", FieldType.STRING)
+    PicardHSmetrics: ModelField[Optional[bool]] = ModelField("PicardHSmetrics", FieldType.BOOLEAN)
+    QualityScoreTrim: ModelField[Optional[str]] = ModelField("QualityScoreTrim", FieldType.STRING)
+    ReadType: ModelField[Optional[str]] = ModelField("ReadType", FieldType.PICKLIST)
+    ReagentCartridgeBarcode: ModelField[Optional[str]] = ModelField("ReagentCartridgeBarcode", FieldType.STRING)
+    ReverseComplement: ModelField[Optional[bool]] = ModelField("ReverseComplement", FieldType.BOOLEAN)
+    RunDate: ModelField[Optional[int]] = ModelField("RunDate", FieldType.DATE)
+    StitchReads: ModelField[Optional[bool]] = ModelField("StitchReads", FieldType.BOOLEAN)
+    TaxonomyFile: ModelField[Optional[str]] = ModelField("TaxonomyFile", FieldType.STRING)
+    VariantCaller: ModelField[Optional[str]] = ModelField("VariantCaller", FieldType.STRING)
+    VariantFilterQualityCutoff: ModelField[Optional[str]] = ModelField("VariantFilterQualityCutoff", FieldType.STRING)
+    Workflow: ModelField[Optional[str]] = ModelField("Workflow", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,27 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class IlluminaNextGenConfigModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type IlluminaNextGenConfig
+    Data Type Display Name: Illumina Next-Gen Configuration (Illumina Next-Gen Configurations)
+    Fields: AssociatedProcessName, Description, MultiplexInstructions, RunType
+    Configuration fields required for the Illumina Next-Gen Sequencing request form
+    """
+    DATA_TYPE_NAME: str = 'IlluminaNextGenConfig'
+    ASSOCIATEDPROCESSNAME__FIELD_NAME: WrapperField = WrapperField("AssociatedProcessName", FieldType.STRING)
+    DESCRIPTION__FIELD_NAME: WrapperField = WrapperField("Description", FieldType.STRING)
+    MULTIPLEXINSTRUCTIONS__FIELD_NAME: WrapperField = WrapperField("MultiplexInstructions", FieldType.SELECTION)
+    RUNTYPE__FIELD_NAME: WrapperField = WrapperField("RunType", FieldType.SELECTION)
+
+    AssociatedProcessName: ModelField[Optional[str]] = ModelField("AssociatedProcessName", FieldType.STRING)
+    Description: ModelField[Optional[str]] = ModelField("Description", FieldType.STRING)
+    MultiplexInstructions: ModelField[Optional[str]] = ModelField("MultiplexInstructions", FieldType.SELECTION)
+    RunType: ModelField[Optional[str]] = ModelField("RunType", FieldType.SELECTION)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,111 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class IlluminaNextSeqRunParametersModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type IlluminaNextSeqRunParameters
+    Data Type Display Name: Illumina NextSeq Run Parameters (Illumina NextSeq Run Parameters')
+    Fields: AnalysisWorkflowType, ApplicationName, ApplicationVersion, BaseSpaceRunId, BaseSpaceRunMode, Chemistry, ComputerName, CustomReadOnePrimer, CustomReadTwoPrimer, ExperimentName, FlowCellSerial, FocusMethod, Index1Read, Index2Read, InstrumentID, IsPairedEnd, LanePerSection, LibraryID, NumLanes, NumSwaths, NumTilesPerSwath, OutputFolder, PR2BottleSerial, Read1, Read2, ReagentKitSerial, RecipeFolder, RKitSerialEnteredInBaseSpace, RTAVersion, RunFolder, RunID, RunManagementType, RunNumber, RunStartDate, SaveFocusImages, SaveScanImages, SectionPerLane, SelectiveSave, SeqCompletedWithoutErrors, SequencingCompletedOrAborted, SequencingStarted, SupportMultipleSurfacesInUI, SurfaceToScan, UsesCustomIndexPrimer, UsesCustomPrimer1, UsesCustomPrimer2
+     <!-- DISPLAY IN INSTRUMENT RUN MONITOR -->
+    """
+    DATA_TYPE_NAME: str = 'IlluminaNextSeqRunParameters'
+    ANALYSISWORKFLOWTYPE__FIELD_NAME: WrapperField = WrapperField("AnalysisWorkflowType", FieldType.STRING)
+    APPLICATIONNAME__FIELD_NAME: WrapperField = WrapperField("ApplicationName", FieldType.STRING)
+    APPLICATIONVERSION__FIELD_NAME: WrapperField = WrapperField("ApplicationVersion", FieldType.STRING)
+    BASESPACERUNID__FIELD_NAME: WrapperField = WrapperField("BaseSpaceRunId", FieldType.STRING)
+    BASESPACERUNMODE__FIELD_NAME: WrapperField = WrapperField("BaseSpaceRunMode", FieldType.STRING)
+    CHEMISTRY__FIELD_NAME: WrapperField = WrapperField("Chemistry", FieldType.STRING)
+    COMPUTERNAME__FIELD_NAME: WrapperField = WrapperField("ComputerName", FieldType.STRING)
+    CUSTOMREADONEPRIMER__FIELD_NAME: WrapperField = WrapperField("CustomReadOnePrimer", FieldType.STRING)
+    CUSTOMREADTWOPRIMER__FIELD_NAME: WrapperField = WrapperField("CustomReadTwoPrimer", FieldType.STRING)
+    EXPERIMENTNAME__FIELD_NAME: WrapperField = WrapperField("ExperimentName", FieldType.STRING)
+    FLOWCELLSERIAL__FIELD_NAME: WrapperField = WrapperField("FlowCellSerial", FieldType.STRING)
+    FOCUSMETHOD__FIELD_NAME: WrapperField = WrapperField("FocusMethod", FieldType.STRING)
+    INDEX1READ__FIELD_NAME: WrapperField = WrapperField("Index1Read", FieldType.LONG)
+    INDEX2READ__FIELD_NAME: WrapperField = WrapperField("Index2Read", FieldType.LONG)
+    INSTRUMENTID__FIELD_NAME: WrapperField = WrapperField("InstrumentID", FieldType.STRING)
+    ISPAIREDEND__FIELD_NAME: WrapperField = WrapperField("IsPairedEnd", FieldType.BOOLEAN)
+    LANEPERSECTION__FIELD_NAME: WrapperField = WrapperField("LanePerSection", FieldType.LONG)
+    LIBRARYID__FIELD_NAME: WrapperField = WrapperField("LibraryID", FieldType.STRING)
+    NUMLANES__FIELD_NAME: WrapperField = WrapperField("NumLanes", FieldType.LONG)
+    NUMSWATHS__FIELD_NAME: WrapperField = WrapperField("NumSwaths", FieldType.LONG)
+    NUMTILESPERSWATH__FIELD_NAME: WrapperField = WrapperField("NumTilesPerSwath", FieldType.LONG)
+    OUTPUTFOLDER__FIELD_NAME: WrapperField = WrapperField("OutputFolder", FieldType.STRING)
+    PR2BOTTLESERIAL__FIELD_NAME: WrapperField = WrapperField("PR2BottleSerial", FieldType.STRING)
+    READ1__FIELD_NAME: WrapperField = WrapperField("Read1", FieldType.LONG)
+    READ2__FIELD_NAME: WrapperField = WrapperField("Read2", FieldType.LONG)
+    REAGENTKITSERIAL__FIELD_NAME: WrapperField = WrapperField("ReagentKitSerial", FieldType.STRING)
+    RECIPEFOLDER__FIELD_NAME: WrapperField = WrapperField("RecipeFolder", FieldType.STRING)
+    RKITSERIALENTEREDINBASESPACE__FIELD_NAME: WrapperField = WrapperField("RKitSerialEnteredInBaseSpace", FieldType.BOOLEAN)
+    RTAVERSION__FIELD_NAME: WrapperField = WrapperField("RTAVersion", FieldType.STRING)
+    RUNFOLDER__FIELD_NAME: WrapperField = WrapperField("RunFolder", FieldType.STRING)
+    RUNID__FIELD_NAME: WrapperField = WrapperField("RunID", FieldType.STRING)
+    RUNMANAGEMENTTYPE__FIELD_NAME: WrapperField = WrapperField("RunManagementType", FieldType.STRING)
+    RUNNUMBER__FIELD_NAME: WrapperField = WrapperField("RunNumber", FieldType.LONG)
+    RUNSTARTDATE__FIELD_NAME: WrapperField = WrapperField("RunStartDate", FieldType.DATE)
+    SAVEFOCUSIMAGES__FIELD_NAME: WrapperField = WrapperField("SaveFocusImages", FieldType.BOOLEAN)
+    SAVESCANIMAGES__FIELD_NAME: WrapperField = WrapperField("SaveScanImages", FieldType.BOOLEAN)
+    SECTIONPERLANE__FIELD_NAME: WrapperField = WrapperField("SectionPerLane", FieldType.LONG)
+    SELECTIVESAVE__FIELD_NAME: WrapperField = WrapperField("SelectiveSave", FieldType.BOOLEAN)
+    SEQCOMPLETEDWITHOUTERRORS__FIELD_NAME: WrapperField = WrapperField("SeqCompletedWithoutErrors", FieldType.BOOLEAN)
+    SEQUENCINGCOMPLETEDORABORTED__FIELD_NAME: WrapperField = WrapperField("SequencingCompletedOrAborted", FieldType.BOOLEAN)
+    SEQUENCINGSTARTED__FIELD_NAME: WrapperField = WrapperField("SequencingStarted", FieldType.BOOLEAN)
+    SUPPORTMULTIPLESURFACESINUI__FIELD_NAME: WrapperField = WrapperField("SupportMultipleSurfacesInUI", FieldType.BOOLEAN)
+    SURFACETOSCAN__FIELD_NAME: WrapperField = WrapperField("SurfaceToScan", FieldType.STRING)
+    USESCUSTOMINDEXPRIMER__FIELD_NAME: WrapperField = WrapperField("UsesCustomIndexPrimer", FieldType.BOOLEAN)
+    USESCUSTOMPRIMER1__FIELD_NAME: WrapperField = WrapperField("UsesCustomPrimer1", FieldType.BOOLEAN)
+    USESCUSTOMPRIMER2__FIELD_NAME: WrapperField = WrapperField("UsesCustomPrimer2", FieldType.BOOLEAN)
+
+    AnalysisWorkflowType: ModelField[Optional[str]] = ModelField("AnalysisWorkflowType", FieldType.STRING)
+    ApplicationName: ModelField[Optional[str]] = ModelField("ApplicationName", FieldType.STRING)
+    ApplicationVersion: ModelField[Optional[str]] = ModelField("ApplicationVersion", FieldType.STRING)
+    BaseSpaceRunId: ModelField[Optional[str]] = ModelField("BaseSpaceRunId", FieldType.STRING)
+    BaseSpaceRunMode: ModelField[Optional[str]] = ModelField("BaseSpaceRunMode", FieldType.STRING)
+    Chemistry: ModelField[Optional[str]] = ModelField("Chemistry", FieldType.STRING)
+    ComputerName: ModelField[Optional[str]] = ModelField("ComputerName", FieldType.STRING)
+    CustomReadOnePrimer: ModelField[Optional[str]] = ModelField("CustomReadOnePrimer", FieldType.STRING)
+    CustomReadTwoPrimer: ModelField[Optional[str]] = ModelField("CustomReadTwoPrimer", FieldType.STRING)
+    ExperimentName: ModelField[Optional[str]] = ModelField("ExperimentName", FieldType.STRING)
+    FlowCellSerial: ModelField[Optional[str]] = ModelField("FlowCellSerial", FieldType.STRING)
+    FocusMethod: ModelField[Optional[str]] = ModelField("FocusMethod", FieldType.STRING)
+    Index1Read: ModelField[Optional[int]] = ModelField("Index1Read", FieldType.LONG)
+    Index2Read: ModelField[Optional[int]] = ModelField("Index2Read", FieldType.LONG)
+    InstrumentID: ModelField[Optional[str]] = ModelField("InstrumentID", FieldType.STRING)
+    IsPairedEnd: ModelField[Optional[bool]] = ModelField("IsPairedEnd", FieldType.BOOLEAN)
+    LanePerSection: ModelField[Optional[int]] = ModelField("LanePerSection", FieldType.LONG)
+    LibraryID: ModelField[Optional[str]] = ModelField("LibraryID", FieldType.STRING)
+    NumLanes: ModelField[Optional[int]] = ModelField("NumLanes", FieldType.LONG)
+    NumSwaths: ModelField[Optional[int]] = ModelField("NumSwaths", FieldType.LONG)
+    NumTilesPerSwath: ModelField[Optional[int]] = ModelField("NumTilesPerSwath", FieldType.LONG)
+    OutputFolder: ModelField[Optional[str]] = ModelField("OutputFolder", FieldType.STRING)
+    PR2BottleSerial: ModelField[Optional[str]] = ModelField("PR2BottleSerial", FieldType.STRING)
+    Read1: ModelField[Optional[int]] = ModelField("Read1", FieldType.LONG)
+    Read2: ModelField[Optional[int]] = ModelField("Read2", FieldType.LONG)
+    ReagentKitSerial: ModelField[Optional[str]] = ModelField("ReagentKitSerial", FieldType.STRING)
+    RecipeFolder: ModelField[Optional[str]] = ModelField("RecipeFolder", FieldType.STRING)
+    RKitSerialEnteredInBaseSpace: ModelField[Optional[bool]] = ModelField("RKitSerialEnteredInBaseSpace", FieldType.BOOLEAN)
+    RTAVersion: ModelField[Optional[str]] = ModelField("RTAVersion", FieldType.STRING)
+    RunFolder: ModelField[Optional[str]] = ModelField("RunFolder", FieldType.STRING)
+    RunID: ModelField[Optional[str]] = ModelField("RunID", FieldType.STRING)
+    RunManagementType: ModelField[Optional[str]] = ModelField("RunManagementType", FieldType.STRING)
+    RunNumber: ModelField[Optional[int]] = ModelField("RunNumber", FieldType.LONG)
+    RunStartDate: ModelField[Optional[int]] = ModelField("RunStartDate", FieldType.DATE)
+    SaveFocusImages: ModelField[Optional[bool]] = ModelField("SaveFocusImages", FieldType.BOOLEAN)
+    SaveScanImages: ModelField[Optional[bool]] = ModelField("SaveScanImages", FieldType.BOOLEAN)
+    SectionPerLane: ModelField[Optional[int]] = ModelField("SectionPerLane", FieldType.LONG)
+    SelectiveSave: ModelField[Optional[bool]] = ModelField("SelectiveSave", FieldType.BOOLEAN)
+    SeqCompletedWithoutErrors: ModelField[Optional[bool]] = ModelField("SeqCompletedWithoutErrors", FieldType.BOOLEAN)
+    SequencingCompletedOrAborted: ModelField[Optional[bool]] = ModelField("SequencingCompletedOrAborted", FieldType.BOOLEAN)
+    SequencingStarted: ModelField[Optional[bool]] = ModelField("SequencingStarted", FieldType.BOOLEAN)
+    SupportMultipleSurfacesInUI: ModelField[Optional[bool]] = ModelField("SupportMultipleSurfacesInUI", FieldType.BOOLEAN)
+    SurfaceToScan: ModelField[Optional[str]] = ModelField("SurfaceToScan", FieldType.STRING)
+    UsesCustomIndexPrimer: ModelField[Optional[bool]] = ModelField("UsesCustomIndexPrimer", FieldType.BOOLEAN)
+    UsesCustomPrimer1: ModelField[Optional[bool]] = ModelField("UsesCustomPrimer1", FieldType.BOOLEAN)
+    UsesCustomPrimer2: ModelField[Optional[bool]] = ModelField("UsesCustomPrimer2", FieldType.BOOLEAN)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,60 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class IlluminaNextSeqSSSettingsModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type IlluminaNextSeqSSSettings
+    Data Type Display Name: Illumina NextSeq Sample Sheet Settings (Illumina NextSeq Sample Sheet Settings)
+    Fields: Adapter, AdapterRead2, AdapterTrimmingStringency, Assay, CustomIndexPrimerMix, CustomRead1PrimerMix, CustomRead2PrimerMix, CyclesRead1, CyclesRead2, DateUnix, Description, ExperimentName, FilterOutSingleStrandVariants, IndexReads, InvestigatorName, PercentTilesToScan, QualityScoreTrim, ReadType, ReagentCartridgeBarcode, StitchReads, Workflow
+    """
+    DATA_TYPE_NAME: str = 'IlluminaNextSeqSSSettings'
+    ADAPTER__FIELD_NAME: WrapperField = WrapperField("Adapter", FieldType.STRING)
+    ADAPTERREAD2__FIELD_NAME: WrapperField = WrapperField("AdapterRead2", FieldType.STRING)
+    ADAPTERTRIMMINGSTRINGENCY__FIELD_NAME: WrapperField = WrapperField("AdapterTrimmingStringency", FieldType.STRING)
+    ASSAY__FIELD_NAME: WrapperField = WrapperField("Assay", FieldType.STRING)
+    CUSTOMINDEXPRIMERMIX__FIELD_NAME: WrapperField = WrapperField("CustomIndexPrimerMix", FieldType.STRING)
+    CUSTOMREAD1PRIMERMIX__FIELD_NAME: WrapperField = WrapperField("CustomRead1PrimerMix", FieldType.STRING)
+    CUSTOMREAD2PRIMERMIX__FIELD_NAME: WrapperField = WrapperField("CustomRead2PrimerMix", FieldType.STRING)
+    CYCLESREAD1__FIELD_NAME: WrapperField = WrapperField("CyclesRead1", FieldType.INTEGER)
+    CYCLESREAD2__FIELD_NAME: WrapperField = WrapperField("CyclesRead2", FieldType.INTEGER)
+    DATEUNIX__FIELD_NAME: WrapperField = WrapperField("DateUnix", FieldType.DATE)
+    DESCRIPTION__FIELD_NAME: WrapperField = WrapperField("Description", FieldType.STRING)
+    EXPERIMENTNAME__FIELD_NAME: WrapperField = WrapperField("ExperimentName", FieldType.STRING)
+    FILTEROUTSINGLESTRANDVARIANTS__FIELD_NAME: WrapperField = WrapperField("FilterOutSingleStrandVariants", FieldType.STRING)
+    INDEXREADS__FIELD_NAME: WrapperField = WrapperField("IndexReads", FieldType.SHORT)
+    INVESTIGATORNAME__FIELD_NAME: WrapperField = WrapperField("InvestigatorName", FieldType.STRING)
+    PERCENTTILESTOSCAN__FIELD_NAME: WrapperField = WrapperField("PercentTilesToScan", FieldType.STRING)
+    QUALITYSCORETRIM__FIELD_NAME: WrapperField = WrapperField("QualityScoreTrim", FieldType.STRING)
+    READTYPE__FIELD_NAME: WrapperField = WrapperField("ReadType", FieldType.PICKLIST)
+    REAGENTCARTRIDGEBARCODE__FIELD_NAME: WrapperField = WrapperField("ReagentCartridgeBarcode", FieldType.STRING)
+    STITCHREADS__FIELD_NAME: WrapperField = WrapperField("StitchReads", FieldType.BOOLEAN)
+    WORKFLOW__FIELD_NAME: WrapperField = WrapperField("Workflow", FieldType.STRING)
+
+    Adapter: ModelField[Optional[str]] = ModelField("Adapter", FieldType.STRING)
+    AdapterRead2: ModelField[Optional[str]] = ModelField("AdapterRead2", FieldType.STRING)
+    AdapterTrimmingStringency: ModelField[Optional[str]] = ModelField("AdapterTrimmingStringency", FieldType.STRING)
+    Assay: ModelField[Optional[str]] = ModelField("Assay", FieldType.STRING)
+    CustomIndexPrimerMix: ModelField[Optional[str]] = ModelField("CustomIndexPrimerMix", FieldType.STRING)
+    CustomRead1PrimerMix: ModelField[Optional[str]] = ModelField("CustomRead1PrimerMix", FieldType.STRING)
+    CustomRead2PrimerMix: ModelField[Optional[str]] = ModelField("CustomRead2PrimerMix", FieldType.STRING)
+    CyclesRead1: ModelField[Optional[int]] = ModelField("CyclesRead1", FieldType.INTEGER)
+    CyclesRead2: ModelField[Optional[int]] = ModelField("CyclesRead2", FieldType.INTEGER)
+    DateUnix: ModelField[Optional[int]] = ModelField("DateUnix", FieldType.DATE)
+    Description: ModelField[Optional[str]] = ModelField("Description", FieldType.STRING)
+    ExperimentName: ModelField[Optional[str]] = ModelField("ExperimentName", FieldType.STRING)
+    FilterOutSingleStrandVariants: ModelField[Optional[str]] = ModelField("FilterOutSingleStrandVariants", FieldType.STRING)
+    IndexReads: ModelField[Optional[int]] = ModelField("IndexReads", FieldType.SHORT)
+    InvestigatorName: ModelField[Optional[str]] = ModelField("InvestigatorName", FieldType.STRING)
+    PercentTilesToScan: ModelField[Optional[str]] = ModelField("PercentTilesToScan", FieldType.STRING)
+    QualityScoreTrim: ModelField[Optional[str]] = ModelField("QualityScoreTrim", FieldType.STRING)
+    ReadType: ModelField[Optional[str]] = ModelField("ReadType", FieldType.PICKLIST)
+    ReagentCartridgeBarcode: ModelField[Optional[str]] = ModelField("ReagentCartridgeBarcode", FieldType.STRING)
+    StitchReads: ModelField[Optional[bool]] = ModelField("StitchReads", FieldType.BOOLEAN)
+    Workflow: ModelField[Optional[str]] = ModelField("Workflow", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
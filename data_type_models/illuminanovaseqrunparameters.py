@@ -0,0 +1,181 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class IlluminaNovaSeqRunParametersModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type IlluminaNovaSeqRunParameters
+    Data Type Display Name: Illumina NovaSeq Run Parameters (Illumina NovaSeq Run Parameters)
+    Fields: Application, ApplicationVersion, AttachmentFile, Autocenter, BiDirectionalScanning, BufferExpirationdate, BufferLotNumber, BufferNumberOfCyclesRemaining, BufferPartNumber, BufferRssi, BufferSerialBarcode, BufferStartDate, BufferSupportedModes, CeLinuxRunFolder, CeMountRunFolder, ClusterCycleKit, ClusterExpirationdate, ClusterLotNumber, ClusterNumberOfCyclesRemaining, ClusterPartNumber, ClusterRssi, ClusterSerialBarcode, ClusterStartDate, ClusterSupportedModes, ExperimentName, FlowCellExpirationdate, FlowCellLotNumber, FlowCellMode, FlowCellNumberOfReuseRemaining, FlowCellPartNumber, FlowCellRssi, FlowCellSerialBarcode, FlowCellStartDate, FlowCellSupportedModes, IndexRead1NumberOfCycles, IndexRead2NumberOfCycles, InstrumentName, IsRehyb, LibraryTubeExpirationdate, LibraryTubeLotNumber, LibraryTubePartNumber, LibraryTubeRssi, LibraryTubeSerialBarcode, LibraryTubeStartDate, LibraryTubeSupportedModes, OutputRunFolder, PlannedIndex1ReadCycles, PlannedIndex2ReadCycles, PlannedRead1Cycles, PlannedRead2Cycles, PlatformType, PreRunFolder, Read1NumberOfCycles, Read2NumberOfCycles, ReadType, RecipeFilePath, RecipeVersion, RtaRawRunFolder, RtaVersion, RunId, RunNumber, RunStartDate, SbcRunFolder, SbsCycleKit, SbsExpirationdate, SbsLotNumber, SbsNumberOfCyclesRemaining, SbsNumberOfCyclesSupported, SbsPartNumber, SbsRssi, SbsSerialBarcode, SbsStartDate, SbsSupportedModes, SendIlluminaHealthData, Side, Surface, UcsRunId, UcsVersion, UseCustomIndexRead1Primer, UseCustomRead1Primer, UseCustomRead2Primer
+     <!-- DISPLAY IN INSTRUMENT RUN MONITOR -->
+    """
+    DATA_TYPE_NAME: str = 'IlluminaNovaSeqRunParameters'
+    APPLICATION__FIELD_NAME: WrapperField = WrapperField("Application", FieldType.STRING)
+    APPLICATIONVERSION__FIELD_NAME: WrapperField = WrapperField("ApplicationVersion", FieldType.STRING)
+    ATTACHMENTFILE__FIELD_NAME: WrapperField = WrapperField("AttachmentFile", FieldType.STRING)
+    AUTOCENTER__FIELD_NAME: WrapperField = WrapperField("Autocenter", FieldType.BOOLEAN)
+    BIDIRECTIONALSCANNING__FIELD_NAME: WrapperField = WrapperField("BiDirectionalScanning", FieldType.BOOLEAN)
+    BUFFEREXPIRATIONDATE__FIELD_NAME: WrapperField = WrapperField("BufferExpirationdate", FieldType.DATE)
+    BUFFERLOTNUMBER__FIELD_NAME: WrapperField = WrapperField("BufferLotNumber", FieldType.INTEGER)
+    BUFFERNUMBEROFCYCLESREMAINING__FIELD_NAME: WrapperField = WrapperField("BufferNumberOfCyclesRemaining", FieldType.INTEGER)
+    BUFFERPARTNUMBER__FIELD_NAME: WrapperField = WrapperField("BufferPartNumber", FieldType.INTEGER)
+    BUFFERRSSI__FIELD_NAME: WrapperField = WrapperField("BufferRssi", FieldType.INTEGER)
+    BUFFERSERIALBARCODE__FIELD_NAME: WrapperField = WrapperField("BufferSerialBarcode", FieldType.STRING)
+    BUFFERSTARTDATE__FIELD_NAME: WrapperField = WrapperField("BufferStartDate", FieldType.DATE)
+    BUFFERSUPPORTEDMODES__FIELD_NAME: WrapperField = WrapperField("BufferSupportedModes", FieldType.STRING)
+    CELINUXRUNFOLDER__FIELD_NAME: WrapperField = WrapperField("CeLinuxRunFolder", FieldType.STRING)
+    CEMOUNTRUNFOLDER__FIELD_NAME: WrapperField = WrapperField("CeMountRunFolder", FieldType.STRING)
+    CLUSTERCYCLEKIT__FIELD_NAME: WrapperField = WrapperField("ClusterCycleKit", FieldType.INTEGER)
+    CLUSTEREXPIRATIONDATE__FIELD_NAME: WrapperField = WrapperField("ClusterExpirationdate", FieldType.DATE)
+    CLUSTERLOTNUMBER__FIELD_NAME: WrapperField = WrapperField("ClusterLotNumber", FieldType.INTEGER)
+    CLUSTERNUMBEROFCYCLESREMAINING__FIELD_NAME: WrapperField = WrapperField("ClusterNumberOfCyclesRemaining", FieldType.INTEGER)
+    CLUSTERPARTNUMBER__FIELD_NAME: WrapperField = WrapperField("ClusterPartNumber", FieldType.STRING)
+    CLUSTERRSSI__FIELD_NAME: WrapperField = WrapperField("ClusterRssi", FieldType.INTEGER)
+    CLUSTERSERIALBARCODE__FIELD_NAME: WrapperField = WrapperField("ClusterSerialBarcode", FieldType.STRING)
+    CLUSTERSTARTDATE__FIELD_NAME: WrapperField = WrapperField("ClusterStartDate", FieldType.DATE)
+    CLUSTERSUPPORTEDMODES__FIELD_NAME: WrapperField = WrapperField("ClusterSupportedModes", FieldType.STRING)
+    EXPERIMENTNAME__FIELD_NAME: WrapperField = WrapperField("ExperimentName", FieldType.STRING)
+    FLOWCELLEXPIRATIONDATE__FIELD_NAME: WrapperField = WrapperField("FlowCellExpirationdate", FieldType.DATE)
+    FLOWCELLLOTNUMBER__FIELD_NAME: WrapperField = WrapperField("FlowCellLotNumber", FieldType.INTEGER)
+    FLOWCELLMODE__FIELD_NAME: WrapperField = WrapperField("FlowCellMode", FieldType.STRING)
+    FLOWCELLNUMBEROFREUSEREMAINING__FIELD_NAME: WrapperField = WrapperField("FlowCellNumberOfReuseRemaining", FieldType.INTEGER)
+    FLOWCELLPARTNUMBER__FIELD_NAME: WrapperField = WrapperField("FlowCellPartNumber", FieldType.STRING)
+    FLOWCELLRSSI__FIELD_NAME: WrapperField = WrapperField("FlowCellRssi", FieldType.INTEGER)
+    FLOWCELLSERIALBARCODE__FIELD_NAME: WrapperField = WrapperField("FlowCellSerialBarcode", FieldType.STRING)
+    FLOWCELLSTARTDATE__FIELD_NAME: WrapperField = WrapperField("FlowCellStartDate", FieldType.DATE)
+    FLOWCELLSUPPORTEDMODES__FIELD_NAME: WrapperField = WrapperField("FlowCellSupportedModes", FieldType.STRING)
+    INDEXREAD1NUMBEROFCYCLES__FIELD_NAME: WrapperField = WrapperField("IndexRead1NumberOfCycles", FieldType.INTEGER)
+    INDEXREAD2NUMBEROFCYCLES__FIELD_NAME: WrapperField = WrapperField("IndexRead2NumberOfCycles", FieldType.INTEGER)
+    INSTRUMENTNAME__FIELD_NAME: WrapperField = WrapperField("InstrumentName", FieldType.STRING)
+    ISREHYB__FIELD_NAME: WrapperField = WrapperField("IsRehyb", FieldType.BOOLEAN)
+    LIBRARYTUBEEXPIRATIONDATE__FIELD_NAME: WrapperField = WrapperField("LibraryTubeExpirationdate", FieldType.DATE)
+    LIBRARYTUBELOTNUMBER__FIELD_NAME: WrapperField = WrapperField("LibraryTubeLotNumber", FieldType.INTEGER)
+    LIBRARYTUBEPARTNUMBER__FIELD_NAME: WrapperField = WrapperField("LibraryTubePartNumber", FieldType.INTEGER)
+    LIBRARYTUBERSSI__FIELD_NAME: WrapperField = WrapperField("LibraryTubeRssi", FieldType.INTEGER)
+    LIBRARYTUBESERIALBARCODE__FIELD_NAME: WrapperField = WrapperField("LibraryTubeSerialBarcode", FieldType.STRING)
+    LIBRARYTUBESTARTDATE__FIELD_NAME: WrapperField = WrapperField("LibraryTubeStartDate", FieldType.DATE)
+    LIBRARYTUBESUPPORTEDMODES__FIELD_NAME: WrapperField = WrapperField("LibraryTubeSupportedModes", FieldType.STRING)
+    OUTPUTRUNFOLDER__FIELD_NAME: WrapperField = WrapperField("OutputRunFolder", FieldType.STRING)
+    PLANNEDINDEX1READCYCLES__FIELD_NAME: WrapperField = WrapperField("PlannedIndex1ReadCycles", FieldType.INTEGER)
+    PLANNEDINDEX2READCYCLES__FIELD_NAME: WrapperField = WrapperField("PlannedIndex2ReadCycles", FieldType.INTEGER)
+    PLANNEDREAD1CYCLES__FIELD_NAME: WrapperField = WrapperField("PlannedRead1Cycles", FieldType.INTEGER)
+    PLANNEDREAD2CYCLES__FIELD_NAME: WrapperField = WrapperField("PlannedRead2Cycles", FieldType.INTEGER)
+    PLATFORMTYPE__FIELD_NAME: WrapperField = WrapperField("PlatformType", FieldType.STRING)
+    PRERUNFOLDER__FIELD_NAME: WrapperField = WrapperField("PreRunFolder", FieldType.STRING)
+    READ1NUMBEROFCYCLES__FIELD_NAME: WrapperField = WrapperField("Read1NumberOfCycles", FieldType.INTEGER)
+    READ2NUMBEROFCYCLES__FIELD_NAME: WrapperField = WrapperField("Read2NumberOfCycles", FieldType.INTEGER)
+    READTYPE__FIELD_NAME: WrapperField = WrapperField("ReadType", FieldType.STRING)
+    RECIPEFILEPATH__FIELD_NAME: WrapperField = WrapperField("RecipeFilePath", FieldType.STRING)
+    RECIPEVERSION__FIELD_NAME: WrapperField = WrapperField("RecipeVersion", FieldType.STRING)
+    RTARAWRUNFOLDER__FIELD_NAME: WrapperField = WrapperField("RtaRawRunFolder", FieldType.STRING)
+    RTAVERSION__FIELD_NAME: WrapperField = WrapperField("RtaVersion", FieldType.STRING)
+    RUNID__FIELD_NAME: WrapperField = WrapperField("RunId", FieldType.STRING)
+    RUNNUMBER__FIELD_NAME: WrapperField = WrapperField("RunNumber", FieldType.INTEGER)
+    RUNSTARTDATE__FIELD_NAME: WrapperField = WrapperField("RunStartDate", FieldType.STRING)
+    SBCRUNFOLDER__FIELD_NAME: WrapperField = WrapperField("SbcRunFolder", FieldType.STRING)
+    SBSCYCLEKIT__FIELD_NAME: WrapperField = WrapperField("SbsCycleKit", FieldType.INTEGER)
+    SBSEXPIRATIONDATE__FIELD_NAME: WrapperField = WrapperField("SbsExpirationdate", FieldType.DATE)
+    SBSLOTNUMBER__FIELD_NAME: WrapperField = WrapperField("SbsLotNumber", FieldType.INTEGER)
+    SBSNUMBEROFCYCLESREMAINING__FIELD_NAME: WrapperField = WrapperField("SbsNumberOfCyclesRemaining", FieldType.INTEGER)
+    SBSNUMBEROFCYCLESSUPPORTED__FIELD_NAME: WrapperField = WrapperField("SbsNumberOfCyclesSupported", FieldType.INTEGER)
+    SBSPARTNUMBER__FIELD_NAME: WrapperField = WrapperField("SbsPartNumber", FieldType.STRING)
+    SBSRSSI__FIELD_NAME: WrapperField = WrapperField("SbsRssi", FieldType.INTEGER)
+    SBSSERIALBARCODE__FIELD_NAME: WrapperField = WrapperField("SbsSerialBarcode", FieldType.STRING)
+    SBSSTARTDATE__FIELD_NAME: WrapperField = WrapperField("SbsStartDate", FieldType.DATE)
+    SBSSUPPORTEDMODES__FIELD_NAME: WrapperField = WrapperField("SbsSupportedModes", FieldType.STRING)
+    SENDILLUMINAHEALTHDATA__FIELD_NAME: WrapperField = WrapperField("SendIlluminaHealthData", FieldType.BOOLEAN)
+    SIDE__FIELD_NAME: WrapperField = WrapperField("Side", FieldType.STRING)
+    SURFACE__FIELD_NAME: WrapperField = WrapperField("Surface", FieldType.STRING)
+    UCSRUNID__FIELD_NAME: WrapperField = WrapperField("UcsRunId", FieldType.STRING)
+    UCSVERSION__FIELD_NAME: WrapperField = WrapperField("UcsVersion", FieldType.STRING)
+    USECUSTOMINDEXREAD1PRIMER__FIELD_NAME: WrapperField = WrapperField("UseCustomIndexRead1Primer", FieldType.BOOLEAN)
+    USECUSTOMREAD1PRIMER__FIELD_NAME: WrapperField = WrapperField("UseCustomRead1Primer", FieldType.BOOLEAN)
+    USECUSTOMREAD2PRIMER__FIELD_NAME: WrapperField = WrapperField("UseCustomRead2Primer", FieldType.BOOLEAN)
+
+    Application: ModelField[Optional[str]] = ModelField("Application", FieldType.STRING)
+    ApplicationVersion: ModelField[Optional[str]] = ModelField("ApplicationVersion", FieldType.STRING)
+    AttachmentFile: ModelField[Optional[str]] = ModelField("AttachmentFile", FieldType.STRING)
+    Autocenter: ModelField[Optional[bool]] = ModelField("Autocenter", FieldType.BOOLEAN)
+    BiDirectionalScanning: ModelField[Optional[bool]] = ModelField("BiDirectionalScanning", FieldType.BOOLEAN)
+    BufferExpirationdate: ModelField[Optional[int]] = ModelField("BufferExpirationdate", FieldType.DATE)
+    BufferLotNumber: ModelField[Optional[int]] = ModelField("BufferLotNumber", FieldType.INTEGER)
+    BufferNumberOfCyclesRemaining: ModelField[Optional[int]] = ModelField("BufferNumberOfCyclesRemaining", FieldType.INTEGER)
+    BufferPartNumber: ModelField[Optional[int]] = ModelField("BufferPartNumber", FieldType.INTEGER)
+    BufferRssi: ModelField[Optional[int]] = ModelField("BufferRssi", FieldType.INTEGER)
+    BufferSerialBarcode: ModelField[Optional[str]] = ModelField("BufferSerialBarcode", FieldType.STRING)
+    BufferStartDate: ModelField[Optional[int]] = ModelField("BufferStartDate", FieldType.DATE)
+    BufferSupportedModes: ModelField[Optional[str]] = ModelField("BufferSupportedModes", FieldType.STRING)
+    CeLinuxRunFolder: ModelField[Optional[str]] = ModelField("CeLinuxRunFolder", FieldType.STRING)
+    CeMountRunFolder: ModelField[Optional[str]] = ModelField("CeMountRunFolder", FieldType.STRING)
+    ClusterCycleKit: ModelField[Optional[int]] = ModelField("ClusterCycleKit", FieldType.INTEGER)
+    ClusterExpirationdate: ModelField[Optional[int]] = ModelField("ClusterExpirationdate", FieldType.DATE)
+    ClusterLotNumber: ModelField[Optional[int]] = ModelField("ClusterLotNumber", FieldType.INTEGER)
+    ClusterNumberOfCyclesRemaining: ModelField[Optional[int]] = ModelField("ClusterNumberOfCyclesRemaining", FieldType.INTEGER)
+    ClusterPartNumber: ModelField[Optional[str]] = ModelField("ClusterPartNumber", FieldType.STRING)
+    ClusterRssi: ModelField[Optional[int]] = ModelField("ClusterRssi", FieldType.INTEGER)
+    ClusterSerialBarcode: ModelField[Optional[str]] = ModelField("ClusterSerialBarcode", FieldType.STRING)
+    ClusterStartDate: ModelField[Optional[int]] = ModelField("ClusterStartDate", FieldType.DATE)
+    ClusterSupportedModes: ModelField[Optional[str]] = ModelField("ClusterSupportedModes", FieldType.STRING)
+    ExperimentName: ModelField[Optional[str]] = ModelField("ExperimentName", FieldType.STRING)
+    FlowCellExpirationdate: ModelField[Optional[int]] = ModelField("FlowCellExpirationdate", FieldType.DATE)
+    FlowCellLotNumber: ModelField[Optional[int]] = ModelField("FlowCellLotNumber", FieldType.INTEGER)
+    FlowCellMode: ModelField[Optional[str]] = ModelField("FlowCellMode", FieldType.STRING)
+    FlowCellNumberOfReuseRemaining: ModelField[Optional[int]] = ModelField("FlowCellNumberOfReuseRemaining", FieldType.INTEGER)
+    FlowCellPartNumber: ModelField[Optional[str]] = ModelField("FlowCellPartNumber", FieldType.STRING)
+    FlowCellRssi: ModelField[Optional[int]] = ModelField("FlowCellRssi", FieldType.INTEGER)
+    FlowCellSerialBarcode: ModelField[Optional[str]] = ModelField("FlowCellSerialBarcode", FieldType.STRING)
+    FlowCellStartDate: ModelField[Optional[int]] = ModelField("FlowCellStartDate", FieldType.DATE)
+    FlowCellSupportedModes: ModelField[Optional[str]] = ModelField("FlowCellSupportedModes", FieldType.STRING)
+    IndexRead1NumberOfCycles: ModelField[Optional[int]] = ModelField("IndexRead1NumberOfCycles", FieldType.INTEGER)
+    IndexRead2NumberOfCycles: ModelField[Optional[int]] = ModelField("IndexRead2NumberOfCycles", FieldType.INTEGER)
+    InstrumentName: ModelField[Optional[str]] = ModelField("InstrumentName", FieldType.STRING)
+    IsRehyb: ModelField[Optional[bool]] = ModelField("IsRehyb", FieldType.BOOLEAN)
+    LibraryTubeExpirationdate: ModelField[Optional[int]] = ModelField("LibraryTubeExpirationdate", FieldType.DATE)
+    LibraryTubeLotNumber: ModelField[Optional[int]] = ModelField("LibraryTubeLotNumber", FieldType.INTEGER)
+    LibraryTubePartNumber: ModelField[Optional[int]] = ModelField("LibraryTubePartNumber", FieldType.INTEGER)
+    LibraryTubeRssi: ModelField[Optional[int]] = ModelField("LibraryTubeRssi", FieldType.INTEGER)
+    LibraryTubeSerialBarcode: ModelField[Optional[str]] = ModelField("LibraryTubeSerialBarcode", FieldType.STRING)
+    LibraryTubeStartDate: ModelField[Optional[int]] = ModelField("LibraryTubeStartDate", FieldType.DATE)
+    LibraryTubeSupportedModes: ModelField[Optional[str]] = ModelField("LibraryTubeSupportedModes", FieldType.STRING)
+    OutputRunFolder: ModelField[Optional[str]] = ModelField("OutputRunFolder", FieldType.STRING)
+    PlannedIndex1ReadCycles: ModelField[Optional[int]] = ModelField("PlannedIndex1ReadCycles", FieldType.INTEGER)
+    PlannedIndex2ReadCycles: ModelField[Optional[int]] = ModelField("PlannedIndex2ReadCycles", FieldType.INTEGER)
+    PlannedRead1Cycles: ModelField[Optional[int]] = ModelField("PlannedRead1Cycles", FieldType.INTEGER)
+    PlannedRead2Cycles: ModelField[Optional[int]] = ModelField("PlannedRead2Cycles", FieldType.INTEGER)
+    PlatformType: ModelField[Optional[str]] = ModelField("PlatformType", FieldType.STRING)
+    PreRunFolder: ModelField[Optional[str]] = ModelField("PreRunFolder", FieldType.STRING)
+    Read1NumberOfCycles: ModelField[Optional[int]] = ModelField("Read1NumberOfCycles", FieldType.INTEGER)
+    Read2NumberOfCycles: ModelField[Optional[int]] = ModelField("Read2NumberOfCycles", FieldType.INTEGER)
+    ReadType: ModelField[Optional[str]] = ModelField("ReadType", FieldType.STRING)
+    RecipeFilePath: ModelField[Optional[str]] = ModelField("RecipeFilePath", FieldType.STRING)
+    RecipeVersion: ModelField[Optional[str]] = ModelField("RecipeVersion", FieldType.STRING)
+    RtaRawRunFolder: ModelField[Optional[str]] = ModelField("RtaRawRunFolder", FieldType.STRING)
+    RtaVersion: ModelField[Optional[str]] = ModelField("RtaVersion", FieldType.STRING)
+    RunId: ModelField[Optional[str]] = ModelField("RunId", FieldType.STRING)
+    RunNumber: ModelField[Optional[int]] = ModelField("RunNumber", FieldType.INTEGER)
+    RunStartDate: ModelField[Optional[str]] = ModelField("RunStartDate", FieldType.STRING)
+    SbcRunFolder: ModelField[Optional[str]] = ModelField("SbcRunFolder", FieldType.STRING)
+    SbsCycleKit: ModelField[Optional[int]] = ModelField("SbsCycleKit", FieldType.INTEGER)
+    SbsExpirationdate: ModelField[Optional[int]] = ModelField("SbsExpirationdate", FieldType.DATE)
+    SbsLotNumber: ModelField[Optional[int]] = ModelField("SbsLotNumber", FieldType.INTEGER)
+    SbsNumberOfCyclesRemaining: ModelField[Optional[int]] = ModelField("SbsNumberOfCyclesRemaining", FieldType.INTEGER)
+    SbsNumberOfCyclesSupported: ModelField[Optional[int]] = ModelField("SbsNumberOfCyclesSupported", FieldType.INTEGER)
+    SbsPartNumber: ModelField[Optional[str]] = ModelField("SbsPartNumber", FieldType.STRING)
+    SbsRssi: ModelField[Optional[int]] = ModelField("SbsRssi", FieldType.INTEGER)
+    SbsSerialBarcode: ModelField[Optional[str]] = ModelField("SbsSerialBarcode", FieldType.STRING)
+    SbsStartDate: ModelField[Optional[int]] = ModelField("SbsStartDate", FieldType.DATE)
+    SbsSupportedModes: ModelField[Optional[str]] = ModelField("SbsSupportedModes", FieldType.STRING)
+    SendIlluminaHealthData: ModelField[Optional[bool]] = ModelField("SendIlluminaHealthData", FieldType.BOOLEAN)
+    Side: ModelField[Optional[str]] = ModelField("Side", FieldType.STRING)
+    Surface: ModelField[Optional[str]] = ModelField("Surface", FieldType.STRING)
+    UcsRunId: ModelField[Optional[str]] = ModelField("UcsRunId", FieldType.STRING)
+    UcsVersion: ModelField[Optional[str]] = ModelField("UcsVersion", FieldType.STRING)
+    UseCustomIndexRead1Primer: ModelField[Optional[bool]] = ModelField("UseCustomIndexRead1Primer", FieldType.BOOLEAN)
+    UseCustomRead1Primer: ModelField[Optional[bool]] = ModelField("UseCustomRead1Primer", FieldType.BOOLEAN)
+    UseCustomRead2Primer: ModelField[Optional[bool]] = ModelField("UseCustomRead2Primer", FieldType.BOOLEAN)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,49 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class IlluminaNovaSeqXRunParametersModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type IlluminaNovaSeqXRunParameters
+    Data Type Display Name: Illumina NovaSeq X Run Parameter (Illumina NovaSeq X Run Parameters)
+    Fields: Application, CloudUploadMode, ExperimentName, FlowCellName, FlowCellType, InstrumentSerialNumber, InstrumentType, OutputFolder, RecipeName, RecipeVersion, RunCounter, RunId, ScanSpeedMmPerSec, Side, SystemSuiteVersion
+    <!-- DISPLAY IN INSTRUMENT RUN MONITOR -->
+    """
+    DATA_TYPE_NAME: str = 'IlluminaNovaSeqXRunParameters'
+    APPLICATION__FIELD_NAME: WrapperField = WrapperField("Application", FieldType.STRING)
+    CLOUDUPLOADMODE__FIELD_NAME: WrapperField = WrapperField("CloudUploadMode", FieldType.STRING)
+    EXPERIMENTNAME__FIELD_NAME: WrapperField = WrapperField("ExperimentName", FieldType.STRING)
+    FLOWCELLNAME__FIELD_NAME: WrapperField = WrapperField("FlowCellName", FieldType.STRING)
+    FLOWCELLTYPE__FIELD_NAME: WrapperField = WrapperField("FlowCellType", FieldType.STRING)
+    INSTRUMENTSERIALNUMBER__FIELD_NAME: WrapperField = WrapperField("InstrumentSerialNumber", FieldType.STRING)
+    INSTRUMENTTYPE__FIELD_NAME: WrapperField = WrapperField("InstrumentType", FieldType.STRING)
+    OUTPUTFOLDER__FIELD_NAME: WrapperField = WrapperField("OutputFolder", FieldType.STRING)
+    RECIPENAME__FIELD_NAME: WrapperField = WrapperField("RecipeName", FieldType.STRING)
+    RECIPEVERSION__FIELD_NAME: WrapperField = WrapperField("RecipeVersion", FieldType.STRING)
+    RUNCOUNTER__FIELD_NAME: WrapperField = WrapperField("RunCounter", FieldType.INTEGER)
+    RUNID__FIELD_NAME: WrapperField = WrapperField("RunId", FieldType.STRING)
+    SCANSPEEDMMPERSEC__FIELD_NAME: WrapperField = WrapperField("ScanSpeedMmPerSec", FieldType.DOUBLE)
+    SIDE__FIELD_NAME: WrapperField = WrapperField("Side", FieldType.STRING)
+    SYSTEMSUITEVERSION__FIELD_NAME: WrapperField = WrapperField("SystemSuiteVersion", FieldType.STRING)
+
+    Application: ModelField[Optional[str]] = ModelField("Application", FieldType.STRING)
+    CloudUploadMode: ModelField[Optional[str]] = ModelField("CloudUploadMode", FieldType.STRING)
+    ExperimentName: ModelField[Optional[str]] = ModelField("ExperimentName", FieldType.STRING)
+    FlowCellName: ModelField[Optional[str]] = ModelField("FlowCellName", FieldType.STRING)
+    FlowCellType: ModelField[Optional[str]] = ModelField("FlowCellType", FieldType.STRING)
+    InstrumentSerialNumber: ModelField[Optional[str]] = ModelField("InstrumentSerialNumber", FieldType.STRING)
+    InstrumentType: ModelField[Optional[str]] = ModelField("InstrumentType", FieldType.STRING)
+    OutputFolder: ModelField[Optional[str]] = ModelField("OutputFolder", FieldType.STRING)
+    RecipeName: ModelField[Optional[str]] = ModelField("RecipeName", FieldType.STRING)
+    RecipeVersion: ModelField[Optional[str]] = ModelField("RecipeVersion", FieldType.STRING)
+    RunCounter: ModelField[Optional[int]] = ModelField("RunCounter", FieldType.INTEGER)
+    RunId: ModelField[Optional[str]] = ModelField("RunId", FieldType.STRING)
+    ScanSpeedMmPerSec: ModelField[Optional[float]] = ModelField("ScanSpeedMmPerSec", FieldType.DOUBLE)
+    Side: ModelField[Optional[str]] = ModelField("Side", FieldType.STRING)
+    SystemSuiteVersion: ModelField[Optional[str]] = ModelField("SystemSuiteVersion", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
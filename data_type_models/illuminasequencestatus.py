@@ -0,0 +1,49 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class IlluminaSequenceStatusModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type IlluminaSequenceStatus
+    Data Type Display Name: Illumina Sequencing Status (Illumina Sequencing Statuses)
+    Fields: CurrentRead, CyclesCompleted, DateOfRun, DateOfUpdate, FlowcellId, InstrumentId, LaneCount, ReadIndexed, RunId, RunNumber, SurfaceCount, SwathCount, TileCount, TimeOfRun, TimeOfUpdate
+    <!-- DISPLAY IN INSTRUMENT RUN MONITOR -->
+    """
+    DATA_TYPE_NAME: str = 'IlluminaSequenceStatus'
+    CURRENTREAD__FIELD_NAME: WrapperField = WrapperField("CurrentRead", FieldType.LONG)
+    CYCLESCOMPLETED__FIELD_NAME: WrapperField = WrapperField("CyclesCompleted", FieldType.STRING)
+    DATEOFRUN__FIELD_NAME: WrapperField = WrapperField("DateOfRun", FieldType.DATE)
+    DATEOFUPDATE__FIELD_NAME: WrapperField = WrapperField("DateOfUpdate", FieldType.DATE)
+    FLOWCELLID__FIELD_NAME: WrapperField = WrapperField("FlowcellId", FieldType.STRING)
+    INSTRUMENTID__FIELD_NAME: WrapperField = WrapperField("InstrumentId", FieldType.STRING)
+    LANECOUNT__FIELD_NAME: WrapperField = WrapperField("LaneCount", FieldType.LONG)
+    READINDEXED__FIELD_NAME: WrapperField = WrapperField("ReadIndexed", FieldType.BOOLEAN)
+    RUNID__FIELD_NAME: WrapperField = WrapperField("RunId", FieldType.STRING)
+    RUNNUMBER__FIELD_NAME: WrapperField = WrapperField("RunNumber", FieldType.LONG)
+    SURFACECOUNT__FIELD_NAME: WrapperField = WrapperField("SurfaceCount", FieldType.INTEGER)
+    SWATHCOUNT__FIELD_NAME: WrapperField = WrapperField("SwathCount", FieldType.LONG)
+    TILECOUNT__FIELD_NAME: WrapperField = WrapperField("TileCount", FieldType.LONG)
+    TIMEOFRUN__FIELD_NAME: WrapperField = WrapperField("TimeOfRun", FieldType.STRING)
+    TIMEOFUPDATE__FIELD_NAME: WrapperField = WrapperField("TimeOfUpdate", FieldType.STRING)
+
+    CurrentRead: ModelField[Optional[int]] = ModelField("CurrentRead", FieldType.LONG)
+    CyclesCompleted: ModelField[Optional[str]] = ModelField("CyclesCompleted", FieldType.STRING)
+    DateOfRun: ModelField[Optional[int]] = ModelField("DateOfRun", FieldType.DATE)
+    DateOfUpdate: ModelField[Optional[int]] = ModelField("DateOfUpdate", FieldType.DATE)
+    FlowcellId: ModelField[Optional[str]] = ModelField("FlowcellId", FieldType.STRING)
+    InstrumentId: ModelField[Optional[str]] = ModelField("InstrumentId", FieldType.STRING)
+    LaneCount: ModelField[Optional[int]] = ModelField("LaneCount", FieldType.LONG)
+    ReadIndexed: ModelField[Optional[bool]] = ModelField("ReadIndexed", FieldType.BOOLEAN)
+    RunId: ModelField[Optional[str]] = ModelField("RunId", FieldType.STRING)
+    RunNumber: ModelField[Optional[int]] = ModelField("RunNumber", FieldType.LONG)
+    SurfaceCount: ModelField[Optional[int]] = ModelField("SurfaceCount", FieldType.INTEGER)
+    SwathCount: ModelField[Optional[int]] = ModelField("SwathCount", FieldType.LONG)
+    TileCount: ModelField[Optional[int]] = ModelField("TileCount", FieldType.LONG)
+    TimeOfRun: ModelField[Optional[str]] = ModelField("TimeOfRun", FieldType.STRING)
+    TimeOfUpdate: ModelField[Optional[str]] = ModelField("TimeOfUpdate", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,32 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class IndexAssignmentModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type IndexAssignment
+    Data Type Display Name: Index Assignment (Index Assignments)
+    Fields: ColPosition, IndexId, IndexTag, IndexType, MultiParentLink175, MultiParentLink193, MultiplexInstructions, RowPosition
+    """
+    DATA_TYPE_NAME: str = 'IndexAssignment'
+    COLPOSITION__FIELD_NAME: WrapperField = WrapperField("ColPosition", FieldType.SELECTION)
+    INDEXID__FIELD_NAME: WrapperField = WrapperField("IndexId", FieldType.STRING)
+    INDEXTAG__FIELD_NAME: WrapperField = WrapperField("IndexTag", FieldType.STRING)
+    INDEXTYPE__FIELD_NAME: WrapperField = WrapperField("IndexType", FieldType.PICKLIST)
+    MULTIPARENTLINK175__FIELD_NAME: WrapperField = WrapperField("MultiParentLink175", FieldType.MULTIPARENTLINK)
+    MULTIPARENTLINK193__FIELD_NAME: WrapperField = WrapperField("MultiParentLink193", FieldType.MULTIPARENTLINK)
+    MULTIPLEXINSTRUCTIONS__FIELD_NAME: WrapperField = WrapperField("MultiplexInstructions", FieldType.PICKLIST)
+    ROWPOSITION__FIELD_NAME: WrapperField = WrapperField("RowPosition", FieldType.SELECTION)
+
+    ColPosition: ModelField[Optional[str]] = ModelField("ColPosition", FieldType.SELECTION)
+    IndexId: ModelField[Optional[str]] = ModelField("IndexId", FieldType.STRING)
+    IndexTag: ModelField[Optional[str]] = ModelField("IndexTag", FieldType.STRING)
+    IndexType: ModelField[Optional[str]] = ModelField("IndexType", FieldType.PICKLIST)
+    MultiplexInstructions: ModelField[Optional[str]] = ModelField("MultiplexInstructions", FieldType.PICKLIST)
+    RowPosition: ModelField[Optional[str]] = ModelField("RowPosition", FieldType.SELECTION)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
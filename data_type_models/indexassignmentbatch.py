@@ -0,0 +1,29 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class IndexAssignmentBatchModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type IndexAssignmentBatch
+    Data Type Display Name: Index Assignment Batch (Index Assignment Batches)
+    Fields: BatchSize, IndexSetName, IndexType, LastUsed, MultiplexInstructions
+    A batch record that contains Index Assignment data records. This is used in providing support to Multiplexing specifications in index assignment.
+    """
+    DATA_TYPE_NAME: str = 'IndexAssignmentBatch'
+    BATCHSIZE__FIELD_NAME: WrapperField = WrapperField("BatchSize", FieldType.LONG)
+    INDEXSETNAME__FIELD_NAME: WrapperField = WrapperField("IndexSetName", FieldType.STRING)
+    INDEXTYPE__FIELD_NAME: WrapperField = WrapperField("IndexType", FieldType.STRING)
+    LASTUSED__FIELD_NAME: WrapperField = WrapperField("LastUsed", FieldType.BOOLEAN)
+    MULTIPLEXINSTRUCTIONS__FIELD_NAME: WrapperField = WrapperField("MultiplexInstructions", FieldType.PICKLIST)
+
+    BatchSize: ModelField[Optional[int]] = ModelField("BatchSize", FieldType.LONG)
+    IndexSetName: ModelField[Optional[str]] = ModelField("IndexSetName", FieldType.STRING)
+    IndexType: ModelField[Optional[str]] = ModelField("IndexType", FieldType.STRING)
+    LastUsed: ModelField[Optional[bool]] = ModelField("LastUsed", FieldType.BOOLEAN)
+    MultiplexInstructions: ModelField[Optional[str]] = ModelField("MultiplexInstructions", FieldType.PICKLIST)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,23 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class IndexAssignmentTypeModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type IndexAssignmentType
+    Data Type Display Name: Index Assignment Type (Index Assignment Types)
+    Fields: IndexQty, IndexType
+    A data record that encompasses multiple Index Assignment records and groups them into a single type.
+    """
+    DATA_TYPE_NAME: str = 'IndexAssignmentType'
+    INDEXQTY__FIELD_NAME: WrapperField = WrapperField("IndexQty", FieldType.LONG)
+    INDEXTYPE__FIELD_NAME: WrapperField = WrapperField("IndexType", FieldType.SELECTION)
+
+    IndexQty: ModelField[Optional[int]] = ModelField("IndexQty", FieldType.LONG)
+    IndexType: ModelField[Optional[str]] = ModelField("IndexType", FieldType.SELECTION)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,33 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class IndexMetricModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type IndexMetric
+    Data Type Display Name: Index Metric (Index Metrics)
+    Fields: ColRead, IndexSeq, Lane, LaneCol, NumClusters, Project, SampleId
+    <!-- DISPLAY IN INSTRUMENT RUN MONITOR -->
+    """
+    DATA_TYPE_NAME: str = 'IndexMetric'
+    COLREAD__FIELD_NAME: WrapperField = WrapperField("ColRead", FieldType.STRING)
+    INDEXSEQ__FIELD_NAME: WrapperField = WrapperField("IndexSeq", FieldType.STRING)
+    LANE__FIELD_NAME: WrapperField = WrapperField("Lane", FieldType.LONG)
+    LANECOL__FIELD_NAME: WrapperField = WrapperField("LaneCol", FieldType.STRING)
+    NUMCLUSTERS__FIELD_NAME: WrapperField = WrapperField("NumClusters", FieldType.LONG)
+    PROJECT__FIELD_NAME: WrapperField = WrapperField("Project", FieldType.STRING)
+    SAMPLEID__FIELD_NAME: WrapperField = WrapperField("SampleId", FieldType.STRING)
+
+    ColRead: ModelField[Optional[str]] = ModelField("ColRead", FieldType.STRING)
+    IndexSeq: ModelField[Optional[str]] = ModelField("IndexSeq", FieldType.STRING)
+    Lane: ModelField[Optional[int]] = ModelField("Lane", FieldType.LONG)
+    LaneCol: ModelField[Optional[str]] = ModelField("LaneCol", FieldType.STRING)
+    NumClusters: ModelField[Optional[int]] = ModelField("NumClusters", FieldType.LONG)
+    Project: ModelField[Optional[str]] = ModelField("Project", FieldType.STRING)
+    SampleId: ModelField[Optional[str]] = ModelField("SampleId", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,45 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class InstrumentModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type Instrument
+    Data Type Display Name: Instrument (Instruments)
+    Fields: Barcode, DatePurchased, Description, FilePath, InstrumentName, InstrumentType, IsActive, ModelNumber, NetworkFilePath, SerialNumber, Site, Vendor, WorkstationId
+    <!-- CONFIG: Environmental -->
+    """
+    DATA_TYPE_NAME: str = 'Instrument'
+    BARCODE__FIELD_NAME: WrapperField = WrapperField("Barcode", FieldType.STRING)
+    DATEPURCHASED__FIELD_NAME: WrapperField = WrapperField("DatePurchased", FieldType.DATE)
+    DESCRIPTION__FIELD_NAME: WrapperField = WrapperField("Description", FieldType.STRING)
+    FILEPATH__FIELD_NAME: WrapperField = WrapperField("FilePath", FieldType.STRING)
+    INSTRUMENTNAME__FIELD_NAME: WrapperField = WrapperField("InstrumentName", FieldType.STRING)
+    INSTRUMENTTYPE__FIELD_NAME: WrapperField = WrapperField("InstrumentType", FieldType.SELECTION)
+    ISACTIVE__FIELD_NAME: WrapperField = WrapperField("IsActive", FieldType.BOOLEAN)
+    MODELNUMBER__FIELD_NAME: WrapperField = WrapperField("ModelNumber", FieldType.STRING)
+    NETWORKFILEPATH__FIELD_NAME: WrapperField = WrapperField("NetworkFilePath", FieldType.STRING)
+    SERIALNUMBER__FIELD_NAME: WrapperField = WrapperField("SerialNumber", FieldType.STRING)
+    SITE__FIELD_NAME: WrapperField = WrapperField("Site", FieldType.STRING)
+    VENDOR__FIELD_NAME: WrapperField = WrapperField("Vendor", FieldType.STRING)
+    WORKSTATIONID__FIELD_NAME: WrapperField = WrapperField("WorkstationId", FieldType.STRING)
+
+    Barcode: ModelField[Optional[str]] = ModelField("Barcode", FieldType.STRING)
+    DatePurchased: ModelField[Optional[int]] = ModelField("DatePurchased", FieldType.DATE)
+    Description: ModelField[Optional[str]] = ModelField("Description", FieldType.STRING)
+    FilePath: ModelField[Optional[str]] = ModelField("FilePath", FieldType.STRING)
+    InstrumentName: ModelField[Optional[str]] = ModelField("InstrumentName", FieldType.STRING)
+    InstrumentType: ModelField[Optional[str]] = ModelField("InstrumentType", FieldType.SELECTION)
+    IsActive: ModelField[Optional[bool]] = ModelField("IsActive", FieldType.BOOLEAN)
+    ModelNumber: ModelField[Optional[str]] = ModelField("ModelNumber", FieldType.STRING)
+    NetworkFilePath: ModelField[Optional[str]] = ModelField("NetworkFilePath", FieldType.STRING)
+    SerialNumber: ModelField[Optional[str]] = ModelField("SerialNumber", FieldType.STRING)
+    Site: ModelField[Optional[str]] = ModelField("Site", FieldType.STRING)
+    Vendor: ModelField[Optional[str]] = ModelField("Vendor", FieldType.STRING)
+    WorkstationId: ModelField[Optional[str]] = ModelField("WorkstationId", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,54 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class InstrumentConfigModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type InstrumentConfig
+    Data Type Display Name: Instrument Configuration (Instrument Configurations)
+    Fields: ContainsKey1, ContainsKey2, ContainsKey3, FileCreator, FileDifferentiator, FileKeyIdentifier1, FileKeyIdentifier2, FileKeyIdentifier3, FileLoader, FileParser, InstrumentConfigurationName, InstrumentType, OutputFileCreator, Presenter, RecordHandler, RecordProcessor, SupportsMolarity, Validator
+    """
+    DATA_TYPE_NAME: str = 'InstrumentConfig'
+    CONTAINSKEY1__FIELD_NAME: WrapperField = WrapperField("ContainsKey1", FieldType.BOOLEAN)
+    CONTAINSKEY2__FIELD_NAME: WrapperField = WrapperField("ContainsKey2", FieldType.BOOLEAN)
+    CONTAINSKEY3__FIELD_NAME: WrapperField = WrapperField("ContainsKey3", FieldType.BOOLEAN)
+    FILECREATOR__FIELD_NAME: WrapperField = WrapperField("FileCreator", FieldType.SELECTION)
+    FILEDIFFERENTIATOR__FIELD_NAME: WrapperField = WrapperField("FileDifferentiator", FieldType.SELECTION)
+    FILEKEYIDENTIFIER1__FIELD_NAME: WrapperField = WrapperField("FileKeyIdentifier1", FieldType.STRING)
+    FILEKEYIDENTIFIER2__FIELD_NAME: WrapperField = WrapperField("FileKeyIdentifier2", FieldType.STRING)
+    FILEKEYIDENTIFIER3__FIELD_NAME: WrapperField = WrapperField("FileKeyIdentifier3", FieldType.STRING)
+    FILELOADER__FIELD_NAME: WrapperField = WrapperField("FileLoader", FieldType.SELECTION)
+    FILEPARSER__FIELD_NAME: WrapperField = WrapperField("FileParser", FieldType.SELECTION)
+    INSTRUMENTCONFIGURATIONNAME__FIELD_NAME: WrapperField = WrapperField("InstrumentConfigurationName", FieldType.STRING)
+    INSTRUMENTTYPE__FIELD_NAME: WrapperField = WrapperField("InstrumentType", FieldType.STRING)
+    OUTPUTFILECREATOR__FIELD_NAME: WrapperField = WrapperField("OutputFileCreator", FieldType.SELECTION)
+    PRESENTER__FIELD_NAME: WrapperField = WrapperField("Presenter", FieldType.SELECTION)
+    RECORDHANDLER__FIELD_NAME: WrapperField = WrapperField("RecordHandler", FieldType.SELECTION)
+    RECORDPROCESSOR__FIELD_NAME: WrapperField = WrapperField("RecordProcessor", FieldType.SELECTION)
+    SUPPORTSMOLARITY__FIELD_NAME: WrapperField = WrapperField("SupportsMolarity", FieldType.BOOLEAN)
+    VALIDATOR__FIELD_NAME: WrapperField = WrapperField("Validator", FieldType.SELECTION)
+
+    ContainsKey1: ModelField[Optional[bool]] = ModelField("ContainsKey1", FieldType.BOOLEAN)
+    ContainsKey2: ModelField[Optional[bool]] = ModelField("ContainsKey2", FieldType.BOOLEAN)
+    ContainsKey3: ModelField[Optional[bool]] = ModelField("ContainsKey3", FieldType.BOOLEAN)
+    FileCreator: ModelField[Optional[str]] = ModelField("FileCreator", FieldType.SELECTION)
+    FileDifferentiator: ModelField[Optional[str]] = ModelField("FileDifferentiator", FieldType.SELECTION)
+    FileKeyIdentifier1: ModelField[Optional[str]] = ModelField("FileKeyIdentifier1", FieldType.STRING)
+    FileKeyIdentifier2: ModelField[Optional[str]] = ModelField("FileKeyIdentifier2", FieldType.STRING)
+    FileKeyIdentifier3: ModelField[Optional[str]] = ModelField("FileKeyIdentifier3", FieldType.STRING)
+    FileLoader: ModelField[Optional[str]] = ModelField("FileLoader", FieldType.SELECTION)
+    FileParser: ModelField[Optional[str]] = ModelField("FileParser", FieldType.SELECTION)
+    InstrumentConfigurationName: ModelField[Optional[str]] = ModelField("InstrumentConfigurationName", FieldType.STRING)
+    InstrumentType: ModelField[Optional[str]] = ModelField("InstrumentType", FieldType.STRING)
+    OutputFileCreator: ModelField[Optional[str]] = ModelField("OutputFileCreator", FieldType.SELECTION)
+    Presenter: ModelField[Optional[str]] = ModelField("Presenter", FieldType.SELECTION)
+    RecordHandler: ModelField[Optional[str]] = ModelField("RecordHandler", FieldType.SELECTION)
+    RecordProcessor: ModelField[Optional[str]] = ModelField("RecordProcessor", FieldType.SELECTION)
+    SupportsMolarity: ModelField[Optional[bool]] = ModelField("SupportsMolarity", FieldType.BOOLEAN)
+    Validator: ModelField[Optional[str]] = ModelField("Validator", FieldType.SELECTION)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,34 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class InstrumentConsumableDatumModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type InstrumentConsumableDatum
+    Data Type Display Name: Instrument Consumable (Instrument Consumable)
+    Fields: ActiveTaskId, ActiveWorkflowId, ExperimentRecordId, ExperimentType, OtherSampleId, SampleId, TaskName, WorkflowName
+    """
+    DATA_TYPE_NAME: str = 'InstrumentConsumableDatum'
+    ACTIVETASKID__FIELD_NAME: WrapperField = WrapperField("ActiveTaskId", FieldType.LONG)
+    ACTIVEWORKFLOWID__FIELD_NAME: WrapperField = WrapperField("ActiveWorkflowId", FieldType.LONG)
+    EXPERIMENTRECORDID__FIELD_NAME: WrapperField = WrapperField("ExperimentRecordId", FieldType.LONG)
+    EXPERIMENTTYPE__FIELD_NAME: WrapperField = WrapperField("ExperimentType", FieldType.STRING)
+    OTHERSAMPLEID__FIELD_NAME: WrapperField = WrapperField("OtherSampleId", FieldType.STRING)
+    SAMPLEID__FIELD_NAME: WrapperField = WrapperField("SampleId", FieldType.STRING)
+    TASKNAME__FIELD_NAME: WrapperField = WrapperField("TaskName", FieldType.STRING)
+    WORKFLOWNAME__FIELD_NAME: WrapperField = WrapperField("WorkflowName", FieldType.STRING)
+
+    ActiveTaskId: ModelField[Optional[int]] = ModelField("ActiveTaskId", FieldType.LONG)
+    ActiveWorkflowId: ModelField[Optional[int]] = ModelField("ActiveWorkflowId", FieldType.LONG)
+    ExperimentRecordId: ModelField[Optional[int]] = ModelField("ExperimentRecordId", FieldType.LONG)
+    ExperimentType: ModelField[Optional[str]] = ModelField("ExperimentType", FieldType.STRING)
+    OtherSampleId: ModelField[Optional[str]] = ModelField("OtherSampleId", FieldType.STRING)
+    SampleId: ModelField[Optional[str]] = ModelField("SampleId", FieldType.STRING)
+    TaskName: ModelField[Optional[str]] = ModelField("TaskName", FieldType.STRING)
+    WorkflowName: ModelField[Optional[str]] = ModelField("WorkflowName", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,22 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class InstrumentFieldMapModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type InstrumentFieldMap
+    Data Type Display Name: Instrument Field Map (Instrument Field Maps)
+    Fields: FromFileField, ToRecordField
+    """
+    DATA_TYPE_NAME: str = 'InstrumentFieldMap'
+    FROMFILEFIELD__FIELD_NAME: WrapperField = WrapperField("FromFileField", FieldType.STRING)
+    TORECORDFIELD__FIELD_NAME: WrapperField = WrapperField("ToRecordField", FieldType.SELECTION)
+
+    FromFileField: ModelField[Optional[str]] = ModelField("FromFileField", FieldType.STRING)
+    ToRecordField: ModelField[Optional[str]] = ModelField("ToRecordField", FieldType.SELECTION)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
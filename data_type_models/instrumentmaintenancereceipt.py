@@ -0,0 +1,44 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class InstrumentMaintenanceReceiptModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type InstrumentMaintenanceReceipt
+    Data Type Display Name: Instrument Maintenance Log (Instrument Maintenance Logs)
+    Fields: ActiveWorkflowId, ActiveWorkflowName, ApproverComment, ApproverGroupName, ApproverName, ApproverUsername, DateApproved, MaintenanceComments, MaintenancePendingDate, MaintenancePerformedBy, MaintenancePerformedDate, MaintenanceStatus, NextDueDate
+    """
+    DATA_TYPE_NAME: str = 'InstrumentMaintenanceReceipt'
+    ACTIVEWORKFLOWID__FIELD_NAME: WrapperField = WrapperField("ActiveWorkflowId", FieldType.LONG)
+    ACTIVEWORKFLOWNAME__FIELD_NAME: WrapperField = WrapperField("ActiveWorkflowName", FieldType.SELECTION)
+    APPROVERCOMMENT__FIELD_NAME: WrapperField = WrapperField("ApproverComment", FieldType.STRING)
+    APPROVERGROUPNAME__FIELD_NAME: WrapperField = WrapperField("ApproverGroupName", FieldType.STRING)
+    APPROVERNAME__FIELD_NAME: WrapperField = WrapperField("ApproverName", FieldType.STRING)
+    APPROVERUSERNAME__FIELD_NAME: WrapperField = WrapperField("ApproverUsername", FieldType.STRING)
+    DATEAPPROVED__FIELD_NAME: WrapperField = WrapperField("DateApproved", FieldType.DATE)
+    MAINTENANCECOMMENTS__FIELD_NAME: WrapperField = WrapperField("MaintenanceComments", FieldType.STRING)
+    MAINTENANCEPENDINGDATE__FIELD_NAME: WrapperField = WrapperField("MaintenancePendingDate", FieldType.DATE)
+    MAINTENANCEPERFORMEDBY__FIELD_NAME: WrapperField = WrapperField("MaintenancePerformedBy", FieldType.SELECTION)
+    MAINTENANCEPERFORMEDDATE__FIELD_NAME: WrapperField = WrapperField("MaintenancePerformedDate", FieldType.DATE)
+    MAINTENANCESTATUS__FIELD_NAME: WrapperField = WrapperField("MaintenanceStatus", FieldType.PICKLIST)
+    NEXTDUEDATE__FIELD_NAME: WrapperField = WrapperField("NextDueDate", FieldType.DATE)
+
+    ActiveWorkflowId: ModelField[Optional[int]] = ModelField("ActiveWorkflowId", FieldType.LONG)
+    ActiveWorkflowName: ModelField[Optional[str]] = ModelField("ActiveWorkflowName", FieldType.SELECTION)
+    ApproverComment: ModelField[Optional[str]] = ModelField("ApproverComment", FieldType.STRING)
+    ApproverGroupName: ModelField[Optional[str]] = ModelField("ApproverGroupName", FieldType.STRING)
+    ApproverName: ModelField[Optional[str]] = ModelField("ApproverName", FieldType.STRING)
+    ApproverUsername: ModelField[Optional[str]] = ModelField("ApproverUsername", FieldType.STRING)
+    DateApproved: ModelField[Optional[int]] = ModelField("DateApproved", FieldType.DATE)
+    MaintenanceComments: ModelField[Optional[str]] = ModelField("MaintenanceComments", FieldType.STRING)
+    MaintenancePendingDate: ModelField[Optional[int]] = ModelField("MaintenancePendingDate", FieldType.DATE)
+    MaintenancePerformedBy: ModelField[Optional[str]] = ModelField("MaintenancePerformedBy", FieldType.SELECTION)
+    MaintenancePerformedDate: ModelField[Optional[int]] = ModelField("MaintenancePerformedDate", FieldType.DATE)
+    MaintenanceStatus: ModelField[Optional[str]] = ModelField("MaintenanceStatus", FieldType.PICKLIST)
+    NextDueDate: ModelField[Optional[int]] = ModelField("NextDueDate", FieldType.DATE)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,35 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class InstrumentParseConfigModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type InstrumentParseConfig
+    Data Type Display Name: Instrument Parser Config (Instrument Parser Configs)
+    Fields: BlockIdentifier, BlockType, DataLoaderConfig, EndPivotOnColumn, FieldName1, FieldName2, FieldName3, StartPivotOnColumn
+    This is for the Generic Instrument Parser.
+    """
+    DATA_TYPE_NAME: str = 'InstrumentParseConfig'
+    BLOCKIDENTIFIER__FIELD_NAME: WrapperField = WrapperField("BlockIdentifier", FieldType.STRING)
+    BLOCKTYPE__FIELD_NAME: WrapperField = WrapperField("BlockType", FieldType.PICKLIST)
+    DATALOADERCONFIG__FIELD_NAME: WrapperField = WrapperField("DataLoaderConfig", FieldType.STRING)
+    ENDPIVOTONCOLUMN__FIELD_NAME: WrapperField = WrapperField("EndPivotOnColumn", FieldType.STRING)
+    FIELDNAME1__FIELD_NAME: WrapperField = WrapperField("FieldName1", FieldType.STRING)
+    FIELDNAME2__FIELD_NAME: WrapperField = WrapperField("FieldName2", FieldType.STRING)
+    FIELDNAME3__FIELD_NAME: WrapperField = WrapperField("FieldName3", FieldType.STRING)
+    STARTPIVOTONCOLUMN__FIELD_NAME: WrapperField = WrapperField("StartPivotOnColumn", FieldType.STRING)
+
+    BlockIdentifier: ModelField[Optional[str]] = ModelField("BlockIdentifier", FieldType.STRING)
+    BlockType: ModelField[Optional[str]] = ModelField("BlockType", FieldType.PICKLIST)
+    DataLoaderConfig: ModelField[Optional[str]] = ModelField("DataLoaderConfig", FieldType.STRING)
+    EndPivotOnColumn: ModelField[Optional[str]] = ModelField("EndPivotOnColumn", FieldType.STRING)
+    FieldName1: ModelField[Optional[str]] = ModelField("FieldName1", FieldType.STRING)
+    FieldName2: ModelField[Optional[str]] = ModelField("FieldName2", FieldType.STRING)
+    FieldName3: ModelField[Optional[str]] = ModelField("FieldName3", FieldType.STRING)
+    StartPivotOnColumn: ModelField[Optional[str]] = ModelField("StartPivotOnColumn", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
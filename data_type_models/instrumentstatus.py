@@ -0,0 +1,30 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class InstrumentStatusModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type InstrumentStatus
+    Data Type Display Name: Instrument Status (Instrument Status)
+    Fields: CurrentRunDate, CurrentRunId, LastUpdated, PercentCompletion, Position, Status
+    """
+    DATA_TYPE_NAME: str = 'InstrumentStatus'
+    CURRENTRUNDATE__FIELD_NAME: WrapperField = WrapperField("CurrentRunDate", FieldType.INTEGER)
+    CURRENTRUNID__FIELD_NAME: WrapperField = WrapperField("CurrentRunId", FieldType.STRING)
+    LASTUPDATED__FIELD_NAME: WrapperField = WrapperField("LastUpdated", FieldType.DATE)
+    PERCENTCOMPLETION__FIELD_NAME: WrapperField = WrapperField("PercentCompletion", FieldType.DOUBLE)
+    POSITION__FIELD_NAME: WrapperField = WrapperField("Position", FieldType.STRING)
+    STATUS__FIELD_NAME: WrapperField = WrapperField("Status", FieldType.STRING)
+
+    CurrentRunDate: ModelField[Optional[int]] = ModelField("CurrentRunDate", FieldType.INTEGER)
+    CurrentRunId: ModelField[Optional[str]] = ModelField("CurrentRunId", FieldType.STRING)
+    LastUpdated: ModelField[Optional[int]] = ModelField("LastUpdated", FieldType.DATE)
+    PercentCompletion: ModelField[Optional[float]] = ModelField("PercentCompletion", FieldType.DOUBLE)
+    Position: ModelField[Optional[str]] = ModelField("Position", FieldType.STRING)
+    Status: ModelField[Optional[str]] = ModelField("Status", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
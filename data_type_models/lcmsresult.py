@@ -0,0 +1,44 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class LCMSResultModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type LCMSResult
+    Data Type Display Name: LCMS Result (LCMS Results)
+    Fields: AccuracyPercent, AnalyteISArea, Area, CalculatedConcentration, CompoundName, Concentration, DilutionFactor, Filename, FileType, Height, ISArea, ISHeight, SampleType
+    """
+    DATA_TYPE_NAME: str = 'LCMSResult'
+    ACCURACYPERCENT__FIELD_NAME: WrapperField = WrapperField("AccuracyPercent", FieldType.STRING)
+    ANALYTEISAREA__FIELD_NAME: WrapperField = WrapperField("AnalyteISArea", FieldType.DOUBLE)
+    AREA__FIELD_NAME: WrapperField = WrapperField("Area", FieldType.DOUBLE)
+    CALCULATEDCONCENTRATION__FIELD_NAME: WrapperField = WrapperField("CalculatedConcentration", FieldType.DOUBLE)
+    COMPOUNDNAME__FIELD_NAME: WrapperField = WrapperField("CompoundName", FieldType.STRING)
+    CONCENTRATION__FIELD_NAME: WrapperField = WrapperField("Concentration", FieldType.DOUBLE)
+    DILUTIONFACTOR__FIELD_NAME: WrapperField = WrapperField("DilutionFactor", FieldType.DOUBLE)
+    FILENAME__FIELD_NAME: WrapperField = WrapperField("Filename", FieldType.STRING)
+    FILETYPE__FIELD_NAME: WrapperField = WrapperField("FileType", FieldType.STRING)
+    HEIGHT__FIELD_NAME: WrapperField = WrapperField("Height", FieldType.DOUBLE)
+    ISAREA__FIELD_NAME: WrapperField = WrapperField("ISArea", FieldType.DOUBLE)
+    ISHEIGHT__FIELD_NAME: WrapperField = WrapperField("ISHeight", FieldType.DOUBLE)
+    SAMPLETYPE__FIELD_NAME: WrapperField = WrapperField("SampleType", FieldType.STRING)
+
+    AccuracyPercent: ModelField[Optional[str]] = ModelField("AccuracyPercent", FieldType.STRING)
+    AnalyteISArea: ModelField[Optional[float]] = ModelField("AnalyteISArea", FieldType.DOUBLE)
+    Area: ModelField[Optional[float]] = ModelField("Area", FieldType.DOUBLE)
+    CalculatedConcentration: ModelField[Optional[float]] = ModelField("CalculatedConcentration", FieldType.DOUBLE)
+    CompoundName: ModelField[Optional[str]] = ModelField("CompoundName", FieldType.STRING)
+    Concentration: ModelField[Optional[float]] = ModelField("Concentration", FieldType.DOUBLE)
+    DilutionFactor: ModelField[Optional[float]] = ModelField("DilutionFactor", FieldType.DOUBLE)
+    Filename: ModelField[Optional[str]] = ModelField("Filename", FieldType.STRING)
+    FileType: ModelField[Optional[str]] = ModelField("FileType", FieldType.STRING)
+    Height: ModelField[Optional[float]] = ModelField("Height", FieldType.DOUBLE)
+    ISArea: ModelField[Optional[float]] = ModelField("ISArea", FieldType.DOUBLE)
+    ISHeight: ModelField[Optional[float]] = ModelField("ISHeight", FieldType.DOUBLE)
+    SampleType: ModelField[Optional[str]] = ModelField("SampleType", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
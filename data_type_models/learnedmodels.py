@@ -0,0 +1,43 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class LearnedModelsModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type LearnedModels
+    Data Type Display Name: Learned Model (Learned Models)
+    Fields: FilePath, FormulaName, IndependentVariableNames, IndependentVariableTypes, ModelId, ModelInputType, ModelType, ResponseVariableName, ResponseVariableType, SoftwareSuite, SoftwareVersion, VeloxCurrentVersion
+    This is a repository of all statistical models which can be used to generate predictions.
+    """
+    DATA_TYPE_NAME: str = 'LearnedModels'
+    FILEPATH__FIELD_NAME: WrapperField = WrapperField("FilePath", FieldType.STRING)
+    FORMULANAME__FIELD_NAME: WrapperField = WrapperField("FormulaName", FieldType.STRING)
+    INDEPENDENTVARIABLENAMES__FIELD_NAME: WrapperField = WrapperField("IndependentVariableNames", FieldType.SELECTION)
+    INDEPENDENTVARIABLETYPES__FIELD_NAME: WrapperField = WrapperField("IndependentVariableTypes", FieldType.STRING)
+    MODELID__FIELD_NAME: WrapperField = WrapperField("ModelId", FieldType.STRING)
+    MODELINPUTTYPE__FIELD_NAME: WrapperField = WrapperField("ModelInputType", FieldType.STRING)
+    MODELTYPE__FIELD_NAME: WrapperField = WrapperField("ModelType", FieldType.STRING)
+    RESPONSEVARIABLENAME__FIELD_NAME: WrapperField = WrapperField("ResponseVariableName", FieldType.STRING)
+    RESPONSEVARIABLETYPE__FIELD_NAME: WrapperField = WrapperField("ResponseVariableType", FieldType.STRING)
+    SOFTWARESUITE__FIELD_NAME: WrapperField = WrapperField("SoftwareSuite", FieldType.STRING)
+    SOFTWAREVERSION__FIELD_NAME: WrapperField = WrapperField("SoftwareVersion", FieldType.STRING)
+    VELOXCURRENTVERSION__FIELD_NAME: WrapperField = WrapperField("VeloxCurrentVersion", FieldType.INTEGER)
+
+    FilePath: ModelField[Optional[str]] = ModelField("FilePath", FieldType.STRING)
+    FormulaName: ModelField[Optional[str]] = ModelField("FormulaName", FieldType.STRING)
+    IndependentVariableNames: ModelField[Optional[str]] = ModelField("IndependentVariableNames", FieldType.SELECTION)
+    IndependentVariableTypes: ModelField[Optional[str]] = ModelField("IndependentVariableTypes", FieldType.STRING)
+    ModelId: ModelField[Optional[str]] = ModelField("ModelId", FieldType.STRING)
+    ModelInputType: ModelField[Optional[str]] = ModelField("ModelInputType", FieldType.STRING)
+    ModelType: ModelField[Optional[str]] = ModelField("ModelType", FieldType.STRING)
+    ResponseVariableName: ModelField[Optional[str]] = ModelField("ResponseVariableName", FieldType.STRING)
+    ResponseVariableType: ModelField[Optional[str]] = ModelField("ResponseVariableType", FieldType.STRING)
+    SoftwareSuite: ModelField[Optional[str]] = ModelField("SoftwareSuite", FieldType.STRING)
+    SoftwareVersion: ModelField[Optional[str]] = ModelField("SoftwareVersion", FieldType.STRING)
+    VeloxCurrentVersion: ModelField[Optional[int]] = ModelField("VeloxCurrentVersion", FieldType.INTEGER)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,61 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class LinearRegressionModelModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type LinearRegressionModel
+    Data Type Display Name: Linear Regression Model (Linear Regression Models)
+    Fields: A0, A1, A10, A2, A3, A4, A5, A6, A7, A8, A9, AdjRSquared, DegreeOfPolynomial, DenominatorDOF, EntryName, fValue, MultiParentLink207, NumeratorDOF, pValue, RSquared, SeriesName, SourceEntryId
+    """
+    DATA_TYPE_NAME: str = 'LinearRegressionModel'
+    A0__FIELD_NAME: WrapperField = WrapperField("A0", FieldType.DOUBLE)
+    A1__FIELD_NAME: WrapperField = WrapperField("A1", FieldType.DOUBLE)
+    A10__FIELD_NAME: WrapperField = WrapperField("A10", FieldType.DOUBLE)
+    A2__FIELD_NAME: WrapperField = WrapperField("A2", FieldType.DOUBLE)
+    A3__FIELD_NAME: WrapperField = WrapperField("A3", FieldType.DOUBLE)
+    A4__FIELD_NAME: WrapperField = WrapperField("A4", FieldType.DOUBLE)
+    A5__FIELD_NAME: WrapperField = WrapperField("A5", FieldType.DOUBLE)
+    A6__FIELD_NAME: WrapperField = WrapperField("A6", FieldType.DOUBLE)
+    A7__FIELD_NAME: WrapperField = WrapperField("A7", FieldType.DOUBLE)
+    A8__FIELD_NAME: WrapperField = WrapperField("A8", FieldType.DOUBLE)
+    A9__FIELD_NAME: WrapperField = WrapperField("A9", FieldType.DOUBLE)
+    ADJRSQUARED__FIELD_NAME: WrapperField = WrapperField("AdjRSquared", FieldType.DOUBLE)
+    DEGREEOFPOLYNOMIAL__FIELD_NAME: WrapperField = WrapperField("DegreeOfPolynomial", FieldType.INTEGER)
+    DENOMINATORDOF__FIELD_NAME: WrapperField = WrapperField("DenominatorDOF", FieldType.DOUBLE)
+    ENTRYNAME__FIELD_NAME: WrapperField = WrapperField("EntryName", FieldType.STRING)
+    FVALUE__FIELD_NAME: WrapperField = WrapperField("fValue", FieldType.DOUBLE)
+    MULTIPARENTLINK207__FIELD_NAME: WrapperField = WrapperField("MultiParentLink207", FieldType.MULTIPARENTLINK)
+    NUMERATORDOF__FIELD_NAME: WrapperField = WrapperField("NumeratorDOF", FieldType.DOUBLE)
+    PVALUE__FIELD_NAME: WrapperField = WrapperField("pValue", FieldType.DOUBLE)
+    RSQUARED__FIELD_NAME: WrapperField = WrapperField("RSquared", FieldType.DOUBLE)
+    SERIESNAME__FIELD_NAME: WrapperField = WrapperField("SeriesName", FieldType.STRING)
+    SOURCEENTRYID__FIELD_NAME: WrapperField = WrapperField("SourceEntryId", FieldType.LONG)
+
+    A0: ModelField[Optional[float]] = ModelField("A0", FieldType.DOUBLE)
+    A1: ModelField[Optional[float]] = ModelField("A1", FieldType.DOUBLE)
+    A10: ModelField[Optional[float]] = ModelField("A10", FieldType.DOUBLE)
+    A2: ModelField[Optional[float]] = ModelField("A2", FieldType.DOUBLE)
+    A3: ModelField[Optional[float]] = ModelField("A3", FieldType.DOUBLE)
+    A4: ModelField[Optional[float]] = ModelField("A4", FieldType.DOUBLE)
+    A5: ModelField[Optional[float]] = ModelField("A5", FieldType.DOUBLE)
+    A6: ModelField[Optional[float]] = ModelField("A6", FieldType.DOUBLE)
+    A7: ModelField[Optional[float]] = ModelField("A7", FieldType.DOUBLE)
+    A8: ModelField[Optional[float]] = ModelField("A8", FieldType.DOUBLE)
+    A9: ModelField[Optional[float]] = ModelField("A9", FieldType.DOUBLE)
+    AdjRSquared: ModelField[Optional[float]] = ModelField("AdjRSquared", FieldType.DOUBLE)
+    DegreeOfPolynomial: ModelField[Optional[int]] = ModelField("DegreeOfPolynomial", FieldType.INTEGER)
+    DenominatorDOF: ModelField[Optional[float]] = ModelField("DenominatorDOF", FieldType.DOUBLE)
+    EntryName: ModelField[Optional[str]] = ModelField("EntryName", FieldType.STRING)
+    fValue: ModelField[Optional[float]] = ModelField("fValue", FieldType.DOUBLE)
+    NumeratorDOF: ModelField[Optional[float]] = ModelField("NumeratorDOF", FieldType.DOUBLE)
+    pValue: ModelField[Optional[float]] = ModelField("pValue", FieldType.DOUBLE)
+    RSquared: ModelField[Optional[float]] = ModelField("RSquared", FieldType.DOUBLE)
+    SeriesName: ModelField[Optional[str]] = ModelField("SeriesName", FieldType.STRING)
+    SourceEntryId: ModelField[Optional[int]] = ModelField("SourceEntryId", FieldType.LONG)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
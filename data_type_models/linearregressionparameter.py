@@ -0,0 +1,26 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class LinearRegressionParameterModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type LinearRegressionParameter
+    Data Type Display Name: Linear Regression Parameter (Linear Regression Parameters)
+    Fields: Intercept, SBA_AdjRSquared, SBA_RSquared, Slope
+    """
+    DATA_TYPE_NAME: str = 'LinearRegressionParameter'
+    INTERCEPT__FIELD_NAME: WrapperField = WrapperField("Intercept", FieldType.DOUBLE)
+    SBA_ADJRSQUARED__FIELD_NAME: WrapperField = WrapperField("SBA_AdjRSquared", FieldType.DOUBLE)
+    SBA_RSQUARED__FIELD_NAME: WrapperField = WrapperField("SBA_RSquared", FieldType.DOUBLE)
+    SLOPE__FIELD_NAME: WrapperField = WrapperField("Slope", FieldType.DOUBLE)
+
+    Intercept: ModelField[Optional[float]] = ModelField("Intercept", FieldType.DOUBLE)
+    SBA_AdjRSquared: ModelField[Optional[float]] = ModelField("SBA_AdjRSquared", FieldType.DOUBLE)
+    SBA_RSquared: ModelField[Optional[float]] = ModelField("SBA_RSquared", FieldType.DOUBLE)
+    Slope: ModelField[Optional[float]] = ModelField("Slope", FieldType.DOUBLE)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,28 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class LogisticRegressionParameterModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type LogisticRegressionParameter
+    Data Type Display Name: Logistic Regression Parameter (Logistic Regression Parameters)
+    Fields: LogisticAsymmetry, LogisticBottom, LogisticICEC50, LogisticSlope, LogisticTop
+    """
+    DATA_TYPE_NAME: str = 'LogisticRegressionParameter'
+    LOGISTICASYMMETRY__FIELD_NAME: WrapperField = WrapperField("LogisticAsymmetry", FieldType.DOUBLE)
+    LOGISTICBOTTOM__FIELD_NAME: WrapperField = WrapperField("LogisticBottom", FieldType.DOUBLE)
+    LOGISTICICEC50__FIELD_NAME: WrapperField = WrapperField("LogisticICEC50", FieldType.DOUBLE)
+    LOGISTICSLOPE__FIELD_NAME: WrapperField = WrapperField("LogisticSlope", FieldType.DOUBLE)
+    LOGISTICTOP__FIELD_NAME: WrapperField = WrapperField("LogisticTop", FieldType.DOUBLE)
+
+    LogisticAsymmetry: ModelField[Optional[float]] = ModelField("LogisticAsymmetry", FieldType.DOUBLE)
+    LogisticBottom: ModelField[Optional[float]] = ModelField("LogisticBottom", FieldType.DOUBLE)
+    LogisticICEC50: ModelField[Optional[float]] = ModelField("LogisticICEC50", FieldType.DOUBLE)
+    LogisticSlope: ModelField[Optional[float]] = ModelField("LogisticSlope", FieldType.DOUBLE)
+    LogisticTop: ModelField[Optional[float]] = ModelField("LogisticTop", FieldType.DOUBLE)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,68 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class MaintenanceItemModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type MaintenanceItem
+    Data Type Display Name: Instrument Maintenance Item (Instrument Maintenance Items)
+    Fields: ActiveWorkflowId, ActiveWorkflowName, AlertAdvanceNoticeInDays, CanPerformMaintenance, DeactivateIfPastDue, LastPerformedDate, MaintenanceComment, MaintenanceDate, MaintenanceGracePeriod, MaintenanceReason, MaintenanceStatus, MaintenanceTechnician, MaxNotifications, NextDueDate, NotificationUserGroupList, PreReceiptCount, RepeatInstrumentMaintenance, RepeatInterval, RepeatIntervalTime, RequirementType, RequiresApproval, RequiresESignatures, SentNotifications, ServiceDescription, WorkOrderNumber
+    """
+    DATA_TYPE_NAME: str = 'MaintenanceItem'
+    ACTIVEWORKFLOWID__FIELD_NAME: WrapperField = WrapperField("ActiveWorkflowId", FieldType.LONG)
+    ACTIVEWORKFLOWNAME__FIELD_NAME: WrapperField = WrapperField("ActiveWorkflowName", FieldType.SELECTION)
+    ALERTADVANCENOTICEINDAYS__FIELD_NAME: WrapperField = WrapperField("AlertAdvanceNoticeInDays", FieldType.LONG)
+    CANPERFORMMAINTENANCE__FIELD_NAME: WrapperField = WrapperField("CanPerformMaintenance", FieldType.SELECTION)
+    DEACTIVATEIFPASTDUE__FIELD_NAME: WrapperField = WrapperField("DeactivateIfPastDue", FieldType.BOOLEAN)
+    LASTPERFORMEDDATE__FIELD_NAME: WrapperField = WrapperField("LastPerformedDate", FieldType.DATE)
+    MAINTENANCECOMMENT__FIELD_NAME: WrapperField = WrapperField("MaintenanceComment", FieldType.STRING)
+    MAINTENANCEDATE__FIELD_NAME: WrapperField = WrapperField("MaintenanceDate", FieldType.DATE)
+    MAINTENANCEGRACEPERIOD__FIELD_NAME: WrapperField = WrapperField("MaintenanceGracePeriod", FieldType.LONG)
+    MAINTENANCEREASON__FIELD_NAME: WrapperField = WrapperField("MaintenanceReason", FieldType.PICKLIST)
+    MAINTENANCESTATUS__FIELD_NAME: WrapperField = WrapperField("MaintenanceStatus", FieldType.PICKLIST)
+    MAINTENANCETECHNICIAN__FIELD_NAME: WrapperField = WrapperField("MaintenanceTechnician", FieldType.SELECTION)
+    MAXNOTIFICATIONS__FIELD_NAME: WrapperField = WrapperField("MaxNotifications", FieldType.INTEGER)
+    NEXTDUEDATE__FIELD_NAME: WrapperField = WrapperField("NextDueDate", FieldType.DATE)
+    NOTIFICATIONUSERGROUPLIST__FIELD_NAME: WrapperField = WrapperField("NotificationUserGroupList", FieldType.SELECTION)
+    PRERECEIPTCOUNT__FIELD_NAME: WrapperField = WrapperField("PreReceiptCount", FieldType.LONG)
+    REPEATINSTRUMENTMAINTENANCE__FIELD_NAME: WrapperField = WrapperField("RepeatInstrumentMaintenance", FieldType.PICKLIST)
+    REPEATINTERVAL__FIELD_NAME: WrapperField = WrapperField("RepeatInterval", FieldType.LONG)
+    REPEATINTERVALTIME__FIELD_NAME: WrapperField = WrapperField("RepeatIntervalTime", FieldType.PICKLIST)
+    REQUIREMENTTYPE__FIELD_NAME: WrapperField = WrapperField("RequirementType", FieldType.PICKLIST)
+    REQUIRESAPPROVAL__FIELD_NAME: WrapperField = WrapperField("RequiresApproval", FieldType.PICKLIST)
+    REQUIRESESIGNATURES__FIELD_NAME: WrapperField = WrapperField("RequiresESignatures", FieldType.BOOLEAN)
+    SENTNOTIFICATIONS__FIELD_NAME: WrapperField = WrapperField("SentNotifications", FieldType.INTEGER)
+    SERVICEDESCRIPTION__FIELD_NAME: WrapperField = WrapperField("ServiceDescription", FieldType.STRING)
+    WORKORDERNUMBER__FIELD_NAME: WrapperField = WrapperField("WorkOrderNumber", FieldType.STRING)
+
+    ActiveWorkflowId: ModelField[Optional[int]] = ModelField("ActiveWorkflowId", FieldType.LONG)
+    ActiveWorkflowName: ModelField[Optional[str]] = ModelField("ActiveWorkflowName", FieldType.SELECTION)
+    AlertAdvanceNoticeInDays: ModelField[Optional[int]] = ModelField("AlertAdvanceNoticeInDays", FieldType.LONG)
+    CanPerformMaintenance: ModelField[Optional[str]] = ModelField("CanPerformMaintenance", FieldType.SELECTION)
+    DeactivateIfPastDue: ModelField[Optional[bool]] = ModelField("DeactivateIfPastDue", FieldType.BOOLEAN)
+    LastPerformedDate: ModelField[Optional[int]] = ModelField("LastPerformedDate", FieldType.DATE)
+    MaintenanceComment: ModelField[Optional[str]] = ModelField("MaintenanceComment", FieldType.STRING)
+    MaintenanceDate: ModelField[Optional[int]] = ModelField("MaintenanceDate", FieldType.DATE)
+    MaintenanceGracePeriod: ModelField[Optional[int]] = ModelField("MaintenanceGracePeriod", FieldType.LONG)
+    MaintenanceReason: ModelField[Optional[str]] = ModelField("MaintenanceReason", FieldType.PICKLIST)
+    MaintenanceStatus: ModelField[Optional[str]] = ModelField("MaintenanceStatus", FieldType.PICKLIST)
+    MaintenanceTechnician: ModelField[Optional[str]] = ModelField("MaintenanceTechnician", FieldType.SELECTION)
+    MaxNotifications: ModelField[Optional[int]] = ModelField("MaxNotifications", FieldType.INTEGER)
+    NextDueDate: ModelField[Optional[int]] = ModelField("NextDueDate", FieldType.DATE)
+    NotificationUserGroupList: ModelField[Optional[str]] = ModelField("NotificationUserGroupList", FieldType.SELECTION)
+    PreReceiptCount: ModelField[Optional[int]] = ModelField("PreReceiptCount", FieldType.LONG)
+    RepeatInstrumentMaintenance: ModelField[Optional[str]] = ModelField("RepeatInstrumentMaintenance", FieldType.PICKLIST)
+    RepeatInterval: ModelField[Optional[int]] = ModelField("RepeatInterval", FieldType.LONG)
+    RepeatIntervalTime: ModelField[Optional[str]] = ModelField("RepeatIntervalTime", FieldType.PICKLIST)
+    RequirementType: ModelField[Optional[str]] = ModelField("RequirementType", FieldType.PICKLIST)
+    RequiresApproval: ModelField[Optional[str]] = ModelField("RequiresApproval", FieldType.PICKLIST)
+    RequiresESignatures: ModelField[Optional[bool]] = ModelField("RequiresESignatures", FieldType.BOOLEAN)
+    SentNotifications: ModelField[Optional[int]] = ModelField("SentNotifications", FieldType.INTEGER)
+    ServiceDescription: ModelField[Optional[str]] = ModelField("ServiceDescription", FieldType.STRING)
+    WorkOrderNumber: ModelField[Optional[str]] = ModelField("WorkOrderNumber", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,40 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class MasterMixIngredientModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type MasterMixIngredient
+    Data Type Display Name: Master Mix Ingredient Definition (Master Mix Ingredient Definitions)
+    Fields: ConcentrationUnits, ConsumableDataType, ConsumableItemDataType, ConsumableName, ConsumableRecordId, ConsumableType, ContributionPercent, ItemExtensionDataType, PartNumber, Quantity, Units
+    """
+    DATA_TYPE_NAME: str = 'MasterMixIngredient'
+    CONCENTRATIONUNITS__FIELD_NAME: WrapperField = WrapperField("ConcentrationUnits", FieldType.PICKLIST)
+    CONSUMABLEDATATYPE__FIELD_NAME: WrapperField = WrapperField("ConsumableDataType", FieldType.STRING)
+    CONSUMABLEITEMDATATYPE__FIELD_NAME: WrapperField = WrapperField("ConsumableItemDataType", FieldType.SELECTION)
+    CONSUMABLENAME__FIELD_NAME: WrapperField = WrapperField("ConsumableName", FieldType.STRING)
+    CONSUMABLERECORDID__FIELD_NAME: WrapperField = WrapperField("ConsumableRecordId", FieldType.LONG)
+    CONSUMABLETYPE__FIELD_NAME: WrapperField = WrapperField("ConsumableType", FieldType.STRING)
+    CONTRIBUTIONPERCENT__FIELD_NAME: WrapperField = WrapperField("ContributionPercent", FieldType.DOUBLE)
+    ITEMEXTENSIONDATATYPE__FIELD_NAME: WrapperField = WrapperField("ItemExtensionDataType", FieldType.SELECTION)
+    PARTNUMBER__FIELD_NAME: WrapperField = WrapperField("PartNumber", FieldType.STRING)
+    QUANTITY__FIELD_NAME: WrapperField = WrapperField("Quantity", FieldType.DOUBLE)
+    UNITS__FIELD_NAME: WrapperField = WrapperField("Units", FieldType.PICKLIST)
+
+    ConcentrationUnits: ModelField[Optional[str]] = ModelField("ConcentrationUnits", FieldType.PICKLIST)
+    ConsumableDataType: ModelField[Optional[str]] = ModelField("ConsumableDataType", FieldType.STRING)
+    ConsumableItemDataType: ModelField[Optional[str]] = ModelField("ConsumableItemDataType", FieldType.SELECTION)
+    ConsumableName: ModelField[Optional[str]] = ModelField("ConsumableName", FieldType.STRING)
+    ConsumableRecordId: ModelField[Optional[int]] = ModelField("ConsumableRecordId", FieldType.LONG)
+    ConsumableType: ModelField[Optional[str]] = ModelField("ConsumableType", FieldType.STRING)
+    ContributionPercent: ModelField[Optional[float]] = ModelField("ContributionPercent", FieldType.DOUBLE)
+    ItemExtensionDataType: ModelField[Optional[str]] = ModelField("ItemExtensionDataType", FieldType.SELECTION)
+    PartNumber: ModelField[Optional[str]] = ModelField("PartNumber", FieldType.STRING)
+    Quantity: ModelField[Optional[float]] = ModelField("Quantity", FieldType.DOUBLE)
+    Units: ModelField[Optional[str]] = ModelField("Units", FieldType.PICKLIST)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
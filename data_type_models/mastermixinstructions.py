@@ -0,0 +1,20 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class MasterMixInstructionsModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type MasterMixInstructions
+    Data Type Display Name: Master Mix Instruction (Master Mix Instructions)
+    Fields: Instructions
+    """
+    DATA_TYPE_NAME: str = 'MasterMixInstructions'
+    INSTRUCTIONS__FIELD_NAME: WrapperField = WrapperField("Instructions", FieldType.STRING)
+
+    Instructions: ModelField[Optional[str]] = ModelField("Instructions", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
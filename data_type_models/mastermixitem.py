@@ -0,0 +1,45 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class MasterMixItemModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type MasterMixItem
+    Data Type Display Name: Master Mix Ingredient (Master Mix Ingredients)
+    Fields: ConcentrationUnits, ConsumableBarcode, ConsumableDataType, ConsumableItemDataType, ConsumableRecordId, ConsumableType, ItemExtensionDataType, LockFields, LotNumber, Notes, PartNumber, QuantityToUse, Units
+    The MasterMixItem Data Type
+    """
+    DATA_TYPE_NAME: str = 'MasterMixItem'
+    CONCENTRATIONUNITS__FIELD_NAME: WrapperField = WrapperField("ConcentrationUnits", FieldType.PICKLIST)
+    CONSUMABLEBARCODE__FIELD_NAME: WrapperField = WrapperField("ConsumableBarcode", FieldType.SELECTION)
+    CONSUMABLEDATATYPE__FIELD_NAME: WrapperField = WrapperField("ConsumableDataType", FieldType.STRING)
+    CONSUMABLEITEMDATATYPE__FIELD_NAME: WrapperField = WrapperField("ConsumableItemDataType", FieldType.SELECTION)
+    CONSUMABLERECORDID__FIELD_NAME: WrapperField = WrapperField("ConsumableRecordId", FieldType.LONG)
+    CONSUMABLETYPE__FIELD_NAME: WrapperField = WrapperField("ConsumableType", FieldType.SELECTION)
+    ITEMEXTENSIONDATATYPE__FIELD_NAME: WrapperField = WrapperField("ItemExtensionDataType", FieldType.SELECTION)
+    LOCKFIELDS__FIELD_NAME: WrapperField = WrapperField("LockFields", FieldType.BOOLEAN)
+    LOTNUMBER__FIELD_NAME: WrapperField = WrapperField("LotNumber", FieldType.SELECTION)
+    NOTES__FIELD_NAME: WrapperField = WrapperField("Notes", FieldType.STRING)
+    PARTNUMBER__FIELD_NAME: WrapperField = WrapperField("PartNumber", FieldType.STRING)
+    QUANTITYTOUSE__FIELD_NAME: WrapperField = WrapperField("QuantityToUse", FieldType.DOUBLE)
+    UNITS__FIELD_NAME: WrapperField = WrapperField("Units", FieldType.PICKLIST)
+
+    ConcentrationUnits: ModelField[Optional[str]] = ModelField("ConcentrationUnits", FieldType.PICKLIST)
+    ConsumableBarcode: ModelField[Optional[str]] = ModelField("ConsumableBarcode", FieldType.SELECTION)
+    ConsumableDataType: ModelField[Optional[str]] = ModelField("ConsumableDataType", FieldType.STRING)
+    ConsumableItemDataType: ModelField[Optional[str]] = ModelField("ConsumableItemDataType", FieldType.SELECTION)
+    ConsumableRecordId: ModelField[Optional[int]] = ModelField("ConsumableRecordId", FieldType.LONG)
+    ConsumableType: ModelField[Optional[str]] = ModelField("ConsumableType", FieldType.SELECTION)
+    ItemExtensionDataType: ModelField[Optional[str]] = ModelField("ItemExtensionDataType", FieldType.SELECTION)
+    LockFields: ModelField[Optional[bool]] = ModelField("LockFields", FieldType.BOOLEAN)
+    LotNumber: ModelField[Optional[str]] = ModelField("LotNumber", FieldType.SELECTION)
+    Notes: ModelField[Optional[str]] = ModelField("Notes", FieldType.STRING)
+    PartNumber: ModelField[Optional[str]] = ModelField("PartNumber", FieldType.STRING)
+    QuantityToUse: ModelField[Optional[float]] = ModelField("QuantityToUse", FieldType.DOUBLE)
+    Units: ModelField[Optional[str]] = ModelField("Units", FieldType.PICKLIST)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,20 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class MeasurementExceptionModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type MeasurementException
+    Data Type Display Name: Observation Exception (Observation Exceptions)
+    Fields: SubjectRecordId
+    """
+    DATA_TYPE_NAME: str = 'MeasurementException'
+    SUBJECTRECORDID__FIELD_NAME: WrapperField = WrapperField("SubjectRecordId", FieldType.LONG)
+
+    SubjectRecordId: ModelField[Optional[int]] = ModelField("SubjectRecordId", FieldType.LONG)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,88 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class MsdResultModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type MsdResult
+    Data Type Display Name: MSD Result (MSD Results)
+    Fields: Algorithm, AlgorithmParamCalcAsymFactor, AlgorithmParamCalcBottom, AlgorithmParamCalcHillSlope, AlgorithmParamCalcMidPoint, AlgorithmParamCalcTop, AlgorithmParamCalcYInt, AlgorithmParameterWeighting, Assay, BackFitCurve, CalcConcCV, CalcConcentration, CalcConcMean, Concentration, CV, DetectionLimitsBotOfRangeParam, DetectionLimitsBotOfRangeType, DetectionLimitsCalcHigh, DetectionLimitsCalcLow, DetectionLimitsTopOfRangeParam, DetectionLimitsTopOfRangeType, DetectionRange, Dilution, Excluded, FitStatisticRSquared, Mean, PercentRecovery, PercentRecoveryMean, PlateName, Sample, SampleDescription, SampleGroup, SignalValue, Spot, Well
+    """
+    DATA_TYPE_NAME: str = 'MsdResult'
+    ALGORITHM__FIELD_NAME: WrapperField = WrapperField("Algorithm", FieldType.STRING)
+    ALGORITHMPARAMCALCASYMFACTOR__FIELD_NAME: WrapperField = WrapperField("AlgorithmParamCalcAsymFactor", FieldType.DOUBLE)
+    ALGORITHMPARAMCALCBOTTOM__FIELD_NAME: WrapperField = WrapperField("AlgorithmParamCalcBottom", FieldType.DOUBLE)
+    ALGORITHMPARAMCALCHILLSLOPE__FIELD_NAME: WrapperField = WrapperField("AlgorithmParamCalcHillSlope", FieldType.DOUBLE)
+    ALGORITHMPARAMCALCMIDPOINT__FIELD_NAME: WrapperField = WrapperField("AlgorithmParamCalcMidPoint", FieldType.DOUBLE)
+    ALGORITHMPARAMCALCTOP__FIELD_NAME: WrapperField = WrapperField("AlgorithmParamCalcTop", FieldType.DOUBLE)
+    ALGORITHMPARAMCALCYINT__FIELD_NAME: WrapperField = WrapperField("AlgorithmParamCalcYInt", FieldType.DOUBLE)
+    ALGORITHMPARAMETERWEIGHTING__FIELD_NAME: WrapperField = WrapperField("AlgorithmParameterWeighting", FieldType.STRING)
+    ASSAY__FIELD_NAME: WrapperField = WrapperField("Assay", FieldType.STRING)
+    BACKFITCURVE__FIELD_NAME: WrapperField = WrapperField("BackFitCurve", FieldType.STRING)
+    CALCCONCCV__FIELD_NAME: WrapperField = WrapperField("CalcConcCV", FieldType.DOUBLE)
+    CALCCONCENTRATION__FIELD_NAME: WrapperField = WrapperField("CalcConcentration", FieldType.DOUBLE)
+    CALCCONCMEAN__FIELD_NAME: WrapperField = WrapperField("CalcConcMean", FieldType.DOUBLE)
+    CONCENTRATION__FIELD_NAME: WrapperField = WrapperField("Concentration", FieldType.DOUBLE)
+    CV__FIELD_NAME: WrapperField = WrapperField("CV", FieldType.DOUBLE)
+    DETECTIONLIMITSBOTOFRANGEPARAM__FIELD_NAME: WrapperField = WrapperField("DetectionLimitsBotOfRangeParam", FieldType.DOUBLE)
+    DETECTIONLIMITSBOTOFRANGETYPE__FIELD_NAME: WrapperField = WrapperField("DetectionLimitsBotOfRangeType", FieldType.STRING)
+    DETECTIONLIMITSCALCHIGH__FIELD_NAME: WrapperField = WrapperField("DetectionLimitsCalcHigh", FieldType.DOUBLE)
+    DETECTIONLIMITSCALCLOW__FIELD_NAME: WrapperField = WrapperField("DetectionLimitsCalcLow", FieldType.DOUBLE)
+    DETECTIONLIMITSTOPOFRANGEPARAM__FIELD_NAME: WrapperField = WrapperField("DetectionLimitsTopOfRangeParam", FieldType.DOUBLE)
+    DETECTIONLIMITSTOPOFRANGETYPE__FIELD_NAME: WrapperField = WrapperField("DetectionLimitsTopOfRangeType", FieldType.STRING)
+    DETECTIONRANGE__FIELD_NAME: WrapperField = WrapperField("DetectionRange", FieldType.STRING)
+    DILUTION__FIELD_NAME: WrapperField = WrapperField("Dilution", FieldType.DOUBLE)
+    EXCLUDED__FIELD_NAME: WrapperField = WrapperField("Excluded", FieldType.PICKLIST)
+    FITSTATISTICRSQUARED__FIELD_NAME: WrapperField = WrapperField("FitStatisticRSquared", FieldType.DOUBLE)
+    MEAN__FIELD_NAME: WrapperField = WrapperField("Mean", FieldType.DOUBLE)
+    PERCENTRECOVERY__FIELD_NAME: WrapperField = WrapperField("PercentRecovery", FieldType.DOUBLE)
+    PERCENTRECOVERYMEAN__FIELD_NAME: WrapperField = WrapperField("PercentRecoveryMean", FieldType.DOUBLE)
+    PLATENAME__FIELD_NAME: WrapperField = WrapperField("PlateName", FieldType.STRING)
+    SAMPLE__FIELD_NAME: WrapperField = WrapperField("Sample", FieldType.STRING)
+    SAMPLEDESCRIPTION__FIELD_NAME: WrapperField = WrapperField("SampleDescription", FieldType.STRING)
+    SAMPLEGROUP__FIELD_NAME: WrapperField = WrapperField("SampleGroup", FieldType.STRING)
+    SIGNALVALUE__FIELD_NAME: WrapperField = WrapperField("SignalValue", FieldType.DOUBLE)
+    SPOT__FIELD_NAME: WrapperField = WrapperField("Spot", FieldType.STRING)
+    WELL__FIELD_NAME: WrapperField = WrapperField("Well", FieldType.STRING)
+
+    Algorithm: ModelField[Optional[str]] = ModelField("Algorithm", FieldType.STRING)
+    AlgorithmParamCalcAsymFactor: ModelField[Optional[float]] = ModelField("AlgorithmParamCalcAsymFactor", FieldType.DOUBLE)
+    AlgorithmParamCalcBottom: ModelField[Optional[float]] = ModelField("AlgorithmParamCalcBottom", FieldType.DOUBLE)
+    AlgorithmParamCalcHillSlope: ModelField[Optional[float]] = ModelField("AlgorithmParamCalcHillSlope", FieldType.DOUBLE)
+    AlgorithmParamCalcMidPoint: ModelField[Optional[float]] = ModelField("AlgorithmParamCalcMidPoint", FieldType.DOUBLE)
+    AlgorithmParamCalcTop: ModelField[Optional[float]] = ModelField("AlgorithmParamCalcTop", FieldType.DOUBLE)
+    AlgorithmParamCalcYInt: ModelField[Optional[float]] = ModelField("AlgorithmParamCalcYInt", FieldType.DOUBLE)
+    AlgorithmParameterWeighting: ModelField[Optional[str]] = ModelField("AlgorithmParameterWeighting", FieldType.STRING)
+    Assay: ModelField[Optional[str]] = ModelField("Assay", FieldType.STRING)
+    BackFitCurve: ModelField[Optional[str]] = ModelField("BackFitCurve", FieldType.STRING)
+    CalcConcCV: ModelField[Optional[float]] = ModelField("CalcConcCV", FieldType.DOUBLE)
+    CalcConcentration: ModelField[Optional[float]] = ModelField("CalcConcentration", FieldType.DOUBLE)
+    CalcConcMean: ModelField[Optional[float]] = ModelField("CalcConcMean", FieldType.DOUBLE)
+    Concentration: ModelField[Optional[float]] = ModelField("Concentration", FieldType.DOUBLE)
+    CV: ModelField[Optional[float]] = ModelField("CV", FieldType.DOUBLE)
+    DetectionLimitsBotOfRangeParam: ModelField[Optional[float]] = ModelField("DetectionLimitsBotOfRangeParam", FieldType.DOUBLE)
+    DetectionLimitsBotOfRangeType: ModelField[Optional[str]] = ModelField("DetectionLimitsBotOfRangeType", FieldType.STRING)
+    DetectionLimitsCalcHigh: ModelField[Optional[float]] = ModelField("DetectionLimitsCalcHigh", FieldType.DOUBLE)
+    DetectionLimitsCalcLow: ModelField[Optional[float]] = ModelField("DetectionLimitsCalcLow", FieldType.DOUBLE)
+    DetectionLimitsTopOfRangeParam: ModelField[Optional[float]] = ModelField("DetectionLimitsTopOfRangeParam", FieldType.DOUBLE)
+    DetectionLimitsTopOfRangeType: ModelField[Optional[str]] = ModelField("DetectionLimitsTopOfRangeType", FieldType.STRING)
+    DetectionRange: ModelField[Optional[str]] = ModelField("DetectionRange", FieldType.STRING)
+    Dilution: ModelField[Optional[float]] = ModelField("Dilution", FieldType.DOUBLE)
+    Excluded: ModelField[Optional[str]] = ModelField("Excluded", FieldType.PICKLIST)
+    FitStatisticRSquared: ModelField[Optional[float]] = ModelField("FitStatisticRSquared", FieldType.DOUBLE)
+    Mean: ModelField[Optional[float]] = ModelField("Mean", FieldType.DOUBLE)
+    PercentRecovery: ModelField[Optional[float]] = ModelField("PercentRecovery", FieldType.DOUBLE)
+    PercentRecoveryMean: ModelField[Optional[float]] = ModelField("PercentRecoveryMean", FieldType.DOUBLE)
+    PlateName: ModelField[Optional[str]] = ModelField("PlateName", FieldType.STRING)
+    Sample: ModelField[Optional[str]] = ModelField("Sample", FieldType.STRING)
+    SampleDescription: ModelField[Optional[str]] = ModelField("SampleDescription", FieldType.STRING)
+    SampleGroup: ModelField[Optional[str]] = ModelField("SampleGroup", FieldType.STRING)
+    SignalValue: ModelField[Optional[float]] = ModelField("SignalValue", FieldType.DOUBLE)
+    Spot: ModelField[Optional[str]] = ModelField("Spot", FieldType.STRING)
+    Well: ModelField[Optional[str]] = ModelField("Well", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,26 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class NanodropResultModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type NanodropResult
+    Data Type Display Name: Nanodrop Result (Nanodrop Results)
+    Fields: A260, A260230, A260280, A280
+    """
+    DATA_TYPE_NAME: str = 'NanodropResult'
+    A260__FIELD_NAME: WrapperField = WrapperField("A260", FieldType.DOUBLE)
+    A260230__FIELD_NAME: WrapperField = WrapperField("A260230", FieldType.DOUBLE)
+    A260280__FIELD_NAME: WrapperField = WrapperField("A260280", FieldType.DOUBLE)
+    A280__FIELD_NAME: WrapperField = WrapperField("A280", FieldType.DOUBLE)
+
+    A260: ModelField[Optional[float]] = ModelField("A260", FieldType.DOUBLE)
+    A260230: ModelField[Optional[float]] = ModelField("A260230", FieldType.DOUBLE)
+    A260280: ModelField[Optional[float]] = ModelField("A260280", FieldType.DOUBLE)
+    A280: ModelField[Optional[float]] = ModelField("A280", FieldType.DOUBLE)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,22 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class nCounterResultModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type nCounterResult
+    Data Type Display Name: nCounter Result (nCounter Results)
+    Fields: ProbeCount, ProbeName
+    """
+    DATA_TYPE_NAME: str = 'nCounterResult'
+    PROBECOUNT__FIELD_NAME: WrapperField = WrapperField("ProbeCount", FieldType.DOUBLE)
+    PROBENAME__FIELD_NAME: WrapperField = WrapperField("ProbeName", FieldType.STRING)
+
+    ProbeCount: ModelField[Optional[float]] = ModelField("ProbeCount", FieldType.DOUBLE)
+    ProbeName: ModelField[Optional[str]] = ModelField("ProbeName", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,22 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class NotebookDirectoryModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type NotebookDirectory
+    Data Type Display Name: Directory (Directories)
+    Fields: DirectoryName, InheritRolesFromParent
+    """
+    DATA_TYPE_NAME: str = 'NotebookDirectory'
+    DIRECTORYNAME__FIELD_NAME: WrapperField = WrapperField("DirectoryName", FieldType.STRING)
+    INHERITROLESFROMPARENT__FIELD_NAME: WrapperField = WrapperField("InheritRolesFromParent", FieldType.BOOLEAN)
+
+    DirectoryName: ModelField[Optional[str]] = ModelField("DirectoryName", FieldType.STRING)
+    InheritRolesFromParent: ModelField[Optional[bool]] = ModelField("InheritRolesFromParent", FieldType.BOOLEAN)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
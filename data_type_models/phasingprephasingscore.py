@@ -0,0 +1,29 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class PhasingPrephasingScoreModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type PhasingPrephasingScore
+    Data Type Display Name: Phasing and Prephasing Score (Phasing and Prephasing Scores)
+    Fields: ColRead, Lane, LaneCol, ScoreOne, ScoreTwo
+    <!-- DISPLAY IN INSTRUMENT RUN MONITOR -->
+    """
+    DATA_TYPE_NAME: str = 'PhasingPrephasingScore'
+    COLREAD__FIELD_NAME: WrapperField = WrapperField("ColRead", FieldType.STRING)
+    LANE__FIELD_NAME: WrapperField = WrapperField("Lane", FieldType.LONG)
+    LANECOL__FIELD_NAME: WrapperField = WrapperField("LaneCol", FieldType.STRING)
+    SCOREONE__FIELD_NAME: WrapperField = WrapperField("ScoreOne", FieldType.DOUBLE)
+    SCORETWO__FIELD_NAME: WrapperField = WrapperField("ScoreTwo", FieldType.DOUBLE)
+
+    ColRead: ModelField[Optional[str]] = ModelField("ColRead", FieldType.STRING)
+    Lane: ModelField[Optional[int]] = ModelField("Lane", FieldType.LONG)
+    LaneCol: ModelField[Optional[str]] = ModelField("LaneCol", FieldType.STRING)
+    ScoreOne: ModelField[Optional[float]] = ModelField("ScoreOne", FieldType.DOUBLE)
+    ScoreTwo: ModelField[Optional[float]] = ModelField("ScoreTwo", FieldType.DOUBLE)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
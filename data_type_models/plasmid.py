@@ -0,0 +1,39 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class PlasmidModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type Plasmid
+    Data Type Display Name: Plasmid Part (Plasmid Parts)
+    Fields: DownloadGenbankFile, GenebankAttachment, Name, PlasmidClassification, PlasmidName, QuantityOnHand, QuantityPerItem, ReorderLevelQuantity, Sequence, Units, Vendor
+    """
+    DATA_TYPE_NAME: str = 'Plasmid'
+    DOWNLOADGENBANKFILE__FIELD_NAME: WrapperField = WrapperField("DownloadGenbankFile", FieldType.ACTION)
+    GENEBANKATTACHMENT__FIELD_NAME: WrapperField = WrapperField("GenebankAttachment", FieldType.STRING)
+    NAME__FIELD_NAME: WrapperField = WrapperField("Name", FieldType.STRING)
+    PLASMIDCLASSIFICATION__FIELD_NAME: WrapperField = WrapperField("PlasmidClassification", FieldType.SELECTION)
+    PLASMIDNAME__FIELD_NAME: WrapperField = WrapperField("PlasmidName", FieldType.AUTO_ACCESSION)
+    QUANTITYONHAND__FIELD_NAME: WrapperField = WrapperField("QuantityOnHand", FieldType.DOUBLE)
+    QUANTITYPERITEM__FIELD_NAME: WrapperField = WrapperField("QuantityPerItem", FieldType.DOUBLE)
+    REORDERLEVELQUANTITY__FIELD_NAME: WrapperField = WrapperField("ReorderLevelQuantity", FieldType.DOUBLE)
+    SEQUENCE__FIELD_NAME: WrapperField = WrapperField("Sequence", FieldType.STRING)
+    UNITS__FIELD_NAME: WrapperField = WrapperField("Units", FieldType.PICKLIST)
+    VENDOR__FIELD_NAME: WrapperField = WrapperField("Vendor", FieldType.SELECTION)
+
+    GenebankAttachment: ModelField[Optional[str]] = ModelField("GenebankAttachment", FieldType.STRING)
+    Name: ModelField[Optional[str]] = ModelField("Name", FieldType.STRING)
+    PlasmidClassification: ModelField[Optional[str]] = ModelField("PlasmidClassification", FieldType.SELECTION)
+    PlasmidName: ModelField[Optional[str]] = ModelField("PlasmidName", FieldType.AUTO_ACCESSION)
+    QuantityOnHand: ModelField[Optional[float]] = ModelField("QuantityOnHand", FieldType.DOUBLE)
+    QuantityPerItem: ModelField[Optional[float]] = ModelField("QuantityPerItem", FieldType.DOUBLE)
+    ReorderLevelQuantity: ModelField[Optional[float]] = ModelField("ReorderLevelQuantity", FieldType.DOUBLE)
+    Sequence: ModelField[Optional[str]] = ModelField("Sequence", FieldType.STRING)
+    Units: ModelField[Optional[str]] = ModelField("Units", FieldType.PICKLIST)
+    Vendor: ModelField[Optional[str]] = ModelField("Vendor", FieldType.SELECTION)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,32 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class PlasmidItemModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type PlasmidItem
+    Data Type Display Name: Plasmid (Plasmids)
+    Fields: ExpirationDate, Expired, KitLotNumbers, LotNumber, Name, PlasmidName, Sequence
+    """
+    DATA_TYPE_NAME: str = 'PlasmidItem'
+    EXPIRATIONDATE__FIELD_NAME: WrapperField = WrapperField("ExpirationDate", FieldType.DATE)
+    EXPIRED__FIELD_NAME: WrapperField = WrapperField("Expired", FieldType.BOOLEAN)
+    KITLOTNUMBERS__FIELD_NAME: WrapperField = WrapperField("KitLotNumbers", FieldType.STRING)
+    LOTNUMBER__FIELD_NAME: WrapperField = WrapperField("LotNumber", FieldType.STRING)
+    NAME__FIELD_NAME: WrapperField = WrapperField("Name", FieldType.STRING)
+    PLASMIDNAME__FIELD_NAME: WrapperField = WrapperField("PlasmidName", FieldType.STRING)
+    SEQUENCE__FIELD_NAME: WrapperField = WrapperField("Sequence", FieldType.STRING)
+
+    ExpirationDate: ModelField[Optional[int]] = ModelField("ExpirationDate", FieldType.DATE)
+    Expired: ModelField[Optional[bool]] = ModelField("Expired", FieldType.BOOLEAN)
+    KitLotNumbers: ModelField[Optional[str]] = ModelField("KitLotNumbers", FieldType.STRING)
+    LotNumber: ModelField[Optional[str]] = ModelField("LotNumber", FieldType.STRING)
+    Name: ModelField[Optional[str]] = ModelField("Name", FieldType.STRING)
+    PlasmidName: ModelField[Optional[str]] = ModelField("PlasmidName", FieldType.STRING)
+    Sequence: ModelField[Optional[str]] = ModelField("Sequence", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,55 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class PlateModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type Plate
+    Data Type Display Name: Plate (Plates)
+    Fields: ColPosition, ExemplarPlateStatus, IsCircular, IsHighThroughput, MultiParentLink133, MultiParentLink153, MultiParentLink155, MultiParentLink204, PlateBarcode, PlateColumns, PlateId, PlateNote, PlateRows, PlateSampleType, PlateType, PlateWellCnt, QCStatus, RowPosition, StorageLocationBarcode, StorageUnitPath
+    The Plate Data Type
+    """
+    DATA_TYPE_NAME: str = 'Plate'
+    COLPOSITION__FIELD_NAME: WrapperField = WrapperField("ColPosition", FieldType.SELECTION)
+    EXEMPLARPLATESTATUS__FIELD_NAME: WrapperField = WrapperField("ExemplarPlateStatus", FieldType.SELECTION)
+    ISCIRCULAR__FIELD_NAME: WrapperField = WrapperField("IsCircular", FieldType.BOOLEAN)
+    ISHIGHTHROUGHPUT__FIELD_NAME: WrapperField = WrapperField("IsHighThroughput", FieldType.BOOLEAN)
+    MULTIPARENTLINK133__FIELD_NAME: WrapperField = WrapperField("MultiParentLink133", FieldType.MULTIPARENTLINK)
+    MULTIPARENTLINK153__FIELD_NAME: WrapperField = WrapperField("MultiParentLink153", FieldType.MULTIPARENTLINK)
+    MULTIPARENTLINK155__FIELD_NAME: WrapperField = WrapperField("MultiParentLink155", FieldType.MULTIPARENTLINK)
+    MULTIPARENTLINK204__FIELD_NAME: WrapperField = WrapperField("MultiParentLink204", FieldType.MULTIPARENTLINK)
+    PLATEBARCODE__FIELD_NAME: WrapperField = WrapperField("PlateBarcode", FieldType.STRING)
+    PLATECOLUMNS__FIELD_NAME: WrapperField = WrapperField("PlateColumns", FieldType.INTEGER)
+    PLATEID__FIELD_NAME: WrapperField = WrapperField("PlateId", FieldType.STRING)
+    PLATENOTE__FIELD_NAME: WrapperField = WrapperField("PlateNote", FieldType.STRING)
+    PLATEROWS__FIELD_NAME: WrapperField = WrapperField("PlateRows", FieldType.INTEGER)
+    PLATESAMPLETYPE__FIELD_NAME: WrapperField = WrapperField("PlateSampleType", FieldType.SELECTION)
+    PLATETYPE__FIELD_NAME: WrapperField = WrapperField("PlateType", FieldType.STRING)
+    PLATEWELLCNT__FIELD_NAME: WrapperField = WrapperField("PlateWellCnt", FieldType.ENUM)
+    QCSTATUS__FIELD_NAME: WrapperField = WrapperField("QCStatus", FieldType.PICKLIST)
+    ROWPOSITION__FIELD_NAME: WrapperField = WrapperField("RowPosition", FieldType.SELECTION)
+    STORAGELOCATIONBARCODE__FIELD_NAME: WrapperField = WrapperField("StorageLocationBarcode", FieldType.SELECTION)
+    STORAGEUNITPATH__FIELD_NAME: WrapperField = WrapperField("StorageUnitPath", FieldType.STRING)
+
+    ColPosition: ModelField[Optional[str]] = ModelField("ColPosition", FieldType.SELECTION)
+    ExemplarPlateStatus: ModelField[Optional[str]] = ModelField("ExemplarPlateStatus", FieldType.SELECTION)
+    IsCircular: ModelField[Optional[bool]] = ModelField("IsCircular", FieldType.BOOLEAN)
+    IsHighThroughput: ModelField[Optional[bool]] = ModelField("IsHighThroughput", FieldType.BOOLEAN)
+    PlateBarcode: ModelField[Optional[str]] = ModelField("PlateBarcode", FieldType.STRING)
+    PlateColumns: ModelField[Optional[int]] = ModelField("PlateColumns", FieldType.INTEGER)
+    PlateId: ModelField[Optional[str]] = ModelField("PlateId", FieldType.STRING)
+    PlateNote: ModelField[Optional[str]] = ModelField("PlateNote", FieldType.STRING)
+    PlateRows: ModelField[Optional[int]] = ModelField("PlateRows", FieldType.INTEGER)
+    PlateSampleType: ModelField[Optional[str]] = ModelField("PlateSampleType", FieldType.SELECTION)
+    PlateType: ModelField[Optional[str]] = ModelField("PlateType", FieldType.STRING)
+    PlateWellCnt: ModelField[Optional[int]] = ModelField("PlateWellCnt", FieldType.ENUM)
+    QCStatus: ModelField[Optional[str]] = ModelField("QCStatus", FieldType.PICKLIST)
+    RowPosition: ModelField[Optional[str]] = ModelField("RowPosition", FieldType.SELECTION)
+    StorageLocationBarcode: ModelField[Optional[str]] = ModelField("StorageLocationBarcode", FieldType.SELECTION)
+    StorageUnitPath: ModelField[Optional[str]] = ModelField("StorageUnitPath", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
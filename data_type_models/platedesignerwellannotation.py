@@ -0,0 +1,21 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class PlateDesignerWellAnnotationModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type PlateDesignerWellAnnotation
+    Data Type Display Name: Plate Designer Well Annotation (Plate Designer Well Annotations)
+    Fields: Notes
+    Annotations for well element allows users to add additional notes at any location in a 3D plate.
+    """
+    DATA_TYPE_NAME: str = 'PlateDesignerWellAnnotation'
+    NOTES__FIELD_NAME: WrapperField = WrapperField("Notes", FieldType.STRING)
+
+    Notes: ModelField[Optional[str]] = ModelField("Notes", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
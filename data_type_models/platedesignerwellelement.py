@@ -0,0 +1,56 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class PlateDesignerWellElementModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type PlateDesignerWellElement
+    Data Type Display Name: Plate Designer Well Element (Plate Designer Well Element)
+    Fields: ActualVolumeRemoved, AliquotSampleRecordId, ColPosition, Concentration, ConcentrationUnits, ControlType, IsControl, Layer, PlateRecordId, RowPosition, SourceDataTypeName, SourceRecordId, SourceSampleConcentration, SourceSampleMass, SourceSampleVolume, SourceVolumeToRemove, TargetMass, Volume
+    A well element describes a particular location in a 3D plate. Each well element in the system is uniquely identified by (Plate ID, Layer #, Row, Column).
+A well element is always describing about either a payload of an existing record, or an annotation (or both).
+    """
+    DATA_TYPE_NAME: str = 'PlateDesignerWellElement'
+    ACTUALVOLUMEREMOVED__FIELD_NAME: WrapperField = WrapperField("ActualVolumeRemoved", FieldType.DOUBLE)
+    ALIQUOTSAMPLERECORDID__FIELD_NAME: WrapperField = WrapperField("AliquotSampleRecordId", FieldType.LONG)
+    COLPOSITION__FIELD_NAME: WrapperField = WrapperField("ColPosition", FieldType.SELECTION)
+    CONCENTRATION__FIELD_NAME: WrapperField = WrapperField("Concentration", FieldType.DOUBLE)
+    CONCENTRATIONUNITS__FIELD_NAME: WrapperField = WrapperField("ConcentrationUnits", FieldType.STRING)
+    CONTROLTYPE__FIELD_NAME: WrapperField = WrapperField("ControlType", FieldType.STRING)
+    ISCONTROL__FIELD_NAME: WrapperField = WrapperField("IsControl", FieldType.BOOLEAN)
+    LAYER__FIELD_NAME: WrapperField = WrapperField("Layer", FieldType.INTEGER)
+    PLATERECORDID__FIELD_NAME: WrapperField = WrapperField("PlateRecordId", FieldType.LONG)
+    ROWPOSITION__FIELD_NAME: WrapperField = WrapperField("RowPosition", FieldType.SELECTION)
+    SOURCEDATATYPENAME__FIELD_NAME: WrapperField = WrapperField("SourceDataTypeName", FieldType.STRING)
+    SOURCERECORDID__FIELD_NAME: WrapperField = WrapperField("SourceRecordId", FieldType.LONG)
+    SOURCESAMPLECONCENTRATION__FIELD_NAME: WrapperField = WrapperField("SourceSampleConcentration", FieldType.DOUBLE)
+    SOURCESAMPLEMASS__FIELD_NAME: WrapperField = WrapperField("SourceSampleMass", FieldType.DOUBLE)
+    SOURCESAMPLEVOLUME__FIELD_NAME: WrapperField = WrapperField("SourceSampleVolume", FieldType.DOUBLE)
+    SOURCEVOLUMETOREMOVE__FIELD_NAME: WrapperField = WrapperField("SourceVolumeToRemove", FieldType.DOUBLE)
+    TARGETMASS__FIELD_NAME: WrapperField = WrapperField("TargetMass", FieldType.DOUBLE)
+    VOLUME__FIELD_NAME: WrapperField = WrapperField("Volume", FieldType.DOUBLE)
+
+    ActualVolumeRemoved: ModelField[Optional[float]] = ModelField("ActualVolumeRemoved", FieldType.DOUBLE)
+    AliquotSampleRecordId: ModelField[Optional[int]] = ModelField("AliquotSampleRecordId", FieldType.LONG)
+    ColPosition: ModelField[Optional[str]] = ModelField("ColPosition", FieldType.SELECTION)
+    Concentration: ModelField[Optional[float]] = ModelField("Concentration", FieldType.DOUBLE)
+    ConcentrationUnits: ModelField[Optional[str]] = ModelField("ConcentrationUnits", FieldType.STRING)
+    ControlType: ModelField[Optional[str]] = ModelField("ControlType", FieldType.STRING)
+    IsControl: ModelField[Optional[bool]] = ModelField("IsControl", FieldType.BOOLEAN)
+    Layer: ModelField[Optional[int]] = ModelField("Layer", FieldType.INTEGER)
+    PlateRecordId: ModelField[Optional[int]] = ModelField("PlateRecordId", FieldType.LONG)
+    RowPosition: ModelField[Optional[str]] = ModelField("RowPosition", FieldType.SELECTION)
+    SourceDataTypeName: ModelField[Optional[str]] = ModelField("SourceDataTypeName", FieldType.STRING)
+    SourceRecordId: ModelField[Optional[int]] = ModelField("SourceRecordId", FieldType.LONG)
+    SourceSampleConcentration: ModelField[Optional[float]] = ModelField("SourceSampleConcentration", FieldType.DOUBLE)
+    SourceSampleMass: ModelField[Optional[float]] = ModelField("SourceSampleMass", FieldType.DOUBLE)
+    SourceSampleVolume: ModelField[Optional[float]] = ModelField("SourceSampleVolume", FieldType.DOUBLE)
+    SourceVolumeToRemove: ModelField[Optional[float]] = ModelField("SourceVolumeToRemove", FieldType.DOUBLE)
+    TargetMass: ModelField[Optional[float]] = ModelField("TargetMass", FieldType.DOUBLE)
+    Volume: ModelField[Optional[float]] = ModelField("Volume", FieldType.DOUBLE)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
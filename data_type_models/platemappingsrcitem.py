@@ -0,0 +1,30 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class PlateMappingSrcItemModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type PlateMappingSrcItem
+    Data Type Display Name: Plate Mapping Source Item (Plate Mapping Source Items)
+    Fields: ColPosition, Description, IsControl, MultiParentLink133, MultiParentLink155, RowPosition, SourceItemId
+    """
+    DATA_TYPE_NAME: str = 'PlateMappingSrcItem'
+    COLPOSITION__FIELD_NAME: WrapperField = WrapperField("ColPosition", FieldType.SELECTION)
+    DESCRIPTION__FIELD_NAME: WrapperField = WrapperField("Description", FieldType.STRING)
+    ISCONTROL__FIELD_NAME: WrapperField = WrapperField("IsControl", FieldType.BOOLEAN)
+    MULTIPARENTLINK133__FIELD_NAME: WrapperField = WrapperField("MultiParentLink133", FieldType.MULTIPARENTLINK)
+    MULTIPARENTLINK155__FIELD_NAME: WrapperField = WrapperField("MultiParentLink155", FieldType.MULTIPARENTLINK)
+    ROWPOSITION__FIELD_NAME: WrapperField = WrapperField("RowPosition", FieldType.SELECTION)
+    SOURCEITEMID__FIELD_NAME: WrapperField = WrapperField("SourceItemId", FieldType.STRING)
+
+    ColPosition: ModelField[Optional[str]] = ModelField("ColPosition", FieldType.SELECTION)
+    Description: ModelField[Optional[str]] = ModelField("Description", FieldType.STRING)
+    IsControl: ModelField[Optional[bool]] = ModelField("IsControl", FieldType.BOOLEAN)
+    RowPosition: ModelField[Optional[str]] = ModelField("RowPosition", FieldType.SELECTION)
+    SourceItemId: ModelField[Optional[str]] = ModelField("SourceItemId", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
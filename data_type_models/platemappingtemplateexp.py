@@ -0,0 +1,56 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class PlateMappingTemplateExpModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type PlateMappingTemplateExp
+    Data Type Display Name: Plate Mapping Template (Plate Mapping Template)
+    Fields: AllowControlsToShift, ControlType, DestinationPlatingOrder, DstPlateSizeCol, DstPlateSizeRow, MappingName, NumberOfPlates, NumberOfSamples, PlatingMethod, ReverseSortingOrder, SamplesHaveSourcePosition, SortOnField, SourcePlateDoesNotMatter, SrcPlateSizeCol, SrcPlateSizeRow, TargetConcentration, TargetVol, UseCustomPlatePrefix, WellCompaction
+    """
+    DATA_TYPE_NAME: str = 'PlateMappingTemplateExp'
+    ALLOWCONTROLSTOSHIFT__FIELD_NAME: WrapperField = WrapperField("AllowControlsToShift", FieldType.BOOLEAN)
+    CONTROLTYPE__FIELD_NAME: WrapperField = WrapperField("ControlType", FieldType.SELECTION)
+    DESTINATIONPLATINGORDER__FIELD_NAME: WrapperField = WrapperField("DestinationPlatingOrder", FieldType.PICKLIST)
+    DSTPLATESIZECOL__FIELD_NAME: WrapperField = WrapperField("DstPlateSizeCol", FieldType.INTEGER)
+    DSTPLATESIZEROW__FIELD_NAME: WrapperField = WrapperField("DstPlateSizeRow", FieldType.INTEGER)
+    MAPPINGNAME__FIELD_NAME: WrapperField = WrapperField("MappingName", FieldType.STRING)
+    NUMBEROFPLATES__FIELD_NAME: WrapperField = WrapperField("NumberOfPlates", FieldType.INTEGER)
+    NUMBEROFSAMPLES__FIELD_NAME: WrapperField = WrapperField("NumberOfSamples", FieldType.INTEGER)
+    PLATINGMETHOD__FIELD_NAME: WrapperField = WrapperField("PlatingMethod", FieldType.PICKLIST)
+    REVERSESORTINGORDER__FIELD_NAME: WrapperField = WrapperField("ReverseSortingOrder", FieldType.BOOLEAN)
+    SAMPLESHAVESOURCEPOSITION__FIELD_NAME: WrapperField = WrapperField("SamplesHaveSourcePosition", FieldType.BOOLEAN)
+    SORTONFIELD__FIELD_NAME: WrapperField = WrapperField("SortOnField", FieldType.SELECTION)
+    SOURCEPLATEDOESNOTMATTER__FIELD_NAME: WrapperField = WrapperField("SourcePlateDoesNotMatter", FieldType.BOOLEAN)
+    SRCPLATESIZECOL__FIELD_NAME: WrapperField = WrapperField("SrcPlateSizeCol", FieldType.INTEGER)
+    SRCPLATESIZEROW__FIELD_NAME: WrapperField = WrapperField("SrcPlateSizeRow", FieldType.INTEGER)
+    TARGETCONCENTRATION__FIELD_NAME: WrapperField = WrapperField("TargetConcentration", FieldType.DOUBLE)
+    TARGETVOL__FIELD_NAME: WrapperField = WrapperField("TargetVol", FieldType.DOUBLE)
+    USECUSTOMPLATEPREFIX__FIELD_NAME: WrapperField = WrapperField("UseCustomPlatePrefix", FieldType.BOOLEAN)
+    WELLCOMPACTION__FIELD_NAME: WrapperField = WrapperField("WellCompaction", FieldType.PICKLIST)
+
+    AllowControlsToShift: ModelField[Optional[bool]] = ModelField("AllowControlsToShift", FieldType.BOOLEAN)
+    ControlType: ModelField[Optional[str]] = ModelField("ControlType", FieldType.SELECTION)
+    DestinationPlatingOrder: ModelField[Optional[str]] = ModelField("DestinationPlatingOrder", FieldType.PICKLIST)
+    DstPlateSizeCol: ModelField[Optional[int]] = ModelField("DstPlateSizeCol", FieldType.INTEGER)
+    DstPlateSizeRow: ModelField[Optional[int]] = ModelField("DstPlateSizeRow", FieldType.INTEGER)
+    MappingName: ModelField[Optional[str]] = ModelField("MappingName", FieldType.STRING)
+    NumberOfPlates: ModelField[Optional[int]] = ModelField("NumberOfPlates", FieldType.INTEGER)
+    NumberOfSamples: ModelField[Optional[int]] = ModelField("NumberOfSamples", FieldType.INTEGER)
+    PlatingMethod: ModelField[Optional[str]] = ModelField("PlatingMethod", FieldType.PICKLIST)
+    ReverseSortingOrder: ModelField[Optional[bool]] = ModelField("ReverseSortingOrder", FieldType.BOOLEAN)
+    SamplesHaveSourcePosition: ModelField[Optional[bool]] = ModelField("SamplesHaveSourcePosition", FieldType.BOOLEAN)
+    SortOnField: ModelField[Optional[str]] = ModelField("SortOnField", FieldType.SELECTION)
+    SourcePlateDoesNotMatter: ModelField[Optional[bool]] = ModelField("SourcePlateDoesNotMatter", FieldType.BOOLEAN)
+    SrcPlateSizeCol: ModelField[Optional[int]] = ModelField("SrcPlateSizeCol", FieldType.INTEGER)
+    SrcPlateSizeRow: ModelField[Optional[int]] = ModelField("SrcPlateSizeRow", FieldType.INTEGER)
+    TargetConcentration: ModelField[Optional[float]] = ModelField("TargetConcentration", FieldType.DOUBLE)
+    TargetVol: ModelField[Optional[float]] = ModelField("TargetVol", FieldType.DOUBLE)
+    UseCustomPlatePrefix: ModelField[Optional[bool]] = ModelField("UseCustomPlatePrefix", FieldType.BOOLEAN)
+    WellCompaction: ModelField[Optional[str]] = ModelField("WellCompaction", FieldType.PICKLIST)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
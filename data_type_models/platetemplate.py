@@ -0,0 +1,24 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class PlateTemplateModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type PlateTemplate
+    Data Type Display Name: Plate Template (Plate Templates)
+    Fields: TemplateDescription, TemplateDimensions, TemplateName
+    """
+    DATA_TYPE_NAME: str = 'PlateTemplate'
+    TEMPLATEDESCRIPTION__FIELD_NAME: WrapperField = WrapperField("TemplateDescription", FieldType.STRING)
+    TEMPLATEDIMENSIONS__FIELD_NAME: WrapperField = WrapperField("TemplateDimensions", FieldType.STRING)
+    TEMPLATENAME__FIELD_NAME: WrapperField = WrapperField("TemplateName", FieldType.STRING)
+
+    TemplateDescription: ModelField[Optional[str]] = ModelField("TemplateDescription", FieldType.STRING)
+    TemplateDimensions: ModelField[Optional[str]] = ModelField("TemplateDimensions", FieldType.STRING)
+    TemplateName: ModelField[Optional[str]] = ModelField("TemplateName", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
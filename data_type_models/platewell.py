@@ -0,0 +1,50 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class PlateWellModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type PlateWell
+    Data Type Display Name: Plate Well (Plate Wells)
+    Fields: ColPosition, Concentration, ConcentrationUnits, ControlType, ExemplarSampleType, IsControl, IsPooled, OtherSampleId, ParentWellOrSampleRecordId, PlateId, RowPosition, SampleId, SourceSampleRecordId, TotalMass, Volume, VolumeUnits
+    """
+    DATA_TYPE_NAME: str = 'PlateWell'
+    COLPOSITION__FIELD_NAME: WrapperField = WrapperField("ColPosition", FieldType.SELECTION)
+    CONCENTRATION__FIELD_NAME: WrapperField = WrapperField("Concentration", FieldType.DOUBLE)
+    CONCENTRATIONUNITS__FIELD_NAME: WrapperField = WrapperField("ConcentrationUnits", FieldType.PICKLIST)
+    CONTROLTYPE__FIELD_NAME: WrapperField = WrapperField("ControlType", FieldType.STRING)
+    EXEMPLARSAMPLETYPE__FIELD_NAME: WrapperField = WrapperField("ExemplarSampleType", FieldType.SELECTION)
+    ISCONTROL__FIELD_NAME: WrapperField = WrapperField("IsControl", FieldType.BOOLEAN)
+    ISPOOLED__FIELD_NAME: WrapperField = WrapperField("IsPooled", FieldType.BOOLEAN)
+    OTHERSAMPLEID__FIELD_NAME: WrapperField = WrapperField("OtherSampleId", FieldType.STRING)
+    PARENTWELLORSAMPLERECORDID__FIELD_NAME: WrapperField = WrapperField("ParentWellOrSampleRecordId", FieldType.STRING)
+    PLATEID__FIELD_NAME: WrapperField = WrapperField("PlateId", FieldType.STRING)
+    ROWPOSITION__FIELD_NAME: WrapperField = WrapperField("RowPosition", FieldType.SELECTION)
+    SAMPLEID__FIELD_NAME: WrapperField = WrapperField("SampleId", FieldType.STRING)
+    SOURCESAMPLERECORDID__FIELD_NAME: WrapperField = WrapperField("SourceSampleRecordId", FieldType.STRING)
+    TOTALMASS__FIELD_NAME: WrapperField = WrapperField("TotalMass", FieldType.DOUBLE)
+    VOLUME__FIELD_NAME: WrapperField = WrapperField("Volume", FieldType.DOUBLE)
+    VOLUMEUNITS__FIELD_NAME: WrapperField = WrapperField("VolumeUnits", FieldType.PICKLIST)
+
+    ColPosition: ModelField[Optional[str]] = ModelField("ColPosition", FieldType.SELECTION)
+    Concentration: ModelField[Optional[float]] = ModelField("Concentration", FieldType.DOUBLE)
+    ConcentrationUnits: ModelField[Optional[str]] = ModelField("ConcentrationUnits", FieldType.PICKLIST)
+    ControlType: ModelField[Optional[str]] = ModelField("ControlType", FieldType.STRING)
+    ExemplarSampleType: ModelField[Optional[str]] = ModelField("ExemplarSampleType", FieldType.SELECTION)
+    IsControl: ModelField[Optional[bool]] = ModelField("IsControl", FieldType.BOOLEAN)
+    IsPooled: ModelField[Optional[bool]] = ModelField("IsPooled", FieldType.BOOLEAN)
+    OtherSampleId: ModelField[Optional[str]] = ModelField("OtherSampleId", FieldType.STRING)
+    ParentWellOrSampleRecordId: ModelField[Optional[str]] = ModelField("ParentWellOrSampleRecordId", FieldType.STRING)
+    PlateId: ModelField[Optional[str]] = ModelField("PlateId", FieldType.STRING)
+    RowPosition: ModelField[Optional[str]] = ModelField("RowPosition", FieldType.SELECTION)
+    SampleId: ModelField[Optional[str]] = ModelField("SampleId", FieldType.STRING)
+    SourceSampleRecordId: ModelField[Optional[str]] = ModelField("SourceSampleRecordId", FieldType.STRING)
+    TotalMass: ModelField[Optional[float]] = ModelField("TotalMass", FieldType.DOUBLE)
+    Volume: ModelField[Optional[float]] = ModelField("Volume", FieldType.DOUBLE)
+    VolumeUnits: ModelField[Optional[str]] = ModelField("VolumeUnits", FieldType.PICKLIST)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
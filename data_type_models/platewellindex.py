@@ -0,0 +1,36 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class PlateWellIndexModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type PlateWellIndex
+    Data Type Display Name: Plate Well Index (Plate Well Indices)
+    Fields: ColPosition, IndexId, IndexTag, InputAssignmentMultiRecordId, InputAssignmentRecordId, MultiplexInstructions, OtherSampleId, RowPosition, SampleId
+    """
+    DATA_TYPE_NAME: str = 'PlateWellIndex'
+    COLPOSITION__FIELD_NAME: WrapperField = WrapperField("ColPosition", FieldType.SELECTION)
+    INDEXID__FIELD_NAME: WrapperField = WrapperField("IndexId", FieldType.STRING)
+    INDEXTAG__FIELD_NAME: WrapperField = WrapperField("IndexTag", FieldType.STRING)
+    INPUTASSIGNMENTMULTIRECORDID__FIELD_NAME: WrapperField = WrapperField("InputAssignmentMultiRecordId", FieldType.STRING)
+    INPUTASSIGNMENTRECORDID__FIELD_NAME: WrapperField = WrapperField("InputAssignmentRecordId", FieldType.LONG)
+    MULTIPLEXINSTRUCTIONS__FIELD_NAME: WrapperField = WrapperField("MultiplexInstructions", FieldType.SELECTION)
+    OTHERSAMPLEID__FIELD_NAME: WrapperField = WrapperField("OtherSampleId", FieldType.STRING)
+    ROWPOSITION__FIELD_NAME: WrapperField = WrapperField("RowPosition", FieldType.SELECTION)
+    SAMPLEID__FIELD_NAME: WrapperField = WrapperField("SampleId", FieldType.STRING)
+
+    ColPosition: ModelField[Optional[str]] = ModelField("ColPosition", FieldType.SELECTION)
+    IndexId: ModelField[Optional[str]] = ModelField("IndexId", FieldType.STRING)
+    IndexTag: ModelField[Optional[str]] = ModelField("IndexTag", FieldType.STRING)
+    InputAssignmentMultiRecordId: ModelField[Optional[str]] = ModelField("InputAssignmentMultiRecordId", FieldType.STRING)
+    InputAssignmentRecordId: ModelField[Optional[int]] = ModelField("InputAssignmentRecordId", FieldType.LONG)
+    MultiplexInstructions: ModelField[Optional[str]] = ModelField("MultiplexInstructions", FieldType.SELECTION)
+    OtherSampleId: ModelField[Optional[str]] = ModelField("OtherSampleId", FieldType.STRING)
+    RowPosition: ModelField[Optional[str]] = ModelField("RowPosition", FieldType.SELECTION)
+    SampleId: ModelField[Optional[str]] = ModelField("SampleId", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
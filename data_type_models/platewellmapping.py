@@ -0,0 +1,39 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class PlateWellMappingModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type PlateWellMapping
+    Data Type Display Name: Plate Well Mapping (Plate Well Mapping)
+    Fields: Description, ExemplarSampleType, MultiParentLink133, NewControl, SourceItemId, SrcPlateIdAliq1, SrcWellPosAliq1, TargetConcentration, TargetPlateIdAliq1, TargetVol, TargetWellPosAliq1
+    """
+    DATA_TYPE_NAME: str = 'PlateWellMapping'
+    DESCRIPTION__FIELD_NAME: WrapperField = WrapperField("Description", FieldType.STRING)
+    EXEMPLARSAMPLETYPE__FIELD_NAME: WrapperField = WrapperField("ExemplarSampleType", FieldType.SELECTION)
+    MULTIPARENTLINK133__FIELD_NAME: WrapperField = WrapperField("MultiParentLink133", FieldType.MULTIPARENTLINK)
+    NEWCONTROL__FIELD_NAME: WrapperField = WrapperField("NewControl", FieldType.BOOLEAN)
+    SOURCEITEMID__FIELD_NAME: WrapperField = WrapperField("SourceItemId", FieldType.STRING)
+    SRCPLATEIDALIQ1__FIELD_NAME: WrapperField = WrapperField("SrcPlateIdAliq1", FieldType.STRING)
+    SRCWELLPOSALIQ1__FIELD_NAME: WrapperField = WrapperField("SrcWellPosAliq1", FieldType.STRING)
+    TARGETCONCENTRATION__FIELD_NAME: WrapperField = WrapperField("TargetConcentration", FieldType.DOUBLE)
+    TARGETPLATEIDALIQ1__FIELD_NAME: WrapperField = WrapperField("TargetPlateIdAliq1", FieldType.STRING)
+    TARGETVOL__FIELD_NAME: WrapperField = WrapperField("TargetVol", FieldType.DOUBLE)
+    TARGETWELLPOSALIQ1__FIELD_NAME: WrapperField = WrapperField("TargetWellPosAliq1", FieldType.STRING)
+
+    Description: ModelField[Optional[str]] = ModelField("Description", FieldType.STRING)
+    ExemplarSampleType: ModelField[Optional[str]] = ModelField("ExemplarSampleType", FieldType.SELECTION)
+    NewControl: ModelField[Optional[bool]] = ModelField("NewControl", FieldType.BOOLEAN)
+    SourceItemId: ModelField[Optional[str]] = ModelField("SourceItemId", FieldType.STRING)
+    SrcPlateIdAliq1: ModelField[Optional[str]] = ModelField("SrcPlateIdAliq1", FieldType.STRING)
+    SrcWellPosAliq1: ModelField[Optional[str]] = ModelField("SrcWellPosAliq1", FieldType.STRING)
+    TargetConcentration: ModelField[Optional[float]] = ModelField("TargetConcentration", FieldType.DOUBLE)
+    TargetPlateIdAliq1: ModelField[Optional[str]] = ModelField("TargetPlateIdAliq1", FieldType.STRING)
+    TargetVol: ModelField[Optional[float]] = ModelField("TargetVol", FieldType.DOUBLE)
+    TargetWellPosAliq1: ModelField[Optional[str]] = ModelField("TargetWellPosAliq1", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,28 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class ProcessModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type Process
+    Data Type Display Name: Process (Processes)
+    Fields: DisplayName, IsActive, ProcessDescription, ProcessName, ProcessType
+    """
+    DATA_TYPE_NAME: str = 'Process'
+    DISPLAYNAME__FIELD_NAME: WrapperField = WrapperField("DisplayName", FieldType.STRING)
+    ISACTIVE__FIELD_NAME: WrapperField = WrapperField("IsActive", FieldType.BOOLEAN)
+    PROCESSDESCRIPTION__FIELD_NAME: WrapperField = WrapperField("ProcessDescription", FieldType.STRING)
+    PROCESSNAME__FIELD_NAME: WrapperField = WrapperField("ProcessName", FieldType.STRING)
+    PROCESSTYPE__FIELD_NAME: WrapperField = WrapperField("ProcessType", FieldType.SELECTION)
+
+    DisplayName: ModelField[Optional[str]] = ModelField("DisplayName", FieldType.STRING)
+    IsActive: ModelField[Optional[bool]] = ModelField("IsActive", FieldType.BOOLEAN)
+    ProcessDescription: ModelField[Optional[str]] = ModelField("ProcessDescription", FieldType.STRING)
+    ProcessName: ModelField[Optional[str]] = ModelField("ProcessName", FieldType.STRING)
+    ProcessType: ModelField[Optional[str]] = ModelField("ProcessType", FieldType.SELECTION)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,23 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class ProcessBranchConditionModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type ProcessBranchCondition
+    Data Type Display Name: Process Branch Condition (Process Branch Conditions)
+    Fields: BranchConditionJSON, ConditionID
+    Process Branch Condition for process manager pro.
+    """
+    DATA_TYPE_NAME: str = 'ProcessBranchCondition'
+    BRANCHCONDITIONJSON__FIELD_NAME: WrapperField = WrapperField("BranchConditionJSON", FieldType.STRING)
+    CONDITIONID__FIELD_NAME: WrapperField = WrapperField("ConditionID", FieldType.LONG)
+
+    BranchConditionJSON: ModelField[Optional[str]] = ModelField("BranchConditionJSON", FieldType.STRING)
+    ConditionID: ModelField[Optional[int]] = ModelField("ConditionID", FieldType.LONG)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,24 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class ProcessConfigDisplayModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type ProcessConfigDisplay
+    Data Type Display Name: Process Config Display (Process Config Displays)
+    Fields: Imported, ProcessDescription, ProcessName
+    """
+    DATA_TYPE_NAME: str = 'ProcessConfigDisplay'
+    IMPORTED__FIELD_NAME: WrapperField = WrapperField("Imported", FieldType.BOOLEAN)
+    PROCESSDESCRIPTION__FIELD_NAME: WrapperField = WrapperField("ProcessDescription", FieldType.STRING)
+    PROCESSNAME__FIELD_NAME: WrapperField = WrapperField("ProcessName", FieldType.STRING)
+
+    Imported: ModelField[Optional[bool]] = ModelField("Imported", FieldType.BOOLEAN)
+    ProcessDescription: ModelField[Optional[str]] = ModelField("ProcessDescription", FieldType.STRING)
+    ProcessName: ModelField[Optional[str]] = ModelField("ProcessName", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
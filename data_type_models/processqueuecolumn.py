@@ -0,0 +1,28 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class ProcessQueueColumnModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type ProcessQueueColumn
+    Data Type Display Name: Process Queue Column (Process Queue Columns)
+    Fields: ColumnDataTypeName, DataFieldName, FieldOrder, QueueDataType, WorkflowName
+    """
+    DATA_TYPE_NAME: str = 'ProcessQueueColumn'
+    COLUMNDATATYPENAME__FIELD_NAME: WrapperField = WrapperField("ColumnDataTypeName", FieldType.STRING)
+    DATAFIELDNAME__FIELD_NAME: WrapperField = WrapperField("DataFieldName", FieldType.STRING)
+    FIELDORDER__FIELD_NAME: WrapperField = WrapperField("FieldOrder", FieldType.SHORT)
+    QUEUEDATATYPE__FIELD_NAME: WrapperField = WrapperField("QueueDataType", FieldType.STRING)
+    WORKFLOWNAME__FIELD_NAME: WrapperField = WrapperField("WorkflowName", FieldType.STRING)
+
+    ColumnDataTypeName: ModelField[Optional[str]] = ModelField("ColumnDataTypeName", FieldType.STRING)
+    DataFieldName: ModelField[Optional[str]] = ModelField("DataFieldName", FieldType.STRING)
+    FieldOrder: ModelField[Optional[int]] = ModelField("FieldOrder", FieldType.SHORT)
+    QueueDataType: ModelField[Optional[str]] = ModelField("QueueDataType", FieldType.STRING)
+    WorkflowName: ModelField[Optional[str]] = ModelField("WorkflowName", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
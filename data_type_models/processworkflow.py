@@ -0,0 +1,68 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class ProcessWorkflowModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type ProcessWorkflow
+    Data Type Display Name: Process Workflow (Process Workflows)
+    Fields: BranchLongId, CompletionContribution, InputContainerType, InputSampleType, IsELNTemplate, isFalseConditionBranch, IsPlatesOnly, OutputSampleType, ParentBranchLongId, ProcessStepNumber, ResultTypes, WorkflowDescription, WorkflowDiffQueueTime, WorkflowDiffTAT, WorkflowExpectedQTMetric, WorkflowExpectedQueueTime, WorkflowExpectedTAT, WorkflowExpectedTATMetric, WorkflowHistoricQTMetric, WorkflowHistoricQueueTime, WorkflowHistoricQueueTimeStd, WorkflowHistoricTAT, WorkflowHistoricTATMetric, WorkflowHistoricTATStd, WorkflowName
+    """
+    DATA_TYPE_NAME: str = 'ProcessWorkflow'
+    BRANCHLONGID__FIELD_NAME: WrapperField = WrapperField("BranchLongId", FieldType.LONG)
+    COMPLETIONCONTRIBUTION__FIELD_NAME: WrapperField = WrapperField("CompletionContribution", FieldType.INTEGER)
+    INPUTCONTAINERTYPE__FIELD_NAME: WrapperField = WrapperField("InputContainerType", FieldType.PICKLIST)
+    INPUTSAMPLETYPE__FIELD_NAME: WrapperField = WrapperField("InputSampleType", FieldType.SELECTION)
+    ISELNTEMPLATE__FIELD_NAME: WrapperField = WrapperField("IsELNTemplate", FieldType.BOOLEAN)
+    ISFALSECONDITIONBRANCH__FIELD_NAME: WrapperField = WrapperField("isFalseConditionBranch", FieldType.BOOLEAN)
+    ISPLATESONLY__FIELD_NAME: WrapperField = WrapperField("IsPlatesOnly", FieldType.BOOLEAN)
+    OUTPUTSAMPLETYPE__FIELD_NAME: WrapperField = WrapperField("OutputSampleType", FieldType.SELECTION)
+    PARENTBRANCHLONGID__FIELD_NAME: WrapperField = WrapperField("ParentBranchLongId", FieldType.LONG)
+    PROCESSSTEPNUMBER__FIELD_NAME: WrapperField = WrapperField("ProcessStepNumber", FieldType.LONG)
+    RESULTTYPES__FIELD_NAME: WrapperField = WrapperField("ResultTypes", FieldType.SELECTION)
+    WORKFLOWDESCRIPTION__FIELD_NAME: WrapperField = WrapperField("WorkflowDescription", FieldType.STRING)
+    WORKFLOWDIFFQUEUETIME__FIELD_NAME: WrapperField = WrapperField("WorkflowDiffQueueTime", FieldType.DOUBLE)
+    WORKFLOWDIFFTAT__FIELD_NAME: WrapperField = WrapperField("WorkflowDiffTAT", FieldType.DOUBLE)
+    WORKFLOWEXPECTEDQTMETRIC__FIELD_NAME: WrapperField = WrapperField("WorkflowExpectedQTMetric", FieldType.DOUBLE)
+    WORKFLOWEXPECTEDQUEUETIME__FIELD_NAME: WrapperField = WrapperField("WorkflowExpectedQueueTime", FieldType.STRING)
+    WORKFLOWEXPECTEDTAT__FIELD_NAME: WrapperField = WrapperField("WorkflowExpectedTAT", FieldType.STRING)
+    WORKFLOWEXPECTEDTATMETRIC__FIELD_NAME: WrapperField = WrapperField("WorkflowExpectedTATMetric", FieldType.DOUBLE)
+    WORKFLOWHISTORICQTMETRIC__FIELD_NAME: WrapperField = WrapperField("WorkflowHistoricQTMetric", FieldType.DOUBLE)
+    WORKFLOWHISTORICQUEUETIME__FIELD_NAME: WrapperField = WrapperField("WorkflowHistoricQueueTime", FieldType.STRING)
+    WORKFLOWHISTORICQUEUETIMESTD__FIELD_NAME: WrapperField = WrapperField("WorkflowHistoricQueueTimeStd", FieldType.DOUBLE)
+    WORKFLOWHISTORICTAT__FIELD_NAME: WrapperField = WrapperField("WorkflowHistoricTAT", FieldType.STRING)
+    WORKFLOWHISTORICTATMETRIC__FIELD_NAME: WrapperField = WrapperField("WorkflowHistoricTATMetric", FieldType.DOUBLE)
+    WORKFLOWHISTORICTATSTD__FIELD_NAME: WrapperField = WrapperField("WorkflowHistoricTATStd", FieldType.DOUBLE)
+    WORKFLOWNAME__FIELD_NAME: WrapperField = WrapperField("WorkflowName", FieldType.SELECTION)
+
+    BranchLongId: ModelField[Optional[int]] = ModelField("BranchLongId", FieldType.LONG)
+    CompletionContribution: ModelField[Optional[int]] = ModelField("CompletionContribution", FieldType.INTEGER)
+    InputContainerType: ModelField[Optional[str]] = ModelField("InputContainerType", FieldType.PICKLIST)
+    InputSampleType: ModelField[Optional[str]] = ModelField("InputSampleType", FieldType.SELECTION)
+    IsELNTemplate: ModelField[Optional[bool]] = ModelField("IsELNTemplate", FieldType.BOOLEAN)
+    isFalseConditionBranch: ModelField[Optional[bool]] = ModelField("isFalseConditionBranch", FieldType.BOOLEAN)
+    IsPlatesOnly: ModelField[Optional[bool]] = ModelField("IsPlatesOnly", FieldType.BOOLEAN)
+    OutputSampleType: ModelField[Optional[str]] = ModelField("OutputSampleType", FieldType.SELECTION)
+    ParentBranchLongId: ModelField[Optional[int]] = ModelField("ParentBranchLongId", FieldType.LONG)
+    ProcessStepNumber: ModelField[Optional[int]] = ModelField("ProcessStepNumber", FieldType.LONG)
+    ResultTypes: ModelField[Optional[str]] = ModelField("ResultTypes", FieldType.SELECTION)
+    WorkflowDescription: ModelField[Optional[str]] = ModelField("WorkflowDescription", FieldType.STRING)
+    WorkflowDiffQueueTime: ModelField[Optional[float]] = ModelField("WorkflowDiffQueueTime", FieldType.DOUBLE)
+    WorkflowDiffTAT: ModelField[Optional[float]] = ModelField("WorkflowDiffTAT", FieldType.DOUBLE)
+    WorkflowExpectedQTMetric: ModelField[Optional[float]] = ModelField("WorkflowExpectedQTMetric", FieldType.DOUBLE)
+    WorkflowExpectedQueueTime: ModelField[Optional[str]] = ModelField("WorkflowExpectedQueueTime", FieldType.STRING)
+    WorkflowExpectedTAT: ModelField[Optional[str]] = ModelField("WorkflowExpectedTAT", FieldType.STRING)
+    WorkflowExpectedTATMetric: ModelField[Optional[float]] = ModelField("WorkflowExpectedTATMetric", FieldType.DOUBLE)
+    WorkflowHistoricQTMetric: ModelField[Optional[float]] = ModelField("WorkflowHistoricQTMetric", FieldType.DOUBLE)
+    WorkflowHistoricQueueTime: ModelField[Optional[str]] = ModelField("WorkflowHistoricQueueTime", FieldType.STRING)
+    WorkflowHistoricQueueTimeStd: ModelField[Optional[float]] = ModelField("WorkflowHistoricQueueTimeStd", FieldType.DOUBLE)
+    WorkflowHistoricTAT: ModelField[Optional[str]] = ModelField("WorkflowHistoricTAT", FieldType.STRING)
+    WorkflowHistoricTATMetric: ModelField[Optional[float]] = ModelField("WorkflowHistoricTATMetric", FieldType.DOUBLE)
+    WorkflowHistoricTATStd: ModelField[Optional[float]] = ModelField("WorkflowHistoricTATStd", FieldType.DOUBLE)
+    WorkflowName: ModelField[Optional[str]] = ModelField("WorkflowName", FieldType.SELECTION)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
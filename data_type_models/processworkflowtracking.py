@@ -0,0 +1,82 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class ProcessWorkflowTrackingModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type ProcessWorkflowTracking
+    Data Type Display Name: Process Workflow Tracking (Process Workflow Trackings)
+    Fields: ActiveWorkflowId, BranchLongId, EndDate, EndHour, EndMinuteTime, ExpectedQueueTime, ExpectedTAT, MultiParentLink204, ProcessStepNumber, QueuedHours, QueuedMinutes, QueuedTime, QueueStartDate, QueueStartHour, QueueStartMinuteTime, SampleRecordId, StartDate, StartHour, StartMinuteTime, Status, TurnAroundHours, TurnAroundMinutes, WorkflowEndUserId, WorkflowExpectedQueueTime, WorkflowExpectedTAT, WorkflowExpectedTotalTAT, WorkflowIdNumber, WorkflowName, WorkflowProcessTAT, WorkflowStartUserId, WorkflowTAT, WorkflowVersion
+    Records to track time spent on process workflows
+    """
+    DATA_TYPE_NAME: str = 'ProcessWorkflowTracking'
+    ACTIVEWORKFLOWID__FIELD_NAME: WrapperField = WrapperField("ActiveWorkflowId", FieldType.LONG)
+    BRANCHLONGID__FIELD_NAME: WrapperField = WrapperField("BranchLongId", FieldType.LONG)
+    ENDDATE__FIELD_NAME: WrapperField = WrapperField("EndDate", FieldType.DATE)
+    ENDHOUR__FIELD_NAME: WrapperField = WrapperField("EndHour", FieldType.LONG)
+    ENDMINUTETIME__FIELD_NAME: WrapperField = WrapperField("EndMinuteTime", FieldType.LONG)
+    EXPECTEDQUEUETIME__FIELD_NAME: WrapperField = WrapperField("ExpectedQueueTime", FieldType.DOUBLE)
+    EXPECTEDTAT__FIELD_NAME: WrapperField = WrapperField("ExpectedTAT", FieldType.DOUBLE)
+    MULTIPARENTLINK204__FIELD_NAME: WrapperField = WrapperField("MultiParentLink204", FieldType.MULTIPARENTLINK)
+    PROCESSSTEPNUMBER__FIELD_NAME: WrapperField = WrapperField("ProcessStepNumber", FieldType.LONG)
+    QUEUEDHOURS__FIELD_NAME: WrapperField = WrapperField("QueuedHours", FieldType.LONG)
+    QUEUEDMINUTES__FIELD_NAME: WrapperField = WrapperField("QueuedMinutes", FieldType.LONG)
+    QUEUEDTIME__FIELD_NAME: WrapperField = WrapperField("QueuedTime", FieldType.DOUBLE)
+    QUEUESTARTDATE__FIELD_NAME: WrapperField = WrapperField("QueueStartDate", FieldType.DATE)
+    QUEUESTARTHOUR__FIELD_NAME: WrapperField = WrapperField("QueueStartHour", FieldType.LONG)
+    QUEUESTARTMINUTETIME__FIELD_NAME: WrapperField = WrapperField("QueueStartMinuteTime", FieldType.LONG)
+    SAMPLERECORDID__FIELD_NAME: WrapperField = WrapperField("SampleRecordId", FieldType.LONG)
+    STARTDATE__FIELD_NAME: WrapperField = WrapperField("StartDate", FieldType.DATE)
+    STARTHOUR__FIELD_NAME: WrapperField = WrapperField("StartHour", FieldType.LONG)
+    STARTMINUTETIME__FIELD_NAME: WrapperField = WrapperField("StartMinuteTime", FieldType.LONG)
+    STATUS__FIELD_NAME: WrapperField = WrapperField("Status", FieldType.PICKLIST)
+    TURNAROUNDHOURS__FIELD_NAME: WrapperField = WrapperField("TurnAroundHours", FieldType.LONG)
+    TURNAROUNDMINUTES__FIELD_NAME: WrapperField = WrapperField("TurnAroundMinutes", FieldType.LONG)
+    WORKFLOWENDUSERID__FIELD_NAME: WrapperField = WrapperField("WorkflowEndUserId", FieldType.STRING)
+    WORKFLOWEXPECTEDQUEUETIME__FIELD_NAME: WrapperField = WrapperField("WorkflowExpectedQueueTime", FieldType.STRING)
+    WORKFLOWEXPECTEDTAT__FIELD_NAME: WrapperField = WrapperField("WorkflowExpectedTAT", FieldType.STRING)
+    WORKFLOWEXPECTEDTOTALTAT__FIELD_NAME: WrapperField = WrapperField("WorkflowExpectedTotalTAT", FieldType.DOUBLE)
+    WORKFLOWIDNUMBER__FIELD_NAME: WrapperField = WrapperField("WorkflowIdNumber", FieldType.LONG)
+    WORKFLOWNAME__FIELD_NAME: WrapperField = WrapperField("WorkflowName", FieldType.STRING)
+    WORKFLOWPROCESSTAT__FIELD_NAME: WrapperField = WrapperField("WorkflowProcessTAT", FieldType.DOUBLE)
+    WORKFLOWSTARTUSERID__FIELD_NAME: WrapperField = WrapperField("WorkflowStartUserId", FieldType.STRING)
+    WORKFLOWTAT__FIELD_NAME: WrapperField = WrapperField("WorkflowTAT", FieldType.DOUBLE)
+    WORKFLOWVERSION__FIELD_NAME: WrapperField = WrapperField("WorkflowVersion", FieldType.LONG)
+
+    ActiveWorkflowId: ModelField[Optional[int]] = ModelField("ActiveWorkflowId", FieldType.LONG)
+    BranchLongId: ModelField[Optional[int]] = ModelField("BranchLongId", FieldType.LONG)
+    EndDate: ModelField[Optional[int]] = ModelField("EndDate", FieldType.DATE)
+    EndHour: ModelField[Optional[int]] = ModelField("EndHour", FieldType.LONG)
+    EndMinuteTime: ModelField[Optional[int]] = ModelField("EndMinuteTime", FieldType.LONG)
+    ExpectedQueueTime: ModelField[Optional[float]] = ModelField("ExpectedQueueTime", FieldType.DOUBLE)
+    ExpectedTAT: ModelField[Optional[float]] = ModelField("ExpectedTAT", FieldType.DOUBLE)
+    ProcessStepNumber: ModelField[Optional[int]] = ModelField("ProcessStepNumber", FieldType.LONG)
+    QueuedHours: ModelField[Optional[int]] = ModelField("QueuedHours", FieldType.LONG)
+    QueuedMinutes: ModelField[Optional[int]] = ModelField("QueuedMinutes", FieldType.LONG)
+    QueuedTime: ModelField[Optional[float]] = ModelField("QueuedTime", FieldType.DOUBLE)
+    QueueStartDate: ModelField[Optional[int]] = ModelField("QueueStartDate", FieldType.DATE)
+    QueueStartHour: ModelField[Optional[int]] = ModelField("QueueStartHour", FieldType.LONG)
+    QueueStartMinuteTime: ModelField[Optional[int]] = ModelField("QueueStartMinuteTime", FieldType.LONG)
+    SampleRecordId: ModelField[Optional[int]] = ModelField("SampleRecordId", FieldType.LONG)
+    StartDate: ModelField[Optional[int]] = ModelField("StartDate", FieldType.DATE)
+    StartHour: ModelField[Optional[int]] = ModelField("StartHour", FieldType.LONG)
+    StartMinuteTime: ModelField[Optional[int]] = ModelField("StartMinuteTime", FieldType.LONG)
+    Status: ModelField[Optional[str]] = ModelField("Status", FieldType.PICKLIST)
+    TurnAroundHours: ModelField[Optional[int]] = ModelField("TurnAroundHours", FieldType.LONG)
+    TurnAroundMinutes: ModelField[Optional[int]] = ModelField("TurnAroundMinutes", FieldType.LONG)
+    WorkflowEndUserId: ModelField[Optional[str]] = ModelField("WorkflowEndUserId", FieldType.STRING)
+    WorkflowExpectedQueueTime: ModelField[Optional[str]] = ModelField("WorkflowExpectedQueueTime", FieldType.STRING)
+    WorkflowExpectedTAT: ModelField[Optional[str]] = ModelField("WorkflowExpectedTAT", FieldType.STRING)
+    WorkflowExpectedTotalTAT: ModelField[Optional[float]] = ModelField("WorkflowExpectedTotalTAT", FieldType.DOUBLE)
+    WorkflowIdNumber: ModelField[Optional[int]] = ModelField("WorkflowIdNumber", FieldType.LONG)
+    WorkflowName: ModelField[Optional[str]] = ModelField("WorkflowName", FieldType.STRING)
+    WorkflowProcessTAT: ModelField[Optional[float]] = ModelField("WorkflowProcessTAT", FieldType.DOUBLE)
+    WorkflowStartUserId: ModelField[Optional[str]] = ModelField("WorkflowStartUserId", FieldType.STRING)
+    WorkflowTAT: ModelField[Optional[float]] = ModelField("WorkflowTAT", FieldType.DOUBLE)
+    WorkflowVersion: ModelField[Optional[int]] = ModelField("WorkflowVersion", FieldType.LONG)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,89 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class ProjectModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type Project
+    Data Type Display Name: Project (Projects)
+    Fields: AdditionalNotifiers, ApplicationEngineers, Assigned, BusinessAnalystName, ClientProjectContact, CodePath, CustomerName, DefaultReplicateQc, DefaultReplicateStd, EndDate, EstimatedProjectEndDate, Geo, GoLiveDate, InheritRolesFromParent, InProduction, isClinical, LeadEmail, Leader, PrecisionOfConcentration, PrecisionOfCv, ProjectDesc, ProjectDomain, ProjectHealth, ProjectHealthJustification, ProjectId, ProjectManagerName, ProjectName, ProjectStatus, SDMSSubdirectory, ShowProjectTotal, SlaNotes, StabilityExample1, StartDate, SubjectIdPrefix, SubjectIdSequenceDigits, VeloxApprover
+    """
+    DATA_TYPE_NAME: str = 'Project'
+    ADDITIONALNOTIFIERS__FIELD_NAME: WrapperField = WrapperField("AdditionalNotifiers", FieldType.STRING)
+    APPLICATIONENGINEERS__FIELD_NAME: WrapperField = WrapperField("ApplicationEngineers", FieldType.SELECTION)
+    ASSIGNED__FIELD_NAME: WrapperField = WrapperField("Assigned", FieldType.SELECTION)
+    BUSINESSANALYSTNAME__FIELD_NAME: WrapperField = WrapperField("BusinessAnalystName", FieldType.SELECTION)
+    CLIENTPROJECTCONTACT__FIELD_NAME: WrapperField = WrapperField("ClientProjectContact", FieldType.SELECTION)
+    CODEPATH__FIELD_NAME: WrapperField = WrapperField("CodePath", FieldType.STRING)
+    CUSTOMERNAME__FIELD_NAME: WrapperField = WrapperField("CustomerName", FieldType.SELECTION)
+    DEFAULTREPLICATEQC__FIELD_NAME: WrapperField = WrapperField("DefaultReplicateQc", FieldType.INTEGER)
+    DEFAULTREPLICATESTD__FIELD_NAME: WrapperField = WrapperField("DefaultReplicateStd", FieldType.INTEGER)
+    ENDDATE__FIELD_NAME: WrapperField = WrapperField("EndDate", FieldType.DATE)
+    ESTIMATEDPROJECTENDDATE__FIELD_NAME: WrapperField = WrapperField("EstimatedProjectEndDate", FieldType.DATE)
+    GEO__FIELD_NAME: WrapperField = WrapperField("Geo", FieldType.PICKLIST)
+    GOLIVEDATE__FIELD_NAME: WrapperField = WrapperField("GoLiveDate", FieldType.DATE)
+    INHERITROLESFROMPARENT__FIELD_NAME: WrapperField = WrapperField("InheritRolesFromParent", FieldType.BOOLEAN)
+    INPRODUCTION__FIELD_NAME: WrapperField = WrapperField("InProduction", FieldType.BOOLEAN)
+    ISCLINICAL__FIELD_NAME: WrapperField = WrapperField("isClinical", FieldType.BOOLEAN)
+    LEADEMAIL__FIELD_NAME: WrapperField = WrapperField("LeadEmail", FieldType.STRING)
+    LEADER__FIELD_NAME: WrapperField = WrapperField("Leader", FieldType.SELECTION)
+    PRECISIONOFCONCENTRATION__FIELD_NAME: WrapperField = WrapperField("PrecisionOfConcentration", FieldType.INTEGER)
+    PRECISIONOFCV__FIELD_NAME: WrapperField = WrapperField("PrecisionOfCv", FieldType.INTEGER)
+    PROJECTDESC__FIELD_NAME: WrapperField = WrapperField("ProjectDesc", FieldType.STRING)
+    PROJECTDOMAIN__FIELD_NAME: WrapperField = WrapperField("ProjectDomain", FieldType.SELECTION)
+    PROJECTHEALTH__FIELD_NAME: WrapperField = WrapperField("ProjectHealth", FieldType.PICKLIST)
+    PROJECTHEALTHJUSTIFICATION__FIELD_NAME: WrapperField = WrapperField("ProjectHealthJustification", FieldType.STRING)
+    PROJECTID__FIELD_NAME: WrapperField = WrapperField("ProjectId", FieldType.STRING)
+    PROJECTMANAGERNAME__FIELD_NAME: WrapperField = WrapperField("ProjectManagerName", FieldType.SELECTION)
+    PROJECTNAME__FIELD_NAME: WrapperField = WrapperField("ProjectName", FieldType.STRING)
+    PROJECTSTATUS__FIELD_NAME: WrapperField = WrapperField("ProjectStatus", FieldType.PICKLIST)
+    SDMSSUBDIRECTORY__FIELD_NAME: WrapperField = WrapperField("SDMSSubdirectory", FieldType.STRING)
+    SHOWPROJECTTOTAL__FIELD_NAME: WrapperField = WrapperField("ShowProjectTotal", FieldType.ACTION)
+    SLANOTES__FIELD_NAME: WrapperField = WrapperField("SlaNotes", FieldType.STRING)
+    STABILITYEXAMPLE1__FIELD_NAME: WrapperField = WrapperField("StabilityExample1", FieldType.STRING)
+    STARTDATE__FIELD_NAME: WrapperField = WrapperField("StartDate", FieldType.DATE)
+    SUBJECTIDPREFIX__FIELD_NAME: WrapperField = WrapperField("SubjectIdPrefix", FieldType.SELECTION)
+    SUBJECTIDSEQUENCEDIGITS__FIELD_NAME: WrapperField = WrapperField("SubjectIdSequenceDigits", FieldType.INTEGER)
+    VELOXAPPROVER__FIELD_NAME: WrapperField = WrapperField("VeloxApprover", FieldType.SELECTION)
+
+    AdditionalNotifiers: ModelField[Optional[str]] = ModelField("AdditionalNotifiers", FieldType.STRING)
+    ApplicationEngineers: ModelField[Optional[str]] = ModelField("ApplicationEngineers", FieldType.SELECTION)
+    Assigned: ModelField[Optional[str]] = ModelField("Assigned", FieldType.SELECTION)
+    BusinessAnalystName: ModelField[Optional[str]] = ModelField("BusinessAnalystName", FieldType.SELECTION)
+    ClientProjectContact: ModelField[Optional[str]] = ModelField("ClientProjectContact", FieldType.SELECTION)
+    CodePath: ModelField[Optional[str]] = ModelField("CodePath", FieldType.STRING)
+    CustomerName: ModelField[Optional[str]] = ModelField("CustomerName", FieldType.SELECTION)
+    DefaultReplicateQc: ModelField[Optional[int]] = ModelField("DefaultReplicateQc", FieldType.INTEGER)
+    DefaultReplicateStd: ModelField[Optional[int]] = ModelField("DefaultReplicateStd", FieldType.INTEGER)
+    EndDate: ModelField[Optional[int]] = ModelField("EndDate", FieldType.DATE)
+    EstimatedProjectEndDate: ModelField[Optional[int]] = ModelField("EstimatedProjectEndDate", FieldType.DATE)
+    Geo: ModelField[Optional[str]] = ModelField("Geo", FieldType.PICKLIST)
+    GoLiveDate: ModelField[Optional[int]] = ModelField("GoLiveDate", FieldType.DATE)
+    InheritRolesFromParent: ModelField[Optional[bool]] = ModelField("InheritRolesFromParent", FieldType.BOOLEAN)
+    InProduction: ModelField[Optional[bool]] = ModelField("InProduction", FieldType.BOOLEAN)
+    isClinical: ModelField[Optional[bool]] = ModelField("isClinical", FieldType.BOOLEAN)
+    LeadEmail: ModelField[Optional[str]] = ModelField("LeadEmail", FieldType.STRING)
+    Leader: ModelField[Optional[str]] = ModelField("Leader", FieldType.SELECTION)
+    PrecisionOfConcentration: ModelField[Optional[int]] = ModelField("PrecisionOfConcentration", FieldType.INTEGER)
+    PrecisionOfCv: ModelField[Optional[int]] = ModelField("PrecisionOfCv", FieldType.INTEGER)
+    ProjectDesc: ModelField[Optional[str]] = ModelField("ProjectDesc", FieldType.STRING)
+    ProjectDomain: ModelField[Optional[str]] = ModelField("ProjectDomain", FieldType.SELECTION)
+    ProjectHealth: ModelField[Optional[str]] = ModelField("ProjectHealth", FieldType.PICKLIST)
+    ProjectHealthJustification: ModelField[Optional[str]] = ModelField("ProjectHealthJustification", FieldType.STRING)
+    ProjectId: ModelField[Optional[str]] = ModelField("ProjectId", FieldType.STRING)
+    ProjectManagerName: ModelField[Optional[str]] = ModelField("ProjectManagerName", FieldType.SELECTION)
+    ProjectName: ModelField[Optional[str]] = ModelField("ProjectName", FieldType.STRING)
+    ProjectStatus: ModelField[Optional[str]] = ModelField("ProjectStatus", FieldType.PICKLIST)
+    SDMSSubdirectory: ModelField[Optional[str]] = ModelField("SDMSSubdirectory", FieldType.STRING)
+    SlaNotes: ModelField[Optional[str]] = ModelField("SlaNotes", FieldType.STRING)
+    StabilityExample1: ModelField[Optional[str]] = ModelField("StabilityExample1", FieldType.STRING)
+    StartDate: ModelField[Optional[int]] = ModelField("StartDate", FieldType.DATE)
+    SubjectIdPrefix: ModelField[Optional[str]] = ModelField("SubjectIdPrefix", FieldType.SELECTION)
+    SubjectIdSequenceDigits: ModelField[Optional[int]] = ModelField("SubjectIdSequenceDigits", FieldType.INTEGER)
+    VeloxApprover: ModelField[Optional[str]] = ModelField("VeloxApprover", FieldType.SELECTION)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,30 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class ProteinModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type Protein
+    Data Type Display Name: Protein (Proteins)
+    Fields: Barcode, ExpirationDate, Expired, LotNumber, PartNumber, StructureName
+    """
+    DATA_TYPE_NAME: str = 'Protein'
+    BARCODE__FIELD_NAME: WrapperField = WrapperField("Barcode", FieldType.AUTO_ACCESSION)
+    EXPIRATIONDATE__FIELD_NAME: WrapperField = WrapperField("ExpirationDate", FieldType.DATE)
+    EXPIRED__FIELD_NAME: WrapperField = WrapperField("Expired", FieldType.BOOLEAN)
+    LOTNUMBER__FIELD_NAME: WrapperField = WrapperField("LotNumber", FieldType.STRING)
+    PARTNUMBER__FIELD_NAME: WrapperField = WrapperField("PartNumber", FieldType.STRING)
+    STRUCTURENAME__FIELD_NAME: WrapperField = WrapperField("StructureName", FieldType.STRING)
+
+    Barcode: ModelField[Optional[str]] = ModelField("Barcode", FieldType.AUTO_ACCESSION)
+    ExpirationDate: ModelField[Optional[int]] = ModelField("ExpirationDate", FieldType.DATE)
+    Expired: ModelField[Optional[bool]] = ModelField("Expired", FieldType.BOOLEAN)
+    LotNumber: ModelField[Optional[str]] = ModelField("LotNumber", FieldType.STRING)
+    PartNumber: ModelField[Optional[str]] = ModelField("PartNumber", FieldType.STRING)
+    StructureName: ModelField[Optional[str]] = ModelField("StructureName", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
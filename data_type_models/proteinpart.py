@@ -0,0 +1,48 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class ProteinPartModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type ProteinPart
+    Data Type Display Name: Protein Part (Protein Parts)
+    Fields: Descriptor, FilePath, IsStructureEstimated, Keywords, MolecularWeight, NumChains, PartNumber, PDBId, ProteinSequence, QuantityOnHand, QuantityPerItem, ReorderLevelQuantity, StructureName, Units, VeloxCurrentVersion
+    """
+    DATA_TYPE_NAME: str = 'ProteinPart'
+    DESCRIPTOR__FIELD_NAME: WrapperField = WrapperField("Descriptor", FieldType.STRING)
+    FILEPATH__FIELD_NAME: WrapperField = WrapperField("FilePath", FieldType.STRING)
+    ISSTRUCTUREESTIMATED__FIELD_NAME: WrapperField = WrapperField("IsStructureEstimated", FieldType.BOOLEAN)
+    KEYWORDS__FIELD_NAME: WrapperField = WrapperField("Keywords", FieldType.STRING)
+    MOLECULARWEIGHT__FIELD_NAME: WrapperField = WrapperField("MolecularWeight", FieldType.DOUBLE)
+    NUMCHAINS__FIELD_NAME: WrapperField = WrapperField("NumChains", FieldType.INTEGER)
+    PARTNUMBER__FIELD_NAME: WrapperField = WrapperField("PartNumber", FieldType.STRING)
+    PDBID__FIELD_NAME: WrapperField = WrapperField("PDBId", FieldType.STRING)
+    PROTEINSEQUENCE__FIELD_NAME: WrapperField = WrapperField("ProteinSequence", FieldType.STRING)
+    QUANTITYONHAND__FIELD_NAME: WrapperField = WrapperField("QuantityOnHand", FieldType.DOUBLE)
+    QUANTITYPERITEM__FIELD_NAME: WrapperField = WrapperField("QuantityPerItem", FieldType.DOUBLE)
+    REORDERLEVELQUANTITY__FIELD_NAME: WrapperField = WrapperField("ReorderLevelQuantity", FieldType.DOUBLE)
+    STRUCTURENAME__FIELD_NAME: WrapperField = WrapperField("StructureName", FieldType.STRING)
+    UNITS__FIELD_NAME: WrapperField = WrapperField("Units", FieldType.PICKLIST)
+    VELOXCURRENTVERSION__FIELD_NAME: WrapperField = WrapperField("VeloxCurrentVersion", FieldType.INTEGER)
+
+    Descriptor: ModelField[Optional[str]] = ModelField("Descriptor", FieldType.STRING)
+    FilePath: ModelField[Optional[str]] = ModelField("FilePath", FieldType.STRING)
+    IsStructureEstimated: ModelField[Optional[bool]] = ModelField("IsStructureEstimated", FieldType.BOOLEAN)
+    Keywords: ModelField[Optional[str]] = ModelField("Keywords", FieldType.STRING)
+    MolecularWeight: ModelField[Optional[float]] = ModelField("MolecularWeight", FieldType.DOUBLE)
+    NumChains: ModelField[Optional[int]] = ModelField("NumChains", FieldType.INTEGER)
+    PartNumber: ModelField[Optional[str]] = ModelField("PartNumber", FieldType.STRING)
+    PDBId: ModelField[Optional[str]] = ModelField("PDBId", FieldType.STRING)
+    ProteinSequence: ModelField[Optional[str]] = ModelField("ProteinSequence", FieldType.STRING)
+    QuantityOnHand: ModelField[Optional[float]] = ModelField("QuantityOnHand", FieldType.DOUBLE)
+    QuantityPerItem: ModelField[Optional[float]] = ModelField("QuantityPerItem", FieldType.DOUBLE)
+    ReorderLevelQuantity: ModelField[Optional[float]] = ModelField("ReorderLevelQuantity", FieldType.DOUBLE)
+    StructureName: ModelField[Optional[str]] = ModelField("StructureName", FieldType.STRING)
+    Units: ModelField[Optional[str]] = ModelField("Units", FieldType.PICKLIST)
+    VeloxCurrentVersion: ModelField[Optional[int]] = ModelField("VeloxCurrentVersion", FieldType.INTEGER)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
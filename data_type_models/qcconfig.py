@@ -0,0 +1,113 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class QCConfigModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type QCConfig
+    Data Type Display Name: Workflow Specific QC Config (Workflow Specific QC Configs)
+    Fields: A260230MAX, A260230MIN, A260280MAX, A260280MIN, A260MAX, A260MIN, A280MAX, A280MIN, AreaMAX, AreaMIN, AvgSizeMAX, AvgSizeMIN, CalculatedConcentrationMAX, CalculatedConcentrationMIN, CalculatedMolarityMAX, CalculatedMolarityMIN, ConcentrationMAX, ConcentrationMIN, CtMAX, CtMeanMAX, CtMeanMIN, CtMIN, CtSDMAX, CtSDMIN, DatumType, DilutionFactorMAX, DilutionFactorMIN, FailedReprocess, MapToConcentration, MapToConcentrationUnits, MolarityMAX, MolarityMIN, MultiParentLink199, PeakValueMAX, PeakValueMIN, PreferredExperiment, QCConfigId, QuantityMAX, QuantityMeanMAX, QuantityMeanMIN, QuantityMIN, QuantitySDMAX, QuantitySDMIN, RequiredResultsPerSample, RequiresConcentration, RequiresQC, RINMAX, RINMIN
+    """
+    DATA_TYPE_NAME: str = 'QCConfig'
+    A260230MAX__FIELD_NAME: WrapperField = WrapperField("A260230MAX", FieldType.DOUBLE)
+    A260230MIN__FIELD_NAME: WrapperField = WrapperField("A260230MIN", FieldType.DOUBLE)
+    A260280MAX__FIELD_NAME: WrapperField = WrapperField("A260280MAX", FieldType.DOUBLE)
+    A260280MIN__FIELD_NAME: WrapperField = WrapperField("A260280MIN", FieldType.DOUBLE)
+    A260MAX__FIELD_NAME: WrapperField = WrapperField("A260MAX", FieldType.DOUBLE)
+    A260MIN__FIELD_NAME: WrapperField = WrapperField("A260MIN", FieldType.DOUBLE)
+    A280MAX__FIELD_NAME: WrapperField = WrapperField("A280MAX", FieldType.DOUBLE)
+    A280MIN__FIELD_NAME: WrapperField = WrapperField("A280MIN", FieldType.DOUBLE)
+    AREAMAX__FIELD_NAME: WrapperField = WrapperField("AreaMAX", FieldType.DOUBLE)
+    AREAMIN__FIELD_NAME: WrapperField = WrapperField("AreaMIN", FieldType.DOUBLE)
+    AVGSIZEMAX__FIELD_NAME: WrapperField = WrapperField("AvgSizeMAX", FieldType.DOUBLE)
+    AVGSIZEMIN__FIELD_NAME: WrapperField = WrapperField("AvgSizeMIN", FieldType.DOUBLE)
+    CALCULATEDCONCENTRATIONMAX__FIELD_NAME: WrapperField = WrapperField("CalculatedConcentrationMAX", FieldType.DOUBLE)
+    CALCULATEDCONCENTRATIONMIN__FIELD_NAME: WrapperField = WrapperField("CalculatedConcentrationMIN", FieldType.DOUBLE)
+    CALCULATEDMOLARITYMAX__FIELD_NAME: WrapperField = WrapperField("CalculatedMolarityMAX", FieldType.DOUBLE)
+    CALCULATEDMOLARITYMIN__FIELD_NAME: WrapperField = WrapperField("CalculatedMolarityMIN", FieldType.DOUBLE)
+    CONCENTRATIONMAX__FIELD_NAME: WrapperField = WrapperField("ConcentrationMAX", FieldType.DOUBLE)
+    CONCENTRATIONMIN__FIELD_NAME: WrapperField = WrapperField("ConcentrationMIN", FieldType.DOUBLE)
+    CTMAX__FIELD_NAME: WrapperField = WrapperField("CtMAX", FieldType.DOUBLE)
+    CTMEANMAX__FIELD_NAME: WrapperField = WrapperField("CtMeanMAX", FieldType.DOUBLE)
+    CTMEANMIN__FIELD_NAME: WrapperField = WrapperField("CtMeanMIN", FieldType.DOUBLE)
+    CTMIN__FIELD_NAME: WrapperField = WrapperField("CtMIN", FieldType.DOUBLE)
+    CTSDMAX__FIELD_NAME: WrapperField = WrapperField("CtSDMAX", FieldType.DOUBLE)
+    CTSDMIN__FIELD_NAME: WrapperField = WrapperField("CtSDMIN", FieldType.DOUBLE)
+    DATUMTYPE__FIELD_NAME: WrapperField = WrapperField("DatumType", FieldType.SELECTION)
+    DILUTIONFACTORMAX__FIELD_NAME: WrapperField = WrapperField("DilutionFactorMAX", FieldType.DOUBLE)
+    DILUTIONFACTORMIN__FIELD_NAME: WrapperField = WrapperField("DilutionFactorMIN", FieldType.DOUBLE)
+    FAILEDREPROCESS__FIELD_NAME: WrapperField = WrapperField("FailedReprocess", FieldType.BOOLEAN)
+    MAPTOCONCENTRATION__FIELD_NAME: WrapperField = WrapperField("MapToConcentration", FieldType.SELECTION)
+    MAPTOCONCENTRATIONUNITS__FIELD_NAME: WrapperField = WrapperField("MapToConcentrationUnits", FieldType.SELECTION)
+    MOLARITYMAX__FIELD_NAME: WrapperField = WrapperField("MolarityMAX", FieldType.DOUBLE)
+    MOLARITYMIN__FIELD_NAME: WrapperField = WrapperField("MolarityMIN", FieldType.DOUBLE)
+    MULTIPARENTLINK199__FIELD_NAME: WrapperField = WrapperField("MultiParentLink199", FieldType.MULTIPARENTLINK)
+    PEAKVALUEMAX__FIELD_NAME: WrapperField = WrapperField("PeakValueMAX", FieldType.DOUBLE)
+    PEAKVALUEMIN__FIELD_NAME: WrapperField = WrapperField("PeakValueMIN", FieldType.DOUBLE)
+    PREFERREDEXPERIMENT__FIELD_NAME: WrapperField = WrapperField("PreferredExperiment", FieldType.BOOLEAN)
+    QCCONFIGID__FIELD_NAME: WrapperField = WrapperField("QCConfigId", FieldType.STRING)
+    QUANTITYMAX__FIELD_NAME: WrapperField = WrapperField("QuantityMAX", FieldType.DOUBLE)
+    QUANTITYMEANMAX__FIELD_NAME: WrapperField = WrapperField("QuantityMeanMAX", FieldType.DOUBLE)
+    QUANTITYMEANMIN__FIELD_NAME: WrapperField = WrapperField("QuantityMeanMIN", FieldType.DOUBLE)
+    QUANTITYMIN__FIELD_NAME: WrapperField = WrapperField("QuantityMIN", FieldType.DOUBLE)
+    QUANTITYSDMAX__FIELD_NAME: WrapperField = WrapperField("QuantitySDMAX", FieldType.DOUBLE)
+    QUANTITYSDMIN__FIELD_NAME: WrapperField = WrapperField("QuantitySDMIN", FieldType.DOUBLE)
+    REQUIREDRESULTSPERSAMPLE__FIELD_NAME: WrapperField = WrapperField("RequiredResultsPerSample", FieldType.INTEGER)
+    REQUIRESCONCENTRATION__FIELD_NAME: WrapperField = WrapperField("RequiresConcentration", FieldType.BOOLEAN)
+    REQUIRESQC__FIELD_NAME: WrapperField = WrapperField("RequiresQC", FieldType.BOOLEAN)
+    RINMAX__FIELD_NAME: WrapperField = WrapperField("RINMAX", FieldType.DOUBLE)
+    RINMIN__FIELD_NAME: WrapperField = WrapperField("RINMIN", FieldType.DOUBLE)
+
+    A260230MAX: ModelField[Optional[float]] = ModelField("A260230MAX", FieldType.DOUBLE)
+    A260230MIN: ModelField[Optional[float]] = ModelField("A260230MIN", FieldType.DOUBLE)
+    A260280MAX: ModelField[Optional[float]] = ModelField("A260280MAX", FieldType.DOUBLE)
+    A260280MIN: ModelField[Optional[float]] = ModelField("A260280MIN", FieldType.DOUBLE)
+    A260MAX: ModelField[Optional[float]] = ModelField("A260MAX", FieldType.DOUBLE)
+    A260MIN: ModelField[Optional[float]] = ModelField("A260MIN", FieldType.DOUBLE)
+    A280MAX: ModelField[Optional[float]] = ModelField("A280MAX", FieldType.DOUBLE)
+    A280MIN: ModelField[Optional[float]] = ModelField("A280MIN", FieldType.DOUBLE)
+    AreaMAX: ModelField[Optional[float]] = ModelField("AreaMAX", FieldType.DOUBLE)
+    AreaMIN: ModelField[Optional[float]] = ModelField("AreaMIN", FieldType.DOUBLE)
+    AvgSizeMAX: ModelField[Optional[float]] = ModelField("AvgSizeMAX", FieldType.DOUBLE)
+    AvgSizeMIN: ModelField[Optional[float]] = ModelField("AvgSizeMIN", FieldType.DOUBLE)
+    CalculatedConcentrationMAX: ModelField[Optional[float]] = ModelField("CalculatedConcentrationMAX", FieldType.DOUBLE)
+    CalculatedConcentrationMIN: ModelField[Optional[float]] = ModelField("CalculatedConcentrationMIN", FieldType.DOUBLE)
+    CalculatedMolarityMAX: ModelField[Optional[float]] = ModelField("CalculatedMolarityMAX", FieldType.DOUBLE)
+    CalculatedMolarityMIN: ModelField[Optional[float]] = ModelField("CalculatedMolarityMIN", FieldType.DOUBLE)
+    ConcentrationMAX: ModelField[Optional[float]] = ModelField("ConcentrationMAX", FieldType.DOUBLE)
+    ConcentrationMIN: ModelField[Optional[float]] = ModelField("ConcentrationMIN", FieldType.DOUBLE)
+    CtMAX: ModelField[Optional[float]] = ModelField("CtMAX", FieldType.DOUBLE)
+    CtMeanMAX: ModelField[Optional[float]] = ModelField("CtMeanMAX", FieldType.DOUBLE)
+    CtMeanMIN: ModelField[Optional[float]] = ModelField("CtMeanMIN", FieldType.DOUBLE)
+    CtMIN: ModelField[Optional[float]] = ModelField("CtMIN", FieldType.DOUBLE)
+    CtSDMAX: ModelField[Optional[float]] = ModelField("CtSDMAX", FieldType.DOUBLE)
+    CtSDMIN: ModelField[Optional[float]] = ModelField("CtSDMIN", FieldType.DOUBLE)
+    DatumType: ModelField[Optional[str]] = ModelField("DatumType", FieldType.SELECTION)
+    DilutionFactorMAX: ModelField[Optional[float]] = ModelField("DilutionFactorMAX", FieldType.DOUBLE)
+    DilutionFactorMIN: ModelField[Optional[float]] = ModelField("DilutionFactorMIN", FieldType.DOUBLE)
+    FailedReprocess: ModelField[Optional[bool]] = ModelField("FailedReprocess", FieldType.BOOLEAN)
+    MapToConcentration: ModelField[Optional[str]] = ModelField("MapToConcentration", FieldType.SELECTION)
+    MapToConcentrationUnits: ModelField[Optional[str]] = ModelField("MapToConcentrationUnits", FieldType.SELECTION)
+    MolarityMAX: ModelField[Optional[float]] = ModelField("MolarityMAX", FieldType.DOUBLE)
+    MolarityMIN: ModelField[Optional[float]] = ModelField("MolarityMIN", FieldType.DOUBLE)
+    PeakValueMAX: ModelField[Optional[float]] = ModelField("PeakValueMAX", FieldType.DOUBLE)
+    PeakValueMIN: ModelField[Optional[float]] = ModelField("PeakValueMIN", FieldType.DOUBLE)
+    PreferredExperiment: ModelField[Optional[bool]] = ModelField("PreferredExperiment", FieldType.BOOLEAN)
+    QCConfigId: ModelField[Optional[str]] = ModelField("QCConfigId", FieldType.STRING)
+    QuantityMAX: ModelField[Optional[float]] = ModelField("QuantityMAX", FieldType.DOUBLE)
+    QuantityMeanMAX: ModelField[Optional[float]] = ModelField("QuantityMeanMAX", FieldType.DOUBLE)
+    QuantityMeanMIN: ModelField[Optional[float]] = ModelField("QuantityMeanMIN", FieldType.DOUBLE)
+    QuantityMIN: ModelField[Optional[float]] = ModelField("QuantityMIN", FieldType.DOUBLE)
+    QuantitySDMAX: ModelField[Optional[float]] = ModelField("QuantitySDMAX", FieldType.DOUBLE)
+    QuantitySDMIN: ModelField[Optional[float]] = ModelField("QuantitySDMIN", FieldType.DOUBLE)
+    RequiredResultsPerSample: ModelField[Optional[int]] = ModelField("RequiredResultsPerSample", FieldType.INTEGER)
+    RequiresConcentration: ModelField[Optional[bool]] = ModelField("RequiresConcentration", FieldType.BOOLEAN)
+    RequiresQC: ModelField[Optional[bool]] = ModelField("RequiresQC", FieldType.BOOLEAN)
+    RINMAX: ModelField[Optional[float]] = ModelField("RINMAX", FieldType.DOUBLE)
+    RINMIN: ModelField[Optional[float]] = ModelField("RINMIN", FieldType.DOUBLE)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,264 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class QCDatumModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type QCDatum
+    Data Type Display Name: Instrument Datum (Instrument Data)
+    Fields: A230, A260, A260230, A260280, A280, A320, AlignedMigrationTime, Analyte, AnalyteQuantity, Area, Attachments, AverageConcentration, AvgSize, BaselineEnd, BaselineStart, CalculatedConcentration, CalculatedConcentrationMean, CalculatedMolarity, Color, ColPosition, Concentration, ConcentrationUnits, Cq, CqMean, CqStdDev, Ct, CtMean, CtSD, CtThreshold, CV, DateTime, DatumType, DetectionRange, DilutionFactor, EntryId, ExperimentRecordId, ExtinctionCoefficient, FACSPopCount, FACSPopulation, FACSSubPopulation, FileSourceDirectory, FracRetentionTime, FracTFAAreaPercentTotal, FracTFAIsFound, FractionSites, FromTime, GeneExpressed, GeneExpressionValue, GrossWeight, InstrumentDataStatus, InstrumentName, IonMode, MapToSample, Molarity, MolarityUnits, MsdSignal, NetWeight, NH3AreaPercentTotal, NH3IsFound, NH3RetentionTime, Observations, OtherSampleId, OverrideExplanation, OverrideUser, Pathlength, PeakValue, PercentOfTotal, PerRecoveryMean, PlateID, Position, ProbeCount, ProbeName, QCStatus, Quantity, QuantityMean, QuantitySD, Quencher, Ratio, RawDataValue, ReadA, ReadB, Reporter, Results, RIN, ROI, RowPosition, SampleFinalQCStatus, SampleId, SegmentName, SizeDistribution, SQMean, SQStdDev, StartingQuantitySQ, TableEntryName, TareWeight, TargetName, Task, TFAAreaPercentTotal, TFAIsFound, TFARetentionTime, TimeCorrectedArea, TotalConcentration, ToTime, TubeVolume, ViCellAspirateCycles, ViCellAvgBg, ViCellAvgCellsImg, ViCellAvgCirc, ViCellAvgDiam, ViCellComment, ViCellDateTime, ViCellFileName, ViCellImgs, ViCellMaxDiam, ViCellMinCir, ViCellMinDiam, ViCellTotalCells, ViCellTotalCellsMl, ViCellType, ViCellViability, ViCellViableCells, ViCellViableCellsMl, WellPosition
+    """
+    DATA_TYPE_NAME: str = 'QCDatum'
+    A230__FIELD_NAME: WrapperField = WrapperField("A230", FieldType.DOUBLE)
+    A260__FIELD_NAME: WrapperField = WrapperField("A260", FieldType.DOUBLE)
+    A260230__FIELD_NAME: WrapperField = WrapperField("A260230", FieldType.DOUBLE)
+    A260280__FIELD_NAME: WrapperField = WrapperField("A260280", FieldType.DOUBLE)
+    A280__FIELD_NAME: WrapperField = WrapperField("A280", FieldType.DOUBLE)
+    A320__FIELD_NAME: WrapperField = WrapperField("A320", FieldType.DOUBLE)
+    ALIGNEDMIGRATIONTIME__FIELD_NAME: WrapperField = WrapperField("AlignedMigrationTime", FieldType.DOUBLE)
+    ANALYTE__FIELD_NAME: WrapperField = WrapperField("Analyte", FieldType.STRING)
+    ANALYTEQUANTITY__FIELD_NAME: WrapperField = WrapperField("AnalyteQuantity", FieldType.DOUBLE)
+    AREA__FIELD_NAME: WrapperField = WrapperField("Area", FieldType.DOUBLE)
+    ATTACHMENTS__FIELD_NAME: WrapperField = WrapperField("Attachments", FieldType.SELECTION)
+    AVERAGECONCENTRATION__FIELD_NAME: WrapperField = WrapperField("AverageConcentration", FieldType.DOUBLE)
+    AVGSIZE__FIELD_NAME: WrapperField = WrapperField("AvgSize", FieldType.DOUBLE)
+    BASELINEEND__FIELD_NAME: WrapperField = WrapperField("BaselineEnd", FieldType.LONG)
+    BASELINESTART__FIELD_NAME: WrapperField = WrapperField("BaselineStart", FieldType.LONG)
+    CALCULATEDCONCENTRATION__FIELD_NAME: WrapperField = WrapperField("CalculatedConcentration", FieldType.DOUBLE)
+    CALCULATEDCONCENTRATIONMEAN__FIELD_NAME: WrapperField = WrapperField("CalculatedConcentrationMean", FieldType.DOUBLE)
+    CALCULATEDMOLARITY__FIELD_NAME: WrapperField = WrapperField("CalculatedMolarity", FieldType.DOUBLE)
+    COLOR__FIELD_NAME: WrapperField = WrapperField("Color", FieldType.LONG)
+    COLPOSITION__FIELD_NAME: WrapperField = WrapperField("ColPosition", FieldType.STRING)
+    CONCENTRATION__FIELD_NAME: WrapperField = WrapperField("Concentration", FieldType.DOUBLE)
+    CONCENTRATIONUNITS__FIELD_NAME: WrapperField = WrapperField("ConcentrationUnits", FieldType.STRING)
+    CQ__FIELD_NAME: WrapperField = WrapperField("Cq", FieldType.DOUBLE)
+    CQMEAN__FIELD_NAME: WrapperField = WrapperField("CqMean", FieldType.DOUBLE)
+    CQSTDDEV__FIELD_NAME: WrapperField = WrapperField("CqStdDev", FieldType.DOUBLE)
+    CT__FIELD_NAME: WrapperField = WrapperField("Ct", FieldType.DOUBLE)
+    CTMEAN__FIELD_NAME: WrapperField = WrapperField("CtMean", FieldType.DOUBLE)
+    CTSD__FIELD_NAME: WrapperField = WrapperField("CtSD", FieldType.DOUBLE)
+    CTTHRESHOLD__FIELD_NAME: WrapperField = WrapperField("CtThreshold", FieldType.DOUBLE)
+    CV__FIELD_NAME: WrapperField = WrapperField("CV", FieldType.DOUBLE)
+    DATETIME__FIELD_NAME: WrapperField = WrapperField("DateTime", FieldType.DATE)
+    DATUMTYPE__FIELD_NAME: WrapperField = WrapperField("DatumType", FieldType.SELECTION)
+    DETECTIONRANGE__FIELD_NAME: WrapperField = WrapperField("DetectionRange", FieldType.STRING)
+    DILUTIONFACTOR__FIELD_NAME: WrapperField = WrapperField("DilutionFactor", FieldType.DOUBLE)
+    ENTRYID__FIELD_NAME: WrapperField = WrapperField("EntryId", FieldType.LONG)
+    EXPERIMENTRECORDID__FIELD_NAME: WrapperField = WrapperField("ExperimentRecordId", FieldType.LONG)
+    EXTINCTIONCOEFFICIENT__FIELD_NAME: WrapperField = WrapperField("ExtinctionCoefficient", FieldType.DOUBLE)
+    FACSPOPCOUNT__FIELD_NAME: WrapperField = WrapperField("FACSPopCount", FieldType.LONG)
+    FACSPOPULATION__FIELD_NAME: WrapperField = WrapperField("FACSPopulation", FieldType.STRING)
+    FACSSUBPOPULATION__FIELD_NAME: WrapperField = WrapperField("FACSSubPopulation", FieldType.STRING)
+    FILESOURCEDIRECTORY__FIELD_NAME: WrapperField = WrapperField("FileSourceDirectory", FieldType.STRING)
+    FRACRETENTIONTIME__FIELD_NAME: WrapperField = WrapperField("FracRetentionTime", FieldType.DOUBLE)
+    FRACTFAAREAPERCENTTOTAL__FIELD_NAME: WrapperField = WrapperField("FracTFAAreaPercentTotal", FieldType.DOUBLE)
+    FRACTFAISFOUND__FIELD_NAME: WrapperField = WrapperField("FracTFAIsFound", FieldType.BOOLEAN)
+    FRACTIONSITES__FIELD_NAME: WrapperField = WrapperField("FractionSites", FieldType.STRING)
+    FROMTIME__FIELD_NAME: WrapperField = WrapperField("FromTime", FieldType.INTEGER)
+    GENEEXPRESSED__FIELD_NAME: WrapperField = WrapperField("GeneExpressed", FieldType.STRING)
+    GENEEXPRESSIONVALUE__FIELD_NAME: WrapperField = WrapperField("GeneExpressionValue", FieldType.DOUBLE)
+    GROSSWEIGHT__FIELD_NAME: WrapperField = WrapperField("GrossWeight", FieldType.DOUBLE)
+    INSTRUMENTDATASTATUS__FIELD_NAME: WrapperField = WrapperField("InstrumentDataStatus", FieldType.PICKLIST)
+    INSTRUMENTNAME__FIELD_NAME: WrapperField = WrapperField("InstrumentName", FieldType.STRING)
+    IONMODE__FIELD_NAME: WrapperField = WrapperField("IonMode", FieldType.STRING)
+    MAPTOSAMPLE__FIELD_NAME: WrapperField = WrapperField("MapToSample", FieldType.BOOLEAN)
+    MOLARITY__FIELD_NAME: WrapperField = WrapperField("Molarity", FieldType.DOUBLE)
+    MOLARITYUNITS__FIELD_NAME: WrapperField = WrapperField("MolarityUnits", FieldType.STRING)
+    MSDSIGNAL__FIELD_NAME: WrapperField = WrapperField("MsdSignal", FieldType.INTEGER)
+    NETWEIGHT__FIELD_NAME: WrapperField = WrapperField("NetWeight", FieldType.DOUBLE)
+    NH3AREAPERCENTTOTAL__FIELD_NAME: WrapperField = WrapperField("NH3AreaPercentTotal", FieldType.DOUBLE)
+    NH3ISFOUND__FIELD_NAME: WrapperField = WrapperField("NH3IsFound", FieldType.BOOLEAN)
+    NH3RETENTIONTIME__FIELD_NAME: WrapperField = WrapperField("NH3RetentionTime", FieldType.DOUBLE)
+    OBSERVATIONS__FIELD_NAME: WrapperField = WrapperField("Observations", FieldType.STRING)
+    OTHERSAMPLEID__FIELD_NAME: WrapperField = WrapperField("OtherSampleId", FieldType.STRING)
+    OVERRIDEEXPLANATION__FIELD_NAME: WrapperField = WrapperField("OverrideExplanation", FieldType.STRING)
+    OVERRIDEUSER__FIELD_NAME: WrapperField = WrapperField("OverrideUser", FieldType.STRING)
+    PATHLENGTH__FIELD_NAME: WrapperField = WrapperField("Pathlength", FieldType.DOUBLE)
+    PEAKVALUE__FIELD_NAME: WrapperField = WrapperField("PeakValue", FieldType.DOUBLE)
+    PERCENTOFTOTAL__FIELD_NAME: WrapperField = WrapperField("PercentOfTotal", FieldType.DOUBLE)
+    PERRECOVERYMEAN__FIELD_NAME: WrapperField = WrapperField("PerRecoveryMean", FieldType.DOUBLE)
+    PLATEID__FIELD_NAME: WrapperField = WrapperField("PlateID", FieldType.STRING)
+    POSITION__FIELD_NAME: WrapperField = WrapperField("Position", FieldType.STRING)
+    PROBECOUNT__FIELD_NAME: WrapperField = WrapperField("ProbeCount", FieldType.DOUBLE)
+    PROBENAME__FIELD_NAME: WrapperField = WrapperField("ProbeName", FieldType.STRING)
+    QCSTATUS__FIELD_NAME: WrapperField = WrapperField("QCStatus", FieldType.PICKLIST)
+    QUANTITY__FIELD_NAME: WrapperField = WrapperField("Quantity", FieldType.DOUBLE)
+    QUANTITYMEAN__FIELD_NAME: WrapperField = WrapperField("QuantityMean", FieldType.DOUBLE)
+    QUANTITYSD__FIELD_NAME: WrapperField = WrapperField("QuantitySD", FieldType.DOUBLE)
+    QUENCHER__FIELD_NAME: WrapperField = WrapperField("Quencher", FieldType.STRING)
+    RATIO__FIELD_NAME: WrapperField = WrapperField("Ratio", FieldType.STRING)
+    RAWDATAVALUE__FIELD_NAME: WrapperField = WrapperField("RawDataValue", FieldType.DOUBLE)
+    READA__FIELD_NAME: WrapperField = WrapperField("ReadA", FieldType.STRING)
+    READB__FIELD_NAME: WrapperField = WrapperField("ReadB", FieldType.STRING)
+    REPORTER__FIELD_NAME: WrapperField = WrapperField("Reporter", FieldType.STRING)
+    RESULTS__FIELD_NAME: WrapperField = WrapperField("Results", FieldType.STRING)
+    RIN__FIELD_NAME: WrapperField = WrapperField("RIN", FieldType.DOUBLE)
+    ROI__FIELD_NAME: WrapperField = WrapperField("ROI", FieldType.INTEGER)
+    ROWPOSITION__FIELD_NAME: WrapperField = WrapperField("RowPosition", FieldType.STRING)
+    SAMPLEFINALQCSTATUS__FIELD_NAME: WrapperField = WrapperField("SampleFinalQCStatus", FieldType.PICKLIST)
+    SAMPLEID__FIELD_NAME: WrapperField = WrapperField("SampleId", FieldType.STRING)
+    SEGMENTNAME__FIELD_NAME: WrapperField = WrapperField("SegmentName", FieldType.STRING)
+    SIZEDISTRIBUTION__FIELD_NAME: WrapperField = WrapperField("SizeDistribution", FieldType.DOUBLE)
+    SQMEAN__FIELD_NAME: WrapperField = WrapperField("SQMean", FieldType.DOUBLE)
+    SQSTDDEV__FIELD_NAME: WrapperField = WrapperField("SQStdDev", FieldType.DOUBLE)
+    STARTINGQUANTITYSQ__FIELD_NAME: WrapperField = WrapperField("StartingQuantitySQ", FieldType.DOUBLE)
+    TABLEENTRYNAME__FIELD_NAME: WrapperField = WrapperField("TableEntryName", FieldType.STRING)
+    TAREWEIGHT__FIELD_NAME: WrapperField = WrapperField("TareWeight", FieldType.DOUBLE)
+    TARGETNAME__FIELD_NAME: WrapperField = WrapperField("TargetName", FieldType.STRING)
+    TASK__FIELD_NAME: WrapperField = WrapperField("Task", FieldType.STRING)
+    TFAAREAPERCENTTOTAL__FIELD_NAME: WrapperField = WrapperField("TFAAreaPercentTotal", FieldType.DOUBLE)
+    TFAISFOUND__FIELD_NAME: WrapperField = WrapperField("TFAIsFound", FieldType.BOOLEAN)
+    TFARETENTIONTIME__FIELD_NAME: WrapperField = WrapperField("TFARetentionTime", FieldType.DOUBLE)
+    TIMECORRECTEDAREA__FIELD_NAME: WrapperField = WrapperField("TimeCorrectedArea", FieldType.DOUBLE)
+    TOTALCONCENTRATION__FIELD_NAME: WrapperField = WrapperField("TotalConcentration", FieldType.DOUBLE)
+    TOTIME__FIELD_NAME: WrapperField = WrapperField("ToTime", FieldType.INTEGER)
+    TUBEVOLUME__FIELD_NAME: WrapperField = WrapperField("TubeVolume", FieldType.DOUBLE)
+    VICELLASPIRATECYCLES__FIELD_NAME: WrapperField = WrapperField("ViCellAspirateCycles", FieldType.DOUBLE)
+    VICELLAVGBG__FIELD_NAME: WrapperField = WrapperField("ViCellAvgBg", FieldType.DOUBLE)
+    VICELLAVGCELLSIMG__FIELD_NAME: WrapperField = WrapperField("ViCellAvgCellsImg", FieldType.DOUBLE)
+    VICELLAVGCIRC__FIELD_NAME: WrapperField = WrapperField("ViCellAvgCirc", FieldType.DOUBLE)
+    VICELLAVGDIAM__FIELD_NAME: WrapperField = WrapperField("ViCellAvgDiam", FieldType.DOUBLE)
+    VICELLCOMMENT__FIELD_NAME: WrapperField = WrapperField("ViCellComment", FieldType.STRING)
+    VICELLDATETIME__FIELD_NAME: WrapperField = WrapperField("ViCellDateTime", FieldType.DATE)
+    VICELLFILENAME__FIELD_NAME: WrapperField = WrapperField("ViCellFileName", FieldType.STRING)
+    VICELLIMGS__FIELD_NAME: WrapperField = WrapperField("ViCellImgs", FieldType.DOUBLE)
+    VICELLMAXDIAM__FIELD_NAME: WrapperField = WrapperField("ViCellMaxDiam", FieldType.DOUBLE)
+    VICELLMINCIR__FIELD_NAME: WrapperField = WrapperField("ViCellMinCir", FieldType.DOUBLE)
+    VICELLMINDIAM__FIELD_NAME: WrapperField = WrapperField("ViCellMinDiam", FieldType.DOUBLE)
+    VICELLTOTALCELLS__FIELD_NAME: WrapperField = WrapperField("ViCellTotalCells", FieldType.DOUBLE)
+    VICELLTOTALCELLSML__FIELD_NAME: WrapperField = WrapperField("ViCellTotalCellsMl", FieldType.DOUBLE)
+    VICELLTYPE__FIELD_NAME: WrapperField = WrapperField("ViCellType", FieldType.STRING)
+    VICELLVIABILITY__FIELD_NAME: WrapperField = WrapperField("ViCellViability", FieldType.DOUBLE)
+    VICELLVIABLECELLS__FIELD_NAME: WrapperField = WrapperField("ViCellViableCells", FieldType.DOUBLE)
+    VICELLVIABLECELLSML__FIELD_NAME: WrapperField = WrapperField("ViCellViableCellsMl", FieldType.DOUBLE)
+    WELLPOSITION__FIELD_NAME: WrapperField = WrapperField("WellPosition", FieldType.STRING)
+
+    A230: ModelField[Optional[float]] = ModelField("A230", FieldType.DOUBLE)
+    A260: ModelField[Optional[float]] = ModelField("A260", FieldType.DOUBLE)
+    A260230: ModelField[Optional[float]] = ModelField("A260230", FieldType.DOUBLE)
+    A260280: ModelField[Optional[float]] = ModelField("A260280", FieldType.DOUBLE)
+    A280: ModelField[Optional[float]] = ModelField("A280", FieldType.DOUBLE)
+    A320: ModelField[Optional[float]] = ModelField("A320", FieldType.DOUBLE)
+    AlignedMigrationTime: ModelField[Optional[float]] = ModelField("AlignedMigrationTime", FieldType.DOUBLE)
+    Analyte: ModelField[Optional[str]] = ModelField("Analyte", FieldType.STRING)
+    AnalyteQuantity: ModelField[Optional[float]] = ModelField("AnalyteQuantity", FieldType.DOUBLE)
+    Area: ModelField[Optional[float]] = ModelField("Area", FieldType.DOUBLE)
+    Attachments: ModelField[Optional[str]] = ModelField("Attachments", FieldType.SELECTION)
+    AverageConcentration: ModelField[Optional[float]] = ModelField("AverageConcentration", FieldType.DOUBLE)
+    AvgSize: ModelField[Optional[float]] = ModelField("AvgSize", FieldType.DOUBLE)
+    BaselineEnd: ModelField[Optional[int]] = ModelField("BaselineEnd", FieldType.LONG)
+    BaselineStart: ModelField[Optional[int]] = ModelField("BaselineStart", FieldType.LONG)
+    CalculatedConcentration: ModelField[Optional[float]] = ModelField("CalculatedConcentration", FieldType.DOUBLE)
+    CalculatedConcentrationMean: ModelField[Optional[float]] = ModelField("CalculatedConcentrationMean", FieldType.DOUBLE)
+    CalculatedMolarity: ModelField[Optional[float]] = ModelField("CalculatedMolarity", FieldType.DOUBLE)
+    Color: ModelField[Optional[int]] = ModelField("Color", FieldType.LONG)
+    ColPosition: ModelField[Optional[str]] = ModelField("ColPosition", FieldType.STRING)
+    Concentration: ModelField[Optional[float]] = ModelField("Concentration", FieldType.DOUBLE)
+    ConcentrationUnits: ModelField[Optional[str]] = ModelField("ConcentrationUnits", FieldType.STRING)
+    Cq: ModelField[Optional[float]] = ModelField("Cq", FieldType.DOUBLE)
+    CqMean: ModelField[Optional[float]] = ModelField("CqMean", FieldType.DOUBLE)
+    CqStdDev: ModelField[Optional[float]] = ModelField("CqStdDev", FieldType.DOUBLE)
+    Ct: ModelField[Optional[float]] = ModelField("Ct", FieldType.DOUBLE)
+    CtMean: ModelField[Optional[float]] = ModelField("CtMean", FieldType.DOUBLE)
+    CtSD: ModelField[Optional[float]] = ModelField("CtSD", FieldType.DOUBLE)
+    CtThreshold: ModelField[Optional[float]] = ModelField("CtThreshold", FieldType.DOUBLE)
+    CV: ModelField[Optional[float]] = ModelField("CV", FieldType.DOUBLE)
+    DateTime: ModelField[Optional[int]] = ModelField("DateTime", FieldType.DATE)
+    DatumType: ModelField[Optional[str]] = ModelField("DatumType", FieldType.SELECTION)
+    DetectionRange: ModelField[Optional[str]] = ModelField("DetectionRange", FieldType.STRING)
+    DilutionFactor: ModelField[Optional[float]] = ModelField("DilutionFactor", FieldType.DOUBLE)
+    EntryId: ModelField[Optional[int]] = ModelField("EntryId", FieldType.LONG)
+    ExperimentRecordId: ModelField[Optional[int]] = ModelField("ExperimentRecordId", FieldType.LONG)
+    ExtinctionCoefficient: ModelField[Optional[float]] = ModelField("ExtinctionCoefficient", FieldType.DOUBLE)
+    FACSPopCount: ModelField[Optional[int]] = ModelField("FACSPopCount", FieldType.LONG)
+    FACSPopulation: ModelField[Optional[str]] = ModelField("FACSPopulation", FieldType.STRING)
+    FACSSubPopulation: ModelField[Optional[str]] = ModelField("FACSSubPopulation", FieldType.STRING)
+    FileSourceDirectory: ModelField[Optional[str]] = ModelField("FileSourceDirectory", FieldType.STRING)
+    FracRetentionTime: ModelField[Optional[float]] = ModelField("FracRetentionTime", FieldType.DOUBLE)
+    FracTFAAreaPercentTotal: ModelField[Optional[float]] = ModelField("FracTFAAreaPercentTotal", FieldType.DOUBLE)
+    FracTFAIsFound: ModelField[Optional[bool]] = ModelField("FracTFAIsFound", FieldType.BOOLEAN)
+    FractionSites: ModelField[Optional[str]] = ModelField("FractionSites", FieldType.STRING)
+    FromTime: ModelField[Optional[int]] = ModelField("FromTime", FieldType.INTEGER)
+    GeneExpressed: ModelField[Optional[str]] = ModelField("GeneExpressed", FieldType.STRING)
+    GeneExpressionValue: ModelField[Optional[float]] = ModelField("GeneExpressionValue", FieldType.DOUBLE)
+    GrossWeight: ModelField[Optional[float]] = ModelField("GrossWeight", FieldType.DOUBLE)
+    InstrumentDataStatus: ModelField[Optional[str]] = ModelField("InstrumentDataStatus", FieldType.PICKLIST)
+    InstrumentName: ModelField[Optional[str]] = ModelField("InstrumentName", FieldType.STRING)
+    IonMode: ModelField[Optional[str]] = ModelField("IonMode", FieldType.STRING)
+    MapToSample: ModelField[Optional[bool]] = ModelField("MapToSample", FieldType.BOOLEAN)
+    Molarity: ModelField[Optional[float]] = ModelField("Molarity", FieldType.DOUBLE)
+    MolarityUnits: ModelField[Optional[str]] = ModelField("MolarityUnits", FieldType.STRING)
+    MsdSignal: ModelField[Optional[int]] = ModelField("MsdSignal", FieldType.INTEGER)
+    NetWeight: ModelField[Optional[float]] = ModelField("NetWeight", FieldType.DOUBLE)
+    NH3AreaPercentTotal: ModelField[Optional[float]] = ModelField("NH3AreaPercentTotal", FieldType.DOUBLE)
+    NH3IsFound: ModelField[Optional[bool]] = ModelField("NH3IsFound", FieldType.BOOLEAN)
+    NH3RetentionTime: ModelField[Optional[float]] = ModelField("NH3RetentionTime", FieldType.DOUBLE)
+    Observations: ModelField[Optional[str]] = ModelField("Observations", FieldType.STRING)
+    OtherSampleId: ModelField[Optional[str]] = ModelField("OtherSampleId", FieldType.STRING)
+    OverrideExplanation: ModelField[Optional[str]] = ModelField("OverrideExplanation", FieldType.STRING)
+    OverrideUser: ModelField[Optional[str]] = ModelField("OverrideUser", FieldType.STRING)
+    Pathlength: ModelField[Optional[float]] = ModelField("Pathlength", FieldType.DOUBLE)
+    PeakValue: ModelField[Optional[float]] = ModelField("PeakValue", FieldType.DOUBLE)
+    PercentOfTotal: ModelField[Optional[float]] = ModelField("PercentOfTotal", FieldType.DOUBLE)
+    PerRecoveryMean: ModelField[Optional[float]] = ModelField("PerRecoveryMean", FieldType.DOUBLE)
+    PlateID: ModelField[Optional[str]] = ModelField("PlateID", FieldType.STRING)
+    Position: ModelField[Optional[str]] = ModelField("Position", FieldType.STRING)
+    ProbeCount: ModelField[Optional[float]] = ModelField("ProbeCount", FieldType.DOUBLE)
+    ProbeName: ModelField[Optional[str]] = ModelField("ProbeName", FieldType.STRING)
+    QCStatus: ModelField[Optional[str]] = ModelField("QCStatus", FieldType.PICKLIST)
+    Quantity: ModelField[Optional[float]] = ModelField("Quantity", FieldType.DOUBLE)
+    QuantityMean: ModelField[Optional[float]] = ModelField("QuantityMean", FieldType.DOUBLE)
+    QuantitySD: ModelField[Optional[float]] = ModelField("QuantitySD", FieldType.DOUBLE)
+    Quencher: ModelField[Optional[str]] = ModelField("Quencher", FieldType.STRING)
+    Ratio: ModelField[Optional[str]] = ModelField("Ratio", FieldType.STRING)
+    RawDataValue: ModelField[Optional[float]] = ModelField("RawDataValue", FieldType.DOUBLE)
+    ReadA: ModelField[Optional[str]] = ModelField("ReadA", FieldType.STRING)
+    ReadB: ModelField[Optional[str]] = ModelField("ReadB", FieldType.STRING)
+    Reporter: ModelField[Optional[str]] = ModelField("Reporter", FieldType.STRING)
+    Results: ModelField[Optional[str]] = ModelField("Results", FieldType.STRING)
+    RIN: ModelField[Optional[float]] = ModelField("RIN", FieldType.DOUBLE)
+    ROI: ModelField[Optional[int]] = ModelField("ROI", FieldType.INTEGER)
+    RowPosition: ModelField[Optional[str]] = ModelField("RowPosition", FieldType.STRING)
+    SampleFinalQCStatus: ModelField[Optional[str]] = ModelField("SampleFinalQCStatus", FieldType.PICKLIST)
+    SampleId: ModelField[Optional[str]] = ModelField("SampleId", FieldType.STRING)
+    SegmentName: ModelField[Optional[str]] = ModelField("SegmentName", FieldType.STRING)
+    SizeDistribution: ModelField[Optional[float]] = ModelField("SizeDistribution", FieldType.DOUBLE)
+    SQMean: ModelField[Optional[float]] = ModelField("SQMean", FieldType.DOUBLE)
+    SQStdDev: ModelField[Optional[float]] = ModelField("SQStdDev", FieldType.DOUBLE)
+    StartingQuantitySQ: ModelField[Optional[float]] = ModelField("StartingQuantitySQ", FieldType.DOUBLE)
+    TableEntryName: ModelField[Optional[str]] = ModelField("TableEntryName", FieldType.STRING)
+    TareWeight: ModelField[Optional[float]] = ModelField("TareWeight", FieldType.DOUBLE)
+    TargetName: ModelField[Optional[str]] = ModelField("TargetName", FieldType.STRING)
+    Task: ModelField[Optional[str]] = ModelField("Task", FieldType.STRING)
+    TFAAreaPercentTotal: ModelField[Optional[float]] = ModelField("TFAAreaPercentTotal", FieldType.DOUBLE)
+    TFAIsFound: ModelField[Optional[bool]] = ModelField("TFAIsFound", FieldType.BOOLEAN)
+    TFARetentionTime: ModelField[Optional[float]] = ModelField("TFARetentionTime", FieldType.DOUBLE)
+    TimeCorrectedArea: ModelField[Optional[float]] = ModelField("TimeCorrectedArea", FieldType.DOUBLE)
+    TotalConcentration: ModelField[Optional[float]] = ModelField("TotalConcentration", FieldType.DOUBLE)
+    ToTime: ModelField[Optional[int]] = ModelField("ToTime", FieldType.INTEGER)
+    TubeVolume: ModelField[Optional[float]] = ModelField("TubeVolume", FieldType.DOUBLE)
+    ViCellAspirateCycles: ModelField[Optional[float]] = ModelField("ViCellAspirateCycles", FieldType.DOUBLE)
+    ViCellAvgBg: ModelField[Optional[float]] = ModelField("ViCellAvgBg", FieldType.DOUBLE)
+    ViCellAvgCellsImg: ModelField[Optional[float]] = ModelField("ViCellAvgCellsImg", FieldType.DOUBLE)
+    ViCellAvgCirc: ModelField[Optional[float]] = ModelField("ViCellAvgCirc", FieldType.DOUBLE)
+    ViCellAvgDiam: ModelField[Optional[float]] = ModelField("ViCellAvgDiam", FieldType.DOUBLE)
+    ViCellComment: ModelField[Optional[str]] = ModelField("ViCellComment", FieldType.STRING)
+    ViCellDateTime: ModelField[Optional[int]] = ModelField("ViCellDateTime", FieldType.DATE)
+    ViCellFileName: ModelField[Optional[str]] = ModelField("ViCellFileName", FieldType.STRING)
+    ViCellImgs: ModelField[Optional[float]] = ModelField("ViCellImgs", FieldType.DOUBLE)
+    ViCellMaxDiam: ModelField[Optional[float]] = ModelField("ViCellMaxDiam", FieldType.DOUBLE)
+    ViCellMinCir: ModelField[Optional[float]] = ModelField("ViCellMinCir", FieldType.DOUBLE)
+    ViCellMinDiam: ModelField[Optional[float]] = ModelField("ViCellMinDiam", FieldType.DOUBLE)
+    ViCellTotalCells: ModelField[Optional[float]] = ModelField("ViCellTotalCells", FieldType.DOUBLE)
+    ViCellTotalCellsMl: ModelField[Optional[float]] = ModelField("ViCellTotalCellsMl", FieldType.DOUBLE)
+    ViCellType: ModelField[Optional[str]] = ModelField("ViCellType", FieldType.STRING)
+    ViCellViability: ModelField[Optional[float]] = ModelField("ViCellViability", FieldType.DOUBLE)
+    ViCellViableCells: ModelField[Optional[float]] = ModelField("ViCellViableCells", FieldType.DOUBLE)
+    ViCellViableCellsMl: ModelField[Optional[float]] = ModelField("ViCellViableCellsMl", FieldType.DOUBLE)
+    WellPosition: ModelField[Optional[str]] = ModelField("WellPosition", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
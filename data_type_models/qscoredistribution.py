@@ -0,0 +1,29 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class QScoreDistributionModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type QScoreDistribution
+    Data Type Display Name: Q Score Distribution (Q Score Distributions)
+    Fields: ColRead, Lane, LaneCol, PercentGreatQThirty, PercentGreatQTwenty
+    <!-- DISPLAY IN INSTRUMENT RUN MONITOR -->
+    """
+    DATA_TYPE_NAME: str = 'QScoreDistribution'
+    COLREAD__FIELD_NAME: WrapperField = WrapperField("ColRead", FieldType.STRING)
+    LANE__FIELD_NAME: WrapperField = WrapperField("Lane", FieldType.LONG)
+    LANECOL__FIELD_NAME: WrapperField = WrapperField("LaneCol", FieldType.STRING)
+    PERCENTGREATQTHIRTY__FIELD_NAME: WrapperField = WrapperField("PercentGreatQThirty", FieldType.DOUBLE)
+    PERCENTGREATQTWENTY__FIELD_NAME: WrapperField = WrapperField("PercentGreatQTwenty", FieldType.DOUBLE)
+
+    ColRead: ModelField[Optional[str]] = ModelField("ColRead", FieldType.STRING)
+    Lane: ModelField[Optional[int]] = ModelField("Lane", FieldType.LONG)
+    LaneCol: ModelField[Optional[str]] = ModelField("LaneCol", FieldType.STRING)
+    PercentGreatQThirty: ModelField[Optional[float]] = ModelField("PercentGreatQThirty", FieldType.DOUBLE)
+    PercentGreatQTwenty: ModelField[Optional[float]] = ModelField("PercentGreatQTwenty", FieldType.DOUBLE)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
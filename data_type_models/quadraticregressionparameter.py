@@ -0,0 +1,28 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class QuadraticRegressionParameterModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type QuadraticRegressionParameter
+    Data Type Display Name: Quadratic Regression Parameter (Quadratic Regression Parameters)
+    Fields: QuadraticA, QuadraticB, QuadraticC, SBA_AdjRSquared, SBA_RSquared
+    """
+    DATA_TYPE_NAME: str = 'QuadraticRegressionParameter'
+    QUADRATICA__FIELD_NAME: WrapperField = WrapperField("QuadraticA", FieldType.DOUBLE)
+    QUADRATICB__FIELD_NAME: WrapperField = WrapperField("QuadraticB", FieldType.DOUBLE)
+    QUADRATICC__FIELD_NAME: WrapperField = WrapperField("QuadraticC", FieldType.DOUBLE)
+    SBA_ADJRSQUARED__FIELD_NAME: WrapperField = WrapperField("SBA_AdjRSquared", FieldType.DOUBLE)
+    SBA_RSQUARED__FIELD_NAME: WrapperField = WrapperField("SBA_RSquared", FieldType.DOUBLE)
+
+    QuadraticA: ModelField[Optional[float]] = ModelField("QuadraticA", FieldType.DOUBLE)
+    QuadraticB: ModelField[Optional[float]] = ModelField("QuadraticB", FieldType.DOUBLE)
+    QuadraticC: ModelField[Optional[float]] = ModelField("QuadraticC", FieldType.DOUBLE)
+    SBA_AdjRSquared: ModelField[Optional[float]] = ModelField("SBA_AdjRSquared", FieldType.DOUBLE)
+    SBA_RSquared: ModelField[Optional[float]] = ModelField("SBA_RSquared", FieldType.DOUBLE)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
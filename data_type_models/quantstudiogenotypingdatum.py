@@ -0,0 +1,24 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class QuantStudioGenotypingDatumModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type QuantStudioGenotypingDatum
+    Data Type Display Name: QuantStudio Genotyping Datum (QuantStudio Genotyping Datums)
+    Fields: GeneCall, GeneSymbol, NCBISNPReference
+    """
+    DATA_TYPE_NAME: str = 'QuantStudioGenotypingDatum'
+    GENECALL__FIELD_NAME: WrapperField = WrapperField("GeneCall", FieldType.STRING)
+    GENESYMBOL__FIELD_NAME: WrapperField = WrapperField("GeneSymbol", FieldType.STRING)
+    NCBISNPREFERENCE__FIELD_NAME: WrapperField = WrapperField("NCBISNPReference", FieldType.STRING)
+
+    GeneCall: ModelField[Optional[str]] = ModelField("GeneCall", FieldType.STRING)
+    GeneSymbol: ModelField[Optional[str]] = ModelField("GeneSymbol", FieldType.STRING)
+    NCBISNPReference: ModelField[Optional[str]] = ModelField("NCBISNPReference", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,37 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class ReactionModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type Reaction
+    Data Type Display Name: Reaction (Reactions)
+    Fields: Formula, GenerateName, MultiParentLink118, MultiParentLink172, Products, Reactants, ReactionCoefficient, RegisteredToCartridge, Render, SMILES, SubstanceName
+    """
+    DATA_TYPE_NAME: str = 'Reaction'
+    FORMULA__FIELD_NAME: WrapperField = WrapperField("Formula", FieldType.STRING)
+    GENERATENAME__FIELD_NAME: WrapperField = WrapperField("GenerateName", FieldType.ACTION)
+    MULTIPARENTLINK118__FIELD_NAME: WrapperField = WrapperField("MultiParentLink118", FieldType.MULTIPARENTLINK)
+    MULTIPARENTLINK172__FIELD_NAME: WrapperField = WrapperField("MultiParentLink172", FieldType.MULTIPARENTLINK)
+    PRODUCTS__FIELD_NAME: WrapperField = WrapperField("Products", FieldType.SELECTION)
+    REACTANTS__FIELD_NAME: WrapperField = WrapperField("Reactants", FieldType.SELECTION)
+    REACTIONCOEFFICIENT__FIELD_NAME: WrapperField = WrapperField("ReactionCoefficient", FieldType.INTEGER)
+    REGISTEREDTOCARTRIDGE__FIELD_NAME: WrapperField = WrapperField("RegisteredToCartridge", FieldType.BOOLEAN)
+    RENDER__FIELD_NAME: WrapperField = WrapperField("Render", FieldType.STRING)
+    SMILES__FIELD_NAME: WrapperField = WrapperField("SMILES", FieldType.STRING)
+    SUBSTANCENAME__FIELD_NAME: WrapperField = WrapperField("SubstanceName", FieldType.STRING)
+
+    Formula: ModelField[Optional[str]] = ModelField("Formula", FieldType.STRING)
+    Products: ModelField[Optional[str]] = ModelField("Products", FieldType.SELECTION)
+    Reactants: ModelField[Optional[str]] = ModelField("Reactants", FieldType.SELECTION)
+    ReactionCoefficient: ModelField[Optional[int]] = ModelField("ReactionCoefficient", FieldType.INTEGER)
+    RegisteredToCartridge: ModelField[Optional[bool]] = ModelField("RegisteredToCartridge", FieldType.BOOLEAN)
+    Render: ModelField[Optional[str]] = ModelField("Render", FieldType.STRING)
+    SMILES: ModelField[Optional[str]] = ModelField("SMILES", FieldType.STRING)
+    SubstanceName: ModelField[Optional[str]] = ModelField("SubstanceName", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,32 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class ReactionComponentModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type ReactionComponent
+    Data Type Display Name: Reaction Component (Reaction Components)
+    Fields: inchi, InchiKey, LimitingReactant, Name, NoStereoSmiles, ReactionCoefficient, Role
+    """
+    DATA_TYPE_NAME: str = 'ReactionComponent'
+    INCHI__FIELD_NAME: WrapperField = WrapperField("inchi", FieldType.STRING)
+    INCHIKEY__FIELD_NAME: WrapperField = WrapperField("InchiKey", FieldType.STRING)
+    LIMITINGREACTANT__FIELD_NAME: WrapperField = WrapperField("LimitingReactant", FieldType.BOOLEAN)
+    NAME__FIELD_NAME: WrapperField = WrapperField("Name", FieldType.STRING)
+    NOSTEREOSMILES__FIELD_NAME: WrapperField = WrapperField("NoStereoSmiles", FieldType.STRING)
+    REACTIONCOEFFICIENT__FIELD_NAME: WrapperField = WrapperField("ReactionCoefficient", FieldType.DOUBLE)
+    ROLE__FIELD_NAME: WrapperField = WrapperField("Role", FieldType.SELECTION)
+
+    inchi: ModelField[Optional[str]] = ModelField("inchi", FieldType.STRING)
+    InchiKey: ModelField[Optional[str]] = ModelField("InchiKey", FieldType.STRING)
+    LimitingReactant: ModelField[Optional[bool]] = ModelField("LimitingReactant", FieldType.BOOLEAN)
+    Name: ModelField[Optional[str]] = ModelField("Name", FieldType.STRING)
+    NoStereoSmiles: ModelField[Optional[str]] = ModelField("NoStereoSmiles", FieldType.STRING)
+    ReactionCoefficient: ModelField[Optional[float]] = ModelField("ReactionCoefficient", FieldType.DOUBLE)
+    Role: ModelField[Optional[str]] = ModelField("Role", FieldType.SELECTION)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
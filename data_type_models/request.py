@@ -0,0 +1,64 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class RequestModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type Request
+    Data Type Display Name: Request (Requests)
+    Fields: AddSamplesMethod, ArePoolsIncluded, AreSamplesLibraries, CompletedDate, DisableRequetFields, InProcessDate, NumberOfSamples, NumOfReadsNeeded, PartiallyReceivedDate, ReceivedDate, RequestApproved, RequestDate, RequestedStain, RequesterEmail, RequesterName, RequesterOrganization, RequesterPhoneNumber, RequestId, RequestName, Status, TATFromInProcessing, TATFromReceiving, TotalSampleVolume
+    """
+    DATA_TYPE_NAME: str = 'Request'
+    ADDSAMPLESMETHOD__FIELD_NAME: WrapperField = WrapperField("AddSamplesMethod", FieldType.PICKLIST)
+    AREPOOLSINCLUDED__FIELD_NAME: WrapperField = WrapperField("ArePoolsIncluded", FieldType.BOOLEAN)
+    ARESAMPLESLIBRARIES__FIELD_NAME: WrapperField = WrapperField("AreSamplesLibraries", FieldType.BOOLEAN)
+    COMPLETEDDATE__FIELD_NAME: WrapperField = WrapperField("CompletedDate", FieldType.DATE)
+    DISABLEREQUETFIELDS__FIELD_NAME: WrapperField = WrapperField("DisableRequetFields", FieldType.BOOLEAN)
+    INPROCESSDATE__FIELD_NAME: WrapperField = WrapperField("InProcessDate", FieldType.DATE)
+    NUMBEROFSAMPLES__FIELD_NAME: WrapperField = WrapperField("NumberOfSamples", FieldType.LONG)
+    NUMOFREADSNEEDED__FIELD_NAME: WrapperField = WrapperField("NumOfReadsNeeded", FieldType.INTEGER)
+    PARTIALLYRECEIVEDDATE__FIELD_NAME: WrapperField = WrapperField("PartiallyReceivedDate", FieldType.DATE)
+    RECEIVEDDATE__FIELD_NAME: WrapperField = WrapperField("ReceivedDate", FieldType.DATE)
+    REQUESTAPPROVED__FIELD_NAME: WrapperField = WrapperField("RequestApproved", FieldType.BOOLEAN)
+    REQUESTDATE__FIELD_NAME: WrapperField = WrapperField("RequestDate", FieldType.DATE)
+    REQUESTEDSTAIN__FIELD_NAME: WrapperField = WrapperField("RequestedStain", FieldType.PICKLIST)
+    REQUESTEREMAIL__FIELD_NAME: WrapperField = WrapperField("RequesterEmail", FieldType.STRING)
+    REQUESTERNAME__FIELD_NAME: WrapperField = WrapperField("RequesterName", FieldType.STRING)
+    REQUESTERORGANIZATION__FIELD_NAME: WrapperField = WrapperField("RequesterOrganization", FieldType.STRING)
+    REQUESTERPHONENUMBER__FIELD_NAME: WrapperField = WrapperField("RequesterPhoneNumber", FieldType.STRING)
+    REQUESTID__FIELD_NAME: WrapperField = WrapperField("RequestId", FieldType.AUTO_ACCESSION)
+    REQUESTNAME__FIELD_NAME: WrapperField = WrapperField("RequestName", FieldType.STRING)
+    STATUS__FIELD_NAME: WrapperField = WrapperField("Status", FieldType.PICKLIST)
+    TATFROMINPROCESSING__FIELD_NAME: WrapperField = WrapperField("TATFromInProcessing", FieldType.STRING)
+    TATFROMRECEIVING__FIELD_NAME: WrapperField = WrapperField("TATFromReceiving", FieldType.STRING)
+    TOTALSAMPLEVOLUME__FIELD_NAME: WrapperField = WrapperField("TotalSampleVolume", FieldType.DOUBLE)
+
+    AddSamplesMethod: ModelField[Optional[str]] = ModelField("AddSamplesMethod", FieldType.PICKLIST)
+    ArePoolsIncluded: ModelField[Optional[bool]] = ModelField("ArePoolsIncluded", FieldType.BOOLEAN)
+    AreSamplesLibraries: ModelField[Optional[bool]] = ModelField("AreSamplesLibraries", FieldType.BOOLEAN)
+    CompletedDate: ModelField[Optional[int]] = ModelField("CompletedDate", FieldType.DATE)
+    DisableRequetFields: ModelField[Optional[bool]] = ModelField("DisableRequetFields", FieldType.BOOLEAN)
+    InProcessDate: ModelField[Optional[int]] = ModelField("InProcessDate", FieldType.DATE)
+    NumberOfSamples: ModelField[Optional[int]] = ModelField("NumberOfSamples", FieldType.LONG)
+    NumOfReadsNeeded: ModelField[Optional[int]] = ModelField("NumOfReadsNeeded", FieldType.INTEGER)
+    PartiallyReceivedDate: ModelField[Optional[int]] = ModelField("PartiallyReceivedDate", FieldType.DATE)
+    ReceivedDate: ModelField[Optional[int]] = ModelField("ReceivedDate", FieldType.DATE)
+    RequestApproved: ModelField[Optional[bool]] = ModelField("RequestApproved", FieldType.BOOLEAN)
+    RequestDate: ModelField[Optional[int]] = ModelField("RequestDate", FieldType.DATE)
+    RequestedStain: ModelField[Optional[str]] = ModelField("RequestedStain", FieldType.PICKLIST)
+    RequesterEmail: ModelField[Optional[str]] = ModelField("RequesterEmail", FieldType.STRING)
+    RequesterName: ModelField[Optional[str]] = ModelField("RequesterName", FieldType.STRING)
+    RequesterOrganization: ModelField[Optional[str]] = ModelField("RequesterOrganization", FieldType.STRING)
+    RequesterPhoneNumber: ModelField[Optional[str]] = ModelField("RequesterPhoneNumber", FieldType.STRING)
+    RequestId: ModelField[Optional[str]] = ModelField("RequestId", FieldType.AUTO_ACCESSION)
+    RequestName: ModelField[Optional[str]] = ModelField("RequestName", FieldType.STRING)
+    Status: ModelField[Optional[str]] = ModelField("Status", FieldType.PICKLIST)
+    TATFromInProcessing: ModelField[Optional[str]] = ModelField("TATFromInProcessing", FieldType.STRING)
+    TATFromReceiving: ModelField[Optional[str]] = ModelField("TATFromReceiving", FieldType.STRING)
+    TotalSampleVolume: ModelField[Optional[float]] = ModelField("TotalSampleVolume", FieldType.DOUBLE)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
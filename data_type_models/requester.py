@@ -0,0 +1,35 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class RequesterModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type Requester
+    Data Type Display Name: Requester (Requesters)
+    Fields: EmailAddress, FirstName, IsApproved, JobTitle, LastName, MiddleName, Phone, Username
+    The Requester Data Type
+    """
+    DATA_TYPE_NAME: str = 'Requester'
+    EMAILADDRESS__FIELD_NAME: WrapperField = WrapperField("EmailAddress", FieldType.STRING)
+    FIRSTNAME__FIELD_NAME: WrapperField = WrapperField("FirstName", FieldType.STRING)
+    ISAPPROVED__FIELD_NAME: WrapperField = WrapperField("IsApproved", FieldType.BOOLEAN)
+    JOBTITLE__FIELD_NAME: WrapperField = WrapperField("JobTitle", FieldType.STRING)
+    LASTNAME__FIELD_NAME: WrapperField = WrapperField("LastName", FieldType.STRING)
+    MIDDLENAME__FIELD_NAME: WrapperField = WrapperField("MiddleName", FieldType.STRING)
+    PHONE__FIELD_NAME: WrapperField = WrapperField("Phone", FieldType.STRING)
+    USERNAME__FIELD_NAME: WrapperField = WrapperField("Username", FieldType.STRING)
+
+    EmailAddress: ModelField[Optional[str]] = ModelField("EmailAddress", FieldType.STRING)
+    FirstName: ModelField[Optional[str]] = ModelField("FirstName", FieldType.STRING)
+    IsApproved: ModelField[Optional[bool]] = ModelField("IsApproved", FieldType.BOOLEAN)
+    JobTitle: ModelField[Optional[str]] = ModelField("JobTitle", FieldType.STRING)
+    LastName: ModelField[Optional[str]] = ModelField("LastName", FieldType.STRING)
+    MiddleName: ModelField[Optional[str]] = ModelField("MiddleName", FieldType.STRING)
+    Phone: ModelField[Optional[str]] = ModelField("Phone", FieldType.STRING)
+    Username: ModelField[Optional[str]] = ModelField("Username", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,40 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class ReturnPointModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type ReturnPoint
+    Data Type Display Name: Return Point (Return Points)
+    Fields: AttachPointId, BranchLongId, ExemplarSampleType, MultiParentLink204, NextWorkflow, ProcessName, ProcessPointNumber, ProcessStepNumber, SampleId, SampleRecordId, TrackedRecordDataType
+    This data is used to determine where you should restart a sample during reprocessing.
+    """
+    DATA_TYPE_NAME: str = 'ReturnPoint'
+    ATTACHPOINTID__FIELD_NAME: WrapperField = WrapperField("AttachPointId", FieldType.STRING)
+    BRANCHLONGID__FIELD_NAME: WrapperField = WrapperField("BranchLongId", FieldType.LONG)
+    EXEMPLARSAMPLETYPE__FIELD_NAME: WrapperField = WrapperField("ExemplarSampleType", FieldType.SELECTION)
+    MULTIPARENTLINK204__FIELD_NAME: WrapperField = WrapperField("MultiParentLink204", FieldType.MULTIPARENTLINK)
+    NEXTWORKFLOW__FIELD_NAME: WrapperField = WrapperField("NextWorkflow", FieldType.STRING)
+    PROCESSNAME__FIELD_NAME: WrapperField = WrapperField("ProcessName", FieldType.STRING)
+    PROCESSPOINTNUMBER__FIELD_NAME: WrapperField = WrapperField("ProcessPointNumber", FieldType.LONG)
+    PROCESSSTEPNUMBER__FIELD_NAME: WrapperField = WrapperField("ProcessStepNumber", FieldType.LONG)
+    SAMPLEID__FIELD_NAME: WrapperField = WrapperField("SampleId", FieldType.STRING)
+    SAMPLERECORDID__FIELD_NAME: WrapperField = WrapperField("SampleRecordId", FieldType.LONG)
+    TRACKEDRECORDDATATYPE__FIELD_NAME: WrapperField = WrapperField("TrackedRecordDataType", FieldType.STRING)
+
+    AttachPointId: ModelField[Optional[str]] = ModelField("AttachPointId", FieldType.STRING)
+    BranchLongId: ModelField[Optional[int]] = ModelField("BranchLongId", FieldType.LONG)
+    ExemplarSampleType: ModelField[Optional[str]] = ModelField("ExemplarSampleType", FieldType.SELECTION)
+    NextWorkflow: ModelField[Optional[str]] = ModelField("NextWorkflow", FieldType.STRING)
+    ProcessName: ModelField[Optional[str]] = ModelField("ProcessName", FieldType.STRING)
+    ProcessPointNumber: ModelField[Optional[int]] = ModelField("ProcessPointNumber", FieldType.LONG)
+    ProcessStepNumber: ModelField[Optional[int]] = ModelField("ProcessStepNumber", FieldType.LONG)
+    SampleId: ModelField[Optional[str]] = ModelField("SampleId", FieldType.STRING)
+    SampleRecordId: ModelField[Optional[int]] = ModelField("SampleRecordId", FieldType.LONG)
+    TrackedRecordDataType: ModelField[Optional[str]] = ModelField("TrackedRecordDataType", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,102 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class SampleModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type Sample
+    Data Type Display Name: Sample (Samples)
+    Fields: ActiveWorkflowId, AssayType, CollectionDate, CollectionDateTime, ColPosition, Comments, Concentration, ConcentrationUnits, ContainerType, ControlType, ElnbNumber, ExemplarSampleStatus, ExemplarSampleType, Flags, IsControl, IsInvalid, IsPooled, LastEditedBy, MultiParentLink153, MultiParentLink197, MultiParentLink204, MultiParentLink207, MultiParentLink487, MultiParentLink491, NGSSingleTemplateProcess, ObservedCondition, Organism, OtherSampleId, PercentRecoveries, PlateId, PreviousExemplarStatus, RowPosition, SacrificedDate, SampleId, SamplingSchedule, SapioSingleTemplateProcess, StorageLocationBarcode, StorageUnitPath, StudySubject, TatProgressStatus, TimePoint, TotalMass, TubeBarcode, Volume, VolumeUnits
+    """
+    DATA_TYPE_NAME: str = 'Sample'
+    ACTIVEWORKFLOWID__FIELD_NAME: WrapperField = WrapperField("ActiveWorkflowId", FieldType.LONG)
+    ASSAYTYPE__FIELD_NAME: WrapperField = WrapperField("AssayType", FieldType.STRING)
+    COLLECTIONDATE__FIELD_NAME: WrapperField = WrapperField("CollectionDate", FieldType.DATE)
+    COLLECTIONDATETIME__FIELD_NAME: WrapperField = WrapperField("CollectionDateTime", FieldType.DATE)
+    COLPOSITION__FIELD_NAME: WrapperField = WrapperField("ColPosition", FieldType.SELECTION)
+    COMMENTS__FIELD_NAME: WrapperField = WrapperField("Comments", FieldType.STRING)
+    CONCENTRATION__FIELD_NAME: WrapperField = WrapperField("Concentration", FieldType.DOUBLE)
+    CONCENTRATIONUNITS__FIELD_NAME: WrapperField = WrapperField("ConcentrationUnits", FieldType.PICKLIST)
+    CONTAINERTYPE__FIELD_NAME: WrapperField = WrapperField("ContainerType", FieldType.PICKLIST)
+    CONTROLTYPE__FIELD_NAME: WrapperField = WrapperField("ControlType", FieldType.STRING)
+    ELNBNUMBER__FIELD_NAME: WrapperField = WrapperField("ElnbNumber", FieldType.STRING)
+    EXEMPLARSAMPLESTATUS__FIELD_NAME: WrapperField = WrapperField("ExemplarSampleStatus", FieldType.SELECTION)
+    EXEMPLARSAMPLETYPE__FIELD_NAME: WrapperField = WrapperField("ExemplarSampleType", FieldType.SELECTION)
+    FLAGS__FIELD_NAME: WrapperField = WrapperField("Flags", FieldType.STRING)
+    ISCONTROL__FIELD_NAME: WrapperField = WrapperField("IsControl", FieldType.BOOLEAN)
+    ISINVALID__FIELD_NAME: WrapperField = WrapperField("IsInvalid", FieldType.BOOLEAN)
+    ISPOOLED__FIELD_NAME: WrapperField = WrapperField("IsPooled", FieldType.BOOLEAN)
+    LASTEDITEDBY__FIELD_NAME: WrapperField = WrapperField("LastEditedBy", FieldType.STRING)
+    MULTIPARENTLINK153__FIELD_NAME: WrapperField = WrapperField("MultiParentLink153", FieldType.MULTIPARENTLINK)
+    MULTIPARENTLINK197__FIELD_NAME: WrapperField = WrapperField("MultiParentLink197", FieldType.MULTIPARENTLINK)
+    MULTIPARENTLINK204__FIELD_NAME: WrapperField = WrapperField("MultiParentLink204", FieldType.MULTIPARENTLINK)
+    MULTIPARENTLINK207__FIELD_NAME: WrapperField = WrapperField("MultiParentLink207", FieldType.MULTIPARENTLINK)
+    MULTIPARENTLINK487__FIELD_NAME: WrapperField = WrapperField("MultiParentLink487", FieldType.MULTIPARENTLINK)
+    MULTIPARENTLINK491__FIELD_NAME: WrapperField = WrapperField("MultiParentLink491", FieldType.MULTIPARENTLINK)
+    NGSSINGLETEMPLATEPROCESS__FIELD_NAME: WrapperField = WrapperField("NGSSingleTemplateProcess", FieldType.PICKLIST)
+    OBSERVEDCONDITION__FIELD_NAME: WrapperField = WrapperField("ObservedCondition", FieldType.SELECTION)
+    ORGANISM__FIELD_NAME: WrapperField = WrapperField("Organism", FieldType.PICKLIST)
+    OTHERSAMPLEID__FIELD_NAME: WrapperField = WrapperField("OtherSampleId", FieldType.STRING)
+    PERCENTRECOVERIES__FIELD_NAME: WrapperField = WrapperField("PercentRecoveries", FieldType.DOUBLE)
+    PLATEID__FIELD_NAME: WrapperField = WrapperField("PlateId", FieldType.STRING)
+    PREVIOUSEXEMPLARSTATUS__FIELD_NAME: WrapperField = WrapperField("PreviousExemplarStatus", FieldType.SELECTION)
+    ROWPOSITION__FIELD_NAME: WrapperField = WrapperField("RowPosition", FieldType.SELECTION)
+    SACRIFICEDDATE__FIELD_NAME: WrapperField = WrapperField("SacrificedDate", FieldType.DATE)
+    SAMPLEID__FIELD_NAME: WrapperField = WrapperField("SampleId", FieldType.STRING)
+    SAMPLINGSCHEDULE__FIELD_NAME: WrapperField = WrapperField("SamplingSchedule", FieldType.SIDE_LINK)
+    SAPIOSINGLETEMPLATEPROCESS__FIELD_NAME: WrapperField = WrapperField("SapioSingleTemplateProcess", FieldType.PICKLIST)
+    STORAGELOCATIONBARCODE__FIELD_NAME: WrapperField = WrapperField("StorageLocationBarcode", FieldType.SELECTION)
+    STORAGEUNITPATH__FIELD_NAME: WrapperField = WrapperField("StorageUnitPath", FieldType.STRING)
+    STUDYSUBJECT__FIELD_NAME: WrapperField = WrapperField("StudySubject", FieldType.SIDE_LINK)
+    TATPROGRESSSTATUS__FIELD_NAME: WrapperField = WrapperField("TatProgressStatus", FieldType.PICKLIST)
+    TIMEPOINT__FIELD_NAME: WrapperField = WrapperField("TimePoint", FieldType.DOUBLE)
+    TOTALMASS__FIELD_NAME: WrapperField = WrapperField("TotalMass", FieldType.DOUBLE)
+    TUBEBARCODE__FIELD_NAME: WrapperField = WrapperField("TubeBarcode", FieldType.STRING)
+    VOLUME__FIELD_NAME: WrapperField = WrapperField("Volume", FieldType.DOUBLE)
+    VOLUMEUNITS__FIELD_NAME: WrapperField = WrapperField("VolumeUnits", FieldType.PICKLIST)
+
+    ActiveWorkflowId: ModelField[Optional[int]] = ModelField("ActiveWorkflowId", FieldType.LONG)
+    AssayType: ModelField[Optional[str]] = ModelField("AssayType", FieldType.STRING)
+    CollectionDate: ModelField[Optional[int]] = ModelField("CollectionDate", FieldType.DATE)
+    CollectionDateTime: ModelField[Optional[int]] = ModelField("CollectionDateTime", FieldType.DATE)
+    ColPosition: ModelField[Optional[str]] = ModelField("ColPosition", FieldType.SELECTION)
+    Comments: ModelField[Optional[str]] = ModelField("Comments", FieldType.STRING)
+    Concentration: ModelField[Optional[float]] = ModelField("Concentration", FieldType.DOUBLE)
+    ConcentrationUnits: ModelField[Optional[str]] = ModelField("ConcentrationUnits", FieldType.PICKLIST)
+    ContainerType: ModelField[Optional[str]] = ModelField("ContainerType", FieldType.PICKLIST)
+    ControlType: ModelField[Optional[str]] = ModelField("ControlType", FieldType.STRING)
+    ElnbNumber: ModelField[Optional[str]] = ModelField("ElnbNumber", FieldType.STRING)
+    ExemplarSampleStatus: ModelField[Optional[str]] = ModelField("ExemplarSampleStatus", FieldType.SELECTION)
+    ExemplarSampleType: ModelField[Optional[str]] = ModelField("ExemplarSampleType", FieldType.SELECTION)
+    Flags: ModelField[Optional[str]] = ModelField("Flags", FieldType.STRING)
+    IsControl: ModelField[Optional[bool]] = ModelField("IsControl", FieldType.BOOLEAN)
+    IsInvalid: ModelField[Optional[bool]] = ModelField("IsInvalid", FieldType.BOOLEAN)
+    IsPooled: ModelField[Optional[bool]] = ModelField("IsPooled", FieldType.BOOLEAN)
+    LastEditedBy: ModelField[Optional[str]] = ModelField("LastEditedBy", FieldType.STRING)
+    NGSSingleTemplateProcess: ModelField[Optional[str]] = ModelField("NGSSingleTemplateProcess", FieldType.PICKLIST)
+    ObservedCondition: ModelField[Optional[str]] = ModelField("ObservedCondition", FieldType.SELECTION)
+    Organism: ModelField[Optional[str]] = ModelField("Organism", FieldType.PICKLIST)
+    OtherSampleId: ModelField[Optional[str]] = ModelField("OtherSampleId", FieldType.STRING)
+    PercentRecoveries: ModelField[Optional[float]] = ModelField("PercentRecoveries", FieldType.DOUBLE)
+    PlateId: ModelField[Optional[str]] = ModelField("PlateId", FieldType.STRING)
+    PreviousExemplarStatus: ModelField[Optional[str]] = ModelField("PreviousExemplarStatus", FieldType.SELECTION)
+    RowPosition: ModelField[Optional[str]] = ModelField("RowPosition", FieldType.SELECTION)
+    SacrificedDate: ModelField[Optional[int]] = ModelField("SacrificedDate", FieldType.DATE)
+    SampleId: ModelField[Optional[str]] = ModelField("SampleId", FieldType.STRING)
+    SamplingSchedule: ModelField[Optional[int]] = ModelField("SamplingSchedule", FieldType.SIDE_LINK)
+    SapioSingleTemplateProcess: ModelField[Optional[str]] = ModelField("SapioSingleTemplateProcess", FieldType.PICKLIST)
+    StorageLocationBarcode: ModelField[Optional[str]] = ModelField("StorageLocationBarcode", FieldType.SELECTION)
+    StorageUnitPath: ModelField[Optional[str]] = ModelField("StorageUnitPath", FieldType.STRING)
+    StudySubject: ModelField[Optional[int]] = ModelField("StudySubject", FieldType.SIDE_LINK)
+    TatProgressStatus: ModelField[Optional[str]] = ModelField("TatProgressStatus", FieldType.PICKLIST)
+    TimePoint: ModelField[Optional[float]] = ModelField("TimePoint", FieldType.DOUBLE)
+    TotalMass: ModelField[Optional[float]] = ModelField("TotalMass", FieldType.DOUBLE)
+    TubeBarcode: ModelField[Optional[str]] = ModelField("TubeBarcode", FieldType.STRING)
+    Volume: ModelField[Optional[float]] = ModelField("Volume", FieldType.DOUBLE)
+    VolumeUnits: ModelField[Optional[str]] = ModelField("VolumeUnits", FieldType.PICKLIST)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
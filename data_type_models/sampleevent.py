@@ -0,0 +1,22 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class SampleEventModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type SampleEvent
+    Data Type Display Name: Sample Event (Sample Events)
+    Fields: Description, EventType
+    """
+    DATA_TYPE_NAME: str = 'SampleEvent'
+    DESCRIPTION__FIELD_NAME: WrapperField = WrapperField("Description", FieldType.STRING)
+    EVENTTYPE__FIELD_NAME: WrapperField = WrapperField("EventType", FieldType.PICKLIST)
+
+    Description: ModelField[Optional[str]] = ModelField("Description", FieldType.STRING)
+    EventType: ModelField[Optional[str]] = ModelField("EventType", FieldType.PICKLIST)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,30 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class SampleImporterMappingModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type SampleImporterMapping
+    Data Type Display Name: Sample Importer Mapping (Sample Importer Mappings)
+    Fields: DataField, DataType, DisplayName, MappingGroup, MappingName, MappingOrder
+    """
+    DATA_TYPE_NAME: str = 'SampleImporterMapping'
+    DATAFIELD__FIELD_NAME: WrapperField = WrapperField("DataField", FieldType.SELECTION)
+    DATATYPE__FIELD_NAME: WrapperField = WrapperField("DataType", FieldType.PICKLIST)
+    DISPLAYNAME__FIELD_NAME: WrapperField = WrapperField("DisplayName", FieldType.STRING)
+    MAPPINGGROUP__FIELD_NAME: WrapperField = WrapperField("MappingGroup", FieldType.STRING)
+    MAPPINGNAME__FIELD_NAME: WrapperField = WrapperField("MappingName", FieldType.STRING)
+    MAPPINGORDER__FIELD_NAME: WrapperField = WrapperField("MappingOrder", FieldType.SHORT)
+
+    DataField: ModelField[Optional[str]] = ModelField("DataField", FieldType.SELECTION)
+    DataType: ModelField[Optional[str]] = ModelField("DataType", FieldType.PICKLIST)
+    DisplayName: ModelField[Optional[str]] = ModelField("DisplayName", FieldType.STRING)
+    MappingGroup: ModelField[Optional[str]] = ModelField("MappingGroup", FieldType.STRING)
+    MappingName: ModelField[Optional[str]] = ModelField("MappingName", FieldType.STRING)
+    MappingOrder: ModelField[Optional[int]] = ModelField("MappingOrder", FieldType.SHORT)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
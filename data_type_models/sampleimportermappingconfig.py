@@ -0,0 +1,30 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class SampleImporterMappingConfigModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type SampleImporterMappingConfig
+    Data Type Display Name: Sample Importer Mapping Configuration (Sample Importer Mapping Configurations)
+    Fields: HandleLibraries, HandlePlateManifest, HandlePools, HandleSampleManifest, MappingGroup, MappingOrder
+    """
+    DATA_TYPE_NAME: str = 'SampleImporterMappingConfig'
+    HANDLELIBRARIES__FIELD_NAME: WrapperField = WrapperField("HandleLibraries", FieldType.BOOLEAN)
+    HANDLEPLATEMANIFEST__FIELD_NAME: WrapperField = WrapperField("HandlePlateManifest", FieldType.BOOLEAN)
+    HANDLEPOOLS__FIELD_NAME: WrapperField = WrapperField("HandlePools", FieldType.BOOLEAN)
+    HANDLESAMPLEMANIFEST__FIELD_NAME: WrapperField = WrapperField("HandleSampleManifest", FieldType.BOOLEAN)
+    MAPPINGGROUP__FIELD_NAME: WrapperField = WrapperField("MappingGroup", FieldType.STRING)
+    MAPPINGORDER__FIELD_NAME: WrapperField = WrapperField("MappingOrder", FieldType.SHORT)
+
+    HandleLibraries: ModelField[Optional[bool]] = ModelField("HandleLibraries", FieldType.BOOLEAN)
+    HandlePlateManifest: ModelField[Optional[bool]] = ModelField("HandlePlateManifest", FieldType.BOOLEAN)
+    HandlePools: ModelField[Optional[bool]] = ModelField("HandlePools", FieldType.BOOLEAN)
+    HandleSampleManifest: ModelField[Optional[bool]] = ModelField("HandleSampleManifest", FieldType.BOOLEAN)
+    MappingGroup: ModelField[Optional[str]] = ModelField("MappingGroup", FieldType.STRING)
+    MappingOrder: ModelField[Optional[int]] = ModelField("MappingOrder", FieldType.SHORT)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,36 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class SampleReceiptModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type SampleReceipt
+    Data Type Display Name: Sample Receipt (Sample Receipts)
+    Fields: ExemplarSampleType, FailureComment, OtherSampleId, ReceivedBy, ReceivedDate, RejectionReason, SampleId, SampleReceivedRejected, Volume
+    """
+    DATA_TYPE_NAME: str = 'SampleReceipt'
+    EXEMPLARSAMPLETYPE__FIELD_NAME: WrapperField = WrapperField("ExemplarSampleType", FieldType.SELECTION)
+    FAILURECOMMENT__FIELD_NAME: WrapperField = WrapperField("FailureComment", FieldType.STRING)
+    OTHERSAMPLEID__FIELD_NAME: WrapperField = WrapperField("OtherSampleId", FieldType.STRING)
+    RECEIVEDBY__FIELD_NAME: WrapperField = WrapperField("ReceivedBy", FieldType.SELECTION)
+    RECEIVEDDATE__FIELD_NAME: WrapperField = WrapperField("ReceivedDate", FieldType.DATE)
+    REJECTIONREASON__FIELD_NAME: WrapperField = WrapperField("RejectionReason", FieldType.PICKLIST)
+    SAMPLEID__FIELD_NAME: WrapperField = WrapperField("SampleId", FieldType.STRING)
+    SAMPLERECEIVEDREJECTED__FIELD_NAME: WrapperField = WrapperField("SampleReceivedRejected", FieldType.PICKLIST)
+    VOLUME__FIELD_NAME: WrapperField = WrapperField("Volume", FieldType.DOUBLE)
+
+    ExemplarSampleType: ModelField[Optional[str]] = ModelField("ExemplarSampleType", FieldType.SELECTION)
+    FailureComment: ModelField[Optional[str]] = ModelField("FailureComment", FieldType.STRING)
+    OtherSampleId: ModelField[Optional[str]] = ModelField("OtherSampleId", FieldType.STRING)
+    ReceivedBy: ModelField[Optional[str]] = ModelField("ReceivedBy", FieldType.SELECTION)
+    ReceivedDate: ModelField[Optional[int]] = ModelField("ReceivedDate", FieldType.DATE)
+    RejectionReason: ModelField[Optional[str]] = ModelField("RejectionReason", FieldType.PICKLIST)
+    SampleId: ModelField[Optional[str]] = ModelField("SampleId", FieldType.STRING)
+    SampleReceivedRejected: ModelField[Optional[str]] = ModelField("SampleReceivedRejected", FieldType.PICKLIST)
+    Volume: ModelField[Optional[float]] = ModelField("Volume", FieldType.DOUBLE)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
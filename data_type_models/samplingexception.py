@@ -0,0 +1,24 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class SamplingExceptionModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type SamplingException
+    Data Type Display Name: Sampling Exception (Sampling Exceptions)
+    Fields: NumberToExclude, SamplingResultRecordIdSet, SubjectRecordId
+    """
+    DATA_TYPE_NAME: str = 'SamplingException'
+    NUMBERTOEXCLUDE__FIELD_NAME: WrapperField = WrapperField("NumberToExclude", FieldType.INTEGER)
+    SAMPLINGRESULTRECORDIDSET__FIELD_NAME: WrapperField = WrapperField("SamplingResultRecordIdSet", FieldType.STRING)
+    SUBJECTRECORDID__FIELD_NAME: WrapperField = WrapperField("SubjectRecordId", FieldType.LONG)
+
+    NumberToExclude: ModelField[Optional[int]] = ModelField("NumberToExclude", FieldType.INTEGER)
+    SamplingResultRecordIdSet: ModelField[Optional[str]] = ModelField("SamplingResultRecordIdSet", FieldType.STRING)
+    SubjectRecordId: ModelField[Optional[int]] = ModelField("SubjectRecordId", FieldType.LONG)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
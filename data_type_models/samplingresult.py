@@ -0,0 +1,34 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class SamplingResultModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type SamplingResult
+    Data Type Display Name: Sampling Result (Sampling Results)
+    Fields: BiologicalMatrix, CollectionComments, CollectionResult, DateCompleted, SampleRecordId, SamplingRecordId, SamplingSplitNumber, SkipTaskReason
+    """
+    DATA_TYPE_NAME: str = 'SamplingResult'
+    BIOLOGICALMATRIX__FIELD_NAME: WrapperField = WrapperField("BiologicalMatrix", FieldType.SELECTION)
+    COLLECTIONCOMMENTS__FIELD_NAME: WrapperField = WrapperField("CollectionComments", FieldType.STRING)
+    COLLECTIONRESULT__FIELD_NAME: WrapperField = WrapperField("CollectionResult", FieldType.PICKLIST)
+    DATECOMPLETED__FIELD_NAME: WrapperField = WrapperField("DateCompleted", FieldType.DATE)
+    SAMPLERECORDID__FIELD_NAME: WrapperField = WrapperField("SampleRecordId", FieldType.SIDE_LINK)
+    SAMPLINGRECORDID__FIELD_NAME: WrapperField = WrapperField("SamplingRecordId", FieldType.SIDE_LINK)
+    SAMPLINGSPLITNUMBER__FIELD_NAME: WrapperField = WrapperField("SamplingSplitNumber", FieldType.INTEGER)
+    SKIPTASKREASON__FIELD_NAME: WrapperField = WrapperField("SkipTaskReason", FieldType.STRING)
+
+    BiologicalMatrix: ModelField[Optional[str]] = ModelField("BiologicalMatrix", FieldType.SELECTION)
+    CollectionComments: ModelField[Optional[str]] = ModelField("CollectionComments", FieldType.STRING)
+    CollectionResult: ModelField[Optional[str]] = ModelField("CollectionResult", FieldType.PICKLIST)
+    DateCompleted: ModelField[Optional[int]] = ModelField("DateCompleted", FieldType.DATE)
+    SampleRecordId: ModelField[Optional[int]] = ModelField("SampleRecordId", FieldType.SIDE_LINK)
+    SamplingRecordId: ModelField[Optional[int]] = ModelField("SamplingRecordId", FieldType.SIDE_LINK)
+    SamplingSplitNumber: ModelField[Optional[int]] = ModelField("SamplingSplitNumber", FieldType.INTEGER)
+    SkipTaskReason: ModelField[Optional[str]] = ModelField("SkipTaskReason", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,30 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class SamplingScheduleModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type SamplingSchedule
+    Data Type Display Name: Sampling Schedule (Sampling Schedules)
+    Fields: BiologicalMatrix, GroupId, IsPredose, SampleCount, SamplingMilliseconds, TimepointDuration
+    """
+    DATA_TYPE_NAME: str = 'SamplingSchedule'
+    BIOLOGICALMATRIX__FIELD_NAME: WrapperField = WrapperField("BiologicalMatrix", FieldType.SELECTION)
+    GROUPID__FIELD_NAME: WrapperField = WrapperField("GroupId", FieldType.INTEGER)
+    ISPREDOSE__FIELD_NAME: WrapperField = WrapperField("IsPredose", FieldType.BOOLEAN)
+    SAMPLECOUNT__FIELD_NAME: WrapperField = WrapperField("SampleCount", FieldType.INTEGER)
+    SAMPLINGMILLISECONDS__FIELD_NAME: WrapperField = WrapperField("SamplingMilliseconds", FieldType.LONG)
+    TIMEPOINTDURATION__FIELD_NAME: WrapperField = WrapperField("TimepointDuration", FieldType.DATE)
+
+    BiologicalMatrix: ModelField[Optional[str]] = ModelField("BiologicalMatrix", FieldType.SELECTION)
+    GroupId: ModelField[Optional[int]] = ModelField("GroupId", FieldType.INTEGER)
+    IsPredose: ModelField[Optional[bool]] = ModelField("IsPredose", FieldType.BOOLEAN)
+    SampleCount: ModelField[Optional[int]] = ModelField("SampleCount", FieldType.INTEGER)
+    SamplingMilliseconds: ModelField[Optional[int]] = ModelField("SamplingMilliseconds", FieldType.LONG)
+    TimepointDuration: ModelField[Optional[int]] = ModelField("TimepointDuration", FieldType.DATE)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,26 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class SBA_AccAndPrecCriteriaInterModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type SBA_AccAndPrecCriteriaInter
+    Data Type Display Name: Accuracy and Precision Inter Criteria (Accuracy and Precision Inter Criteria)
+    Fields: SBA_MaxCVInter, SBA_MaxMeanBiasInter, SBA_MinRatioLQCOverLLOQ, SBA_MinRunInter
+    """
+    DATA_TYPE_NAME: str = 'SBA_AccAndPrecCriteriaInter'
+    SBA_MAXCVINTER__FIELD_NAME: WrapperField = WrapperField("SBA_MaxCVInter", FieldType.DOUBLE)
+    SBA_MAXMEANBIASINTER__FIELD_NAME: WrapperField = WrapperField("SBA_MaxMeanBiasInter", FieldType.DOUBLE)
+    SBA_MINRATIOLQCOVERLLOQ__FIELD_NAME: WrapperField = WrapperField("SBA_MinRatioLQCOverLLOQ", FieldType.DOUBLE)
+    SBA_MINRUNINTER__FIELD_NAME: WrapperField = WrapperField("SBA_MinRunInter", FieldType.INTEGER)
+
+    SBA_MaxCVInter: ModelField[Optional[float]] = ModelField("SBA_MaxCVInter", FieldType.DOUBLE)
+    SBA_MaxMeanBiasInter: ModelField[Optional[float]] = ModelField("SBA_MaxMeanBiasInter", FieldType.DOUBLE)
+    SBA_MinRatioLQCOverLLOQ: ModelField[Optional[float]] = ModelField("SBA_MinRatioLQCOverLLOQ", FieldType.DOUBLE)
+    SBA_MinRunInter: ModelField[Optional[int]] = ModelField("SBA_MinRunInter", FieldType.INTEGER)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
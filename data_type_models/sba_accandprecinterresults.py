@@ -0,0 +1,27 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class SBA_AccAndPrecInterResultsModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type SBA_AccAndPrecInterResults
+    Data Type Display Name: Accuracy and Precision Inter Results (Accuracy and Precision Inter Results)
+    Fields: SBA_AllLevelsPassCVCheckInter, SBA_AllLevelsPassMeanBiasInter, SBA_AnalyteName, SBA_RunInter
+    The SBA_AccAndPrecInterResults Data Type
+    """
+    DATA_TYPE_NAME: str = 'SBA_AccAndPrecInterResults'
+    SBA_ALLLEVELSPASSCVCHECKINTER__FIELD_NAME: WrapperField = WrapperField("SBA_AllLevelsPassCVCheckInter", FieldType.BOOLEAN)
+    SBA_ALLLEVELSPASSMEANBIASINTER__FIELD_NAME: WrapperField = WrapperField("SBA_AllLevelsPassMeanBiasInter", FieldType.BOOLEAN)
+    SBA_ANALYTENAME__FIELD_NAME: WrapperField = WrapperField("SBA_AnalyteName", FieldType.SELECTION)
+    SBA_RUNINTER__FIELD_NAME: WrapperField = WrapperField("SBA_RunInter", FieldType.INTEGER)
+
+    SBA_AllLevelsPassCVCheckInter: ModelField[Optional[bool]] = ModelField("SBA_AllLevelsPassCVCheckInter", FieldType.BOOLEAN)
+    SBA_AllLevelsPassMeanBiasInter: ModelField[Optional[bool]] = ModelField("SBA_AllLevelsPassMeanBiasInter", FieldType.BOOLEAN)
+    SBA_AnalyteName: ModelField[Optional[str]] = ModelField("SBA_AnalyteName", FieldType.SELECTION)
+    SBA_RunInter: ModelField[Optional[int]] = ModelField("SBA_RunInter", FieldType.INTEGER)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
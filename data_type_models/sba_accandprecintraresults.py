@@ -0,0 +1,23 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class SBA_AccAndPrecIntraResultsModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type SBA_AccAndPrecIntraResults
+    Data Type Display Name: Accuracy and Precision Intra Results (Accuracy and Precision Intra Results)
+    Fields: SBA_AllLevelsPassCVCheckIntra, SBA_AllLevelsPassMeanBiasIntra
+    The SBA_AccAndPrecIntraResults Data Type
+    """
+    DATA_TYPE_NAME: str = 'SBA_AccAndPrecIntraResults'
+    SBA_ALLLEVELSPASSCVCHECKINTRA__FIELD_NAME: WrapperField = WrapperField("SBA_AllLevelsPassCVCheckIntra", FieldType.BOOLEAN)
+    SBA_ALLLEVELSPASSMEANBIASINTRA__FIELD_NAME: WrapperField = WrapperField("SBA_AllLevelsPassMeanBiasIntra", FieldType.BOOLEAN)
+
+    SBA_AllLevelsPassCVCheckIntra: ModelField[Optional[bool]] = ModelField("SBA_AllLevelsPassCVCheckIntra", FieldType.BOOLEAN)
+    SBA_AllLevelsPassMeanBiasIntra: ModelField[Optional[bool]] = ModelField("SBA_AllLevelsPassMeanBiasIntra", FieldType.BOOLEAN)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
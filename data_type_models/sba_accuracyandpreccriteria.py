@@ -0,0 +1,25 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class SBA_AccuracyAndPrecCriteriaModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type SBA_AccuracyAndPrecCriteria
+    Data Type Display Name: Accuracy and Precision Criteria (Accuracy and Precision Criteria)
+    Fields: SBA_MaxCVIntra, SBA_MaxMeanBiasIntra, SBA_MinReplicateNumIntra
+    The AccuracyAndPrecisionCriteria Data Type
+    """
+    DATA_TYPE_NAME: str = 'SBA_AccuracyAndPrecCriteria'
+    SBA_MAXCVINTRA__FIELD_NAME: WrapperField = WrapperField("SBA_MaxCVIntra", FieldType.DOUBLE)
+    SBA_MAXMEANBIASINTRA__FIELD_NAME: WrapperField = WrapperField("SBA_MaxMeanBiasIntra", FieldType.DOUBLE)
+    SBA_MINREPLICATENUMINTRA__FIELD_NAME: WrapperField = WrapperField("SBA_MinReplicateNumIntra", FieldType.INTEGER)
+
+    SBA_MaxCVIntra: ModelField[Optional[float]] = ModelField("SBA_MaxCVIntra", FieldType.DOUBLE)
+    SBA_MaxMeanBiasIntra: ModelField[Optional[float]] = ModelField("SBA_MaxMeanBiasIntra", FieldType.DOUBLE)
+    SBA_MinReplicateNumIntra: ModelField[Optional[int]] = ModelField("SBA_MinReplicateNumIntra", FieldType.INTEGER)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
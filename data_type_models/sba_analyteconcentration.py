@@ -0,0 +1,30 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class SBA_AnalyteConcentrationModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type SBA_AnalyteConcentration
+    Data Type Display Name: Analyte Concentration (Analyte Concentrations)
+    Fields: SBA_AnalyteConcentration, SBA_AnalyteName, SBA_AssayAnalyteRecordId, SBA_ConcentrationUnit, SBA_ControlName, SBA_FlagPctDiff
+    """
+    DATA_TYPE_NAME: str = 'SBA_AnalyteConcentration'
+    SBA_ANALYTECONCENTRATION__FIELD_NAME: WrapperField = WrapperField("SBA_AnalyteConcentration", FieldType.DOUBLE)
+    SBA_ANALYTENAME__FIELD_NAME: WrapperField = WrapperField("SBA_AnalyteName", FieldType.SELECTION)
+    SBA_ASSAYANALYTERECORDID__FIELD_NAME: WrapperField = WrapperField("SBA_AssayAnalyteRecordId", FieldType.LONG)
+    SBA_CONCENTRATIONUNIT__FIELD_NAME: WrapperField = WrapperField("SBA_ConcentrationUnit", FieldType.SELECTION)
+    SBA_CONTROLNAME__FIELD_NAME: WrapperField = WrapperField("SBA_ControlName", FieldType.STRING)
+    SBA_FLAGPCTDIFF__FIELD_NAME: WrapperField = WrapperField("SBA_FlagPctDiff", FieldType.DOUBLE)
+
+    SBA_AnalyteConcentration: ModelField[Optional[float]] = ModelField("SBA_AnalyteConcentration", FieldType.DOUBLE)
+    SBA_AnalyteName: ModelField[Optional[str]] = ModelField("SBA_AnalyteName", FieldType.SELECTION)
+    SBA_AssayAnalyteRecordId: ModelField[Optional[int]] = ModelField("SBA_AssayAnalyteRecordId", FieldType.LONG)
+    SBA_ConcentrationUnit: ModelField[Optional[str]] = ModelField("SBA_ConcentrationUnit", FieldType.SELECTION)
+    SBA_ControlName: ModelField[Optional[str]] = ModelField("SBA_ControlName", FieldType.STRING)
+    SBA_FlagPctDiff: ModelField[Optional[float]] = ModelField("SBA_FlagPctDiff", FieldType.DOUBLE)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
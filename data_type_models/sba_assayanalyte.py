@@ -0,0 +1,32 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class SBA_AssayAnalyteModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type SBA_AssayAnalyte
+    Data Type Display Name: Assay Analyte (Assay Analytes)
+    Fields: SBA_AnalyteName, SBA_InternalStandard, SBA_IsrDiffPercentLimit, SBA_LLOQ, SBA_RelatedAnalyteDataTypeName, SBA_RelatedAnalyteRecordId, SBA_ULOQ
+    """
+    DATA_TYPE_NAME: str = 'SBA_AssayAnalyte'
+    SBA_ANALYTENAME__FIELD_NAME: WrapperField = WrapperField("SBA_AnalyteName", FieldType.STRING)
+    SBA_INTERNALSTANDARD__FIELD_NAME: WrapperField = WrapperField("SBA_InternalStandard", FieldType.STRING)
+    SBA_ISRDIFFPERCENTLIMIT__FIELD_NAME: WrapperField = WrapperField("SBA_IsrDiffPercentLimit", FieldType.DOUBLE)
+    SBA_LLOQ__FIELD_NAME: WrapperField = WrapperField("SBA_LLOQ", FieldType.DOUBLE)
+    SBA_RELATEDANALYTEDATATYPENAME__FIELD_NAME: WrapperField = WrapperField("SBA_RelatedAnalyteDataTypeName", FieldType.STRING)
+    SBA_RELATEDANALYTERECORDID__FIELD_NAME: WrapperField = WrapperField("SBA_RelatedAnalyteRecordId", FieldType.LONG)
+    SBA_ULOQ__FIELD_NAME: WrapperField = WrapperField("SBA_ULOQ", FieldType.DOUBLE)
+
+    SBA_AnalyteName: ModelField[Optional[str]] = ModelField("SBA_AnalyteName", FieldType.STRING)
+    SBA_InternalStandard: ModelField[Optional[str]] = ModelField("SBA_InternalStandard", FieldType.STRING)
+    SBA_IsrDiffPercentLimit: ModelField[Optional[float]] = ModelField("SBA_IsrDiffPercentLimit", FieldType.DOUBLE)
+    SBA_LLOQ: ModelField[Optional[float]] = ModelField("SBA_LLOQ", FieldType.DOUBLE)
+    SBA_RelatedAnalyteDataTypeName: ModelField[Optional[str]] = ModelField("SBA_RelatedAnalyteDataTypeName", FieldType.STRING)
+    SBA_RelatedAnalyteRecordId: ModelField[Optional[int]] = ModelField("SBA_RelatedAnalyteRecordId", FieldType.LONG)
+    SBA_ULOQ: ModelField[Optional[float]] = ModelField("SBA_ULOQ", FieldType.DOUBLE)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,62 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class SBA_AssayInstrumentConfigModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type SBA_AssayInstrumentConfig
+    Data Type Display Name: Assay Instrument Configuration (Assay Instrument Configurations)
+    Fields: SBA_AnalyteNameMapping, SBA_AssayDateMapping, SBA_AssayInstrumentType, SBA_ConcentrationMapping, SBA_ConfigurationName, SBA_CustomParserPluginPath, SBA_ExpectedConcentrationUnits, SBA_FirstWellPositionColumn, SBA_FirstWellPositionRow, SBA_InstrumentOutputFileLayout, SBA_InstrumentOutputFileType, SBA_InstrumentResponseMapping, SBA_IsActive, SBA_IsResponseMapping, SBA_PlateIdCellColumn, SBA_PlateIdCellRow, SBA_PlateIdMapping, SBA_RetentionMapping, SBA_RunIdMapping, SBA_SampleIdMapping, SBA_WellPositionMapping, SBA_WellPositionRepresentation
+    """
+    DATA_TYPE_NAME: str = 'SBA_AssayInstrumentConfig'
+    SBA_ANALYTENAMEMAPPING__FIELD_NAME: WrapperField = WrapperField("SBA_AnalyteNameMapping", FieldType.STRING)
+    SBA_ASSAYDATEMAPPING__FIELD_NAME: WrapperField = WrapperField("SBA_AssayDateMapping", FieldType.STRING)
+    SBA_ASSAYINSTRUMENTTYPE__FIELD_NAME: WrapperField = WrapperField("SBA_AssayInstrumentType", FieldType.PICKLIST)
+    SBA_CONCENTRATIONMAPPING__FIELD_NAME: WrapperField = WrapperField("SBA_ConcentrationMapping", FieldType.STRING)
+    SBA_CONFIGURATIONNAME__FIELD_NAME: WrapperField = WrapperField("SBA_ConfigurationName", FieldType.STRING)
+    SBA_CUSTOMPARSERPLUGINPATH__FIELD_NAME: WrapperField = WrapperField("SBA_CustomParserPluginPath", FieldType.SELECTION)
+    SBA_EXPECTEDCONCENTRATIONUNITS__FIELD_NAME: WrapperField = WrapperField("SBA_ExpectedConcentrationUnits", FieldType.PICKLIST)
+    SBA_FIRSTWELLPOSITIONCOLUMN__FIELD_NAME: WrapperField = WrapperField("SBA_FirstWellPositionColumn", FieldType.INTEGER)
+    SBA_FIRSTWELLPOSITIONROW__FIELD_NAME: WrapperField = WrapperField("SBA_FirstWellPositionRow", FieldType.INTEGER)
+    SBA_INSTRUMENTOUTPUTFILELAYOUT__FIELD_NAME: WrapperField = WrapperField("SBA_InstrumentOutputFileLayout", FieldType.PICKLIST)
+    SBA_INSTRUMENTOUTPUTFILETYPE__FIELD_NAME: WrapperField = WrapperField("SBA_InstrumentOutputFileType", FieldType.STRING)
+    SBA_INSTRUMENTRESPONSEMAPPING__FIELD_NAME: WrapperField = WrapperField("SBA_InstrumentResponseMapping", FieldType.STRING)
+    SBA_ISACTIVE__FIELD_NAME: WrapperField = WrapperField("SBA_IsActive", FieldType.BOOLEAN)
+    SBA_ISRESPONSEMAPPING__FIELD_NAME: WrapperField = WrapperField("SBA_IsResponseMapping", FieldType.STRING)
+    SBA_PLATEIDCELLCOLUMN__FIELD_NAME: WrapperField = WrapperField("SBA_PlateIdCellColumn", FieldType.INTEGER)
+    SBA_PLATEIDCELLROW__FIELD_NAME: WrapperField = WrapperField("SBA_PlateIdCellRow", FieldType.INTEGER)
+    SBA_PLATEIDMAPPING__FIELD_NAME: WrapperField = WrapperField("SBA_PlateIdMapping", FieldType.STRING)
+    SBA_RETENTIONMAPPING__FIELD_NAME: WrapperField = WrapperField("SBA_RetentionMapping", FieldType.STRING)
+    SBA_RUNIDMAPPING__FIELD_NAME: WrapperField = WrapperField("SBA_RunIdMapping", FieldType.STRING)
+    SBA_SAMPLEIDMAPPING__FIELD_NAME: WrapperField = WrapperField("SBA_SampleIdMapping", FieldType.STRING)
+    SBA_WELLPOSITIONMAPPING__FIELD_NAME: WrapperField = WrapperField("SBA_WellPositionMapping", FieldType.STRING)
+    SBA_WELLPOSITIONREPRESENTATION__FIELD_NAME: WrapperField = WrapperField("SBA_WellPositionRepresentation", FieldType.PICKLIST)
+
+    SBA_AnalyteNameMapping: ModelField[Optional[str]] = ModelField("SBA_AnalyteNameMapping", FieldType.STRING)
+    SBA_AssayDateMapping: ModelField[Optional[str]] = ModelField("SBA_AssayDateMapping", FieldType.STRING)
+    SBA_AssayInstrumentType: ModelField[Optional[str]] = ModelField("SBA_AssayInstrumentType", FieldType.PICKLIST)
+    SBA_ConcentrationMapping: ModelField[Optional[str]] = ModelField("SBA_ConcentrationMapping", FieldType.STRING)
+    SBA_ConfigurationName: ModelField[Optional[str]] = ModelField("SBA_ConfigurationName", FieldType.STRING)
+    SBA_CustomParserPluginPath: ModelField[Optional[str]] = ModelField("SBA_CustomParserPluginPath", FieldType.SELECTION)
+    SBA_ExpectedConcentrationUnits: ModelField[Optional[str]] = ModelField("SBA_ExpectedConcentrationUnits", FieldType.PICKLIST)
+    SBA_FirstWellPositionColumn: ModelField[Optional[int]] = ModelField("SBA_FirstWellPositionColumn", FieldType.INTEGER)
+    SBA_FirstWellPositionRow: ModelField[Optional[int]] = ModelField("SBA_FirstWellPositionRow", FieldType.INTEGER)
+    SBA_InstrumentOutputFileLayout: ModelField[Optional[str]] = ModelField("SBA_InstrumentOutputFileLayout", FieldType.PICKLIST)
+    SBA_InstrumentOutputFileType: ModelField[Optional[str]] = ModelField("SBA_InstrumentOutputFileType", FieldType.STRING)
+    SBA_InstrumentResponseMapping: ModelField[Optional[str]] = ModelField("SBA_InstrumentResponseMapping", FieldType.STRING)
+    SBA_IsActive: ModelField[Optional[bool]] = ModelField("SBA_IsActive", FieldType.BOOLEAN)
+    SBA_IsResponseMapping: ModelField[Optional[str]] = ModelField("SBA_IsResponseMapping", FieldType.STRING)
+    SBA_PlateIdCellColumn: ModelField[Optional[int]] = ModelField("SBA_PlateIdCellColumn", FieldType.INTEGER)
+    SBA_PlateIdCellRow: ModelField[Optional[int]] = ModelField("SBA_PlateIdCellRow", FieldType.INTEGER)
+    SBA_PlateIdMapping: ModelField[Optional[str]] = ModelField("SBA_PlateIdMapping", FieldType.STRING)
+    SBA_RetentionMapping: ModelField[Optional[str]] = ModelField("SBA_RetentionMapping", FieldType.STRING)
+    SBA_RunIdMapping: ModelField[Optional[str]] = ModelField("SBA_RunIdMapping", FieldType.STRING)
+    SBA_SampleIdMapping: ModelField[Optional[str]] = ModelField("SBA_SampleIdMapping", FieldType.STRING)
+    SBA_WellPositionMapping: ModelField[Optional[str]] = ModelField("SBA_WellPositionMapping", FieldType.STRING)
+    SBA_WellPositionRepresentation: ModelField[Optional[str]] = ModelField("SBA_WellPositionRepresentation", FieldType.PICKLIST)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
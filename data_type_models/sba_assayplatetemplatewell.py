@@ -0,0 +1,34 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class SBA_AssayPlateTemplateWellModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type SBA_AssayPlateTemplateWell
+    Data Type Display Name: Assay Plate Template Well (Assay Plate Template Wells)
+    Fields: SBA_ColPosition, SBA_ControlName, SBA_ControlType, SBA_PlateColumns, SBA_PlateNumber, SBA_PlateRows, SBA_PlateTemplateName, SBA_RowPosition
+    """
+    DATA_TYPE_NAME: str = 'SBA_AssayPlateTemplateWell'
+    SBA_COLPOSITION__FIELD_NAME: WrapperField = WrapperField("SBA_ColPosition", FieldType.SELECTION)
+    SBA_CONTROLNAME__FIELD_NAME: WrapperField = WrapperField("SBA_ControlName", FieldType.STRING)
+    SBA_CONTROLTYPE__FIELD_NAME: WrapperField = WrapperField("SBA_ControlType", FieldType.STRING)
+    SBA_PLATECOLUMNS__FIELD_NAME: WrapperField = WrapperField("SBA_PlateColumns", FieldType.INTEGER)
+    SBA_PLATENUMBER__FIELD_NAME: WrapperField = WrapperField("SBA_PlateNumber", FieldType.INTEGER)
+    SBA_PLATEROWS__FIELD_NAME: WrapperField = WrapperField("SBA_PlateRows", FieldType.INTEGER)
+    SBA_PLATETEMPLATENAME__FIELD_NAME: WrapperField = WrapperField("SBA_PlateTemplateName", FieldType.STRING)
+    SBA_ROWPOSITION__FIELD_NAME: WrapperField = WrapperField("SBA_RowPosition", FieldType.SELECTION)
+
+    SBA_ColPosition: ModelField[Optional[str]] = ModelField("SBA_ColPosition", FieldType.SELECTION)
+    SBA_ControlName: ModelField[Optional[str]] = ModelField("SBA_ControlName", FieldType.STRING)
+    SBA_ControlType: ModelField[Optional[str]] = ModelField("SBA_ControlType", FieldType.STRING)
+    SBA_PlateColumns: ModelField[Optional[int]] = ModelField("SBA_PlateColumns", FieldType.INTEGER)
+    SBA_PlateNumber: ModelField[Optional[int]] = ModelField("SBA_PlateNumber", FieldType.INTEGER)
+    SBA_PlateRows: ModelField[Optional[int]] = ModelField("SBA_PlateRows", FieldType.INTEGER)
+    SBA_PlateTemplateName: ModelField[Optional[str]] = ModelField("SBA_PlateTemplateName", FieldType.STRING)
+    SBA_RowPosition: ModelField[Optional[str]] = ModelField("SBA_RowPosition", FieldType.SELECTION)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
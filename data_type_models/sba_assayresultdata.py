@@ -0,0 +1,38 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class SBA_AssayResultDataModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type SBA_AssayResultData
+    Data Type Display Name: Assay Result Data (Assay Result Datas)
+    Fields: SBA_AnalyteName, SBA_AssayDateTime, SBA_BiasPercentage, SBA_Concentration, SBA_DeactivateReason, SBA_FoundConcentration, SBA_IsResponse, SBA_RawDataValue, SBA_Retention, SBA_SampleAssayStatus
+    """
+    DATA_TYPE_NAME: str = 'SBA_AssayResultData'
+    SBA_ANALYTENAME__FIELD_NAME: WrapperField = WrapperField("SBA_AnalyteName", FieldType.STRING)
+    SBA_ASSAYDATETIME__FIELD_NAME: WrapperField = WrapperField("SBA_AssayDateTime", FieldType.DATE)
+    SBA_BIASPERCENTAGE__FIELD_NAME: WrapperField = WrapperField("SBA_BiasPercentage", FieldType.DOUBLE)
+    SBA_CONCENTRATION__FIELD_NAME: WrapperField = WrapperField("SBA_Concentration", FieldType.DOUBLE)
+    SBA_DEACTIVATEREASON__FIELD_NAME: WrapperField = WrapperField("SBA_DeactivateReason", FieldType.STRING)
+    SBA_FOUNDCONCENTRATION__FIELD_NAME: WrapperField = WrapperField("SBA_FoundConcentration", FieldType.DOUBLE)
+    SBA_ISRESPONSE__FIELD_NAME: WrapperField = WrapperField("SBA_IsResponse", FieldType.DOUBLE)
+    SBA_RAWDATAVALUE__FIELD_NAME: WrapperField = WrapperField("SBA_RawDataValue", FieldType.DOUBLE)
+    SBA_RETENTION__FIELD_NAME: WrapperField = WrapperField("SBA_Retention", FieldType.DOUBLE)
+    SBA_SAMPLEASSAYSTATUS__FIELD_NAME: WrapperField = WrapperField("SBA_SampleAssayStatus", FieldType.SELECTION)
+
+    SBA_AnalyteName: ModelField[Optional[str]] = ModelField("SBA_AnalyteName", FieldType.STRING)
+    SBA_AssayDateTime: ModelField[Optional[int]] = ModelField("SBA_AssayDateTime", FieldType.DATE)
+    SBA_BiasPercentage: ModelField[Optional[float]] = ModelField("SBA_BiasPercentage", FieldType.DOUBLE)
+    SBA_Concentration: ModelField[Optional[float]] = ModelField("SBA_Concentration", FieldType.DOUBLE)
+    SBA_DeactivateReason: ModelField[Optional[str]] = ModelField("SBA_DeactivateReason", FieldType.STRING)
+    SBA_FoundConcentration: ModelField[Optional[float]] = ModelField("SBA_FoundConcentration", FieldType.DOUBLE)
+    SBA_IsResponse: ModelField[Optional[float]] = ModelField("SBA_IsResponse", FieldType.DOUBLE)
+    SBA_RawDataValue: ModelField[Optional[float]] = ModelField("SBA_RawDataValue", FieldType.DOUBLE)
+    SBA_Retention: ModelField[Optional[float]] = ModelField("SBA_Retention", FieldType.DOUBLE)
+    SBA_SampleAssayStatus: ModelField[Optional[str]] = ModelField("SBA_SampleAssayStatus", FieldType.SELECTION)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
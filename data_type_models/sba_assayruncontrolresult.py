@@ -0,0 +1,42 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class SBA_AssayRunControlResultModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type SBA_AssayRunControlResult
+    Data Type Display Name: Assay Run Control Result (Assay Run Control Results)
+    Fields: SBA_AnalyteName, SBA_ConcentrationCV, SBA_ConcentrationUnit, SBA_ControlName, SBA_ControlType, SBA_DeactivateReason, SBA_MeanBiasPercentage, SBA_MeanConcentration, SBA_PlateId, SBA_SampleAssayStatus, SBA_StandardDeviation, SBA_TheoreticalValue
+    """
+    DATA_TYPE_NAME: str = 'SBA_AssayRunControlResult'
+    SBA_ANALYTENAME__FIELD_NAME: WrapperField = WrapperField("SBA_AnalyteName", FieldType.STRING)
+    SBA_CONCENTRATIONCV__FIELD_NAME: WrapperField = WrapperField("SBA_ConcentrationCV", FieldType.DOUBLE)
+    SBA_CONCENTRATIONUNIT__FIELD_NAME: WrapperField = WrapperField("SBA_ConcentrationUnit", FieldType.SELECTION)
+    SBA_CONTROLNAME__FIELD_NAME: WrapperField = WrapperField("SBA_ControlName", FieldType.STRING)
+    SBA_CONTROLTYPE__FIELD_NAME: WrapperField = WrapperField("SBA_ControlType", FieldType.SELECTION)
+    SBA_DEACTIVATEREASON__FIELD_NAME: WrapperField = WrapperField("SBA_DeactivateReason", FieldType.STRING)
+    SBA_MEANBIASPERCENTAGE__FIELD_NAME: WrapperField = WrapperField("SBA_MeanBiasPercentage", FieldType.DOUBLE)
+    SBA_MEANCONCENTRATION__FIELD_NAME: WrapperField = WrapperField("SBA_MeanConcentration", FieldType.DOUBLE)
+    SBA_PLATEID__FIELD_NAME: WrapperField = WrapperField("SBA_PlateId", FieldType.STRING)
+    SBA_SAMPLEASSAYSTATUS__FIELD_NAME: WrapperField = WrapperField("SBA_SampleAssayStatus", FieldType.SELECTION)
+    SBA_STANDARDDEVIATION__FIELD_NAME: WrapperField = WrapperField("SBA_StandardDeviation", FieldType.DOUBLE)
+    SBA_THEORETICALVALUE__FIELD_NAME: WrapperField = WrapperField("SBA_TheoreticalValue", FieldType.DOUBLE)
+
+    SBA_AnalyteName: ModelField[Optional[str]] = ModelField("SBA_AnalyteName", FieldType.STRING)
+    SBA_ConcentrationCV: ModelField[Optional[float]] = ModelField("SBA_ConcentrationCV", FieldType.DOUBLE)
+    SBA_ConcentrationUnit: ModelField[Optional[str]] = ModelField("SBA_ConcentrationUnit", FieldType.SELECTION)
+    SBA_ControlName: ModelField[Optional[str]] = ModelField("SBA_ControlName", FieldType.STRING)
+    SBA_ControlType: ModelField[Optional[str]] = ModelField("SBA_ControlType", FieldType.SELECTION)
+    SBA_DeactivateReason: ModelField[Optional[str]] = ModelField("SBA_DeactivateReason", FieldType.STRING)
+    SBA_MeanBiasPercentage: ModelField[Optional[float]] = ModelField("SBA_MeanBiasPercentage", FieldType.DOUBLE)
+    SBA_MeanConcentration: ModelField[Optional[float]] = ModelField("SBA_MeanConcentration", FieldType.DOUBLE)
+    SBA_PlateId: ModelField[Optional[str]] = ModelField("SBA_PlateId", FieldType.STRING)
+    SBA_SampleAssayStatus: ModelField[Optional[str]] = ModelField("SBA_SampleAssayStatus", FieldType.SELECTION)
+    SBA_StandardDeviation: ModelField[Optional[float]] = ModelField("SBA_StandardDeviation", FieldType.DOUBLE)
+    SBA_TheoreticalValue: ModelField[Optional[float]] = ModelField("SBA_TheoreticalValue", FieldType.DOUBLE)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
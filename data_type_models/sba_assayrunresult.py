@@ -0,0 +1,40 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class SBA_AssayRunResultModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type SBA_AssayRunResult
+    Data Type Display Name: Assay Run Result (Assay Run Result)
+    Fields: SBA_AcceptOrReject, SBA_AllQCLevelsPassCVCheck, SBA_AnalyteName, SBA_AssayRunId, SBA_CurveFitModelName, SBA_FailureDetected, SBA_FailureReason, SBA_ManualOverrideReason, SBA_ManualRejectionReason, SBA_PlateId, SBA_Status
+    """
+    DATA_TYPE_NAME: str = 'SBA_AssayRunResult'
+    SBA_ACCEPTORREJECT__FIELD_NAME: WrapperField = WrapperField("SBA_AcceptOrReject", FieldType.PICKLIST)
+    SBA_ALLQCLEVELSPASSCVCHECK__FIELD_NAME: WrapperField = WrapperField("SBA_AllQCLevelsPassCVCheck", FieldType.BOOLEAN)
+    SBA_ANALYTENAME__FIELD_NAME: WrapperField = WrapperField("SBA_AnalyteName", FieldType.SELECTION)
+    SBA_ASSAYRUNID__FIELD_NAME: WrapperField = WrapperField("SBA_AssayRunId", FieldType.STRING)
+    SBA_CURVEFITMODELNAME__FIELD_NAME: WrapperField = WrapperField("SBA_CurveFitModelName", FieldType.STRING)
+    SBA_FAILUREDETECTED__FIELD_NAME: WrapperField = WrapperField("SBA_FailureDetected", FieldType.STRING)
+    SBA_FAILUREREASON__FIELD_NAME: WrapperField = WrapperField("SBA_FailureReason", FieldType.STRING)
+    SBA_MANUALOVERRIDEREASON__FIELD_NAME: WrapperField = WrapperField("SBA_ManualOverrideReason", FieldType.STRING)
+    SBA_MANUALREJECTIONREASON__FIELD_NAME: WrapperField = WrapperField("SBA_ManualRejectionReason", FieldType.STRING)
+    SBA_PLATEID__FIELD_NAME: WrapperField = WrapperField("SBA_PlateId", FieldType.STRING)
+    SBA_STATUS__FIELD_NAME: WrapperField = WrapperField("SBA_Status", FieldType.SELECTION)
+
+    SBA_AcceptOrReject: ModelField[Optional[str]] = ModelField("SBA_AcceptOrReject", FieldType.PICKLIST)
+    SBA_AllQCLevelsPassCVCheck: ModelField[Optional[bool]] = ModelField("SBA_AllQCLevelsPassCVCheck", FieldType.BOOLEAN)
+    SBA_AnalyteName: ModelField[Optional[str]] = ModelField("SBA_AnalyteName", FieldType.SELECTION)
+    SBA_AssayRunId: ModelField[Optional[str]] = ModelField("SBA_AssayRunId", FieldType.STRING)
+    SBA_CurveFitModelName: ModelField[Optional[str]] = ModelField("SBA_CurveFitModelName", FieldType.STRING)
+    SBA_FailureDetected: ModelField[Optional[str]] = ModelField("SBA_FailureDetected", FieldType.STRING)
+    SBA_FailureReason: ModelField[Optional[str]] = ModelField("SBA_FailureReason", FieldType.STRING)
+    SBA_ManualOverrideReason: ModelField[Optional[str]] = ModelField("SBA_ManualOverrideReason", FieldType.STRING)
+    SBA_ManualRejectionReason: ModelField[Optional[str]] = ModelField("SBA_ManualRejectionReason", FieldType.STRING)
+    SBA_PlateId: ModelField[Optional[str]] = ModelField("SBA_PlateId", FieldType.STRING)
+    SBA_Status: ModelField[Optional[str]] = ModelField("SBA_Status", FieldType.SELECTION)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,44 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class SBA_AssayRunSampleResultModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type SBA_AssayRunSampleResult
+    Data Type Display Name: Assay Run Sample Result (Assay Run Sample Results)
+    Fields: SBA_AnalyteName, SBA_AssayDetectionQuality, SBA_AssayProcessStatus, SBA_ConcentrationCV, SBA_ConcentrationUnit, SBA_DeactivateReason, SBA_MeanConcentration, SBA_MeanFoundConcentration, SBA_OtherSampleId, SBA_PlateId, SBA_SampleAssayStatus, SBA_SampleId, SBA_StandardDeviation
+    """
+    DATA_TYPE_NAME: str = 'SBA_AssayRunSampleResult'
+    SBA_ANALYTENAME__FIELD_NAME: WrapperField = WrapperField("SBA_AnalyteName", FieldType.STRING)
+    SBA_ASSAYDETECTIONQUALITY__FIELD_NAME: WrapperField = WrapperField("SBA_AssayDetectionQuality", FieldType.SELECTION)
+    SBA_ASSAYPROCESSSTATUS__FIELD_NAME: WrapperField = WrapperField("SBA_AssayProcessStatus", FieldType.SELECTION)
+    SBA_CONCENTRATIONCV__FIELD_NAME: WrapperField = WrapperField("SBA_ConcentrationCV", FieldType.DOUBLE)
+    SBA_CONCENTRATIONUNIT__FIELD_NAME: WrapperField = WrapperField("SBA_ConcentrationUnit", FieldType.SELECTION)
+    SBA_DEACTIVATEREASON__FIELD_NAME: WrapperField = WrapperField("SBA_DeactivateReason", FieldType.STRING)
+    SBA_MEANCONCENTRATION__FIELD_NAME: WrapperField = WrapperField("SBA_MeanConcentration", FieldType.DOUBLE)
+    SBA_MEANFOUNDCONCENTRATION__FIELD_NAME: WrapperField = WrapperField("SBA_MeanFoundConcentration", FieldType.DOUBLE)
+    SBA_OTHERSAMPLEID__FIELD_NAME: WrapperField = WrapperField("SBA_OtherSampleId", FieldType.STRING)
+    SBA_PLATEID__FIELD_NAME: WrapperField = WrapperField("SBA_PlateId", FieldType.STRING)
+    SBA_SAMPLEASSAYSTATUS__FIELD_NAME: WrapperField = WrapperField("SBA_SampleAssayStatus", FieldType.SELECTION)
+    SBA_SAMPLEID__FIELD_NAME: WrapperField = WrapperField("SBA_SampleId", FieldType.STRING)
+    SBA_STANDARDDEVIATION__FIELD_NAME: WrapperField = WrapperField("SBA_StandardDeviation", FieldType.DOUBLE)
+
+    SBA_AnalyteName: ModelField[Optional[str]] = ModelField("SBA_AnalyteName", FieldType.STRING)
+    SBA_AssayDetectionQuality: ModelField[Optional[str]] = ModelField("SBA_AssayDetectionQuality", FieldType.SELECTION)
+    SBA_AssayProcessStatus: ModelField[Optional[str]] = ModelField("SBA_AssayProcessStatus", FieldType.SELECTION)
+    SBA_ConcentrationCV: ModelField[Optional[float]] = ModelField("SBA_ConcentrationCV", FieldType.DOUBLE)
+    SBA_ConcentrationUnit: ModelField[Optional[str]] = ModelField("SBA_ConcentrationUnit", FieldType.SELECTION)
+    SBA_DeactivateReason: ModelField[Optional[str]] = ModelField("SBA_DeactivateReason", FieldType.STRING)
+    SBA_MeanConcentration: ModelField[Optional[float]] = ModelField("SBA_MeanConcentration", FieldType.DOUBLE)
+    SBA_MeanFoundConcentration: ModelField[Optional[float]] = ModelField("SBA_MeanFoundConcentration", FieldType.DOUBLE)
+    SBA_OtherSampleId: ModelField[Optional[str]] = ModelField("SBA_OtherSampleId", FieldType.STRING)
+    SBA_PlateId: ModelField[Optional[str]] = ModelField("SBA_PlateId", FieldType.STRING)
+    SBA_SampleAssayStatus: ModelField[Optional[str]] = ModelField("SBA_SampleAssayStatus", FieldType.SELECTION)
+    SBA_SampleId: ModelField[Optional[str]] = ModelField("SBA_SampleId", FieldType.STRING)
+    SBA_StandardDeviation: ModelField[Optional[float]] = ModelField("SBA_StandardDeviation", FieldType.DOUBLE)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,44 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class SBA_AssaySampleModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type SBA_AssaySample
+    Data Type Display Name: Assay Sample (Assay Samples)
+    Fields: SBA_CollectionDateTime, SBA_ColPosition, SBA_ControlType, SBA_DilutionFactor, SBA_IsCarryoverBlank, SBA_IsControl, SBA_IsExtracted, SBA_OtherSampleId, SBA_PlateId, SBA_RowPosition, SBA_SampleCondition, SBA_SampleId, SBA_ValidationParameter
+    """
+    DATA_TYPE_NAME: str = 'SBA_AssaySample'
+    SBA_COLLECTIONDATETIME__FIELD_NAME: WrapperField = WrapperField("SBA_CollectionDateTime", FieldType.DATE)
+    SBA_COLPOSITION__FIELD_NAME: WrapperField = WrapperField("SBA_ColPosition", FieldType.SELECTION)
+    SBA_CONTROLTYPE__FIELD_NAME: WrapperField = WrapperField("SBA_ControlType", FieldType.STRING)
+    SBA_DILUTIONFACTOR__FIELD_NAME: WrapperField = WrapperField("SBA_DilutionFactor", FieldType.DOUBLE)
+    SBA_ISCARRYOVERBLANK__FIELD_NAME: WrapperField = WrapperField("SBA_IsCarryoverBlank", FieldType.BOOLEAN)
+    SBA_ISCONTROL__FIELD_NAME: WrapperField = WrapperField("SBA_IsControl", FieldType.BOOLEAN)
+    SBA_ISEXTRACTED__FIELD_NAME: WrapperField = WrapperField("SBA_IsExtracted", FieldType.BOOLEAN)
+    SBA_OTHERSAMPLEID__FIELD_NAME: WrapperField = WrapperField("SBA_OtherSampleId", FieldType.STRING)
+    SBA_PLATEID__FIELD_NAME: WrapperField = WrapperField("SBA_PlateId", FieldType.STRING)
+    SBA_ROWPOSITION__FIELD_NAME: WrapperField = WrapperField("SBA_RowPosition", FieldType.SELECTION)
+    SBA_SAMPLECONDITION__FIELD_NAME: WrapperField = WrapperField("SBA_SampleCondition", FieldType.SELECTION)
+    SBA_SAMPLEID__FIELD_NAME: WrapperField = WrapperField("SBA_SampleId", FieldType.STRING)
+    SBA_VALIDATIONPARAMETER__FIELD_NAME: WrapperField = WrapperField("SBA_ValidationParameter", FieldType.SELECTION)
+
+    SBA_CollectionDateTime: ModelField[Optional[int]] = ModelField("SBA_CollectionDateTime", FieldType.DATE)
+    SBA_ColPosition: ModelField[Optional[str]] = ModelField("SBA_ColPosition", FieldType.SELECTION)
+    SBA_ControlType: ModelField[Optional[str]] = ModelField("SBA_ControlType", FieldType.STRING)
+    SBA_DilutionFactor: ModelField[Optional[float]] = ModelField("SBA_DilutionFactor", FieldType.DOUBLE)
+    SBA_IsCarryoverBlank: ModelField[Optional[bool]] = ModelField("SBA_IsCarryoverBlank", FieldType.BOOLEAN)
+    SBA_IsControl: ModelField[Optional[bool]] = ModelField("SBA_IsControl", FieldType.BOOLEAN)
+    SBA_IsExtracted: ModelField[Optional[bool]] = ModelField("SBA_IsExtracted", FieldType.BOOLEAN)
+    SBA_OtherSampleId: ModelField[Optional[str]] = ModelField("SBA_OtherSampleId", FieldType.STRING)
+    SBA_PlateId: ModelField[Optional[str]] = ModelField("SBA_PlateId", FieldType.STRING)
+    SBA_RowPosition: ModelField[Optional[str]] = ModelField("SBA_RowPosition", FieldType.SELECTION)
+    SBA_SampleCondition: ModelField[Optional[str]] = ModelField("SBA_SampleCondition", FieldType.SELECTION)
+    SBA_SampleId: ModelField[Optional[str]] = ModelField("SBA_SampleId", FieldType.STRING)
+    SBA_ValidationParameter: ModelField[Optional[str]] = ModelField("SBA_ValidationParameter", FieldType.SELECTION)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
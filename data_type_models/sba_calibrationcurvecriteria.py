@@ -0,0 +1,29 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class SBA_CalibrationCurveCriteriaModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type SBA_CalibrationCurveCriteria
+    Data Type Display Name: Calibration Curve Criteria (Calibration Curve Criteria)
+    Fields: SBA_MaxMeanBiasForLLOQ, SBA_MaxMeanBiasForNonLLOQ, SBA_MinOfSTDLevels, SBA_MinPassRatePerSTDLevel, SBA_MinSTDPassRate
+    The CalibrationCurveCriteria Data Type
+    """
+    DATA_TYPE_NAME: str = 'SBA_CalibrationCurveCriteria'
+    SBA_MAXMEANBIASFORLLOQ__FIELD_NAME: WrapperField = WrapperField("SBA_MaxMeanBiasForLLOQ", FieldType.DOUBLE)
+    SBA_MAXMEANBIASFORNONLLOQ__FIELD_NAME: WrapperField = WrapperField("SBA_MaxMeanBiasForNonLLOQ", FieldType.DOUBLE)
+    SBA_MINOFSTDLEVELS__FIELD_NAME: WrapperField = WrapperField("SBA_MinOfSTDLevels", FieldType.LONG)
+    SBA_MINPASSRATEPERSTDLEVEL__FIELD_NAME: WrapperField = WrapperField("SBA_MinPassRatePerSTDLevel", FieldType.DOUBLE)
+    SBA_MINSTDPASSRATE__FIELD_NAME: WrapperField = WrapperField("SBA_MinSTDPassRate", FieldType.DOUBLE)
+
+    SBA_MaxMeanBiasForLLOQ: ModelField[Optional[float]] = ModelField("SBA_MaxMeanBiasForLLOQ", FieldType.DOUBLE)
+    SBA_MaxMeanBiasForNonLLOQ: ModelField[Optional[float]] = ModelField("SBA_MaxMeanBiasForNonLLOQ", FieldType.DOUBLE)
+    SBA_MinOfSTDLevels: ModelField[Optional[int]] = ModelField("SBA_MinOfSTDLevels", FieldType.LONG)
+    SBA_MinPassRatePerSTDLevel: ModelField[Optional[float]] = ModelField("SBA_MinPassRatePerSTDLevel", FieldType.DOUBLE)
+    SBA_MinSTDPassRate: ModelField[Optional[float]] = ModelField("SBA_MinSTDPassRate", FieldType.DOUBLE)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,25 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class SBA_CalibrationCurveResultsModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type SBA_CalibrationCurveResults
+    Data Type Display Name: Calibration Curve Results (Calibration Curve Results)
+    Fields: SBA_NumSTDLevels, SBA_NumSTDPassRate, SBA_WithinStdLevelBiasPass
+    The SBA_CalibrationCurveResults Data Type
+    """
+    DATA_TYPE_NAME: str = 'SBA_CalibrationCurveResults'
+    SBA_NUMSTDLEVELS__FIELD_NAME: WrapperField = WrapperField("SBA_NumSTDLevels", FieldType.LONG)
+    SBA_NUMSTDPASSRATE__FIELD_NAME: WrapperField = WrapperField("SBA_NumSTDPassRate", FieldType.DOUBLE)
+    SBA_WITHINSTDLEVELBIASPASS__FIELD_NAME: WrapperField = WrapperField("SBA_WithinStdLevelBiasPass", FieldType.BOOLEAN)
+
+    SBA_NumSTDLevels: ModelField[Optional[int]] = ModelField("SBA_NumSTDLevels", FieldType.LONG)
+    SBA_NumSTDPassRate: ModelField[Optional[float]] = ModelField("SBA_NumSTDPassRate", FieldType.DOUBLE)
+    SBA_WithinStdLevelBiasPass: ModelField[Optional[bool]] = ModelField("SBA_WithinStdLevelBiasPass", FieldType.BOOLEAN)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
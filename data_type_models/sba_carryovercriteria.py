@@ -0,0 +1,23 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class SBA_CarryOverCriteriaModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type SBA_CarryOverCriteria
+    Data Type Display Name: Carry Over Criteria (Carry Over Criteria)
+    Fields: SBA_MaxCarryoverAgainstIS, SBA_MaxCarryoverAgainstLLOQ
+    The CarryOverCriteria Data Type
+    """
+    DATA_TYPE_NAME: str = 'SBA_CarryOverCriteria'
+    SBA_MAXCARRYOVERAGAINSTIS__FIELD_NAME: WrapperField = WrapperField("SBA_MaxCarryoverAgainstIS", FieldType.DOUBLE)
+    SBA_MAXCARRYOVERAGAINSTLLOQ__FIELD_NAME: WrapperField = WrapperField("SBA_MaxCarryoverAgainstLLOQ", FieldType.DOUBLE)
+
+    SBA_MaxCarryoverAgainstIS: ModelField[Optional[float]] = ModelField("SBA_MaxCarryoverAgainstIS", FieldType.DOUBLE)
+    SBA_MaxCarryoverAgainstLLOQ: ModelField[Optional[float]] = ModelField("SBA_MaxCarryoverAgainstLLOQ", FieldType.DOUBLE)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
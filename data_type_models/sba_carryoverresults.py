@@ -0,0 +1,23 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class SBA_CarryOverResultsModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type SBA_CarryOverResults
+    Data Type Display Name: Carry Over Results (Carry Over Results)
+    Fields: SBA_CarryoverAgainstIS, SBA_CarryoverAgainstLLOQ
+    The SBA_CarryOverResults Data Type
+    """
+    DATA_TYPE_NAME: str = 'SBA_CarryOverResults'
+    SBA_CARRYOVERAGAINSTIS__FIELD_NAME: WrapperField = WrapperField("SBA_CarryoverAgainstIS", FieldType.DOUBLE)
+    SBA_CARRYOVERAGAINSTLLOQ__FIELD_NAME: WrapperField = WrapperField("SBA_CarryoverAgainstLLOQ", FieldType.DOUBLE)
+
+    SBA_CarryoverAgainstIS: ModelField[Optional[float]] = ModelField("SBA_CarryoverAgainstIS", FieldType.DOUBLE)
+    SBA_CarryoverAgainstLLOQ: ModelField[Optional[float]] = ModelField("SBA_CarryoverAgainstLLOQ", FieldType.DOUBLE)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
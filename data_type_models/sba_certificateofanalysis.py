@@ -0,0 +1,34 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class SBA_CertificateOfAnalysisModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type SBA_CertificateOfAnalysis
+    Data Type Display Name: Certificate Of Analysis (Certificate Of Analysis)
+    Fields: FilePath, SBA_AnalyzedbyTechnician, SBA_CertificateExpirationDate, SBA_Comments, SBA_ConsumableItemBarcode, SBA_CorrectionFactor, SBA_DateofAnalysis, VeloxCurrentVersion
+    """
+    DATA_TYPE_NAME: str = 'SBA_CertificateOfAnalysis'
+    FILEPATH__FIELD_NAME: WrapperField = WrapperField("FilePath", FieldType.STRING)
+    SBA_ANALYZEDBYTECHNICIAN__FIELD_NAME: WrapperField = WrapperField("SBA_AnalyzedbyTechnician", FieldType.STRING)
+    SBA_CERTIFICATEEXPIRATIONDATE__FIELD_NAME: WrapperField = WrapperField("SBA_CertificateExpirationDate", FieldType.DATE)
+    SBA_COMMENTS__FIELD_NAME: WrapperField = WrapperField("SBA_Comments", FieldType.STRING)
+    SBA_CONSUMABLEITEMBARCODE__FIELD_NAME: WrapperField = WrapperField("SBA_ConsumableItemBarcode", FieldType.STRING)
+    SBA_CORRECTIONFACTOR__FIELD_NAME: WrapperField = WrapperField("SBA_CorrectionFactor", FieldType.DOUBLE)
+    SBA_DATEOFANALYSIS__FIELD_NAME: WrapperField = WrapperField("SBA_DateofAnalysis", FieldType.DATE)
+    VELOXCURRENTVERSION__FIELD_NAME: WrapperField = WrapperField("VeloxCurrentVersion", FieldType.INTEGER)
+
+    FilePath: ModelField[Optional[str]] = ModelField("FilePath", FieldType.STRING)
+    SBA_AnalyzedbyTechnician: ModelField[Optional[str]] = ModelField("SBA_AnalyzedbyTechnician", FieldType.STRING)
+    SBA_CertificateExpirationDate: ModelField[Optional[int]] = ModelField("SBA_CertificateExpirationDate", FieldType.DATE)
+    SBA_Comments: ModelField[Optional[str]] = ModelField("SBA_Comments", FieldType.STRING)
+    SBA_ConsumableItemBarcode: ModelField[Optional[str]] = ModelField("SBA_ConsumableItemBarcode", FieldType.STRING)
+    SBA_CorrectionFactor: ModelField[Optional[float]] = ModelField("SBA_CorrectionFactor", FieldType.DOUBLE)
+    SBA_DateofAnalysis: ModelField[Optional[int]] = ModelField("SBA_DateofAnalysis", FieldType.DATE)
+    VeloxCurrentVersion: ModelField[Optional[int]] = ModelField("VeloxCurrentVersion", FieldType.INTEGER)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,26 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class SBA_CurveFitterFunctionConfigModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type SBA_CurveFitterFunctionConfig
+    Data Type Display Name: Curve Fitter Function Config (Curve Fitter Function Configs)
+    Fields: SBA_ConfigData, SBA_FunctionName, SBA_ImplClass, SBA_IsDefaultFunction
+    """
+    DATA_TYPE_NAME: str = 'SBA_CurveFitterFunctionConfig'
+    SBA_CONFIGDATA__FIELD_NAME: WrapperField = WrapperField("SBA_ConfigData", FieldType.STRING)
+    SBA_FUNCTIONNAME__FIELD_NAME: WrapperField = WrapperField("SBA_FunctionName", FieldType.STRING)
+    SBA_IMPLCLASS__FIELD_NAME: WrapperField = WrapperField("SBA_ImplClass", FieldType.STRING)
+    SBA_ISDEFAULTFUNCTION__FIELD_NAME: WrapperField = WrapperField("SBA_IsDefaultFunction", FieldType.BOOLEAN)
+
+    SBA_ConfigData: ModelField[Optional[str]] = ModelField("SBA_ConfigData", FieldType.STRING)
+    SBA_FunctionName: ModelField[Optional[str]] = ModelField("SBA_FunctionName", FieldType.STRING)
+    SBA_ImplClass: ModelField[Optional[str]] = ModelField("SBA_ImplClass", FieldType.STRING)
+    SBA_IsDefaultFunction: ModelField[Optional[bool]] = ModelField("SBA_IsDefaultFunction", FieldType.BOOLEAN)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,57 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class SBA_MasterAssayModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type SBA_MasterAssay
+    Data Type Display Name: Master Assay (Master Assays)
+    Fields: MultiParentLink118, SBA_ApprovalDate, SBA_AssayComments, SBA_AssayDescription, SBA_AssayId, SBA_AssayInstrumentType, SBA_AssayMethodStatus, SBA_AssayType, SBA_BiologicalMatrix, SBA_ConcentrationUnits, SBA_CVOfLLOQSTD, SBA_CVOfQC, SBA_CVOfSTD, SBA_CVOfUnknownSample, SBA_IsActive, SBA_MasterAssayName, SBA_MinIsrPassRate, SBA_RequiredValidationParam, SBA_RunAcceptanceConfig, SBA_Species
+    """
+    DATA_TYPE_NAME: str = 'SBA_MasterAssay'
+    MULTIPARENTLINK118__FIELD_NAME: WrapperField = WrapperField("MultiParentLink118", FieldType.MULTIPARENTLINK)
+    SBA_APPROVALDATE__FIELD_NAME: WrapperField = WrapperField("SBA_ApprovalDate", FieldType.DATE)
+    SBA_ASSAYCOMMENTS__FIELD_NAME: WrapperField = WrapperField("SBA_AssayComments", FieldType.STRING)
+    SBA_ASSAYDESCRIPTION__FIELD_NAME: WrapperField = WrapperField("SBA_AssayDescription", FieldType.STRING)
+    SBA_ASSAYID__FIELD_NAME: WrapperField = WrapperField("SBA_AssayId", FieldType.AUTO_ACCESSION)
+    SBA_ASSAYINSTRUMENTTYPE__FIELD_NAME: WrapperField = WrapperField("SBA_AssayInstrumentType", FieldType.SELECTION)
+    SBA_ASSAYMETHODSTATUS__FIELD_NAME: WrapperField = WrapperField("SBA_AssayMethodStatus", FieldType.PICKLIST)
+    SBA_ASSAYTYPE__FIELD_NAME: WrapperField = WrapperField("SBA_AssayType", FieldType.SELECTION)
+    SBA_BIOLOGICALMATRIX__FIELD_NAME: WrapperField = WrapperField("SBA_BiologicalMatrix", FieldType.SELECTION)
+    SBA_CONCENTRATIONUNITS__FIELD_NAME: WrapperField = WrapperField("SBA_ConcentrationUnits", FieldType.SELECTION)
+    SBA_CVOFLLOQSTD__FIELD_NAME: WrapperField = WrapperField("SBA_CVOfLLOQSTD", FieldType.DOUBLE)
+    SBA_CVOFQC__FIELD_NAME: WrapperField = WrapperField("SBA_CVOfQC", FieldType.DOUBLE)
+    SBA_CVOFSTD__FIELD_NAME: WrapperField = WrapperField("SBA_CVOfSTD", FieldType.DOUBLE)
+    SBA_CVOFUNKNOWNSAMPLE__FIELD_NAME: WrapperField = WrapperField("SBA_CVOfUnknownSample", FieldType.DOUBLE)
+    SBA_ISACTIVE__FIELD_NAME: WrapperField = WrapperField("SBA_IsActive", FieldType.BOOLEAN)
+    SBA_MASTERASSAYNAME__FIELD_NAME: WrapperField = WrapperField("SBA_MasterAssayName", FieldType.STRING)
+    SBA_MINISRPASSRATE__FIELD_NAME: WrapperField = WrapperField("SBA_MinIsrPassRate", FieldType.DOUBLE)
+    SBA_REQUIREDVALIDATIONPARAM__FIELD_NAME: WrapperField = WrapperField("SBA_RequiredValidationParam", FieldType.SELECTION)
+    SBA_RUNACCEPTANCECONFIG__FIELD_NAME: WrapperField = WrapperField("SBA_RunAcceptanceConfig", FieldType.SELECTION)
+    SBA_SPECIES__FIELD_NAME: WrapperField = WrapperField("SBA_Species", FieldType.SELECTION)
+
+    SBA_ApprovalDate: ModelField[Optional[int]] = ModelField("SBA_ApprovalDate", FieldType.DATE)
+    SBA_AssayComments: ModelField[Optional[str]] = ModelField("SBA_AssayComments", FieldType.STRING)
+    SBA_AssayDescription: ModelField[Optional[str]] = ModelField("SBA_AssayDescription", FieldType.STRING)
+    SBA_AssayId: ModelField[Optional[str]] = ModelField("SBA_AssayId", FieldType.AUTO_ACCESSION)
+    SBA_AssayInstrumentType: ModelField[Optional[str]] = ModelField("SBA_AssayInstrumentType", FieldType.SELECTION)
+    SBA_AssayMethodStatus: ModelField[Optional[str]] = ModelField("SBA_AssayMethodStatus", FieldType.PICKLIST)
+    SBA_AssayType: ModelField[Optional[str]] = ModelField("SBA_AssayType", FieldType.SELECTION)
+    SBA_BiologicalMatrix: ModelField[Optional[str]] = ModelField("SBA_BiologicalMatrix", FieldType.SELECTION)
+    SBA_ConcentrationUnits: ModelField[Optional[str]] = ModelField("SBA_ConcentrationUnits", FieldType.SELECTION)
+    SBA_CVOfLLOQSTD: ModelField[Optional[float]] = ModelField("SBA_CVOfLLOQSTD", FieldType.DOUBLE)
+    SBA_CVOfQC: ModelField[Optional[float]] = ModelField("SBA_CVOfQC", FieldType.DOUBLE)
+    SBA_CVOfSTD: ModelField[Optional[float]] = ModelField("SBA_CVOfSTD", FieldType.DOUBLE)
+    SBA_CVOfUnknownSample: ModelField[Optional[float]] = ModelField("SBA_CVOfUnknownSample", FieldType.DOUBLE)
+    SBA_IsActive: ModelField[Optional[bool]] = ModelField("SBA_IsActive", FieldType.BOOLEAN)
+    SBA_MasterAssayName: ModelField[Optional[str]] = ModelField("SBA_MasterAssayName", FieldType.STRING)
+    SBA_MinIsrPassRate: ModelField[Optional[float]] = ModelField("SBA_MinIsrPassRate", FieldType.DOUBLE)
+    SBA_RequiredValidationParam: ModelField[Optional[str]] = ModelField("SBA_RequiredValidationParam", FieldType.SELECTION)
+    SBA_RunAcceptanceConfig: ModelField[Optional[str]] = ModelField("SBA_RunAcceptanceConfig", FieldType.SELECTION)
+    SBA_Species: ModelField[Optional[str]] = ModelField("SBA_Species", FieldType.SELECTION)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
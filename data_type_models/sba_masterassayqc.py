@@ -0,0 +1,28 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class SBA_MasterAssayQCModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type SBA_MasterAssayQC
+    Data Type Display Name: QC (QCs)
+    Fields: SBA_DilutionFactor, SBA_FlagPctDiff, SBA_NumberOfReplicates, SBA_QcName, SBA_WellPositions
+    """
+    DATA_TYPE_NAME: str = 'SBA_MasterAssayQC'
+    SBA_DILUTIONFACTOR__FIELD_NAME: WrapperField = WrapperField("SBA_DilutionFactor", FieldType.DOUBLE)
+    SBA_FLAGPCTDIFF__FIELD_NAME: WrapperField = WrapperField("SBA_FlagPctDiff", FieldType.DOUBLE)
+    SBA_NUMBEROFREPLICATES__FIELD_NAME: WrapperField = WrapperField("SBA_NumberOfReplicates", FieldType.INTEGER)
+    SBA_QCNAME__FIELD_NAME: WrapperField = WrapperField("SBA_QcName", FieldType.STRING)
+    SBA_WELLPOSITIONS__FIELD_NAME: WrapperField = WrapperField("SBA_WellPositions", FieldType.STRING)
+
+    SBA_DilutionFactor: ModelField[Optional[float]] = ModelField("SBA_DilutionFactor", FieldType.DOUBLE)
+    SBA_FlagPctDiff: ModelField[Optional[float]] = ModelField("SBA_FlagPctDiff", FieldType.DOUBLE)
+    SBA_NumberOfReplicates: ModelField[Optional[int]] = ModelField("SBA_NumberOfReplicates", FieldType.INTEGER)
+    SBA_QcName: ModelField[Optional[str]] = ModelField("SBA_QcName", FieldType.STRING)
+    SBA_WellPositions: ModelField[Optional[str]] = ModelField("SBA_WellPositions", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
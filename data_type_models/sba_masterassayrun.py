@@ -0,0 +1,52 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class SBA_MasterAssayRunModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type SBA_MasterAssayRun
+    Data Type Display Name: Master Assay Run (Master Assay Runs)
+    Fields: SBA_AssayInstrumentType, SBA_AssayRunType, SBA_CompletedBy, SBA_DateCompleted, SBA_Description, SBA_Instrument, SBA_InstrumentOutputDataType, SBA_IsPlatingComplete, SBA_MaxQCCV, SBA_OverrideComment, SBA_ParameterName, SBA_RunId, SBA_RunResult, SBA_ValidatedBy, SBA_ValidationDate, SBA_ValidationParameter, SBA_ValidationResult
+    """
+    DATA_TYPE_NAME: str = 'SBA_MasterAssayRun'
+    SBA_ASSAYINSTRUMENTTYPE__FIELD_NAME: WrapperField = WrapperField("SBA_AssayInstrumentType", FieldType.SELECTION)
+    SBA_ASSAYRUNTYPE__FIELD_NAME: WrapperField = WrapperField("SBA_AssayRunType", FieldType.SELECTION)
+    SBA_COMPLETEDBY__FIELD_NAME: WrapperField = WrapperField("SBA_CompletedBy", FieldType.STRING)
+    SBA_DATECOMPLETED__FIELD_NAME: WrapperField = WrapperField("SBA_DateCompleted", FieldType.DATE)
+    SBA_DESCRIPTION__FIELD_NAME: WrapperField = WrapperField("SBA_Description", FieldType.STRING)
+    SBA_INSTRUMENT__FIELD_NAME: WrapperField = WrapperField("SBA_Instrument", FieldType.SELECTION)
+    SBA_INSTRUMENTOUTPUTDATATYPE__FIELD_NAME: WrapperField = WrapperField("SBA_InstrumentOutputDataType", FieldType.SELECTION)
+    SBA_ISPLATINGCOMPLETE__FIELD_NAME: WrapperField = WrapperField("SBA_IsPlatingComplete", FieldType.BOOLEAN)
+    SBA_MAXQCCV__FIELD_NAME: WrapperField = WrapperField("SBA_MaxQCCV", FieldType.DOUBLE)
+    SBA_OVERRIDECOMMENT__FIELD_NAME: WrapperField = WrapperField("SBA_OverrideComment", FieldType.STRING)
+    SBA_PARAMETERNAME__FIELD_NAME: WrapperField = WrapperField("SBA_ParameterName", FieldType.PICKLIST)
+    SBA_RUNID__FIELD_NAME: WrapperField = WrapperField("SBA_RunId", FieldType.AUTO_ACCESSION)
+    SBA_RUNRESULT__FIELD_NAME: WrapperField = WrapperField("SBA_RunResult", FieldType.PICKLIST)
+    SBA_VALIDATEDBY__FIELD_NAME: WrapperField = WrapperField("SBA_ValidatedBy", FieldType.STRING)
+    SBA_VALIDATIONDATE__FIELD_NAME: WrapperField = WrapperField("SBA_ValidationDate", FieldType.DATE)
+    SBA_VALIDATIONPARAMETER__FIELD_NAME: WrapperField = WrapperField("SBA_ValidationParameter", FieldType.SELECTION)
+    SBA_VALIDATIONRESULT__FIELD_NAME: WrapperField = WrapperField("SBA_ValidationResult", FieldType.PICKLIST)
+
+    SBA_AssayInstrumentType: ModelField[Optional[str]] = ModelField("SBA_AssayInstrumentType", FieldType.SELECTION)
+    SBA_AssayRunType: ModelField[Optional[str]] = ModelField("SBA_AssayRunType", FieldType.SELECTION)
+    SBA_CompletedBy: ModelField[Optional[str]] = ModelField("SBA_CompletedBy", FieldType.STRING)
+    SBA_DateCompleted: ModelField[Optional[int]] = ModelField("SBA_DateCompleted", FieldType.DATE)
+    SBA_Description: ModelField[Optional[str]] = ModelField("SBA_Description", FieldType.STRING)
+    SBA_Instrument: ModelField[Optional[str]] = ModelField("SBA_Instrument", FieldType.SELECTION)
+    SBA_InstrumentOutputDataType: ModelField[Optional[str]] = ModelField("SBA_InstrumentOutputDataType", FieldType.SELECTION)
+    SBA_IsPlatingComplete: ModelField[Optional[bool]] = ModelField("SBA_IsPlatingComplete", FieldType.BOOLEAN)
+    SBA_MaxQCCV: ModelField[Optional[float]] = ModelField("SBA_MaxQCCV", FieldType.DOUBLE)
+    SBA_OverrideComment: ModelField[Optional[str]] = ModelField("SBA_OverrideComment", FieldType.STRING)
+    SBA_ParameterName: ModelField[Optional[str]] = ModelField("SBA_ParameterName", FieldType.PICKLIST)
+    SBA_RunId: ModelField[Optional[str]] = ModelField("SBA_RunId", FieldType.AUTO_ACCESSION)
+    SBA_RunResult: ModelField[Optional[str]] = ModelField("SBA_RunResult", FieldType.PICKLIST)
+    SBA_ValidatedBy: ModelField[Optional[str]] = ModelField("SBA_ValidatedBy", FieldType.STRING)
+    SBA_ValidationDate: ModelField[Optional[int]] = ModelField("SBA_ValidationDate", FieldType.DATE)
+    SBA_ValidationParameter: ModelField[Optional[str]] = ModelField("SBA_ValidationParameter", FieldType.SELECTION)
+    SBA_ValidationResult: ModelField[Optional[str]] = ModelField("SBA_ValidationResult", FieldType.PICKLIST)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
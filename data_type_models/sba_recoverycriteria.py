@@ -0,0 +1,21 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class SBA_RecoveryCriteriaModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type SBA_RecoveryCriteria
+    Data Type Display Name: Recovery Criteria (Recovery Criteria)
+    Fields: SBA_MaxMinRecoveryDiffLimit
+    The RecoveryCriteria Data Type
+    """
+    DATA_TYPE_NAME: str = 'SBA_RecoveryCriteria'
+    SBA_MAXMINRECOVERYDIFFLIMIT__FIELD_NAME: WrapperField = WrapperField("SBA_MaxMinRecoveryDiffLimit", FieldType.DOUBLE)
+
+    SBA_MaxMinRecoveryDiffLimit: ModelField[Optional[float]] = ModelField("SBA_MaxMinRecoveryDiffLimit", FieldType.DOUBLE)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
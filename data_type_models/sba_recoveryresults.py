@@ -0,0 +1,21 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class SBA_RecoveryResultsModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type SBA_RecoveryResults
+    Data Type Display Name: Recovery Results (Recovery Results)
+    Fields: SBA_MaxMinRecoveryDiff
+    The SBA_RecoveryResults Data Type
+    """
+    DATA_TYPE_NAME: str = 'SBA_RecoveryResults'
+    SBA_MAXMINRECOVERYDIFF__FIELD_NAME: WrapperField = WrapperField("SBA_MaxMinRecoveryDiff", FieldType.DOUBLE)
+
+    SBA_MaxMinRecoveryDiff: ModelField[Optional[float]] = ModelField("SBA_MaxMinRecoveryDiff", FieldType.DOUBLE)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,22 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class SBA_RunAcceptanceConfigModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type SBA_RunAcceptanceConfig
+    Data Type Display Name: Run Acceptance Configuration (Run Acceptance Configurations)
+    Fields: SBA_ConfigurationName, SBA_Description
+    """
+    DATA_TYPE_NAME: str = 'SBA_RunAcceptanceConfig'
+    SBA_CONFIGURATIONNAME__FIELD_NAME: WrapperField = WrapperField("SBA_ConfigurationName", FieldType.STRING)
+    SBA_DESCRIPTION__FIELD_NAME: WrapperField = WrapperField("SBA_Description", FieldType.STRING)
+
+    SBA_ConfigurationName: ModelField[Optional[str]] = ModelField("SBA_ConfigurationName", FieldType.STRING)
+    SBA_Description: ModelField[Optional[str]] = ModelField("SBA_Description", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
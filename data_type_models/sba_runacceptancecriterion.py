@@ -0,0 +1,30 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class SBA_RunAcceptanceCriterionModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type SBA_RunAcceptanceCriterion
+    Data Type Display Name: Run Acceptance Criterion (Run Acceptance Criteria)
+    Fields: SBA_Description, SBA_IsYesNoOperator, SBA_Operator, SBA_ParameterName, SBA_Sequence, SBA_ThresholdValue
+    """
+    DATA_TYPE_NAME: str = 'SBA_RunAcceptanceCriterion'
+    SBA_DESCRIPTION__FIELD_NAME: WrapperField = WrapperField("SBA_Description", FieldType.STRING)
+    SBA_ISYESNOOPERATOR__FIELD_NAME: WrapperField = WrapperField("SBA_IsYesNoOperator", FieldType.BOOLEAN)
+    SBA_OPERATOR__FIELD_NAME: WrapperField = WrapperField("SBA_Operator", FieldType.PICKLIST)
+    SBA_PARAMETERNAME__FIELD_NAME: WrapperField = WrapperField("SBA_ParameterName", FieldType.PICKLIST)
+    SBA_SEQUENCE__FIELD_NAME: WrapperField = WrapperField("SBA_Sequence", FieldType.INTEGER)
+    SBA_THRESHOLDVALUE__FIELD_NAME: WrapperField = WrapperField("SBA_ThresholdValue", FieldType.DOUBLE)
+
+    SBA_Description: ModelField[Optional[str]] = ModelField("SBA_Description", FieldType.STRING)
+    SBA_IsYesNoOperator: ModelField[Optional[bool]] = ModelField("SBA_IsYesNoOperator", FieldType.BOOLEAN)
+    SBA_Operator: ModelField[Optional[str]] = ModelField("SBA_Operator", FieldType.PICKLIST)
+    SBA_ParameterName: ModelField[Optional[str]] = ModelField("SBA_ParameterName", FieldType.PICKLIST)
+    SBA_Sequence: ModelField[Optional[int]] = ModelField("SBA_Sequence", FieldType.INTEGER)
+    SBA_ThresholdValue: ModelField[Optional[float]] = ModelField("SBA_ThresholdValue", FieldType.DOUBLE)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
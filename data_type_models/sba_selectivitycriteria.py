@@ -0,0 +1,25 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class SBA_SelectivityCriteriaModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type SBA_SelectivityCriteria
+    Data Type Display Name: Selectivity Criteria (Selectivity Criteria)
+    Fields: SBA_MaxBlankISRatio, SBA_MaxBlankLLOQRatio, SBA_MinNumOfPassedSamples
+    The SelectivityCriteria Data Type
+    """
+    DATA_TYPE_NAME: str = 'SBA_SelectivityCriteria'
+    SBA_MAXBLANKISRATIO__FIELD_NAME: WrapperField = WrapperField("SBA_MaxBlankISRatio", FieldType.DOUBLE)
+    SBA_MAXBLANKLLOQRATIO__FIELD_NAME: WrapperField = WrapperField("SBA_MaxBlankLLOQRatio", FieldType.DOUBLE)
+    SBA_MINNUMOFPASSEDSAMPLES__FIELD_NAME: WrapperField = WrapperField("SBA_MinNumOfPassedSamples", FieldType.LONG)
+
+    SBA_MaxBlankISRatio: ModelField[Optional[float]] = ModelField("SBA_MaxBlankISRatio", FieldType.DOUBLE)
+    SBA_MaxBlankLLOQRatio: ModelField[Optional[float]] = ModelField("SBA_MaxBlankLLOQRatio", FieldType.DOUBLE)
+    SBA_MinNumOfPassedSamples: ModelField[Optional[int]] = ModelField("SBA_MinNumOfPassedSamples", FieldType.LONG)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,23 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class SBA_SelectivityResultsModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type SBA_SelectivityResults
+    Data Type Display Name: Selectivity Results (Selectivity Results)
+    Fields: SBA_NumPassedSamplesIS, SBA_NumPassedSamplesLLOQ
+    The SBA_SelectivityResults Data Type
+    """
+    DATA_TYPE_NAME: str = 'SBA_SelectivityResults'
+    SBA_NUMPASSEDSAMPLESIS__FIELD_NAME: WrapperField = WrapperField("SBA_NumPassedSamplesIS", FieldType.LONG)
+    SBA_NUMPASSEDSAMPLESLLOQ__FIELD_NAME: WrapperField = WrapperField("SBA_NumPassedSamplesLLOQ", FieldType.LONG)
+
+    SBA_NumPassedSamplesIS: ModelField[Optional[int]] = ModelField("SBA_NumPassedSamplesIS", FieldType.LONG)
+    SBA_NumPassedSamplesLLOQ: ModelField[Optional[int]] = ModelField("SBA_NumPassedSamplesLLOQ", FieldType.LONG)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,21 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class SBA_SensitivityCriteriaModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type SBA_SensitivityCriteria
+    Data Type Display Name: Sensitivity Criteria (Sensitivity Criteria)
+    Fields: SBA_MaxBias
+    The SensitivityCriteria Data Type
+    """
+    DATA_TYPE_NAME: str = 'SBA_SensitivityCriteria'
+    SBA_MAXBIAS__FIELD_NAME: WrapperField = WrapperField("SBA_MaxBias", FieldType.DOUBLE)
+
+    SBA_MaxBias: ModelField[Optional[float]] = ModelField("SBA_MaxBias", FieldType.DOUBLE)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
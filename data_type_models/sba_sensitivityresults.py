@@ -0,0 +1,21 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class SBA_SensitivityResultsModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type SBA_SensitivityResults
+    Data Type Display Name: Sensitivity Results (Sensitivity Results)
+    Fields: SBA_AllPassBiasCheck
+    The SBA_SensitivityResults Data Type
+    """
+    DATA_TYPE_NAME: str = 'SBA_SensitivityResults'
+    SBA_ALLPASSBIASCHECK__FIELD_NAME: WrapperField = WrapperField("SBA_AllPassBiasCheck", FieldType.BOOLEAN)
+
+    SBA_AllPassBiasCheck: ModelField[Optional[bool]] = ModelField("SBA_AllPassBiasCheck", FieldType.BOOLEAN)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,26 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class SCIEXResultModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type SCIEXResult
+    Data Type Display Name: SCIEX Result (SCIEX Results)
+    Fields: AnalytePeakArea, AnalytePeakName, CalculatedConcentration, ISPeakArea
+    """
+    DATA_TYPE_NAME: str = 'SCIEXResult'
+    ANALYTEPEAKAREA__FIELD_NAME: WrapperField = WrapperField("AnalytePeakArea", FieldType.DOUBLE)
+    ANALYTEPEAKNAME__FIELD_NAME: WrapperField = WrapperField("AnalytePeakName", FieldType.STRING)
+    CALCULATEDCONCENTRATION__FIELD_NAME: WrapperField = WrapperField("CalculatedConcentration", FieldType.DOUBLE)
+    ISPEAKAREA__FIELD_NAME: WrapperField = WrapperField("ISPeakArea", FieldType.DOUBLE)
+
+    AnalytePeakArea: ModelField[Optional[float]] = ModelField("AnalytePeakArea", FieldType.DOUBLE)
+    AnalytePeakName: ModelField[Optional[str]] = ModelField("AnalytePeakName", FieldType.STRING)
+    CalculatedConcentration: ModelField[Optional[float]] = ModelField("CalculatedConcentration", FieldType.DOUBLE)
+    ISPeakArea: ModelField[Optional[float]] = ModelField("ISPeakArea", FieldType.DOUBLE)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,24 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class SDMSSubfolderModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type SDMSSubfolder
+    Data Type Display Name: SDMS Subfolder (SDMS Subfolders)
+    Fields: Active, Folder, FolderExists
+    """
+    DATA_TYPE_NAME: str = 'SDMSSubfolder'
+    ACTIVE__FIELD_NAME: WrapperField = WrapperField("Active", FieldType.BOOLEAN)
+    FOLDER__FIELD_NAME: WrapperField = WrapperField("Folder", FieldType.STRING)
+    FOLDEREXISTS__FIELD_NAME: WrapperField = WrapperField("FolderExists", FieldType.BOOLEAN)
+
+    Active: ModelField[Optional[bool]] = ModelField("Active", FieldType.BOOLEAN)
+    Folder: ModelField[Optional[str]] = ModelField("Folder", FieldType.STRING)
+    FolderExists: ModelField[Optional[bool]] = ModelField("FolderExists", FieldType.BOOLEAN)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
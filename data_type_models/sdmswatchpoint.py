@@ -0,0 +1,34 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class SDMSWatchPointModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type SDMSWatchPoint
+    Data Type Display Name: SDMS Config (SDMS Configs)
+    Fields: FilePattern, FilterFilesByPattern, ScanFrequencyNumber, ScanFrequencyUnits, SubFolderPattern, SubFoldersScan, UniqueFileEnforcement, WatcherDirectory
+    """
+    DATA_TYPE_NAME: str = 'SDMSWatchPoint'
+    FILEPATTERN__FIELD_NAME: WrapperField = WrapperField("FilePattern", FieldType.STRING)
+    FILTERFILESBYPATTERN__FIELD_NAME: WrapperField = WrapperField("FilterFilesByPattern", FieldType.BOOLEAN)
+    SCANFREQUENCYNUMBER__FIELD_NAME: WrapperField = WrapperField("ScanFrequencyNumber", FieldType.INTEGER)
+    SCANFREQUENCYUNITS__FIELD_NAME: WrapperField = WrapperField("ScanFrequencyUnits", FieldType.SELECTION)
+    SUBFOLDERPATTERN__FIELD_NAME: WrapperField = WrapperField("SubFolderPattern", FieldType.STRING)
+    SUBFOLDERSSCAN__FIELD_NAME: WrapperField = WrapperField("SubFoldersScan", FieldType.SELECTION)
+    UNIQUEFILEENFORCEMENT__FIELD_NAME: WrapperField = WrapperField("UniqueFileEnforcement", FieldType.SELECTION)
+    WATCHERDIRECTORY__FIELD_NAME: WrapperField = WrapperField("WatcherDirectory", FieldType.STRING)
+
+    FilePattern: ModelField[Optional[str]] = ModelField("FilePattern", FieldType.STRING)
+    FilterFilesByPattern: ModelField[Optional[bool]] = ModelField("FilterFilesByPattern", FieldType.BOOLEAN)
+    ScanFrequencyNumber: ModelField[Optional[int]] = ModelField("ScanFrequencyNumber", FieldType.INTEGER)
+    ScanFrequencyUnits: ModelField[Optional[str]] = ModelField("ScanFrequencyUnits", FieldType.SELECTION)
+    SubFolderPattern: ModelField[Optional[str]] = ModelField("SubFolderPattern", FieldType.STRING)
+    SubFoldersScan: ModelField[Optional[str]] = ModelField("SubFoldersScan", FieldType.SELECTION)
+    UniqueFileEnforcement: ModelField[Optional[str]] = ModelField("UniqueFileEnforcement", FieldType.SELECTION)
+    WatcherDirectory: ModelField[Optional[str]] = ModelField("WatcherDirectory", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
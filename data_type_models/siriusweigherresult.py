@@ -0,0 +1,24 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class SiriusWeigherResultModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type SiriusWeigherResult
+    Data Type Display Name: Sirius Weigher Result (Sirius Weigher Results)
+    Fields: GrossWeight, NetWeight, TareWeight
+    """
+    DATA_TYPE_NAME: str = 'SiriusWeigherResult'
+    GROSSWEIGHT__FIELD_NAME: WrapperField = WrapperField("GrossWeight", FieldType.DOUBLE)
+    NETWEIGHT__FIELD_NAME: WrapperField = WrapperField("NetWeight", FieldType.DOUBLE)
+    TAREWEIGHT__FIELD_NAME: WrapperField = WrapperField("TareWeight", FieldType.DOUBLE)
+
+    GrossWeight: ModelField[Optional[float]] = ModelField("GrossWeight", FieldType.DOUBLE)
+    NetWeight: ModelField[Optional[float]] = ModelField("NetWeight", FieldType.DOUBLE)
+    TareWeight: ModelField[Optional[float]] = ModelField("TareWeight", FieldType.DOUBLE)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
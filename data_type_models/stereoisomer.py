@@ -0,0 +1,23 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class StereoisomerModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type Stereoisomer
+    Data Type Display Name: Stereoisomer (Stereoisomers)
+    Fields: MOL, SMILES
+    Possible stereoisomer of a parent compound.
+    """
+    DATA_TYPE_NAME: str = 'Stereoisomer'
+    MOL__FIELD_NAME: WrapperField = WrapperField("MOL", FieldType.STRING)
+    SMILES__FIELD_NAME: WrapperField = WrapperField("SMILES", FieldType.STRING)
+
+    MOL: ModelField[Optional[str]] = ModelField("MOL", FieldType.STRING)
+    SMILES: ModelField[Optional[str]] = ModelField("SMILES", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,24 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class StorageConfigurationModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type StorageConfiguration
+    Data Type Display Name: Storage Configuration (Storage Configurations)
+    Fields: StorableItemDataType, StorableItemScanMatchField, StorableItemStorageUnits
+    """
+    DATA_TYPE_NAME: str = 'StorageConfiguration'
+    STORABLEITEMDATATYPE__FIELD_NAME: WrapperField = WrapperField("StorableItemDataType", FieldType.SELECTION)
+    STORABLEITEMSCANMATCHFIELD__FIELD_NAME: WrapperField = WrapperField("StorableItemScanMatchField", FieldType.SELECTION)
+    STORABLEITEMSTORAGEUNITS__FIELD_NAME: WrapperField = WrapperField("StorableItemStorageUnits", FieldType.SELECTION)
+
+    StorableItemDataType: ModelField[Optional[str]] = ModelField("StorableItemDataType", FieldType.SELECTION)
+    StorableItemScanMatchField: ModelField[Optional[str]] = ModelField("StorableItemScanMatchField", FieldType.SELECTION)
+    StorableItemStorageUnits: ModelField[Optional[str]] = ModelField("StorableItemStorageUnits", FieldType.SELECTION)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,34 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class StorageEventModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type StorageEvent
+    Data Type Display Name: Storage Event (Storage Events)
+    Fields: DurationHours, DurationMinutes, EventDate, EventTime, EventType, StorageUnitId, StorageUnitPath, StorageUnitTemperature
+    """
+    DATA_TYPE_NAME: str = 'StorageEvent'
+    DURATIONHOURS__FIELD_NAME: WrapperField = WrapperField("DurationHours", FieldType.SHORT)
+    DURATIONMINUTES__FIELD_NAME: WrapperField = WrapperField("DurationMinutes", FieldType.SHORT)
+    EVENTDATE__FIELD_NAME: WrapperField = WrapperField("EventDate", FieldType.DATE)
+    EVENTTIME__FIELD_NAME: WrapperField = WrapperField("EventTime", FieldType.STRING)
+    EVENTTYPE__FIELD_NAME: WrapperField = WrapperField("EventType", FieldType.PICKLIST)
+    STORAGEUNITID__FIELD_NAME: WrapperField = WrapperField("StorageUnitId", FieldType.STRING)
+    STORAGEUNITPATH__FIELD_NAME: WrapperField = WrapperField("StorageUnitPath", FieldType.STRING)
+    STORAGEUNITTEMPERATURE__FIELD_NAME: WrapperField = WrapperField("StorageUnitTemperature", FieldType.DOUBLE)
+
+    DurationHours: ModelField[Optional[int]] = ModelField("DurationHours", FieldType.SHORT)
+    DurationMinutes: ModelField[Optional[int]] = ModelField("DurationMinutes", FieldType.SHORT)
+    EventDate: ModelField[Optional[int]] = ModelField("EventDate", FieldType.DATE)
+    EventTime: ModelField[Optional[str]] = ModelField("EventTime", FieldType.STRING)
+    EventType: ModelField[Optional[str]] = ModelField("EventType", FieldType.PICKLIST)
+    StorageUnitId: ModelField[Optional[str]] = ModelField("StorageUnitId", FieldType.STRING)
+    StorageUnitPath: ModelField[Optional[str]] = ModelField("StorageUnitPath", FieldType.STRING)
+    StorageUnitTemperature: ModelField[Optional[float]] = ModelField("StorageUnitTemperature", FieldType.DOUBLE)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,20 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class StorageHierarchyConfigModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type StorageHierarchyConfig
+    Data Type Display Name: Storage Hierarchy Configuration (Storage Hierarchy Configurations)
+    Fields: Hierarchy
+    """
+    DATA_TYPE_NAME: str = 'StorageHierarchyConfig'
+    HIERARCHY__FIELD_NAME: WrapperField = WrapperField("Hierarchy", FieldType.STRING)
+
+    Hierarchy: ModelField[Optional[str]] = ModelField("Hierarchy", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
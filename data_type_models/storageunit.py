@@ -0,0 +1,41 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class StorageUnitModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type StorageUnit
+    Data Type Display Name: Storage Unit (Storage Units)
+    Fields: ColPosition, Humidity, OccupiedCount, RecomputeOccupancy, RowPosition, StorageUnitCapacity, StorageUnitId, StorageUnitPath, StorageUnitType, Temperature, UnitColumns, UnitRows
+    """
+    DATA_TYPE_NAME: str = 'StorageUnit'
+    COLPOSITION__FIELD_NAME: WrapperField = WrapperField("ColPosition", FieldType.STRING)
+    HUMIDITY__FIELD_NAME: WrapperField = WrapperField("Humidity", FieldType.DOUBLE)
+    OCCUPIEDCOUNT__FIELD_NAME: WrapperField = WrapperField("OccupiedCount", FieldType.LONG)
+    RECOMPUTEOCCUPANCY__FIELD_NAME: WrapperField = WrapperField("RecomputeOccupancy", FieldType.ACTION)
+    ROWPOSITION__FIELD_NAME: WrapperField = WrapperField("RowPosition", FieldType.STRING)
+    STORAGEUNITCAPACITY__FIELD_NAME: WrapperField = WrapperField("StorageUnitCapacity", FieldType.LONG)
+    STORAGEUNITID__FIELD_NAME: WrapperField = WrapperField("StorageUnitId", FieldType.STRING)
+    STORAGEUNITPATH__FIELD_NAME: WrapperField = WrapperField("StorageUnitPath", FieldType.STRING)
+    STORAGEUNITTYPE__FIELD_NAME: WrapperField = WrapperField("StorageUnitType", FieldType.SELECTION)
+    TEMPERATURE__FIELD_NAME: WrapperField = WrapperField("Temperature", FieldType.DOUBLE)
+    UNITCOLUMNS__FIELD_NAME: WrapperField = WrapperField("UnitColumns", FieldType.LONG)
+    UNITROWS__FIELD_NAME: WrapperField = WrapperField("UnitRows", FieldType.LONG)
+
+    ColPosition: ModelField[Optional[str]] = ModelField("ColPosition", FieldType.STRING)
+    Humidity: ModelField[Optional[float]] = ModelField("Humidity", FieldType.DOUBLE)
+    OccupiedCount: ModelField[Optional[int]] = ModelField("OccupiedCount", FieldType.LONG)
+    RowPosition: ModelField[Optional[str]] = ModelField("RowPosition", FieldType.STRING)
+    StorageUnitCapacity: ModelField[Optional[int]] = ModelField("StorageUnitCapacity", FieldType.LONG)
+    StorageUnitId: ModelField[Optional[str]] = ModelField("StorageUnitId", FieldType.STRING)
+    StorageUnitPath: ModelField[Optional[str]] = ModelField("StorageUnitPath", FieldType.STRING)
+    StorageUnitType: ModelField[Optional[str]] = ModelField("StorageUnitType", FieldType.SELECTION)
+    Temperature: ModelField[Optional[float]] = ModelField("Temperature", FieldType.DOUBLE)
+    UnitColumns: ModelField[Optional[int]] = ModelField("UnitColumns", FieldType.LONG)
+    UnitRows: ModelField[Optional[int]] = ModelField("UnitRows", FieldType.LONG)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
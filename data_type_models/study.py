@@ -0,0 +1,45 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class StudyModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type Study
+    Data Type Display Name: Study (Studies)
+    Fields: BodyWeightWarningPercentage, Description, InheritRolesFromParent, InheritRolesFromProject, IsClinical, IsStudyTaskTypesCombined, IsVivariumSubjectTracking, MaxBodyWeightDosingTime, StudyId, StudyName, StudyStartDate, StudySubjectRandomizerConfig, StudyType
+    The Study Data Type
+    """
+    DATA_TYPE_NAME: str = 'Study'
+    BODYWEIGHTWARNINGPERCENTAGE__FIELD_NAME: WrapperField = WrapperField("BodyWeightWarningPercentage", FieldType.DOUBLE)
+    DESCRIPTION__FIELD_NAME: WrapperField = WrapperField("Description", FieldType.STRING)
+    INHERITROLESFROMPARENT__FIELD_NAME: WrapperField = WrapperField("InheritRolesFromParent", FieldType.BOOLEAN)
+    INHERITROLESFROMPROJECT__FIELD_NAME: WrapperField = WrapperField("InheritRolesFromProject", FieldType.BOOLEAN)
+    ISCLINICAL__FIELD_NAME: WrapperField = WrapperField("IsClinical", FieldType.BOOLEAN)
+    ISSTUDYTASKTYPESCOMBINED__FIELD_NAME: WrapperField = WrapperField("IsStudyTaskTypesCombined", FieldType.BOOLEAN)
+    ISVIVARIUMSUBJECTTRACKING__FIELD_NAME: WrapperField = WrapperField("IsVivariumSubjectTracking", FieldType.BOOLEAN)
+    MAXBODYWEIGHTDOSINGTIME__FIELD_NAME: WrapperField = WrapperField("MaxBodyWeightDosingTime", FieldType.INTEGER)
+    STUDYID__FIELD_NAME: WrapperField = WrapperField("StudyId", FieldType.AUTO_ACCESSION)
+    STUDYNAME__FIELD_NAME: WrapperField = WrapperField("StudyName", FieldType.STRING)
+    STUDYSTARTDATE__FIELD_NAME: WrapperField = WrapperField("StudyStartDate", FieldType.DATE)
+    STUDYSUBJECTRANDOMIZERCONFIG__FIELD_NAME: WrapperField = WrapperField("StudySubjectRandomizerConfig", FieldType.SELECTION)
+    STUDYTYPE__FIELD_NAME: WrapperField = WrapperField("StudyType", FieldType.PICKLIST)
+
+    BodyWeightWarningPercentage: ModelField[Optional[float]] = ModelField("BodyWeightWarningPercentage", FieldType.DOUBLE)
+    Description: ModelField[Optional[str]] = ModelField("Description", FieldType.STRING)
+    InheritRolesFromParent: ModelField[Optional[bool]] = ModelField("InheritRolesFromParent", FieldType.BOOLEAN)
+    InheritRolesFromProject: ModelField[Optional[bool]] = ModelField("InheritRolesFromProject", FieldType.BOOLEAN)
+    IsClinical: ModelField[Optional[bool]] = ModelField("IsClinical", FieldType.BOOLEAN)
+    IsStudyTaskTypesCombined: ModelField[Optional[bool]] = ModelField("IsStudyTaskTypesCombined", FieldType.BOOLEAN)
+    IsVivariumSubjectTracking: ModelField[Optional[bool]] = ModelField("IsVivariumSubjectTracking", FieldType.BOOLEAN)
+    MaxBodyWeightDosingTime: ModelField[Optional[int]] = ModelField("MaxBodyWeightDosingTime", FieldType.INTEGER)
+    StudyId: ModelField[Optional[str]] = ModelField("StudyId", FieldType.AUTO_ACCESSION)
+    StudyName: ModelField[Optional[str]] = ModelField("StudyName", FieldType.STRING)
+    StudyStartDate: ModelField[Optional[int]] = ModelField("StudyStartDate", FieldType.DATE)
+    StudySubjectRandomizerConfig: ModelField[Optional[str]] = ModelField("StudySubjectRandomizerConfig", FieldType.SELECTION)
+    StudyType: ModelField[Optional[str]] = ModelField("StudyType", FieldType.PICKLIST)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,22 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class StudyGroupModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type StudyGroup
+    Data Type Display Name: Study Group (Study Groups)
+    Fields: StudyGroupId, StudyGroupName
+    """
+    DATA_TYPE_NAME: str = 'StudyGroup'
+    STUDYGROUPID__FIELD_NAME: WrapperField = WrapperField("StudyGroupId", FieldType.INTEGER)
+    STUDYGROUPNAME__FIELD_NAME: WrapperField = WrapperField("StudyGroupName", FieldType.STRING)
+
+    StudyGroupId: ModelField[Optional[int]] = ModelField("StudyGroupId", FieldType.INTEGER)
+    StudyGroupName: ModelField[Optional[str]] = ModelField("StudyGroupName", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
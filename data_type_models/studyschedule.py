@@ -0,0 +1,39 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class StudyScheduleModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type StudySchedule
+    Data Type Display Name: Study Schedule (Study Schedules)
+    Fields: Assignee, Days, DayTimesToOmit, EditSchedule, NumberOfCycles, NumberOfDays, ScheduleDefinition, ScheduledItems, ScheduleStartDate, ScheduleType, Times
+    """
+    DATA_TYPE_NAME: str = 'StudySchedule'
+    ASSIGNEE__FIELD_NAME: WrapperField = WrapperField("Assignee", FieldType.SELECTION)
+    DAYS__FIELD_NAME: WrapperField = WrapperField("Days", FieldType.STRING)
+    DAYTIMESTOOMIT__FIELD_NAME: WrapperField = WrapperField("DayTimesToOmit", FieldType.STRING)
+    EDITSCHEDULE__FIELD_NAME: WrapperField = WrapperField("EditSchedule", FieldType.ACTION)
+    NUMBEROFCYCLES__FIELD_NAME: WrapperField = WrapperField("NumberOfCycles", FieldType.INTEGER)
+    NUMBEROFDAYS__FIELD_NAME: WrapperField = WrapperField("NumberOfDays", FieldType.INTEGER)
+    SCHEDULEDEFINITION__FIELD_NAME: WrapperField = WrapperField("ScheduleDefinition", FieldType.SELECTION)
+    SCHEDULEDITEMS__FIELD_NAME: WrapperField = WrapperField("ScheduledItems", FieldType.SELECTION)
+    SCHEDULESTARTDATE__FIELD_NAME: WrapperField = WrapperField("ScheduleStartDate", FieldType.DATE)
+    SCHEDULETYPE__FIELD_NAME: WrapperField = WrapperField("ScheduleType", FieldType.PICKLIST)
+    TIMES__FIELD_NAME: WrapperField = WrapperField("Times", FieldType.STRING)
+
+    Assignee: ModelField[Optional[str]] = ModelField("Assignee", FieldType.SELECTION)
+    Days: ModelField[Optional[str]] = ModelField("Days", FieldType.STRING)
+    DayTimesToOmit: ModelField[Optional[str]] = ModelField("DayTimesToOmit", FieldType.STRING)
+    NumberOfCycles: ModelField[Optional[int]] = ModelField("NumberOfCycles", FieldType.INTEGER)
+    NumberOfDays: ModelField[Optional[int]] = ModelField("NumberOfDays", FieldType.INTEGER)
+    ScheduleDefinition: ModelField[Optional[str]] = ModelField("ScheduleDefinition", FieldType.SELECTION)
+    ScheduledItems: ModelField[Optional[str]] = ModelField("ScheduledItems", FieldType.SELECTION)
+    ScheduleStartDate: ModelField[Optional[int]] = ModelField("ScheduleStartDate", FieldType.DATE)
+    ScheduleType: ModelField[Optional[str]] = ModelField("ScheduleType", FieldType.PICKLIST)
+    Times: ModelField[Optional[str]] = ModelField("Times", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,30 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class StudyScheduleDefinitionModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type StudyScheduleDefinition
+    Data Type Display Name: Study Schedule Definition (Study Schedule Definitions)
+    Fields: Days, DayTimesToOmit, NumberOfDays, ScheduleDescription, ScheduleName, Times
+    """
+    DATA_TYPE_NAME: str = 'StudyScheduleDefinition'
+    DAYS__FIELD_NAME: WrapperField = WrapperField("Days", FieldType.STRING)
+    DAYTIMESTOOMIT__FIELD_NAME: WrapperField = WrapperField("DayTimesToOmit", FieldType.STRING)
+    NUMBEROFDAYS__FIELD_NAME: WrapperField = WrapperField("NumberOfDays", FieldType.INTEGER)
+    SCHEDULEDESCRIPTION__FIELD_NAME: WrapperField = WrapperField("ScheduleDescription", FieldType.STRING)
+    SCHEDULENAME__FIELD_NAME: WrapperField = WrapperField("ScheduleName", FieldType.STRING)
+    TIMES__FIELD_NAME: WrapperField = WrapperField("Times", FieldType.STRING)
+
+    Days: ModelField[Optional[str]] = ModelField("Days", FieldType.STRING)
+    DayTimesToOmit: ModelField[Optional[str]] = ModelField("DayTimesToOmit", FieldType.STRING)
+    NumberOfDays: ModelField[Optional[int]] = ModelField("NumberOfDays", FieldType.INTEGER)
+    ScheduleDescription: ModelField[Optional[str]] = ModelField("ScheduleDescription", FieldType.STRING)
+    ScheduleName: ModelField[Optional[str]] = ModelField("ScheduleName", FieldType.STRING)
+    Times: ModelField[Optional[str]] = ModelField("Times", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,34 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class StudySubjectModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type StudySubject
+    Data Type Display Name: Study Subject (Study Subjects)
+    Fields: Gender, GroupId, MultiParentLink449, MultiParentLink450, Species, StudyGroup, StudySubjectID, Subject, SubjectStatus
+    """
+    DATA_TYPE_NAME: str = 'StudySubject'
+    GENDER__FIELD_NAME: WrapperField = WrapperField("Gender", FieldType.SELECTION)
+    GROUPID__FIELD_NAME: WrapperField = WrapperField("GroupId", FieldType.INTEGER)
+    MULTIPARENTLINK449__FIELD_NAME: WrapperField = WrapperField("MultiParentLink449", FieldType.MULTIPARENTLINK)
+    MULTIPARENTLINK450__FIELD_NAME: WrapperField = WrapperField("MultiParentLink450", FieldType.MULTIPARENTLINK)
+    SPECIES__FIELD_NAME: WrapperField = WrapperField("Species", FieldType.PICKLIST)
+    STUDYGROUP__FIELD_NAME: WrapperField = WrapperField("StudyGroup", FieldType.SIDE_LINK)
+    STUDYSUBJECTID__FIELD_NAME: WrapperField = WrapperField("StudySubjectID", FieldType.STRING)
+    SUBJECT__FIELD_NAME: WrapperField = WrapperField("Subject", FieldType.SIDE_LINK)
+    SUBJECTSTATUS__FIELD_NAME: WrapperField = WrapperField("SubjectStatus", FieldType.PICKLIST)
+
+    Gender: ModelField[Optional[str]] = ModelField("Gender", FieldType.SELECTION)
+    GroupId: ModelField[Optional[int]] = ModelField("GroupId", FieldType.INTEGER)
+    Species: ModelField[Optional[str]] = ModelField("Species", FieldType.PICKLIST)
+    StudyGroup: ModelField[Optional[int]] = ModelField("StudyGroup", FieldType.SIDE_LINK)
+    StudySubjectID: ModelField[Optional[str]] = ModelField("StudySubjectID", FieldType.STRING)
+    Subject: ModelField[Optional[int]] = ModelField("Subject", FieldType.SIDE_LINK)
+    SubjectStatus: ModelField[Optional[str]] = ModelField("SubjectStatus", FieldType.PICKLIST)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
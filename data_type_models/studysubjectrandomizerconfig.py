@@ -0,0 +1,22 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class StudySubjectRandomizerConfigModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type StudySubjectRandomizerConfig
+    Data Type Display Name: Study Subject Randomizer Configuration (Study Subject Randomizer Configurations)
+    Fields: RandomizerDisplayName, RandomizerPluginPath
+    """
+    DATA_TYPE_NAME: str = 'StudySubjectRandomizerConfig'
+    RANDOMIZERDISPLAYNAME__FIELD_NAME: WrapperField = WrapperField("RandomizerDisplayName", FieldType.STRING)
+    RANDOMIZERPLUGINPATH__FIELD_NAME: WrapperField = WrapperField("RandomizerPluginPath", FieldType.STRING)
+
+    RandomizerDisplayName: ModelField[Optional[str]] = ModelField("RandomizerDisplayName", FieldType.STRING)
+    RandomizerPluginPath: ModelField[Optional[str]] = ModelField("RandomizerPluginPath", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
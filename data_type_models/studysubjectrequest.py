@@ -0,0 +1,29 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class StudySubjectRequestModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type StudySubjectRequest
+    Data Type Display Name: Study Subject Request (Study Subject Requests)
+    Fields: Gender, LaunchSubjectRegistration, NumberOfSubjects, Species, Strain, SubjectCondition
+    """
+    DATA_TYPE_NAME: str = 'StudySubjectRequest'
+    GENDER__FIELD_NAME: WrapperField = WrapperField("Gender", FieldType.SELECTION)
+    LAUNCHSUBJECTREGISTRATION__FIELD_NAME: WrapperField = WrapperField("LaunchSubjectRegistration", FieldType.ACTION)
+    NUMBEROFSUBJECTS__FIELD_NAME: WrapperField = WrapperField("NumberOfSubjects", FieldType.INTEGER)
+    SPECIES__FIELD_NAME: WrapperField = WrapperField("Species", FieldType.PICKLIST)
+    STRAIN__FIELD_NAME: WrapperField = WrapperField("Strain", FieldType.SELECTION)
+    SUBJECTCONDITION__FIELD_NAME: WrapperField = WrapperField("SubjectCondition", FieldType.SELECTION)
+
+    Gender: ModelField[Optional[str]] = ModelField("Gender", FieldType.SELECTION)
+    NumberOfSubjects: ModelField[Optional[int]] = ModelField("NumberOfSubjects", FieldType.INTEGER)
+    Species: ModelField[Optional[str]] = ModelField("Species", FieldType.PICKLIST)
+    Strain: ModelField[Optional[str]] = ModelField("Strain", FieldType.SELECTION)
+    SubjectCondition: ModelField[Optional[str]] = ModelField("SubjectCondition", FieldType.SELECTION)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
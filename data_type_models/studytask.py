@@ -0,0 +1,48 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class StudyTaskModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type StudyTask
+    Data Type Display Name: Study Task (Study Tasks)
+    Fields: Assignee, BiologicalMatrix, DosingAgent, MeasurementScheduleRecordId, ObservationType, SamplingScheduleRecordId, SamplingSplitNumber, ScheduleDate, ScheduleEndDate, StudyId, StudySchedule, TaskStatus, TaskType, TreatmentRecordId, TreatmentScheduleRecordId
+    """
+    DATA_TYPE_NAME: str = 'StudyTask'
+    ASSIGNEE__FIELD_NAME: WrapperField = WrapperField("Assignee", FieldType.SELECTION)
+    BIOLOGICALMATRIX__FIELD_NAME: WrapperField = WrapperField("BiologicalMatrix", FieldType.SELECTION)
+    DOSINGAGENT__FIELD_NAME: WrapperField = WrapperField("DosingAgent", FieldType.SELECTION)
+    MEASUREMENTSCHEDULERECORDID__FIELD_NAME: WrapperField = WrapperField("MeasurementScheduleRecordId", FieldType.SIDE_LINK)
+    OBSERVATIONTYPE__FIELD_NAME: WrapperField = WrapperField("ObservationType", FieldType.SELECTION)
+    SAMPLINGSCHEDULERECORDID__FIELD_NAME: WrapperField = WrapperField("SamplingScheduleRecordId", FieldType.SIDE_LINK)
+    SAMPLINGSPLITNUMBER__FIELD_NAME: WrapperField = WrapperField("SamplingSplitNumber", FieldType.INTEGER)
+    SCHEDULEDATE__FIELD_NAME: WrapperField = WrapperField("ScheduleDate", FieldType.DATE)
+    SCHEDULEENDDATE__FIELD_NAME: WrapperField = WrapperField("ScheduleEndDate", FieldType.DATE)
+    STUDYID__FIELD_NAME: WrapperField = WrapperField("StudyId", FieldType.STRING)
+    STUDYSCHEDULE__FIELD_NAME: WrapperField = WrapperField("StudySchedule", FieldType.SIDE_LINK)
+    TASKSTATUS__FIELD_NAME: WrapperField = WrapperField("TaskStatus", FieldType.SELECTION)
+    TASKTYPE__FIELD_NAME: WrapperField = WrapperField("TaskType", FieldType.SELECTION)
+    TREATMENTRECORDID__FIELD_NAME: WrapperField = WrapperField("TreatmentRecordId", FieldType.SIDE_LINK)
+    TREATMENTSCHEDULERECORDID__FIELD_NAME: WrapperField = WrapperField("TreatmentScheduleRecordId", FieldType.SIDE_LINK)
+
+    Assignee: ModelField[Optional[str]] = ModelField("Assignee", FieldType.SELECTION)
+    BiologicalMatrix: ModelField[Optional[str]] = ModelField("BiologicalMatrix", FieldType.SELECTION)
+    DosingAgent: ModelField[Optional[str]] = ModelField("DosingAgent", FieldType.SELECTION)
+    MeasurementScheduleRecordId: ModelField[Optional[int]] = ModelField("MeasurementScheduleRecordId", FieldType.SIDE_LINK)
+    ObservationType: ModelField[Optional[str]] = ModelField("ObservationType", FieldType.SELECTION)
+    SamplingScheduleRecordId: ModelField[Optional[int]] = ModelField("SamplingScheduleRecordId", FieldType.SIDE_LINK)
+    SamplingSplitNumber: ModelField[Optional[int]] = ModelField("SamplingSplitNumber", FieldType.INTEGER)
+    ScheduleDate: ModelField[Optional[int]] = ModelField("ScheduleDate", FieldType.DATE)
+    ScheduleEndDate: ModelField[Optional[int]] = ModelField("ScheduleEndDate", FieldType.DATE)
+    StudyId: ModelField[Optional[str]] = ModelField("StudyId", FieldType.STRING)
+    StudySchedule: ModelField[Optional[int]] = ModelField("StudySchedule", FieldType.SIDE_LINK)
+    TaskStatus: ModelField[Optional[str]] = ModelField("TaskStatus", FieldType.SELECTION)
+    TaskType: ModelField[Optional[str]] = ModelField("TaskType", FieldType.SELECTION)
+    TreatmentRecordId: ModelField[Optional[int]] = ModelField("TreatmentRecordId", FieldType.SIDE_LINK)
+    TreatmentScheduleRecordId: ModelField[Optional[int]] = ModelField("TreatmentScheduleRecordId", FieldType.SIDE_LINK)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,34 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class StudyTaskGroupModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type StudyTaskGroup
+    Data Type Display Name: Study Task Group (Study Task Groups)
+    Fields: Assignee, Description, FormattedScheduleDate, ScheduleDate, ScheduleEndDate, StudyId, TaskStatus, TaskType
+    """
+    DATA_TYPE_NAME: str = 'StudyTaskGroup'
+    ASSIGNEE__FIELD_NAME: WrapperField = WrapperField("Assignee", FieldType.SELECTION)
+    DESCRIPTION__FIELD_NAME: WrapperField = WrapperField("Description", FieldType.STRING)
+    FORMATTEDSCHEDULEDATE__FIELD_NAME: WrapperField = WrapperField("FormattedScheduleDate", FieldType.STRING)
+    SCHEDULEDATE__FIELD_NAME: WrapperField = WrapperField("ScheduleDate", FieldType.DATE)
+    SCHEDULEENDDATE__FIELD_NAME: WrapperField = WrapperField("ScheduleEndDate", FieldType.DATE)
+    STUDYID__FIELD_NAME: WrapperField = WrapperField("StudyId", FieldType.STRING)
+    TASKSTATUS__FIELD_NAME: WrapperField = WrapperField("TaskStatus", FieldType.SELECTION)
+    TASKTYPE__FIELD_NAME: WrapperField = WrapperField("TaskType", FieldType.SELECTION)
+
+    Assignee: ModelField[Optional[str]] = ModelField("Assignee", FieldType.SELECTION)
+    Description: ModelField[Optional[str]] = ModelField("Description", FieldType.STRING)
+    FormattedScheduleDate: ModelField[Optional[str]] = ModelField("FormattedScheduleDate", FieldType.STRING)
+    ScheduleDate: ModelField[Optional[int]] = ModelField("ScheduleDate", FieldType.DATE)
+    ScheduleEndDate: ModelField[Optional[int]] = ModelField("ScheduleEndDate", FieldType.DATE)
+    StudyId: ModelField[Optional[str]] = ModelField("StudyId", FieldType.STRING)
+    TaskStatus: ModelField[Optional[str]] = ModelField("TaskStatus", FieldType.SELECTION)
+    TaskType: ModelField[Optional[str]] = ModelField("TaskType", FieldType.SELECTION)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,24 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class StudyTaskObservationModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type StudyTaskObservation
+    Data Type Display Name: Study Task Observation (Study Task Observations)
+    Fields: DateCompleted, SkipTaskReason, StudyRecordId
+    """
+    DATA_TYPE_NAME: str = 'StudyTaskObservation'
+    DATECOMPLETED__FIELD_NAME: WrapperField = WrapperField("DateCompleted", FieldType.DATE)
+    SKIPTASKREASON__FIELD_NAME: WrapperField = WrapperField("SkipTaskReason", FieldType.STRING)
+    STUDYRECORDID__FIELD_NAME: WrapperField = WrapperField("StudyRecordId", FieldType.LONG)
+
+    DateCompleted: ModelField[Optional[int]] = ModelField("DateCompleted", FieldType.DATE)
+    SkipTaskReason: ModelField[Optional[str]] = ModelField("SkipTaskReason", FieldType.STRING)
+    StudyRecordId: ModelField[Optional[int]] = ModelField("StudyRecordId", FieldType.LONG)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,57 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class SubjectModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type Subject
+    Data Type Display Name: Subject (Subjects)
+    Fields: Age, BodyMass, BodyMassUnits, ColPosition, DateOfBirth, Gender, Height, MultiParentLink450, RowPosition, Site, Species, StorageLocationBarcode, StorageUnitPath, Strain, SubjectCondition, SubjectId, SubjectName, SubjectStatus, Vendor, Weight
+    """
+    DATA_TYPE_NAME: str = 'Subject'
+    AGE__FIELD_NAME: WrapperField = WrapperField("Age", FieldType.DOUBLE)
+    BODYMASS__FIELD_NAME: WrapperField = WrapperField("BodyMass", FieldType.DOUBLE)
+    BODYMASSUNITS__FIELD_NAME: WrapperField = WrapperField("BodyMassUnits", FieldType.PICKLIST)
+    COLPOSITION__FIELD_NAME: WrapperField = WrapperField("ColPosition", FieldType.SELECTION)
+    DATEOFBIRTH__FIELD_NAME: WrapperField = WrapperField("DateOfBirth", FieldType.DATE)
+    GENDER__FIELD_NAME: WrapperField = WrapperField("Gender", FieldType.SELECTION)
+    HEIGHT__FIELD_NAME: WrapperField = WrapperField("Height", FieldType.DOUBLE)
+    MULTIPARENTLINK450__FIELD_NAME: WrapperField = WrapperField("MultiParentLink450", FieldType.MULTIPARENTLINK)
+    ROWPOSITION__FIELD_NAME: WrapperField = WrapperField("RowPosition", FieldType.SELECTION)
+    SITE__FIELD_NAME: WrapperField = WrapperField("Site", FieldType.PICKLIST)
+    SPECIES__FIELD_NAME: WrapperField = WrapperField("Species", FieldType.PICKLIST)
+    STORAGELOCATIONBARCODE__FIELD_NAME: WrapperField = WrapperField("StorageLocationBarcode", FieldType.SELECTION)
+    STORAGEUNITPATH__FIELD_NAME: WrapperField = WrapperField("StorageUnitPath", FieldType.STRING)
+    STRAIN__FIELD_NAME: WrapperField = WrapperField("Strain", FieldType.SELECTION)
+    SUBJECTCONDITION__FIELD_NAME: WrapperField = WrapperField("SubjectCondition", FieldType.SELECTION)
+    SUBJECTID__FIELD_NAME: WrapperField = WrapperField("SubjectId", FieldType.AUTO_ACCESSION)
+    SUBJECTNAME__FIELD_NAME: WrapperField = WrapperField("SubjectName", FieldType.STRING)
+    SUBJECTSTATUS__FIELD_NAME: WrapperField = WrapperField("SubjectStatus", FieldType.PICKLIST)
+    VENDOR__FIELD_NAME: WrapperField = WrapperField("Vendor", FieldType.STRING)
+    WEIGHT__FIELD_NAME: WrapperField = WrapperField("Weight", FieldType.DOUBLE)
+
+    Age: ModelField[Optional[float]] = ModelField("Age", FieldType.DOUBLE)
+    BodyMass: ModelField[Optional[float]] = ModelField("BodyMass", FieldType.DOUBLE)
+    BodyMassUnits: ModelField[Optional[str]] = ModelField("BodyMassUnits", FieldType.PICKLIST)
+    ColPosition: ModelField[Optional[str]] = ModelField("ColPosition", FieldType.SELECTION)
+    DateOfBirth: ModelField[Optional[int]] = ModelField("DateOfBirth", FieldType.DATE)
+    Gender: ModelField[Optional[str]] = ModelField("Gender", FieldType.SELECTION)
+    Height: ModelField[Optional[float]] = ModelField("Height", FieldType.DOUBLE)
+    RowPosition: ModelField[Optional[str]] = ModelField("RowPosition", FieldType.SELECTION)
+    Site: ModelField[Optional[str]] = ModelField("Site", FieldType.PICKLIST)
+    Species: ModelField[Optional[str]] = ModelField("Species", FieldType.PICKLIST)
+    StorageLocationBarcode: ModelField[Optional[str]] = ModelField("StorageLocationBarcode", FieldType.SELECTION)
+    StorageUnitPath: ModelField[Optional[str]] = ModelField("StorageUnitPath", FieldType.STRING)
+    Strain: ModelField[Optional[str]] = ModelField("Strain", FieldType.SELECTION)
+    SubjectCondition: ModelField[Optional[str]] = ModelField("SubjectCondition", FieldType.SELECTION)
+    SubjectId: ModelField[Optional[str]] = ModelField("SubjectId", FieldType.AUTO_ACCESSION)
+    SubjectName: ModelField[Optional[str]] = ModelField("SubjectName", FieldType.STRING)
+    SubjectStatus: ModelField[Optional[str]] = ModelField("SubjectStatus", FieldType.PICKLIST)
+    Vendor: ModelField[Optional[str]] = ModelField("Vendor", FieldType.STRING)
+    Weight: ModelField[Optional[float]] = ModelField("Weight", FieldType.DOUBLE)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
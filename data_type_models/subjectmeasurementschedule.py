@@ -0,0 +1,30 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class SubjectMeasurementScheduleModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type SubjectMeasurementSchedule
+    Data Type Display Name: Subject Observation Schedule (Subject Observation Schedules)
+    Fields: GroupId, IsPredose, MeasurementType, MeasuringMilliseconds, TimepointDuration, UnitsOfMeasure
+    """
+    DATA_TYPE_NAME: str = 'SubjectMeasurementSchedule'
+    GROUPID__FIELD_NAME: WrapperField = WrapperField("GroupId", FieldType.INTEGER)
+    ISPREDOSE__FIELD_NAME: WrapperField = WrapperField("IsPredose", FieldType.BOOLEAN)
+    MEASUREMENTTYPE__FIELD_NAME: WrapperField = WrapperField("MeasurementType", FieldType.SELECTION)
+    MEASURINGMILLISECONDS__FIELD_NAME: WrapperField = WrapperField("MeasuringMilliseconds", FieldType.LONG)
+    TIMEPOINTDURATION__FIELD_NAME: WrapperField = WrapperField("TimepointDuration", FieldType.DATE)
+    UNITSOFMEASURE__FIELD_NAME: WrapperField = WrapperField("UnitsOfMeasure", FieldType.PICKLIST)
+
+    GroupId: ModelField[Optional[int]] = ModelField("GroupId", FieldType.INTEGER)
+    IsPredose: ModelField[Optional[bool]] = ModelField("IsPredose", FieldType.BOOLEAN)
+    MeasurementType: ModelField[Optional[str]] = ModelField("MeasurementType", FieldType.SELECTION)
+    MeasuringMilliseconds: ModelField[Optional[int]] = ModelField("MeasuringMilliseconds", FieldType.LONG)
+    TimepointDuration: ModelField[Optional[int]] = ModelField("TimepointDuration", FieldType.DATE)
+    UnitsOfMeasure: ModelField[Optional[str]] = ModelField("UnitsOfMeasure", FieldType.PICKLIST)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
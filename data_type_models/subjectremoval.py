@@ -0,0 +1,22 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class SubjectRemovalModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type SubjectRemoval
+    Data Type Display Name: Subject Removal (Subject Removals)
+    Fields: RemovalComments, RemovalReason
+    """
+    DATA_TYPE_NAME: str = 'SubjectRemoval'
+    REMOVALCOMMENTS__FIELD_NAME: WrapperField = WrapperField("RemovalComments", FieldType.STRING)
+    REMOVALREASON__FIELD_NAME: WrapperField = WrapperField("RemovalReason", FieldType.PICKLIST)
+
+    RemovalComments: ModelField[Optional[str]] = ModelField("RemovalComments", FieldType.STRING)
+    RemovalReason: ModelField[Optional[str]] = ModelField("RemovalReason", FieldType.PICKLIST)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
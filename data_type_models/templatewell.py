@@ -0,0 +1,20 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class TemplateWellModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type TemplateWell
+    Data Type Display Name: Template Plate Well (Template Plate Wells)
+    Fields: WellPosition
+    """
+    DATA_TYPE_NAME: str = 'TemplateWell'
+    WELLPOSITION__FIELD_NAME: WrapperField = WrapperField("WellPosition", FieldType.STRING)
+
+    WellPosition: ModelField[Optional[str]] = ModelField("WellPosition", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
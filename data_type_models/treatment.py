@@ -0,0 +1,34 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class TreatmentModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type Treatment
+    Data Type Display Name: Treatment (Treatments)
+    Fields: DoseAmounts, DoseType, DoseUnit, Formulation, IsControlGroup, RouteOfAdministration, TreatmentId, TreatmentName
+    """
+    DATA_TYPE_NAME: str = 'Treatment'
+    DOSEAMOUNTS__FIELD_NAME: WrapperField = WrapperField("DoseAmounts", FieldType.DOUBLE)
+    DOSETYPE__FIELD_NAME: WrapperField = WrapperField("DoseType", FieldType.PICKLIST)
+    DOSEUNIT__FIELD_NAME: WrapperField = WrapperField("DoseUnit", FieldType.SELECTION)
+    FORMULATION__FIELD_NAME: WrapperField = WrapperField("Formulation", FieldType.SELECTION)
+    ISCONTROLGROUP__FIELD_NAME: WrapperField = WrapperField("IsControlGroup", FieldType.BOOLEAN)
+    ROUTEOFADMINISTRATION__FIELD_NAME: WrapperField = WrapperField("RouteOfAdministration", FieldType.SELECTION)
+    TREATMENTID__FIELD_NAME: WrapperField = WrapperField("TreatmentId", FieldType.STRING)
+    TREATMENTNAME__FIELD_NAME: WrapperField = WrapperField("TreatmentName", FieldType.STRING)
+
+    DoseAmounts: ModelField[Optional[float]] = ModelField("DoseAmounts", FieldType.DOUBLE)
+    DoseType: ModelField[Optional[str]] = ModelField("DoseType", FieldType.PICKLIST)
+    DoseUnit: ModelField[Optional[str]] = ModelField("DoseUnit", FieldType.SELECTION)
+    Formulation: ModelField[Optional[str]] = ModelField("Formulation", FieldType.SELECTION)
+    IsControlGroup: ModelField[Optional[bool]] = ModelField("IsControlGroup", FieldType.BOOLEAN)
+    RouteOfAdministration: ModelField[Optional[str]] = ModelField("RouteOfAdministration", FieldType.SELECTION)
+    TreatmentId: ModelField[Optional[str]] = ModelField("TreatmentId", FieldType.STRING)
+    TreatmentName: ModelField[Optional[str]] = ModelField("TreatmentName", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,23 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class TreatmentScheduleModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type TreatmentSchedule
+    Data Type Display Name: Treatment Schedule (Treatment Schedules)
+    Fields: MultiParentLink441, TreatmentMilliseconds, TreatmentTimeType
+    """
+    DATA_TYPE_NAME: str = 'TreatmentSchedule'
+    MULTIPARENTLINK441__FIELD_NAME: WrapperField = WrapperField("MultiParentLink441", FieldType.MULTIPARENTLINK)
+    TREATMENTMILLISECONDS__FIELD_NAME: WrapperField = WrapperField("TreatmentMilliseconds", FieldType.LONG)
+    TREATMENTTIMETYPE__FIELD_NAME: WrapperField = WrapperField("TreatmentTimeType", FieldType.PICKLIST)
+
+    TreatmentMilliseconds: ModelField[Optional[int]] = ModelField("TreatmentMilliseconds", FieldType.LONG)
+    TreatmentTimeType: ModelField[Optional[str]] = ModelField("TreatmentTimeType", FieldType.PICKLIST)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,41 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class VeloxAppRecordModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type VeloxAppRecord
+    Data Type Display Name: Organization Details (Organization Details)
+    Fields: Address1, Address2, City, CompanyDescription, CompanyName, CompanyWebsite, Country, PostalCode, Region, State, VeloxPublicUrl
+    This data type includes exactly one data record about the application's info.This data type is protected. Only system admins and portal admins can modify. This datatype cannot have any parents.
+    """
+    DATA_TYPE_NAME: str = 'VeloxAppRecord'
+    ADDRESS1__FIELD_NAME: WrapperField = WrapperField("Address1", FieldType.STRING)
+    ADDRESS2__FIELD_NAME: WrapperField = WrapperField("Address2", FieldType.STRING)
+    CITY__FIELD_NAME: WrapperField = WrapperField("City", FieldType.STRING)
+    COMPANYDESCRIPTION__FIELD_NAME: WrapperField = WrapperField("CompanyDescription", FieldType.STRING)
+    COMPANYNAME__FIELD_NAME: WrapperField = WrapperField("CompanyName", FieldType.STRING)
+    COMPANYWEBSITE__FIELD_NAME: WrapperField = WrapperField("CompanyWebsite", FieldType.STRING)
+    COUNTRY__FIELD_NAME: WrapperField = WrapperField("Country", FieldType.STRING)
+    POSTALCODE__FIELD_NAME: WrapperField = WrapperField("PostalCode", FieldType.STRING)
+    REGION__FIELD_NAME: WrapperField = WrapperField("Region", FieldType.STRING)
+    STATE__FIELD_NAME: WrapperField = WrapperField("State", FieldType.STRING)
+    VELOXPUBLICURL__FIELD_NAME: WrapperField = WrapperField("VeloxPublicUrl", FieldType.STRING)
+
+    Address1: ModelField[Optional[str]] = ModelField("Address1", FieldType.STRING)
+    Address2: ModelField[Optional[str]] = ModelField("Address2", FieldType.STRING)
+    City: ModelField[Optional[str]] = ModelField("City", FieldType.STRING)
+    CompanyDescription: ModelField[Optional[str]] = ModelField("CompanyDescription", FieldType.STRING)
+    CompanyName: ModelField[Optional[str]] = ModelField("CompanyName", FieldType.STRING)
+    CompanyWebsite: ModelField[Optional[str]] = ModelField("CompanyWebsite", FieldType.STRING)
+    Country: ModelField[Optional[str]] = ModelField("Country", FieldType.STRING)
+    PostalCode: ModelField[Optional[str]] = ModelField("PostalCode", FieldType.STRING)
+    Region: ModelField[Optional[str]] = ModelField("Region", FieldType.STRING)
+    State: ModelField[Optional[str]] = ModelField("State", FieldType.STRING)
+    VeloxPublicUrl: ModelField[Optional[str]] = ModelField("VeloxPublicUrl", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
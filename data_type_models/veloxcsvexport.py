@@ -0,0 +1,31 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class VeloxCsvExportModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type VeloxCsvExport
+    Data Type Display Name: CSV Export (CSV Exports)
+    Fields: CsvExportReportExecutionId, CsvExportSourceTempTypePojo, Description, ExportStatus, FilePath, VeloxCurrentVersion
+    This data type is used to store the file created when exporting a table to a CSV from anywhere in the system.
+    """
+    DATA_TYPE_NAME: str = 'VeloxCsvExport'
+    CSVEXPORTREPORTEXECUTIONID__FIELD_NAME: WrapperField = WrapperField("CsvExportReportExecutionId", FieldType.STRING)
+    CSVEXPORTSOURCETEMPTYPEPOJO__FIELD_NAME: WrapperField = WrapperField("CsvExportSourceTempTypePojo", FieldType.STRING)
+    DESCRIPTION__FIELD_NAME: WrapperField = WrapperField("Description", FieldType.STRING)
+    EXPORTSTATUS__FIELD_NAME: WrapperField = WrapperField("ExportStatus", FieldType.STRING)
+    FILEPATH__FIELD_NAME: WrapperField = WrapperField("FilePath", FieldType.STRING)
+    VELOXCURRENTVERSION__FIELD_NAME: WrapperField = WrapperField("VeloxCurrentVersion", FieldType.INTEGER)
+
+    CsvExportReportExecutionId: ModelField[Optional[str]] = ModelField("CsvExportReportExecutionId", FieldType.STRING)
+    CsvExportSourceTempTypePojo: ModelField[Optional[str]] = ModelField("CsvExportSourceTempTypePojo", FieldType.STRING)
+    Description: ModelField[Optional[str]] = ModelField("Description", FieldType.STRING)
+    ExportStatus: ModelField[Optional[str]] = ModelField("ExportStatus", FieldType.STRING)
+    FilePath: ModelField[Optional[str]] = ModelField("FilePath", FieldType.STRING)
+    VeloxCurrentVersion: ModelField[Optional[int]] = ModelField("VeloxCurrentVersion", FieldType.INTEGER)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
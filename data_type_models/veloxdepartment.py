@@ -0,0 +1,22 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class VeloxDepartmentModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type VeloxDepartment
+    Data Type Display Name: Department (Departments)
+    Fields: DepartmentName, InheritRolesFromParent
+    """
+    DATA_TYPE_NAME: str = 'VeloxDepartment'
+    DEPARTMENTNAME__FIELD_NAME: WrapperField = WrapperField("DepartmentName", FieldType.STRING)
+    INHERITROLESFROMPARENT__FIELD_NAME: WrapperField = WrapperField("InheritRolesFromParent", FieldType.BOOLEAN)
+
+    DepartmentName: ModelField[Optional[str]] = ModelField("DepartmentName", FieldType.STRING)
+    InheritRolesFromParent: ModelField[Optional[bool]] = ModelField("InheritRolesFromParent", FieldType.BOOLEAN)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,20 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class VeloxLocationModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type VeloxLocation
+    Data Type Display Name: Location (Locations)
+    Fields: LocationName
+    """
+    DATA_TYPE_NAME: str = 'VeloxLocation'
+    LOCATIONNAME__FIELD_NAME: WrapperField = WrapperField("LocationName", FieldType.STRING)
+
+    LocationName: ModelField[Optional[str]] = ModelField("LocationName", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,31 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class VeloxUserModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type VeloxUser
+    Data Type Display Name: User (Users)
+    Fields: EmailAddress, FirstName, JobTitle, LastName, MiddleName, Username
+    Data type to represent each user in the system.  These records can be searched using api methods and CustomReports but cannot be edited like typical records.
+    """
+    DATA_TYPE_NAME: str = 'VeloxUser'
+    EMAILADDRESS__FIELD_NAME: WrapperField = WrapperField("EmailAddress", FieldType.STRING)
+    FIRSTNAME__FIELD_NAME: WrapperField = WrapperField("FirstName", FieldType.STRING)
+    JOBTITLE__FIELD_NAME: WrapperField = WrapperField("JobTitle", FieldType.STRING)
+    LASTNAME__FIELD_NAME: WrapperField = WrapperField("LastName", FieldType.STRING)
+    MIDDLENAME__FIELD_NAME: WrapperField = WrapperField("MiddleName", FieldType.STRING)
+    USERNAME__FIELD_NAME: WrapperField = WrapperField("Username", FieldType.STRING)
+
+    EmailAddress: ModelField[Optional[str]] = ModelField("EmailAddress", FieldType.STRING)
+    FirstName: ModelField[Optional[str]] = ModelField("FirstName", FieldType.STRING)
+    JobTitle: ModelField[Optional[str]] = ModelField("JobTitle", FieldType.STRING)
+    LastName: ModelField[Optional[str]] = ModelField("LastName", FieldType.STRING)
+    MiddleName: ModelField[Optional[str]] = ModelField("MiddleName", FieldType.STRING)
+    Username: ModelField[Optional[str]] = ModelField("Username", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
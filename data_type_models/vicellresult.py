@@ -0,0 +1,52 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class ViCellResultModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type ViCellResult
+    Data Type Display Name: Vi-Cell Result (Vi-Cell Results)
+    Fields: AspirateCycles, AvgBg, AvgCellsImg, AvgCirc, AvgDiam, CellType, DateTime, FileName, Imgs, MaxDiam, MinCir, MinDiam, TotalCells, TotalCellsMl, Viability, ViableCells, ViableCellsMl
+    """
+    DATA_TYPE_NAME: str = 'ViCellResult'
+    ASPIRATECYCLES__FIELD_NAME: WrapperField = WrapperField("AspirateCycles", FieldType.DOUBLE)
+    AVGBG__FIELD_NAME: WrapperField = WrapperField("AvgBg", FieldType.DOUBLE)
+    AVGCELLSIMG__FIELD_NAME: WrapperField = WrapperField("AvgCellsImg", FieldType.DOUBLE)
+    AVGCIRC__FIELD_NAME: WrapperField = WrapperField("AvgCirc", FieldType.DOUBLE)
+    AVGDIAM__FIELD_NAME: WrapperField = WrapperField("AvgDiam", FieldType.DOUBLE)
+    CELLTYPE__FIELD_NAME: WrapperField = WrapperField("CellType", FieldType.STRING)
+    DATETIME__FIELD_NAME: WrapperField = WrapperField("DateTime", FieldType.DATE)
+    FILENAME__FIELD_NAME: WrapperField = WrapperField("FileName", FieldType.STRING)
+    IMGS__FIELD_NAME: WrapperField = WrapperField("Imgs", FieldType.DOUBLE)
+    MAXDIAM__FIELD_NAME: WrapperField = WrapperField("MaxDiam", FieldType.DOUBLE)
+    MINCIR__FIELD_NAME: WrapperField = WrapperField("MinCir", FieldType.DOUBLE)
+    MINDIAM__FIELD_NAME: WrapperField = WrapperField("MinDiam", FieldType.DOUBLE)
+    TOTALCELLS__FIELD_NAME: WrapperField = WrapperField("TotalCells", FieldType.DOUBLE)
+    TOTALCELLSML__FIELD_NAME: WrapperField = WrapperField("TotalCellsMl", FieldType.DOUBLE)
+    VIABILITY__FIELD_NAME: WrapperField = WrapperField("Viability", FieldType.DOUBLE)
+    VIABLECELLS__FIELD_NAME: WrapperField = WrapperField("ViableCells", FieldType.DOUBLE)
+    VIABLECELLSML__FIELD_NAME: WrapperField = WrapperField("ViableCellsMl", FieldType.DOUBLE)
+
+    AspirateCycles: ModelField[Optional[float]] = ModelField("AspirateCycles", FieldType.DOUBLE)
+    AvgBg: ModelField[Optional[float]] = ModelField("AvgBg", FieldType.DOUBLE)
+    AvgCellsImg: ModelField[Optional[float]] = ModelField("AvgCellsImg", FieldType.DOUBLE)
+    AvgCirc: ModelField[Optional[float]] = ModelField("AvgCirc", FieldType.DOUBLE)
+    AvgDiam: ModelField[Optional[float]] = ModelField("AvgDiam", FieldType.DOUBLE)
+    CellType: ModelField[Optional[str]] = ModelField("CellType", FieldType.STRING)
+    DateTime: ModelField[Optional[int]] = ModelField("DateTime", FieldType.DATE)
+    FileName: ModelField[Optional[str]] = ModelField("FileName", FieldType.STRING)
+    Imgs: ModelField[Optional[float]] = ModelField("Imgs", FieldType.DOUBLE)
+    MaxDiam: ModelField[Optional[float]] = ModelField("MaxDiam", FieldType.DOUBLE)
+    MinCir: ModelField[Optional[float]] = ModelField("MinCir", FieldType.DOUBLE)
+    MinDiam: ModelField[Optional[float]] = ModelField("MinDiam", FieldType.DOUBLE)
+    TotalCells: ModelField[Optional[float]] = ModelField("TotalCells", FieldType.DOUBLE)
+    TotalCellsMl: ModelField[Optional[float]] = ModelField("TotalCellsMl", FieldType.DOUBLE)
+    Viability: ModelField[Optional[float]] = ModelField("Viability", FieldType.DOUBLE)
+    ViableCells: ModelField[Optional[float]] = ModelField("ViableCells", FieldType.DOUBLE)
+    ViableCellsMl: ModelField[Optional[float]] = ModelField("ViableCellsMl", FieldType.DOUBLE)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
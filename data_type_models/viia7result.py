@@ -0,0 +1,26 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class ViiA7ResultModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type ViiA7Result
+    Data Type Display Name: ViiA7 Result (ViiA7 Results)
+    Fields: Ct, CtMean, CtSD, Quantity
+    """
+    DATA_TYPE_NAME: str = 'ViiA7Result'
+    CT__FIELD_NAME: WrapperField = WrapperField("Ct", FieldType.DOUBLE)
+    CTMEAN__FIELD_NAME: WrapperField = WrapperField("CtMean", FieldType.DOUBLE)
+    CTSD__FIELD_NAME: WrapperField = WrapperField("CtSD", FieldType.DOUBLE)
+    QUANTITY__FIELD_NAME: WrapperField = WrapperField("Quantity", FieldType.DOUBLE)
+
+    Ct: ModelField[Optional[float]] = ModelField("Ct", FieldType.DOUBLE)
+    CtMean: ModelField[Optional[float]] = ModelField("CtMean", FieldType.DOUBLE)
+    CtSD: ModelField[Optional[float]] = ModelField("CtSD", FieldType.DOUBLE)
+    Quantity: ModelField[Optional[float]] = ModelField("Quantity", FieldType.DOUBLE)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
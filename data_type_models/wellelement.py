@@ -0,0 +1,44 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class WellElementModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type WellElement
+    Data Type Display Name: Well Element (Well Elements)
+    Fields: Amount, ControlType, ElementId, isControl, Layer, MultiParentLink137, MultiParentLink207, Notes, Required, TimePoint, UnitOfMeasure, WellElementDataType, WellElementFilterField, WellElementSubType
+    """
+    DATA_TYPE_NAME: str = 'WellElement'
+    AMOUNT__FIELD_NAME: WrapperField = WrapperField("Amount", FieldType.DOUBLE)
+    CONTROLTYPE__FIELD_NAME: WrapperField = WrapperField("ControlType", FieldType.STRING)
+    ELEMENTID__FIELD_NAME: WrapperField = WrapperField("ElementId", FieldType.STRING)
+    ISCONTROL__FIELD_NAME: WrapperField = WrapperField("isControl", FieldType.BOOLEAN)
+    LAYER__FIELD_NAME: WrapperField = WrapperField("Layer", FieldType.INTEGER)
+    MULTIPARENTLINK137__FIELD_NAME: WrapperField = WrapperField("MultiParentLink137", FieldType.MULTIPARENTLINK)
+    MULTIPARENTLINK207__FIELD_NAME: WrapperField = WrapperField("MultiParentLink207", FieldType.MULTIPARENTLINK)
+    NOTES__FIELD_NAME: WrapperField = WrapperField("Notes", FieldType.STRING)
+    REQUIRED__FIELD_NAME: WrapperField = WrapperField("Required", FieldType.BOOLEAN)
+    TIMEPOINT__FIELD_NAME: WrapperField = WrapperField("TimePoint", FieldType.STRING)
+    UNITOFMEASURE__FIELD_NAME: WrapperField = WrapperField("UnitOfMeasure", FieldType.PICKLIST)
+    WELLELEMENTDATATYPE__FIELD_NAME: WrapperField = WrapperField("WellElementDataType", FieldType.STRING)
+    WELLELEMENTFILTERFIELD__FIELD_NAME: WrapperField = WrapperField("WellElementFilterField", FieldType.STRING)
+    WELLELEMENTSUBTYPE__FIELD_NAME: WrapperField = WrapperField("WellElementSubType", FieldType.STRING)
+
+    Amount: ModelField[Optional[float]] = ModelField("Amount", FieldType.DOUBLE)
+    ControlType: ModelField[Optional[str]] = ModelField("ControlType", FieldType.STRING)
+    ElementId: ModelField[Optional[str]] = ModelField("ElementId", FieldType.STRING)
+    isControl: ModelField[Optional[bool]] = ModelField("isControl", FieldType.BOOLEAN)
+    Layer: ModelField[Optional[int]] = ModelField("Layer", FieldType.INTEGER)
+    Notes: ModelField[Optional[str]] = ModelField("Notes", FieldType.STRING)
+    Required: ModelField[Optional[bool]] = ModelField("Required", FieldType.BOOLEAN)
+    TimePoint: ModelField[Optional[str]] = ModelField("TimePoint", FieldType.STRING)
+    UnitOfMeasure: ModelField[Optional[str]] = ModelField("UnitOfMeasure", FieldType.PICKLIST)
+    WellElementDataType: ModelField[Optional[str]] = ModelField("WellElementDataType", FieldType.STRING)
+    WellElementFilterField: ModelField[Optional[str]] = ModelField("WellElementFilterField", FieldType.STRING)
+    WellElementSubType: ModelField[Optional[str]] = ModelField("WellElementSubType", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,29 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class WorkQueueButtonConfigurationModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type WorkQueueButtonConfiguration
+    Data Type Display Name: Work Queue Button Configuration (Work Queue Button Configurations)
+    Fields: ButtonName, DataType, Line2Text, NoSelectionRequired, PackagePath, ViewUploadImageButton
+    """
+    DATA_TYPE_NAME: str = 'WorkQueueButtonConfiguration'
+    BUTTONNAME__FIELD_NAME: WrapperField = WrapperField("ButtonName", FieldType.STRING)
+    DATATYPE__FIELD_NAME: WrapperField = WrapperField("DataType", FieldType.SELECTION)
+    LINE2TEXT__FIELD_NAME: WrapperField = WrapperField("Line2Text", FieldType.STRING)
+    NOSELECTIONREQUIRED__FIELD_NAME: WrapperField = WrapperField("NoSelectionRequired", FieldType.BOOLEAN)
+    PACKAGEPATH__FIELD_NAME: WrapperField = WrapperField("PackagePath", FieldType.STRING)
+    VIEWUPLOADIMAGEBUTTON__FIELD_NAME: WrapperField = WrapperField("ViewUploadImageButton", FieldType.ACTION)
+
+    ButtonName: ModelField[Optional[str]] = ModelField("ButtonName", FieldType.STRING)
+    DataType: ModelField[Optional[str]] = ModelField("DataType", FieldType.SELECTION)
+    Line2Text: ModelField[Optional[str]] = ModelField("Line2Text", FieldType.STRING)
+    NoSelectionRequired: ModelField[Optional[bool]] = ModelField("NoSelectionRequired", FieldType.BOOLEAN)
+    PackagePath: ModelField[Optional[str]] = ModelField("PackagePath", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
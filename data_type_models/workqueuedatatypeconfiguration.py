@@ -0,0 +1,32 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class WorkQueueDataTypeConfigurationModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type WorkQueueDataTypeConfiguration
+    Data Type Display Name: Work Queue Data Type Configuration (Work Queue Data Type Configurations)
+    Fields: BatchRetrieval, DataType, DoubleClickActionPluginPath, IsReportBacked, ItemQueuePackagePath, ShowDefaultButtons, UseSingleSelection
+    """
+    DATA_TYPE_NAME: str = 'WorkQueueDataTypeConfiguration'
+    BATCHRETRIEVAL__FIELD_NAME: WrapperField = WrapperField("BatchRetrieval", FieldType.BOOLEAN)
+    DATATYPE__FIELD_NAME: WrapperField = WrapperField("DataType", FieldType.SELECTION)
+    DOUBLECLICKACTIONPLUGINPATH__FIELD_NAME: WrapperField = WrapperField("DoubleClickActionPluginPath", FieldType.STRING)
+    ISREPORTBACKED__FIELD_NAME: WrapperField = WrapperField("IsReportBacked", FieldType.BOOLEAN)
+    ITEMQUEUEPACKAGEPATH__FIELD_NAME: WrapperField = WrapperField("ItemQueuePackagePath", FieldType.STRING)
+    SHOWDEFAULTBUTTONS__FIELD_NAME: WrapperField = WrapperField("ShowDefaultButtons", FieldType.BOOLEAN)
+    USESINGLESELECTION__FIELD_NAME: WrapperField = WrapperField("UseSingleSelection", FieldType.BOOLEAN)
+
+    BatchRetrieval: ModelField[Optional[bool]] = ModelField("BatchRetrieval", FieldType.BOOLEAN)
+    DataType: ModelField[Optional[str]] = ModelField("DataType", FieldType.SELECTION)
+    DoubleClickActionPluginPath: ModelField[Optional[str]] = ModelField("DoubleClickActionPluginPath", FieldType.STRING)
+    IsReportBacked: ModelField[Optional[bool]] = ModelField("IsReportBacked", FieldType.BOOLEAN)
+    ItemQueuePackagePath: ModelField[Optional[str]] = ModelField("ItemQueuePackagePath", FieldType.STRING)
+    ShowDefaultButtons: ModelField[Optional[bool]] = ModelField("ShowDefaultButtons", FieldType.BOOLEAN)
+    UseSingleSelection: ModelField[Optional[bool]] = ModelField("UseSingleSelection", FieldType.BOOLEAN)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,30 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class WorkQueueTabConfigurationModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type WorkQueueTabConfiguration
+    Data Type Display Name: Work Queue Tab Configuration (Work Queue Tab Configurations)
+    Fields: HidePlateView, HideStorageView, HideTab, TabDisplayName, TabName, TabPluralDisplayName
+    """
+    DATA_TYPE_NAME: str = 'WorkQueueTabConfiguration'
+    HIDEPLATEVIEW__FIELD_NAME: WrapperField = WrapperField("HidePlateView", FieldType.BOOLEAN)
+    HIDESTORAGEVIEW__FIELD_NAME: WrapperField = WrapperField("HideStorageView", FieldType.BOOLEAN)
+    HIDETAB__FIELD_NAME: WrapperField = WrapperField("HideTab", FieldType.BOOLEAN)
+    TABDISPLAYNAME__FIELD_NAME: WrapperField = WrapperField("TabDisplayName", FieldType.STRING)
+    TABNAME__FIELD_NAME: WrapperField = WrapperField("TabName", FieldType.STRING)
+    TABPLURALDISPLAYNAME__FIELD_NAME: WrapperField = WrapperField("TabPluralDisplayName", FieldType.STRING)
+
+    HidePlateView: ModelField[Optional[bool]] = ModelField("HidePlateView", FieldType.BOOLEAN)
+    HideStorageView: ModelField[Optional[bool]] = ModelField("HideStorageView", FieldType.BOOLEAN)
+    HideTab: ModelField[Optional[bool]] = ModelField("HideTab", FieldType.BOOLEAN)
+    TabDisplayName: ModelField[Optional[str]] = ModelField("TabDisplayName", FieldType.STRING)
+    TabName: ModelField[Optional[str]] = ModelField("TabName", FieldType.STRING)
+    TabPluralDisplayName: ModelField[Optional[str]] = ModelField("TabPluralDisplayName", FieldType.STRING)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
@@ -0,0 +1,31 @@
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField
+from typing import Optional
+from data_type_models._base import GeneratedRecordModel, ModelField
+
+
+class WorkQueueTaskConfigurationModel(GeneratedRecordModel):
+    """
+    Auto-Generated Record Model Wrapper for data type WorkQueueTaskConfiguration
+    Data Type Display Name: Work Queue Category Configuration (Work Queue Category Configurations)
+    Fields: AddManageBatchPluginPath, CategoryOrder, DefaultBatchButtonsToExclude, DisableDeleteBatchPrompt, UserGroupList, ViewUploadImageButton, WorkflowOrCategoryName
+    """
+    DATA_TYPE_NAME: str = 'WorkQueueTaskConfiguration'
+    ADDMANAGEBATCHPLUGINPATH__FIELD_NAME: WrapperField = WrapperField("AddManageBatchPluginPath", FieldType.STRING)
+    CATEGORYORDER__FIELD_NAME: WrapperField = WrapperField("CategoryOrder", FieldType.LONG)
+    DEFAULTBATCHBUTTONSTOEXCLUDE__FIELD_NAME: WrapperField = WrapperField("DefaultBatchButtonsToExclude", FieldType.SELECTION)
+    DISABLEDELETEBATCHPROMPT__FIELD_NAME: WrapperField = WrapperField("DisableDeleteBatchPrompt", FieldType.BOOLEAN)
+    USERGROUPLIST__FIELD_NAME: WrapperField = WrapperField("UserGroupList", FieldType.SELECTION)
+    VIEWUPLOADIMAGEBUTTON__FIELD_NAME: WrapperField = WrapperField("ViewUploadImageButton", FieldType.ACTION)
+    WORKFLOWORCATEGORYNAME__FIELD_NAME: WrapperField = WrapperField("WorkflowOrCategoryName", FieldType.SELECTION)
+
+    AddManageBatchPluginPath: ModelField[Optional[str]] = ModelField("AddManageBatchPluginPath", FieldType.STRING)
+    CategoryOrder: ModelField[Optional[int]] = ModelField("CategoryOrder", FieldType.LONG)
+    DefaultBatchButtonsToExclude: ModelField[Optional[str]] = ModelField("DefaultBatchButtonsToExclude", FieldType.SELECTION)
+    DisableDeleteBatchPrompt: ModelField[Optional[bool]] = ModelField("DisableDeleteBatchPrompt", FieldType.BOOLEAN)
+    UserGroupList: ModelField[Optional[str]] = ModelField("UserGroupList", FieldType.SELECTION)
+    WorkflowOrCategoryName: ModelField[Optional[str]] = ModelField("WorkflowOrCategoryName", FieldType.SELECTION)
+
+    @classmethod
+    def get_wrapper_data_type_name(cls):
+        return cls.DATA_TYPE_NAME
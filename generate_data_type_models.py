@@ -0,0 +1,407 @@
+"""
+Generates the record model wrappers in the data_type_models package from the data types of a Sapio system.
+
+Each data type is written into its own module under data_type_models, and the package __init__ is written with an
+index of those modules so that wrappers are only imported when they are first used.
+
+Definitions are fetched concurrently, and a module is only rewritten when the hash of its content changes. After a
+change to a single data type, only that type's module is touched, so the diff stays small and the bytecode cache of
+every other module stays valid.
+
+Example:
+    python generate_data_type_models.py --url https://linux-vm:8443/webservice/api \
+        --guid 3c232543-f407-4828-aae5-b33d4cd31fa7 --username yqiao_api --password Password1!
+
+After a change to the templates, the package can be rendered again from its own wrappers, without a Sapio system:
+    python generate_data_type_models.py --from-package
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import importlib.util
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+from sapiopylib.rest.DataMgmtService import DataMgmtServer
+from sapiopylib.rest.User import SapioUser
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from data_type_models._base import GeneratedRecordModel
+
+PACKAGE_NAME = "data_type_models"
+
+# Number of data types whose definitions are fetched at the same time.
+DEFAULT_FETCH_WORKERS = 8
+
+# The python type returned by the getters and accepted by the setters of each field type.
+# Fields with types that are not listed here (links, action buttons...) do not get accessors.
+PYTHON_TYPE_BY_FIELD_TYPE: Dict[FieldType, str] = {
+    FieldType.BOOLEAN: "bool",
+    FieldType.DOUBLE: "float",
+    FieldType.ENUM: "int",
+    FieldType.LONG: "int",
+    FieldType.INTEGER: "int",
+    FieldType.SHORT: "int",
+    FieldType.STRING: "str",
+    FieldType.DATE: "int",
+    FieldType.SELECTION: "str",
+    FieldType.PICKLIST: "str",
+    FieldType.AUTO_ACCESSION: "str",
+    FieldType.DATE_RANGE: "DateRange",
+    FieldType.SIDE_LINK: "int",
+    FieldType.ACTION_STRING: "str",
+}
+
+# The imports of a generated module, each only written when the module uses the names it imports.
+FIELD_TYPE_IMPORT = "from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType"
+WRAPPER_FIELD_IMPORT = "from sapiopylib.rest.utils.recordmodel.RecordModelWrapper import WrapperField"
+DATE_RANGE_IMPORT = "from sapiopylib.rest.pojo.DateRange import DateRange"
+OPTIONAL_IMPORT = "from typing import Optional"
+
+# Module level names referenced from within the generated class bodies.
+CLASS_BODY_NAMES = {"FieldType", "WrapperField", "DateRange", "Optional", "GeneratedRecordModel", "ModelField"}
+
+PACKAGE_INIT_TEMPLATE = '''\
+"""
+Auto-Generated Record Model Wrappers
+
+Each data type's wrapper lives in its own module and is only imported the first time it is accessed, so that
+"from data_type_models import SampleModel" does not load the wrappers of every other data type in the system.
+"""
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Dict, List, Type
+
+from data_type_models._base import GeneratedRecordModel
+from data_type_models._registry import ModelRegistry
+
+if TYPE_CHECKING:
+{type_checking_imports}
+
+# Wrapper class name -> module under this package that defines it.
+_MODEL_MODULES: Dict[str, str] = {{
+{model_modules}
+}}
+
+# Data type name -> wrapper class name.
+_DATA_TYPE_MODELS: Dict[str, str] = {{
+{data_type_models}
+}}
+
+__all__ = list(_MODEL_MODULES)
+
+
+def __getattr__(name: str):
+    module_name = _MODEL_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+    model = getattr(importlib.import_module(f"{{__name__}}.{{module_name}}"), name)
+    globals()[name] = model
+    return model
+
+
+# The wrapper class of every data type by data type name, e.g. MODELS_BY_DATA_TYPE["Sample"] is SampleModel.
+# Only the wrappers that are looked up are imported.
+MODELS_BY_DATA_TYPE: ModelRegistry = ModelRegistry(_DATA_TYPE_MODELS, __getattr__)
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_MODEL_MODULES))
+
+
+def load_all_models() -> List[Type[GeneratedRecordModel]]:
+    """
+    Import every wrapper in this package. Only use this when all wrappers are actually needed.
+    """
+    return [__getattr__(name) for name in _MODEL_MODULES]
+'''
+
+
+@dataclass
+class FieldSpec:
+    """
+    The parts of a data field definition that end up in a generated wrapper.
+    """
+    field_name: str
+    field_type: FieldType
+
+    @property
+    def constant_name(self) -> str:
+        return self.field_name.upper() + "__FIELD_NAME"
+
+    @property
+    def python_type(self) -> Optional[str]:
+        return PYTHON_TYPE_BY_FIELD_TYPE.get(self.field_type)
+
+
+@dataclass
+class DataTypeSpec:
+    """
+    The parts of a data type definition that end up in a generated wrapper.
+    """
+    data_type_name: str
+    display_name: str
+    plural_display_name: str
+    description: Optional[str] = None
+    fields: List[FieldSpec] = field(default_factory=list)
+
+    @property
+    def class_name(self) -> str:
+        return self.data_type_name + "Model"
+
+    @property
+    def module_name(self) -> str:
+        return self.data_type_name.lower()
+
+
+def render_model_class(spec: DataTypeSpec) -> str:
+    """
+    Render the wrapper class of a single data type.
+    """
+    lines: List[str] = [
+        f"class {spec.class_name}(GeneratedRecordModel):",
+        '    """',
+        f"    Auto-Generated Record Model Wrapper for data type {spec.data_type_name}",
+        f"    Data Type Display Name: {spec.display_name} ({spec.plural_display_name})",
+        "    Fields: " + ", ".join(x.field_name for x in spec.fields),
+    ]
+    if spec.description:
+        lines.append("    " + spec.description)
+    lines.append('    """')
+    lines.append(f"    DATA_TYPE_NAME: str = '{spec.data_type_name}'")
+    for field_spec in spec.fields:
+        lines.append(f'    {field_spec.constant_name}: WrapperField = '
+                     f'WrapperField("{field_spec.field_name}", FieldType.{field_spec.field_type.name})')
+    # Fields are exposed as descriptors named after the field, which also provide the get_X_field/set_X_field
+    # aliases. A field whose name is already taken by the wrapper base class, or would shadow a name used in the
+    # class body, gets explicit methods instead.
+    accessor_fields = [x for x in spec.fields if x.python_type is not None]
+    descriptor_fields = [x for x in accessor_fields if not _is_reserved_attribute(x.field_name)]
+    method_fields = [x for x in accessor_fields if _is_reserved_attribute(x.field_name)]
+    if descriptor_fields:
+        lines.append("")
+    for field_spec in descriptor_fields:
+        lines.append(f'    {field_spec.field_name}: ModelField[Optional[{field_spec.python_type}]] = '
+                     f'ModelField("{field_spec.field_name}", FieldType.{field_spec.field_type.name})')
+    lines += [
+        "",
+        "    @classmethod",
+        "    def get_wrapper_data_type_name(cls):",
+        "        return cls.DATA_TYPE_NAME",
+    ]
+    for field_spec in method_fields:
+        python_type = field_spec.python_type
+        name = field_spec.field_name
+        lines += [
+            "",
+            f"    def set_{name}_field(self, value: Optional[{python_type}]):",
+            '        """',
+            f"        Set data field with field name '{name}' on this record model",
+            '        """',
+            f"        self.set_field_value(self.{field_spec.constant_name}.field_name, value)",
+            "",
+            f"    def get_{name}_field(self) -> Optional[{python_type}]:",
+            '        """',
+            f"        Get data field value with field name '{name}' from this record model",
+            '        """',
+            f"        return self.get_field_value(self.{field_spec.constant_name}.field_name)",
+        ]
+    return "\n".join(lines) + "\n"
+
+
+def _is_reserved_attribute(name: str) -> bool:
+    return hasattr(GeneratedRecordModel, name) or name in CLASS_BODY_NAMES
+
+
+def render_model_module(spec: DataTypeSpec) -> str:
+    """
+    Render the module holding the wrapper of a single data type.
+    """
+    return render_module_header(spec) + "\n\n" + render_model_class(spec)
+
+
+def render_module_header(spec: DataTypeSpec) -> str:
+    """
+    Render the imports of the module holding the wrapper of a single data type.
+    """
+    accessor_fields = [x for x in spec.fields if x.python_type is not None]
+    lines: List[str] = []
+    if spec.fields:
+        lines += [FIELD_TYPE_IMPORT, WRAPPER_FIELD_IMPORT]
+    if any(x.python_type == "DateRange" for x in accessor_fields):
+        lines.append(DATE_RANGE_IMPORT)
+    if accessor_fields:
+        lines.append(OPTIONAL_IMPORT)
+    if any(not _is_reserved_attribute(x.field_name) for x in accessor_fields):
+        lines.append("from data_type_models._base import GeneratedRecordModel, ModelField")
+    else:
+        lines.append("from data_type_models._base import GeneratedRecordModel")
+    return "\n".join(lines) + "\n"
+
+
+def render_package_init(specs: Iterable[DataTypeSpec]) -> str:
+    """
+    Render the package __init__ that lazily imports the wrappers of the provided data types.
+    """
+    specs = sorted(specs, key=lambda x: x.class_name)
+    type_checking_imports = "\n".join(
+        f"    from {PACKAGE_NAME}.{x.module_name} import {x.class_name}" for x in specs)
+    model_modules = "\n".join(f'    "{x.class_name}": "{x.module_name}",' for x in specs)
+    data_type_models = "\n".join(f'    "{x.data_type_name}": "{x.class_name}",' for x in specs)
+    return PACKAGE_INIT_TEMPLATE.format(type_checking_imports=type_checking_imports or "    pass",
+                                        model_modules=model_modules, data_type_models=data_type_models)
+
+
+@dataclass
+class WriteSummary:
+    """
+    The files under the package directory that were touched by write_package.
+    """
+    written: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+
+
+def write_package(specs: List[DataTypeSpec], package_dir: str) -> WriteSummary:
+    """
+    Write the wrapper modules and the package __init__ into package_dir.
+    Files whose content hash has not changed are left alone, and modules of data types that no longer exist are removed.
+    """
+    os.makedirs(package_dir, exist_ok=True)
+    summary = WriteSummary()
+    contents: Dict[str, str] = {spec.module_name + ".py": render_model_module(spec) for spec in specs}
+    contents["__init__.py"] = render_package_init(specs)
+    for file_name, content in contents.items():
+        if _write_if_changed(os.path.join(package_dir, file_name), content):
+            summary.written.append(file_name)
+        else:
+            summary.unchanged.append(file_name)
+    for file_name in sorted(os.listdir(package_dir)):
+        if file_name.endswith(".py") and not file_name.startswith("_") and file_name not in contents:
+            os.remove(os.path.join(package_dir, file_name))
+            summary.removed.append(file_name)
+    return summary
+
+
+def fetch_data_type_specs(user: SapioUser, max_workers: int = DEFAULT_FETCH_WORKERS) -> List[DataTypeSpec]:
+    """
+    Read the definition of every data type in the system, along with its non-system fields.
+    Up to max_workers data types are fetched at the same time.
+    """
+    data_type_manager = DataMgmtServer.get_data_type_manager(user)
+    data_type_names = data_type_manager.get_data_type_name_list()
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fetch-data-type") as executor:
+        specs = list(executor.map(lambda name: fetch_data_type_spec(user, name), data_type_names))
+    return [spec for spec in specs if spec is not None]
+
+
+def fetch_data_type_spec(user: SapioUser, data_type_name: str) -> Optional[DataTypeSpec]:
+    """
+    Read the definition of a single data type. Returns None if the data type does not exist (anymore).
+    """
+    data_type_manager = DataMgmtServer.get_data_type_manager(user)
+    definition = data_type_manager.get_data_type_definition(data_type_name)
+    field_definitions = data_type_manager.get_field_definition_list(data_type_name)
+    if definition is None or field_definitions is None:
+        return None
+    fields = [FieldSpec(x.data_field_name, x.data_field_type) for x in field_definitions if not x.system_field]
+    return DataTypeSpec(data_type_name, definition.display_name, definition.plural_display_name,
+                        definition.description, sort_fields(fields))
+
+
+def sort_fields(fields: Iterable[FieldSpec]) -> List[FieldSpec]:
+    """
+    The fields in the order they are written into a wrapper, by field name, ignoring case, so that the order does not
+    depend on the order the server lists them in.
+    """
+    return sorted(fields, key=lambda x: (x.field_name.lower(), x.field_name))
+
+
+def read_package_specs(package_dir: str) -> List[DataTypeSpec]:
+    """
+    Read the data type specs back from the wrappers already generated into package_dir, to render them again.
+    """
+    specs: List[DataTypeSpec] = []
+    for file_name in sorted(os.listdir(package_dir)):
+        if not file_name.endswith(".py") or file_name.startswith("_"):
+            continue
+        module_name = f"_generated_{file_name[:-3]}"
+        module_spec = importlib.util.spec_from_file_location(module_name, os.path.join(package_dir, file_name))
+        module = importlib.util.module_from_spec(module_spec)
+        module_spec.loader.exec_module(module)
+        for model in vars(module).values():
+            if isinstance(model, type) and issubclass(model, GeneratedRecordModel) and model.__module__ == module_name:
+                specs.append(_spec_of_model(model))
+    return specs
+
+
+def _spec_of_model(model: type) -> DataTypeSpec:
+    # The docstring is rendered by render_model_class(): a title, the display names, the fields, then the description.
+    doc_lines = model.__doc__.split("\n")
+    display_name, plural_display_name = re.fullmatch(r"    Data Type Display Name: (.*) \((.*)\)",
+                                                     doc_lines[2]).groups()
+    description = "\n".join(doc_lines[4:-1])[4:] or None
+    fields = [FieldSpec(x.field_name, x.field_type) for x in model.get_wrapper_fields()]
+    return DataTypeSpec(model.DATA_TYPE_NAME, display_name, plural_display_name, description, sort_fields(fields))
+
+
+def _content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _write_if_changed(path: str, content: str) -> bool:
+    """
+    Write the content into the file at path, unless the file already has that content. Returns whether it was written.
+    """
+    data = content.encode("utf-8")
+    try:
+        with open(path, "rb") as file:
+            if _content_hash(file.read()) == _content_hash(data):
+                return False
+    except FileNotFoundError:
+        pass
+    with open(path, "wb") as file:
+        file.write(data)
+    return True
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Generate the data_type_models package from a Sapio system.")
+    parser.add_argument("--url", help="The webservice URL, ending with /webservice/api")
+    parser.add_argument("--from-package", action="store_true",
+                        help="Render the package again from its own wrappers rather than from a Sapio system.")
+    parser.add_argument("--guid")
+    parser.add_argument("--account-name")
+    parser.add_argument("--username")
+    parser.add_argument("--password")
+    parser.add_argument("--api-token")
+    parser.add_argument("--no-verify-ssl-cert", action="store_true")
+    parser.add_argument("--workers", type=int, default=DEFAULT_FETCH_WORKERS,
+                        help="How many data types to fetch at the same time.")
+    parser.add_argument("--output", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), PACKAGE_NAME),
+                        help="The package directory to write into.")
+    args = parser.parse_args(argv)
+    if args.from_package:
+        specs = read_package_specs(args.output)
+    elif args.url:
+        user = SapioUser(url=args.url, verify_ssl_cert=not args.no_verify_ssl_cert, guid=args.guid,
+                         account_name=args.account_name, username=args.username, password=args.password,
+                         api_token=args.api_token)
+        specs = fetch_data_type_specs(user, args.workers)
+    else:
+        parser.error("Provide --url, or --from-package.")
+    summary = write_package(specs, args.output)
+    print(f"Generated {len(specs)} record model wrappers into {args.output}: {len(summary.written)} files written, "
+          f"{len(summary.unchanged)} unchanged, {len(summary.removed)} removed")
+    for file_name in summary.written:
+        print(f"  written: {file_name}")
+    for file_name in summary.removed:
+        print(f"  removed: {file_name}")
+
+
+if __name__ == "__main__":
+    main()
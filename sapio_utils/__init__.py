@@ -0,0 +1,3 @@
+"""
+Reusable helpers for the tutorial scripts and webhook handlers, built on top of sapiopylib.
+"""
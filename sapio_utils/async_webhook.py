@@ -0,0 +1,146 @@
+"""
+Webhook handlers written as coroutines, so that independent requests to the Sapio server can be awaited together.
+
+sapiopylib makes its requests with blocking calls. An AsyncManager runs the methods of a manager on a thread pool
+shared by the process and returns awaitables, so that asyncio.gather() can wait for several requests at once. Each
+worker thread of the webhook server keeps one event loop, which runs the handlers invoked on that thread.
+"""
+from __future__ import annotations
+
+import asyncio
+import functools
+import sys
+import threading
+import traceback
+from abc import abstractmethod
+from concurrent.futures import Executor
+from typing import Any, Callable, Dict, Generic, Optional, TypeVar
+
+from flask import request
+from sapiopylib.rest.ClientCallbackService import ClientCallback
+from sapiopylib.rest.CustomReportService import CustomReportManager
+from sapiopylib.rest.DataMgmtService import DataMgmtServer
+from sapiopylib.rest.DataRecordManagerService import DataRecordManager
+from sapiopylib.rest.DataTypeService import DataTypeManager
+from sapiopylib.rest.ELNService import ElnManager
+from sapiopylib.rest.WebhookService import AbstractWebhookHandler
+from sapiopylib.rest.pojo.webhook.WebhookContext import SapioWebhookContext
+from sapiopylib.rest.pojo.webhook.WebhookResult import SapioWebhookResult
+
+from sapio_utils.fan_out import get_request_executor
+from sapio_utils.http_pool import parse_pooled_webhook
+
+ManagerType = TypeVar("ManagerType")
+
+_event_loops = threading.local()
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    The event loop of the current thread, created on first use and kept for the next handler invoked on the thread.
+    """
+    loop: Optional[asyncio.AbstractEventLoop] = getattr(_event_loops, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        _event_loops.loop = loop
+    return loop
+
+
+class AsyncManager(Generic[ManagerType]):
+    """
+    Makes every method of a sapiopylib manager awaitable, by running it on a thread pool.
+
+        eln_manager = AsyncManager(context.eln_manager)
+        entries, options = await asyncio.gather(
+            eln_manager.get_experiment_entry_list(exp_id),
+            eln_manager.get_notebook_experiment_options(exp_id))
+
+    Attributes that are not methods are returned as they are.
+    """
+
+    def __init__(self, manager: ManagerType, executor: Optional[Executor] = None):
+        """
+        :param manager: The manager whose methods to run.
+        :param executor: The thread pool to run them on. Defaults to the pool shared by the process.
+        """
+        self.manager = manager
+        self.executor = executor
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self.manager, name)
+        if not callable(attribute):
+            return attribute
+        return self._awaitable(attribute)
+
+    def _awaitable(self, method: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(method)
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            executor = self.executor or get_request_executor()
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(executor, functools.partial(method, *args, **kwargs))
+
+        return call
+
+
+class AsyncManagers:
+    """
+    The managers of a webhook context, as AsyncManagers. Each one is created when it is first used, from the manager
+    the context has at the time.
+    """
+
+    def __init__(self, context: SapioWebhookContext, executor: Optional[Executor] = None):
+        self.context = context
+        self.executor = executor
+
+    @property
+    def data_record_manager(self) -> AsyncManager[DataRecordManager]:
+        return AsyncManager(self.context.data_record_manager, self.executor)
+
+    @property
+    def eln_manager(self) -> AsyncManager[ElnManager]:
+        return AsyncManager(self.context.eln_manager, self.executor)
+
+    @property
+    def data_type_manager(self) -> AsyncManager[DataTypeManager]:
+        return AsyncManager(DataMgmtServer.get_data_type_manager(self.context.user), self.executor)
+
+    @property
+    def custom_report_manager(self) -> AsyncManager[CustomReportManager]:
+        return AsyncManager(DataMgmtServer.get_custom_report_manager(self.context.user), self.executor)
+
+    @property
+    def client_callback(self) -> AsyncManager[ClientCallback]:
+        return AsyncManager(DataMgmtServer.get_client_callback(self.context.user), self.executor)
+
+
+class AsyncAbstractWebhookHandler(AbstractWebhookHandler):
+    """
+    A webhook handler whose run() is a coroutine. Register it with a WebhookConfiguration like any other handler.
+
+    Each invocation runs on the event loop of the server thread that received it. Use AsyncManagers(context) to await
+    requests to the Sapio server, and asyncio.gather() to wait for independent ones together. The requests of the
+    context's user go through the HTTP pool shared by the process, so the worker threads reuse each other's connections.
+    """
+
+    def post(self) -> Dict[str, Any]:
+        """
+        Internal method to be executed to translate incoming requests.
+        """
+        context = parse_pooled_webhook(request.json, self.client_timeout_seconds, self.verify_sapio_cert)
+        # noinspection PyBroadException
+        try:
+            return get_event_loop().run_until_complete(self.run(context)).to_json()
+        except Exception:
+            print('Error occurred while running webhook custom logic. See traceback.', file=sys.stderr)
+            traceback.print_exc()
+            return SapioWebhookResult(False, display_text="Error occurred during webhook execution.").to_json()
+
+    @abstractmethod
+    async def run(self, context: SapioWebhookContext) -> SapioWebhookResult:
+        """
+        The execution details for this service.
+
+        :param context: The webhook context provided to you when it is called.
+        :return: The webhook result to send back to Sapio.
+        """
+        pass
@@ -0,0 +1,328 @@
+"""
+A process-wide cache of data type definitions, shared by every webhook invocation handled by the process.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Mapping, Optional, Tuple
+
+from sapiopylib.rest.DataMgmtService import DataMgmtServer
+from sapiopylib.rest.User import SapioUser
+from sapiopylib.rest.pojo.datatype.DataType import DataTypeDefinition
+from sapiopylib.rest.pojo.datatype.FieldDefinition import AbstractVeloxFieldDefinition
+from sapiopylib.rest.utils.DataTypeCacheManager import DataTypeCacheManager
+from sapiopylib.rest.utils.recordmodel.RecordModelManager import RecordModelManager
+
+# How long cached definitions are used before they are fetched again.
+DEFAULT_TTL_SECONDS = 600.0
+
+# How many values (data type definitions, field definition lists and data type name lists) are kept at most.
+DEFAULT_MAX_ENTRIES = 4096
+
+# Number of data type definitions that are fetched at the same time when many are missing from the cache.
+DEFAULT_FETCH_WORKERS = 16
+
+# How often the version check hook is called for each server.
+DEFAULT_VERSION_CHECK_SECONDS = 30.0
+
+# The kinds of cached values, which are part of the cache keys.
+_DATA_TYPE = "data type"
+_FIELDS = "fields"
+_DATA_TYPE_NAMES = "data type names"
+
+_Key = Tuple[str, str, str]
+
+
+@dataclass(frozen=True)
+class DataTypeCacheStats:
+    """
+    Counters of a DataTypeCache since it was created or since its counters were last reset.
+    """
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "hitRatio": self.hit_ratio,
+        }
+
+
+class DataTypeCache:
+    """
+    Caches data type definitions, field definitions and the list of data type names of Sapio servers, keyed by the
+    server URL and the data type name.
+
+    Unlike the DataTypeCacheManager of a RecordModelManager, which lives as long as its user object (a single webhook
+    invocation), this cache is shared by every user and thread of the process. Values are kept for ttl_seconds, and
+    the least recently used ones are evicted beyond max_entries. Definitions that are missing from the cache are
+    fetched with up to max_workers concurrent requests, so resolving the display names of every data type in the
+    system takes a handful of round trips instead of one round trip per data type.
+
+    Call invalidate() after changing data type definitions, so that the change is picked up before the TTL expires.
+    Alternatively, provide a version_check that returns a value that changes whenever the data types of a server
+    change (for example, a version field maintained on a configuration record). It is called at most once every
+    version_check_seconds for each server, and the values cached for a server are dropped when its version changes.
+
+    The cache counts its hits and misses; see stats(). Under gunicorn, every worker process has its own cache and
+    its own counters.
+    """
+
+    def __init__(self, ttl_seconds: float = DEFAULT_TTL_SECONDS, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 max_workers: int = DEFAULT_FETCH_WORKERS,
+                 version_check: Optional[Callable[[SapioUser], Hashable]] = None,
+                 version_check_seconds: float = DEFAULT_VERSION_CHECK_SECONDS,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        :param ttl_seconds: How long a cached value is used before it is fetched again.
+        :param max_entries: How many values are cached at most.
+        :param max_workers: How many data type definitions are fetched at the same time.
+        :param version_check: Returns the current version of the data types of the user's server.
+        :param version_check_seconds: How often version_check is called for each server.
+        :param clock: The monotonic clock that expiry is measured against.
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_workers = max_workers
+        self.version_check = version_check
+        self.version_check_seconds = version_check_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[_Key, Tuple[float, Any]] = OrderedDict()
+        # Server URL -> (time of the next version check, last seen version).
+        self._versions: Dict[str, Tuple[float, Hashable]] = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def get_data_type_names(self, user: SapioUser) -> List[str]:
+        """
+        The names of every data type in the system.
+        """
+        names = self._get_many(user, _DATA_TYPE_NAMES, [""],
+                               lambda keys: [DataMgmtServer.get_data_type_manager(user).get_data_type_name_list()])
+        return list(names[0])
+
+    def get_data_type(self, user: SapioUser, data_type_name: str) -> Optional[DataTypeDefinition]:
+        """
+        The definition of a data type, or None if the data type does not exist.
+        """
+        return self.get_data_types(user, [data_type_name])[0]
+
+    def get_data_types(self, user: SapioUser, data_type_names: Iterable[str]) -> List[Optional[DataTypeDefinition]]:
+        """
+        The definitions of the provided data types, in the same order. Definitions that are not cached are fetched
+        concurrently. Data types that do not exist are None.
+        """
+        data_type_manager = DataMgmtServer.get_data_type_manager(user)
+        return self._get_many(user, _DATA_TYPE, list(data_type_names),
+                              lambda names: self._fetch_all(data_type_manager.get_data_type_definition, names))
+
+    def get_field_definitions(self, user: SapioUser, data_type_name: str) \
+            -> Optional[List[AbstractVeloxFieldDefinition]]:
+        """
+        The field definitions of a data type, or None if the data type does not exist.
+        """
+        fields_by_name = self.get_fields_by_name(user, data_type_name)
+        return None if fields_by_name is None else list(fields_by_name.values())
+
+    def get_fields_by_name(self, user: SapioUser, data_type_name: str) \
+            -> Optional[Mapping[str, AbstractVeloxFieldDefinition]]:
+        """
+        The field definitions of a data type by data field name, or None if the data type does not exist.
+        """
+        data_type_manager = DataMgmtServer.get_data_type_manager(user)
+
+        def fetch(names: List[str]) -> List[Optional[Mapping[str, AbstractVeloxFieldDefinition]]]:
+            field_lists = self._fetch_all(data_type_manager.get_field_definition_list, names)
+            return [None if x is None else MappingProxyType({f.data_field_name: f for f in x}) for x in field_lists]
+
+        return self._get_many(user, _FIELDS, [data_type_name], fetch)[0]
+
+    def get_display_names(self, user: SapioUser, data_type_names: Iterable[str]) -> List[str]:
+        """
+        The display names of the provided data types, in the same order. Data types that do not exist keep their
+        data type name.
+        """
+        data_type_names = list(data_type_names)
+        definitions = self.get_data_types(user, data_type_names)
+        return [name if definition is None else definition.display_name
+                for name, definition in zip(data_type_names, definitions)]
+
+    def get_display_name(self, user: SapioUser, data_type_name: str) -> str:
+        """
+        The display name of a data type.
+        """
+        return self.get_display_names(user, [data_type_name])[0]
+
+    def get_plural_display_name(self, user: SapioUser, data_type_name: str) -> str:
+        """
+        The plural display name of a data type.
+        """
+        definition = self.get_data_type(user, data_type_name)
+        return data_type_name if definition is None else definition.plural_display_name
+
+    def invalidate(self, user: Optional[SapioUser] = None, data_type_name: Optional[str] = None) -> None:
+        """
+        Drop cached values, so that they are fetched again on their next use.
+
+        :param user: Only drop the values cached for the server of this user. Defaults to every server.
+        :param data_type_name: Only drop the definitions of this data type, and the list of data type names.
+            Defaults to every data type.
+        """
+        self._invalidate(None if user is None else user.url, data_type_name)
+
+    def stats(self) -> DataTypeCacheStats:
+        """
+        A snapshot of the counters of this cache.
+        """
+        with self._lock:
+            return DataTypeCacheStats(self._hits, self._misses, self._evictions, self._invalidations)
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._hits = self._misses = self._evictions = self._invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get_many(self, user: SapioUser, kind: str, names: List[str],
+                  fetch: Callable[[List[str]], List[Any]]) -> List[Any]:
+        """
+        Look up values of one kind, fetching the ones that are missing or expired with a single call of fetch.
+        """
+        url = user.url
+        self._check_version(user)
+        values: Dict[str, Any] = {}
+        missing: List[str] = []
+        with self._lock:
+            now = self._clock()
+            for name in names:
+                if name in values:
+                    continue
+                key = (url, kind, name)
+                entry = self._entries.get(key)
+                if entry is not None and entry[0] > now:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    values[name] = entry[1]
+                else:
+                    self._misses += 1
+                    values[name] = None
+                    missing.append(name)
+        if missing:
+            fetched = fetch(missing)
+            with self._lock:
+                expires = self._clock() + self.ttl_seconds
+                for name, value in zip(missing, fetched):
+                    key = (url, kind, name)
+                    self._entries[key] = (expires, value)
+                    self._entries.move_to_end(key)
+                    values[name] = value
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self._evictions += 1
+        return [values[name] for name in names]
+
+    def _fetch_all(self, fetch_one: Callable[[str], Any], names: List[str]) -> List[Any]:
+        if len(names) == 1:
+            return [fetch_one(names[0])]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(names)),
+                                thread_name_prefix="fetch-data-type") as executor:
+            return list(executor.map(fetch_one, names))
+
+    def _check_version(self, user: SapioUser) -> None:
+        if self.version_check is None:
+            return
+        url = user.url
+        with self._lock:
+            checked = self._versions.get(url)
+            if checked is not None and checked[0] > self._clock():
+                return
+        version = self.version_check(user)
+        with self._lock:
+            self._versions[url] = (self._clock() + self.version_check_seconds, version)
+        if checked is not None and checked[1] != version:
+            self._invalidate(url, None)
+
+    def _invalidate(self, url: Optional[str], data_type_name: Optional[str]) -> None:
+        with self._lock:
+            for key in list(self._entries):
+                key_url, kind, name = key
+                if url is not None and key_url != url:
+                    continue
+                if data_type_name is None or kind == _DATA_TYPE_NAMES or name == data_type_name:
+                    del self._entries[key]
+                    self._invalidations += 1
+
+
+class SharedDataTypeCacheManager(DataTypeCacheManager):
+    """
+    A DataTypeCacheManager that reads through DATA_TYPE_CACHE, so that the record models of a SharedRecordModelManager
+    share the data type and field definitions already cached by the process. Like any DataTypeCacheManager, there is
+    one per user object.
+
+    Definitions are kept for the lifetime of the manager once they have been read, as the DataTypeCacheManager keeps
+    them, so that record models, which look up field definitions on every field change, don't go through the shared
+    cache each time.
+    """
+
+    def __init__(self, user: SapioUser):
+        super().__init__(user)
+        self._data_types: Dict[str, DataTypeDefinition] = {}
+        self._fields_by_type: Dict[str, Dict[str, AbstractVeloxFieldDefinition]] = {}
+
+    def get_data_type(self, dt_name: str) -> DataTypeDefinition:
+        definition = self._data_types.get(dt_name)
+        if definition is None:
+            definition = self._data_types[dt_name] = DATA_TYPE_CACHE.get_data_type(self.user, dt_name)
+        return definition
+
+    def get_fields_for_type(self, dt_name: str) -> Dict[str, AbstractVeloxFieldDefinition]:
+        fields_by_name = self._fields_by_type.get(dt_name)
+        if fields_by_name is None:
+            fields_by_name = dict(DATA_TYPE_CACHE.get_fields_by_name(self.user, dt_name) or {})
+            self._fields_by_type[dt_name] = fields_by_name
+        return fields_by_name
+
+
+class SharedRecordModelManager(RecordModelManager):
+    """
+    A RecordModelManager whose data type cache manager is the user's SharedDataTypeCacheManager. See
+    get_record_model_manager().
+    """
+
+    @property
+    def data_type_cache_manager(self) -> DataTypeCacheManager:
+        return SharedDataTypeCacheManager(self.user)
+
+
+def get_record_model_manager(user: SapioUser) -> RecordModelManager:
+    """
+    The RecordModelManager of a user, with a data type cache manager that reads through DATA_TYPE_CACHE.
+
+    A RecordModelManager is a singleton per user object, shared with its subclasses, so once this has been called,
+    RecordModelManager(user) returns the same manager. If RecordModelManager(user) was called first, the plain
+    manager it created is returned instead, and reads definitions as before.
+    """
+    return SharedRecordModelManager(user)
+
+
+# The cache shared by every webhook handler of the process.
+DATA_TYPE_CACHE: DataTypeCache = DataTypeCache()
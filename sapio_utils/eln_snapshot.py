@@ -0,0 +1,330 @@
+"""
+Snapshots of notebook experiments, so that a webhook handler reads the entries of an experiment from the server once.
+"""
+from __future__ import annotations
+
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+from weakref import WeakKeyDictionary
+
+from requests import Response
+from sapiopylib.rest.ELNService import ElnManager
+from sapiopylib.rest.User import SapioUser
+from sapiopylib.rest.pojo.DataRecord import DataRecord
+from sapiopylib.rest.pojo.eln.ExperimentEntry import ExperimentEntry
+from sapiopylib.rest.pojo.webhook.WebhookContext import SapioWebhookContext
+
+from sapio_utils.report_cache import written_data_types
+
+# Number of entries whose options are fetched at the same time.
+DEFAULT_FETCH_WORKERS = 16
+
+# The ELN requests that only read, although they are not GET requests, by the first part of their path under /eln.
+_READ_ONLY_ELN_ACTIONS = frozenset({"queryExperimentByCriteria", "esign", "protocoltemplate", "templateexperiment"})
+# The ELN requests that add records to or remove records from one entry, at /eln/<action>/<experiment ID>/<entry ID>.
+_RECORD_CHANGE_ELN_ACTIONS = frozenset({"addRecordsToTableEntry", "removeRecordsFromTableEntry"})
+
+
+class ExperimentSnapshot:
+    """
+    The entries of a notebook experiment, their entry options and their records, read from the server once and indexed
+    by entry ID, entry name and option key.
+
+    The entry list is read the first time it is needed. The server returns entry options one entry at a time, so the
+    options of all entries are read together, with up to max_workers concurrent requests, the first time any option
+    is needed. The records of an entry are read, every page of them, the first time they are needed. Afterwards, every
+    lookup is answered from memory.
+
+    A snapshot does not see changes made to the experiment after it was read. Call invalidate() after changing the
+    experiment's entries or their options, and invalidate_entry_records() after changing the records of an entry. The
+    snapshot returned by get_experiment_snapshot() does this by itself for the changes made through
+    get_snapshot_eln_manager(), and, once eln_request_sent() is registered with an HttpPool, for every change the
+    context's PooledSapioUser sends.
+    """
+
+    def __init__(self, eln_manager: ElnManager, experiment_id: int, max_workers: int = DEFAULT_FETCH_WORKERS):
+        """
+        :param eln_manager: The ELN manager used to read the experiment.
+        :param experiment_id: The notebook experiment ID of the experiment.
+        :param max_workers: How many entry options are fetched at the same time.
+        """
+        self.eln_manager = eln_manager
+        self.experiment_id = experiment_id
+        self.max_workers = max_workers
+        self._entries: Optional[List[ExperimentEntry]] = None
+        self._entries_by_id: Dict[int, ExperimentEntry] = {}
+        self._entries_by_name: Dict[str, ExperimentEntry] = {}
+        self._options_by_entry_id: Optional[Dict[int, Dict[str, str]]] = None
+        self._entries_by_option: Dict[str, ExperimentEntry] = {}
+        self._records_by_entry_id: Dict[int, List[DataRecord]] = {}
+
+    @property
+    def entries(self) -> List[ExperimentEntry]:
+        """
+        The entries of the experiment, in the order returned by the server.
+        """
+        if self._entries is None:
+            self._entries = self.eln_manager.get_experiment_entry_list(self.experiment_id, False) or []
+            self._entries_by_id = {entry.entry_id: entry for entry in self._entries}
+            self._entries_by_name = {}
+            for entry in self._entries:
+                self._entries_by_name.setdefault(entry.entry_name, entry)
+        return self._entries
+
+    def get_entry(self, entry_id: int) -> Optional[ExperimentEntry]:
+        """
+        The entry with the provided entry ID, or None if the experiment has no such entry.
+        """
+        self.entries
+        return self._entries_by_id.get(entry_id)
+
+    def get_entry_by_name(self, entry_name: str) -> Optional[ExperimentEntry]:
+        """
+        The first entry with the provided name, or None if no entry has that name.
+        """
+        self.entries
+        return self._entries_by_name.get(entry_name)
+
+    def get_entry_options(self, entry_id: int) -> Dict[str, str]:
+        """
+        The entry options of an entry. Empty if the entry has no options or is not part of the experiment.
+        """
+        return self._load_options().get(entry_id, {})
+
+    def get_entry_by_option(self, option: str) -> Optional[ExperimentEntry]:
+        """
+        The first entry with the provided entry option key, or None if no entry has that option.
+        """
+        self._load_options()
+        return self._entries_by_option.get(option)
+
+    def get_entry_records(self, entry_id: int) -> List[DataRecord]:
+        """
+        The records of an entry, across all pages. The list is shared by every caller, so do not modify it.
+        """
+        records = self._records_by_entry_id.get(entry_id)
+        if records is None:
+            records = []
+            paging_criteria = None
+            while True:
+                page = self.eln_manager.get_data_records_for_entry(self.experiment_id, entry_id, paging_criteria)
+                records.extend(page.result_list)
+                if not page.is_next_page_available or page.next_page_criteria is None:
+                    break
+                paging_criteria = page.next_page_criteria
+            self._records_by_entry_id[entry_id] = records
+        return records
+
+    def invalidate(self) -> None:
+        """
+        Forget everything that was read, so that it is read again on the next lookup.
+        """
+        self._entries = None
+        self._entries_by_id = {}
+        self._entries_by_name = {}
+        self._options_by_entry_id = None
+        self._entries_by_option = {}
+        self._records_by_entry_id = {}
+
+    def invalidate_entry_records(self, entry_id: Optional[int] = None) -> None:
+        """
+        Forget the records of an entry, so that they are read again the next time they are needed.
+
+        :param entry_id: The entry ID. Defaults to every entry.
+        """
+        if entry_id is None:
+            self._records_by_entry_id = {}
+        else:
+            self._records_by_entry_id.pop(entry_id, None)
+
+    def _load_options(self) -> Dict[int, Dict[str, str]]:
+        if self._options_by_entry_id is not None:
+            return self._options_by_entry_id
+        entries = self.entries
+
+        def fetch_options(entry: ExperimentEntry) -> Dict[str, str]:
+            return self.eln_manager.get_experiment_entry_options(self.experiment_id, entry.entry_id) or {}
+
+        if len(entries) <= 1:
+            option_list = [fetch_options(entry) for entry in entries]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(entries)),
+                                    thread_name_prefix="fetch-entry-options") as executor:
+                option_list = list(executor.map(fetch_options, entries))
+        self._options_by_entry_id = {}
+        self._entries_by_option = {}
+        for entry, options in zip(entries, option_list):
+            self._options_by_entry_id[entry.entry_id] = options
+            for option in options:
+                self._entries_by_option.setdefault(option, entry)
+        return self._options_by_entry_id
+
+
+class SnapshotElnManager:
+    """
+    Wraps the ElnManager of a webhook context, keeping the experiment snapshots of one request up to date.
+
+    Every method of the ELN manager is available. The methods that only read are passed on as they are. Every other
+    method is passed on to the ELN manager and then invalidates what the snapshot of the changed experiment had read:
+    adding records to or removing records from a table only invalidates the records of that entry, and every other
+    change invalidates the whole snapshot. A change that is not made to one experiment, such as creating an experiment
+    or updating the role assignments of several, invalidates every snapshot.
+
+    Changes made through other ELN managers, such as context.eln_manager itself or the one
+    DataMgmtServer.get_eln_manager() returns, which the protocol utilities use, are only seen if the context's user is
+    a PooledSapioUser of a pool that eln_request_sent() is registered with. Otherwise, call invalidate() on the
+    snapshot after making them.
+    """
+
+    # The methods that don't change anything on the server. Every other method invalidates snapshots, so that a method
+    # added to the ElnManager is treated as a change until it is listed here.
+    _READ_ONLY = frozenset({
+        "get_banner",
+        "get_data_records_for_entry",
+        "get_eln_experiment_by_criteria",
+        "get_eln_experiment_by_id",
+        "get_eln_experiment_by_record_id",
+        "get_eln_experiment_list",
+        "get_eln_experiment_signatures",
+        "get_entry_signatures",
+        "get_experiment_entry",
+        "get_experiment_entry_list",
+        "get_experiment_entry_options",
+        "get_field_set_info_list",
+        "get_notebook_experiment_options",
+        "get_predefined_field_by_id",
+        "get_predefined_field_by_name",
+        "get_predefined_fields",
+        "get_predefined_fields_from_field_set_id",
+        "get_protocol_template_info_list",
+        "get_tabs_for_experiment",
+        "get_template_experiment_list",
+    })
+
+    # Changes to the records of one entry. Their first two parameters are the experiment ID and the entry ID.
+    _RECORD_CHANGES = frozenset({
+        "add_records_to_table_entry",
+        "remove_records_from_table_entry",
+    })
+
+    def __init__(self, eln_manager: ElnManager, max_workers: int = DEFAULT_FETCH_WORKERS):
+        """
+        :param eln_manager: The ELN manager that makes the requests.
+        :param max_workers: How many entry options each snapshot fetches at the same time.
+        """
+        self.eln_manager = eln_manager
+        self.max_workers = max_workers
+        self.snapshots: Dict[int, ExperimentSnapshot] = {}
+
+    def get_snapshot(self, experiment_id: int) -> ExperimentSnapshot:
+        """
+        The snapshot of an experiment, created the first time it is asked for.
+        """
+        snapshot = self.snapshots.get(experiment_id)
+        if snapshot is None:
+            snapshot = ExperimentSnapshot(self.eln_manager, experiment_id, self.max_workers)
+            self.snapshots[experiment_id] = snapshot
+        return snapshot
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self.eln_manager, name)
+        if name.startswith("_") or name in self._READ_ONLY or not callable(attribute):
+            return attribute
+        return self._invalidating(name, attribute)
+
+    def _invalidating(self, name: str, method: Callable[..., Any]) -> Callable[..., Any]:
+        signature = inspect.signature(method)
+
+        def call(*args: Any, **kwargs: Any) -> Any:
+            arguments = list(signature.bind(*args, **kwargs).arguments.values())
+            try:
+                return method(*args, **kwargs)
+            finally:
+                # Invalidate even if the request failed, since the server may have made part of the change.
+                self._invalidate(name, arguments)
+
+        return call
+
+    def _invalidate(self, name: str, arguments: List[Any]) -> None:
+        if not arguments or not isinstance(arguments[0], int):
+            for snapshot in self.snapshots.values():
+                snapshot.invalidate()
+            return
+        snapshot = self.snapshots.get(arguments[0])
+        if snapshot is None:
+            return
+        if name in self._RECORD_CHANGES:
+            snapshot.invalidate_entry_records(arguments[1])
+        else:
+            snapshot.invalidate()
+
+
+# The ELN manager wrapper of each webhook context, which lives as long as the context does.
+_SNAPSHOT_ELN_MANAGERS: WeakKeyDictionary[SapioWebhookContext, SnapshotElnManager] = WeakKeyDictionary()
+
+
+def get_snapshot_eln_manager(context: SapioWebhookContext) -> SnapshotElnManager:
+    """
+    The SnapshotElnManager of the current webhook request, created the first time it is asked for. Make changes to
+    the experiment through it, rather than through context.eln_manager, so that they invalidate the snapshots that
+    get_experiment_snapshot() returns.
+
+    :param context: The context of the webhook request. The wrapper and its snapshots live as long as the context.
+    """
+    eln_manager = _SNAPSHOT_ELN_MANAGERS.get(context)
+    if eln_manager is None:
+        eln_manager = _SNAPSHOT_ELN_MANAGERS[context] = SnapshotElnManager(context.eln_manager)
+    return eln_manager
+
+
+def eln_request_sent(user: SapioUser, method: str, url_sub_path: str, params: Optional[dict], payload: Any,
+                     response: Response) -> None:
+    """
+    Invalidate what the experiment snapshots of the webhook contexts of a user read, when the user sends a request
+    that changes an experiment or records. Register it with the pool of the PooledSapioUsers of webhook contexts, so
+    that it sees the changes made through any ELN manager or protocol of theirs:
+
+        HTTP_POOL.add_request_listener(eln_request_sent)
+
+    A change to one experiment invalidates its snapshots, and adding records to or removing records from an entry
+    only invalidates the records of that entry. A change to the ELN that names no experiment invalidates every
+    snapshot, and a change to records invalidates the records of every entry, since the snapshots hold their fields.
+    """
+    if method == "GET":
+        return
+    parts = url_sub_path.strip("/").split("/")
+    if parts[0] != "eln":
+        if written_data_types(method, url_sub_path, params, payload) != set():
+            for snapshot in _user_snapshots(user):
+                snapshot.invalidate_entry_records()
+        return
+    action = parts[1] if len(parts) > 1 else ""
+    if action in _READ_ONLY_ELN_ACTIONS:
+        return
+    experiment_id = int(parts[2]) if len(parts) > 2 and parts[2].isdigit() else None
+    for snapshot in _user_snapshots(user):
+        if experiment_id is not None and snapshot.experiment_id != experiment_id:
+            continue
+        if action in _RECORD_CHANGE_ELN_ACTIONS and len(parts) > 3 and parts[3].isdigit():
+            snapshot.invalidate_entry_records(int(parts[3]))
+        else:
+            snapshot.invalidate()
+
+
+def _user_snapshots(user: SapioUser) -> List[ExperimentSnapshot]:
+    return [snapshot for context, eln_manager in list(_SNAPSHOT_ELN_MANAGERS.items()) if context.user is user
+            for snapshot in list(eln_manager.snapshots.values())]
+
+
+def get_experiment_snapshot(context: SapioWebhookContext, experiment_id: Optional[int] = None) -> ExperimentSnapshot:
+    """
+    The snapshot of an experiment for the current webhook request, created the first time it is asked for. The
+    snapshot is kept up to date with the changes made through get_snapshot_eln_manager(context).
+
+    :param context: The context of the webhook request. The snapshots live as long as the context.
+    :param experiment_id: The notebook experiment ID. Defaults to the experiment the webhook was invoked from.
+    """
+    if experiment_id is None:
+        experiment_id = context.eln_experiment.notebook_experiment_id
+    return get_snapshot_eln_manager(context).get_snapshot(experiment_id)
@@ -0,0 +1,182 @@
+"""
+Runs independent calls to the Sapio server at the same time from a synchronous webhook handler.
+"""
+from __future__ import annotations
+
+import contextvars
+import threading
+import time
+from concurrent.futures import FIRST_EXCEPTION, Executor, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, List, Optional
+
+from sapiopylib.rest.pojo.webhook.WebhookContext import SapioWebhookContext
+
+# How many requests to the Sapio server the handlers of a process can have in flight at the same time.
+DEFAULT_MAX_WORKERS = 32
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+# Set on the threads of the shared pool.
+_pool_thread = threading.local()
+
+
+class _InlineExecutor(Executor):
+    """
+    Runs each call on the thread that submits it, before submit() returns.
+    """
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        future: Future = Future()
+        if future.set_running_or_notify_cancel():
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+        return future
+
+
+_inline_executor = _InlineExecutor()
+
+
+def _mark_pool_thread() -> None:
+    _pool_thread.active = True
+
+
+def get_request_executor() -> Executor:
+    """
+    The thread pool shared by the process for requests to the Sapio server, created on first use.
+
+    A call that already runs on the shared pool, and fans out again, gets an executor that runs the nested calls one
+    after the other on its own thread instead. Waiting on the pool from inside it could otherwise take up every thread
+    of the pool with callers waiting for calls that have no thread left to run on.
+    """
+    global _executor
+    if getattr(_pool_thread, "active", False):
+        return _inline_executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=DEFAULT_MAX_WORKERS, thread_name_prefix="sapio-request",
+                                           initializer=_mark_pool_thread)
+        return _executor
+
+
+@dataclass(frozen=True)
+class FanOutStats:
+    """
+    Counters of the fan-outs of the process since it started or since the counters were last reset.
+
+    serial_seconds is how long the calls ran, added up, which is about how long they would have taken one after the
+    other. wall_seconds is how long the handlers waited for them.
+    """
+    fan_outs: int = 0
+    calls: int = 0
+    timeouts: int = 0
+    failures: int = 0
+    serial_seconds: float = 0.0
+    wall_seconds: float = 0.0
+
+    @property
+    def saved_seconds(self) -> float:
+        return self.serial_seconds - self.wall_seconds
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "fanOuts": self.fan_outs,
+            "calls": self.calls,
+            "timeouts": self.timeouts,
+            "failures": self.failures,
+            "serialSeconds": self.serial_seconds,
+            "wallSeconds": self.wall_seconds,
+            "savedSeconds": self.saved_seconds,
+        }
+
+
+_stats = FanOutStats()
+_stats_lock = threading.Lock()
+
+
+def get_fan_out_stats() -> FanOutStats:
+    return _stats
+
+
+def reset_fan_out_stats() -> None:
+    global _stats
+    with _stats_lock:
+        _stats = FanOutStats()
+
+
+def gather(context: SapioWebhookContext, *calls: Callable[[], Any], timeout: Optional[float] = None,
+           executor: Optional[Executor] = None) -> List[Any]:
+    """
+    Run the calls at the same time and return their results in the same order.
+
+        samples, checks = gather(context,
+                                 lambda: eln_manager.get_data_records_for_entry(exp_id, samples_id),
+                                 lambda: eln_manager.get_data_records_for_entry(exp_id, checks_id))
+
+    The calls run on the thread pool shared by the process, which bounds how many requests are in flight at once, with
+    the context variables of the caller. If a call raises, or runs for longer than the timeout, the calls that have
+    not started yet are cancelled and the error is raised. Calls that are already running cannot be stopped; their
+    results are discarded.
+
+    When gather() is itself called from a call running on that pool, the calls run one after the other on the calling
+    thread, and the timeout is not applied to them; see get_request_executor().
+
+    :param context: The context of the webhook request the calls are made for.
+    :param calls: Functions without parameters, usually lambdas that call a manager.
+    :param timeout: How many seconds each call may run, counted from when it starts. Defaults to the request timeout
+        of the context's user.
+    :param executor: The thread pool to run the calls on. Defaults to the pool shared by the process.
+    :raises TimeoutError: If a call runs for longer than the timeout.
+    """
+    if timeout is None:
+        timeout = context.user.timeout_seconds
+    executor = executor or get_request_executor()
+    started: List[Optional[float]] = [None] * len(calls)
+    durations: List[float] = [0.0] * len(calls)
+
+    def run(index: int, call: Callable[[], Any], call_context: contextvars.Context) -> Any:
+        started[index] = time.perf_counter()
+        try:
+            return call_context.run(call)
+        finally:
+            durations[index] = time.perf_counter() - started[index]
+
+    start = time.perf_counter()
+    futures: List[Future] = [executor.submit(run, index, call, contextvars.copy_context())
+                             for index, call in enumerate(calls)]
+    timed_out = failed = False
+    try:
+        pending = set(futures)
+        while pending:
+            now = time.perf_counter()
+            deadlines = [started[index] + timeout for index, future in enumerate(futures)
+                         if future in pending and started[index] is not None]
+            if any(deadline <= now for deadline in deadlines):
+                timed_out = True
+                raise TimeoutError(f"A call did not finish within {timeout:g} seconds.")
+            # Until a call has started its deadline is unknown, so check again after a full timeout.
+            done, pending = wait(pending, timeout=min(deadlines, default=now + timeout) - now,
+                                 return_when=FIRST_EXCEPTION)
+            for future in done:
+                if future.exception() is not None:
+                    failed = True
+                    raise future.exception()
+    except BaseException:
+        for future in futures:
+            future.cancel()
+        raise
+    finally:
+        _record(len(calls), sum(durations), time.perf_counter() - start, timed_out, failed)
+    return [future.result() for future in futures]
+
+
+def _record(calls: int, serial_seconds: float, wall_seconds: float, timed_out: bool, failed: bool) -> None:
+    global _stats
+    with _stats_lock:
+        _stats = replace(_stats, fan_outs=_stats.fan_outs + 1, calls=_stats.calls + calls,
+                         timeouts=_stats.timeouts + timed_out, failures=_stats.failures + failed,
+                         serial_seconds=_stats.serial_seconds + serial_seconds,
+                         wall_seconds=_stats.wall_seconds + wall_seconds)
@@ -0,0 +1,164 @@
+"""
+Walks down or up several levels of the record hierarchy, keeping only the record IDs of the records it passes.
+
+Each level is read with the batch calls of the data record manager. The record IDs of a level are split into chunks,
+and the pages of each chunk are read on the thread pool shared by the process, so the chunks are read at the same
+time. The links found are kept as CSR adjacency arrays of record IDs rather than as DataRecords.
+"""
+from __future__ import annotations
+
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sapiopylib.rest.DataMgmtService import DataMgmtServer
+from sapiopylib.rest.User import SapioUser
+from sapiopylib.rest.pojo.DataRecordPaging import DataRecordPojoHierarchyPageCriteria
+
+from sapio_utils.fan_out import get_request_executor
+
+# How many record IDs are sent in one batch call, and how many records each page of it returns.
+DEFAULT_CHUNK_SIZE = 500
+DEFAULT_PAGE_SIZE = 1000
+
+_EMPTY = np.empty(0, dtype=np.int64)
+
+
+@dataclass(frozen=True)
+class CsrAdjacency:
+    """
+    Links from source records to target records, in compressed sparse row form.
+
+    source_ids holds the record IDs of the sources that have at least one target, in ascending order. The targets of
+    source_ids[i] are target_ids[indptr[i]:indptr[i + 1]], also in ascending order and without repeats.
+    """
+    source_ids: np.ndarray
+    indptr: np.ndarray
+    target_ids: np.ndarray
+
+    @staticmethod
+    def from_edges(sources: np.ndarray, targets: np.ndarray) -> CsrAdjacency:
+        """
+        The adjacency of the links sources[i] -> targets[i]. Repeated links are kept once.
+        """
+        if len(sources) == 0:
+            return CsrAdjacency(_EMPTY, np.zeros(1, dtype=np.int64), _EMPTY)
+        order = np.lexsort((targets, sources))
+        sources, targets = sources[order], targets[order]
+        keep = np.ones(len(sources), dtype=bool)
+        keep[1:] = (sources[1:] != sources[:-1]) | (targets[1:] != targets[:-1])
+        sources, targets = sources[keep], targets[keep]
+        source_ids, counts = np.unique(sources, return_counts=True)
+        indptr = np.zeros(len(source_ids) + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+        return CsrAdjacency(source_ids, indptr, targets)
+
+    def __len__(self) -> int:
+        """
+        The number of links.
+        """
+        return len(self.target_ids)
+
+    def targets_of(self, record_id: int) -> np.ndarray:
+        """
+        The record IDs of the targets of a source record, empty if it has none.
+        """
+        index = np.searchsorted(self.source_ids, record_id)
+        if index == len(self.source_ids) or self.source_ids[index] != record_id:
+            return _EMPTY
+        return self.target_ids[self.indptr[index]:self.indptr[index + 1]]
+
+    def edges(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        The links as two arrays of the same length, the source and the target record ID of each link.
+        """
+        return np.repeat(self.source_ids, np.diff(self.indptr)), self.target_ids
+
+    def unique_target_ids(self) -> np.ndarray:
+        return np.unique(self.target_ids)
+
+    def then(self, other: CsrAdjacency) -> CsrAdjacency:
+        """
+        The links from the sources of this adjacency to the targets of another, through the targets of this one.
+        """
+        sources, middles = self.edges()
+        if len(middles) == 0 or len(other.source_ids) == 0:
+            return CsrAdjacency.from_edges(_EMPTY, _EMPTY)
+        rows = np.minimum(np.searchsorted(other.source_ids, middles), len(other.source_ids) - 1)
+        starts = other.indptr[rows]
+        counts = np.where(other.source_ids[rows] == middles, other.indptr[rows + 1] - starts, 0)
+        # The positions in other.target_ids of the targets of every middle record, one run per link of this one.
+        offsets = np.repeat(starts - (np.cumsum(counts) - counts), counts) + np.arange(counts.sum())
+        return CsrAdjacency.from_edges(np.repeat(sources, counts), other.target_ids[offsets])
+
+
+@dataclass(frozen=True)
+class HierarchyTraversal:
+    """
+    The links found by traverse_hierarchy(). hops[i] links the records of path[i] to those of path[i + 1].
+    """
+    path: List[str]
+    hops: List[CsrAdjacency]
+
+    def end_to_end(self) -> CsrAdjacency:
+        """
+        The links from the records the traversal started from to the records of the last data type of the path.
+        """
+        result = self.hops[0]
+        for hop in self.hops[1:]:
+            result = result.then(hop)
+        return result
+
+
+def traverse_hierarchy(user: SapioUser, record_ids: Iterable[int], path: Sequence[str], parents: bool = False,
+                       chunk_size: int = DEFAULT_CHUNK_SIZE, page_size: int = DEFAULT_PAGE_SIZE,
+                       executor: Optional[Executor] = None) -> HierarchyTraversal:
+    """
+    Follow the hierarchy from records of the first data type of a path through each data type after it.
+
+        traversal = traverse_hierarchy(user, project_ids, ["Project", "Sample", "QCDatum"])
+        qc_data_ids = traversal.end_to_end().targets_of(project_id)
+
+    Each level starts from the distinct records the level before it reached, so a record reached from several others
+    is only read from once.
+
+    :param user: The user that reads the hierarchy.
+    :param record_ids: The record IDs of the records of the first data type to start from.
+    :param path: The data types to pass through, starting with the data type of record_ids.
+    :param parents: Whether to walk up to parents rather than down to children.
+    :param chunk_size: How many record IDs are sent in one batch call.
+    :param page_size: How many records each page of a batch call returns.
+    :param executor: The thread pool to read the chunks on. Defaults to the pool shared by the process.
+    """
+    if len(path) < 2:
+        raise ValueError("A path needs at least two data types.")
+    executor = executor or get_request_executor()
+    data_record_manager = DataMgmtServer.get_data_record_manager(user)
+
+    def read_chunk(chunk: List[int], source_type: str, target_type: str) -> Tuple[np.ndarray, np.ndarray]:
+        sources: List[int] = []
+        targets: List[int] = []
+        criteria: Optional[DataRecordPojoHierarchyPageCriteria] = DataRecordPojoHierarchyPageCriteria(
+            page_size=page_size)
+        while criteria is not None:
+            if parents:
+                page = data_record_manager.get_parents_list(list(chunk), source_type, target_type, criteria)
+            else:
+                page = data_record_manager.get_children_list(list(chunk), target_type, criteria)
+            for source_id, records in page.result_map.items():
+                sources.extend([int(source_id)] * len(records))
+                targets.extend(record.record_id for record in records)
+            criteria = page.next_page_criteria if page.is_next_page_available else None
+        return np.array(sources, dtype=np.int64), np.array(targets, dtype=np.int64)
+
+    level = np.unique(np.fromiter(record_ids, dtype=np.int64))
+    hops: List[CsrAdjacency] = []
+    for source_type, target_type in zip(path, path[1:]):
+        chunks = [level[i:i + chunk_size].tolist() for i in range(0, len(level), chunk_size)]
+        results = list(executor.map(lambda chunk: read_chunk(chunk, source_type, target_type), chunks))
+        hop = CsrAdjacency.from_edges(np.concatenate([x[0] for x in results] or [_EMPTY]),
+                                      np.concatenate([x[1] for x in results] or [_EMPTY]))
+        hops.append(hop)
+        level = hop.unique_target_ids()
+    return HierarchyTraversal(list(path), hops)
@@ -0,0 +1,352 @@
+"""
+A pool of keep-alive HTTP connections to Sapio servers, shared by the users and threads of a process.
+"""
+from __future__ import annotations
+
+import sys
+import threading
+import traceback
+from dataclasses import dataclass, replace
+from typing import IO, Any, Callable, Collection, Dict, List, Optional
+from weakref import WeakKeyDictionary
+
+import requests
+from flask import request
+from requests import Response
+from requests.adapters import HTTPAdapter
+from sapiopylib.rest.User import SapioUser, parse_session_additional_data
+from sapiopylib.rest.WebhookService import AbstractWebhookHandler
+from sapiopylib.rest.pojo.webhook.WebhookContext import SapioWebhookContext, SapioWebhookContextParser
+from sapiopylib.rest.pojo.webhook.WebhookResult import SapioWebhookResult
+from sapiopylib.rest.utils.Protocols import ElnEntryStep, ElnExperimentProtocol
+from urllib3.connectionpool import HTTPConnectionPool
+from urllib3.util.retry import Retry
+
+from sapio_utils.data_type_cache import get_record_model_manager
+from sapio_utils.wire_format import accept_encoding_header, accept_header, decode_json
+
+# Servers that a process keeps connections to. Connections beyond pool_maxsize for one server are closed after use.
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 32
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.2
+DEFAULT_RETRY_STATUSES = (502, 503, 504)
+# Only requests that can be repeated safely are retried once the server has received them. Requests that could not
+# connect are retried whatever their method, since the server never saw them.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Called with the user, the method, the URL below the user's URL, the query parameters, the JSON payload and the
+# response of each request a PooledSapioUser sends to a JSON endpoint.
+RequestListener = Callable[[SapioUser, str, str, Optional[dict], Any, Response], None]
+
+
+@dataclass(frozen=True)
+class HttpPoolStats:
+    """
+    Counters of an HttpPool since it was created or since its counters were last reset. Requests that failed count as
+    requests, and their retries only count when the last attempt got a response.
+
+    Every connection opened costs a TCP handshake, and a TLS handshake for HTTPS. A request that does not open one
+    reused a kept-alive connection. The connections are counted by the connection pools urllib3 keeps for each server,
+    so those of a server the pool has stopped keeping connections to, past pool_connections servers, are not counted.
+
+    bytes_received is the size of the response bodies as sent, compressed or not, and bytes_decompressed their size
+    once decompressed. Streamed responses are not included in either.
+    """
+    requests: int = 0
+    connections_opened: int = 0
+    retries: int = 0
+    bytes_received: int = 0
+    bytes_decompressed: int = 0
+
+    @property
+    def connections_reused(self) -> int:
+        return max(self.requests - self.connections_opened, 0)
+
+    @property
+    def reuse_ratio(self) -> float:
+        return self.connections_reused / self.requests if self.requests else 0.0
+
+    @property
+    def compression_ratio(self) -> float:
+        return self.bytes_decompressed / self.bytes_received if self.bytes_received else 1.0
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "connectionsOpened": self.connections_opened,
+            "connectionsReused": self.connections_reused,
+            "retries": self.retries,
+            "reuseRatio": self.reuse_ratio,
+            "bytesReceived": self.bytes_received,
+            "bytesDecompressed": self.bytes_decompressed,
+            "compressionRatio": self.compression_ratio,
+        }
+
+
+class HttpPool:
+    """
+    Keeps HTTP connections to Sapio servers open between requests, instead of opening one for every request.
+
+    The connections are shared by every thread, up to pool_maxsize connections per server. Each thread gets its own
+    requests.Session, since a session is not safe to share between threads, and every session sends its requests
+    through the same connection pool. Failed requests are retried up to max_retries times, waiting backoff_factor
+    seconds and then twice as long each time: connection errors for every method, and errors or retry_statuses
+    responses only for the methods that can be repeated safely.
+
+    Requests are not pipelined. The connection pool sends one request at a time on a connection, which is what
+    servers handle reliably, and runs concurrent requests on separate connections instead.
+
+    Requests ask for compressed responses. The requests of PooledSapioUser.send_json() also ask for MessagePack rather
+    than JSON if binary_encoding is set, as described in sapio_utils.wire_format. Servers that offer neither answer
+    with plain JSON, which is read as before.
+    """
+
+    def __init__(self, pool_connections: int = DEFAULT_POOL_CONNECTIONS, pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+                 max_retries: int = DEFAULT_MAX_RETRIES, backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+                 retry_statuses: Collection[int] = DEFAULT_RETRY_STATUSES, keep_alive: bool = True,
+                 pool_block: bool = False, binary_encoding: bool = True):
+        """
+        :param pool_connections: How many servers to keep connections to.
+        :param pool_maxsize: How many connections to keep open to each server.
+        :param max_retries: How many times a failed request is retried. 0 disables retries.
+        :param backoff_factor: How many seconds to wait before the second retry, doubling for each retry after it.
+        :param retry_statuses: The response statuses that are retried, for the methods that can be repeated safely.
+        :param keep_alive: Whether to keep connections open after a response. If false, every request opens a new one.
+        :param pool_block: Whether a request waits for a connection when pool_maxsize connections are in use, rather
+            than opening one that is closed after use.
+        :param binary_encoding: Whether PooledSapioUser.send_json() asks for MessagePack responses, if the msgpack
+            package is installed.
+        """
+        self.keep_alive = keep_alive
+        self.binary_encoding = binary_encoding
+        self._stats = HttpPoolStats()
+        self._stats_lock = threading.Lock()
+        self._sessions = threading.local()
+        self._request_listeners: List[RequestListener] = []
+        retry = Retry(total=max_retries, connect=max_retries, read=max_retries, status=max_retries,
+                      backoff_factor=backoff_factor, status_forcelist=retry_statuses,
+                      allowed_methods=IDEMPOTENT_METHODS, raise_on_status=False)
+        self._adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+                                    max_retries=retry, pool_block=pool_block)
+        # The connections each server's pool had opened when the counters were last reset.
+        self._connections_at_reset: WeakKeyDictionary[HTTPConnectionPool, int] = WeakKeyDictionary()
+
+    def session(self) -> requests.Session:
+        """
+        The session of the current thread, created on first use.
+        """
+        session: Optional[requests.Session] = getattr(self._sessions, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.mount("http://", self._adapter)
+            session.mount("https://", self._adapter)
+            session.headers["Accept-Encoding"] = accept_encoding_header()
+            if not self.keep_alive:
+                session.headers["Connection"] = "close"
+            self._sessions.session = session
+        return session
+
+    def request(self, method: str, url: str, **kwargs: Any) -> Response:
+        """
+        Send a request through the pool. Takes the same arguments as requests.request().
+        """
+        retries = received = decompressed = 0
+        try:
+            response = self.session().request(method, url, **kwargs)
+            retries = len(getattr(getattr(response.raw, "retries", None), "history", ()))
+            if not kwargs.get("stream") and hasattr(response.raw, "tell"):
+                received, decompressed = response.raw.tell(), len(response.content)
+            return response
+        finally:
+            with self._stats_lock:
+                self._stats = replace(self._stats, requests=self._stats.requests + 1,
+                                      retries=self._stats.retries + retries,
+                                      bytes_received=self._stats.bytes_received + received,
+                                      bytes_decompressed=self._stats.bytes_decompressed + decompressed)
+
+    def stats(self) -> HttpPoolStats:
+        with self._stats_lock:
+            return replace(self._stats, connections_opened=sum(
+                max(pool.num_connections - self._connections_at_reset.get(pool, 0), 0) for pool in self._pools()))
+
+    def reset_stats(self) -> None:
+        with self._stats_lock:
+            self._stats = HttpPoolStats()
+            self._connections_at_reset = WeakKeyDictionary({pool: pool.num_connections for pool in self._pools()})
+
+    def add_request_listener(self, listener: RequestListener) -> None:
+        """
+        Call a listener after each request that a PooledSapioUser of this pool sends to a JSON endpoint, such as
+        ReportCache.request_sent, which drops the cached reports on the data types whose records the request changed.
+        Listeners are called in the order they were added, on the thread that sent the request.
+        """
+        self._request_listeners.append(listener)
+
+    def close(self) -> None:
+        """
+        Close every connection the pool has open. The pool opens new ones for the requests sent after this.
+        """
+        self._adapter.close()
+
+    def _pools(self) -> List[HTTPConnectionPool]:
+        """
+        The connection pools urllib3 keeps, one for each server.
+        """
+        pools = self._adapter.poolmanager.pools
+        return [pool for pool in (pools.get(key) for key in pools.keys()) if pool is not None]
+
+
+class PooledSapioUser(SapioUser):
+    """
+    A SapioUser that sends its requests through an HttpPool, so that its requests reuse the connections that other
+    requests of the process opened to the same server. Takes the same arguments as SapioUser, and the pool to use.
+
+    The requests of post(), get(), put(), delete(), send_json() and the stream methods go through the pool. The plugin
+    endpoint methods are sent as SapioUser sends them. Only send_json() asks for MessagePack, since it decodes the
+    response itself. The responses of post(), get(), put() and delete() are JSON, as sapiopylib's managers read them.
+
+    The user of a webhook context is created by sapiopylib, so handlers that want theirs pooled extend
+    PooledWebhookHandler, which creates the context with a PooledSapioUser.
+    """
+    http_pool: HttpPool
+
+    def __init__(self, url: str, *args: Any, http_pool: Optional[HttpPool] = None, **kwargs: Any):
+        super().__init__(url, *args, **kwargs)
+        self.http_pool = http_pool or HTTP_POOL
+
+    def post(self, url_sub_path: str, params: Optional[dict] = None, payload=None,
+             is_payload_plain_text: bool = False) -> Response:
+        return self._send("POST", url_sub_path, params, payload, is_payload_plain_text)
+
+    def get(self, url_sub_path: str, params: Optional[dict] = None) -> Response:
+        return self._send("GET", url_sub_path, params)
+
+    def delete(self, url_sub_path: str, params: Optional[dict] = None, payload=None) -> Response:
+        return self._send("DELETE", url_sub_path, params, payload)
+
+    def put(self, url_sub_path: str, params: Optional[dict] = None, payload=None,
+            is_payload_plain_text: bool = False) -> Response:
+        return self._send("PUT", url_sub_path, params, payload, is_payload_plain_text)
+
+    def send_json(self, method: str, url_sub_path: str, params: Optional[dict] = None, payload=None) -> Any:
+        """
+        Send a request to a JSON endpoint and return the value of its response, decoded by decode_json() in the
+        encoding the server chose. Bulk reads that parse the value themselves, rather than through a manager, get
+        MessagePack this way.
+
+        :param method: The HTTP method of the request.
+        :param url_sub_path: The path of the endpoint, under the URL of the user.
+        :param params: The query parameters of the request.
+        :param payload: The JSON payload of the request.
+        """
+        response = self._send(method, url_sub_path, params, payload, binary=self.http_pool.binary_encoding)
+        self.raise_for_status(response)
+        return decode_json(response)
+
+    def post_data_stream(self, url_sub_path: str, data_stream: IO, params: Optional[dict] = None):
+        headers = self.get_http_headers()
+        headers['Content-Type'] = 'application/octet-stream'
+        return self.http_pool.request("POST", self.url + url_sub_path, params=params, data=data_stream,
+                                      headers=headers, verify=self.verify_ssl_cert, timeout=self.timeout_seconds)
+
+    def consume_octet_stream_get(self, url_sub_path: str, data_sink: Callable[[bytes], None],
+                                 params: Optional[dict] = None, chunk_size=1024 * 1024) -> Response:
+        return self._consume("GET", url_sub_path, data_sink, params, None, chunk_size)
+
+    def consume_octet_stream_post(self, url_sub_path: str, data_sink: Callable[[bytes], None],
+                                  params: Optional[dict] = None, payload=None, chunk_size=1024 * 1024) -> Response:
+        return self._consume("POST", url_sub_path, data_sink, params, payload, chunk_size)
+
+    def _send(self, method: str, url_sub_path: str, params: Optional[dict], payload: Any = None,
+              is_payload_plain_text: bool = False, binary: bool = False) -> Response:
+        headers = self.get_http_headers()
+        headers['Accept'] = accept_header(binary)
+        body: Dict[str, Any] = {}
+        if is_payload_plain_text:
+            headers['Content-Type'] = 'application/json'
+            body["data"] = payload
+        elif method != "GET":
+            body["json"] = payload
+        response = self.http_pool.request(method, self.url + url_sub_path, params=params, headers=headers,
+                                          verify=self.verify_ssl_cert, timeout=self.timeout_seconds, **body)
+        for listener in self.http_pool._request_listeners:
+            # The request was sent either way, so a listener that fails must not fail it.
+            # noinspection PyBroadException
+            try:
+                listener(self, method, url_sub_path, params, payload, response)
+            except Exception:
+                print(f'Error occurred in a request listener of {method} {url_sub_path}. See traceback.',
+                      file=sys.stderr)
+                traceback.print_exc()
+        return response
+
+    def _consume(self, method: str, url_sub_path: str, data_sink: Callable[[bytes], None], params: Optional[dict],
+                 payload: Any, chunk_size: int) -> Response:
+        response = self.http_pool.request(method, self.url + url_sub_path, params=params, json=payload,
+                                          headers=self.get_http_headers(), verify=self.verify_ssl_cert,
+                                          timeout=self.timeout_seconds, stream=True)
+        self.raise_for_status(response)
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            data_sink(chunk)
+        return response
+
+
+def parse_pooled_webhook(json_dct: Dict[str, Any], timeout_seconds: int = 60, verify_ssl_cert: bool = True,
+                         http_pool: Optional[HttpPool] = None) -> SapioWebhookContext:
+    """
+    Parse the body of a webhook request like SapioWebhookContextParser.parse_webhook(), into a context whose user is
+    a PooledSapioUser, and whose managers send their requests through that user.
+
+    :param json_dct: The JSON body of the webhook request.
+    :param timeout_seconds: The request timeout of the context's user.
+    :param verify_ssl_cert: Whether the context's user verifies the certificate of the Sapio server.
+    :param http_pool: The pool to use. Defaults to the pool shared by the process.
+    """
+    parsed = SapioWebhookContextParser.parse_webhook(json_dct, timeout_seconds, verify_ssl_cert)
+    session_additional_data_raw = json_dct.get("sessionAdditionalData")
+    user = PooledSapioUser(parsed.user.url, verify_ssl_cert=verify_ssl_cert, timeout_seconds=timeout_seconds,
+                           api_token=parsed.user.api_token, username=parsed.user.username, guid=parsed.user.guid,
+                           group_name=parsed.user.group_name,
+                           session_additional_data=(parse_session_additional_data(session_additional_data_raw)
+                                                    if session_additional_data_raw else None),
+                           http_pool=http_pool)
+    context = SapioWebhookContext(user, parsed.end_point_type)
+    # The active protocol and step hold the user they were built with, so they are built again for the pooled user,
+    # as parse_webhook() builds them. Everything else the webhook sent is the same as parsed.
+    if getattr(parsed, "active_protocol", None) is not None:
+        context.active_protocol = ElnExperimentProtocol(eln_experiment=parsed.eln_experiment, user=user)
+        if getattr(parsed, "active_step", None) is not None:
+            context.active_step = ElnEntryStep(protocol=context.active_protocol, eln_entry=parsed.experiment_entry)
+    for name, value in vars(parsed).items():
+        vars(context).setdefault(name, value)
+    return context
+
+
+class PooledWebhookHandler(AbstractWebhookHandler):
+    """
+    A webhook handler whose context's user is a PooledSapioUser, so that its requests reuse the connections of the
+    handlers invoked before it. Register it with a WebhookConfiguration like any other handler.
+
+    The record model manager of the context's user is created with get_record_model_manager() before run() is
+    called, so RecordModelManager(context.user) reads data type and field definitions through DATA_TYPE_CACHE rather
+    than fetching them on every invocation.
+    """
+
+    def post(self) -> Dict[str, Any]:
+        """
+        Internal method to be executed to translate incoming requests.
+        """
+        context = parse_pooled_webhook(request.json, self.client_timeout_seconds, self.verify_sapio_cert)
+        get_record_model_manager(context.user)
+        # noinspection PyBroadException
+        try:
+            return self.run(context).to_json()
+        except Exception:
+            print('Error occurred while running webhook custom logic. See traceback.', file=sys.stderr)
+            traceback.print_exc()
+            return SapioWebhookResult(False, display_text="Error occurred during webhook execution.").to_json()
+
+
+# The pool shared by the process, used by PooledSapioUsers that are not given one.
+HTTP_POOL = HttpPool()
@@ -0,0 +1,203 @@
+"""
+Scans of the records of a data type that read several record ID ranges from the Sapio server at the same time.
+
+The auto-pagers of sapiopylib read a data type one page after the other, since each page is requested with criteria
+from the page before it. A ParallelRecordScan instead splits the record IDs of the type into ranges, and reads each
+range with its own custom reports, on several threads at once.
+"""
+from __future__ import annotations
+
+import queue
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import pandas as pd
+from sapiopylib.rest.DataMgmtService import DataMgmtServer
+from sapiopylib.rest.User import SapioUser
+from sapiopylib.rest.pojo.CustomReport import AbstractReportTerm, CustomReportCriteria, ReportColumn
+from sapiopylib.rest.pojo.Sort import SortDirection
+from sapiopylib.rest.pojo.datatype.FieldDefinition import AbstractVeloxFieldDefinition, FieldType
+
+from sapio_utils.record_selection import DEFAULT_PAGE_SIZE
+from sapio_utils.report_terms import RECORD_ID_FIELD, all_of, record_id_range_term
+
+# How many ranges are read at the same time. Past the number of reports the server runs at once, more only queue up.
+DEFAULT_WORKERS = 8
+# Record IDs are shared by every data type, so the records of one type are spread unevenly over its ranges. Each
+# worker gets several ranges, so that a worker whose range turned out sparse moves on to another one.
+PARTITIONS_PER_WORKER = 4
+
+# Put in the queue of pages when a range has been read.
+_RANGE_DONE = object()
+
+
+def record_id_bounds(user: SapioUser, data_type_name: str, root_term: Optional[AbstractReportTerm] = None,
+                     executor: Optional[Executor] = None) -> Optional[Tuple[int, int]]:
+    """
+    The lowest and highest record IDs of the records of a data type that match root_term, or None if none do. Runs
+    two one-row reports, at the same time if an executor is provided.
+    """
+    report_manager = DataMgmtServer.get_custom_report_manager(user)
+
+    def first_record_id(direction: SortDirection) -> Optional[int]:
+        column = ReportColumn(data_type_name, RECORD_ID_FIELD, FieldType.LONG, sort_direction=direction)
+        # A report only includes a data type that one of its terms is on, so the range of all record IDs is added.
+        term = all_of([term for term in (root_term, record_id_range_term(data_type_name, first=0)) if term])
+        report = report_manager.run_custom_report(CustomReportCriteria([column], term, page_size=1, page_number=0))
+        return int(report.result_table[0][0]) if report.result_table else None
+
+    if executor is None:
+        lowest, highest = first_record_id(SortDirection.ASCENDING), first_record_id(SortDirection.DESCENDING)
+    else:
+        futures = [executor.submit(first_record_id, x) for x in (SortDirection.ASCENDING, SortDirection.DESCENDING)]
+        lowest, highest = [future.result() for future in futures]
+    if lowest is None or highest is None:
+        return None
+    return lowest, highest
+
+
+def record_id_partitions(first: int, last: int, count: int) -> List[Tuple[int, int]]:
+    """
+    Split the record IDs from first to last, inclusive, into at most count ranges of about the same width. Each range
+    is (start, stop), from start up to but not including stop.
+    """
+    count = max(1, min(count, last - first + 1))
+    width, extra = divmod(last - first + 1, count)
+    partitions: List[Tuple[int, int]] = []
+    start = first
+    for index in range(count):
+        stop = start + width + (index < extra)
+        partitions.append((start, stop))
+        start = stop
+    return partitions
+
+
+class ParallelRecordScan(Iterator[List[Dict[str, Any]]]):
+    """
+    Pages of the field maps of every record of a data type, read by several threads at once, each thread reading its
+    own range of record IDs.
+
+        with ParallelRecordScan(user, "QCDatum", fields, workers=8) as scan:
+            for page in scan:
+                ...
+
+    Pages are returned as they arrive, so records from different ranges are interleaved. Within a range, records are
+    in record ID order, and the pages of a range are read by asking for the records past the last record ID of the
+    page before, which the server can answer from its index however far into the range it is. to_data_frame() returns
+    every record at once, in record ID order.
+
+    At most two pages per worker wait to be returned, so memory stays bounded however large the data type is. If the
+    caller stops before the last page, close the scan, or use it in a with statement, so that the workers stop.
+    """
+
+    def __init__(self, user: SapioUser, data_type_name: str, fields: List[AbstractVeloxFieldDefinition],
+                 root_term: Optional[AbstractReportTerm] = None, workers: int = DEFAULT_WORKERS,
+                 partitions: Optional[int] = None, page_size: int = DEFAULT_PAGE_SIZE):
+        """
+        :param user: The user that runs the reports.
+        :param data_type_name: The data type of the records.
+        :param fields: The fields to read. The record ID is always read, as the first field of each field map.
+        :param root_term: Restricts the records that are read, or None for all records of the type.
+        :param workers: How many ranges to read at the same time.
+        :param partitions: How many ranges to split the record IDs into. Defaults to PARTITIONS_PER_WORKER per worker.
+        :param page_size: How many records each report returns at most.
+        """
+        if workers < 1:
+            raise ValueError("A scan needs at least one worker.")
+        self.user = user
+        self.data_type_name = data_type_name
+        self.root_term = root_term
+        self.workers = workers
+        self.partitions = partitions or workers * PARTITIONS_PER_WORKER
+        self.page_size = page_size
+        self.pages_read = 0
+        self.report_manager = DataMgmtServer.get_custom_report_manager(user)
+        # Sorted by record ID, so that each page ends with the highest record ID read so far in its range.
+        columns = [ReportColumn(data_type_name, RECORD_ID_FIELD, FieldType.LONG,
+                                sort_direction=SortDirection.ASCENDING)]
+        columns += [ReportColumn(data_type_name, field.data_field_name, field.data_field_type) for field in fields
+                    if field.data_field_name != RECORD_ID_FIELD]
+        self.columns = columns
+        self._field_names = [column.data_field_name for column in columns]
+        self._pages: queue.Queue = queue.Queue(maxsize=2 * workers)
+        self._closed = threading.Event()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._ranges_left: Optional[int] = None
+
+    def __next__(self) -> List[Dict[str, Any]]:
+        if self._ranges_left is None:
+            self._start()
+        while self._ranges_left and not self._closed.is_set():
+            page = self._pages.get()
+            if page is _RANGE_DONE:
+                self._ranges_left -= 1
+                continue
+            if isinstance(page, BaseException):
+                self.close()
+                raise page
+            self.pages_read += 1
+            return page
+        self.close()
+        raise StopIteration
+
+    def to_data_frame(self) -> pd.DataFrame:
+        """
+        Every remaining record as a data frame with a column per field, in record ID order.
+        """
+        rows = [row for page in self for row in page]
+        data_frame = pd.DataFrame(rows, columns=self._field_names)
+        return data_frame.sort_values(RECORD_ID_FIELD, kind="stable", ignore_index=True)
+
+    def close(self) -> None:
+        """
+        Stop the workers. Reports that are already running are left to finish, and their pages are discarded.
+        """
+        self._closed.set()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        # Make room for workers that are waiting to queue a page, so that they see the scan is closed.
+        while not self._pages.empty():
+            self._pages.get_nowait()
+
+    def __enter__(self) -> ParallelRecordScan:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _start(self) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="sapio-scan")
+        bounds = record_id_bounds(self.user, self.data_type_name, self.root_term, self._executor)
+        if bounds is None:
+            self._ranges_left = 0
+            return
+        ranges = record_id_partitions(bounds[0], bounds[1], self.partitions)
+        self._ranges_left = len(ranges)
+        for start, stop in ranges:
+            self._executor.submit(self._read_range, start, stop)
+
+    def _read_range(self, start: int, stop: int) -> None:
+        try:
+            while not self._closed.is_set():
+                range_term = record_id_range_term(self.data_type_name, start, stop)
+                term = all_of([term for term in (self.root_term, range_term) if term])
+                criteria = CustomReportCriteria(self.columns, term, page_size=self.page_size, page_number=0)
+                report = self.report_manager.run_custom_report(criteria)
+                page = [dict(zip(self._field_names, row)) for row in report.result_table]
+                if page:
+                    self._put(page)
+                if not page or not report.has_next_page:
+                    break
+                start = int(page[-1][RECORD_ID_FIELD]) + 1
+            self._put(_RANGE_DONE)
+        except BaseException as e:
+            self._put(e)
+
+    def _put(self, item: Any) -> None:
+        while not self._closed.is_set():
+            try:
+                self._pages.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                pass
@@ -0,0 +1,109 @@
+"""
+Auto-pagers that read the next pages from the Sapio server while the caller is still working on the current one.
+"""
+from __future__ import annotations
+
+import queue
+import threading
+from typing import Any, Generic, Iterator, Optional, TypeVar
+
+from sapiopylib.rest.utils.autopaging import SapioPyAutoPager
+
+ItemType = TypeVar("ItemType")
+
+# How many pages to read ahead of the page the caller is on.
+DEFAULT_DEPTH = 2
+
+# Put in the queue of pages after the last page.
+_DONE = object()
+
+
+class PrefetchingAutoPager(Generic[ItemType], Iterator[ItemType]):
+    """
+    Iterates over the items of a sapiopylib auto-pager, like the auto-pager itself, while a background thread reads
+    up to depth pages ahead.
+
+        with PrefetchingAutoPager(QueryAllRecordsOfTypeAutoPager("Sample", user)) as samples:
+            for sample in samples:
+                ...
+
+    Each page of an auto-pager is requested with criteria from the page before it, so the pages are still read one
+    after the other. What the prefetching saves is the time the caller spends on each page: instead of a round trip
+    and then the caller's work on the page, a page costs whichever of the two takes longer. At most depth + 1 pages
+    are in memory at a time: the page the caller is on, and the pages read or being read ahead of it.
+
+    The auto-pager must not be used by anything else once it is wrapped. If the caller stops before the last page,
+    close the pager, or use it in a with statement, so that the background thread stops reading.
+    """
+
+    def __init__(self, pager: SapioPyAutoPager[Any, ItemType], depth: int = DEFAULT_DEPTH):
+        """
+        :param pager: The auto-pager to read the pages of. Its max_page is respected.
+        :param depth: How many pages to read ahead of the page the caller is on, at least 1.
+        """
+        if depth < 1:
+            raise ValueError("The read-ahead depth must be at least 1.")
+        self.pager = pager
+        self.depth = depth
+        self.has_iterated = False
+        self._pages: queue.Queue = queue.Queue()
+        # One slot for each page that may be read ahead. The caller frees a slot when it moves on to the next page.
+        self._slots = threading.Semaphore(depth)
+        self._closed = threading.Event()
+        self._current: Iterator[ItemType] = iter(())
+        self._thread: Optional[threading.Thread] = None
+
+    def __iter__(self) -> PrefetchingAutoPager[ItemType]:
+        return self
+
+    def __next__(self) -> ItemType:
+        if not self.has_iterated:
+            self.has_iterated = True
+            self._thread = threading.Thread(target=self._read_ahead, name="sapio-prefetch", daemon=True)
+            self._thread.start()
+        while True:
+            for item in self._current:
+                return item
+            if self._closed.is_set():
+                raise StopIteration
+            page = self._pages.get()
+            if page is _DONE:
+                self._closed.set()
+                raise StopIteration
+            if isinstance(page, BaseException):
+                self.close()
+                raise page
+            self._current = page
+            self._slots.release()
+
+    def close(self) -> None:
+        """
+        Stop reading ahead. The pages that were already read are discarded.
+        """
+        self._closed.set()
+        # Wake the background thread if it is waiting for a slot, so that it sees the pager is closed.
+        self._slots.release()
+        self._current = iter(())
+
+    def __enter__(self) -> PrefetchingAutoPager[ItemType]:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _read_ahead(self) -> None:
+        pager = self.pager
+        try:
+            while pager.next_page_criteria is not None:
+                self._slots.acquire()
+                if self._closed.is_set():
+                    return
+                pager.cur_page += 1
+                if pager.max_page is not None and 0 < pager.max_page < pager.cur_page:
+                    break
+                pager.next_page_criteria, page = pager.get_next_page_result()
+                # The auto-pagers return each page as a queue of its items.
+                self._pages.put(iter(list(page.queue)))
+            self._pages.put(_DONE)
+        except BaseException as e:
+            self._pages.put(e)
@@ -0,0 +1,124 @@
+"""
+Record selection dialogs that read and show the records of a data type one page at a time.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, Iterator, List, Optional
+
+from sapiopylib.rest.ClientCallbackService import ClientCallback
+from sapiopylib.rest.DataMgmtService import DataMgmtServer
+from sapiopylib.rest.User import SapioUser
+from sapiopylib.rest.pojo.CustomReport import AbstractReportTerm, CustomReportCriteria, ReportColumn
+from sapiopylib.rest.pojo.DataRecord import DataRecord
+from sapiopylib.rest.pojo.datatype.FieldDefinition import AbstractVeloxFieldDefinition, FieldType
+from sapiopylib.rest.pojo.webhook.ClientCallbackRequest import DataRecordSelectionRequest, OptionDialogRequest
+
+from sapio_utils.record_set import RecordSet
+from sapio_utils.report_terms import RECORD_ID_FIELD
+
+# How many records are read from the server, and shown in the dialog, at a time.
+DEFAULT_PAGE_SIZE = 1000
+
+SHOW_MORE = "Show More"
+DONE = "Done"
+
+
+def visible_fields(fields: List[AbstractVeloxFieldDefinition]) -> List[AbstractVeloxFieldDefinition]:
+    """
+    The fields a record table shows: the visible ones that are stored with the record. Record ID is left out, since
+    every page includes it anyway.
+    """
+    return [field for field in fields
+            if field.visible and field.data_field_type.is_in_record_table and field.data_field_name != RECORD_ID_FIELD]
+
+
+class FieldMapPager(Iterator[List[Dict[str, Any]]]):
+    """
+    Pages of the field maps of the records of a data type, read one custom report page at a time.
+
+    Only the provided fields and the record ID are read, so a page holds what a record table shows and nothing more.
+    The server leaves out the records that do not match root_term. The excluded records are left out of each page once
+    it has been received, for when root_term could not exclude them all. Pages that end up empty are skipped, except
+    that the first page is always returned so that an empty data type still shows an empty dialog.
+
+    Each page is read when it is asked for, so at most one page is held at a time.
+    """
+
+    def __init__(self, user: SapioUser, data_type_name: str, fields: List[AbstractVeloxFieldDefinition],
+                 root_term: Optional[AbstractReportTerm] = None,
+                 excluded_records: Optional[RecordSet[DataRecord]] = None, page_size: int = DEFAULT_PAGE_SIZE):
+        """
+        :param user: The user that runs the reports.
+        :param data_type_name: The data type of the records.
+        :param fields: The fields to read. Use visible_fields() to read what a record table shows.
+        :param root_term: Restricts the records the server returns, or None for all records of the type.
+        :param excluded_records: Records to leave out of the pages.
+        :param page_size: How many records are read from the server at a time.
+        """
+        self.data_type_name = data_type_name
+        self.fields = fields
+        self.excluded_records = excluded_records
+        self.page_size = page_size
+        self.report_manager = DataMgmtServer.get_custom_report_manager(user)
+        columns = [ReportColumn(data_type_name, RECORD_ID_FIELD, FieldType.LONG)]
+        columns += [ReportColumn(data_type_name, field.data_field_name, field.data_field_type) for field in fields]
+        self._field_names = [column.data_field_name for column in columns]
+        self._criteria = CustomReportCriteria(columns, root_term, page_size=page_size, page_number=0)
+        self._has_next_page = True
+        self._returned_page = False
+
+    @property
+    def has_next_page(self) -> bool:
+        """
+        Whether the server may have more records. The next page can still turn out empty once records are excluded.
+        """
+        return self._has_next_page
+
+    def __next__(self) -> List[Dict[str, Any]]:
+        while self._has_next_page:
+            report = self.report_manager.run_custom_report(self._criteria)
+            self._criteria.page_number += 1
+            self._has_next_page = bool(report.has_next_page) and len(report.result_table) > 0
+            page = [dict(zip(self._field_names, row)) for row in report.result_table]
+            if self.excluded_records:
+                page = [field_map for field_map in page
+                        if (self.data_type_name, field_map[RECORD_ID_FIELD]) not in self.excluded_records]
+            if page or not self._returned_page:
+                self._returned_page = True
+                return page
+        raise StopIteration
+
+
+def select_record_ids(client_callback: ClientCallback, pager: FieldMapPager, data_type_display_name: str,
+                      data_type_plural_display_name: str) -> Optional[List[int]]:
+    """
+    Show the records of the pager in a multi-select dialog, one page at a time, and return the record IDs the user
+    chose.
+
+    After each page, if the server has more records, the user is asked whether to show more. Returns None if the user
+    cancels any of the dialogs or chooses no records, and otherwise the record IDs chosen across all pages shown.
+    """
+    selected: List[int] = []
+    shown = 0
+    for page in pager:
+        message = None
+        if shown > 0 or pager.has_next_page:
+            message = f"Showing {data_type_plural_display_name} {shown + 1} to {shown + len(page)}."
+        shown += len(page)
+        request = DataRecordSelectionRequest(data_type_display_name, data_type_plural_display_name, pager.fields, page,
+                                             dialog_message=message, multi_select=True)
+        selection = client_callback.show_data_record_selection_dialog(request)
+        if selection is None:
+            return None
+        selected += [field_map[RECORD_ID_FIELD] for field_map in selection]
+        if not pager.has_next_page:
+            break
+        options = [DONE, SHOW_MORE]
+        choice = client_callback.show_option_dialog(OptionDialogRequest(
+            f"More {data_type_plural_display_name}", f"{len(selected)} selected so far. Show more records?", options,
+            closable=True))
+        if choice is None:
+            return None
+        if options[choice] == DONE:
+            break
+    return selected or None
@@ -0,0 +1,113 @@
+"""
+Sets of records indexed by data type name and record ID, for membership checks that do not compare every pair.
+"""
+from __future__ import annotations
+
+from typing import Dict, Generic, Iterable, Iterator, KeysView, List, Optional, Protocol, Tuple, TypeVar, Union
+
+# A record is identified by its data type name and its record ID.
+RecordKey = Tuple[str, int]
+
+
+class Record(Protocol):
+    """
+    Anything that has a data type name and a record ID: a DataRecord, a PyRecordModel or a wrapped record model.
+    """
+
+    @property
+    def data_type_name(self) -> str: ...
+
+    @property
+    def record_id(self) -> int: ...
+
+
+RecordType = TypeVar("RecordType", bound=Record)
+
+
+def record_key(record: Record) -> RecordKey:
+    """
+    The key a record is indexed by in a RecordSet.
+    """
+    return record.data_type_name, record.record_id
+
+
+class RecordSet(Generic[RecordType], Iterable[RecordType]):
+    """
+    Records indexed by data type name and record ID, in the order they were added.
+
+    Membership, difference and intersection take one dictionary lookup per record. Checking a list of records against
+    a list with `in` takes one DataRecord comparison per pair instead, which adds up quickly for the tables of an
+    experiment. Adding a record with the key of a record already in the set keeps the record that was added first.
+
+    Membership can be checked for any record, or for a key of data type name and record ID.
+    """
+    __slots__ = ("_records",)
+
+    def __init__(self, records: Iterable[RecordType] = ()):
+        self._records: Dict[RecordKey, RecordType] = {}
+        self.update(records)
+
+    def add(self, record: RecordType) -> None:
+        self._records.setdefault(record_key(record), record)
+
+    def update(self, records: Iterable[RecordType]) -> None:
+        for record in records:
+            self.add(record)
+
+    def discard(self, record: Union[Record, RecordKey]) -> None:
+        self._records.pop(self._key(record), None)
+
+    def get(self, key: RecordKey) -> Optional[RecordType]:
+        """
+        The record with the provided data type name and record ID, or None if the set has no such record.
+        """
+        return self._records.get(key)
+
+    def keys(self) -> KeysView[RecordKey]:
+        return self._records.keys()
+
+    def record_ids(self, data_type_name: Optional[str] = None) -> List[int]:
+        """
+        The record IDs of the records in the set, optionally only those of one data type.
+        """
+        return [record_id for type_name, record_id in self._records
+                if data_type_name is None or type_name == data_type_name]
+
+    def difference(self, records: Iterable[RecordType]) -> List[RecordType]:
+        """
+        The provided records that are not in this set, in the order they were provided.
+        """
+        return [record for record in records if record_key(record) not in self._records]
+
+    def intersection(self, records: Iterable[RecordType]) -> List[RecordType]:
+        """
+        The provided records that are in this set, in the order they were provided.
+        """
+        return [record for record in records if record_key(record) in self._records]
+
+    def __sub__(self, other: RecordSet[RecordType]) -> RecordSet[RecordType]:
+        return RecordSet(other.difference(self))
+
+    def __and__(self, other: RecordSet[RecordType]) -> RecordSet[RecordType]:
+        return RecordSet(other.intersection(self))
+
+    def __or__(self, other: RecordSet[RecordType]) -> RecordSet[RecordType]:
+        union = RecordSet(self)
+        union.update(other)
+        return union
+
+    def __contains__(self, record: Union[Record, RecordKey]) -> bool:
+        return self._key(record) in self._records
+
+    def __iter__(self) -> Iterator[RecordType]:
+        return iter(self._records.values())
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __repr__(self) -> str:
+        return f"RecordSet({len(self)} records)"
+
+    @staticmethod
+    def _key(record: Union[Record, RecordKey]) -> RecordKey:
+        return record if isinstance(record, tuple) else record_key(record)
@@ -0,0 +1,362 @@
+"""
+A cache of custom report results, keyed by the criteria of the report in a canonical form, shared by every user and
+thread of the process.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+import urllib.parse
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, FrozenSet, Mapping, Optional, Set, Tuple
+
+from requests import Response
+from sapiopylib.rest.DataMgmtService import DataMgmtServer
+from sapiopylib.rest.User import SapioUser
+from sapiopylib.rest.pojo.CustomReport import CustomReport, CustomReportCriteria
+
+# How long a report result is used before the report is run again, for data types without a TTL of their own.
+DEFAULT_TTL_SECONDS = 60.0
+# How many values, summed over every cached report (rows times columns), are kept in memory at most.
+DEFAULT_MAX_CELLS = 2_000_000
+
+_COMPOSITE_TERM = "COMPOSITE_TERM"
+# AND and OR give the same result whatever the order of their operands, and however they are nested.
+_COMMUTATIVE_OPERATIONS = frozenset({"AND_OPERATOR", "OR_OPERATOR"})
+# The keys of the JSON of report criteria and of record payloads that hold data type names.
+_DATA_TYPE_KEYS = frozenset({"dataTypeName", "leftDataTypeName", "rightDataTypeName", "rootDataType",
+                             "relatedRecordType", "childTypeName", "parentTypeName"})
+
+# Requests under /datarecord that only read records, although they are not GET requests.
+_READ_ONLY_PATHS = re.compile(r"^/datarecord(?:manager/querydatarecords|list|list/(?:parents|childrenbyid|ancestors|"
+                              r"descendants|sidelinksto|sidelinksfrom|getlastsaved)|/access/.*|/datarecordacl/"
+                              r"(?!revert$)[^/]+)/?$")
+# Requests that add, change or delete the records of the data type in their path.
+_DATA_TYPE_PATHS = re.compile(r"^/datarecord(?:list)?/(?:fields/)?([^/]+)(?:/-?\d+)?/?$")
+_NOT_DATA_TYPES = frozenset({"delete", "children", "fields", "runbatchupdate", "datarecordacl"})
+
+_Key = Tuple[str, str]
+
+
+@dataclass(frozen=True)
+class ReportCacheStats:
+    """
+    Counters of a ReportCache since it was created or since its counters were last reset. disk_hits are the hits
+    that were read from the disk tier, and are included in hits.
+    """
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "diskHits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "hitRatio": self.hit_ratio,
+        }
+
+
+def canonical_term(term: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    The JSON of a report term in a canonical form, in which terms that always match the same records are equal.
+
+    The operands of nested ANDs, or of nested ORs, are collected into a single operand list, in a fixed order and
+    without repeats, so that (a AND b) AND c, c AND (b AND a) and a AND b AND c AND a have the same canonical form.
+    """
+    if term is None or term.get("termType") != _COMPOSITE_TERM:
+        return term
+    operation = term["termOperation"]
+    operands: Dict[str, Dict[str, Any]] = {}
+
+    def collect(child: Dict[str, Any]) -> None:
+        if (child.get("termType") == _COMPOSITE_TERM and child["termOperation"] == operation
+                and operation in _COMMUTATIVE_OPERATIONS and not child.get("negated")):
+            collect(child["leftChild"])
+            collect(child["rightChild"])
+            return
+        canonical = canonical_term(child)
+        operands[json.dumps(canonical, sort_keys=True, separators=(",", ":"))] = canonical
+
+    collect(term["leftChild"])
+    collect(term["rightChild"])
+    if operation not in _COMMUTATIVE_OPERATIONS:
+        return {**term, "leftChild": canonical_term(term["leftChild"]),
+                "rightChild": canonical_term(term["rightChild"])}
+    if len(operands) == 1 and not term.get("negated"):
+        return next(iter(operands.values()))
+    return {"termType": _COMPOSITE_TERM, "negated": bool(term.get("negated")), "termOperation": operation,
+            "operands": [operands[key] for key in sorted(operands)]}
+
+
+def canonical_criteria(criteria: CustomReportCriteria) -> Dict[str, Any]:
+    """
+    The JSON of report criteria with its root term and the terms of its joins in their canonical form.
+    """
+    criteria_json = criteria.to_json()
+    criteria_json["rootTerm"] = canonical_term(criteria_json.get("rootTerm"))
+    for join in criteria_json.get("joinList") or []:
+        join["reportTermPojo"] = canonical_term(join.get("reportTermPojo"))
+    return criteria_json
+
+
+def criteria_key(criteria: CustomReportCriteria) -> str:
+    """
+    A hash of the canonical form of report criteria, the same for every criteria that return the same results.
+    """
+    canonical = json.dumps(canonical_criteria(criteria), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def referenced_data_types(value: Any) -> Set[str]:
+    """
+    The data type names in the JSON of report criteria, of their terms or of a record payload.
+    """
+    names: Set[str] = set()
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            for key, child in item.items():
+                if key in _DATA_TYPE_KEYS and isinstance(child, str):
+                    names.add(child)
+                elif isinstance(child, (dict, list)):
+                    stack.append(child)
+        elif isinstance(item, list):
+            stack.extend(x for x in item if isinstance(x, (dict, list)))
+    return names
+
+
+def written_data_types(method: str, url_sub_path: str, params: Optional[dict], payload: Any) -> Optional[Set[str]]:
+    """
+    The data types whose records a request to the Sapio server adds, changes or deletes. Empty if the request does
+    not change records, and None if it changes records of data types it does not name.
+    """
+    if method == "GET" or not url_sub_path.startswith("/datarecord") or _READ_ONLY_PATHS.match(url_sub_path):
+        return set()
+    names = referenced_data_types(payload) | referenced_data_types(params or {})
+    match = _DATA_TYPE_PATHS.match(url_sub_path)
+    if match and match.group(1) not in _NOT_DATA_TYPES:
+        names.add(urllib.parse.unquote(match.group(1)))
+    return names or None
+
+
+class ReportCache:
+    """
+    Caches the results of custom reports, keyed by the server, the user that ran them and a hash of the canonical
+    form of their criteria, so that criteria built differently but with the same meaning share their results.
+
+        report = REPORT_CACHE.run_custom_report(user, criteria)
+
+    Results are kept for the TTL of the data types the criteria reference, the shortest of them, and the least
+    recently used ones are evicted once the cached reports hold more than max_cells values. With a directory, results
+    are also written there and read back when they are no longer in memory, including by later processes, until
+    their TTL runs out.
+
+    Once request_sent() is registered with an HttpPool, records of a data type that are added, changed or deleted
+    through the data record manager or the record model manager of a PooledSapioUser of that pool drop the cached
+    results of every report that references the data type, on disk as well as in memory. Changes made by other
+    users, clients or processes are only picked up once the TTL runs out; call invalidate() to drop results sooner.
+
+    Cached reports are shared by every caller, and must not be modified.
+    """
+
+    def __init__(self, ttl_seconds: float = DEFAULT_TTL_SECONDS, ttl_by_data_type: Optional[Mapping[str, float]] = None,
+                 max_cells: int = DEFAULT_MAX_CELLS, directory: Optional[str] = None,
+                 clock: Callable[[], float] = time.time):
+        """
+        :param ttl_seconds: How long a result is used, for data types without a TTL of their own.
+        :param ttl_by_data_type: The TTL of the reports that reference each data type. 0 disables caching them.
+        :param max_cells: How many values the reports cached in memory hold at most.
+        :param directory: The directory of the disk tier, or None to only cache results in memory.
+        :param clock: The clock that expiry is measured against. Results on disk expire by the same clock.
+        """
+        self.ttl_seconds = ttl_seconds
+        self.ttl_by_data_type = dict(ttl_by_data_type or {})
+        self.max_cells = max_cells
+        self.directory = directory
+        self._clock = clock
+        self._lock = threading.Lock()
+        # (server URL, criteria key) -> (expiry, data types, cells, report).
+        self._entries: OrderedDict[_Key, Tuple[float, FrozenSet[str], int, CustomReport]] = OrderedDict()
+        self._cells = 0
+        # (server URL, data type name or "" for every data type) -> when its results were last dropped.
+        self._invalidated: Dict[Tuple[str, str], float] = {}
+        self._hits = self._disk_hits = self._misses = self._evictions = self._invalidations = 0
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def run_custom_report(self, user: SapioUser, criteria: CustomReportCriteria) -> CustomReport:
+        """
+        The results of a custom report, from the cache if they are there, and otherwise from the server.
+        """
+        data_types = frozenset(referenced_data_types(criteria.to_json()))
+        key = (user.url, self._user_key(user) + criteria_key(criteria))
+        report = self._get(key, data_types)
+        if report is not None:
+            return report
+        # Records may change while the report runs, so its result is only as recent as when it was started.
+        started = self._clock()
+        report = DataMgmtServer.get_custom_report_manager(user).run_custom_report(criteria)
+        ttl = min([self.ttl_by_data_type.get(x, self.ttl_seconds) for x in data_types] or [self.ttl_seconds])
+        if ttl > 0:
+            self._put(key, data_types, started, started + ttl, report)
+        return report
+
+    def invalidate(self, user: Optional[SapioUser] = None, data_type_name: Optional[str] = None) -> None:
+        """
+        Drop cached results, so that their reports are run again on their next use.
+
+        :param user: Only drop the results of the server of this user. Defaults to every server.
+        :param data_type_name: Only drop the results of the reports that reference this data type. Defaults to every
+            report.
+        """
+        url = None if user is None else user.url
+        with self._lock:
+            now = self._clock()
+            for key, entry in list(self._entries.items()):
+                if (url is None or key[0] == url) and (data_type_name is None or data_type_name in entry[1]):
+                    self._remove(key)
+                    self._invalidations += 1
+            # Results on disk are checked against this when they are read.
+            self._invalidated[(url or "", data_type_name or "")] = now
+
+    def request_sent(self, user: SapioUser, method: str, url_sub_path: str, params: Optional[dict], payload: Any,
+                     response: Response) -> None:
+        """
+        Drop the cached results of the data types whose records a request added, changed or deleted. Register it with
+        the pool of the users that write records, so that it sees their requests:
+
+            HTTP_POOL.add_request_listener(REPORT_CACHE.request_sent)
+        """
+        if not response.ok:
+            return
+        data_types = written_data_types(method, url_sub_path, params, payload)
+        if data_types is None:
+            self.invalidate(user)
+        for data_type_name in data_types or ():
+            self.invalidate(user, data_type_name)
+
+    def stats(self) -> ReportCacheStats:
+        """
+        A snapshot of the counters of this cache.
+        """
+        with self._lock:
+            return ReportCacheStats(self._hits, self._disk_hits, self._misses, self._evictions, self._invalidations)
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._hits = self._disk_hits = self._misses = self._evictions = self._invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get(self, key: _Key, data_types: FrozenSet[str]) -> Optional[CustomReport]:
+        with self._lock:
+            now = self._clock()
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[3]
+            if entry is not None:
+                self._remove(key)
+        stored = self._read(key, data_types)
+        with self._lock:
+            if stored is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._disk_hits += 1
+        self._put(key, data_types, *stored, write=False)
+        return stored[2]
+
+    def _put(self, key: _Key, data_types: FrozenSet[str], started: float, expires: float, report: CustomReport,
+             write: bool = True) -> None:
+        """
+        Cache a result, unless its data types were invalidated since its report was started, in which case it may
+        miss the changes that caused the invalidation.
+        """
+        cells = max(len(report.result_table) * len(report.column_list or [None]), 1)
+        with self._lock:
+            if self._last_invalidated(key, data_types) >= started:
+                return
+            if key in self._entries:
+                self._remove(key)
+            if cells <= self.max_cells:
+                self._entries[key] = (expires, data_types, cells, report)
+                self._cells += cells
+            while self._cells > self.max_cells:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+        if write and self.directory is not None:
+            self._write(key, data_types, started, expires, report)
+
+    def _remove(self, key: _Key) -> None:
+        self._cells -= self._entries.pop(key)[2]
+
+    def _last_invalidated(self, key: _Key, data_types: FrozenSet[str]) -> float:
+        return max([self._invalidated.get((server, name), float("-inf"))
+                    for server in (key[0], "") for name in [""] + list(data_types)])
+
+    def _path(self, key: _Key) -> str:
+        return os.path.join(self.directory, hashlib.sha256("\n".join(key).encode("utf-8")).hexdigest() + ".json")
+
+    def _read(self, key: _Key, data_types: FrozenSet[str]) -> Optional[Tuple[float, float, CustomReport]]:
+        if self.directory is None:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as file:
+                stored = json.load(file)
+        except (OSError, ValueError):
+            return None
+        with self._lock:
+            invalidated = self._last_invalidated(key, data_types)
+        if stored["expires"] <= self._clock() or stored["stored"] <= invalidated:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        return stored["stored"], stored["expires"], CustomReport.from_json(stored["report"])
+
+    def _write(self, key: _Key, data_types: FrozenSet[str], started: float, expires: float,
+               report: CustomReport) -> None:
+        # Stamped with when the report was started, so that invalidations made while it ran reject it when it is read.
+        stored = {"stored": started, "expires": expires, "dataTypes": sorted(data_types),
+                  "report": report.to_json()}
+        # Written to a temporary file and renamed, so that other processes never read a partly written result.
+        descriptor, temporary = tempfile.mkstemp(dir=self.directory, suffix=".part")
+        try:
+            with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+                json.dump(stored, file)
+            os.replace(temporary, self._path(key))
+        except BaseException:
+            os.remove(temporary)
+            raise
+
+    @staticmethod
+    def _user_key(user: SapioUser) -> str:
+        # Reports only return the records the user can see, so results are not shared between users.
+        identity = user.username or user.api_token or user.bearer_token or ""
+        return hashlib.sha256(f"{identity}\n{user.group_name or ''}".encode("utf-8")).hexdigest()[:16]
+
+
+# The cache shared by every webhook handler of the process.
+REPORT_CACHE: ReportCache = ReportCache()
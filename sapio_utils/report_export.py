@@ -0,0 +1,242 @@
+"""
+Exports of every page of a custom report to a file, written one page at a time while the next pages are read.
+
+Pages are written as Parquet row groups or Arrow IPC record batches, typed from the field types of the report columns,
+which needs the pyarrow package. Without it, reports can still be exported to CSV.
+"""
+from __future__ import annotations
+
+import copy
+import csv
+import os
+import queue
+import threading
+from dataclasses import dataclass
+from typing import IO, Any, List, Optional, Sequence
+
+from sapiopylib.rest.DataMgmtService import DataMgmtServer
+from sapiopylib.rest.User import SapioUser
+from sapiopylib.rest.pojo.CustomReport import CustomReportCriteria, ReportColumn
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+
+from data_type_models._columns import INTEGER_FIELD_TYPES
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:
+    pa = None
+
+PARQUET = "parquet"
+ARROW = "arrow"
+CSV = "csv"
+FORMATS_BY_SUFFIX = {".parquet": PARQUET, ".arrow": ARROW, ".feather": ARROW, ".ipc": ARROW, ".csv": CSV}
+
+# Exports read larger pages than dialogs do, since a page costs a round trip and a report run on the server.
+DEFAULT_PAGE_SIZE = 10000
+# How many pages may wait to be written while the next one is read. Memory holds at most this many pages, plus the
+# page being read and the page being written.
+DEFAULT_READ_AHEAD = 2
+
+# Put in the queue of pages after the last page.
+_DONE = object()
+
+
+@dataclass(frozen=True)
+class ReportExport:
+    """
+    What export_report() wrote: the file, its format, and how many rows and pages of the report went into it.
+    """
+    path: str
+    file_format: str
+    rows: int
+    pages: int
+
+
+def column_names(columns: Sequence[ReportColumn]) -> List[str]:
+    """
+    The names of the report columns in an exported file: the data field name, prefixed with the data type name when
+    the report has the same field name on several data types.
+    """
+    names = [column.data_field_name for column in columns]
+    return [f"{column.data_type_name}.{name}" if names.count(name) > 1 else name
+            for column, name in zip(columns, names)]
+
+
+def arrow_type(field_type: FieldType) -> pa.DataType:
+    """
+    The Arrow type of a report column of the provided field type. Dates are epoch milliseconds, in UTC.
+    """
+    if field_type == FieldType.DOUBLE:
+        return pa.float64()
+    # Dates are in INTEGER_FIELD_TYPES as well, so they are checked first.
+    if field_type == FieldType.DATE:
+        return pa.timestamp("ms", tz="UTC")
+    if field_type in INTEGER_FIELD_TYPES:
+        return pa.int64()
+    if field_type == FieldType.BOOLEAN:
+        return pa.bool_()
+    return pa.string()
+
+
+def report_schema(columns: Sequence[ReportColumn]) -> pa.Schema:
+    """
+    The Arrow schema of the pages of a report with the provided columns.
+    """
+    return pa.schema([pa.field(name, arrow_type(column.field_type))
+                      for column, name in zip(columns, column_names(columns))])
+
+
+def page_record_batch(rows: List[List[Any]], schema: pa.Schema) -> pa.RecordBatch:
+    """
+    Convert the rows of a report page into a record batch of the report's schema, a column at a time.
+    """
+    values_by_column = list(zip(*rows)) if rows else [()] * len(schema)
+    arrays = []
+    for field, values in zip(schema, values_by_column):
+        if pa.types.is_string(field.type) and not all(x is None or x.__class__ is str for x in values):
+            # Columns of field types without an Arrow type of their own may hold values other than text.
+            values = [None if x is None else str(x) for x in values]
+        if pa.types.is_timestamp(field.type):
+            arrays.append(pa.array(values, pa.int64()).cast(field.type))
+        else:
+            arrays.append(pa.array(values, field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+class _PageWriter:
+    """
+    Writes the pages of a report to an open file in one of the export formats.
+    """
+
+    def __init__(self, file: Any, file_format: str, columns: Sequence[ReportColumn], compression: Optional[str]):
+        self.file_format = file_format
+        if file_format == CSV:
+            self._csv = csv.writer(file)
+            self._csv.writerow(column_names(columns))
+            return
+        if pa is None:
+            raise ImportError(f"Exporting reports to {file_format} needs the pyarrow package.")
+        self._schema = report_schema(columns)
+        if file_format == PARQUET:
+            self._writer = pa.parquet.ParquetWriter(file, self._schema, compression=compression or "snappy")
+        else:
+            options = pa.ipc.IpcWriteOptions(compression=compression)
+            self._writer = pa.ipc.new_file(file, self._schema, options=options)
+
+    def write(self, rows: List[List[Any]]) -> None:
+        if self.file_format == CSV:
+            self._csv.writerows(rows)
+        else:
+            self._writer.write_batch(page_record_batch(rows, self._schema))
+
+    def close(self) -> None:
+        if self.file_format != CSV:
+            self._writer.close()
+
+
+def export_report(user: SapioUser, criteria: CustomReportCriteria, path: str, file_format: Optional[str] = None,
+                  page_size: int = DEFAULT_PAGE_SIZE, read_ahead: int = DEFAULT_READ_AHEAD,
+                  compression: Optional[str] = None) -> ReportExport:
+    """
+    Run every page of a custom report and write its rows to a file, without holding the whole report in memory.
+
+        export = export_report(user, CustomReportCriteria(columns, root_term), "qc_data.parquet")
+
+    A background thread reads the next pages while the current one is written, up to read_ahead pages ahead. Each
+    page becomes a Parquet row group or an Arrow record batch of the same schema, with a column per report column,
+    typed from its field type. The file is written under a temporary name and only takes the provided name once every
+    page has been written, so a failed export never leaves a partial file behind.
+
+    :param user: The user that runs the report.
+    :param criteria: The report to run. Its page size and page number are ignored; it is not modified.
+    :param path: The file to write.
+    :param file_format: PARQUET, ARROW or CSV. Defaults to the format of the file name's suffix.
+    :param page_size: How many rows to read from the server at a time.
+    :param read_ahead: How many pages may wait to be written. 0 reads each page only once the one before is written.
+    :param compression: The compression codec of the Parquet or Arrow file, e.g. "zstd". Defaults to snappy for
+        Parquet and no compression for Arrow.
+    """
+    if file_format is None:
+        file_format = FORMATS_BY_SUFFIX.get(os.path.splitext(path)[1].lower())
+        if file_format is None:
+            raise ValueError(f"Cannot tell the export format of {path!r}. Provide file_format.")
+    if file_format not in (PARQUET, ARROW, CSV):
+        raise ValueError(f"Unknown export format {file_format!r}.")
+    report_manager = DataMgmtServer.get_custom_report_manager(user)
+    criteria = copy.copy(criteria)
+    criteria.page_size = page_size
+    criteria.page_number = 0
+    closed = threading.Event()
+    pages: queue.Queue = queue.Queue(maxsize=max(read_ahead, 1))
+
+    more_pages = True
+
+    def next_page() -> Optional[List[List[Any]]]:
+        nonlocal more_pages
+        if not more_pages:
+            return None
+        report = report_manager.run_custom_report(criteria)
+        more_pages = bool(report.has_next_page) and len(report.result_table) > 0
+        criteria.page_number += 1
+        return report.result_table
+
+    def put(item: Any) -> None:
+        while not closed.is_set():
+            try:
+                pages.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+    def read_ahead_pages() -> None:
+        try:
+            while not closed.is_set():
+                page = next_page()
+                put(_DONE if page is None else page)
+                if page is None:
+                    return
+        except BaseException as e:
+            put(e)
+
+    def take_page() -> Optional[List[List[Any]]]:
+        if read_ahead == 0:
+            return next_page()
+        page = pages.get()
+        if isinstance(page, BaseException):
+            raise page
+        return None if page is _DONE else page
+
+    rows = page_count = 0
+    part_path = f"{path}.part"
+    try:
+        with _open(part_path, file_format) as file:
+            writer = _PageWriter(file, file_format, criteria.column_list, compression)
+            # Closed before the file even if a page fails, since a Parquet writer that is closed later writes its
+            # footer to the closed file.
+            try:
+                if read_ahead > 0:
+                    threading.Thread(target=read_ahead_pages, name="sapio-report-export", daemon=True).start()
+                while True:
+                    page = take_page()
+                    if page is None:
+                        break
+                    writer.write(page)
+                    rows += len(page)
+                    page_count += 1
+            finally:
+                writer.close()
+        os.replace(part_path, path)
+    finally:
+        # Stops the background thread, which drops the page it is reading, if any.
+        closed.set()
+        if os.path.exists(part_path):
+            os.remove(part_path)
+    return ReportExport(path, file_format, rows, page_count)
+
+
+def _open(path: str, file_format: str) -> IO:
+    if file_format == CSV:
+        return open(path, "w", newline="", encoding="utf-8")
+    return open(path, "wb")
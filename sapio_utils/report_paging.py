@@ -0,0 +1,214 @@
+"""
+Auto-paging over the rows of custom reports and quick reports, like the record auto-pagers of sapiopylib.
+
+Report pages are addressed by page number rather than by criteria from the page before, so the pages of a report
+can be read ahead, or several at a time, and still be returned in order.
+"""
+from __future__ import annotations
+
+import copy
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from queue import Queue
+from typing import Any, Callable, Deque, List, Optional
+
+import pandas as pd
+from sapiopylib.rest.DataMgmtService import DataMgmtServer
+from sapiopylib.rest.User import SapioUser
+from sapiopylib.rest.pojo.CustomReport import CustomReport, CustomReportCriteria, RawReportTerm
+from sapiopylib.rest.utils.autopaging import SapioPyAutoPager
+
+from sapio_utils.fan_out import get_request_executor
+
+# Read one page after the other, each when the caller reaches it.
+SEQUENTIAL = "sequential"
+# Read the next pages on a background thread, one after the other, while the caller works on the current page.
+PREFETCH = "prefetch"
+# Read several pages at the same time.
+CONCURRENT = "concurrent"
+
+# The page size of sapiopylib's report paging, which is also the default limit of Sapio servers.
+DEFAULT_PAGE_SIZE = 10000
+DEFAULT_DEPTH = 2
+DEFAULT_WORKERS = 4
+# Reports with no rows past this many pages are read one page after the other, even in CONCURRENT mode, since
+# reading pages past the end of a short report costs more than the concurrency saves.
+DEFAULT_FAN_OUT_PAGES = 4
+
+
+def has_rows_past(run_page: Callable[[int, int], CustomReport], first_page_number: int, page_size: int,
+                  pages: int) -> bool:
+    """
+    Whether a report has any rows past its first pages, found by asking for a single row: the first row after them.
+    Sapio has no call that counts the rows of a report, and counting them this way would take a report per halving
+    of the range of the count.
+
+    :param run_page: Runs a page of the report, given its page size and page number.
+    :param first_page_number: The page number the report is read from.
+    :param page_size: The page size the report is read with.
+    :param pages: How many pages, from first_page_number on, the rows must go past.
+    """
+    report = run_page(1, (first_page_number + pages) * page_size)
+    return len(report.result_table) > 0
+
+
+class CustomReportAutoPager(SapioPyAutoPager[CustomReportCriteria, List[Any]]):
+    """
+    Iterates over the rows of every page of a custom report, or of a quick report, in order. Each row is the list of
+    the values of the report columns.
+
+        with CustomReportAutoPager(user, CustomReportCriteria(columns, root_term), mode=CONCURRENT) as rows:
+            for row in rows:
+                ...
+
+    In SEQUENTIAL mode, which is the default, each page is read when the caller reaches it. In PREFETCH mode, a
+    background thread reads up to depth pages ahead, one after the other, while the caller works on the current page.
+    In CONCURRENT mode, up to workers pages are read at the same time, but only once a single-row report has shown
+    that the report goes past fan_out_pages pages; shorter reports are read one page after the other. Either way, at
+    most depth or workers pages are read ahead of the caller, and rows are returned in the order of the report.
+
+    Reading ahead reads pages the caller may never reach: the pages past the end of the report, up to depth or
+    workers of them, and every page read ahead when the caller stops early. Close the pager, or use it in a with
+    statement, so that pages that were not started yet are not read.
+    """
+
+    def __init__(self, user: SapioUser, criteria: Optional[CustomReportCriteria] = None,
+                 quick_report_term: Optional[RawReportTerm] = None, mode: str = SEQUENTIAL,
+                 depth: int = DEFAULT_DEPTH, workers: int = DEFAULT_WORKERS,
+                 fan_out_pages: int = DEFAULT_FAN_OUT_PAGES, executor: Optional[Executor] = None):
+        """
+        :param user: The user that runs the report.
+        :param criteria: The custom report to run, starting from its page number, with its page size. It is not
+            modified. Leave it out to run a quick report instead.
+        :param quick_report_term: The term of the quick report to run, if criteria is left out. Pages of a quick report
+            are read with the page size of DEFAULT_PAGE_SIZE.
+        :param mode: SEQUENTIAL, PREFETCH or CONCURRENT.
+        :param depth: How many pages PREFETCH mode reads ahead.
+        :param workers: How many pages CONCURRENT mode reads at the same time.
+        :param fan_out_pages: How many pages a report must go past for CONCURRENT mode to read pages at the same time.
+        :param executor: The thread pool CONCURRENT mode reads pages on. Defaults to the pool shared by the process.
+        """
+        if (criteria is None) == (quick_report_term is None):
+            raise ValueError("Provide either the criteria of a custom report or the term of a quick report.")
+        if mode not in (SEQUENTIAL, PREFETCH, CONCURRENT):
+            raise ValueError(f"Unknown paging mode {mode!r}.")
+        if criteria is not None:
+            criteria = copy.copy(criteria)
+            if criteria.page_size is None or criteria.page_size < 1:
+                criteria.page_size = DEFAULT_PAGE_SIZE
+            criteria.page_number = max(criteria.page_number or 0, 0)
+        self.quick_report_term = quick_report_term
+        super().__init__(user, criteria)
+        self.mode = mode
+        self.depth = depth
+        self.workers = workers
+        self.fan_out_pages = fan_out_pages
+        self.report_manager = DataMgmtServer.get_custom_report_manager(user)
+        # The columns of the report, known for a quick report once its first page has been read.
+        self.column_list = list(self.next_page_criteria.column_list or [])
+        self._executor = executor
+        self._own_executor: Optional[ThreadPoolExecutor] = None
+        self._window_size: Optional[int] = None
+        # The pages being read ahead of the caller, in page order, and the page number to read after them.
+        self._window: Deque[Future] = deque()
+        self._next_page_number = self.next_page_criteria.page_number
+        self._first_page_criteria: CustomReportCriteria = self.next_page_criteria
+
+    def default_first_page_criteria(self) -> CustomReportCriteria:
+        # A quick report has no criteria. This holds its page size and page number.
+        return CustomReportCriteria([], self.quick_report_term, page_size=DEFAULT_PAGE_SIZE, page_number=0)
+
+    def run_page(self, page_size: int, page_number: int) -> CustomReport:
+        """
+        Run one page of the report.
+        """
+        if self.quick_report_term is not None:
+            return self.report_manager.run_quick_report(self.quick_report_term, page_size, page_number)
+        criteria = copy.copy(self._first_page_criteria)
+        criteria.page_size = page_size
+        criteria.page_number = page_number
+        return self.report_manager.run_custom_report(criteria)
+
+    def get_next_page_result(self) -> (Optional[CustomReportCriteria], Queue[List[Any]]):
+        criteria = self.next_page_criteria
+        if self.mode == SEQUENTIAL:
+            report = self.run_page(criteria.page_size, criteria.page_number)
+        else:
+            self._fill_window()
+            report = self._window.popleft().result()
+        if report.column_list and not self.column_list:
+            self.column_list = list(report.column_list)
+        rows: Queue[List[Any]] = Queue()
+        rows.queue.extend(report.result_table)
+        if not report.has_next_page or not report.result_table:
+            self.close()
+            return None, rows
+        next_page_criteria = copy.copy(criteria)
+        next_page_criteria.page_number += 1
+        self._fill_window()
+        return next_page_criteria, rows
+
+    def get_all_at_once(self) -> List[List[Any]]:
+        if self.has_iterated:
+            raise BrokenPipeError("Cannot use this method if the iterator has already been used.")
+        return list(self)
+
+    def get_data_frame(self) -> pd.DataFrame:
+        """
+        Every remaining row in a data frame, with the columns named like those of CustomReport.get_data_frame().
+        """
+        rows = list(self)
+        return pd.DataFrame(rows, columns=[str(x) for x in self.column_list] or None)
+
+    def close(self) -> None:
+        """
+        Stop the iteration and any reading ahead. Pages that are already being read are left to finish, and are
+        discarded.
+        """
+        for future in self._window:
+            future.cancel()
+        self._window.clear()
+        self._window_size = 0
+        self.next_page_criteria = None
+        self.last_page_result = None
+        if self._own_executor is not None:
+            self._own_executor.shutdown(wait=False)
+
+    def __enter__(self) -> CustomReportAutoPager:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _fill_window(self) -> None:
+        if self.mode == SEQUENTIAL:
+            return
+        if self._window_size is None:
+            self._window_size = self._start()
+        page_size = self._first_page_criteria.page_size
+        while len(self._window) < self._window_size and self._within_max_page(self._next_page_number):
+            self._window.append(self._executor.submit(self.run_page, page_size, self._next_page_number))
+            self._next_page_number += 1
+
+    def _start(self) -> int:
+        """
+        Decide how many pages to read ahead, and set up the thread pool to read them on.
+        """
+        if self.mode == PREFETCH:
+            # A single thread, so that the pages are read one after the other.
+            self._own_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sapio-report-prefetch")
+            self._executor = self._own_executor
+            return self.depth
+        self._executor = self._executor or get_request_executor()
+        criteria = self._first_page_criteria
+        # The first page is read while the probe runs, since it is needed either way.
+        self._window.append(self._executor.submit(self.run_page, criteria.page_size, criteria.page_number))
+        self._next_page_number += 1
+        if has_rows_past(self.run_page, criteria.page_number, criteria.page_size, self.fan_out_pages):
+            return self.workers
+        return 1
+
+    def _within_max_page(self, page_number: int) -> bool:
+        # max_page counts the pages read by this pager, from 1.
+        pages = page_number - self._first_page_criteria.page_number + 1
+        return self.max_page is None or self.max_page <= 0 or pages <= self.max_page
@@ -0,0 +1,561 @@
+"""
+A planner that rewrites the term trees of custom reports into smaller trees that match the same records.
+
+Term trees built by hand, or pieced together by code, often hold terms every record matches, such as RecordId >= 0,
+long chains of ORs that compare one field with one value after another, and repeated terms. The planner drops what
+cannot change the result, merges the terms on each numeric field, and rebuilds the tree balanced, with the most
+selective terms first. Trees that no record can match are found without running the report.
+"""
+from __future__ import annotations
+
+import copy
+import json
+import math
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+from sapiopylib.rest.DataMgmtService import DataMgmtServer
+from sapiopylib.rest.User import SapioUser
+from sapiopylib.rest.pojo.CustomReport import (AbstractReportTerm, CompositeReportTerm, CompositeTermOperation,
+                                               CustomReport, CustomReportCriteria, FieldCompareReportTerm,
+                                               RawReportTerm, RawTermOperation, ReportColumn)
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+
+from data_type_models._columns import INTEGER_FIELD_TYPES
+from sapio_utils.data_type_cache import DATA_TYPE_CACHE
+from sapio_utils.report_terms import RECORD_ID_FIELD, all_of, any_of
+
+# The whole-number fields whose terms are merged into ranges. Enum values are positions in a list of options and side
+# links are record IDs, so ranges of them rarely mean anything, and their terms are left as they are written.
+RANGE_INTEGER_FIELD_TYPES = INTEGER_FIELD_TYPES - {FieldType.ENUM, FieldType.SIDE_LINK}
+NUMERIC_FIELD_TYPES = RANGE_INTEGER_FIELD_TYPES | {FieldType.DOUBLE}
+
+_AND = CompositeTermOperation.AND_OPERATOR
+_OR = CompositeTermOperation.OR_OPERATOR
+_RANGE_OPERATIONS = frozenset({RawTermOperation.GREATER_THAN_OPERATOR, RawTermOperation.GREATER_THAN_OR_EQUAL_OPERATOR,
+                               RawTermOperation.LESS_THAN_OPERATOR, RawTermOperation.LESS_THAN_OR_EQUAL_OPERATOR})
+
+FieldKey = Tuple[str, str]
+# An interval of field values: its lower bound, whether it includes it, its upper bound and whether it includes it.
+_Interval = Tuple[float, bool, float, bool]
+_LINE: List[_Interval] = [(-math.inf, False, math.inf, False)]
+# Every record has a record ID, and record IDs start from 1.
+_RECORD_IDS: List[_Interval] = [(1, True, math.inf, False)]
+
+
+class _Always:
+    """
+    A term every record matches, or a term no record matches.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __repr__(self) -> str:
+        return self.name
+
+
+_TRUE = _Always("TRUE")
+_FALSE = _Always("FALSE")
+
+
+@dataclass
+class _Composite:
+    """
+    An AND or an OR of any number of operands, which is only made into a tree of CompositeReportTerms at the end.
+    """
+    operation: CompositeTermOperation
+    operands: List[_Node]
+
+
+_Node = Union[AbstractReportTerm, _Composite, _Always]
+
+
+@dataclass(frozen=True)
+class TermPlan:
+    """
+    The term tree plan_term() rewrote a term tree into, and what it did to get there. term is None if no record can
+    match the original term, in which case its report need not be run.
+    """
+    original: AbstractReportTerm
+    term: Optional[AbstractReportTerm]
+    steps: List[str]
+
+    @property
+    def matches_nothing(self) -> bool:
+        return self.term is None
+
+    def explain(self) -> str:
+        """
+        A summary of the plan, like the output of EXPLAIN in SQL: the size of the tree before and after, then each
+        rewrite, then the planned term.
+        """
+        lines = [f"terms: {term_count(self.original)} -> {term_count(self.term)}",
+                 f"depth: {term_depth(self.original)} -> {term_depth(self.term)}",
+                 f"request bytes: {term_bytes(self.original)} -> {term_bytes(self.term)}"]
+        lines.extend(f"- {step}" for step in self.steps)
+        lines.append("no record can match, the report need not be run" if self.term is None
+                     else f"term: {term_text(self.term)}")
+        return "\n".join(lines)
+
+
+def term_text(term: AbstractReportTerm) -> str:
+    """
+    A term tree as text, such as (Sample.Volume > 5 OR NOT Sample.Status = Failed), with nested ANDs and nested ORs
+    written as one list of operands.
+    """
+    prefix = "NOT " if term.negated else ""
+    if isinstance(term, RawReportTerm):
+        return f"{prefix}{term.data_type_name}.{term.data_field_name} {term.term_operation} {term.value}"
+    if isinstance(term, FieldCompareReportTerm):
+        return (f"{prefix}{term.left_data_type_name}.{term.left_data_field_name} {term.term_operation} "
+                f"{term.right_data_type_name}.{term.right_data_field_name}")
+    operands: List[AbstractReportTerm] = []
+    stack = [term.right_child, term.left_child]
+    while stack:
+        child = stack.pop()
+        if isinstance(child, CompositeReportTerm) and child.term_operation == term.term_operation and not child.negated:
+            stack.extend((child.right_child, child.left_child))
+        else:
+            operands.append(child)
+    return f"{prefix}({f' {term.term_operation} '.join(term_text(x) for x in operands)})"
+
+
+def term_count(term: Optional[AbstractReportTerm]) -> int:
+    """
+    The number of terms in a term tree that compare fields, not counting the ANDs and ORs that join them.
+    """
+    if term is None:
+        return 0
+    if isinstance(term, CompositeReportTerm):
+        return term_count(term.left_child) + term_count(term.right_child)
+    return 1
+
+
+def term_depth(term: Optional[AbstractReportTerm]) -> int:
+    """
+    The number of levels of a term tree, which is how deep the server recurses to read it.
+    """
+    if term is None:
+        return 0
+    if isinstance(term, CompositeReportTerm):
+        return 1 + max(term_depth(term.left_child), term_depth(term.right_child))
+    return 1
+
+
+def term_bytes(term: Optional[AbstractReportTerm]) -> int:
+    """
+    The size of a term tree in the JSON of a report request.
+    """
+    return 0 if term is None else len(json.dumps(term.to_json(), separators=(",", ":")))
+
+
+def plan_term(term: AbstractReportTerm, field_types: Optional[Mapping[FieldKey, FieldType]] = None) -> TermPlan:
+    """
+    Rewrite a term tree into one that matches the same records with fewer terms.
+
+        plan = plan_term(root_term, {("Sample", "Volume"): FieldType.DOUBLE})
+        print(plan.explain())
+
+    - Nested ANDs, and nested ORs, are read as a single AND or OR of all of their operands, which drops repeated
+      operands and operands that others already decide, such as a OR (a AND b).
+    - The terms of an AND or an OR on the same numeric field are merged: RecordId >= 0 is dropped, since every record
+      matches it, Volume = 1 OR Volume = 2 OR Volume = 3 on an integer field becomes Volume >= 1 AND Volume <= 3, and
+      Volume > 5 AND Volume < 2 is found to match nothing. Reports have no "one of" operator, so chains of ORs on text
+      fields only lose their repeated values.
+    - Every AND and OR is rebuilt as a balanced tree, with equality terms first, then ranges, then other terms, then
+      nested ANDs and ORs by size, then field comparisons, which join data types.
+
+    Negated ANDs and ORs are left as they are, since their result depends on how the server treats fields without a
+    value. For the same reason, negated terms are only rewritten on RecordId, which every record has a value of, and
+    ranges only become != terms on RecordId or on fields that the term already compared with !=.
+
+    :param term: The root term of a report. It is not modified.
+    :param field_types: The types of the fields the terms compare, by data type name and data field name. The terms on
+        other fields are left as they are, apart from RecordId, which is always known.
+    """
+    planner = _Planner(field_types or {})
+    node = planner.plan(term)
+    if node is _FALSE:
+        return TermPlan(term, None, planner.steps)
+    if node is _TRUE:
+        # Reports need a term, so the one that matches every record is kept.
+        data_type_name = planner.true_data_type_name or _first_data_type_name(term)
+        planned: AbstractReportTerm = RawReportTerm(data_type_name, RECORD_ID_FIELD,
+                                                    RawTermOperation.GREATER_THAN_OPERATOR, "0")
+        planner.steps.append(f"Every record matches the whole term, which becomes {term_text(planned)}.")
+        return TermPlan(term, planned, planner.steps)
+    return TermPlan(term, _to_term(node), planner.steps)
+
+
+def column_field_types(columns: Iterable[ReportColumn]) -> Dict[FieldKey, FieldType]:
+    """
+    The field types of report columns, by data type name and data field name.
+    """
+    return {(column.data_type_name, column.data_field_name): column.field_type for column in columns}
+
+
+def plan_criteria(criteria: CustomReportCriteria, field_types: Optional[Mapping[FieldKey, FieldType]] = None) \
+        -> Tuple[CustomReportCriteria, TermPlan]:
+    """
+    A copy of report criteria with its root term planned by plan_term(), and the plan. The field types of the report
+    columns are used along with field_types. The criteria are not modified. If no record can match, the copy keeps the
+    original root term.
+    """
+    plan = plan_term(criteria.root_term, {**column_field_types(criteria.column_list or []), **(field_types or {})})
+    planned = copy.copy(criteria)
+    if plan.term is not None:
+        planned.root_term = plan.term
+    return planned, plan
+
+
+def run_planned_report(user: SapioUser, criteria: CustomReportCriteria,
+                       field_types: Optional[Mapping[FieldKey, FieldType]] = None) -> CustomReport:
+    """
+    Run a custom report with its root term planned by plan_term(). A report that no record can match is not sent to
+    the server, and comes back empty.
+
+    :param user: The user that runs the report.
+    :param criteria: The report to run. It is not modified.
+    :param field_types: The types of the fields the terms compare. Defaults to the field definitions of the data types
+        of the terms, from the data type cache shared by the process.
+    """
+    if field_types is None:
+        field_types = {}
+        for data_type_name in {x.data_type_name for x in _raw_terms(criteria.root_term)}:
+            fields_by_name = DATA_TYPE_CACHE.get_fields_by_name(user, data_type_name) or {}
+            field_types.update({(data_type_name, name): field.data_field_type
+                                for name, field in fields_by_name.items()})
+    planned, plan = plan_criteria(criteria, field_types)
+    if plan.matches_nothing:
+        return CustomReport(False, [], criteria)
+    return DataMgmtServer.get_custom_report_manager(user).run_custom_report(planned)
+
+
+class _Planner:
+    """
+    Rewrites one term tree, and records the rewrites.
+    """
+
+    def __init__(self, field_types: Mapping[FieldKey, FieldType]):
+        self.field_types = field_types
+        self.steps: List[str] = []
+        # The data type of a RecordId term that every record matches, to build the term of a tree that reduces to it.
+        self.true_data_type_name: Optional[str] = None
+
+    def plan(self, term: AbstractReportTerm) -> _Node:
+        if not isinstance(term, CompositeReportTerm) or term.negated or term.term_operation not in (_AND, _OR):
+            return self._plan_leaf(term)
+        operation = term.term_operation
+        operands: List[_Node] = []
+        stack = [term.right_child, term.left_child]
+        while stack:
+            child = stack.pop()
+            if isinstance(child, CompositeReportTerm) and child.term_operation == operation and not child.negated:
+                stack.extend((child.right_child, child.left_child))
+            else:
+                operands.append(self.plan(child))
+        return self._combine(operation, operands)
+
+    def _plan_leaf(self, term: AbstractReportTerm) -> _Node:
+        # A lone term on a numeric field may still match every record, or none, such as RecordId >= 0.
+        if isinstance(term, RawReportTerm) and self._intervals(term) is not None:
+            return self._combine(_AND, [term])
+        return term
+
+    def _combine(self, operation: CompositeTermOperation, operands: List[_Node]) -> _Node:
+        absorbing, neutral = (_FALSE, _TRUE) if operation == _AND else (_TRUE, _FALSE)
+        flat: List[_Node] = []
+        for operand in operands:
+            if operand is absorbing:
+                return absorbing
+            if isinstance(operand, _Composite) and operand.operation == operation:
+                flat.extend(operand.operands)
+            elif operand is not neutral:
+                flat.append(operand)
+        merged = self._merge_fields(operation, flat)
+        if merged is absorbing:
+            return absorbing
+        # The merged terms of a field may be an AND of bounds, which joins the operands of an AND.
+        operands = []
+        for operand in merged:
+            if isinstance(operand, _Composite) and operand.operation == operation:
+                operands.extend(operand.operands)
+            elif operand is not neutral:
+                operands.append(operand)
+        kept = self._drop_redundant(operation, operands)
+        if not kept:
+            return neutral
+        if len(kept) == 1:
+            return kept[0]
+        ordered = sorted(kept, key=_selectivity_rank)
+        if any(a is not b for a, b in zip(ordered, kept)):
+            self.steps.append(f"Put the {len(kept)} operands of an {operation} in order of selectivity, starting with "
+                              f"{term_text(_to_term(ordered[0]))}.")
+        return _Composite(operation, ordered)
+
+    def _merge_fields(self, operation: CompositeTermOperation, operands: List[_Node]) -> Union[List[_Node], _Always]:
+        """
+        Merge the terms of an AND or an OR on each numeric field. The merged terms of a field take the place of its
+        first term.
+        """
+        groups: Dict[FieldKey, List[Tuple[RawReportTerm, List[_Interval]]]] = {}
+        result: List[Union[_Node, FieldKey]] = []
+        for operand in operands:
+            intervals = self._intervals(operand) if isinstance(operand, RawReportTerm) else None
+            if intervals is None:
+                result.append(operand)
+                continue
+            key = (operand.data_type_name, operand.data_field_name)
+            if key not in groups:
+                groups[key] = []
+                result.append(key)
+            groups[key].append((operand, intervals))
+        planned: Dict[FieldKey, List[_Node]] = {}
+        for key, group in groups.items():
+            node = self._merge_field(operation, key, group)
+            if node is (_FALSE if operation == _AND else _TRUE):
+                return node
+            planned[key] = node if isinstance(node, list) else [node]
+        merged: List[_Node] = []
+        for item in result:
+            merged.extend(planned[item] if isinstance(item, tuple) else [item])
+        return merged
+
+    def _merge_field(self, operation: CompositeTermOperation, key: FieldKey,
+                     group: List[Tuple[RawReportTerm, List[_Interval]]]) -> Union[_Node, List[_Node]]:
+        data_type_name, data_field_name = key
+        integer = self._field_type(key) in RANGE_INTEGER_FIELD_TYPES
+        domain = _RECORD_IDS if data_field_name == RECORD_ID_FIELD else _LINE
+        if operation == _AND:
+            values = domain
+            for _, intervals in group:
+                values = _intersect(values, intervals, integer)
+        else:
+            values = []
+            for _, intervals in group:
+                values = _merge(values + _intersect(intervals, domain, integer), integer)
+        terms = [term for term, _ in group]
+        joined = f" {operation} ".join(term_text(x) for x in terms)
+        if not values:
+            self.steps.append(f"No record can match {joined}.")
+            return _FALSE
+        if values == domain:
+            if domain is _RECORD_IDS:
+                self.steps.append(f"Every record matches {joined}, dropped.")
+                self.true_data_type_name = self.true_data_type_name or data_type_name
+                return _TRUE
+            # Every value matches, but records without a value do not, and no term says that.
+            return terms
+        texts = {_parse(x.value): x.value for x in terms}
+        # A record without a value may match a != term but no range term, so != terms only stand in for ranges on
+        # RecordId, or on a field whose terms already compared it with !=.
+        not_equal = data_field_name == RECORD_ID_FIELD or any(
+            x.term_operation == RawTermOperation.NOT_EQUAL_TO_OPERATOR and not x.negated for x in terms)
+        node = _interval_terms(data_type_name, data_field_name, values, domain, integer, texts, not_equal)
+        count = _leaf_count(node)
+        if count >= len(terms):
+            return terms
+        self.steps.append(f"Merged {len(terms)} terms on {data_type_name}.{data_field_name} into {count}: "
+                          f"{term_text(_to_term(node))}.")
+        return node
+
+    def _drop_redundant(self, operation: CompositeTermOperation, operands: List[_Node]) -> List[_Node]:
+        """
+        Drop repeated operands, and nested ORs of an AND (or nested ANDs of an OR) that share an operand with it,
+        since a AND (a OR b) is a, and a OR (a AND b) is a.
+        """
+        keys = [_node_key(x) for x in operands]
+        kept: List[_Node] = []
+        seen = set()
+        for operand, key in zip(operands, keys):
+            if key in seen:
+                self.steps.append(f"Dropped repeated term {term_text(_to_term(operand))}.")
+                continue
+            seen.add(key)
+            if isinstance(operand, _Composite):
+                shared = next((x for x in operand.operands if _node_key(x) in keys), None)
+                if shared is not None:
+                    self.steps.append(f"Dropped {term_text(_to_term(operand))}, which "
+                                      f"{term_text(_to_term(shared))} decides in an {operation}.")
+                    continue
+            kept.append(operand)
+        return kept
+
+    def _field_type(self, key: FieldKey) -> Optional[FieldType]:
+        return FieldType.LONG if key[1] == RECORD_ID_FIELD else self.field_types.get(key)
+
+    def _intervals(self, term: RawReportTerm) -> Optional[List[_Interval]]:
+        """
+        The values of its field that a raw term matches, or None if the term is not one the planner can merge.
+        """
+        field_type = self._field_type((term.data_type_name, term.data_field_name))
+        value = _parse(term.value)
+        if field_type not in NUMERIC_FIELD_TYPES or value is None:
+            return None
+        if term.negated and term.data_field_name != RECORD_ID_FIELD:
+            return None
+        integer = field_type in RANGE_INTEGER_FIELD_TYPES
+        operation = term.term_operation
+        if operation == RawTermOperation.EQUAL_TO_OPERATOR:
+            intervals = [(value, True, value, True)]
+        elif operation == RawTermOperation.NOT_EQUAL_TO_OPERATOR:
+            intervals = [(-math.inf, False, value, False), (value, False, math.inf, False)]
+        elif operation == RawTermOperation.GREATER_THAN_OPERATOR:
+            intervals = [(value, False, math.inf, False)]
+        elif operation == RawTermOperation.GREATER_THAN_OR_EQUAL_OPERATOR:
+            intervals = [(value, True, math.inf, False)]
+        elif operation == RawTermOperation.LESS_THAN_OPERATOR:
+            intervals = [(-math.inf, False, value, False)]
+        else:
+            intervals = [(-math.inf, False, value, True)]
+        intervals = _merge(intervals, integer)
+        return _complement(intervals, integer) if term.negated else intervals
+
+
+def _parse(value: Optional[str]) -> Optional[float]:
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    if math.isnan(number) or math.isinf(number):
+        return None
+    return int(number) if number.is_integer() else number
+
+
+def _normalize(interval: _Interval, integer: bool) -> Optional[_Interval]:
+    """
+    The interval with the bounds of an integer field made inclusive, or None if it holds no value.
+    """
+    low, low_closed, high, high_closed = interval
+    if integer:
+        if not math.isinf(low):
+            low, low_closed = (low if low_closed and low == math.floor(low) else math.floor(low) + 1), True
+        if not math.isinf(high):
+            high, high_closed = (high if high_closed and high == math.ceil(high) else math.ceil(high) - 1), True
+    if low > high or (low == high and not (low_closed and high_closed)):
+        return None
+    return low, low_closed, high, high_closed
+
+
+def _merge(intervals: List[_Interval], integer: bool) -> List[_Interval]:
+    """
+    The same values as a sorted list of intervals that neither overlap nor touch.
+    """
+    normalized = sorted((x for x in (_normalize(x, integer) for x in intervals) if x is not None),
+                        key=lambda x: (x[0], not x[1]))
+    merged: List[_Interval] = []
+    for low, low_closed, high, high_closed in normalized:
+        if merged:
+            last_low, last_low_closed, last_high, last_high_closed = merged[-1]
+            touches = low < last_high or (low == last_high and (last_high_closed or low_closed)) or (
+                integer and low == last_high + 1)
+            if touches:
+                if high > last_high or (high == last_high and high_closed):
+                    merged[-1] = (last_low, last_low_closed, high, high_closed)
+                continue
+        merged.append((low, low_closed, high, high_closed))
+    return merged
+
+
+def _intersect(first: List[_Interval], second: List[_Interval], integer: bool) -> List[_Interval]:
+    parts: List[_Interval] = []
+    for a in first:
+        for b in second:
+            low, low_closed = max((a[0], not a[1]), (b[0], not b[1]))
+            high, high_closed = min((a[2], a[3]), (b[2], b[3]))
+            parts.append((low, not low_closed, high, high_closed))
+    return _merge(parts, integer)
+
+
+def _complement(intervals: List[_Interval], integer: bool) -> List[_Interval]:
+    gaps: List[_Interval] = []
+    low, low_closed = -math.inf, False
+    for interval in intervals:
+        gaps.append((low, low_closed, interval[0], not interval[1]))
+        low, low_closed = interval[2], not interval[3]
+    gaps.append((low, low_closed, math.inf, False))
+    return _merge(gaps, integer)
+
+
+def _interval_terms(data_type_name: str, data_field_name: str, values: List[_Interval], domain: List[_Interval],
+                    integer: bool, texts: Mapping[float, str], not_equal: bool) -> _Node:
+    """
+    The fewest terms that match the values of a field, either as an OR of the intervals of the values, or, if
+    not_equal is set, as an AND of the values they leave out.
+    """
+    def term(operation: RawTermOperation, value: float) -> RawReportTerm:
+        return RawReportTerm(data_type_name, data_field_name, operation, texts.get(value, str(value)))
+
+    ranges: List[_Node] = []
+    for low, low_closed, high, high_closed in values:
+        if low == high:
+            ranges.append(term(RawTermOperation.EQUAL_TO_OPERATOR, low))
+            continue
+        bounds: List[_Node] = []
+        if (low, low_closed) != domain[0][:2]:
+            bounds.append(term(RawTermOperation.GREATER_THAN_OR_EQUAL_OPERATOR if low_closed
+                               else RawTermOperation.GREATER_THAN_OPERATOR, low))
+        if (high, high_closed) != domain[-1][2:]:
+            bounds.append(term(RawTermOperation.LESS_THAN_OR_EQUAL_OPERATOR if high_closed
+                               else RawTermOperation.LESS_THAN_OPERATOR, high))
+        ranges.append(bounds[0] if len(bounds) == 1 else _Composite(_AND, bounds))
+    by_ranges = ranges[0] if len(ranges) == 1 else _Composite(_OR, ranges)
+    left_out = _intersect(_complement(values, integer), domain, integer)
+    if not_equal and all(x[0] == x[2] for x in left_out) and len(left_out) < _leaf_count(by_ranges):
+        excluded = [term(RawTermOperation.NOT_EQUAL_TO_OPERATOR, x[0]) for x in left_out]
+        return excluded[0] if len(excluded) == 1 else _Composite(_AND, excluded)
+    return by_ranges
+
+
+def _selectivity_rank(node: _Node) -> Tuple[int, int]:
+    """
+    Equality terms first, since they match the fewest records, then ranges, then other terms, then nested ANDs and
+    ORs, smallest first, then field comparisons, which join data types.
+    """
+    if isinstance(node, RawReportTerm) and not node.negated:
+        if node.term_operation == RawTermOperation.EQUAL_TO_OPERATOR:
+            return 0, 1
+        return (1 if node.term_operation in _RANGE_OPERATIONS else 2), 1
+    if isinstance(node, FieldCompareReportTerm):
+        return 6, 1
+    if isinstance(node, _Composite):
+        return (3 if node.operation == _AND else 4), _leaf_count(node)
+    return 5, _leaf_count(node)
+
+
+def _leaf_count(node: _Node) -> int:
+    if isinstance(node, _Composite):
+        return sum(_leaf_count(x) for x in node.operands)
+    if isinstance(node, AbstractReportTerm):
+        return term_count(node)
+    return 0
+
+
+def _node_key(node: _Node) -> str:
+    if isinstance(node, _Composite):
+        return f"{node.operation.name}({','.join(sorted(_node_key(x) for x in node.operands))})"
+    return json.dumps(node.to_json(), sort_keys=True, separators=(",", ":"))
+
+
+def _to_term(node: _Node) -> AbstractReportTerm:
+    if isinstance(node, _Composite):
+        operands = [_to_term(x) for x in node.operands]
+        return all_of(operands) if node.operation == _AND else any_of(operands)
+    return node
+
+
+def _raw_terms(term: AbstractReportTerm) -> Iterable[RawReportTerm]:
+    stack: List[AbstractReportTerm] = [term]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, CompositeReportTerm):
+            stack.extend((item.left_child, item.right_child))
+        elif isinstance(item, RawReportTerm):
+            yield item
+
+
+def _first_data_type_name(term: AbstractReportTerm) -> str:
+    for raw_term in _raw_terms(term):
+        return raw_term.data_type_name
+    return term.left_data_type_name
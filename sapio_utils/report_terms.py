@@ -0,0 +1,99 @@
+"""
+Builders of custom report terms that the report builder has no single operator for.
+"""
+from __future__ import annotations
+
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from sapiopylib.rest.pojo.CustomReport import (
+    AbstractReportTerm,
+    CompositeReportTerm,
+    CompositeTermOperation,
+    RawReportTerm,
+    RawTermOperation,
+)
+
+RECORD_ID_FIELD = "RecordId"
+
+# The most terms a built term tree may hold. Each one adds about 150 bytes to the report request.
+DEFAULT_MAX_TERMS = 1000
+
+
+def record_id_ranges(record_ids: Iterable[int]) -> List[Tuple[int, int]]:
+    """
+    Sorted, non-overlapping inclusive (first, last) ranges that cover exactly the provided record IDs. Records added to
+    the system together usually have consecutive record IDs, so there are far fewer ranges than IDs.
+    """
+    ranges: List[Tuple[int, int]] = []
+    for record_id in sorted(set(record_ids)):
+        if ranges and ranges[-1][1] == record_id - 1:
+            ranges[-1] = (ranges[-1][0], record_id)
+        else:
+            ranges.append((record_id, record_id))
+    return ranges
+
+
+def all_of(terms: Sequence[AbstractReportTerm]) -> Optional[AbstractReportTerm]:
+    """
+    Combine terms with AND, as a balanced tree so that the server does not have to recurse once per term.
+    None if there are no terms.
+    """
+    return _combine(terms, CompositeTermOperation.AND_OPERATOR)
+
+
+def any_of(terms: Sequence[AbstractReportTerm]) -> Optional[AbstractReportTerm]:
+    """
+    Combine terms with OR, as a balanced tree so that the server does not have to recurse once per term.
+    None if there are no terms.
+    """
+    return _combine(terms, CompositeTermOperation.OR_OPERATOR)
+
+
+def record_id_not_in_term(data_type_name: str, record_ids: Iterable[int],
+                          max_terms: int = DEFAULT_MAX_TERMS) -> Optional[AbstractReportTerm]:
+    """
+    A term that excludes the records of a data type with the provided record IDs.
+
+    Custom reports have no "not one of" operator, so the record IDs are grouped into ranges of consecutive IDs and
+    each range is excluded by its own term. Returns None if there are no record IDs, or if it would take more than
+    max_terms terms. Callers should then filter the report results themselves.
+    """
+    ranges = record_id_ranges(record_ids)
+    if not ranges or len(ranges) > max_terms:
+        return None
+    terms: List[AbstractReportTerm] = []
+    for first, last in ranges:
+        if first == last:
+            terms.append(RawReportTerm(data_type_name, RECORD_ID_FIELD, RawTermOperation.NOT_EQUAL_TO_OPERATOR,
+                                       str(first)))
+        else:
+            # Outside of the range: below its first record ID or above its last.
+            terms.append(CompositeReportTerm(
+                RawReportTerm(data_type_name, RECORD_ID_FIELD, RawTermOperation.LESS_THAN_OPERATOR, str(first)),
+                CompositeTermOperation.OR_OPERATOR,
+                RawReportTerm(data_type_name, RECORD_ID_FIELD, RawTermOperation.GREATER_THAN_OPERATOR, str(last))))
+    return all_of(terms)
+
+
+def record_id_range_term(data_type_name: str, first: Optional[int] = None,
+                         stop: Optional[int] = None) -> Optional[AbstractReportTerm]:
+    """
+    A term that matches the records of a data type with record IDs from first up to but not including stop. Either
+    bound can be left out. None if both are.
+    """
+    terms: List[AbstractReportTerm] = []
+    if first is not None:
+        terms.append(RawReportTerm(data_type_name, RECORD_ID_FIELD, RawTermOperation.GREATER_THAN_OR_EQUAL_OPERATOR,
+                                   str(first)))
+    if stop is not None:
+        terms.append(RawReportTerm(data_type_name, RECORD_ID_FIELD, RawTermOperation.LESS_THAN_OPERATOR, str(stop)))
+    return all_of(terms)
+
+
+def _combine(terms: Sequence[AbstractReportTerm], operation: CompositeTermOperation) -> Optional[AbstractReportTerm]:
+    if not terms:
+        return None
+    if len(terms) == 1:
+        return terms[0]
+    middle = len(terms) // 2
+    return CompositeReportTerm(_combine(terms[:middle], operation), operation, _combine(terms[middle:], operation))
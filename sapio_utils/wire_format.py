@@ -0,0 +1,85 @@
+"""
+The encodings of response bodies the Sapio clients of this repository ask for, and how they are decoded.
+
+Record pages and custom report results are large, and parsing them takes most of the CPU time of bulk reads. A
+client that sends accept_header() asks the server for MessagePack, which is smaller and faster to parse than JSON,
+and still accepts JSON from servers that do not offer it. Only code that reads responses with decode_json() should
+ask for it: sapiopylib's managers parse JSON text, and turning MessagePack into JSON for them costs more CPU time than
+it saves. Compression is negotiated separately, through the
+Accept-Encoding header that urllib3 sends: gzip and deflate always, brotli and zstd when the brotli or zstandard
+packages are installed. urllib3 decompresses responses before they are decoded.
+
+MessagePack needs the msgpack package. JSON is parsed with orjson when it is installed, which is several times faster
+than the json module. Without either package, responses are parsed as they would be without this module.
+"""
+from __future__ import annotations
+
+from typing import Any, Optional
+
+from requests import Response
+from urllib3.util.request import ACCEPT_ENCODING
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JSON = "application/json"
+MSGPACK = "application/msgpack"
+# The media types servers use for MessagePack, which has no registered one.
+MSGPACK_TYPES = frozenset({MSGPACK, "application/x-msgpack", "application/vnd.msgpack"})
+
+
+def accept_header(binary: bool = True) -> str:
+    """
+    The Accept header for requests to JSON endpoints, whose responses can be decoded by decode_json(). Requests that
+    download files or other octet streams should not send it.
+
+    :param binary: Whether to ask for MessagePack, if the msgpack package is installed.
+    """
+    if binary and msgpack is not None:
+        return f"{MSGPACK}, {JSON};q=0.9, */*;q=0.1"
+    return f"{JSON}, */*;q=0.1"
+
+
+def accept_encoding_header() -> str:
+    """
+    The Accept-Encoding header for the compressions urllib3 can decompress with the packages that are installed.
+    """
+    return ", ".join(x.strip() for x in ACCEPT_ENCODING.split(","))
+
+
+def media_type(content_type: Optional[str]) -> str:
+    """
+    The media type of a Content-Type header, without its parameters.
+    """
+    return (content_type or "").split(";", 1)[0].strip().lower()
+
+
+def is_msgpack(response: Response) -> bool:
+    """
+    Whether the body of a response is MessagePack that this module can decode.
+    """
+    return msgpack is not None and media_type(response.headers.get("Content-Type")) in MSGPACK_TYPES
+
+
+def decode_json(response: Response) -> Any:
+    """
+    The value of the body of a response, decoded in the encoding the server chose: MessagePack, or JSON with orjson
+    when it is installed. Anything else is parsed by requests.
+    """
+    if is_msgpack(response):
+        return msgpack.unpackb(response.content, raw=False, strict_map_key=False) if response.content else None
+    # orjson takes no options and only reads UTF-8, which is what Sapio sends.
+    if orjson is not None and response.encoding in (None, "utf-8", "UTF-8"):
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            pass
+    return response.json()
+
@@ -0,0 +1,9 @@
+"""
+Puts the repository root, and the benchmarks directory with its stand-in Sapio server, on sys.path for the tests.
+"""
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+sys.path.insert(0, ROOT)
@@ -0,0 +1,20 @@
+from sapiopylib.rest.pojo.DataRecord import DataRecord
+from sapiopylib.rest.utils.recordmodel.RecordModelManager import RecordModelManager
+
+from _stub_server import StubSapioServer
+from sapio_utils.data_type_cache import DATA_TYPE_CACHE, SharedDataTypeCacheManager, get_record_model_manager
+
+
+def test_record_models_of_every_invocation_share_the_field_definitions():
+    DATA_TYPE_CACHE.invalidate()
+    with StubSapioServer() as server:
+        server.route("GET", "/datatypemanager/veloxfieldlist/(.+)", lambda match, query, body: [])
+        for _ in range(3):
+            # Every webhook invocation has its own user object.
+            user = server.user()
+            manager = get_record_model_manager(user)
+            assert RecordModelManager(user) is manager
+            assert isinstance(manager.data_type_cache_manager, SharedDataTypeCacheManager)
+            model = manager.instance_manager.add_existing_record(DataRecord("Sample", 7, {"RecordId": 7}))
+            model.set_field_value("Volume", 2.5)
+        assert server.request_count == 1
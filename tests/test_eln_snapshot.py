@@ -0,0 +1,43 @@
+from sapiopylib.rest.DataMgmtService import DataMgmtServer
+from sapiopylib.rest.pojo.DataRecord import DataRecord
+from sapiopylib.rest.pojo.eln.ElnExperiment import ElnExperimentUpdateCriteria
+from sapiopylib.rest.pojo.webhook.WebhookContext import SapioWebhookContext
+from sapiopylib.rest.pojo.webhook.WebhookEnums import WebhookEndpointType
+
+from _stub_server import StubSapioServer
+from sapio_utils.eln_snapshot import eln_request_sent, get_experiment_snapshot
+from sapio_utils.http_pool import HttpPool
+
+ENTRY = {"entryType": "Table", "entryId": 4, "parentExperimentId": 3, "enbEntryName": "Samples", "order": 0,
+         "entryStatus": "Enabled"}
+
+
+def test_changes_made_outside_the_snapshot_eln_manager_invalidate_the_snapshot():
+    pool = HttpPool()
+    pool.add_request_listener(eln_request_sent)
+    with StubSapioServer() as server:
+        server.route("GET", "/eln/getExperimentEntryList/3", lambda match, query, body: [ENTRY])
+        server.route("GET", "/eln/getDataRecordsForEntry/3/4", lambda match, query, body: {
+            "nextPageAvailable": False, "resultList": [{"dataTypeName": "Sample", "recordId": 7, "fields": {}}]})
+        server.route("POST", r"/eln/addRecordsToTableEntry/\d+/4", lambda match, query, body: None)
+        server.route("POST", "/eln/updateNotebookExperiment/3", lambda match, query, body: None)
+        context = SapioWebhookContext(server.pooled_user(pool), WebhookEndpointType.ACTIONMENU)
+        snapshot = get_experiment_snapshot(context, 3)
+
+        def requests_to_read() -> int:
+            server.request_count = 0
+            snapshot.get_entry_by_name("Samples")
+            snapshot.get_entry_records(4)
+            return server.request_count
+
+        assert requests_to_read() == 2
+        assert requests_to_read() == 0
+        # The records of the entry change, through the context's own ELN manager.
+        context.eln_manager.add_records_to_table_entry(3, 4, [DataRecord("Sample", 8, {})])
+        assert requests_to_read() == 1
+        # The experiment changes, through the ELN manager protocols use.
+        DataMgmtServer.get_eln_manager(context.user).update_notebook_experiment(3, ElnExperimentUpdateCriteria("Run 2"))
+        assert requests_to_read() == 2
+        # Other experiments are left alone.
+        context.eln_manager.add_records_to_table_entry(5, 4, [DataRecord("Sample", 8, {})])
+        assert requests_to_read() == 0
@@ -0,0 +1,35 @@
+from sapiopylib.rest.pojo.webhook.WebhookEnums import WebhookEndpointType
+
+from _stub_server import StubSapioServer
+from sapio_utils.http_pool import HttpPool, PooledSapioUser, parse_pooled_webhook
+
+
+def test_the_active_protocol_and_step_of_a_pooled_context_use_the_pooled_user():
+    pool = HttpPool()
+    context = parse_pooled_webhook({
+        "endpointType": WebhookEndpointType.ACTIONMENU.display_name, "webserviceUrl": "http://localhost/webservice/api",
+        "webhookApiToken": "token", "username": "admin",
+        "notebookExperimentPojo": {"notebookExperimentId": 3, "notebookExperimentName": "Run", "experimentRecordId": 9},
+        "elnExperimentEntryPojo": {"entryType": "Plugin", "entryId": 4, "parentExperimentId": 3,
+                                   "enbEntryName": "Samples", "order": 0, "entryStatus": "Enabled"}}, http_pool=pool)
+    assert isinstance(context.user, PooledSapioUser) and context.user.http_pool is pool
+    assert context.active_protocol.user is context.user
+    assert context.active_step.user is context.user
+    assert context.active_step.protocol is context.active_protocol
+
+
+def test_requests_succeed_when_a_listener_fails(capsys):
+    seen = []
+
+    def failing(*args):
+        raise ValueError("listener failed")
+
+    pool = HttpPool()
+    pool.add_request_listener(failing)
+    pool.add_request_listener(lambda user, method, url_sub_path, *args: seen.append(url_sub_path))
+    with StubSapioServer() as server:
+        server.route("GET", "/ping", lambda match, query, body: {"ok": True})
+        response = server.pooled_user(pool).get("/ping")
+    assert response.json() == {"ok": True}
+    assert seen == ["/ping"]
+    assert "listener failed" in capsys.readouterr().err
@@ -0,0 +1,134 @@
+import os
+
+import pytest
+from sapiopylib.rest.DataMgmtService import DataMgmtServer
+from sapiopylib.rest.pojo.CustomReport import (CompositeReportTerm, CompositeTermOperation, CustomReportCriteria,
+                                               RawReportTerm, RawTermOperation, ReportColumn)
+from sapiopylib.rest.pojo.DataRecord import DataRecord
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+from sapiopylib.rest.utils.recordmodel.RecordModelManager import RecordModelManager
+
+from _stub_server import StubSapioServer
+from sapio_utils.http_pool import HttpPool
+from sapio_utils.report_cache import ReportCache, canonical_term, criteria_key
+
+
+def criteria(data_type_name: str) -> CustomReportCriteria:
+    return CustomReportCriteria([ReportColumn(data_type_name, "RecordId", FieldType.LONG)],
+                                RawReportTerm(data_type_name, "RecordId", RawTermOperation.GREATER_THAN_OPERATOR, "0"))
+
+
+@pytest.fixture
+def server():
+    with StubSapioServer() as stub:
+        stub.route("POST", "/report/runCustomReport",
+                   lambda match, query, body: {**body, "hasNextPage": False, "resultTable": [[1], [2]]})
+        stub.route("PUT", "/datarecordlist/fields", lambda match, query, body: None)
+        stub.route("GET", "/datatypemanager/veloxfieldlist/(.+)", lambda match, query, body: [])
+        stub.route("POST", "/datarecordlist/runbatchupdate", lambda match, query, body: {"addedRecordUpdates": {}})
+        stub.route("POST", "/datarecordlist", lambda match, query, body: {"nextPageAvailable": False, "resultList": [
+            {"dataTypeName": query["dataTypeName"][0], "recordId": x, "fields": {"RecordId": x}} for x in body]})
+        yield stub
+
+
+@pytest.fixture
+def cache_and_user(server):
+    cache = ReportCache()
+    pool = HttpPool()
+    pool.add_request_listener(cache.request_sent)
+    return cache, server.pooled_user(pool)
+
+
+def run_reports(cache, user, server) -> int:
+    server.request_count = 0
+    for data_type_name in ("QCDatum", "Sample"):
+        cache.run_custom_report(user, criteria(data_type_name))
+    return server.request_count
+
+
+def test_commits_drop_the_reports_on_their_data_type(server, cache_and_user):
+    cache, user = cache_and_user
+    assert run_reports(cache, user, server) == 2
+    assert run_reports(cache, user, server) == 0
+    DataMgmtServer.get_data_record_manager(user).commit_data_records([DataRecord("QCDatum", 1, {"Status": "Passed"})])
+    assert run_reports(cache, user, server) == 1
+    assert cache.stats().invalidations == 1
+
+
+def test_record_model_commits_drop_the_reports_on_their_data_type(server, cache_and_user):
+    cache, user = cache_and_user
+    run_reports(cache, user, server)
+    record_model_manager = RecordModelManager(user)
+    model = record_model_manager.instance_manager.add_existing_record(DataRecord("Sample", 7, {"RecordId": 7}))
+    model.set_field_value("Volume", 2.5)
+    record_model_manager.store_and_commit()
+    assert run_reports(cache, user, server) == 1
+
+
+def test_users_of_other_pools_are_not_seen(server, cache_and_user):
+    cache, user = cache_and_user
+    run_reports(cache, user, server)
+    other_user = server.pooled_user(HttpPool())
+    DataMgmtServer.get_data_record_manager(other_user).commit_data_records([DataRecord("QCDatum", 1, {})])
+    assert run_reports(cache, user, server) == 0
+
+
+def test_invalidations_while_a_report_runs_keep_its_result_out_of_the_cache(tmp_path):
+    cache = ReportCache(directory=str(tmp_path))
+    pool = HttpPool()
+    pool.add_request_listener(cache.request_sent)
+    commits = []
+
+    def slow_report(match, query, body):
+        # The records of the report change after the server read them, but before the report returns.
+        if not commits:
+            commits.append(DataMgmtServer.get_data_record_manager(user).commit_data_records(
+                [DataRecord("QCDatum", 1, {})]))
+        return {**body, "hasNextPage": False, "resultTable": [[1]]}
+
+    with StubSapioServer() as server:
+        server.route("POST", "/report/runCustomReport", slow_report)
+        server.route("PUT", "/datarecordlist/fields", lambda match, query, body: None)
+        user = server.pooled_user(pool)
+        cache.run_custom_report(user, criteria("QCDatum"))
+        assert cache.stats().invalidations == 0
+        assert len(cache) == 0
+        assert os.listdir(tmp_path) == []
+        assert run_reports(cache, user, server) == 2
+        assert run_reports(cache, user, server) == 0
+
+
+def term(field: str, value: str) -> RawReportTerm:
+    return RawReportTerm("Sample", field, RawTermOperation.EQUAL_TO_OPERATOR, value)
+
+
+def join(left, operation: CompositeTermOperation, right, negated: bool = False) -> CompositeReportTerm:
+    return CompositeReportTerm(left, operation, right, is_negated=negated)
+
+
+def test_reordered_and_regrouped_terms_have_the_same_canonical_form():
+    a, b, c = term("Status", "Passed"), term("Volume", "2"), term("Plate", "P1")
+    and_ = CompositeTermOperation.AND_OPERATOR
+    or_ = CompositeTermOperation.OR_OPERATOR
+    forms = [join(join(a, and_, b), and_, c), join(c, and_, join(b, and_, a)),
+             join(join(a, and_, b), and_, join(c, and_, a))]
+    assert len({str(canonical_term(x.to_json())) for x in forms}) == 1
+    nested = canonical_term(join(join(a, or_, b), or_, join(c, and_, a)).to_json())
+    assert len(nested["operands"]) == 3
+    assert canonical_term(join(a, and_, b).to_json()) != canonical_term(join(a, or_, b).to_json())
+    assert canonical_term(join(a, and_, b, negated=True).to_json()) != canonical_term(join(a, and_, b).to_json())
+    first = CustomReportCriteria([ReportColumn("Sample", "RecordId", FieldType.LONG)], join(a, and_, b))
+    second = CustomReportCriteria([ReportColumn("Sample", "RecordId", FieldType.LONG)], join(b, and_, a))
+    assert criteria_key(first) == criteria_key(second)
+
+
+def test_reports_are_not_shared_between_users(server):
+    cache = ReportCache()
+    first, second = server.user(), server.user()
+    second.username = "other"
+    server.request_count = 0
+    cache.run_custom_report(first, criteria("Sample"))
+    cache.run_custom_report(second, criteria("Sample"))
+    cache.run_custom_report(first, criteria("Sample"))
+    assert server.request_count == 2
+    assert ReportCache._user_key(first) != ReportCache._user_key(second)
@@ -0,0 +1,85 @@
+import os
+
+import pytest
+from sapiopylib.rest.pojo.CustomReport import CustomReportCriteria, RawReportTerm, RawTermOperation, ReportColumn
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+
+from _stub_server import StubSapioServer
+from sapio_utils.report_export import ARROW, PARQUET, export_report
+
+pa = pytest.importorskip("pyarrow")
+import pyarrow.ipc  # noqa: E402
+import pyarrow.parquet  # noqa: E402
+
+ROWS = 25
+PAGE_SIZE = 10
+COLUMNS = [ReportColumn("QCDatum", "RecordId", FieldType.LONG),
+           ReportColumn("QCDatum", "SampleId", FieldType.STRING),
+           ReportColumn("QCDatum", "DateTime", FieldType.DATE),
+           ReportColumn("QCDatum", "Concentration", FieldType.DOUBLE),
+           ReportColumn("QCDatum", "Passed", FieldType.BOOLEAN),
+           ReportColumn("Sample", "SampleId", FieldType.STRING)]
+SCHEMA = pa.schema([("RecordId", pa.int64()), ("QCDatum.SampleId", pa.string()),
+                    ("DateTime", pa.timestamp("ms", tz="UTC")), ("Concentration", pa.float64()),
+                    ("Passed", pa.bool_()), ("Sample.SampleId", pa.string())])
+
+
+def row(i: int) -> list:
+    return [i + 1, f"S-{i:04d}", 1_700_000_000_000 + i * 60_000, None if i % 7 == 0 else i / 4, i % 2 == 0, i]
+
+
+@pytest.fixture
+def server():
+    def report(match, query, body) -> dict:
+        first = body["pageNumber"] * body["pageSize"]
+        stop = min(first + body["pageSize"], ROWS)
+        return {**body, "hasNextPage": stop < ROWS, "resultTable": [row(i) for i in range(first, stop)]}
+
+    with StubSapioServer() as stub:
+        stub.route("POST", "/report/runCustomReport", report)
+        yield stub
+
+
+def criteria() -> CustomReportCriteria:
+    return CustomReportCriteria(COLUMNS, RawReportTerm("QCDatum", "RecordId",
+                                                       RawTermOperation.GREATER_THAN_OR_EQUAL_OPERATOR, "0"))
+
+
+def expected_table() -> pa.Table:
+    columns = list(zip(*[row(i) for i in range(ROWS)]))
+    columns[2] = pa.array(columns[2], pa.int64()).cast(SCHEMA.field(2).type)
+    columns[5] = [str(x) for x in columns[5]]
+    return pa.Table.from_arrays([pa.array(values, field.type) for values, field in zip(columns, SCHEMA)],
+                                schema=SCHEMA)
+
+
+@pytest.mark.parametrize("read_ahead", [0, 2])
+def test_parquet_round_trip(server, tmp_path, read_ahead):
+    path = str(tmp_path / "report.parquet")
+    export = export_report(server.user(), criteria(), path, page_size=PAGE_SIZE, read_ahead=read_ahead)
+    assert (export.file_format, export.rows, export.pages) == (PARQUET, ROWS, 3)
+    parquet_file = pa.parquet.ParquetFile(path)
+    assert parquet_file.schema_arrow == SCHEMA
+    assert [parquet_file.metadata.row_group(i).num_rows for i in range(parquet_file.num_row_groups)] == [10, 10, 5]
+    assert parquet_file.read().equals(expected_table())
+    assert os.listdir(tmp_path) == ["report.parquet"]
+
+
+@pytest.mark.parametrize("compression", [None, "zstd"])
+def test_arrow_round_trip(server, tmp_path, compression):
+    path = str(tmp_path / "report.arrow")
+    export = export_report(server.user(), criteria(), path, page_size=PAGE_SIZE, compression=compression)
+    assert (export.file_format, export.rows, export.pages) == (ARROW, ROWS, 3)
+    with pa.memory_map(path) as source:
+        reader = pa.ipc.open_file(source)
+        assert reader.schema == SCHEMA
+        assert [reader.get_batch(i).num_rows for i in range(reader.num_record_batches)] == [10, 10, 5]
+        assert reader.read_all().equals(expected_table())
+
+
+def test_failed_export_leaves_no_file(tmp_path):
+    with StubSapioServer() as failing_server:
+        failing_server.route("POST", "/report/runCustomReport", lambda match, query, body: 1 / 0)
+        with pytest.raises(Exception):
+            export_report(failing_server.user(), criteria(), str(tmp_path / "report.parquet"), page_size=PAGE_SIZE)
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,73 @@
+from sapiopylib.rest.pojo.CustomReport import (CompositeReportTerm, CompositeTermOperation, CustomReportCriteria,
+                                               RawReportTerm, RawTermOperation, ReportColumn)
+from sapiopylib.rest.pojo.datatype.FieldDefinition import FieldType
+
+from _stub_server import StubSapioServer
+from sapio_utils.report_planner import plan_criteria, plan_term, run_planned_report, term_text
+from sapio_utils.report_terms import all_of, any_of
+
+VOLUME = {("Sample", "Volume"): FieldType.DOUBLE}
+COUNT = {("Sample", "Count"): FieldType.INTEGER}
+
+
+def term(field: str, operation: RawTermOperation, value: str) -> RawReportTerm:
+    return RawReportTerm("Sample", field, operation, value)
+
+
+def test_equal_terms_on_an_integer_field_merge_into_a_range():
+    plan = plan_term(any_of([term("Count", RawTermOperation.EQUAL_TO_OPERATOR, str(x)) for x in (1, 2, 3)]), COUNT)
+    assert term_text(plan.term) == "(Sample.Count ≥ 1 AND Sample.Count ≤ 3)"
+
+
+def test_record_id_terms_every_record_matches_are_dropped():
+    volume = term("Volume", RawTermOperation.GREATER_THAN_OPERATOR, "5")
+    plan = plan_term(all_of([term("RecordId", RawTermOperation.GREATER_THAN_OR_EQUAL_OPERATOR, "0"), volume]), VOLUME)
+    assert term_text(plan.term) == "Sample.Volume > 5"
+
+
+def test_terms_no_record_matches_are_found():
+    plan = plan_term(all_of([term("Volume", RawTermOperation.GREATER_THAN_OPERATOR, "5"),
+                             term("Volume", RawTermOperation.LESS_THAN_OPERATOR, "2")]), VOLUME)
+    assert plan.matches_nothing
+    assert plan.term is None
+
+
+def test_negated_ands_and_ors_are_left_as_they_are():
+    negated = CompositeReportTerm(term("Volume", RawTermOperation.EQUAL_TO_OPERATOR, "1"),
+                                  CompositeTermOperation.OR_OPERATOR,
+                                  term("Volume", RawTermOperation.EQUAL_TO_OPERATOR, "1"), is_negated=True)
+    plan = plan_term(negated, VOLUME)
+    assert term_text(plan.term) == "NOT (Sample.Volume = 1 OR Sample.Volume = 1)"
+
+
+def test_ranges_do_not_become_not_equal_terms_that_match_records_without_a_value():
+    ranges = any_of([term("Volume", RawTermOperation.LESS_THAN_OPERATOR, "3"),
+                     term("Volume", RawTermOperation.GREATER_THAN_OPERATOR, "3")])
+    assert term_text(plan_term(ranges, VOLUME).term) == "(Sample.Volume < 3 OR Sample.Volume > 3)"
+    record_ids = any_of([term("RecordId", RawTermOperation.LESS_THAN_OPERATOR, "3"),
+                         term("RecordId", RawTermOperation.GREATER_THAN_OPERATOR, "3")])
+    assert term_text(plan_term(record_ids).term) == "Sample.RecordId ≠ 3"
+
+
+def test_plan_criteria_reads_the_field_types_of_the_columns():
+    counts = any_of([term("Count", RawTermOperation.EQUAL_TO_OPERATOR, str(x)) for x in (1, 2, 3)])
+    criteria = CustomReportCriteria([ReportColumn("Sample", "Count", FieldType.INTEGER)], counts)
+    planned, plan = plan_criteria(criteria)
+    assert term_text(planned.root_term) == "(Sample.Count ≥ 1 AND Sample.Count ≤ 3)"
+    assert planned.root_term is plan.term
+    assert criteria.root_term is plan.original
+
+
+def test_reports_no_record_can_match_are_not_run():
+    criteria = CustomReportCriteria([ReportColumn("Sample", "Volume", FieldType.DOUBLE)],
+                                    all_of([term("Volume", RawTermOperation.GREATER_THAN_OPERATOR, "5"),
+                                            term("Volume", RawTermOperation.LESS_THAN_OPERATOR, "2")]))
+    with StubSapioServer() as server:
+        server.route("POST", "/report/runCustomReport",
+                     lambda match, query, body: {**body, "hasNextPage": False, "resultTable": [[1.0]]})
+        report = run_planned_report(server.user(), criteria, VOLUME)
+        assert report.result_table == []
+        assert server.request_count == 0
+        criteria.root_term = term("Volume", RawTermOperation.GREATER_THAN_OPERATOR, "5")
+        assert run_planned_report(server.user(), criteria, VOLUME).result_table == [[1.0]]
+        assert server.request_count == 1
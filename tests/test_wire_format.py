@@ -0,0 +1,55 @@
+import json
+
+import pytest
+from sapiopylib.rest.DataMgmtService import DataMgmtServer
+
+from _stub_server import StubSapioServer
+from sapio_utils.http_pool import HttpPool
+from sapio_utils.wire_format import MSGPACK, accept_header, decode_json
+
+msgpack = pytest.importorskip("msgpack")
+
+PAGE = {"nextPageAvailable": False, "resultList": [
+    {"dataTypeName": "Sample", "recordId": i, "fields": {"RecordId": i, "SampleId": f"S-{i}", "Volume": i / 4,
+                                                         "IsControl": i % 2 == 0, "Note": None}}
+    for i in range(1, 51)]}
+
+
+@pytest.fixture
+def server():
+    with StubSapioServer() as stub:
+        stub.route("GET", "/datarecordlist/all", lambda match, query, body: PAGE)
+        yield stub
+
+
+def test_decode_json_reads_a_msgpack_body(server):
+    response = HttpPool().request("GET", server.url + "/datarecordlist/all", headers={"Accept": accept_header()})
+    assert response.headers["Content-Type"] == MSGPACK
+    assert msgpack.unpackb(response.content) == PAGE
+    assert decode_json(response) == PAGE
+
+
+def test_send_json_reads_msgpack_pages(server):
+    assert server.pooled_user(HttpPool()).send_json("GET", "/datarecordlist/all") == PAGE
+    assert server.bytes_sent == len(msgpack.packb(PAGE))
+
+
+def test_managers_read_json_pages(server):
+    user = server.pooled_user(HttpPool())
+    records = DataMgmtServer.get_data_record_manager(user).query_all_records_of_type("Sample").result_list
+    assert server.bytes_sent == len(json.dumps(PAGE).encode("utf-8"))
+    assert [record.record_id for record in records] == list(range(1, 51))
+    assert records[3].get_field_value("Volume") == 1.0
+
+
+def test_octet_streams_do_not_ask_for_msgpack(server):
+    user = server.pooled_user(HttpPool())
+    chunks = []
+    user.consume_octet_stream_get("/datarecordlist/all", chunks.append)
+    assert json.loads(b"".join(chunks)) == PAGE
+
+
+def test_json_pool_does_not_ask_for_msgpack(server):
+    user = server.pooled_user(HttpPool(binary_encoding=False))
+    assert user.send_json("GET", "/datarecordlist/all") == PAGE
+    assert server.bytes_sent == len(json.dumps(PAGE).encode("utf-8"))